@@ -652,6 +652,7 @@ class KISWebSocket:
         [websockets.ClientConnection, str, pd.DataFrame, dict], None
     ] = None
     result_all_data: bool = False
+    raw_data: bool = False
 
     retry_count: int = 0
     amx_retries: int = 0
@@ -680,9 +681,13 @@ class KISWebSocket:
                 if dm.get("encrypt", None) == "Y":
                     d = aes_cbc_base64_dec(dm["key"], dm["iv"], d)
 
-                df = pd.read_csv(
-                    StringIO(d), header=None, sep="^", names=dm["columns"], dtype=object
-                )
+                if self.raw_data:
+                    # 복호화된 원문 그대로 전달 ("^" 구분, 다건 프레임 포함)
+                    df = d
+                else:
+                    df = pd.read_csv(
+                        StringIO(d), header=None, sep="^", names=dm["columns"], dtype=object
+                    )
 
                 show_result = True
 
@@ -789,9 +794,11 @@ class KISWebSocket:
                 [websockets.ClientConnection, str, pd.DataFrame, dict], None
             ],
             result_all_data: bool = False,
+            raw_data: bool = False,
     ):
         self.on_result = on_result
         self.result_all_data = result_all_data
+        self.raw_data = raw_data
         try:
             asyncio.run(self.__runner())
         except KeyboardInterrupt:
@@ -0,0 +1,40 @@
+"""
+Backtest 모듈 - market_data.db 분봉 리플레이 백테스트
+
+주요 클래스:
+- MarketDataFeed: 거래일 단위 분봉/일봉 스트리밍
+- SimulatedBroker: KISBroker 인터페이스 시뮬레이터 (수수료, 호가단위 보정)
+- BacktestEngine: 실제 전략(StrategyRegistry) 구동 엔진
+- BacktestResult: 거래 원장 + 평가자산 곡선
+- SharedMarketData / ArrayFeed: 공유 메모리 시세 배열 (스윕 워커 공용)
+- run_sweep: 전략 파라미터 그리드/랜덤 탐색 (ProcessPoolExecutor, Parquet 요약)
+"""
+
+from leverage_worker.backtest.broker import BacktestTrade, SimFill, SimulatedBroker
+from leverage_worker.backtest.data_feed import MarketDataFeed
+from leverage_worker.backtest.engine import (
+    BacktestConfig,
+    BacktestEngine,
+    BacktestResult,
+    StrategySpec,
+)
+from leverage_worker.backtest.shared_data import ArrayFeed, SharedDataHandle, SharedMarketData
+from leverage_worker.backtest.sweep import SweepResult, iter_grid, run_sweep, sample_space
+
+__all__ = [
+    "MarketDataFeed",
+    "SimulatedBroker",
+    "SimFill",
+    "BacktestTrade",
+    "BacktestEngine",
+    "BacktestConfig",
+    "BacktestResult",
+    "StrategySpec",
+    "SharedMarketData",
+    "SharedDataHandle",
+    "ArrayFeed",
+    "SweepResult",
+    "run_sweep",
+    "iter_grid",
+    "sample_space",
+]
@@ -0,0 +1,636 @@
+"""
+백테스트용 시뮬레이션 브로커
+
+KISBroker와 같은 인터페이스로 주문/잔고/시세 조회를 흉내냄
+- 호가: 매수1호가 = 직전 종가, 매도1호가 = 직전 종가 + 1호가단위
+- 시장가: 매수는 매도1호가, 매도는 매수1호가에 즉시 체결 (+ 슬리피지 틱)
+- 지정가: 즉시 체결 가능하면 최우선 호가에 체결, 아니면 대기 후
+  다음 분봉에서 가격을 관통(매수: 저가 < 지정가, 매도: 고가 > 지정가)할 때 체결
+- 수수료: 매수/매도 수수료율 + 매도 거래세 (원 단위 절사)
+- 가격은 math_utils.get_tick_size 호가단위로 보정
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from leverage_worker.data.daily_candle_repository import DailyCandle
+from leverage_worker.data.minute_candle_repository import MinuteCandle
+from leverage_worker.trading.broker import (
+    OrderInfo,
+    OrderResult,
+    OrderSide,
+    OrderStatus,
+    Position,
+    StockPrice,
+)
+from leverage_worker.utils.logger import get_logger
+from leverage_worker.utils.math_utils import get_tick_size, round_price_to_tick
+
+logger = get_logger(__name__)
+
+_BRANCH_NO = "00000"
+
+
+@dataclass(slots=True)
+class SimFill:
+    """체결 기록"""
+
+    time: datetime
+    stock_code: str
+    side: OrderSide
+    quantity: int
+    price: int
+    fee: int
+    order_id: str
+    strategy_name: str
+    reason: str
+
+
+@dataclass(slots=True)
+class BacktestTrade:
+    """청산 완료 거래 (매수 → 매도 1회)"""
+
+    stock_code: str
+    strategy_name: str
+    entry_time: datetime
+    exit_time: datetime
+    quantity: int
+    entry_price: float
+    exit_price: int
+    fees: int
+    pnl: int
+    return_pct: float
+    exit_reason: str
+
+
+@dataclass(slots=True)
+class _SimOrder:
+    """시뮬레이션 주문"""
+
+    order_id: str
+    stock_code: str
+    side: OrderSide
+    quantity: int
+    price: int  # 0이면 시장가
+    placed_at: datetime
+    strategy_name: str
+    reason: str
+    filled_qty: int = 0
+    filled_price: int = 0
+    status: OrderStatus = OrderStatus.SUBMITTED
+
+    @property
+    def remaining(self) -> int:
+        return self.quantity - self.filled_qty
+
+
+@dataclass(slots=True)
+class _SimPosition:
+    """시뮬레이션 보유 종목"""
+
+    stock_code: str
+    quantity: int = 0
+    avg_price: float = 0.0
+    buy_fees: int = 0
+    entry_time: Optional[datetime] = None
+    strategy_name: str = ""
+
+
+class SimulatedBroker:
+    """
+    KISBroker 인터페이스 시뮬레이터
+
+    BacktestEngine이 분봉마다 on_bar()로 시세/시각을 갱신하고,
+    전략 처리 코드는 실거래와 같은 메서드(place_limit_order 등)로 주문.
+    """
+
+    def __init__(
+        self,
+        initial_cash: int,
+        buy_fee_rate: float = 0.00015,
+        sell_fee_rate: float = 0.00015,
+        sell_tax_rate: float = 0.0,
+        slippage_ticks: int = 0,
+        stock_names: Optional[Dict[str, str]] = None,
+        daily_candles: Optional[Dict[str, List[DailyCandle]]] = None,
+    ):
+        """
+        Args:
+            initial_cash: 초기 예수금
+            buy_fee_rate: 매수 수수료율
+            sell_fee_rate: 매도 수수료율
+            sell_tax_rate: 매도 거래세율 (ETF 0)
+            slippage_ticks: 시장가 체결 시 불리한 방향 추가 호가 수
+            stock_names: {종목코드: 종목명}
+            daily_candles: {종목코드: 일봉 리스트} (get_daily_candles 응답용)
+        """
+        self._cash = initial_cash
+        self._buy_fee_rate = buy_fee_rate
+        self._sell_fee_rate = sell_fee_rate
+        self._sell_tax_rate = sell_tax_rate
+        self._slippage_ticks = slippage_ticks
+        self._stock_names = stock_names or {}
+        self._daily_candles = daily_candles or {}
+
+        self._now: Optional[datetime] = None
+        self._last_bar: Dict[str, MinuteCandle] = {}
+        self._recent_bars: Dict[str, Deque[MinuteCandle]] = {}
+
+        self._positions: Dict[str, _SimPosition] = {}
+        self._orders: Dict[str, _SimOrder] = {}
+        self._open_orders: Dict[str, _SimOrder] = {}
+        self._order_seq = 0
+        self._reserved_cash = 0
+
+        self.fills: List[SimFill] = []
+        self.trades: List[BacktestTrade] = []
+        self._filled_count_today: Dict[str, int] = {}
+
+    # ==========================================
+    # 시장 상태 갱신 (엔진 전용)
+    # ==========================================
+
+    @property
+    def now(self) -> Optional[datetime]:
+        """시뮬레이션 현재 시각"""
+        return self._now
+
+    def begin_day(self) -> None:
+        """거래일 시작 (당일 주문/카운트 초기화)"""
+        self._orders = {
+            oid: order for oid, order in self._orders.items() if oid in self._open_orders
+        }
+        self._filled_count_today.clear()
+
+    def on_bar(self, candle: MinuteCandle, now: datetime) -> List[SimFill]:
+        """
+        분봉 완성 반영: 대기 지정가 주문 체결 판정 후 시세 갱신
+
+        Args:
+            candle: 완성 분봉
+            now: 분봉 종료 시각 (주문/체결 시각 기준)
+
+        Returns:
+            이번 분봉에서 발생한 체결
+        """
+        self._now = now
+        stock_code = candle.stock_code
+        fills: List[SimFill] = []
+
+        for order in [o for o in self._open_orders.values() if o.stock_code == stock_code]:
+            if order.side == OrderSide.BUY and candle.low_price < order.price:
+                price = int(min(order.price, candle.open_price))
+                fill = self._fill(order, order.remaining, price)
+            elif order.side == OrderSide.SELL and candle.high_price > order.price:
+                price = int(max(order.price, candle.open_price))
+                fill = self._fill(order, order.remaining, price)
+            else:
+                continue
+            if fill:
+                fills.append(fill)
+
+        self._last_bar[stock_code] = candle
+        bars = self._recent_bars.get(stock_code)
+        if bars is None:
+            bars = self._recent_bars[stock_code] = deque(maxlen=30)
+        bars.append(candle)
+        return fills
+
+    def has_open_order(self, stock_code: str) -> bool:
+        """종목 미체결 주문 존재 여부"""
+        return any(o.stock_code == stock_code for o in self._open_orders.values())
+
+    def get_position_owner(self, stock_code: str) -> Optional[str]:
+        """보유 종목의 진입 전략명"""
+        pos = self._positions.get(stock_code)
+        return pos.strategy_name if pos and pos.quantity > 0 else None
+
+    def get_today_trade_count(self, stock_code: str) -> int:
+        """당일 체결 완료 주문 수 (OrderManager.get_today_trade_count 대응)"""
+        return self._filled_count_today.get(stock_code, 0)
+
+    def get_equity(self) -> int:
+        """평가 자산 (예수금 + 보유 평가금액)"""
+        equity = self._cash
+        for code, pos in self._positions.items():
+            if pos.quantity > 0:
+                equity += pos.quantity * int(self._last_price(code) or pos.avg_price)
+        return int(equity)
+
+    @property
+    def cash(self) -> int:
+        """예수금"""
+        return self._cash
+
+    # ==========================================
+    # 시세 조회 (KISBroker 인터페이스)
+    # ==========================================
+
+    def _last_price(self, stock_code: str) -> int:
+        bar = self._last_bar.get(stock_code)
+        return int(bar.close_price) if bar else 0
+
+    def get_current_price(self, stock_code: str) -> Optional[StockPrice]:
+        """현재가 조회 (직전 분봉 기준)"""
+        bar = self._last_bar.get(stock_code)
+        if bar is None:
+            return None
+        return StockPrice(
+            stock_code=stock_code,
+            stock_name=self._stock_names.get(stock_code, stock_code),
+            current_price=int(bar.close_price),
+            prev_close=0,
+            change=0,
+            change_rate=0.0,
+            open_price=int(bar.open_price),
+            high_price=int(bar.high_price),
+            low_price=int(bar.low_price),
+            volume=int(bar.volume),
+            trade_amount=0,
+        )
+
+    def get_asking_price(self, stock_code: str) -> Optional[int]:
+        """매도1호가 (직전 종가 + 1호가단위)"""
+        price = self._last_price(stock_code)
+        if price <= 0:
+            return None
+        return price + get_tick_size(price)
+
+    def get_bidding_price(self, stock_code: str) -> Optional[int]:
+        """매수1호가 (직전 종가)"""
+        price = self._last_price(stock_code)
+        return price if price > 0 else None
+
+    def get_daily_candles(
+        self,
+        stock_code: str,
+        start_date: str,
+        end_date: str,
+    ) -> List[Dict[str, Any]]:
+        """일봉 조회 (최신순, 현재 거래일 이전만)"""
+        today = self._now.strftime("%Y%m%d") if self._now else end_date
+        result = [
+            {
+                "trade_date": c.trade_date,
+                "open_price": c.open_price,
+                "high_price": c.high_price,
+                "low_price": c.low_price,
+                "close_price": c.close_price,
+                "volume": c.volume,
+                "trade_amount": c.trade_amount,
+                "change_rate": c.change_rate,
+            }
+            for c in self._daily_candles.get(stock_code, [])
+            if start_date <= c.trade_date <= end_date and c.trade_date < today
+        ]
+        result.reverse()
+        return result
+
+    def get_minute_candles(
+        self,
+        stock_code: str,
+        time_unit: str = "1",
+        target_hour: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """분봉 조회 (최근 30개, 최신순)"""
+        bars = self._recent_bars.get(stock_code, ())
+        return [
+            {
+                "stock_code": c.stock_code,
+                "candle_datetime": c.candle_datetime,
+                "trade_date": c.trade_date,
+                "open_price": int(c.open_price),
+                "high_price": int(c.high_price),
+                "low_price": int(c.low_price),
+                "close_price": int(c.close_price),
+                "volume": int(c.volume),
+            }
+            for c in reversed(bars)
+        ]
+
+    # ==========================================
+    # 계좌 조회 (KISBroker 인터페이스)
+    # ==========================================
+
+    def _to_position(self, pos: _SimPosition) -> Position:
+        current = self._last_price(pos.stock_code) or int(pos.avg_price)
+        profit_loss = int((current - pos.avg_price) * pos.quantity)
+        return Position(
+            stock_code=pos.stock_code,
+            stock_name=self._stock_names.get(pos.stock_code, pos.stock_code),
+            quantity=pos.quantity,
+            avg_price=pos.avg_price,
+            current_price=current,
+            eval_amount=current * pos.quantity,
+            profit_loss=profit_loss,
+            profit_rate=(current - pos.avg_price) / pos.avg_price * 100 if pos.avg_price else 0.0,
+        )
+
+    def get_position(self, stock_code: str) -> Optional[Position]:
+        """종목 보유 정보 (미보유 시 None)"""
+        pos = self._positions.get(stock_code)
+        if pos is None or pos.quantity <= 0:
+            return None
+        return self._to_position(pos)
+
+    def get_balance(self) -> Tuple[List[Position], Dict[str, Any]]:
+        """잔고 조회"""
+        positions = [self._to_position(p) for p in self._positions.values() if p.quantity > 0]
+        eval_amount = sum(p.eval_amount for p in positions)
+        summary = {
+            "total_eval": self._cash + eval_amount,
+            "deposit": self._cash,
+            "total_profit_loss": sum(p.profit_loss for p in positions),
+        }
+        return positions, summary
+
+    def get_deposit(self) -> int:
+        """예수금 조회"""
+        return self._cash
+
+    def get_buyable_quantity(self, stock_code: str, current_price: int = 0) -> Tuple[int, int]:
+        """매수 가능 수량 및 주문 가능 금액"""
+        available = self._cash - self._reserved_cash
+        price = current_price or self.get_asking_price(stock_code) or 0
+        if price <= 0 or available <= 0:
+            return 0, max(0, available)
+        return int(available // (price * (1 + self._buy_fee_rate))), available
+
+    # ==========================================
+    # 주문 (KISBroker 인터페이스)
+    # ==========================================
+
+    def _next_order_id(self) -> str:
+        self._order_seq += 1
+        return f"{self._order_seq:010d}"
+
+    def _result(self, order: Optional[_SimOrder], stock_code: str, side: OrderSide,
+                quantity: int, price: int, message: str) -> OrderResult:
+        return OrderResult(
+            success=order is not None,
+            order_id=order.order_id if order else None,
+            message=message,
+            stock_code=stock_code,
+            side=side,
+            quantity=quantity,
+            price=price,
+            order_branch=_BRANCH_NO if order else None,
+        )
+
+    def _check_order(self, stock_code: str, side: OrderSide, quantity: int, price: int) -> str:
+        """주문 가능 여부 (빈 문자열이면 가능)"""
+        if quantity <= 0:
+            return "주문수량 오류"
+        if stock_code not in self._last_bar:
+            return "시세 없음"
+        if side == OrderSide.BUY:
+            cost = price * quantity
+            cost += int(cost * self._buy_fee_rate)
+            if cost > self._cash - self._reserved_cash:
+                return "주문가능금액 부족"
+        else:
+            pos = self._positions.get(stock_code)
+            pending = sum(
+                o.remaining for o in self._open_orders.values()
+                if o.stock_code == stock_code and o.side == OrderSide.SELL
+            )
+            if pos is None or pos.quantity - pending < quantity:
+                return "매도가능수량 부족"
+        return ""
+
+    def place_market_order(
+        self,
+        stock_code: str,
+        side: OrderSide,
+        quantity: int,
+        strategy_name: str = "",
+        reason: str = "",
+    ) -> OrderResult:
+        """시장가 주문 (즉시 체결)"""
+        if side == OrderSide.BUY:
+            price = (self.get_asking_price(stock_code) or 0)
+            price += self._slippage_ticks * get_tick_size(price)
+        else:
+            price = self.get_bidding_price(stock_code) or 0
+            for _ in range(self._slippage_ticks):
+                price -= get_tick_size(price - 1)
+
+        error = self._check_order(stock_code, side, quantity, price)
+        if error:
+            return self._result(None, stock_code, side, quantity, 0, error)
+
+        order = self._new_order(stock_code, side, quantity, 0, strategy_name, reason)
+        self._fill(order, quantity, price)
+        return self._result(order, stock_code, side, quantity, 0, "체결")
+
+    def place_limit_order(
+        self,
+        stock_code: str,
+        side: OrderSide,
+        quantity: int,
+        price: int,
+        strategy_name: str = "",
+        reason: str = "",
+    ) -> OrderResult:
+        """지정가 주문 (최우선 호가 이상이면 즉시 체결, 아니면 대기)"""
+        price = round_price_to_tick(price, "down" if side == OrderSide.BUY else "up")
+        error = self._check_order(stock_code, side, quantity, price)
+        if error:
+            return self._result(None, stock_code, side, quantity, price, error)
+
+        order = self._new_order(stock_code, side, quantity, price, strategy_name, reason)
+        ask = self.get_asking_price(stock_code) or 0
+        bid = self.get_bidding_price(stock_code) or 0
+        if side == OrderSide.BUY and price >= ask:
+            self._fill(order, quantity, ask)
+        elif side == OrderSide.SELL and price <= bid:
+            self._fill(order, quantity, bid)
+        else:
+            self._open_orders[order.order_id] = order
+            if side == OrderSide.BUY:
+                self._reserved_cash += price * quantity
+        return self._result(order, stock_code, side, quantity, price, "접수")
+
+    def cancel_order(
+        self,
+        order_id: str,
+        order_branch: str = _BRANCH_NO,
+        quantity: int = 0,
+    ) -> bool:
+        """주문 취소 (미체결 잔량 전체)"""
+        order = self._open_orders.pop(order_id, None)
+        if order is None:
+            return False
+        if order.side == OrderSide.BUY:
+            self._reserved_cash -= order.price * order.remaining
+        order.status = OrderStatus.CANCELLED if order.filled_qty == 0 else OrderStatus.PARTIAL
+        return True
+
+    def modify_order(
+        self,
+        order_id: str,
+        order_branch: str,
+        quantity: int,
+        new_price: int,
+    ) -> Optional[str]:
+        """주문 정정 (취소 후 재주문, 새 주문번호 반환)"""
+        order = self._open_orders.get(order_id)
+        if order is None:
+            return None
+        self.cancel_order(order_id, order_branch, quantity)
+        result = self.place_limit_order(
+            order.stock_code, order.side, quantity, new_price,
+            strategy_name=order.strategy_name, reason=order.reason,
+        )
+        return result.order_id if result.success else None
+
+    def cancel_all_pending_orders(self) -> int:
+        """모든 미체결 주문 취소"""
+        order_ids = list(self._open_orders)
+        for order_id in order_ids:
+            self.cancel_order(order_id)
+        return len(order_ids)
+
+    def _to_order_info(self, order: _SimOrder) -> OrderInfo:
+        return OrderInfo(
+            order_id=order.order_id,
+            order_no=order.order_id,
+            branch_no=_BRANCH_NO,
+            stock_code=order.stock_code,
+            stock_name=self._stock_names.get(order.stock_code, order.stock_code),
+            side=order.side,
+            order_qty=order.quantity,
+            order_price=order.price,
+            filled_qty=order.filled_qty,
+            filled_price=order.filled_price,
+            status=order.status,
+            order_time=order.placed_at.strftime("%H%M%S"),
+        )
+
+    def get_pending_orders(self) -> List[OrderInfo]:
+        """미체결 주문 조회"""
+        return [self._to_order_info(o) for o in self._open_orders.values()]
+
+    def get_today_orders(self) -> List[OrderInfo]:
+        """당일 전체 주문 조회"""
+        return [self._to_order_info(o) for o in self._orders.values()]
+
+    def get_order_status(
+        self,
+        order_id: str,
+        stock_code: str = "",
+        order_qty: int = 0,
+        side: Optional[OrderSide] = None,
+    ) -> Tuple[int, int]:
+        """주문의 (체결수량, 미체결수량)"""
+        order = self._orders.get(order_id)
+        if order is None:
+            return (0, 0)
+        unfilled = order.remaining if order.order_id in self._open_orders else 0
+        return (order.filled_qty, unfilled)
+
+    # ==========================================
+    # 체결 처리
+    # ==========================================
+
+    def _new_order(
+        self,
+        stock_code: str,
+        side: OrderSide,
+        quantity: int,
+        price: int,
+        strategy_name: str,
+        reason: str,
+    ) -> _SimOrder:
+        order = _SimOrder(
+            order_id=self._next_order_id(),
+            stock_code=stock_code,
+            side=side,
+            quantity=quantity,
+            price=price,
+            placed_at=self._now,
+            strategy_name=strategy_name,
+            reason=reason,
+        )
+        self._orders[order.order_id] = order
+        return order
+
+    def _fill(self, order: _SimOrder, quantity: int, price: int) -> Optional[SimFill]:
+        """체결 반영 (예수금/포지션/거래 기록)"""
+        amount = price * quantity
+        stock_code = order.stock_code
+
+        if order.side == OrderSide.BUY:
+            fee = int(amount * self._buy_fee_rate)
+            if order.order_id in self._open_orders:
+                self._reserved_cash -= order.price * quantity
+            if amount + fee > self._cash:
+                logger.warning(f"[backtest] {stock_code} 매수 체결 불가 (예수금 부족)")
+                self.cancel_order(order.order_id)
+                return None
+            self._cash -= amount + fee
+
+            pos = self._positions.get(stock_code)
+            if pos is None or pos.quantity == 0:
+                pos = _SimPosition(
+                    stock_code=stock_code,
+                    entry_time=self._now,
+                    strategy_name=order.strategy_name,
+                )
+                self._positions[stock_code] = pos
+            total_qty = pos.quantity + quantity
+            pos.avg_price = (pos.avg_price * pos.quantity + amount) / total_qty
+            pos.quantity = total_qty
+            pos.buy_fees += fee
+        else:
+            fee = int(amount * self._sell_fee_rate) + int(amount * self._sell_tax_rate)
+            self._cash += amount - fee
+
+            pos = self._positions[stock_code]
+            buy_fee_share = int(pos.buy_fees * quantity / pos.quantity)
+            pnl = int((price - pos.avg_price) * quantity) - fee - buy_fee_share
+            cost_basis = pos.avg_price * quantity
+            self.trades.append(
+                BacktestTrade(
+                    stock_code=stock_code,
+                    strategy_name=pos.strategy_name or order.strategy_name,
+                    entry_time=pos.entry_time,
+                    exit_time=self._now,
+                    quantity=quantity,
+                    entry_price=pos.avg_price,
+                    exit_price=price,
+                    fees=fee + buy_fee_share,
+                    pnl=pnl,
+                    return_pct=pnl / cost_basis * 100 if cost_basis else 0.0,
+                    exit_reason=order.reason,
+                )
+            )
+            pos.quantity -= quantity
+            pos.buy_fees -= buy_fee_share
+            if pos.quantity == 0:
+                del self._positions[stock_code]
+
+        order.filled_qty += quantity
+        order.filled_price = price
+        if order.remaining == 0:
+            order.status = OrderStatus.FILLED
+            self._open_orders.pop(order.order_id, None)
+            self._filled_count_today[stock_code] = self._filled_count_today.get(stock_code, 0) + 1
+        else:
+            order.status = OrderStatus.PARTIAL
+
+        fill = SimFill(
+            time=self._now,
+            stock_code=stock_code,
+            side=order.side,
+            quantity=quantity,
+            price=price,
+            fee=fee,
+            order_id=order.order_id,
+            strategy_name=order.strategy_name,
+            reason=order.reason,
+        )
+        self.fills.append(fill)
+        return fill
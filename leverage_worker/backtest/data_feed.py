@@ -0,0 +1,206 @@
+"""
+백테스트 데이터 피드 모듈
+
+MarketDataDB의 분봉/일봉을 시간순으로 스트리밍
+- 거래일 단위로 전 종목 분봉을 한 번에 조회 (candle_datetime, stock_code 순)
+- created_at/updated_at 파싱 생략 (행당 변환 비용 최소화)
+- 일봉은 종목별로 한 번만 적재
+- Parquet 아카이브 지정 시 SQLite에서 이관된 거래일도 재생 (월 파일 단위 캐시)
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from leverage_worker.data.candle_archive import (
+    MinuteCandleArchive,
+    MinuteCandleReader,
+    trade_dates_of,
+)
+from leverage_worker.data.daily_candle_repository import DailyCandle
+from leverage_worker.data.database import MarketDataDB
+from leverage_worker.data.minute_candle_repository import MinuteCandle
+from leverage_worker.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class MarketDataFeed:
+    """
+    분봉 리플레이 피드
+
+    사용 예:
+        feed = MarketDataFeed(db, ["122630"], "20250101", "20251231")
+        for trade_date, candles in feed.iter_days():
+            for candle in candles:  # 시간순
+                ...
+    """
+
+    def __init__(
+        self,
+        db: MarketDataDB,
+        stock_codes: Sequence[str],
+        start_date: str,
+        end_date: str,
+        archive: Optional[MinuteCandleArchive] = None,
+    ):
+        """
+        Args:
+            db: 시세 DB
+            stock_codes: 대상 종목코드
+            start_date: 시작일 (YYYYMMDD, 포함)
+            end_date: 종료일 (YYYYMMDD, 포함)
+            archive: 분봉 Parquet 아카이브 (None이면 SQLite만 재생)
+        """
+        self._db = db
+        self._stock_codes = list(dict.fromkeys(stock_codes))
+        self._start_date = start_date
+        self._end_date = end_date
+        self._placeholders = ",".join("?" * len(self._stock_codes))
+        self._archive = archive
+        # (종목코드, YYYYMM) → (거래일 배열, 해당 월 분봉 리스트)
+        self._archive_month: Dict[Tuple[str, str], Tuple[np.ndarray, List[MinuteCandle]]] = {}
+
+    @property
+    def stock_codes(self) -> List[str]:
+        """대상 종목코드"""
+        return list(self._stock_codes)
+
+    def get_trade_dates(self) -> List[str]:
+        """기간 내 분봉이 있는 거래일 목록 (오름차순)"""
+        if not self._stock_codes:
+            return []
+
+        rows = self._db.fetch_all(
+            f"""
+            SELECT DISTINCT trade_date FROM minute_candles
+            WHERE stock_code IN ({self._placeholders})
+              AND trade_date BETWEEN ? AND ?
+            ORDER BY trade_date
+            """,
+            (*self._stock_codes, self._start_date, self._end_date),
+        )
+        trade_dates = {row["trade_date"] for row in rows}
+        if self._archive is not None:
+            for stock_code in self._stock_codes:
+                trade_dates.update(
+                    self._archive.get_day_counts(stock_code, self._start_date, self._end_date)
+                )
+        return sorted(trade_dates)
+
+    def get_day_candles(self, trade_date: str) -> List[MinuteCandle]:
+        """거래일의 전 종목 분봉 (candle_datetime, stock_code 순)"""
+        rows = self._db.fetch_all(
+            f"""
+            SELECT stock_code, candle_datetime, trade_date,
+                   open_price, high_price, low_price, close_price, volume
+            FROM minute_candles
+            WHERE stock_code IN ({self._placeholders}) AND trade_date = ?
+            ORDER BY candle_datetime, stock_code
+            """,
+            (*self._stock_codes, trade_date),
+        )
+        candles = [
+            MinuteCandle(
+                stock_code=row[0],
+                candle_datetime=row[1],
+                trade_date=row[2],
+                open_price=row[3],
+                high_price=row[4],
+                low_price=row[5],
+                close_price=row[6],
+                volume=row[7],
+            )
+            for row in rows
+        ]
+        if self._archive is None:
+            return candles
+
+        # 아카이브 분봉 병합 (같은 봉은 SQLite 우선)
+        hot_keys = {(c.stock_code, c.candle_datetime) for c in candles}
+        archived = [
+            candle
+            for stock_code in self._stock_codes
+            for candle in self._get_archived_day(stock_code, trade_date)
+            if (stock_code, candle.candle_datetime) not in hot_keys
+        ]
+        if archived:
+            candles.extend(archived)
+            candles.sort(key=lambda c: (c.candle_datetime, c.stock_code))
+        return candles
+
+    def _get_archived_day(self, stock_code: str, trade_date: str) -> List[MinuteCandle]:
+        """아카이브 거래일 분봉 (현재 월 파일만 캐시)"""
+        month = trade_date[:6]
+        key = (stock_code, month)
+        cached = self._archive_month.get(key)
+        if cached is None:
+            for old_key in [k for k in self._archive_month if k[1] != month]:
+                del self._archive_month[old_key]
+            table = self._archive.read_month(stock_code, month)
+            dates = trade_dates_of(table["timestamp"].to_numpy())
+            month_candles = MinuteCandleReader.table_to_candles(stock_code, table)
+            cached = self._archive_month[key] = (dates, month_candles)
+
+        dates, month_candles = cached
+        day = int(trade_date)
+        start = int(np.searchsorted(dates, day, side="left"))
+        stop = int(np.searchsorted(dates, day, side="right"))
+        return month_candles[start:stop]
+
+    def iter_days(self) -> Iterator[Tuple[str, List[MinuteCandle]]]:
+        """거래일별 분봉 스트리밍"""
+        trade_dates = self.get_trade_dates()
+        logger.info(
+            f"[backtest] feed: {len(self._stock_codes)} stocks, "
+            f"{len(trade_dates)} trade dates ({self._start_date} ~ {self._end_date})"
+        )
+        for trade_date in trade_dates:
+            yield trade_date, self.get_day_candles(trade_date)
+
+    def load_daily_candles(self, lookback_days: int = 150) -> Dict[str, List[DailyCandle]]:
+        """
+        종목별 일봉 적재 (시작일 lookback_days 이전부터 종료일까지, 오름차순)
+
+        Args:
+            lookback_days: 시작일 이전 조회 기간 (달력 기준 일수)
+
+        Returns:
+            {종목코드: [DailyCandle, ...]}
+        """
+        from_date = (
+            datetime.strptime(self._start_date, "%Y%m%d") - timedelta(days=lookback_days)
+        ).strftime("%Y%m%d")
+
+        result: Dict[str, List[DailyCandle]] = {code: [] for code in self._stock_codes}
+        if not self._stock_codes:
+            return result
+
+        rows = self._db.fetch_all(
+            f"""
+            SELECT stock_code, trade_date, open_price, high_price, low_price,
+                   close_price, volume, trade_amount, adj_close_price, change_rate
+            FROM daily_candles
+            WHERE stock_code IN ({self._placeholders})
+              AND trade_date BETWEEN ? AND ?
+            ORDER BY stock_code, trade_date
+            """,
+            (*self._stock_codes, from_date, self._end_date),
+        )
+        for row in rows:
+            result[row[0]].append(
+                DailyCandle(
+                    stock_code=row[0],
+                    trade_date=row[1],
+                    open_price=row[2],
+                    high_price=row[3],
+                    low_price=row[4],
+                    close_price=row[5],
+                    volume=row[6],
+                    trade_amount=row[7],
+                    adj_close_price=row[8],
+                    change_rate=row[9],
+                )
+            )
+        return result
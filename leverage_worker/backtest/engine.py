@@ -0,0 +1,572 @@
+"""
+이벤트 기반 백테스트 엔진
+
+MarketDataDB 분봉을 시간순으로 재생하며 실제 전략(StrategyRegistry)을 구동
+- 분봉 완성 시점(봉 시작 + 1분)에 TradingEngine._handle_market_snapshot과 같은 방식으로
+  StrategyContext 생성 (최근 500개 분봉 뷰, 일봉 + 당일 진행 일봉, 브로커 포지션, 당일 거래 수)
+- 시그널 처리는 TradingEngine._process_signal / ScalpingExecutor.activate_limit_order 축약판
+- 주문/체결은 SimulatedBroker (수수료, 호가단위 보정)
+- 결과: 거래 원장 + 분 단위 평가자산 곡선
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from leverage_worker.backtest.broker import BacktestTrade, SimFill, SimulatedBroker
+from leverage_worker.backtest.data_feed import MarketDataFeed
+from leverage_worker.config.settings import Settings
+from leverage_worker.data.candle_store import CandleView
+from leverage_worker.data.daily_candle_repository import DailyCandle
+from leverage_worker.data.database import MarketDataDB
+from leverage_worker.data.minute_candle_repository import MinuteCandle
+from leverage_worker.scalping.models import ScalpingConfig
+from leverage_worker.strategy import BaseStrategy, StrategyContext, StrategyRegistry, TradingSignal
+from leverage_worker.strategy import strategies as _strategies  # noqa: F401 (전략 자동 등록)
+from leverage_worker.trading.broker import OrderSide
+from leverage_worker.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class StrategySpec:
+    """백테스트 대상 전략 (trading_config.yaml의 stocks.<code>.strategies 항목과 동일 구성)"""
+
+    stock_code: str
+    name: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    allocation: float = 100.0
+    execution_mode: str = "scheduler"  # "scheduler" | "scalping"
+    stock_name: str = ""
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> List["StrategySpec"]:
+        """설정 파일의 종목/전략 목록 변환 (websocket 전략 제외)"""
+        specs = []
+        for stock_code, stock_config in settings.stocks.items():
+            for strategy_config in stock_config.strategies:
+                name = strategy_config.get("name")
+                mode = strategy_config.get("execution_mode", "scheduler")
+                if not name or mode == "websocket":
+                    continue
+                specs.append(
+                    cls(
+                        stock_code=stock_code,
+                        name=name,
+                        params=strategy_config.get("params", {}),
+                        allocation=float(strategy_config.get("allocation", 100)),
+                        execution_mode=mode,
+                        stock_name=stock_config.name,
+                    )
+                )
+        return specs
+
+
+@dataclass
+class BacktestConfig:
+    """백테스트 설정"""
+
+    start_date: str  # YYYYMMDD (포함)
+    end_date: str  # YYYYMMDD (포함)
+    initial_cash: int = 10_000_000
+    buy_fee_rate: float = 0.00015
+    sell_fee_rate: float = 0.00015
+    sell_tax_rate: float = 0.0
+    slippage_ticks: int = 0
+    history_size: int = 500  # 전략에 전달하는 분봉 개수 (_handle_market_snapshot과 동일)
+    daily_history_days: int = 100  # 전략에 전달하는 과거 일봉 개수
+    liquidation_time: Optional[str] = "15:19"  # 당일 청산 시각 (None이면 보유 이월)
+
+
+@dataclass
+class BacktestResult:
+    """백테스트 결과"""
+
+    config: BacktestConfig
+    trades: List[BacktestTrade]
+    fills: List[SimFill]
+    equity_curve: List[Tuple[datetime, int]]
+    final_equity: int
+    bars_processed: int
+    elapsed_seconds: float
+
+    def summary(self) -> Dict[str, Any]:
+        """성과 요약"""
+        initial = self.config.initial_cash
+        wins = [t for t in self.trades if t.pnl > 0]
+        gross_profit = sum(t.pnl for t in wins)
+        gross_loss = -sum(t.pnl for t in self.trades if t.pnl < 0)
+
+        peak = initial
+        max_drawdown = 0.0
+        for _, equity in self.equity_curve:
+            peak = max(peak, equity)
+            if peak > 0:
+                max_drawdown = max(max_drawdown, (peak - equity) / peak)
+
+        return {
+            "initial_cash": initial,
+            "final_equity": self.final_equity,
+            "total_return_pct": (self.final_equity - initial) / initial * 100 if initial else 0.0,
+            "total_pnl": sum(t.pnl for t in self.trades),
+            "total_fees": sum(f.fee for f in self.fills),
+            "trade_count": len(self.trades),
+            "win_rate": len(wins) / len(self.trades) * 100 if self.trades else 0.0,
+            "profit_factor": gross_profit / gross_loss if gross_loss else 0.0,
+            "max_drawdown_pct": max_drawdown * 100,
+            "bars_processed": self.bars_processed,
+            "elapsed_seconds": round(self.elapsed_seconds, 2),
+        }
+
+    def trades_dataframe(self):
+        """거래 원장 DataFrame"""
+        import pandas as pd
+
+        columns = list(BacktestTrade.__dataclass_fields__)
+        return pd.DataFrame(
+            [[getattr(t, c) for c in columns] for t in self.trades], columns=columns
+        )
+
+    def equity_dataframe(self):
+        """평가자산 곡선 DataFrame (timestamp, equity, pnl)"""
+        import pandas as pd
+
+        df = pd.DataFrame(self.equity_curve, columns=["timestamp", "equity"])
+        df["pnl"] = df["equity"] - self.config.initial_cash
+        return df
+
+
+class _LimitOrderCycle:
+    """
+    scalping 실행 모드 limit_order 사이클 (ScalpingExecutor 축약)
+
+    idle → buy_pending (지정가 매수) → holding (지정가 익절 매도 대기)
+    → 익절 체결 / 손절 / 타임아웃 시장가 매도 → idle
+    """
+
+    __slots__ = (
+        "spec", "config", "state", "buy_order_id", "buy_time",
+        "sell_order_id", "sell_price", "timeout_seconds", "fill_time",
+    )
+
+    def __init__(self, spec: StrategySpec):
+        self.spec = spec
+        self.config = ScalpingConfig.from_params(spec.params)
+        self.reset()
+
+    def reset(self) -> None:
+        self.state = "idle"
+        self.buy_order_id: Optional[str] = None
+        self.buy_time: Optional[datetime] = None
+        self.sell_order_id: Optional[str] = None
+        self.sell_price = 0
+        self.timeout_seconds = 0
+        self.fill_time: Optional[datetime] = None
+
+    @property
+    def is_active(self) -> bool:
+        return self.state != "idle"
+
+
+class BacktestEngine:
+    """
+    분봉 리플레이 백테스트 엔진
+
+    사용 예:
+        engine = BacktestEngine(MarketDataDB(), specs, BacktestConfig("20250101", "20251231"))
+        result = engine.run()
+        print(result.summary())
+    """
+
+    def __init__(
+        self,
+        db: Optional[MarketDataDB],
+        specs: List[StrategySpec],
+        config: BacktestConfig,
+        feed: Optional[MarketDataFeed] = None,
+    ):
+        """
+        Args:
+            db: 시세 DB (분봉/일봉, feed 지정 시 None 가능)
+            specs: 대상 종목/전략 목록
+            config: 백테스트 설정
+            feed: 분봉 피드 (기본: db 조회 MarketDataFeed, 스윕 워커는 ArrayFeed)
+        """
+        self._db = db
+        self._config = config
+        self._specs = specs
+
+        self._strategies: Dict[Tuple[str, str], BaseStrategy] = {}
+        self._specs_by_code: Dict[str, List[StrategySpec]] = {}
+        self._cycles: Dict[Tuple[str, str], _LimitOrderCycle] = {}
+        for spec in specs:
+            strategy = StrategyRegistry.get(spec.name, spec.params)
+            if strategy is None:
+                raise ValueError(f"Strategy not found: {spec.name}")
+            key = (spec.stock_code, spec.name)
+            self._strategies[key] = strategy
+            self._specs_by_code.setdefault(spec.stock_code, []).append(spec)
+            if spec.execution_mode == "scalping":
+                self._cycles[key] = _LimitOrderCycle(spec)
+
+        self._stock_names = {
+            spec.stock_code: spec.stock_name or spec.stock_code for spec in specs
+        }
+        if feed is None:
+            feed = MarketDataFeed(db, list(self._specs_by_code), config.start_date, config.end_date)
+        self._feed = feed
+        self._broker: Optional[SimulatedBroker] = None
+
+        # 종목별 상태
+        self._history: Dict[str, List[MinuteCandle]] = {}
+        self._all_daily: Dict[str, List[DailyCandle]] = {}
+        self._daily_context: Dict[str, List[DailyCandle]] = {}
+        self._liquidated = False
+
+    @property
+    def broker(self) -> Optional[SimulatedBroker]:
+        """시뮬레이션 브로커 (run() 이후 유효)"""
+        return self._broker
+
+    # ==========================================
+    # 실행
+    # ==========================================
+
+    def run(self) -> BacktestResult:
+        """백테스트 실행"""
+        import time
+
+        started = time.perf_counter()
+        config = self._config
+
+        self._all_daily = self._feed.load_daily_candles(
+            lookback_days=config.daily_history_days * 2
+        )
+        broker = SimulatedBroker(
+            initial_cash=config.initial_cash,
+            buy_fee_rate=config.buy_fee_rate,
+            sell_fee_rate=config.sell_fee_rate,
+            sell_tax_rate=config.sell_tax_rate,
+            slippage_ticks=config.slippage_ticks,
+            stock_names=self._stock_names,
+            daily_candles=self._all_daily,
+        )
+        self._broker = broker
+        self._history = {code: [] for code in self._specs_by_code}
+
+        equity_curve: List[Tuple[datetime, int]] = []
+        bars = 0
+        for trade_date, candles in self._feed.iter_days():
+            self._begin_day(trade_date)
+            current_minute = None
+            for candle in candles:
+                if candle.candle_datetime != current_minute:
+                    if current_minute is not None:
+                        equity_curve.append((broker.now, broker.get_equity()))
+                    current_minute = candle.candle_datetime
+                self._on_bar(candle)
+                bars += 1
+            if current_minute is not None:
+                equity_curve.append((broker.now, broker.get_equity()))
+            self._end_day()
+
+        elapsed = time.perf_counter() - started
+        result = BacktestResult(
+            config=config,
+            trades=broker.trades,
+            fills=broker.fills,
+            equity_curve=equity_curve,
+            final_equity=broker.get_equity(),
+            bars_processed=bars,
+            elapsed_seconds=elapsed,
+        )
+        logger.info(f"[backtest] 완료: {result.summary()}")
+        return result
+
+    def _begin_day(self, trade_date: str) -> None:
+        """거래일 시작: 일봉 컨텍스트(전일까지 + 당일 진행 일봉) 구성"""
+        self._broker.begin_day()
+        self._liquidated = False
+        days = self._config.daily_history_days
+        for code in self._specs_by_code:
+            past = [c for c in self._all_daily.get(code, []) if c.trade_date < trade_date]
+            self._daily_context[code] = past[-days:]
+
+    def _end_day(self) -> None:
+        """거래일 종료: 미체결 주문 만료"""
+        self._broker.cancel_all_pending_orders()
+        for cycle in self._cycles.values():
+            if cycle.state == "buy_pending":
+                cycle.reset()
+
+    def _on_bar(self, candle: MinuteCandle) -> None:
+        """분봉 1개 처리"""
+        broker = self._broker
+        stock_code = candle.stock_code
+        now = datetime.strptime(candle.candle_datetime, "%Y-%m-%d %H:%M") + timedelta(minutes=1)
+
+        broker.on_bar(candle, now)
+        self._update_history(candle)
+
+        # 당일 청산 (TradingEngine 15:19 청산 콜백 대응)
+        liquidation_time = self._config.liquidation_time
+        if liquidation_time and now.strftime("%H:%M") >= liquidation_time:
+            if not self._liquidated:
+                self._liquidate_all()
+            return
+
+        for spec in self._specs_by_code.get(stock_code, ()):
+            cycle = self._cycles.get((stock_code, spec.name))
+            if cycle:
+                self._update_cycle(cycle, candle, now)
+
+        current_price = int(candle.close_price)
+        history = self._history[stock_code]
+        size = self._config.history_size
+        price_history = CandleView(history, max(0, len(history) - size), len(history))
+        daily_candles = self._daily_context.get(stock_code, [])
+        position = broker.get_position(stock_code)
+        owner = broker.get_position_owner(stock_code)
+        trade_count = broker.get_today_trade_count(stock_code)
+
+        for spec in self._specs_by_code.get(stock_code, ()):
+            strategy = self._strategies[(stock_code, spec.name)]
+            context = StrategyContext(
+                stock_code=stock_code,
+                stock_name=self._stock_names[stock_code],
+                current_price=current_price,
+                current_time=now,
+                price_history=price_history,
+                position=position,
+                daily_candles=daily_candles,
+                today_trade_count=trade_count,
+            )
+            if not strategy.can_generate_signal(context):
+                continue
+
+            cycle = self._cycles.get((stock_code, spec.name))
+            if cycle:
+                self._process_scalping_signal(cycle, strategy.generate_signal(context), context)
+                continue
+
+            # 다른 전략의 포지션이면 시그널만 생성 (TradingEngine과 동일)
+            if owner is not None and owner != spec.name:
+                strategy.generate_signal(context)
+                continue
+
+            self._process_signal(spec, strategy, strategy.generate_signal(context), context)
+            position = broker.get_position(stock_code)
+            owner = broker.get_position_owner(stock_code)
+            trade_count = broker.get_today_trade_count(stock_code)
+
+    def _update_history(self, candle: MinuteCandle) -> None:
+        """분봉 히스토리/당일 진행 일봉 갱신"""
+        stock_code = candle.stock_code
+        history = self._history[stock_code]
+        history.append(candle)
+        if len(history) > self._config.history_size * 2:
+            # 새 리스트로 교체 (이미 전달된 CandleView는 기존 리스트 유지)
+            self._history[stock_code] = history[-self._config.history_size:]
+
+        daily = self._daily_context[stock_code]
+        today = daily[-1] if daily and daily[-1].trade_date == candle.trade_date else None
+        if today is None:
+            daily.append(
+                DailyCandle(
+                    stock_code=stock_code,
+                    trade_date=candle.trade_date,
+                    open_price=candle.open_price,
+                    high_price=candle.high_price,
+                    low_price=candle.low_price,
+                    close_price=candle.close_price,
+                    volume=candle.volume,
+                )
+            )
+        else:
+            today.high_price = max(today.high_price, candle.high_price)
+            today.low_price = min(today.low_price, candle.low_price)
+            today.close_price = candle.close_price
+            today.volume += candle.volume
+
+    def _liquidate_all(self) -> None:
+        """미체결 취소 + 전 종목 시장가 매도"""
+        broker = self._broker
+        broker.cancel_all_pending_orders()
+        for cycle in self._cycles.values():
+            cycle.reset()
+        positions, _ = broker.get_balance()
+        for pos in positions:
+            broker.place_market_order(
+                pos.stock_code, OrderSide.SELL, pos.quantity,
+                strategy_name=broker.get_position_owner(pos.stock_code) or "",
+                reason="당일청산",
+            )
+        self._liquidated = True
+
+    # ==========================================
+    # 시그널 처리 (TradingEngine._process_signal 대응)
+    # ==========================================
+
+    def _process_signal(
+        self,
+        spec: StrategySpec,
+        strategy: BaseStrategy,
+        signal: TradingSignal,
+        context: StrategyContext,
+    ) -> None:
+        """scheduler 실행 모드 시그널 처리"""
+        if signal.is_hold:
+            return
+
+        broker = self._broker
+        stock_code = signal.stock_code
+
+        if signal.is_buy:
+            strategy.on_entry(context, signal)
+
+            price_offset_pct = strategy.params.get("price_offset_pct", 0.0)
+            signal_price = int(context.current_price * (1 + price_offset_pct))
+
+            _, max_buy_amt = broker.get_buyable_quantity(stock_code, signal_price)
+            price_with_fee = int(signal_price * (1 + self._config.buy_fee_rate))
+            buyable_qty = max_buy_amt // price_with_fee if price_with_fee > 0 else 0
+            if buyable_qty > 0:
+                quantity = max(1, int(buyable_qty * (spec.allocation / 100)))
+            else:
+                quantity = signal.quantity
+
+            # 지정가 추격 매수 → 매도1호가 지정가 (즉시 체결)
+            ask = broker.get_asking_price(stock_code) or context.current_price
+            broker.place_limit_order(
+                stock_code, OrderSide.BUY, quantity, ask,
+                strategy_name=spec.name, reason=signal.reason,
+            )
+
+        elif signal.is_sell:
+            strategy.on_exit(context, signal)
+
+            quantity = min(signal.quantity or context.position_quantity, context.position_quantity)
+            if quantity <= 0:
+                return
+
+            if "익절" in signal.reason:
+                bid = broker.get_bidding_price(stock_code) or context.current_price
+                broker.place_limit_order(
+                    stock_code, OrderSide.SELL, quantity, bid,
+                    strategy_name=spec.name, reason=signal.reason,
+                )
+            else:
+                broker.place_market_order(
+                    stock_code, OrderSide.SELL, quantity,
+                    strategy_name=spec.name, reason=signal.reason,
+                )
+
+    # ==========================================
+    # scalping limit_order 사이클 (ScalpingExecutor 대응)
+    # ==========================================
+
+    def _process_scalping_signal(
+        self,
+        cycle: _LimitOrderCycle,
+        signal: TradingSignal,
+        context: StrategyContext,
+    ) -> None:
+        """scalping 실행 모드 시그널 처리"""
+        broker = self._broker
+
+        if signal.is_buy and signal.metadata.get("limit_price"):
+            if cycle.state == "buy_pending":
+                # 시그널 갱신: 기존 매수 주문 취소 후 재주문
+                broker.cancel_order(cycle.buy_order_id)
+                cycle.reset()
+            if cycle.is_active:
+                return
+
+            buy_price = int(signal.metadata["limit_price"])
+            quantity = signal.quantity
+            if quantity <= 0:
+                buyable_qty, _ = broker.get_buyable_quantity(context.stock_code, buy_price)
+                if buyable_qty <= 0:
+                    return
+                quantity = max(1, int(buyable_qty * (cycle.spec.allocation / 100)))
+
+            result = broker.place_limit_order(
+                context.stock_code, OrderSide.BUY, quantity, buy_price,
+                strategy_name=cycle.spec.name, reason=signal.reason,
+            )
+            if not result.success:
+                return
+
+            cycle.state = "buy_pending"
+            cycle.buy_order_id = result.order_id
+            cycle.buy_time = context.current_time
+            cycle.sell_price = int(signal.metadata["sell_price"])
+            cycle.timeout_seconds = int(signal.metadata.get("timeout_seconds", 60))
+            # 즉시 체결된 경우 바로 익절 주문
+            self._update_cycle(cycle, None, context.current_time)
+
+        elif signal.is_sell and cycle.is_active:
+            # 숏 시그널: 매수 대기 취소 / 보유 시 청산
+            if cycle.state == "buy_pending":
+                broker.cancel_order(cycle.buy_order_id)
+                cycle.reset()
+            else:
+                self._exit_cycle(cycle, context.stock_code, signal.reason)
+
+    def _update_cycle(
+        self,
+        cycle: _LimitOrderCycle,
+        candle: Optional[MinuteCandle],
+        now: datetime,
+    ) -> None:
+        """주문 체결/타임아웃/손절 확인"""
+        broker = self._broker
+        stock_code = cycle.spec.stock_code
+
+        if cycle.state == "buy_pending":
+            filled, unfilled = broker.get_order_status(cycle.buy_order_id)
+            if filled > 0 and unfilled == 0:
+                cycle.state = "holding"
+                cycle.fill_time = now
+                result = broker.place_limit_order(
+                    stock_code, OrderSide.SELL, filled, cycle.sell_price,
+                    strategy_name=cycle.spec.name, reason="익절",
+                )
+                cycle.sell_order_id = result.order_id if result.success else None
+            elif (now - cycle.buy_time).total_seconds() >= cycle.config.buy_timeout_seconds:
+                broker.cancel_order(cycle.buy_order_id)
+                cycle.reset()
+            return
+
+        if cycle.state != "holding":
+            return
+
+        position = broker.get_position(stock_code)
+        if position is None:
+            # 익절 체결 완료
+            cycle.reset()
+            return
+
+        # 체결 봉 이후부터 손절 확인
+        if candle is not None and now > cycle.fill_time:
+            sl_price = position.avg_price * (1 - cycle.config.stop_loss_pct)
+            if candle.low_price <= sl_price:
+                self._exit_cycle(cycle, stock_code, "손절")
+                return
+
+        if (now - cycle.fill_time).total_seconds() >= cycle.timeout_seconds:
+            self._exit_cycle(cycle, stock_code, "타임아웃")
+
+    def _exit_cycle(self, cycle: _LimitOrderCycle, stock_code: str, reason: str) -> None:
+        """익절 주문 취소 + 시장가 매도"""
+        broker = self._broker
+        if cycle.sell_order_id:
+            broker.cancel_order(cycle.sell_order_id)
+        position = broker.get_position(stock_code)
+        if position is not None:
+            broker.place_market_order(
+                stock_code, OrderSide.SELL, position.quantity,
+                strategy_name=cycle.spec.name, reason=reason,
+            )
+        cycle.reset()
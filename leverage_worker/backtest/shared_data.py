@@ -0,0 +1,360 @@
+"""
+백테스트 공유 메모리 시세 모듈
+
+파라미터 스윕 워커들이 같은 분봉/일봉을 DB 재조회 없이 읽도록
+numpy 구조화 배열을 multiprocessing.shared_memory 블록에 적재
+- 부모 프로세스: SharedMarketData.create()로 1회 조회 후 공유 메모리 생성
+  (분봉은 MinuteCandleReader → Parquet 아카이브 + SQLite)
+- 워커 프로세스: SharedMarketData.attach(handle)로 복사 없이 연결
+- ArrayFeed: MarketDataFeed와 같은 인터페이스 (BacktestEngine feed로 사용)
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from multiprocessing import shared_memory
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from leverage_worker.data.candle_archive import MinuteCandleArchive, MinuteCandleReader
+from leverage_worker.data.daily_candle_repository import DailyCandle
+from leverage_worker.data.database import MarketDataDB
+from leverage_worker.data.minute_candle_repository import MinuteCandle
+from leverage_worker.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 분봉: (candle_datetime, stock_code) 오름차순 정렬
+MINUTE_DTYPE = np.dtype([
+    ("code", np.int16),  # stock_codes 인덱스
+    ("ts", "datetime64[m]"),
+    ("trade_date", np.int32),  # YYYYMMDD
+    ("open", np.float64),
+    ("high", np.float64),
+    ("low", np.float64),
+    ("close", np.float64),
+    ("volume", np.int64),
+])
+
+# 일봉: (stock_code, trade_date) 오름차순 정렬, 결측은 NaN
+DAILY_DTYPE = np.dtype([
+    ("code", np.int16),
+    ("trade_date", np.int32),
+    ("open", np.float64),
+    ("high", np.float64),
+    ("low", np.float64),
+    ("close", np.float64),
+    ("volume", np.int64),
+    ("trade_amount", np.float64),
+    ("adj_close", np.float64),
+    ("change_rate", np.float64),
+])
+
+
+@dataclass(frozen=True)
+class SharedDataHandle:
+    """워커 전달용 공유 메모리 핸들 (pickle 가능)"""
+
+    stock_codes: Tuple[str, ...]
+    start_date: str
+    end_date: str
+    minute_shm: Optional[str]
+    minute_count: int
+    daily_shm: Optional[str]
+    daily_count: int
+
+
+def _optional(value) -> float:
+    return float("nan") if value is None else float(value)
+
+
+def _to_block(
+    array: np.ndarray,
+) -> Tuple[Optional[shared_memory.SharedMemory], np.ndarray]:
+    """구조화 배열 → 공유 메모리 블록 복사 (블록, 블록 위 배열 뷰)"""
+    if len(array) == 0:
+        return None, array
+    block = shared_memory.SharedMemory(create=True, size=array.nbytes)
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+    view[:] = array
+    return block, view
+
+
+def _from_block(
+    name: Optional[str], count: int, dtype: np.dtype
+) -> Tuple[Optional[shared_memory.SharedMemory], np.ndarray]:
+    if name is None:
+        return None, np.empty(0, dtype=dtype)
+    # 3.13+: 연결만 하는 쪽은 resource_tracker 등록 제외 (생성자가 unlink)
+    try:
+        block = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray((count,), dtype=dtype, buffer=block.buf)
+
+
+class SharedMarketData:
+    """
+    공유 메모리 분봉/일봉 배열
+
+    사용 예:
+        with SharedMarketData.create(db, codes, "20250101", "20251231") as data:
+            handle = data.handle  # 워커로 전달
+            ...
+        # 워커:
+        data = SharedMarketData.attach(handle)
+        feed = data.feed(["122630"])
+    """
+
+    def __init__(
+        self,
+        handle: SharedDataHandle,
+        minute: np.ndarray,
+        daily: np.ndarray,
+        blocks: Sequence[Optional[shared_memory.SharedMemory]],
+        owner: bool,
+    ):
+        self._handle = handle
+        self._minute = minute
+        self._daily = daily
+        self._blocks = [b for b in blocks if b is not None]
+        self._owner = owner
+        self._code_index = {code: i for i, code in enumerate(handle.stock_codes)}
+
+    # ==========================================
+    # 생성 / 연결
+    # ==========================================
+
+    @classmethod
+    def create(
+        cls,
+        db: MarketDataDB,
+        stock_codes: Sequence[str],
+        start_date: str,
+        end_date: str,
+        daily_lookback_days: int = 200,
+        archive: Optional[MinuteCandleArchive] = None,
+    ) -> "SharedMarketData":
+        """
+        DB 1회 조회 후 공유 메모리 생성
+
+        Args:
+            db: 시세 DB
+            stock_codes: 대상 종목코드
+            start_date: 분봉 시작일 (YYYYMMDD, 포함)
+            end_date: 분봉 종료일 (YYYYMMDD, 포함)
+            daily_lookback_days: 일봉 추가 조회 기간 (시작일 이전 달력 일수)
+            archive: 분봉 Parquet 아카이브 (이관된 거래일 포함)
+        """
+        codes = tuple(dict.fromkeys(stock_codes))
+        code_index = {code: i for i, code in enumerate(codes)}
+        placeholders = ",".join("?" * len(codes))
+
+        # 분봉: 종목별 (아카이브 + SQLite) 배열 → (시각, 종목) 순 정렬
+        reader = MinuteCandleReader(db, archive)
+        parts = []
+        for i, code in enumerate(codes):
+            arrays = reader.read_arrays(code, start_date, end_date)
+            part = np.empty(len(arrays["timestamp"]), dtype=MINUTE_DTYPE)
+            part["code"] = i
+            part["ts"] = arrays["timestamp"]
+            part["trade_date"] = arrays["trade_date"]
+            for field in ("open", "high", "low", "close", "volume"):
+                part[field] = arrays[field]
+            parts.append(part)
+        minute = np.concatenate(parts) if parts else np.empty(0, dtype=MINUTE_DTYPE)
+        minute = minute[np.lexsort((minute["code"], minute["ts"]))]
+
+        from_date = (
+            datetime.strptime(start_date, "%Y%m%d") - timedelta(days=daily_lookback_days)
+        ).strftime("%Y%m%d")
+        rows = db.fetch_all(
+            f"""
+            SELECT stock_code, trade_date, open_price, high_price, low_price,
+                   close_price, volume, trade_amount, adj_close_price, change_rate
+            FROM daily_candles
+            WHERE stock_code IN ({placeholders}) AND trade_date BETWEEN ? AND ?
+            ORDER BY stock_code, trade_date
+            """,
+            (*codes, from_date, end_date),
+        ) if codes else []
+        daily = np.empty(len(rows), dtype=DAILY_DTYPE)
+        if rows:
+            daily["code"] = [code_index[r[0]] for r in rows]
+            daily["trade_date"] = [int(r[1]) for r in rows]
+            daily["open"] = [r[2] for r in rows]
+            daily["high"] = [r[3] for r in rows]
+            daily["low"] = [r[4] for r in rows]
+            daily["close"] = [r[5] for r in rows]
+            daily["volume"] = [r[6] or 0 for r in rows]
+            daily["trade_amount"] = [_optional(r[7]) for r in rows]
+            daily["adj_close"] = [_optional(r[8]) for r in rows]
+            daily["change_rate"] = [_optional(r[9]) for r in rows]
+
+        minute_block, minute_view = _to_block(minute)
+        daily_block, daily_view = _to_block(daily)
+        handle = SharedDataHandle(
+            stock_codes=codes,
+            start_date=start_date,
+            end_date=end_date,
+            minute_shm=minute_block.name if minute_block else None,
+            minute_count=len(minute),
+            daily_shm=daily_block.name if daily_block else None,
+            daily_count=len(daily),
+        )
+
+        logger.info(
+            f"[backtest] shared data: {len(codes)} stocks, "
+            f"{len(minute):,} minute / {len(daily):,} daily candles "
+            f"({(minute.nbytes + daily.nbytes) / 1024 / 1024:.1f} MB)"
+        )
+        return cls(handle, minute_view, daily_view, [minute_block, daily_block], owner=True)
+
+    @classmethod
+    def attach(cls, handle: SharedDataHandle) -> "SharedMarketData":
+        """기존 공유 메모리에 연결 (복사 없음)"""
+        minute_block, minute = _from_block(handle.minute_shm, handle.minute_count, MINUTE_DTYPE)
+        daily_block, daily = _from_block(handle.daily_shm, handle.daily_count, DAILY_DTYPE)
+        return cls(handle, minute, daily, [minute_block, daily_block], owner=False)
+
+    @property
+    def handle(self) -> SharedDataHandle:
+        return self._handle
+
+    @property
+    def minute(self) -> np.ndarray:
+        """분봉 구조화 배열 (읽기 전용으로 사용)"""
+        return self._minute
+
+    @property
+    def daily(self) -> np.ndarray:
+        """일봉 구조화 배열 (읽기 전용으로 사용)"""
+        return self._daily
+
+    def feed(self, stock_codes: Optional[Sequence[str]] = None) -> "ArrayFeed":
+        """종목 부분집합 피드 생성"""
+        codes = list(stock_codes) if stock_codes is not None else list(self._handle.stock_codes)
+        unknown = [c for c in codes if c not in self._code_index]
+        if unknown:
+            raise KeyError(f"Stock codes not in shared data: {unknown}")
+        return ArrayFeed(self, codes)
+
+    def close(self) -> None:
+        """공유 메모리 연결 해제 (생성자는 블록 삭제까지)"""
+        self._minute = np.empty(0, dtype=MINUTE_DTYPE)
+        self._daily = np.empty(0, dtype=DAILY_DTYPE)
+        for block in self._blocks:
+            try:
+                block.close()
+            except BufferError:
+                # 외부에서 배열 뷰를 아직 참조 중 → 매핑은 GC 시 해제
+                pass
+            if self._owner:
+                try:
+                    block.unlink()
+                except FileNotFoundError:
+                    pass
+        self._blocks = []
+
+    def __enter__(self) -> "SharedMarketData":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class ArrayFeed:
+    """
+    공유 배열 기반 분봉 리플레이 피드 (MarketDataFeed 호환)
+
+    거래일 구간은 searchsorted로 찾고, 분봉 객체는 해당 일자만 생성
+    """
+
+    def __init__(self, data: SharedMarketData, stock_codes: Sequence[str]):
+        self._data = data
+        self._stock_codes = list(dict.fromkeys(stock_codes))
+        all_codes = data.handle.stock_codes
+        self._codes = np.array([all_codes.index(c) for c in self._stock_codes], dtype=np.int16)
+        self._all_codes = all_codes
+
+        minute = data.minute
+        if len(self._codes) == len(all_codes):
+            self._minute = minute
+        else:
+            self._minute = minute[np.isin(minute["code"], self._codes)]
+        dates = self._minute["trade_date"]
+        self._trade_dates, self._day_starts = np.unique(dates, return_index=True)
+
+    @property
+    def stock_codes(self) -> List[str]:
+        return list(self._stock_codes)
+
+    def get_trade_dates(self) -> List[str]:
+        return [str(d) for d in self._trade_dates]
+
+    def get_day_candles(self, trade_date: str) -> List[MinuteCandle]:
+        i = int(np.searchsorted(self._trade_dates, int(trade_date)))
+        if i >= len(self._trade_dates) or self._trade_dates[i] != int(trade_date):
+            return []
+        return self._build_candles(i)
+
+    def _build_candles(self, day_index: int) -> List[MinuteCandle]:
+        start = self._day_starts[day_index]
+        stop = (
+            self._day_starts[day_index + 1]
+            if day_index + 1 < len(self._day_starts) else len(self._minute)
+        )
+        day = self._minute[start:stop]
+        trade_date = str(self._trade_dates[day_index])
+        codes = self._all_codes
+        stamps = np.char.replace(np.datetime_as_string(day["ts"], unit="m"), "T", " ").tolist()
+        return [
+            MinuteCandle(
+                stock_code=codes[code],
+                candle_datetime=stamp,
+                trade_date=trade_date,
+                open_price=o,
+                high_price=h,
+                low_price=l,
+                close_price=c,
+                volume=v,
+            )
+            for code, stamp, o, h, l, c, v in zip(
+                day["code"].tolist(), stamps, day["open"].tolist(), day["high"].tolist(),
+                day["low"].tolist(), day["close"].tolist(), day["volume"].tolist(),
+            )
+        ]
+
+    def iter_days(self) -> Iterator[Tuple[str, List[MinuteCandle]]]:
+        for i in range(len(self._trade_dates)):
+            yield str(self._trade_dates[i]), self._build_candles(i)
+
+    def load_daily_candles(self, lookback_days: int = 150) -> Dict[str, List[DailyCandle]]:
+        """종목별 일봉 (공유 배열에 적재된 범위 내에서 lookback_days 적용)"""
+        from_date = int(
+            (
+                datetime.strptime(self._data.handle.start_date, "%Y%m%d")
+                - timedelta(days=lookback_days)
+            ).strftime("%Y%m%d")
+        )
+        daily = self._data.daily
+        result: Dict[str, List[DailyCandle]] = {code: [] for code in self._stock_codes}
+        for code_idx, code in zip(self._codes.tolist(), self._stock_codes):
+            rows = daily[(daily["code"] == code_idx) & (daily["trade_date"] >= from_date)]
+            for row in rows.tolist():
+                _, trade_date, o, h, l, c, v, amount, adj, rate = row
+                result[code].append(
+                    DailyCandle(
+                        stock_code=code,
+                        trade_date=str(trade_date),
+                        open_price=o,
+                        high_price=h,
+                        low_price=l,
+                        close_price=c,
+                        volume=v,
+                        trade_amount=None if amount != amount else int(amount),
+                        adj_close_price=None if adj != adj else adj,
+                        change_rate=None if rate != rate else rate,
+                    )
+                )
+        return result
@@ -0,0 +1,257 @@
+"""
+전략 파라미터 스윕 모듈
+
+StrategyRegistry 전략의 params 탐색 공간(그리드/랜덤)을 종목별로 백테스트
+- 분봉/일봉은 부모 프로세스에서 1회 조회 → 공유 메모리 (SharedMarketData)
+- (파라미터 조합, 종목) 단위 작업을 ProcessPoolExecutor로 병렬 실행
+- 결과 요약 테이블을 Parquet으로 저장
+
+사용 예:
+    result = run_sweep(
+        "bollinger_band",
+        {"window": [15, 20, 30], "num_std": [1.5, 2.0, 2.5]},
+        ["122630", "233740"],
+        "20250101", "20251231",
+        output_path=Path("sweeps/bollinger_band.parquet"),
+    )
+    print(result.ranked("total_return_pct").head())
+"""
+
+import itertools
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from leverage_worker.backtest.engine import BacktestConfig, BacktestEngine, StrategySpec
+from leverage_worker.backtest.shared_data import SharedDataHandle, SharedMarketData
+from leverage_worker.data.candle_archive import MinuteCandleArchive
+from leverage_worker.data.database import MarketDataDB
+from leverage_worker.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 워커 프로세스 전역 (initializer에서 공유 메모리 연결)
+_worker_data: Optional[SharedMarketData] = None
+
+
+# ==========================================
+# 탐색 공간
+# ==========================================
+
+def iter_grid(space: Dict[str, Sequence[Any]]) -> Iterator[Dict[str, Any]]:
+    """그리드 탐색: 모든 조합"""
+    keys = list(space)
+    for values in itertools.product(*(space[k] for k in keys)):
+        yield dict(zip(keys, values))
+
+
+def sample_space(
+    space: Dict[str, Sequence[Any]],
+    n_samples: int,
+    seed: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    랜덤 탐색: 그리드 조합 중 중복 없이 n_samples개 추출
+
+    전체 조합을 나열하지 않고 인덱스만 추출 (큰 공간도 메모리 일정)
+    """
+    keys = list(space)
+    sizes = [len(space[k]) for k in keys]
+    total = 1
+    for size in sizes:
+        total *= size
+
+    rng = random.Random(seed)
+    combos = []
+    for index in rng.sample(range(total), min(n_samples, total)):
+        params = {}
+        for key, size in zip(reversed(keys), reversed(sizes)):
+            index, pos = divmod(index, size)
+            params[key] = space[key][pos]
+        combos.append({k: params[k] for k in keys})
+    return combos
+
+
+# ==========================================
+# 결과
+# ==========================================
+
+@dataclass
+class SweepResult:
+    """스윕 결과 ((조합, 종목)별 성과 요약 행)"""
+
+    strategy_name: str
+    param_names: List[str]
+    rows: List[Dict[str, Any]] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    def to_dataframe(self):
+        """요약 테이블 (combo_id, stock_code, param_*, 성과 지표)"""
+        import pandas as pd
+
+        return pd.DataFrame(self.rows)
+
+    def ranked(self, metric: str = "total_return_pct", ascending: bool = False):
+        """조합별 종목 평균 성과 순위"""
+        df = self.to_dataframe()
+        if df.empty:
+            return df
+        df = df[df["error"].isna()]
+        param_cols = [f"param_{name}" for name in self.param_names]
+        agg = df.groupby("combo_id").agg(
+            {**{c: "first" for c in param_cols}, metric: "mean", "trade_count": "sum"}
+        )
+        return agg.sort_values(metric, ascending=ascending)
+
+    def to_parquet(self, path: Path) -> Path:
+        """Parquet 저장"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.to_dataframe().to_parquet(path, index=False)
+        return path
+
+
+# ==========================================
+# 워커
+# ==========================================
+
+def _init_worker(handle: SharedDataHandle) -> None:
+    """워커 초기화: 공유 메모리 연결"""
+    global _worker_data
+    _worker_data = SharedMarketData.attach(handle)
+
+
+def _run_task(
+    combo_id: int,
+    spec: StrategySpec,
+    config: BacktestConfig,
+    data: Optional[SharedMarketData] = None,
+) -> Dict[str, Any]:
+    """(조합, 종목) 1건 백테스트"""
+    data = data or _worker_data
+    row: Dict[str, Any] = {"combo_id": combo_id, "stock_code": spec.stock_code}
+    row.update({f"param_{k}": v for k, v in spec.params.items()})
+    try:
+        engine = BacktestEngine(None, [spec], config, feed=data.feed([spec.stock_code]))
+        row.update(engine.run().summary())
+        row["error"] = None
+    except Exception as e:
+        row["error"] = f"{type(e).__name__}: {e}"
+    return row
+
+
+# ==========================================
+# 실행
+# ==========================================
+
+def run_sweep(
+    strategy_name: str,
+    space: Dict[str, Sequence[Any]],
+    stock_codes: Sequence[str],
+    start_date: str,
+    end_date: str,
+    base_params: Optional[Dict[str, Any]] = None,
+    n_samples: Optional[int] = None,
+    seed: Optional[int] = None,
+    execution_mode: str = "scheduler",
+    allocation: float = 100.0,
+    config: Optional[BacktestConfig] = None,
+    max_workers: Optional[int] = None,
+    db: Optional[MarketDataDB] = None,
+    archive: Optional[MinuteCandleArchive] = None,
+    output_path: Optional[Path] = None,
+) -> SweepResult:
+    """
+    파라미터 스윕 실행
+
+    Args:
+        strategy_name: 전략 이름 (StrategyRegistry)
+        space: {파라미터명: 후보값 목록}
+        stock_codes: 대상 종목코드 (종목별 독립 계좌로 평가)
+        start_date: 시작일 (YYYYMMDD)
+        end_date: 종료일 (YYYYMMDD)
+        base_params: 탐색하지 않는 고정 파라미터
+        n_samples: 지정 시 랜덤 탐색 (미지정 시 그리드 전체)
+        seed: 랜덤 탐색 시드
+        execution_mode: "scheduler" | "scalping"
+        allocation: 할당 비율 (%)
+        config: 백테스트 설정 (기간은 start_date/end_date로 대체)
+        max_workers: 워커 프로세스 수 (기본: CPU 수, 1이면 현재 프로세스에서 실행)
+        db: 시세 DB (기본: MarketDataDB())
+        archive: 분봉 Parquet 아카이브 (SQLite에서 이관된 거래일 포함)
+        output_path: Parquet 저장 경로
+
+    Returns:
+        SweepResult
+    """
+    started = time.perf_counter()
+    combos = (
+        sample_space(space, n_samples, seed) if n_samples else list(iter_grid(space))
+    )
+    base_config = config or BacktestConfig(start_date=start_date, end_date=end_date)
+    backtest_config = replace(base_config, start_date=start_date, end_date=end_date)
+    tasks = [
+        (
+            combo_id,
+            StrategySpec(
+                stock_code=code,
+                name=strategy_name,
+                params={**(base_params or {}), **params},
+                allocation=allocation,
+                execution_mode=execution_mode,
+            ),
+        )
+        for combo_id, params in enumerate(combos)
+        for code in stock_codes
+    ]
+    logger.info(
+        f"[sweep] {strategy_name}: {len(combos)} combos x {len(stock_codes)} stocks "
+        f"= {len(tasks)} backtests"
+    )
+
+    own_db = db is None
+    db = db or MarketDataDB()
+    try:
+        data = SharedMarketData.create(
+            db, stock_codes, start_date, end_date,
+            daily_lookback_days=backtest_config.daily_history_days * 2,
+            archive=archive,
+        )
+    finally:
+        if own_db:
+            db.close()
+
+    result = SweepResult(strategy_name=strategy_name, param_names=list(space))
+    workers = max_workers or os.cpu_count() or 1
+    with data:
+        if workers <= 1:
+            for combo_id, spec in tasks:
+                result.rows.append(_run_task(combo_id, spec, backtest_config, data))
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(data.handle,),
+            ) as executor:
+                futures = [
+                    executor.submit(_run_task, combo_id, spec, backtest_config)
+                    for combo_id, spec in tasks
+                ]
+                for done, future in enumerate(as_completed(futures), 1):
+                    result.rows.append(future.result())
+                    if done % 50 == 0 or done == len(futures):
+                        logger.info(f"[sweep] {done}/{len(futures)} done")
+
+    result.rows.sort(key=lambda r: (r["combo_id"], r["stock_code"]))
+    result.elapsed_seconds = time.perf_counter() - started
+
+    failed = sum(1 for r in result.rows if r["error"])
+    if failed:
+        logger.warning(f"[sweep] {failed} backtests failed (error 컬럼 참고)")
+    if output_path:
+        logger.info(f"[sweep] saved: {result.to_parquet(output_path)}")
+    return result
@@ -28,8 +28,8 @@ class ScheduleConfig:
     """스케줄 설정"""
     trading_start: str = "08:50"
     trading_end: str = "15:30"
-    default_interval_seconds: int = 5
-    default_offset_seconds: int = 0
+    default_interval_seconds: float = 5  # 1초 미만 가능 (예: 0.5)
+    default_offset_seconds: float = 0
     idle_check_interval_seconds: int = 60  # 장외 시간 체크 주기
 
 
@@ -45,8 +45,8 @@ class StockConfig:
     """개별 종목 설정"""
     code: str
     name: str
-    interval_seconds: Optional[int] = None  # None이면 전역 기본값 사용
-    offset_seconds: Optional[int] = None
+    interval_seconds: Optional[float] = None  # None이면 전역 기본값 사용
+    offset_seconds: Optional[float] = None
     strategies: List[Dict[str, Any]] = field(default_factory=list)
 
 
@@ -58,6 +58,9 @@ class NotificationConfig:
     slack_channel: Optional[str] = None  # Channel ID (C...)
     enable_trade_alerts: bool = True
     enable_daily_report: bool = True
+    slack_async: bool = True  # 백그라운드 전송 큐 사용
+    slack_queue_size: int = 500  # 전송 대기 최대 수 (초과 시 오래된 메시지 폐기)
+    slack_min_interval: float = 1.0  # 채널별 최소 전송 간격 (초)
 
 
 @dataclass
@@ -167,6 +170,9 @@ class Settings:
             slack_channel=notification_cfg.get("slack_channel"),
             enable_trade_alerts=notification_cfg.get("enable_trade_alerts", True),
             enable_daily_report=notification_cfg.get("enable_daily_report", True),
+            slack_async=notification_cfg.get("slack_async", True),
+            slack_queue_size=notification_cfg.get("slack_queue_size", 500),
+            slack_min_interval=notification_cfg.get("slack_min_interval", 1.0),
         )
 
         # 실행 설정
@@ -220,14 +226,14 @@ class Settings:
         """종목 설정 딕셔너리"""
         return self._stocks
 
-    def get_stock_interval(self, stock_code: str) -> int:
+    def get_stock_interval(self, stock_code: str) -> float:
         """종목별 interval 반환 (override 또는 기본값)"""
         stock = self._stocks.get(stock_code)
         if stock and stock.interval_seconds is not None:
             return stock.interval_seconds
         return self.schedule.default_interval_seconds
 
-    def get_stock_offset(self, stock_code: str) -> int:
+    def get_stock_offset(self, stock_code: str) -> float:
         """종목별 offset 반환 (override 또는 기본값)"""
         stock = self._stocks.get(stock_code)
         if stock and stock.offset_seconds is not None:
@@ -275,6 +281,103 @@ class Settings:
         """매수 수수료율 반환 (기본값: 0.015%)"""
         return self._execution.get("buy_fee_rate", 0.00015)
 
+    def get_api_rate_limit(self) -> Optional[float]:
+        """REST API 초당 호출 한도 반환 (None이면 모드별 KIS 기본값)"""
+        return self._execution.get("api_rate_limit")
+
+    def get_http_pool_size(self) -> int:
+        """REST API keep-alive 커넥션 풀 크기 반환"""
+        return self._execution.get("http_pool_size", 16)
+
+    def get_scheduler_mode(self) -> str:
+        """종목 틱 실행 방식 반환 (thread: 스레드 병렬, async: 단일 이벤트 루프)"""
+        return self._execution.get("scheduler_mode", "thread")
+
+    def get_ws_dataframe_mode(self) -> bool:
+        """WebSocket 수신 데이터 DataFrame 호환 모드 여부 (기본: 원문 직접 분해)"""
+        return self._execution.get("ws_dataframe_mode", False)
+
+    def get_minute_hot_days(self) -> int:
+        """SQLite에 남길 분봉 기간 (일, 0이면 장 마감 후 아카이브 이관 안 함)"""
+        return self._execution.get("minute_hot_days", 0)
+
+    def get_minute_archive_dir(self) -> Optional[Path]:
+        """분봉 Parquet 아카이브 경로 (None이면 data/minute_archive)"""
+        path = self._execution.get("minute_archive_dir")
+        return Path(path) if path else None
+
+    def get_db_single_writer(self) -> bool:
+        """DB 쓰기 전용 writer 스레드 사용 여부 (False면 스레드별 연결)"""
+        return self._execution.get("db_single_writer", True)
+
+    def get_latency_enabled(self) -> bool:
+        """틱→시그널→주문 지연 시간 계측 여부"""
+        return self._execution.get("latency_enabled", True)
+
+    def get_latency_dump_interval(self) -> float:
+        """지연 시간 요약 구조화 로그 기록 주기 (초, 0이면 장 마감 시에만)"""
+        return self._execution.get("latency_dump_interval", 60.0)
+
+    def get_scalping_async_orders(self) -> bool:
+        """스캘핑 주문을 계좌 전용 디스패처 스레드에서 실행 (False면 tick 스레드에서 동기 실행)"""
+        return self._execution.get("scalping_async_orders", True)
+
+    def get_ws_pool_connections(self) -> int:
+        """40종목 초과 구독용 추가 WebSocket 세션 수 (0이면 비활성)"""
+        return int(self._execution.get("ws_pool_connections", 0))
+
+    def get_ws_pool_credentials(self) -> List[Dict[str, str]]:
+        """추가 세션별 자격증명 [{app_key, app_secret}] (부족분은 기본 자격증명 사용)"""
+        return list(self._execution.get("ws_pool_credentials", []))
+
+    def get_market_data_ws(self) -> bool:
+        """스케줄러 종목 시세를 WebSocket 체결로 수신할지 여부 (REST 폴링 대체)"""
+        return self._execution.get("market_data_ws", True)
+
+    def get_market_data_ws_stale_seconds(self) -> float:
+        """마지막 WS 체결 후 REST 시세로 전환하는 기준 시간 (초)"""
+        return self._execution.get("market_data_ws_stale_seconds", 5.0)
+
+    def get_bar_aggregator(self) -> bool:
+        """WS 체결로 분봉을 실시간 집계할지 여부 (완성 즉시 분봉 저장소 반영)"""
+        return self._execution.get("bar_aggregator", True)
+
+    def get_bar_seconds(self) -> List[int]:
+        """1분봉 외에 집계할 N초봉 길이 목록 (예: [10, 30])"""
+        return self._execution.get("bar_seconds", [])
+
+    def get_bar_reconcile_seconds(self) -> float:
+        """WS 집계 종목의 REST 분봉 대조 조회 주기 (초)"""
+        return self._execution.get("bar_reconcile_seconds", 300.0)
+
+    def get_order_book_ws(self) -> bool:
+        """WebSocket 호가(10단계)로 최우선 매도/매수호가를 받을지 여부 (REST 호가 조회 대체)"""
+        return self._execution.get("order_book_ws", True)
+
+    def get_order_book_stale_seconds(self) -> float:
+        """마지막 WS 호가 후 REST 호가로 전환하는 기준 시간 (초)"""
+        return self._execution.get("order_book_stale_seconds", 2.0)
+
+    def get_order_chase_reconcile_seconds(self) -> float:
+        """추격/매도 전환 중 주문 체결 REST 보정 조회 간격 (초, 활성 주문 전체가 1회 조회 공유)"""
+        return self._execution.get("order_chase_reconcile_seconds", 0.5)
+
+    def get_account_orders_ttl(self) -> float:
+        """당일 주문 조회 스냅샷 재사용 시간 (초, 주문/체결통보 시 즉시 폐기)"""
+        return self._execution.get("account_orders_ttl", 0.5)
+
+    def get_account_balance_ttl(self) -> float:
+        """잔고 조회 스냅샷 재사용 시간 (초, 주문/체결통보 시 즉시 폐기)"""
+        return self._execution.get("account_balance_ttl", 1.0)
+
+    def get_scheduler_workers(self) -> int:
+        """스케줄러 상시 워커 수 반환 (0이면 종목 수 기반 자동)"""
+        return self._execution.get("scheduler_workers", 0)
+
+    def get_tick_shards(self) -> int:
+        """종목 샤드 워커 수 반환 (WS 틱/실시간 매도 시그널 종목별 병렬 처리)"""
+        return self._execution.get("tick_shards", 8)
+
     def get_server_url(self) -> str:
         """API 서버 URL 반환"""
         if self.mode == TradingMode.LIVE:
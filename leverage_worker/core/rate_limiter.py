@@ -0,0 +1,177 @@
+"""
+API 호출 속도 제한 모듈
+
+KIS Open API 초당 호출 한도 대응
+- 토큰 버킷 (스레드 / 이벤트 루프 공유)
+- 429 / 초당 거래건수 초과 응답 시 속도 감소, 정상 응답 누적 시 점진 복구 (AIMD)
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+from leverage_worker.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# KIS 초당 호출 한도 (앱키 기준)
+KIS_LIVE_REQUESTS_PER_SECOND = 20.0
+KIS_PAPER_REQUESTS_PER_SECOND = 2.0
+
+
+class TokenBucketRateLimiter:
+    """
+    적응형 토큰 버킷
+
+    - acquire(): 토큰 1개 소비 (없으면 보충될 때까지 대기)
+    - on_throttled(): 서버 제한 감지 시 속도 절반으로 감소 + 버킷 비움
+    - on_success(): 정상 응답 누적 시 기준 속도까지 점진 복구
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst: Optional[float] = None,
+        min_rate_per_second: Optional[float] = None,
+        recovery_step: float = 0.1,
+        recovery_after: int = 20,
+    ):
+        """
+        Args:
+            rate_per_second: 기준 초당 요청 수
+            burst: 버킷 용량 (None이면 기준 속도의 절반, 최소 1)
+            min_rate_per_second: 감소 하한 (None이면 기준 속도의 1/8)
+            recovery_step: 복구 시 증가 비율 (기준 속도 대비)
+            recovery_after: 복구 1단계에 필요한 연속 성공 횟수
+        """
+        if rate_per_second <= 0:
+            raise ValueError(f"rate_per_second must be positive: {rate_per_second}")
+
+        self._base_rate = rate_per_second
+        self._rate = rate_per_second
+        self._capacity = burst if burst is not None else max(1.0, rate_per_second / 2)
+        self._min_rate = (
+            min_rate_per_second
+            if min_rate_per_second is not None
+            else rate_per_second / 8
+        )
+        self._recovery_step = recovery_step
+        self._recovery_after = recovery_after
+
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._success_streak = 0
+        self._lock = threading.Lock()
+
+        # 통계
+        self._total_acquired = 0
+        self._total_wait_seconds = 0.0
+        self._throttle_count = 0
+
+    def _refill_locked(self, now: float) -> None:
+        """경과 시간만큼 토큰 보충"""
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+            self._last_refill = now
+
+    def _try_acquire(self, start: float) -> float:
+        """
+        토큰 1개 획득 시도 (비차단)
+
+        Returns:
+            0.0이면 획득 성공, 그 외에는 다음 토큰까지 대기 시간 (초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill_locked(now)
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                self._total_acquired += 1
+                self._total_wait_seconds += now - start
+                return 0.0
+            return (1.0 - self._tokens) / self._rate
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        토큰 1개 획득 (필요 시 대기)
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            획득 성공 여부
+        """
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+
+        while True:
+            wait = self._try_acquire(start)
+            if wait == 0.0:
+                return True
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """토큰 1개 획득 (이벤트 루프용, 대기 중 루프 차단 없음)"""
+        start = time.monotonic()
+        while True:
+            wait = self._try_acquire(start)
+            if wait == 0.0:
+                return
+            await asyncio.sleep(wait)
+
+    def on_success(self) -> None:
+        """정상 응답 통지 (연속 성공 시 속도 복구)"""
+        with self._lock:
+            if self._rate >= self._base_rate:
+                return
+            self._success_streak += 1
+            if self._success_streak >= self._recovery_after:
+                self._success_streak = 0
+                self._rate = min(
+                    self._base_rate,
+                    self._rate + self._base_rate * self._recovery_step,
+                )
+                logger.debug(f"Rate limit recovering: {self._rate:.2f} req/s")
+
+    def on_throttled(self) -> None:
+        """서버 제한 응답 통지 (속도 절반 감소 + 버킷 비움)"""
+        with self._lock:
+            self._throttle_count += 1
+            self._success_streak = 0
+            self._rate = max(self._min_rate, self._rate / 2)
+            self._tokens = 0.0
+            self._last_refill = time.monotonic()
+            rate = self._rate
+
+        logger.warning(f"Rate limit throttled by server → {rate:.2f} req/s")
+
+    @property
+    def rate(self) -> float:
+        """현재 초당 요청 수"""
+        return self._rate
+
+    def get_status(self) -> Dict:
+        """상태 정보"""
+        with self._lock:
+            avg_wait_ms = (
+                self._total_wait_seconds / self._total_acquired * 1000
+                if self._total_acquired
+                else 0.0
+            )
+            return {
+                "base_rate": self._base_rate,
+                "current_rate": round(self._rate, 3),
+                "capacity": self._capacity,
+                "acquired": self._total_acquired,
+                "avg_wait_ms": round(avg_wait_ms, 2),
+                "throttled": self._throttle_count,
+            }
@@ -2,22 +2,31 @@
 스케줄러 모듈
 
 매매 시간 스케줄링
-- 장중: 1초 간격으로 종목별 실행 시점 체크
-- 장외: 1분 간격으로 시간 체크
+- 타이밍 휠 기반: 다음 만기 시각까지 단조 시계로 대기 (처리 시간만큼 밀리지 않음)
+- 종목별 슬롯 = 자정 기준 offset + k * interval (1초 미만 interval 지원)
+- 종목별 슬롯은 누락/중복 없이 순서대로 실행 (이전 실행 중이면 완료 후 실행)
+- 슬롯별 지연(lateness) 계측
+- 장외: idle_check_interval_seconds 간격으로 대기 콜백
 - 장 마감 시 미체결 취소
+- 종목 틱 실행: 상시 워커 풀(thread) 또는 단일 이벤트 루프(async)
 """
 
+import asyncio
+import queue
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime
-from typing import Callable, Dict, List, Optional, Set
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, time as dtime
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
 
 from leverage_worker.config.settings import Settings
+from leverage_worker.core.timing_wheel import TimingWheel
+from leverage_worker.utils.latency import STAGE_SCHEDULE_LATENESS, get_latency_recorder
 from leverage_worker.utils.logger import get_logger
 from leverage_worker.utils.time_utils import (
     is_trading_hours,
-    should_execute_stock,
     get_time_until_market_open,
     get_time_until_market_close,
     is_weekday,
@@ -26,16 +35,57 @@ from leverage_worker.utils.time_utils import (
 
 logger = get_logger(__name__)
 
+NS_PER_SECOND = 1_000_000_000
+
+# 타이머 종류
+TIMER_HOUSEKEEPING = "housekeeping"  # 1초: 장 시작/마감 감지, 체결 확인, 특정 시간 콜백
+TIMER_IDLE = "idle"  # 장외 대기 콜백
+TIMER_STOCK = "stock"  # 종목 틱
+TIMER_PREFETCH = "prefetch"  # 예수금 사전 조회 (매분 n초)
+
+
+@dataclass
+class _Timer:
+    """
+    주기 타이머 (슬롯 번호 기준, 자정 기준 벽시계 정렬)
+
+    슬롯 k 시각 = anchor + offset + k * interval → 다음 슬롯은 이전 슬롯 기준으로 계산되어
+    처리 시간/깨어남 지연이 누적되지 않음
+    """
+
+    kind: str
+    key: str
+    interval_ns: int
+    offset_ns: int
+    anchor_ns: int  # 기준 자정 (epoch ns)
+    slot: int = 0
+
+    @property
+    def name(self) -> str:
+        return f"{self.kind}:{self.key}"
+
+    def slot_wall_ns(self, slot: int) -> int:
+        return self.anchor_ns + self.offset_ns + slot * self.interval_ns
+
+    def first_slot(self, wall_ns: int) -> int:
+        """wall_ns 이후(포함) 첫 슬롯 번호"""
+        return -(-(wall_ns - self.anchor_ns - self.offset_ns) // self.interval_ns)
+
 
 class TradingScheduler:
     """
     매매 스케줄러
 
-    - 장중: 1초 간격으로 체크, 종목별 interval/offset에 따라 콜백 호출
-    - 장외: 1분 간격으로 대기
+    - 장중: 종목별 interval/offset 슬롯마다 콜백 호출 (상시 워커 풀에서 병렬)
+    - 장외: idle_check_interval_seconds 간격으로 대기
     - 장 마감 시 on_market_close 콜백 호출
     """
 
+    # 종목별 최대 대기 슬롯 (초과 시 가장 오래된 슬롯 폐기 + ERROR 로그)
+    MAX_BACKLOG = 10
+    # 지연 경고 기준 (ns)
+    LATE_WARNING_NS = 500_000_000
+
     def __init__(self, settings: Settings):
         self._settings = settings
         self._schedule = settings.schedule
@@ -53,6 +103,14 @@ class TradingScheduler:
         self._on_market_close: Optional[Callable[[], None]] = None
         self._on_idle: Optional[Callable[[], None]] = None
 
+        # 비동기 종목 틱 (설정 시 전용 스레드의 이벤트 루프 하나에서 실행)
+        self._on_stock_tick_async: Optional[
+            Callable[[str, datetime], Awaitable[None]]
+        ] = None
+        self._on_async_shutdown: Optional[Callable[[], Awaitable[None]]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+
         # Prefetch 설정
         self._prefetch_second: int = 55  # 매분 n초에 예수금 사전 조회
 
@@ -69,6 +127,31 @@ class TradingScheduler:
         # 이전 매매시간 상태 (상태 전환 감지용)
         self._was_trading_hours = False
 
+        # 타이밍 휠 (스케줄러 스레드 전용)
+        self._wheel = TimingWheel(resolution_ns=10_000_000, slots=1024)
+        self._wake = threading.Event()
+        self._clock_offset_ns = 0  # 벽시계 - 단조 시계
+
+        # 상시 워커 풀 (종목 틱 / prefetch)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._max_workers = settings.get_scheduler_workers() or max(4, len(self._stocks) * 2)
+
+        # 타이머별 실행 중 작업 / 대기 슬롯 (누락·중복 방지)
+        self._inflight: Dict[str, Future] = {}
+        self._backlog: Dict[str, Deque[Tuple[str, str, int, int]]] = {}  # name -> (kind, key, wall_ns, deadline_ns)
+        self._completed: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+        self._last_slot: Dict[str, int] = {}
+
+        # 슬롯 지연 계측
+        self._latency = get_latency_recorder()
+        self._stats: Dict[str, int] = {
+            "dispatched": 0,
+            "deferred": 0,  # 이전 실행 중이라 대기 후 실행
+            "dropped": 0,  # 대기 한도 초과로 폐기
+            "late": 0,  # LATE_WARNING_NS 이상 지연
+            "max_lateness_us": 0,
+        }
+
         logger.info("TradingScheduler initialized")
 
     def set_on_stock_tick(self, callback: Callable[[str, datetime], None]) -> None:
@@ -76,12 +159,30 @@ class TradingScheduler:
         종목 틱 콜백 설정
 
         Args:
-            callback: (stock_code, current_time) -> None
+            callback: (stock_code, slot_time) -> None
         """
         self._on_stock_tick = callback
 
+    def set_on_stock_tick_async(
+        self,
+        callback: Callable[[str, datetime], Awaitable[None]],
+        on_shutdown: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> None:
+        """
+        비동기 종목 틱 콜백 설정 (async 모드)
+
+        종목 틱을 스케줄러 전용 이벤트 루프에서 동시에 실행.
+        설정 시 set_on_stock_tick 콜백보다 우선.
+
+        Args:
+            callback: async (stock_code, slot_time) -> None
+            on_shutdown: 스케줄러 종료 시 같은 루프에서 실행할 정리 코루틴
+        """
+        self._on_stock_tick_async = callback
+        self._on_async_shutdown = on_shutdown
+
     def set_on_check_fills(self, callback: Callable[[], None]) -> None:
-        """체결 확인 콜백 설정 (틱 처리 전 1회 호출)"""
+        """체결 확인 콜백 설정 (장중 매초, 같은 시각 종목 틱 전 1회 호출)"""
         self._on_check_fills = callback
 
     def set_on_market_open(self, callback: Callable[[], None]) -> None:
@@ -93,7 +194,7 @@ class TradingScheduler:
         self._on_market_close = callback
 
     def set_on_idle(self, callback: Callable[[], None]) -> None:
-        """대기 상태 콜백 설정 (장외 1분마다)"""
+        """대기 상태 콜백 설정 (장외 idle_check_interval_seconds마다)"""
         self._on_idle = callback
 
     def set_on_prefetch_tick(
@@ -130,6 +231,12 @@ class TradingScheduler:
             return
 
         self._running = True
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="SchedulerWorker"
+        )
+        if self._on_stock_tick_async:
+            self._start_loop()
+
         self._thread = threading.Thread(
             target=self._run_loop,
             daemon=True,
@@ -137,125 +244,317 @@ class TradingScheduler:
         )
         self._thread.start()
 
-        logger.info("Scheduler started")
+        logger.info(f"Scheduler started (workers={self._max_workers})")
 
     def stop(self) -> None:
         """스케줄러 중지"""
         self._running = False
+        self._wake.set()
         if self._thread:
             self._thread.join(timeout=5)
+            self._thread = None
+        if self._executor:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self._close_loop()
         logger.info("Scheduler stopped")
 
+    # ==========================================
+    # 이벤트 루프 (async 모드)
+    # ==========================================
+
+    def _start_loop(self) -> None:
+        """종목 틱 전용 이벤트 루프 스레드 시작"""
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever,
+            daemon=True,
+            name="TradingSchedulerLoop",
+        )
+        self._loop_thread.start()
+        logger.info("Scheduler running in async mode (single event loop)")
+
+    def _close_loop(self) -> None:
+        """이벤트 루프 정리 (종료 코루틴 실행 후 닫기)"""
+        if self._loop is None:
+            return
+
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown_loop(), self._loop).result(timeout=10)
+        except Exception as e:
+            logger.error(f"Async shutdown error: {e}")
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            if self._loop_thread:
+                self._loop_thread.join(timeout=5)
+                self._loop_thread = None
+            self._loop.close()
+            self._loop = None
+
+    async def _shutdown_loop(self, timeout: float = 5.0) -> None:
+        """진행 중 종목 틱 완료 대기(초과 시 취소) 후 종료 코루틴 실행"""
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        if self._on_async_shutdown:
+            await self._on_async_shutdown()
+
+    # ==========================================
+    # 타이밍 휠 루프
+    # ==========================================
+
     def _run_loop(self) -> None:
-        """메인 루프"""
+        """메인 루프: 다음 만기 시각까지 대기 → 만기 타이머 처리"""
+        self._clock_offset_ns = time.time_ns() - time.monotonic_ns()
+        anchor_ns = self._midnight_ns(datetime.now())
+        self._arm(_Timer(TIMER_HOUSEKEEPING, "main", NS_PER_SECOND, 0, anchor_ns))
+        self._arm(
+            _Timer(
+                TIMER_IDLE,
+                "main",
+                int(self._schedule.idle_check_interval_seconds * NS_PER_SECOND),
+                0,
+                anchor_ns,
+            )
+        )
+
+        # 시작 즉시 장 상태 확인 (장중이면 종목 타이머 등록)
+        try:
+            self._housekeeping(datetime.now())
+        except Exception as e:
+            logger.error(f"Scheduler error: {e}")
+
         while self._running:
+            self._wake.clear()
             try:
-                now = datetime.now()
+                due = self._wheel.advance(time.monotonic_ns())
+                # 같은 시각이면 체결 확인/장 상태 처리가 종목 틱보다 먼저
+                due.sort(key=lambda timer: timer.kind != TIMER_HOUSEKEEPING)
+                for timer in due:
+                    self._fire(timer)
+                self._drain_completed()
+            except Exception as e:
+                logger.error(f"Scheduler error: {e}")
 
-                # 주말 체크
-                if not is_weekday(now):
-                    logger.debug("Weekend - sleeping for 1 minute")
-                    time.sleep(60)
+            deadline = self._wheel.next_deadline()
+            timeout = 1.0
+            if deadline is not None:
+                timeout = max(0.0, (deadline - time.monotonic_ns()) / NS_PER_SECOND)
+            self._wake.wait(timeout)
+
+    @staticmethod
+    def _midnight_ns(now: datetime) -> int:
+        return int(datetime.combine(now.date(), dtime.min).timestamp()) * NS_PER_SECOND
+
+    def _arm(self, timer: _Timer, slot: Optional[int] = None) -> None:
+        """타이머의 다음 슬롯 등록 (slot 미지정 시 현재 이후 첫 슬롯)"""
+        if slot is None:
+            slot = timer.first_slot(time.monotonic_ns() + self._clock_offset_ns)
+        timer.slot = slot
+        self._wheel.schedule(timer.slot_wall_ns(slot) - self._clock_offset_ns, timer)
+
+    def _fire(self, timer: _Timer) -> None:
+        """만기 타이머 처리 + 다음 슬롯 등록 (이전 슬롯 기준 → 드리프트 없음)"""
+        slot = timer.slot
+        wall_ns = timer.slot_wall_ns(slot)
+        deadline_ns = wall_ns - self._clock_offset_ns
+        self._arm(timer, slot + 1)
+
+        if timer.kind == TIMER_HOUSEKEEPING:
+            self._housekeeping(datetime.fromtimestamp(wall_ns / NS_PER_SECOND))
+        elif timer.kind == TIMER_IDLE:
+            if not self._was_trading_hours:
+                now = datetime.fromtimestamp(wall_ns / NS_PER_SECOND)
+                if is_weekday(now):
+                    self._process_idle(now)
+        else:
+            self._enqueue_slot(timer, slot, wall_ns, deadline_ns)
+
+    def _housekeeping(self, now: datetime) -> None:
+        """장 시작/마감 감지, 체결 확인, 특정 시간 콜백 (스케줄러 스레드)"""
+        # 주말 체크
+        if not is_weekday(now):
+            return
+
+        # 매매 시간 체크
+        is_trading = is_trading_hours(
+            now,
+            self._schedule.trading_start,
+            self._schedule.trading_end,
+        )
+
+        if is_trading:
+            # 장 시작 감지
+            if not self._was_trading_hours:
+                self._was_trading_hours = True
+                logger.info("Market opened")
+                if self._on_market_open:
+                    self._on_market_open()
+                self._arm_trading_timers(now)
+
+            # 체결 확인 (같은 시각 종목 틱 전 1회)
+            if self._on_check_fills:
+                try:
+                    self._on_check_fills()
+                except Exception as e:
+                    logger.error(f"Check fills error: {e}")
+
+            # 특정 시간 콜백 처리
+            self._check_specific_time_callbacks(now)
+
+        else:
+            # 장 마감 감지
+            if self._was_trading_hours:
+                self._was_trading_hours = False
+                self._disarm_trading_timers()
+                today = now.strftime("%Y%m%d")
+
+                if self._last_close_date != today:
+                    self._last_close_date = today
+                    logger.info("Market closed")
+                    if self._on_market_close:
+                        self._on_market_close()
+
+    def _arm_trading_timers(self, now: datetime) -> None:
+        """장중 타이머 등록 (종목 틱 / prefetch)"""
+        anchor_ns = self._midnight_ns(now)
+
+        if self._on_stock_tick or self._on_stock_tick_async:
+            for stock_code in self._stocks:
+                interval = self._settings.get_stock_interval(stock_code)
+                offset = self._settings.get_stock_offset(stock_code)
+                if interval <= 0:
+                    logger.error(f"[{stock_code}] invalid interval_seconds: {interval}")
                     continue
+                self._arm(
+                    _Timer(
+                        TIMER_STOCK,
+                        stock_code,
+                        int(interval * NS_PER_SECOND),
+                        int(offset * NS_PER_SECOND),
+                        anchor_ns,
+                    )
+                )
 
-                # 매매 시간 체크
-                is_trading = is_trading_hours(
-                    now,
-                    self._schedule.trading_start,
-                    self._schedule.trading_end,
+        if self._on_prefetch_tick:
+            for stock_code in self._stocks:
+                self._arm(
+                    _Timer(
+                        TIMER_PREFETCH,
+                        stock_code,
+                        60 * NS_PER_SECOND,
+                        self._prefetch_second * NS_PER_SECOND,
+                        anchor_ns,
+                    )
                 )
 
-                if is_trading:
-                    # 장 시작 감지
-                    if not self._was_trading_hours:
-                        self._was_trading_hours = True
-                        logger.info("Market opened")
-                        if self._on_market_open:
-                            self._on_market_open()
-
-                    # 장중: 1초마다 체크
-                    self._process_trading_tick(now)
-                    time.sleep(1)
-
-                else:
-                    # 장 마감 감지
-                    if self._was_trading_hours:
-                        self._was_trading_hours = False
-                        today = now.strftime("%Y%m%d")
-
-                        if self._last_close_date != today:
-                            self._last_close_date = today
-                            logger.info("Market closed")
-                            if self._on_market_close:
-                                self._on_market_close()
-
-                    # 장외: 1분마다 체크
-                    self._process_idle(now)
-                    time.sleep(60)
+        logger.info(f"Trading timers armed: {len(self._wheel)} timers")
 
-            except Exception as e:
-                logger.error(f"Scheduler error: {e}")
-                time.sleep(1)
+    def _disarm_trading_timers(self) -> None:
+        """장중 타이머 해제 (실행 중 작업은 완료까지 유지)"""
+        removed = self._wheel.remove(
+            lambda timer: timer.kind in (TIMER_STOCK, TIMER_PREFETCH)
+        )
+        self._backlog.clear()
+        self._last_slot.clear()
+        logger.info(f"Trading timers disarmed: {removed} timers")
 
-    def _process_trading_tick(self, now: datetime) -> None:
-        """
-        장중 틱 처리
+    # ==========================================
+    # 슬롯 실행 (누락/중복 방지)
+    # ==========================================
 
-        각 종목별 interval/offset 설정에 따라 콜백 호출 여부 결정
-        종목별 틱은 병렬로 처리하여 API 지연으로 인한 누락 방지
+    def _enqueue_slot(self, timer: _Timer, slot: int, wall_ns: int, deadline_ns: int) -> None:
         """
-        # 1. 체결 확인 (병렬 처리 전 1회)
-        if self._on_check_fills:
-            try:
-                self._on_check_fills()
-            except Exception as e:
-                logger.error(f"Check fills error: {e}")
+        슬롯 실행 요청
 
-        # 2. Prefetch 체크 (매분 n초)
-        if self._on_prefetch_tick and now.second == self._prefetch_second:
-            for stock_code in self._stocks:
-                try:
-                    self._on_prefetch_tick(stock_code, now)
-                except Exception as e:
-                    logger.error(f"Prefetch tick error [{stock_code}]: {e}")
+        같은 타이머의 이전 실행이 끝나지 않았으면 대기열에 넣고 완료 후 순서대로 실행
+        """
+        name = timer.name
+        if slot <= self._last_slot.get(name, -1):
+            return  # 이미 실행한 슬롯 (중복 방지)
+        self._last_slot[name] = slot
 
-        # 3. 종목별 틱 처리
-        if not self._on_stock_tick:
+        if name not in self._inflight:
+            self._dispatch(timer.kind, timer.key, wall_ns, deadline_ns)
             return
 
-        # 실행할 종목 수집
-        stocks_to_execute = []
-        for stock_code, stock_config in self._stocks.items():
-            interval = (
-                stock_config.interval_seconds
-                if stock_config.interval_seconds is not None
-                else self._schedule.default_interval_seconds
+        backlog = self._backlog.setdefault(name, deque())
+        backlog.append((timer.kind, timer.key, wall_ns, deadline_ns))
+        self._stats["deferred"] += 1
+        if len(backlog) > self.MAX_BACKLOG:
+            _, _, dropped_ns, _ = backlog.popleft()
+            self._stats["dropped"] += 1
+            logger.error(
+                f"[{timer.key}] {timer.kind} slot dropped: "
+                f"{datetime.fromtimestamp(dropped_ns / NS_PER_SECOND):%H:%M:%S.%f} "
+                f"(backlog > {self.MAX_BACKLOG})"
             )
-            offset = (
-                stock_config.offset_seconds
-                if stock_config.offset_seconds is not None
-                else self._schedule.default_offset_seconds
+
+    def _dispatch(self, kind: str, key: str, wall_ns: int, deadline_ns: int) -> None:
+        """워커 풀/이벤트 루프에 슬롯 실행 등록 + 지연 계측"""
+        name = f"{kind}:{key}"
+        slot_time = datetime.fromtimestamp(wall_ns / NS_PER_SECOND)
+
+        if kind == TIMER_STOCK and self._loop is not None:
+            future = asyncio.run_coroutine_threadsafe(
+                self._run_stock_tick_async(key, slot_time), self._loop
+            )
+        elif kind == TIMER_STOCK:
+            future = self._executor.submit(self._run_stock_tick, key, slot_time)
+        else:
+            future = self._executor.submit(self._run_prefetch_tick, key, slot_time)
+
+        self._inflight[name] = future
+        future.add_done_callback(lambda _f, name=name: self._on_slot_done(name))
+
+        lateness_ns = max(0, time.monotonic_ns() - deadline_ns)
+        self._latency.record(STAGE_SCHEDULE_LATENESS, lateness_ns, key, kind)
+        self._stats["dispatched"] += 1
+        self._stats["max_lateness_us"] = max(self._stats["max_lateness_us"], lateness_ns // 1000)
+        if lateness_ns >= self.LATE_WARNING_NS:
+            self._stats["late"] += 1
+            logger.warning(
+                f"[{key}] {kind} slot {slot_time:%H:%M:%S.%f} dispatched late "
+                f"by {lateness_ns / 1e6:.0f}ms"
             )
 
-            if should_execute_stock(now, interval, offset):
-                stocks_to_execute.append(stock_code)
-
-        # 병렬 실행
-        if stocks_to_execute:
-            with ThreadPoolExecutor(max_workers=len(stocks_to_execute)) as executor:
-                futures = {
-                    executor.submit(self._on_stock_tick, stock_code, now): stock_code
-                    for stock_code in stocks_to_execute
-                }
-                for future in futures:
-                    try:
-                        future.result()
-                    except Exception as e:
-                        stock_code = futures[future]
-                        logger.error(f"Stock tick error [{stock_code}]: {e}")
-
-        # 3. 특정 시간 콜백 처리
-        self._check_specific_time_callbacks(now)
+    def _on_slot_done(self, name: str) -> None:
+        """슬롯 실행 완료 (워커/루프 스레드) → 스케줄러 스레드 깨움"""
+        self._completed.put(name)
+        self._wake.set()
+
+    def _drain_completed(self) -> None:
+        """완료된 타이머의 대기 슬롯 실행"""
+        while True:
+            try:
+                name = self._completed.get_nowait()
+            except queue.Empty:
+                return
+            self._inflight.pop(name, None)
+            backlog = self._backlog.get(name)
+            if backlog:
+                self._dispatch(*backlog.popleft())
+
+    def _run_stock_tick(self, stock_code: str, slot_time: datetime) -> None:
+        try:
+            self._on_stock_tick(stock_code, slot_time)
+        except Exception as e:
+            logger.error(f"Stock tick error [{stock_code}]: {e}")
+
+    async def _run_stock_tick_async(self, stock_code: str, slot_time: datetime) -> None:
+        try:
+            await self._on_stock_tick_async(stock_code, slot_time)
+        except Exception as e:
+            logger.error(f"Stock tick error [{stock_code}]: {e}")
+
+    def _run_prefetch_tick(self, stock_code: str, slot_time: datetime) -> None:
+        try:
+            self._on_prefetch_tick(stock_code, slot_time)
+        except Exception as e:
+            logger.error(f"Prefetch tick error [{stock_code}]: {e}")
 
     def _check_specific_time_callbacks(self, now: datetime) -> None:
         """특정 시간 콜백 체크 및 실행"""
@@ -332,11 +631,11 @@ class TradingScheduler:
         """관리 종목 코드 리스트"""
         return list(self._stocks.keys())
 
-    def get_stock_interval(self, stock_code: str) -> int:
+    def get_stock_interval(self, stock_code: str) -> float:
         """종목별 실행 간격 (초)"""
         return self._settings.get_stock_interval(stock_code)
 
-    def get_stock_offset(self, stock_code: str) -> int:
+    def get_stock_offset(self, stock_code: str) -> float:
         """종목별 실행 오프셋 (초)"""
         return self._settings.get_stock_offset(stock_code)
 
@@ -361,6 +660,12 @@ class TradingScheduler:
             "trading_start": self._schedule.trading_start,
             "trading_end": self._schedule.trading_end,
             "managed_stocks": len(self._stocks),
+            "tick_mode": "async" if self._on_stock_tick_async else "thread",
+            "workers": self._max_workers,
+            "timers": len(self._wheel),
+            "inflight": len(self._inflight),
+            "backlog": sum(len(b) for b in self._backlog.values()),
+            **self._stats,
         }
 
         if is_trading:
@@ -5,6 +5,7 @@ KIS Open API 인증 및 토큰 관리
 - 토큰 발급/갱신
 - 8시간 전 자동 갱신
 - API 호출 공통 함수
+- keep-alive 커넥션 풀 + 토큰 버킷 호출 속도 제한
 """
 
 import copy
@@ -15,12 +16,18 @@ import time
 from collections import namedtuple
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
 
 from leverage_worker.config.settings import Settings, TradingMode
+from leverage_worker.core.rate_limiter import (
+    KIS_LIVE_REQUESTS_PER_SECOND,
+    KIS_PAPER_REQUESTS_PER_SECOND,
+    TokenBucketRateLimiter,
+)
 from leverage_worker.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -120,6 +127,7 @@ class SessionManager:
     - 만료 8시간 전 자동 갱신
     - API 호출 공통 함수
     - 재시도 로직 (지수 백오프)
+    - 모든 스레드가 하나의 커넥션 풀 / 토큰 버킷 공유
     """
 
     def __init__(self, settings: Settings):
@@ -151,7 +159,33 @@ class SessionManager:
 
         # 모의/실전 구분
         self._is_paper = settings.mode == TradingMode.PAPER
-        self._smart_sleep = 0.5 if self._is_paper else 0.05
+
+        # 호출 속도 제한 (고정 sleep 대신 토큰 버킷, 스레드 공유)
+        rate = settings.get_api_rate_limit() or (
+            KIS_PAPER_REQUESTS_PER_SECOND if self._is_paper else KIS_LIVE_REQUESTS_PER_SECOND
+        )
+        self._rate_limiter = TokenBucketRateLimiter(rate)
+
+        # keep-alive 커넥션 풀 (TLS 핸드셰이크 재사용)
+        self._http = self._create_http_session(settings.get_http_pool_size())
+
+    @staticmethod
+    def _create_http_session(pool_size: int) -> requests.Session:
+        """커넥션 풀 HTTP 세션 생성 (재시도는 url_fetch에서 처리)"""
+        http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=pool_size,
+            max_retries=0,
+        )
+        http.mount("https://", adapter)
+        http.mount("http://", adapter)
+        return http
+
+    def close(self) -> None:
+        """HTTP 커넥션 풀 종료"""
+        self._http.close()
+        logger.debug("HTTP session closed")
 
     def _get_token_file_path(self) -> Path:
         """토큰 파일 경로 (일별)"""
@@ -295,7 +329,7 @@ class SessionManager:
         }
 
         try:
-            res = requests.post(
+            res = self._http.post(
                 url,
                 data=json.dumps(payload),
                 headers=self._get_base_header(),
@@ -428,34 +462,36 @@ class SessionManager:
         """토큰 유효성 플래그 (갱신 실패 시 False)"""
         return self._token_valid
 
-    def smart_sleep(self) -> None:
-        """API 호출 간 대기 (Rate Limit 대응)"""
-        time.sleep(self._smart_sleep)
+    @property
+    def rate_limiter(self) -> TokenBucketRateLimiter:
+        """API 호출 속도 제한기"""
+        return self._rate_limiter
+
+    @staticmethod
+    def is_throttled(res: requests.Response) -> bool:
+        """서버 호출 한도 초과 응답 여부 (429 또는 EGW00201 초당 거래건수 초과)"""
+        if res.status_code == 429:
+            return True
+        return res.status_code >= 500 and "EGW00201" in res.text
 
-    def url_fetch(
+    def build_request(
         self,
         api_url: str,
         tr_id: str,
         tr_cont: str = "",
-        params: Optional[Dict[str, Any]] = None,
         append_headers: Optional[Dict[str, str]] = None,
-        post_flag: bool = False,
-        max_retries: int = 3,
-    ) -> APIResp:
+    ) -> Tuple[str, Dict[str, str]]:
         """
-        API 호출 공통 함수 (재시도 로직 포함)
+        요청 URL 및 헤더 생성 (동기/비동기 클라이언트 공통)
 
         Args:
-            api_url: API URL 경로 (예: "/uapi/domestic-stock/v1/quotations/inquire-price")
-            tr_id: 트랜잭션 ID
-            tr_cont: 연속 조회 여부 ("", "N", "M")
-            params: 요청 파라미터
+            api_url: API URL 경로
+            tr_id: 트랜잭션 ID (모의투자 시 V 접두사로 변환)
+            tr_cont: 연속 조회 여부
             append_headers: 추가 헤더
-            post_flag: POST 요청 여부
-            max_retries: 최대 재시도 횟수 (기본: 3)
 
         Returns:
-            APIResp 객체
+            (전체 URL, 헤더) 튜플
         """
         url = f"{self._settings.get_server_url()}{api_url}"
         headers = self._get_base_header()
@@ -474,6 +510,34 @@ class SessionManager:
         if append_headers:
             headers.update(append_headers)
 
+        return url, headers
+
+    def url_fetch(
+        self,
+        api_url: str,
+        tr_id: str,
+        tr_cont: str = "",
+        params: Optional[Dict[str, Any]] = None,
+        append_headers: Optional[Dict[str, str]] = None,
+        post_flag: bool = False,
+        max_retries: int = 3,
+    ) -> APIResp:
+        """
+        API 호출 공통 함수 (재시도 로직 포함)
+
+        Args:
+            api_url: API URL 경로 (예: "/uapi/domestic-stock/v1/quotations/inquire-price")
+            tr_id: 트랜잭션 ID
+            tr_cont: 연속 조회 여부 ("", "N", "M")
+            params: 요청 파라미터
+            append_headers: 추가 헤더
+            post_flag: POST 요청 여부
+            max_retries: 최대 재시도 횟수 (기본: 3)
+
+        Returns:
+            APIResp 객체
+        """
+        url, headers = self.build_request(api_url, tr_id, tr_cont, append_headers)
         params = params or {}
 
         # 재시도 로직 (지수 백오프)
@@ -483,16 +547,19 @@ class SessionManager:
         last_status_code: int = 0
 
         for attempt in range(max_retries + 1):
+            # 토큰 버킷 대기 (재시도 포함 모든 요청)
+            self._rate_limiter.acquire()
+
             try:
                 if post_flag:
-                    res = requests.post(
+                    res = self._http.post(
                         url,
                         headers=headers,
                         data=json.dumps(params),
                         timeout=30,
                     )
                 else:
-                    res = requests.get(
+                    res = self._http.get(
                         url,
                         headers=headers,
                         params=params,
@@ -501,10 +568,12 @@ class SessionManager:
 
                 # 성공
                 if res.status_code == 200:
+                    self._rate_limiter.on_success()
                     return APIResp(res)
 
-                # Rate Limit (429) - 재시도
-                if res.status_code == 429:
+                # Rate Limit (429 / EGW00201) - 속도 감소 후 재시도
+                if self.is_throttled(res):
+                    self._rate_limiter.on_throttled()
                     last_status_code = 429
                     if attempt < max_retries:
                         delay = min(base_delay * (2 ** attempt), max_delay)
@@ -573,18 +642,27 @@ class SessionManager:
         """계좌 정보 반환 (계좌번호, 상품코드)"""
         return self._settings.account_number, self._settings.account_product_code
 
-    def get_ws_approval_key(self) -> str:
-        """WebSocket approval key 발급 (현재 모드에 맞는 키 사용)"""
+    def get_ws_approval_key(
+        self,
+        app_key: Optional[str] = None,
+        app_secret: Optional[str] = None,
+    ) -> str:
+        """
+        WebSocket approval key 발급 (현재 모드에 맞는 키 사용)
+
+        Args:
+            app_key / app_secret: 추가 자격증명 (WebSocket 연결 풀용, 미지정 시 기본값)
+        """
         server_url = self._settings.get_server_url()
         url = f"{server_url}/oauth2/Approval"
         body = {
             "grant_type": "client_credentials",
-            "appkey": self._settings.app_key,
-            "secretkey": self._settings.app_secret,
+            "appkey": app_key or self._settings.app_key,
+            "secretkey": app_secret or self._settings.app_secret,
         }
 
         try:
-            res = requests.post(
+            res = self._http.post(
                 url,
                 json=body,
                 headers=self._get_base_header(),
@@ -0,0 +1,171 @@
+"""
+종목 샤드 실행기
+
+종목코드 단위 actor 실행: 같은 종목의 작업은 항상 같은 워커에서 순서대로,
+다른 종목은 워커 간 병렬로 처리한다.
+- 종목 → 샤드 배정은 최초 등장 시 종목 수가 가장 적은 샤드로 고정 (sticky)
+- submit()은 큐 등록만 하고 즉시 반환 (WS 수신 스레드 비차단)
+- 작업 예외는 Future로 전달 + 로그 (워커는 계속 동작)
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from leverage_worker.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_Task = Tuple[Future, Callable[..., Any], tuple, dict]
+
+
+class _Shard:
+    """워커 스레드 1개 + FIFO 큐"""
+
+    def __init__(self, index: int, name: str):
+        self.index = index
+        self.name = f"{name}-{index}"
+        self.queue: Deque[_Task] = deque()
+        self.cond = threading.Condition()
+        self.running = False
+        self.thread: Optional[threading.Thread] = None
+        self.symbols = 0
+        self.processed = 0
+        self.busy_ns = 0
+
+    def start(self) -> None:
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self.thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self.cond:
+                while self.running and not self.queue:
+                    self.cond.wait()
+                if not self.queue:
+                    return  # 정지 요청 + 큐 비어있음
+                future, fn, args, kwargs = self.queue.popleft()
+
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            start = time.perf_counter_ns()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                logger.error(f"[{self.name}] task error: {e}", exc_info=True)
+                future.set_exception(e)
+            finally:
+                self.busy_ns += time.perf_counter_ns() - start
+                self.processed += 1
+
+
+class TickShardExecutor:
+    """
+    종목코드 키 기반 샤드 실행기
+
+    Example:
+        shards = TickShardExecutor(num_shards=8)
+        shards.start()
+        shards.submit("122630", handle_tick, tick)  # 종목 내 순서 보장
+    """
+
+    def __init__(self, num_shards: int = 8, name: str = "tick-shard"):
+        if num_shards < 1:
+            raise ValueError("num_shards must be >= 1")
+        self._shards = [_Shard(i, name) for i in range(num_shards)]
+        self._assignment: Dict[str, _Shard] = {}
+        self._lock = threading.Lock()
+        self._running = False
+
+    @property
+    def num_shards(self) -> int:
+        return len(self._shards)
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        """워커 스레드 시작"""
+        if self._running:
+            return
+        self._running = True
+        for shard in self._shards:
+            shard.start()
+        logger.info(f"TickShardExecutor started ({len(self._shards)} shards)")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """남은 작업 처리 후 종료"""
+        if not self._running:
+            return
+        self._running = False
+        for shard in self._shards:
+            with shard.cond:
+                shard.running = False
+                shard.cond.notify_all()
+        deadline = time.monotonic() + timeout
+        for shard in self._shards:
+            if shard.thread:
+                shard.thread.join(timeout=max(0.0, deadline - time.monotonic()))
+                if shard.thread.is_alive():
+                    logger.warning(f"[{shard.name}] did not terminate in time")
+                shard.thread = None
+        logger.info("TickShardExecutor stopped")
+
+    def submit(self, key: str, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        종목 샤드에 작업 등록 (즉시 반환)
+
+        미시작/종료 상태면 호출 스레드에서 바로 실행한다.
+        """
+        future: Future = Future()
+        if not self._running:
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+            return future
+
+        shard = self._shard_for(key)
+        with shard.cond:
+            shard.queue.append((future, fn, args, kwargs))
+            shard.cond.notify()
+        return future
+
+    def shard_of(self, key: str) -> int:
+        """종목의 샤드 번호"""
+        return self._shard_for(key).index
+
+    def _shard_for(self, key: str) -> _Shard:
+        shard = self._assignment.get(key)
+        if shard is not None:
+            return shard
+        with self._lock:
+            shard = self._assignment.get(key)
+            if shard is None:
+                shard = min(self._shards, key=lambda s: (s.symbols, s.index))
+                shard.symbols += 1
+                self._assignment[key] = shard
+            return shard
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """샤드별 종목 수 / 대기 / 처리 건수 / 누적 처리 시간"""
+        result = []
+        for shard in self._shards:
+            with shard.cond:
+                pending = len(shard.queue)
+            result.append(
+                {
+                    "shard": shard.index,
+                    "symbols": shard.symbols,
+                    "pending": pending,
+                    "processed": shard.processed,
+                    "busy_ms": round(shard.busy_ns / 1e6, 1),
+                }
+            )
+        return result
@@ -0,0 +1,110 @@
+"""
+타이밍 휠 모듈
+
+해시 타이밍 휠 (단조 시계 ns 기준)
+- 슬롯 = deadline // resolution % 슬롯 수 → 등록/만기 추출 O(1) (버킷 크기 기준)
+- 한 바퀴를 넘는 deadline은 같은 버킷에 남아 있다가 해당 회차에 만기
+- next_deadline(): 다음 만기 시각 → 스케줄러가 그 시각까지만 대기
+
+스레드 안전하지 않음 (스케줄러 스레드 전용)
+"""
+
+from typing import Any, Iterator, List, Optional, Tuple
+
+_Entry = Tuple[int, int, Any]  # (deadline_ns, seq, item)
+
+
+class TimingWheel:
+    """
+    해시 타이밍 휠
+
+    Example:
+        wheel = TimingWheel(resolution_ns=10_000_000, slots=1024)
+        wheel.schedule(time.monotonic_ns() + 500_000_000, "job")
+        due = wheel.advance(time.monotonic_ns())  # 만기 항목 (deadline 순)
+    """
+
+    def __init__(self, resolution_ns: int = 10_000_000, slots: int = 1024):
+        """
+        Args:
+            resolution_ns: 버킷 1칸 시간 (기본 10ms)
+            slots: 버킷 수 (한 바퀴 = resolution_ns * slots)
+        """
+        if resolution_ns <= 0 or slots <= 0:
+            raise ValueError("resolution_ns and slots must be positive")
+        self._resolution = resolution_ns
+        self._buckets: List[List[_Entry]] = [[] for _ in range(slots)]
+        self._cursor: Optional[int] = None  # 다음에 확인할 틱 번호
+        self._seq = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _tick_of(self, deadline_ns: int) -> int:
+        return deadline_ns // self._resolution
+
+    def schedule(self, deadline_ns: int, item: Any) -> None:
+        """deadline_ns(단조 시계)에 만기될 항목 등록 (지난 시각이면 다음 advance에서 만기)"""
+        tick = self._tick_of(deadline_ns)
+        if self._cursor is None or tick < self._cursor:
+            # 커서보다 이전 칸은 다시 훑지 않으므로 커서를 당겨 놓음
+            self._cursor = tick
+        self._buckets[tick % len(self._buckets)].append((deadline_ns, self._seq, item))
+        self._seq += 1
+        self._size += 1
+
+    def advance(self, now_ns: int) -> List[Any]:
+        """now_ns까지 만기된 항목 추출 (deadline, 등록 순서 순)"""
+        if self._size == 0 or self._cursor is None:
+            self._cursor = self._tick_of(now_ns)
+            return []
+
+        now_tick = self._tick_of(now_ns)
+        due: List[_Entry] = []
+        slots = len(self._buckets)
+        # 한 바퀴 이상 밀렸으면 전체 버킷을 한 번만 확인
+        last = min(now_tick, self._cursor + slots - 1)
+        for tick in range(self._cursor, last + 1):
+            bucket = self._buckets[tick % slots]
+            if not bucket:
+                continue
+            keep = [entry for entry in bucket if entry[0] > now_ns]
+            if len(keep) != len(bucket):
+                due.extend(entry for entry in bucket if entry[0] <= now_ns)
+                bucket[:] = keep
+        # 현재 칸은 now 이후 항목이 남아 있을 수 있으므로 커서는 now_tick
+        self._cursor = now_tick
+        self._size -= len(due)
+        due.sort(key=lambda entry: (entry[0], entry[1]))
+        return [entry[2] for entry in due]
+
+    def next_deadline(self) -> Optional[int]:
+        """가장 이른 만기 시각 (ns), 비어 있으면 None"""
+        if self._size == 0:
+            return None
+        slots = len(self._buckets)
+        start = self._cursor or 0
+        # 커서부터 한 바퀴 안의 항목은 버킷 순서 = 시간 순서
+        for tick in range(start, start + slots):
+            bucket = self._buckets[tick % slots]
+            if not bucket:
+                continue
+            in_round = [entry[0] for entry in bucket if self._tick_of(entry[0]) <= tick]
+            if in_round:
+                return min(in_round)
+        return min(entry[0] for entry in self._entries())
+
+    def remove(self, predicate) -> int:
+        """조건에 맞는 항목 제거 (제거 건수 반환)"""
+        removed = 0
+        for bucket in self._buckets:
+            keep = [entry for entry in bucket if not predicate(entry[2])]
+            removed += len(bucket) - len(keep)
+            bucket[:] = keep
+        self._size -= removed
+        return removed
+
+    def _entries(self) -> Iterator[_Entry]:
+        for bucket in self._buckets:
+            yield from bucket
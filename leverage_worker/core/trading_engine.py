@@ -7,13 +7,15 @@
 - 시그널 처리
 """
 
+import asyncio
+import functools
 import signal
 import sys
 import threading
 import uuid
 from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 from leverage_worker.config.settings import Settings, TradingMode
 from leverage_worker.core.daily_liquidation import DailyLiquidationManager, LiquidationResult
@@ -27,9 +29,24 @@ from leverage_worker.core.health_checker import (
 from leverage_worker.core.recovery_manager import RecoveryManager
 from leverage_worker.core.scheduler import TradingScheduler
 from leverage_worker.core.session_manager import SessionManager
+from leverage_worker.core.tick_shards import TickShardExecutor
+from leverage_worker.data.bar_aggregator import Bar, BarAggregator
+from leverage_worker.data.candle_archive import (
+    MIN_MINUTE_HOT_DAYS,
+    MinuteCandleArchive,
+    archive_minute_candles,
+)
+from leverage_worker.data.candle_store import CandleStore
 from leverage_worker.data.daily_candle_repository import DailyCandle, DailyCandleRepository
 from leverage_worker.data.database import MarketDataDB, TradingDB
-from leverage_worker.data.minute_candle_repository import MinuteCandleRepository
+from leverage_worker.data.market_data import (
+    SOURCE_REST_MULTI,
+    SOURCE_WS,
+    MarketDataService,
+    MarketSnapshot,
+)
+from leverage_worker.data.order_book import MarketDataView
+from leverage_worker.data.minute_candle_repository import MinuteCandle, MinuteCandleRepository
 from leverage_worker.notification.daily_report import DailyReportGenerator
 from leverage_worker.notification.slack_notifier import SlackNotifier
 from leverage_worker.strategy import (
@@ -38,16 +55,34 @@ from leverage_worker.strategy import (
     StrategyRegistry,
     TradingSignal,
 )
+from leverage_worker.trading.async_broker import AsyncKISBroker
 from leverage_worker.trading.broker import KISBroker, Position, OrderSide
 from leverage_worker.trading.order_manager import ManagedOrder, OrderManager
 from leverage_worker.trading.position_manager import PositionManager
+from leverage_worker.utils.latency import (
+    STAGE_GENERATE_SIGNAL,
+    STAGE_HISTORY_LOAD,
+    STAGE_PROCESS_SIGNAL,
+    STAGE_TICK_LOCK_WAIT,
+    get_latency_recorder,
+)
 from leverage_worker.utils.logger import get_logger, attach_slack_handler
 from leverage_worker.utils.log_constants import LogEventType
 from leverage_worker.utils.math_utils import calculate_allocation_amount
 from leverage_worker.utils.structured_logger import get_structured_logger
 from leverage_worker.scalping.executor import ScalpingExecutor
 from leverage_worker.scalping.models import ScalpingConfig
-from leverage_worker.websocket import ExitMonitor, ExitMonitorConfig, OrderNoticeData, RealtimeWSClient, TickData
+from leverage_worker.scalping.order_dispatcher import OrderDispatcher
+from leverage_worker.websocket import (
+    ExitMonitor,
+    ExitMonitorConfig,
+    OrderNoticeData,
+    RealtimeWSClient,
+    TickBus,
+    TickData,
+    WSConnectionManager,
+    WSConnectionPool,
+)
 
 logger = get_logger(__name__)
 structured_logger = get_structured_logger()
@@ -71,13 +106,34 @@ class TradingEngine:
 
         # 1. Database (시세 DB / 매매 DB 분리)
         # 시세 DB: 모의/실전 공유 (market_data.db)
-        self._market_db = MarketDataDB(settings.market_data_db_path)
+        # 쓰기는 DB별 전용 writer 스레드가 그룹 커밋 (WAL, 읽기 전용 연결은 대기 없음)
+        single_writer = settings.get_db_single_writer()
+        self._market_db = MarketDataDB(settings.market_data_db_path, single_writer)
         # 매매 DB: 모의/실전 분리 (trading_paper.db / trading_live.db)
-        self._trading_db = TradingDB(settings.trading_db_path)
+        self._trading_db = TradingDB(settings.trading_db_path, single_writer)
 
         # 2. Minute Candle Repository (분봉 데이터 - 시세 DB)
         self._price_repo = MinuteCandleRepository(self._market_db)
 
+        # 2-0. 인메모리 분봉 저장소 (틱 경로 DB 조회 제거, DB는 비동기 write-through)
+        self._candle_store = CandleStore(self._price_repo)
+
+        # 2-0-0. WS 체결 → 분봉/N초봉 실시간 집계 (완성 봉을 분봉 저장소에 일괄 반영)
+        self._bar_aggregator: Optional[BarAggregator] = None
+        if settings.get_bar_aggregator():
+            self._bar_aggregator = BarAggregator(
+                on_bars=self._on_aggregated_bars,
+                bar_seconds=settings.get_bar_seconds(),
+            )
+
+        # 2-0-1. 시세 서비스 (WS 우선 / REST 멀티종목 보완, 브로커 초기화 후 생성)
+        self._market_data: Optional[MarketDataService] = None
+        self._market_data_ws_codes: List[str] = []  # 시세 서비스가 구독한 WS 종목
+
+        # 2-0-2. 실시간 호가 뷰 (WS 호가 우선 / REST 호가 보완, 브로커 초기화 후 생성)
+        self._market_view: Optional[MarketDataView] = None
+        self._order_book_codes: List[str] = []  # 호가 뷰가 구독한 WS 종목
+
         # 2-1. Daily Candle Repository (일봉 데이터 - 시세 DB)
         self._daily_repo = DailyCandleRepository(self._market_db)
 
@@ -89,6 +145,7 @@ class TradingEngine:
 
         # 4. Broker
         self._broker: Optional[KISBroker] = None
+        self._async_broker: Optional[AsyncKISBroker] = None  # scheduler_mode: async
 
         # 5. Position Manager
         self._position_manager: Optional[PositionManager] = None
@@ -105,6 +162,9 @@ class TradingEngine:
             token=settings.notification.slack_token,
             channel=settings.notification.slack_channel,
             is_paper_mode=settings.is_paper_trading(),
+            async_delivery=settings.notification.slack_async,
+            max_queue=settings.notification.slack_queue_size,
+            min_interval=settings.notification.slack_min_interval,
         )
 
         # ERROR 로그 Slack 전송 핸들러 연결
@@ -133,6 +193,9 @@ class TradingEngine:
         )
 
         # 14. WebSocket 클라이언트 (실시간 전략용)
+        # 연결 관리자 1개를 실시간 전략/ExitMonitor가 공유 (구독 참조 카운트)
+        self._ws_manager: Optional[WSConnectionManager] = None
+        self._ws_pool: Optional[WSConnectionPool] = None  # 40종목 초과분 (추가 세션)
         self._ws_client: Optional[RealtimeWSClient] = None
         self._ws_stock_codes: Set[str] = set()  # WebSocket 구독 종목
 
@@ -142,12 +205,28 @@ class TradingEngine:
         # 15-1. 스캘핑 실행기: (stock_code, strategy_name) -> ScalpingExecutor
         self._scalping_executors: Dict[tuple, ScalpingExecutor] = {}
 
+        # 15-2. 스캘핑 주문 디스패처 (계좌 단위 전용 스레드, WS tick 스레드 REST 대기 제거)
+        self._order_dispatcher: Optional[OrderDispatcher] = None
+
         # 16. 동시성 제어 (스케줄러/WebSocket 공유 리소스 보호)
-        self._tick_lock = threading.Lock()
+        # 종목 단위 잠금: 같은 종목의 스케줄러/WS/ExitMonitor 처리는 직렬, 종목 간 병렬
+        self._symbol_locks: Dict[str, threading.Lock] = {}
+        self._symbol_locks_guard = threading.Lock()
+        # 종목 간 공유 자원은 좁은 잠금으로 보호 (예수금 조회 ~ 매수 주문)
+        self._cash_lock = threading.Lock()
         self._check_fills_lock = threading.Lock()
         self._pnl_lock = threading.Lock()
         self._pending_fill_signals: deque = deque()  # thread-safe FIFO
 
+        # 16-0. 종목 샤드 실행기 (WS 틱/ExitMonitor 시그널을 종목별 순서 보장 + 종목 간 병렬)
+        self._tick_shards = TickShardExecutor(
+            num_shards=settings.get_tick_shards(), name="tick-shard"
+        )
+
+        # 16-1. 틱 → 시그널 → 주문 지연 계측 (단계 × 종목 × 전략 히스토그램)
+        self._latency = get_latency_recorder()
+        self._latency.enabled = settings.get_latency_enabled()
+
         # 17. Daily Liquidation Manager
         self._liquidation_manager: Optional["DailyLiquidationManager"] = None
 
@@ -157,6 +236,9 @@ class TradingEngine:
         # 19. Prefetch 캐시 (예수금 사전 조회)
         self._prefetch_cache: Dict[str, tuple[int, datetime]] = {}  # stock_code -> (deposit, timestamp)
         self._prefetch_cache_ttl: int = settings.get_prefetch_cache_ttl()
+        # 무효화 세대 (조회 중 다른 종목 매수로 무효화되면 조회 결과를 저장하지 않음)
+        self._prefetch_lock = threading.Lock()
+        self._prefetch_generation = 0
         self._buy_fee_rate: float = settings.get_buy_fee_rate()
 
         # 세션 ID
@@ -221,7 +303,42 @@ class TradingEngine:
             self._session.start_auto_refresh()
 
             # 3. 브로커 초기화
-            self._broker = KISBroker(self._session)
+            self._broker = KISBroker(
+                self._session,
+                orders_ttl=self._settings.get_account_orders_ttl(),
+                balance_ttl=self._settings.get_account_balance_ttl(),
+            )
+            if self._settings.get_scheduler_mode() == "async":
+                try:
+                    self._async_broker = AsyncKISBroker(
+                        self._session, pool_size=self._settings.get_http_pool_size()
+                    )
+                except ImportError as e:
+                    logger.error(f"Async scheduler mode unavailable, using thread mode: {e}")
+
+            # 3-0-0. 시세 서비스 (종목 틱 시세 출처 결정)
+            self._market_data = MarketDataService(
+                fetch_prices=self._broker.get_multi_prices,
+                fetch_candles=lambda code: self._broker.get_minute_candles(stock_code=code),
+                ws_stale_seconds=self._settings.get_market_data_ws_stale_seconds(),
+                ws_candle_interval=(
+                    self._settings.get_bar_reconcile_seconds() if self._bar_aggregator else 0.0
+                ),
+            )
+
+            # 3-0-0-1. 실시간 호가 뷰 (최우선 매도/매수호가 출처)
+            self._market_view = MarketDataView(
+                fetch_ask=self._broker.get_asking_price,
+                fetch_bid=self._broker.get_bidding_price,
+                stale_seconds=self._settings.get_order_book_stale_seconds(),
+            )
+
+            # 3-0. 스캘핑 주문 디스패처 (계좌 단위)
+            if self._settings.get_scalping_async_orders():
+                self._order_dispatcher = OrderDispatcher(
+                    self._broker, name="scalping-orders"
+                )
+                self._order_dispatcher.start()
 
             # 3-1. 계좌 잔고 조회 및 출력 (API 연결 확인)
             logger.info("Fetching account balance...")
@@ -241,6 +358,8 @@ class TradingEngine:
                 self._broker,
                 self._position_manager,
                 self._trading_db,
+                market_data_view=self._market_view,
+                chase_reconcile_interval=self._settings.get_order_chase_reconcile_seconds(),
             )
             self._order_manager.set_on_fill_callback(self._on_order_fill)
 
@@ -256,7 +375,15 @@ class TradingEngine:
             logger.info("Loading daily candle data...")
             self._load_daily_candles()
 
-            # 5-3. 분봉 이력 로드 (초기 데이터 확보)
+            # 5-3. 분봉 메모리 저장소 적재 (DB 1회 조회) + writer 시작
+            logger.info("Seeding in-memory candle store...")
+            self._candle_store.seed(self._settings.stocks.keys())
+            self._candle_store.start()
+
+            # 5-3-1. 지연 시간 요약 주기 기록 시작
+            self._latency.start_periodic_dump(self._settings.get_latency_dump_interval())
+
+            # 5-4. 분봉 이력 로드 (초기 데이터 확보)
             logger.info("Loading minute candle history...")
             self._load_minute_candles()
 
@@ -265,6 +392,11 @@ class TradingEngine:
 
             # 7. 스케줄러 콜백 설정
             self._scheduler.set_on_stock_tick(self._on_stock_tick)
+            if self._async_broker:
+                self._scheduler.set_on_stock_tick_async(
+                    self._on_stock_tick_async,
+                    on_shutdown=self._async_broker.close,
+                )
             self._scheduler.set_on_check_fills(self._on_check_fills)
             self._scheduler.set_on_market_open(self._on_market_open)
             self._scheduler.set_on_market_close(self._on_market_close)
@@ -288,12 +420,35 @@ class TradingEngine:
                 stocks_count=len(self._settings.stocks),
             )
 
-            # 8-1. WebSocket 시작 (실시간 전략용)
+            # 8-0. 공유 WebSocket 연결 관리자 (구독 종목이 생길 때 연결)
+            tick_bus = TickBus()
+            self._ws_pool = self._create_ws_pool(tick_bus)
+            self._ws_manager = WSConnectionManager(
+                is_paper=self._settings.mode == TradingMode.PAPER,
+                hts_id=self._settings.hts_id,
+                use_dataframe=self._settings.get_ws_dataframe_mode(),
+                bus=tick_bus,
+                on_error=self._on_ws_error,
+                pool=self._ws_pool,
+            )
+            tick_bus.subscribe(self._market_data.on_tick)
+            if self._bar_aggregator:
+                tick_bus.subscribe(self._bar_aggregator.on_tick)
+                self._bar_aggregator.start()
+
+            # 8-1. WebSocket 시작 (실시간 전략용, 체결통보 구독 포함 → 시세 구독보다 먼저)
+            self._tick_shards.start()
             self._start_websocket()
 
-            # 8-2. 실시간 매도 모니터링 시작
+            # 8-2. 스케줄러 종목 WS 체결 구독 (시세 서비스용, 남은 슬롯 + 연결 풀)
+            self._start_market_data_ws()
+
+            # 8-3. 실시간 매도 모니터링 시작
             self._start_exit_monitor()
 
+            # 8-4. 실시간 호가 구독 (체결 구독 후 남은 슬롯 사용)
+            self._start_order_book_ws()
+
             # 9. 스케줄러 시작
             self._running = True
             self._scheduler.start()
@@ -372,6 +527,23 @@ class TradingEngine:
                 self._exit_monitor.stop()
                 logger.info("Exit monitor stopped")
 
+            # 3-2-1. 공유 WebSocket 연결 종료
+            if self._ws_manager:
+                for stock_code in self._market_data_ws_codes:
+                    self._ws_manager.release(stock_code)
+                self._market_data_ws_codes = []
+                for stock_code in self._order_book_codes:
+                    self._ws_manager.release_book(stock_code)
+                self._order_book_codes = []
+                self._ws_manager.stop()
+
+            # 3-2-2. 종목 샤드 종료 (대기 중인 틱/시그널 처리 후)
+            self._tick_shards.stop()
+
+            # 3-2-3. 분봉 집계 종료 (완성 봉 분봉 저장소 반영)
+            if self._bar_aggregator:
+                self._bar_aggregator.stop()
+
             # 3-3. 스캘핑 executor 중지
             for _key, executor in self._scalping_executors.items():
                 if executor.is_active:
@@ -381,19 +553,28 @@ class TradingEngine:
                     f"Scalping executors deactivated: "
                     f"{len(self._scalping_executors)}"
                 )
+            if self._order_dispatcher:
+                self._order_dispatcher.stop()
 
-            # 4. 미체결 주문 취소
+            # 4. 미체결 주문 취소 (진행 중 추격 마무리 후)
             if self._order_manager:
+                self._order_manager.stop()
                 cancelled = self._order_manager.cancel_all_pending()
                 logger.info(f"Cancelled {cancelled} pending orders")
 
-            # 5. 토큰 갱신 중지
+            # 5. 토큰 갱신 중지 + HTTP 커넥션 풀 종료
             self._session.stop_auto_refresh()
+            self._session.close()
 
             # 6. 복구 관리자 세션 종료 (정상 종료 기록)
             self._recovery_manager.stop_session()
 
-            # 7. 일일 리포트 생성 및 전송 (DB 종료 전)
+            # 7. 일일 리포트 생성 및 전송 (DB 종료 전, 포지션 현재가 반영 후)
+            if self._position_manager:
+                try:
+                    self._position_manager.flush(timeout=5)
+                except Exception as e:
+                    logger.error(f"Position flush error on stop: {e}")
             try:
                 report = self._report_generator.generate_and_send()
                 logger.info(
@@ -403,15 +584,18 @@ class TradingEngine:
             except Exception as e:
                 logger.error(f"Daily report error on stop: {e}")
 
-            # 8. DB 연결 종료
+            # 8. 분봉 write-through 잔여분 저장 후 DB 연결 종료
+            self._latency.stop_periodic_dump(flush=True)
+            self._candle_store.stop()
             self._market_db.close_all()
             self._trading_db.close_all()
 
             # 9. 시그널 요약 전송
             self._slack.send_signal_summary()
 
-            # 10. Slack 종료 알림
+            # 10. Slack 종료 알림 (전송 큐 비우고 종료)
             self._slack.notify_stop()
+            self._slack.close()
 
             logger.info("TradingEngine stopped")
             structured_logger.module_stop("TradingEngine", session_id=self._session_id)
@@ -520,7 +704,9 @@ class TradingEngine:
         self, stock_code: str, candle_data: list
     ) -> int:
         """
-        분봉 데이터 DB 저장 (헬퍼 함수)
+        분봉 데이터 저장 (헬퍼 함수)
+
+        메모리 저장소에 즉시 반영하고 DB에는 writer 스레드가 일괄 저장
 
         Args:
             stock_code: 종목코드
@@ -532,7 +718,8 @@ class TradingEngine:
         if not candle_data:
             return 0
 
-        saved_count = 0
+        now = datetime.now()
+        candles: List[MinuteCandle] = []
         for data in candle_data:
             trade_date = data.get("trade_date", "")
             time_str = data.get("time", "")
@@ -542,21 +729,57 @@ class TradingEngine:
                 if not ("0900" <= hour_min <= "1530"):
                     continue
 
-                # YYYYMMDD + HHMMSS -> YYYYMMDD_HHMM 형식으로 변환
-                minute_key = f"{trade_date}_{hour_min}"
+                # YYYYMMDD + HHMMSS -> YYYY-MM-DD HH:MM 형식으로 변환
+                candle_datetime = (
+                    f"{trade_date[:4]}-{trade_date[4:6]}-{trade_date[6:8]} "
+                    f"{hour_min[:2]}:{hour_min[2:]}"
+                )
                 # REST API의 정확한 OHLCV 저장 (close만 사용하면 O/H/L이 손실됨)
-                self._price_repo.upsert_price(
+                candles.append(MinuteCandle(
                     stock_code=stock_code,
+                    candle_datetime=candle_datetime,
+                    trade_date=trade_date[:8],
                     open_price=data["open_price"],
                     high_price=data["high_price"],
                     low_price=data["low_price"],
                     close_price=data["close_price"],
                     volume=data["volume"],
-                    minute_key=minute_key,
-                )
-                saved_count += 1
+                    created_at=now,
+                    updated_at=now,
+                ))
+
+        # 집계 분봉 대조 (REST 확정 분봉은 이후 집계 보정본으로 덮어쓰지 않음)
+        if self._bar_aggregator:
+            self._bar_aggregator.reconcile(stock_code, candles, now)
 
-        return saved_count
+        return self._candle_store.upsert_candles(stock_code, candles)
+
+    def _on_aggregated_bars(self, bars: List[Bar]) -> None:
+        """
+        집계 완성 봉 콜백 (BarAggregator flush, 일괄)
+
+        1분봉만 분봉 저장소에 반영 (DB는 writer 스레드가 일괄 저장), N초봉은 집계기에서 조회
+        """
+        now = datetime.now()
+        candles_by_code: Dict[str, List[MinuteCandle]] = {}
+        for bar in bars:
+            if bar.seconds != 60:
+                continue
+            candles_by_code.setdefault(bar.stock_code, []).append(MinuteCandle(
+                stock_code=bar.stock_code,
+                candle_datetime=bar.start.strftime("%Y-%m-%d %H:%M"),
+                trade_date=bar.start.strftime("%Y%m%d"),
+                open_price=bar.open_price,
+                high_price=bar.high_price,
+                low_price=bar.low_price,
+                close_price=bar.close_price,
+                volume=bar.volume,
+                created_at=now,
+                updated_at=now,
+            ))
+
+        for stock_code, candles in candles_by_code.items():
+            self._candle_store.upsert_candles(stock_code, candles)
 
     def _load_strategies(self) -> None:
         """전략 인스턴스 로드"""
@@ -594,6 +817,11 @@ class TradingEngine:
                             position_manager=self._position_manager,
                             trading_db=self._trading_db,
                             report_generator=self._report_generator,
+                            dispatcher=self._order_dispatcher,
+                            trade_ledger=self._order_manager.trade_ledger,
+                            on_unclaimed_fill=functools.partial(
+                                self._on_unclaimed_scalping_fill, key
+                            ),
                         )
                         self._scalping_executors[key] = executor
                         logger.info(
@@ -859,12 +1087,67 @@ class TradingEngine:
             on_tick=self._on_ws_tick,
             on_error=self._on_ws_error,
             on_order_notice=self._on_ws_order_notice,
-            is_paper=self._settings.mode == TradingMode.PAPER,
-            hts_id=self._settings.hts_id,
+            manager=self._ws_manager,
         )
         self._ws_client.start(list(ws_stock_codes))
         logger.info(f"WebSocket started for {len(ws_stock_codes)} stocks: {ws_stock_codes}")
 
+    def _start_market_data_ws(self) -> None:
+        """스케줄러 종목 WS 체결 구독 (시세 서비스용, 구독 한도 초과 종목은 REST)"""
+        if not self._settings.get_market_data_ws():
+            return
+
+        for stock_code in self._settings.stocks:
+            if self._ws_manager.acquire(stock_code):
+                self._market_data_ws_codes.append(stock_code)
+
+        if self._market_data_ws_codes:
+            self._ws_manager.start()
+            logger.info(
+                f"Market data WebSocket: {len(self._market_data_ws_codes)}/"
+                f"{len(self._settings.stocks)} stocks"
+            )
+
+    def _start_order_book_ws(self) -> None:
+        """스케줄러 종목 WS 호가 구독 (최우선 호가용, 구독 한도 초과 종목은 REST 호가)"""
+        if not self._settings.get_order_book_ws():
+            return
+
+        self._ws_manager.add_book_listener(self._market_view.on_order_book)
+        for stock_code in self._settings.stocks:
+            if self._ws_manager.acquire_book(stock_code):
+                self._order_book_codes.append(stock_code)
+
+        if self._order_book_codes:
+            self._ws_manager.start()
+            logger.info(
+                f"Order book WebSocket: {len(self._order_book_codes)}/"
+                f"{len(self._settings.stocks)} stocks"
+            )
+
+    def _create_ws_pool(self, bus: TickBus) -> Optional[WSConnectionPool]:
+        """40종목 초과 구독용 WebSocket 연결 풀 (ws_pool_connections 설정 시)"""
+        count = self._settings.get_ws_pool_connections()
+        if count <= 0:
+            return None
+
+        credentials = self._settings.get_ws_pool_credentials()
+        providers = []
+        for i in range(count):
+            credential = credentials[i] if i < len(credentials) else {}
+            providers.append(
+                lambda c=credential: self._session.get_ws_approval_key(
+                    c.get("app_key"), c.get("app_secret")
+                )
+            )
+
+        logger.info(f"WebSocket pool configured: {count} connections")
+        return WSConnectionPool(
+            url=f"{self._settings.get_websocket_url()}/tryitout",
+            approval_key_providers=providers,
+            bus=bus,
+        )
+
     def _get_ws_strategy_stocks(self) -> Set[str]:
         """WebSocket 전략이 설정된 종목 목록 조회 (websocket + scalping 모두 포함)"""
         ws_stocks = set()
@@ -883,38 +1166,21 @@ class TradingEngine:
 
     def _on_ws_order_notice(self, notice: OrderNoticeData) -> None:
         """WebSocket 체결통보 수신 콜백 - OrderManager + Scalping Executor 라우팅"""
+        self._latency.on_fill_notice(notice.order_no)
+        # 체결로 주문/잔고가 바뀌었으므로 계좌 스냅샷 폐기 (이후 REST 조회는 새로 조회)
+        self._broker.invalidate_account_snapshot()
         try:
             logger.info(
                 f"[WS 체결통보] {notice.stock_code} "
                 f"주문번호={notice.order_no} 체결수량={notice.filled_qty}"
             )
 
-            # 1. Try OrderManager first (regular orders)
-            order = self._order_manager.process_ws_fill(
-                order_no=notice.order_no,
-                filled_qty=notice.filled_qty,
-                filled_price=notice.filled_price,
-            )
-
-            if order:
-                return  # Handled by OrderManager
-
-            # 2. Route to ScalpingExecutor
-            for key, executor in self._scalping_executors.items():
-                if executor.is_active:
-                    handled = executor.process_ws_fill(
-                        notice.order_no,
-                        notice.filled_qty,
-                        notice.filled_price,
-                    )
-                    if handled:
-                        logger.info(
-                            f"[WS 체결] ScalpingExecutor handled: "
-                            f"{key[0]} {key[1]}"
-                        )
-                        return
+            if self._route_ws_fill(
+                notice.order_no, notice.filled_qty, notice.filled_price, notice.stock_code
+            ):
+                return
 
-            # 3. Order not found (cancelled/outdated)
+            # Order not found (cancelled/outdated)
             logger.debug(
                 f"[WS 체결] Order {notice.order_no} not found in active orders"
             )
@@ -922,13 +1188,65 @@ class TradingEngine:
         except Exception as e:
             logger.error(f"Order notice handling error: {e}")
 
+    def _route_ws_fill(
+        self,
+        order_no: str,
+        filled_qty: int,
+        filled_price: int,
+        stock_code: str,
+        exclude: Optional[Tuple[str, str]] = None,
+    ) -> bool:
+        """
+        체결통보 라우팅 - OrderManager → ScalpingExecutor 순
+
+        Args:
+            exclude: 제외할 executor 키 (보류 체결을 반환한 executor)
+
+        Returns:
+            처리한 주문이 있으면 True
+        """
+        # 1. Try OrderManager first (regular orders)
+        order = self._order_manager.process_ws_fill(
+            order_no=order_no,
+            filled_qty=filled_qty,
+            filled_price=filled_price,
+        )
+        if order:
+            return True  # Handled by OrderManager
+
+        # 2. Route to ScalpingExecutor
+        for key, executor in list(self._scalping_executors.items()):
+            if key == exclude or not executor.is_active:
+                continue
+            if executor.process_ws_fill(
+                order_no, filled_qty, filled_price, stock_code=stock_code
+            ):
+                logger.info(
+                    f"[WS 체결] ScalpingExecutor handled: "
+                    f"{key[0]} {key[1]}"
+                )
+                return True
+        return False
+
+    def _on_unclaimed_scalping_fill(
+        self,
+        key: Tuple[str, str],
+        order_no: str,
+        filled_qty: int,
+        filled_price: int,
+        stock_code: str,
+    ) -> None:
+        """executor가 보류했다 반환한 체결 재라우팅 (ack 전 도착 체결이 다른 주문 것이었던 경우)"""
+        if not self._route_ws_fill(order_no, filled_qty, filled_price, stock_code, exclude=key):
+            logger.debug(f"[WS 체결] 반환된 보류 체결 {order_no} 처리 주문 없음")
+
     # ===== 실시간 매도 모니터링 (ExitMonitor) =====
 
     def _start_exit_monitor(self) -> None:
         """실시간 매도 모니터링 시작"""
         self._exit_monitor = ExitMonitor(
             on_exit_signal=self._on_exit_monitor_signal,
-            is_paper=self._settings.mode == TradingMode.PAPER,
+            manager=self._ws_manager,
         )
         self._exit_monitor.start()
 
@@ -984,8 +1302,27 @@ class TradingEngine:
         reason: str,
         is_take_profit: bool,
     ) -> None:
-        """실시간 매도 모니터링 시그널 콜백"""
-        with self._tick_lock:
+        """실시간 매도 모니터링 시그널 콜백 (WS 스레드 → 종목 샤드로 전달)"""
+        self._tick_shards.submit(
+            stock_code,
+            self._handle_exit_monitor_signal,
+            stock_code,
+            strategy_name,
+            quantity,
+            reason,
+            is_take_profit,
+        )
+
+    def _handle_exit_monitor_signal(
+        self,
+        stock_code: str,
+        strategy_name: str,
+        quantity: int,
+        reason: str,
+        is_take_profit: bool,
+    ) -> None:
+        """실시간 매도 시그널 처리 (종목 샤드 스레드)"""
+        with self._symbol_lock(stock_code):
             try:
                 # 중복 주문 방지
                 if self._order_manager.has_pending_order(stock_code):
@@ -1024,7 +1361,7 @@ class TradingEngine:
                 order_id = None
                 if is_take_profit:
                     # TP: 매수1호가 지정가 매도 (1초 후 미체결 시 시장가)
-                    bid_price = self._broker.get_bidding_price(stock_code)
+                    bid_price = self._market_view.best_bid(stock_code)
                     if not bid_price or bid_price <= 0:
                         logger.warning(f"[ExitMonitor] {stock_code} 매수1호가 조회 실패, 시장가 매도로 전환")
                         order_id = self._order_manager.place_sell_order(
@@ -1138,8 +1475,19 @@ class TradingEngine:
         기존 _on_stock_tick과 유사하지만:
         - REST API 대신 WebSocket 데이터 사용
         - WebSocket 전략만 실행
+
+        수신 스레드는 종목 샤드에 등록만 하고 즉시 반환 (종목 내 순서 보장)
         """
-        with self._tick_lock:
+        self._tick_shards.submit(
+            tick_data.stock_code, self._process_ws_tick, tick_data, self._latency.now()
+        )
+
+    def _process_ws_tick(self, tick_data: TickData, submitted_ns: int) -> None:
+        """WebSocket 틱 처리 (종목 샤드 스레드, 대기 시간 = 샤드 큐 + 종목 잠금)"""
+        with self._symbol_lock(tick_data.stock_code):
+            self._latency.record_since(
+                STAGE_TICK_LOCK_WAIT, submitted_ns, tick_data.stock_code
+            )
             try:
                 stock_code = tick_data.stock_code
                 now = tick_data.timestamp
@@ -1160,7 +1508,10 @@ class TradingEngine:
                     f"({change_sign}{tick_data.change_rate:.2f}%)"
                 )
 
-                # NOTE: DB 저장은 스케줄러(_on_stock_tick)에서 30개 분봉 단위로 처리
+                # 진행 중 분봉 메모리 갱신 (완성 분봉 DB 저장은 BarAggregator / REST 분봉)
+                self._candle_store.update_from_tick(
+                    stock_code, tick_data.price, tick_data.volume, now
+                )
 
                 # 중복 주문 방지
                 if self._order_manager.has_pending_order(stock_code):
@@ -1172,8 +1523,9 @@ class TradingEngine:
                 if not strategies:
                     return
 
-                # 가격 히스토리 로드 (분봉)
-                price_history = self._price_repo.get_recent_prices(stock_code, count=500)
+                # 가격 히스토리 로드 (분봉, 메모리 저장소 뷰)
+                history_start = self._latency.now()
+                price_history = self._candle_store.get_recent(stock_code, count=500)
 
                 # 일봉 데이터 로드 (캐시에서)
                 daily_candles = self._daily_candles_cache.get(stock_code, [])
@@ -1181,6 +1533,7 @@ class TradingEngine:
                 # 현재 포지션
                 position = self._position_manager.get_position(stock_code)
                 broker_position = self._get_broker_position(stock_code)
+                self._latency.record_since(STAGE_HISTORY_LOAD, history_start, stock_code)
 
                 for strategy_config in strategies:
                     # WebSocket 전략만 실행
@@ -1223,11 +1576,18 @@ class TradingEngine:
                     if not strategy.can_generate_signal(context):
                         continue
 
-                    # 시그널 생성 (WebSocket 모드)
-                    signal = strategy.generate_signal(context, "websocket")
+                    # 지연 계측 라벨/기준 시각 (하위 broker 주문까지 전파)
+                    with self._latency.context(
+                        stock_code, strategy_name, tick_data.received_ns
+                    ):
+                        # 시그널 생성 (WebSocket 모드)
+                        with self._latency.span(STAGE_GENERATE_SIGNAL):
+                            signal = strategy.generate_signal(context, "websocket")
 
-                    # 시그널 처리
-                    self._process_signal(signal, context, strategy)
+                        # 시그널 처리
+                        if not signal.is_hold:
+                            with self._latency.span(STAGE_PROCESS_SIGNAL):
+                                self._process_signal(signal, context, strategy)
 
                 # 스캘핑 executor에 tick 전달 (별도 처리, 중복 주문 방지와 무관)
                 for key, executor in self._scalping_executors.items():
@@ -1246,11 +1606,18 @@ class TradingEngine:
         신호 발생 전에 미리 예수금을 조회하여 캐싱합니다.
         이를 통해 신호 발생 시 API 호출 없이 빠르게 수량을 계산할 수 있습니다.
         """
+        with self._prefetch_lock:
+            generation = self._prefetch_generation
         try:
             # 예수금 조회 (current_price=0으로 호출하면 API의 기본값 사용)
             _, deposit = self._broker.get_buyable_quantity(stock_code, 0)
 
-            self._prefetch_cache[stock_code] = (deposit, now)
+            with self._prefetch_lock:
+                if generation != self._prefetch_generation:
+                    # 조회 중 다른 종목 매수 → 매수 전 예수금일 수 있음
+                    logger.debug(f"[prefetch][{stock_code}] 조회 중 무효화 → 저장 생략")
+                    return
+                self._prefetch_cache[stock_code] = (deposit, now)
 
             logger.debug(f"[prefetch][{stock_code}] 캐시 저장: 예수금 {deposit:,}원")
         except Exception as e:
@@ -1271,12 +1638,26 @@ class TradingEngine:
                 return deposit
         return None
 
+    def _invalidate_prefetch_cache(self) -> None:
+        """예수금 캐시 전체 폐기 (진행 중인 prefetch 조회 결과도 저장하지 않음)"""
+        with self._prefetch_lock:
+            self._prefetch_generation += 1
+            self._prefetch_cache.clear()
+
+    def _symbol_lock(self, stock_code: str) -> threading.Lock:
+        """종목 단위 잠금 (최초 요청 시 생성)"""
+        lock = self._symbol_locks.get(stock_code)
+        if lock is None:
+            with self._symbol_locks_guard:
+                lock = self._symbol_locks.setdefault(stock_code, threading.Lock())
+        return lock
+
     def _on_stock_tick(self, stock_code: str, now: datetime) -> None:
         """
         종목 틱 콜백 (스케줄러 기반 전략용)
 
-        1. 분봉 데이터 조회 (30개)
-        2. DB 저장
+        1. 시세 스냅샷 조회 (WS 우선, 필요 시 REST 분봉/멀티종목 시세)
+        2. 분봉 DB 저장 (조회한 경우)
         3. 전략별 시그널 생성
         4. 주문 실행
 
@@ -1287,136 +1668,155 @@ class TradingEngine:
             logger.debug(f"[{stock_code}] Skipping stock tick: liquidation in progress")
             return
 
-        with self._tick_lock:
+        lock_wait_start = self._latency.now()
+        with self._symbol_lock(stock_code):
+            self._latency.record_since(STAGE_TICK_LOCK_WAIT, lock_wait_start, stock_code)
             try:
-                # 1. 분봉 데이터 조회 (30개)
-                candle_data = self._broker.get_minute_candles(stock_code=stock_code)
-                if not candle_data:
-                    logger.warning(f"Failed to get minute candles: {stock_code}")
-                    return
+                # 0. 직전 봉 완성 반영 (체결 없이 분이 바뀐 종목 포함)
+                if self._bar_aggregator:
+                    self._bar_aggregator.advance(now)
 
-                # 2. DB 저장 (30개 분봉 upsert)
-                self._save_minute_candles(stock_code, candle_data)
+                # 1. 시세 스냅샷 조회
+                snapshot = self._market_data.get_snapshot(stock_code, now)
+                self._handle_market_snapshot(stock_code, now, snapshot)
+            except Exception as e:
+                logger.error(f"Stock tick error [{stock_code}]: {e}")
 
-                # 현재가 로그 출력 (가장 최근 분봉 기준)
-                latest_candle = candle_data[0]  # 최신순 정렬
-                current_price = latest_candle["close_price"]
-                change_rate = latest_candle.get("change_rate", 0.0)
+    async def _on_stock_tick_async(self, stock_code: str, now: datetime) -> None:
+        """
+        종목 틱 콜백 (async 모드, 스케줄러 이벤트 루프에서 실행)
 
-                stock_config = self._settings.stocks.get(stock_code)
-                stock_name = stock_config.name if stock_config else stock_code
+        분봉 조회(필요한 분에만)는 종목 간 동시에 진행하고, 시세 스냅샷 및 이후 처리는
+        종목 샤드에서 종목 잠금을 잡고 실행 (이벤트 루프 비차단).
+        샤드가 멈춘 상태(시작 전/종료 중)에도 동기 주문/DB 경로는 루프 밖 스레드에서 실행.
+        """
+        if self._liquidation_in_progress:
+            logger.debug(f"[{stock_code}] Skipping stock tick: liquidation in progress")
+            return
 
-                # 당일 등락률
-                change_sign = "+" if change_rate > 0 else ""
-                change_rate_str = f"({change_sign}{change_rate:.1f}%)"
+        try:
+            # 1. 분봉 데이터 조회 (30개, 비동기, 시세 서비스가 필요하다고 판단한 경우만)
+            candle_data = None
+            if self._market_data.needs_candles(stock_code, now):
+                candle_data = await self._async_broker.get_minute_candles(stock_code=stock_code)
+            args = (stock_code, now, candle_data, self._latency.now())
+            if self._tick_shards.is_running:
+                await asyncio.wrap_future(
+                    self._tick_shards.submit(stock_code, self._handle_market_data_locked, *args)
+                )
+            else:
+                # 미시작 샤드는 호출 스레드(이벤트 루프)에서 바로 실행하므로 기본 스레드 풀 사용
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._handle_market_data_locked, *args
+                )
+        except Exception as e:
+            logger.error(f"Stock tick error [{stock_code}]: {e}")
 
-                # 보유 포지션 수익률 계산
-                position_profit_str = ""
-                position = self._position_manager.get_position(stock_code)
-                if position and position.avg_price > 0:
-                    position_profit_rate = (current_price - position.avg_price) / position.avg_price * 100
-                    position_sign = "+" if position_profit_rate >= 0 else ""
-                    position_profit_str = f" / 현재포지션 대비 ({position_sign}{position_profit_rate:.1f}%)"
+    def _handle_market_data_locked(
+        self,
+        stock_code: str,
+        now: datetime,
+        candle_data: Optional[List[Dict]],
+        submitted_ns: int,
+    ) -> None:
+        """종목 잠금 후 시세 스냅샷 처리 (async 모드, 종목 샤드 스레드)"""
+        with self._symbol_lock(stock_code):
+            self._latency.record_since(STAGE_TICK_LOCK_WAIT, submitted_ns, stock_code)
+            if self._bar_aggregator:
+                self._bar_aggregator.advance(now)
+            snapshot = self._market_data.get_snapshot(stock_code, now, candle_data)
+            self._handle_market_snapshot(stock_code, now, snapshot)
+
+    def _handle_market_snapshot(
+        self, stock_code: str, now: datetime, snapshot: Optional[MarketSnapshot]
+    ) -> None:
+        """
+        시세 스냅샷으로 종목 틱 처리 (종목 잠금 보유 상태에서 호출)
 
-                logger.info(
-                    f"[{stock_name}] 현재가: {current_price:,}원 {change_rate_str}{position_profit_str}"
-                )
+        Args:
+            stock_code: 종목코드
+            now: 틱 시각
+            snapshot: 시세 스냅샷 (candles: 이번에 조회한 REST 분봉, 최신순)
+        """
+        if snapshot is None:
+            logger.warning(f"Failed to get market data: {stock_code}")
+            return
 
-                # 3. 중복 주문 방지
-                if self._order_manager.has_pending_order(stock_code):
-                    return
+        # 2. 분봉 저장 (조회한 경우 30개 분봉 upsert, DB는 비동기)
+        if snapshot.candles:
+            self._save_minute_candles(stock_code, snapshot.candles)
 
-                # 4. 전략별 시그널 생성
-                stock_config = self._settings.stocks.get(stock_code)
-                if not stock_config:
-                    return
+        # 분봉을 이번에 조회하지 않은 시세(WS/멀티종목)는 진행 중 분봉 종가/고저에 반영
+        # (price_history[-1]이 current_price와 같은 시점이 되도록, 거래량은 REST 분봉 기준 유지)
+        if snapshot.source in (SOURCE_WS, SOURCE_REST_MULTI):
+            self._candle_store.update_from_tick(stock_code, snapshot.price, 0, snapshot.timestamp)
 
-                strategies = stock_config.strategies
+        # 현재가 로그 출력
+        current_price = snapshot.price
+        change_rate = snapshot.change_rate
 
-                if not strategies:
-                    # 전략 없음 → 가격만 저장
-                    return
+        stock_config = self._settings.stocks.get(stock_code)
+        stock_name = stock_config.name if stock_config else stock_code
 
-                # 가격 히스토리 로드 (분봉)
-                price_history = self._price_repo.get_recent_prices(stock_code, count=500)
+        # 당일 등락률
+        change_sign = "+" if change_rate > 0 else ""
+        change_rate_str = f"({change_sign}{change_rate:.1f}%)"
 
-                # 일봉 데이터 로드 (캐시에서)
-                daily_candles = self._daily_candles_cache.get(stock_code, [])
+        # 보유 포지션 수익률 계산
+        position_profit_str = ""
+        position = self._position_manager.get_position(stock_code)
+        if position and position.avg_price > 0:
+            position_profit_rate = (current_price - position.avg_price) / position.avg_price * 100
+            position_sign = "+" if position_profit_rate >= 0 else ""
+            position_profit_str = f" / 현재포지션 대비 ({position_sign}{position_profit_rate:.1f}%)"
 
-                # 현재 포지션
-                position = self._position_manager.get_position(stock_code)
-                broker_position = self._get_broker_position(stock_code)
+        logger.info(
+            f"[{stock_name}] 현재가: {current_price:,}원 {change_rate_str}{position_profit_str}"
+        )
 
-                for strategy_config in strategies:
-                    # WebSocket 전략은 스킵 (별도 처리)
-                    if strategy_config.get("execution_mode") == "websocket":
-                        continue
+        # 3. 중복 주문 방지
+        if self._order_manager.has_pending_order(stock_code):
+            return
 
-                    strategy_name = strategy_config.get("name")
-                    key = (stock_code, strategy_name)
-                    strategy = self._strategies.get(key)
+        # 4. 전략별 시그널 생성
+        stock_config = self._settings.stocks.get(stock_code)
+        if not stock_config:
+            return
 
-                    if not strategy:
-                        continue
+        strategies = stock_config.strategies
 
-                    # 스캘핑 전략: executor에 라우팅 (별도 처리)
-                    if strategy_config.get("execution_mode") == "scalping":
-                        executor = self._scalping_executors.get(key)
-                        if executor:
-                            context = StrategyContext(
-                                stock_code=stock_code,
-                                stock_name=stock_config.name,
-                                current_price=current_price,
-                                current_time=now,
-                                price_history=price_history,
-                                position=broker_position,
-                                daily_candles=daily_candles,
-                                today_trade_count=self._order_manager.get_today_trade_count(
-                                    stock_code
-                                ),
-                            )
-                            if strategy.can_generate_signal(context):
-                                signal = strategy.generate_signal(context)
-
-                                # LONG 시그널: 기존 로직
-                                if signal.is_buy and not executor.is_active:
-                                    # main_beam_1 등 limit_order 전략: 즉시 지정가 매수
-                                    if signal.metadata.get("limit_price"):
-                                        executor.activate_limit_order(
-                                            buy_price=signal.metadata["limit_price"],
-                                            sell_price=signal.metadata["sell_price"],
-                                            timeout_seconds=signal.metadata.get(
-                                                "timeout_seconds", 60
-                                            ),
-                                            quantity=signal.quantity,
-                                        )
-                                    else:
-                                        # 기존 boundary_tracker 기반 스캘핑
-                                        executor.activate_signal(
-                                            signal_price=current_price,
-                                            tp_pct=executor._config.take_profit_pct,
-                                            sl_pct=executor._config.stop_loss_pct,
-                                            timeout_minutes=executor._config.max_signal_minutes,
-                                        )
-                                    # Slack notification now handled in executor methods
-
-                                # NEW: SHORT 시그널 → 활성화 중일 때만 처리
-                                elif signal.is_sell and executor.is_active:
-                                    executor.handle_short_signal(
-                                        short_price=current_price,
-                                        reason=signal.reason
-                                    )
-                        continue
+        if not strategies:
+            # 전략 없음 → 가격만 저장
+            return
 
-                    # 포지션 보유 시 해당 전략으로만 매도 가능
-                    # (unmanaged 포지션은 첫 번째 매칭 전략이 처리)
-                    is_other_strategy_position = (
-                        position
-                        and position.strategy_name is not None
-                        and position.strategy_name != strategy_name
-                    )
+        # 가격 히스토리 로드 (분봉, 메모리 저장소 뷰)
+        history_start = self._latency.now()
+        price_history = self._candle_store.get_recent(stock_code, count=500)
 
-                    # 전략 컨텍스트 생성
+        # 일봉 데이터 로드 (캐시에서)
+        daily_candles = self._daily_candles_cache.get(stock_code, [])
+
+        # 현재 포지션
+        position = self._position_manager.get_position(stock_code)
+        broker_position = self._get_broker_position(stock_code)
+        self._latency.record_since(STAGE_HISTORY_LOAD, history_start, stock_code)
+
+        for strategy_config in strategies:
+            # WebSocket 전략은 스킵 (별도 처리)
+            if strategy_config.get("execution_mode") == "websocket":
+                continue
+
+            strategy_name = strategy_config.get("name")
+            key = (stock_code, strategy_name)
+            strategy = self._strategies.get(key)
+
+            if not strategy:
+                continue
+
+            # 스캘핑 전략: executor에 라우팅 (별도 처리)
+            if strategy_config.get("execution_mode") == "scalping":
+                executor = self._scalping_executors.get(key)
+                if executor:
                     context = StrategyContext(
                         stock_code=stock_code,
                         stock_name=stock_config.name,
@@ -1429,47 +1829,105 @@ class TradingEngine:
                             stock_code
                         ),
                     )
-
-                    # 시그널 생성 가능 여부 확인 (데이터 충분성, 가격 유효성)
-                    if not strategy.can_generate_signal(context):
-                        validation = context.validate_price_data()
-                        if not validation.is_valid:
-                            logger.warning(
-                                f"[{stock_code}] Cannot generate signal: {validation.errors}"
+                    if strategy.can_generate_signal(context):
+                        with self._latency.span(
+                            STAGE_GENERATE_SIGNAL, stock_code, strategy_name
+                        ):
+                            signal = strategy.generate_signal(context)
+
+                        # LONG 시그널: 기존 로직
+                        if signal.is_buy and not executor.is_active:
+                            # main_beam_1 등 limit_order 전략: 즉시 지정가 매수
+                            if signal.metadata.get("limit_price"):
+                                executor.activate_limit_order(
+                                    buy_price=signal.metadata["limit_price"],
+                                    sell_price=signal.metadata["sell_price"],
+                                    timeout_seconds=signal.metadata.get(
+                                        "timeout_seconds", 60
+                                    ),
+                                    quantity=signal.quantity,
+                                )
+                            else:
+                                # 기존 boundary_tracker 기반 스캘핑
+                                executor.activate_signal(
+                                    signal_price=current_price,
+                                    tp_pct=executor._config.take_profit_pct,
+                                    sl_pct=executor._config.stop_loss_pct,
+                                    timeout_minutes=executor._config.max_signal_minutes,
+                                )
+                            # Slack notification now handled in executor methods
+
+                        # NEW: SHORT 시그널 → 활성화 중일 때만 처리
+                        elif signal.is_sell and executor.is_active:
+                            executor.handle_short_signal(
+                                short_price=current_price,
+                                reason=signal.reason
                             )
-                        continue
+                continue
 
-                    # 다른 전략의 포지션이어도 모니터링 로그는 출력
-                    if is_other_strategy_position:
-                        strategy.generate_signal(context)
-                        continue
+            # 포지션 보유 시 해당 전략으로만 매도 가능
+            # (unmanaged 포지션은 첫 번째 매칭 전략이 처리)
+            is_other_strategy_position = (
+                position
+                and position.strategy_name is not None
+                and position.strategy_name != strategy_name
+            )
 
-                    # 시그널 생성
-                    signal = strategy.generate_signal(context)
+            # 전략 컨텍스트 생성
+            context = StrategyContext(
+                stock_code=stock_code,
+                stock_name=stock_config.name,
+                current_price=current_price,
+                current_time=now,
+                price_history=price_history,
+                position=broker_position,
+                daily_candles=daily_candles,
+                today_trade_count=self._order_manager.get_today_trade_count(
+                    stock_code
+                ),
+            )
 
-                    # ExitMonitor가 모니터링 중인 종목의 매도 시그널은 스킵
-                    # (WebSocket에서 실시간 처리하므로 폴링 스킵)
-                    if signal.is_sell and self._exit_monitor:
-                        if self._exit_monitor.is_exit_in_progress(stock_code):
-                            logger.debug(
-                                f"[{stock_code}] 실시간 매도 진행 중 - 폴링 스킵"
-                            )
-                            continue
-                        if (
-                            self._exit_monitor.is_monitored(stock_code)
-                            and self._exit_monitor.is_ws_connected
-                        ):
-                            logger.debug(
-                                f"[{stock_code}] ExitMonitor 모니터링 중 - 폴링 스킵"
-                            )
-                            continue
-                        # WebSocket 끊김 시 → 폴링이 백업으로 처리
+            # 시그널 생성 가능 여부 확인 (데이터 충분성, 가격 유효성)
+            if not strategy.can_generate_signal(context):
+                validation = context.validate_price_data()
+                if not validation.is_valid:
+                    logger.warning(
+                        f"[{stock_code}] Cannot generate signal: {validation.errors}"
+                    )
+                continue
 
-                    # 시그널 처리
-                    self._process_signal(signal, context, strategy)
+            # 다른 전략의 포지션이어도 모니터링 로그는 출력
+            if is_other_strategy_position:
+                strategy.generate_signal(context)
+                continue
 
-            except Exception as e:
-                logger.error(f"Stock tick error [{stock_code}]: {e}")
+            # 시그널 생성
+            with self._latency.span(STAGE_GENERATE_SIGNAL, stock_code, strategy_name):
+                signal = strategy.generate_signal(context)
+
+            # ExitMonitor가 모니터링 중인 종목의 매도 시그널은 스킵
+            # (WebSocket에서 실시간 처리하므로 폴링 스킵)
+            if signal.is_sell and self._exit_monitor:
+                if self._exit_monitor.is_exit_in_progress(stock_code):
+                    logger.debug(
+                        f"[{stock_code}] 실시간 매도 진행 중 - 폴링 스킵"
+                    )
+                    continue
+                if (
+                    self._exit_monitor.is_monitored(stock_code)
+                    and self._exit_monitor.is_ws_connected
+                ):
+                    logger.debug(
+                        f"[{stock_code}] ExitMonitor 모니터링 중 - 폴링 스킵"
+                    )
+                    continue
+                # WebSocket 끊김 시 → 폴링이 백업으로 처리
+
+            # 시그널 처리
+            if not signal.is_hold:
+                with self._latency.context(stock_code, strategy_name):
+                    with self._latency.span(STAGE_PROCESS_SIGNAL):
+                        self._process_signal(signal, context, strategy)
 
     def _get_broker_position(self, stock_code: str) -> Optional[Position]:
         """브로커에서 Position 객체 조회"""
@@ -1526,80 +1984,76 @@ class TradingEngine:
                     f"현재가 {context.current_price:,} → 시그널가 {signal_price:,}"
                 )
 
-            # 캐시된 예수금 사용 또는 실시간 조회
-            cached_deposit = self._get_prefetch_cache(stock_code)
-            if cached_deposit:
-                max_buy_amt = cached_deposit
-                logger.info(f"[{stock_code}] prefetch 캐시 사용: 예수금 {max_buy_amt:,}원")
-            else:
-                _, max_buy_amt = self._broker.get_buyable_quantity(stock_code, 0)
-                logger.warning(f"[{stock_code}] prefetch 캐시 없음 → 실시간 조회: 예수금 {max_buy_amt:,}원")
-
-            # 수수료 적용하여 매수가능수량 계산
-            price_with_fee = int(signal_price * (1 + self._buy_fee_rate))
-            buyable_qty = max_buy_amt // price_with_fee if price_with_fee > 0 else 0
-
-            if buyable_qty > 0:
-                # allocation 비율 적용
-                quantity = int(buyable_qty * (allocation / 100))
-                if quantity < 1:
-                    logger.warning(f"[{stock_code}] 계산된 수량 0 → 최소 1주로 설정")
-                    quantity = 1
-                logger.info(
-                    f"[{stock_code}] 매수 수량 계산: {quantity}주 "
-                    f"(예수금: {max_buy_amt:,}원, 가격: {signal_price:,}원, "
-                    f"수수료율: {self._buy_fee_rate:.4%}, allocation: {allocation}%)"
-                )
-            else:
-                quantity = signal.quantity
-                max_buy_amt = context.current_price * quantity  # fallback
-                logger.warning(f"[{stock_code}] 매수가능수량 조회 실패 → 시그널 수량 사용: {quantity}주")
-
-            # 시그널 알림 (주문 전) - 매수 시그널은 매번 전송
-            self._slack.notify_signal(
-                signal_type="BUY",
-                stock_code=stock_code,
-                stock_name=stock_name,
-                quantity=quantity,
-                price=context.current_price,
-                strategy_name=strategy.name,
-                reason=signal.reason,
-                strategy_win_rate=win_rate,
-                tp_price=tp_price,
-                tp_rate=tp_rate,
-                sl_price=sl_price,
-                sl_rate=-sl_rate,  # 음수로 표시
-                force=True,
-            )
-
-            # 지정가 추격 매수 (매도호가1로 주문 + 0.5초마다 정정)
-            # deposit: 가격 상승 시 수량 자동 조정용 (실제 최대매수금액 사용)
-            order_id = self._order_manager.place_buy_order_with_chase(
-                stock_code=stock_code,
-                stock_name=stock_name,
-                quantity=quantity,
-                deposit=max_buy_amt,
-                strategy_name=strategy.name,
-                interval=0.5,
-                max_retry=10,
-                signal_price=signal_price,
-            )
-
-            if order_id:
-                logger.info(f"[{stock_code}] 지정가 추격 매수 프로세스 종료: {order_id}")
-                order = self._order_manager.get_order(order_id)
-                actual_qty = order.filled_qty if order else quantity
-                actual_price = order.filled_price if order and order.filled_price > 0 else context.current_price
+            # 예수금 조회 ~ 매수 주문은 종목 간 직렬화 (동시 매수로 예수금 초과 방지)
+            with self._cash_lock:
+                # 캐시된 예수금 사용 또는 실시간 조회
+                cached_deposit = self._get_prefetch_cache(stock_code)
+                if cached_deposit:
+                    max_buy_amt = cached_deposit
+                    logger.info(f"[{stock_code}] prefetch 캐시 사용: 예수금 {max_buy_amt:,}원")
+                else:
+                    _, max_buy_amt = self._broker.get_buyable_quantity(stock_code, 0)
+                    logger.warning(f"[{stock_code}] prefetch 캐시 없음 → 실시간 조회: 예수금 {max_buy_amt:,}원")
+
+                # 수수료 적용하여 매수가능수량 계산
+                price_with_fee = int(signal_price * (1 + self._buy_fee_rate))
+                buyable_qty = max_buy_amt // price_with_fee if price_with_fee > 0 else 0
+
+                if buyable_qty > 0:
+                    # allocation 비율 적용
+                    quantity = int(buyable_qty * (allocation / 100))
+                    if quantity < 1:
+                        logger.warning(f"[{stock_code}] 계산된 수량 0 → 최소 1주로 설정")
+                        quantity = 1
+                    logger.info(
+                        f"[{stock_code}] 매수 수량 계산: {quantity}주 "
+                        f"(예수금: {max_buy_amt:,}원, 가격: {signal_price:,}원, "
+                        f"수수료율: {self._buy_fee_rate:.4%}, allocation: {allocation}%)"
+                    )
+                else:
+                    quantity = signal.quantity
+                    max_buy_amt = context.current_price * quantity  # fallback
+                    logger.warning(f"[{stock_code}] 매수가능수량 조회 실패 → 시그널 수량 사용: {quantity}주")
 
-                self._slack.notify_buy(
+                # 시그널 알림 (주문 전) - 매수 시그널은 매번 전송
+                self._slack.notify_signal(
+                    signal_type="BUY",
                     stock_code=stock_code,
                     stock_name=stock_name,
-                    quantity=actual_qty,
-                    price=actual_price,
+                    quantity=quantity,
+                    price=context.current_price,
                     strategy_name=strategy.name,
                     reason=signal.reason,
                     strategy_win_rate=win_rate,
+                    tp_price=tp_price,
+                    tp_rate=tp_rate,
+                    sl_price=sl_price,
+                    sl_rate=-sl_rate,  # 음수로 표시
+                    force=True,
+                )
+
+                # 지정가 추격 매수 (매도호가1로 주문 + 0.5초마다 정정)
+                # deposit: 가격 상승 시 수량 자동 조정용 (실제 최대매수금액 사용)
+                order_id = self._order_manager.place_buy_order_with_chase(
+                    stock_code=stock_code,
+                    stock_name=stock_name,
+                    quantity=quantity,
+                    deposit=max_buy_amt,
+                    strategy_name=strategy.name,
+                    interval=0.5,
+                    max_retry=10,
+                    signal_price=signal_price,
+                    on_complete=lambda order: self._on_chase_buy_complete(
+                        order, signal.reason, win_rate, context.current_price
+                    ),
                 )
+
+                if order_id:
+                    # 다른 종목의 prefetch 예수금은 이제 실제보다 큼 → 무효화
+                    self._invalidate_prefetch_cache()
+
+            if order_id:
+                logger.info(f"[{stock_code}] 지정가 추격 매수 시작: {order_id}")
             else:
                 logger.error(f"[{stock_code}] 지정가 추격 매수 실패")
 
@@ -1638,7 +2092,7 @@ class TradingEngine:
 
             if is_take_profit and position:
                 # TP: 매수1호가 지정가 매도 (즉시 체결)
-                bid_price = self._broker.get_bidding_price(stock_code)
+                bid_price = self._market_view.best_bid(stock_code)
                 if not bid_price or bid_price <= 0:
                     logger.warning(f"[{stock_code}] 매수1호가 조회 실패, 시장가 매도로 전환")
                     order_id = self._order_manager.place_sell_order(
@@ -1682,6 +2136,23 @@ class TradingEngine:
                     strategy_win_rate=win_rate,
                 )
 
+    def _on_chase_buy_complete(
+        self, order: ManagedOrder, reason: str, win_rate: Optional[float], signal_price: int
+    ) -> None:
+        """추격 매수 종료 콜백 (추격 엔진 스레드) - 최종 체결 기준 매수 알림"""
+        logger.info(f"[{order.stock_code}] 지정가 추격 매수 프로세스 종료: {order.order_id}")
+        if order.filled_qty <= 0:
+            return
+        self._slack.notify_buy(
+            stock_code=order.stock_code,
+            stock_name=order.stock_name,
+            quantity=order.filled_qty,
+            price=order.filled_price if order.filled_price > 0 else signal_price,
+            strategy_name=order.strategy_name or "",
+            reason=reason,
+            strategy_win_rate=win_rate,
+        )
+
     def _on_market_open(self) -> None:
         """장 시작 콜백"""
         logger.info("Market opened - syncing positions")
@@ -1801,10 +2272,28 @@ class TradingEngine:
             # 4. 시그널 요약 전송
             self._slack.send_signal_summary()
 
+            # 5. 마감 거래일 분봉 Parquet 아카이브 이관 (설정 시)
+            self._archive_minute_candles()
+
         except Exception as e:
             logger.error(f"Market close error: {e}")
             self._slack.notify_error("장 마감 처리 오류", str(e))
 
+    def _archive_minute_candles(self) -> None:
+        """보관 기간이 지난 분봉을 Parquet 아카이브로 이관 (minute_hot_days > 0일 때)"""
+        hot_days = self._settings.get_minute_hot_days()
+        if hot_days <= 0:
+            return
+
+        keep_days = max(hot_days, MIN_MINUTE_HOT_DAYS)
+        archive = MinuteCandleArchive(self._settings.get_minute_archive_dir())
+        moved = archive_minute_candles(self._market_db, archive, keep_days=keep_days)
+        if moved:
+            logger.info(
+                f"[archive] {sum(moved.values()):,} minute candles archived "
+                f"({len(moved)} stocks, keep {keep_days} days)"
+            )
+
     def _on_daily_liquidation(self) -> None:
         """15:19 당일 청산 콜백"""
         try:
@@ -1906,7 +2395,22 @@ class TradingEngine:
             "active_orders": len(self._order_manager.get_active_orders()) if self._order_manager else 0,
             "strategies": len(self._strategies),
             "session_id": self._session_id,
+            "api_rate_limit": self._session.rate_limiter.get_status(),
             "health": self._health_checker.get_last_health().to_dict() if self._health_checker.get_last_health() else None,
+            "latency": self._latency.snapshot(cumulative=True),
+            "slack": self._slack.delivery_stats(),
+            "websocket": self._ws_manager.stats() if self._ws_manager else None,
+            "tick_shards": self._tick_shards.stats(),
+            "market_data": self._market_data.stats() if self._market_data else None,
+            "order_book": self._market_view.stats() if self._market_view else None,
+            "order_chase": self._order_manager.get_chase_stats() if self._order_manager else None,
+            "account_snapshot": self._broker.account_snapshot_stats() if self._broker else None,
+            "position_persist": self._position_manager.get_persist_stats() if self._position_manager else None,
+            "trade_ledger": self._order_manager.trade_ledger.snapshot() if self._order_manager else None,
+            "bars": self._bar_aggregator.stats() if self._bar_aggregator else None,
+            "ws_pool": (
+                [vars(h) for h in self._ws_pool.health()] if self._ws_pool else None
+            ),
         }
 
     def _on_health_change(self, health) -> None:
@@ -8,9 +8,15 @@ Data 모듈 - 데이터베이스, 가격/시세 저장소
 - StockRepository: 종목 마스터 관리
 - DailyCandleRepository: 일봉 데이터 관리
 - MinuteCandleRepository: 분봉 데이터 관리 (기존 PriceRepository 대체)
+- CandleStore: 종목별 인메모리 분봉 버퍼 (틱 경로 DB 조회 제거)
+- MinuteCandleArchive: 마감 거래일 분봉 Parquet 아카이브 (종목/연/월)
+- MinuteCandleReader: 아카이브 + SQLite 분봉 통합 조회 (Arrow/numpy)
+- MarketDataService: 종목 시세 스냅샷 (WS 우선, REST 멀티종목/분봉 보완)
+- BarAggregator: WebSocket 체결 → 1분봉/N초봉 실시간 집계 (REST 분봉 대조)
+- MarketDataView: WebSocket 호가 기반 로컬 호가창 (최우선 매도/매수호가, REST 보완)
 """
 
-from leverage_worker.data.database import Database, MarketDataDB, TradingDB
+from leverage_worker.data.database import Database, LeaseExpiredError, MarketDataDB, TradingDB
 from leverage_worker.data.stock_repository import Stock, StockRepository
 from leverage_worker.data.daily_candle_repository import DailyCandle, DailyCandleRepository
 from leverage_worker.data.minute_candle_repository import (
@@ -19,10 +25,20 @@ from leverage_worker.data.minute_candle_repository import (
     OHLCV,  # 호환성 별칭
     PriceRepository,  # 호환성 별칭
 )
+from leverage_worker.data.candle_store import CandleStore, CandleView
+from leverage_worker.data.candle_archive import (
+    MinuteCandleArchive,
+    MinuteCandleReader,
+    archive_minute_candles,
+)
+from leverage_worker.data.market_data import MarketDataService, MarketSnapshot
+from leverage_worker.data.bar_aggregator import Bar, BarAggregator
+from leverage_worker.data.order_book import MarketDataView
 
 __all__ = [
     # Database
     "Database",
+    "LeaseExpiredError",
     "MarketDataDB",
     "TradingDB",
     # Stock
@@ -34,6 +50,21 @@ __all__ = [
     # Minute Candle
     "MinuteCandle",
     "MinuteCandleRepository",
+    # Candle Store
+    "CandleStore",
+    "CandleView",
+    # Minute Candle Archive
+    "MinuteCandleArchive",
+    "MinuteCandleReader",
+    "archive_minute_candles",
+    # Market Data
+    "MarketDataService",
+    "MarketSnapshot",
+    # Bar Aggregator
+    "Bar",
+    "BarAggregator",
+    # Order Book
+    "MarketDataView",
     # 호환성 별칭
     "OHLCV",
     "PriceRepository",
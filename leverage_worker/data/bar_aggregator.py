@@ -0,0 +1,508 @@
+"""
+틱 → 봉 집계 모듈
+
+WebSocket 체결(TickData)로 1분봉 / N초봉을 실시간 생성
+- 장중(09:00 ~ 15:30 분봉) 체결만 집계, N초봉은 09:00 기준으로 정렬
+- 거래량 = 누적거래량(accumulated_volume) 차이 → 틱 중복/누락/순서 뒤바뀜에도 합계 유지
+  (누적거래량이 없는 틱은 체결수량 합산)
+- 시가/종가는 (체결시각, 누적거래량) 순서로 결정 → 늦게 도착한 틱도 제자리에 반영
+- 다음 봉 체결 수신 또는 봉 종료 시각 경과 시 즉시 완성, 완성 후 도착한 틱은 보정본 재발행
+- REST 분봉과 대조해 차이(drift) 기록, 대조된 분봉은 REST 값으로 확정 (이후 보정 발행 안 함)
+- 완성 봉은 모아서 on_bars 콜백으로 일괄 전달 (분봉 저장소 upsert)
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, time as dt_time, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from leverage_worker.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 장중 집계 구간 [09:00, 15:31) - REST 분봉 저장 규칙(09:00 ~ 15:30 분봉)과 동일
+SESSION_START = dt_time(9, 0)
+SESSION_END = dt_time(15, 31)
+
+MINUTE_SECONDS = 60
+
+_BarKey = Tuple[str, int, datetime]  # (종목코드, 봉 길이 초, 봉 시작)
+
+
+@dataclass
+class Bar:
+    """완성 봉 (on_bars 전달 단위)"""
+
+    stock_code: str
+    seconds: int  # 봉 길이 (60 = 1분봉)
+    start: datetime
+    open_price: int
+    high_price: int
+    low_price: int
+    close_price: int
+    volume: int
+    tick_count: int
+    revision: int = 0  # 0 = 최초 발행, 1 이상 = 늦은 틱 반영 보정본
+
+    @property
+    def end(self) -> datetime:
+        return self.start + timedelta(seconds=self.seconds)
+
+
+class _BarState:
+    """집계 중인 봉 1개"""
+
+    __slots__ = (
+        "start", "end", "open", "high", "low", "close", "open_key", "close_key",
+        "max_acc", "base_acc", "volume_sum", "tick_count", "closed", "emitted", "reconciled",
+    )
+
+    def __init__(self, start: datetime, end: datetime):
+        self.start = start
+        self.end = end
+        self.open = self.high = self.low = self.close = 0
+        self.open_key: Optional[Tuple[datetime, int]] = None
+        self.close_key: Optional[Tuple[datetime, int]] = None
+        self.max_acc = 0  # 봉 내 최대 누적거래량 (0 = 미제공)
+        self.base_acc: Optional[int] = None  # 봉 내 min(누적거래량 - 체결수량)
+        self.volume_sum = 0
+        self.tick_count = 0
+        self.closed = False
+        self.emitted = 0
+        self.reconciled = False
+
+    def add(self, price: int, acc: int, volume: int, order: Tuple[datetime, int]) -> None:
+        if self.tick_count == 0:
+            self.open = self.high = self.low = self.close = price
+            self.open_key = self.close_key = order
+        else:
+            if price > self.high:
+                self.high = price
+            if price < self.low:
+                self.low = price
+            if order < self.open_key:
+                self.open, self.open_key = price, order
+            if order >= self.close_key:
+                self.close, self.close_key = price, order
+        if acc > 0:
+            if acc > self.max_acc:
+                self.max_acc = acc
+            base = acc - volume
+            if self.base_acc is None or base < self.base_acc:
+                self.base_acc = base
+        self.volume_sum += volume
+        self.tick_count += 1
+
+
+class _Series:
+    """종목 × 봉 길이별 집계 상태 (봉 시작 오름차순)"""
+
+    __slots__ = ("trade_date", "starts", "bars", "baseline_acc", "floor")
+
+    def __init__(self, trade_date: date):
+        self.trade_date = trade_date
+        self.starts: List[datetime] = []
+        self.bars: Dict[datetime, _BarState] = {}
+        self.baseline_acc = 0  # 보관 구간 밖으로 밀려난 봉의 최대 누적거래량
+        self.floor: Optional[datetime] = None  # 이 시각 이전 틱은 보정 불가 (폐기)
+
+
+class BarAggregator:
+    """
+    스트리밍 OHLCV 집계기
+
+    스레드 안전. WS 수신 스레드(on_tick), 스케줄러 워커(advance/reconcile),
+    내부 flush 스레드에서 동시에 호출된다.
+
+    Example:
+        aggregator = BarAggregator(on_bars=save_bars, bar_seconds=[10])
+        bus.subscribe(aggregator.on_tick)
+        aggregator.start()
+        aggregator.advance(datetime.now())  # 종료 시각 지난 봉 완성 + 일괄 전달
+    """
+
+    def __init__(
+        self,
+        on_bars: Optional[Callable[[List[Bar]], None]] = None,
+        bar_seconds: Sequence[int] = (),
+        close_grace: float = 0.2,
+        retain_bars: int = 5,
+        history_size: int = 600,
+        reconcile_settle_seconds: float = 3.0,
+        flush_interval: float = 0.1,
+    ):
+        """
+        Args:
+            on_bars: 완성 봉 일괄 전달 콜백 (flush 시 호출)
+            bar_seconds: 1분봉 외에 만들 N초봉 길이 목록
+            close_grace: 봉 종료 시각 후 체결 지연 허용 시간 (초, 시각 기준 완성 시)
+            retain_bars: 늦은 틱 보정을 위해 보관할 완성 봉 수 (종목 × 봉 길이별)
+            history_size: get_bars() 조회용 완성 봉 보관 수
+            reconcile_settle_seconds: 봉 종료 후 이 시간이 지난 REST 분봉만 대조 (REST 확정 대기)
+            flush_interval: 백그라운드 완성 처리/일괄 전달 주기 (초)
+        """
+        for seconds in bar_seconds:
+            if seconds <= 0 or MINUTE_SECONDS % seconds and seconds % MINUTE_SECONDS:
+                raise ValueError(f"bar_seconds must divide or be a multiple of 60: {seconds}")
+        self._resolutions: Tuple[int, ...] = tuple(sorted({MINUTE_SECONDS, *bar_seconds}))
+        self._on_bars = on_bars
+        self._close_grace = timedelta(seconds=close_grace)
+        self._retain_bars = retain_bars
+        self._history_size = history_size
+        self._reconcile_settle = timedelta(seconds=reconcile_settle_seconds)
+        self._flush_interval = flush_interval
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # on_bars 호출 직렬화 (보정본 순서 보장)
+
+        self._series: Dict[Tuple[str, int], _Series] = {}
+        self._pending: "OrderedDict[_BarKey, Bar]" = OrderedDict()
+        self._history: Dict[Tuple[str, int], "OrderedDict[datetime, Bar]"] = {}
+
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        self._stats: Dict[str, int] = {
+            "ticks": 0,
+            "outside_session": 0,
+            "bars": 0,
+            "corrections": 0,
+            "late_ticks": 0,
+            "late_dropped": 0,
+            "partial_skipped": 0,
+            "reconciled": 0,
+            "drift_bars": 0,
+            "drift_volume": 0,
+            "batches": 0,
+        }
+
+    @property
+    def resolutions(self) -> Tuple[int, ...]:
+        """집계 중인 봉 길이 목록 (초)"""
+        return self._resolutions
+
+    # ==========================================
+    # 생명주기
+    # ==========================================
+
+    def start(self) -> None:
+        """백그라운드 완성 처리 스레드 시작 (체결 없는 종목의 봉 완성용)"""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name="BarAggregatorThread"
+        )
+        self._thread.start()
+        logger.info(f"BarAggregator started (bars={list(self._resolutions)}s)")
+
+    def stop(self) -> None:
+        """스레드 종료 후 종료 시각 지난 봉 완성 + 잔여분 전달"""
+        self._running = False
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.advance(datetime.now())
+        logger.info("BarAggregator stopped")
+
+    def _run(self) -> None:
+        while self._running:
+            time.sleep(self._flush_interval)
+            try:
+                self.advance(datetime.now())
+            except Exception as e:
+                logger.error(f"BarAggregator advance error: {e}")
+
+    # ==========================================
+    # 입력
+    # ==========================================
+
+    def on_tick(self, tick) -> None:
+        """TickBus 구독 콜백 (TickData: price, volume, accumulated_volume, timestamp)"""
+        price = tick.price
+        if price <= 0:
+            return
+        timestamp = tick.timestamp
+        if not (SESSION_START <= timestamp.time() < SESSION_END):
+            self._stats["outside_session"] += 1
+            return
+
+        acc = tick.accumulated_volume or 0
+        volume = tick.volume or 0
+        order = (timestamp, acc)
+
+        with self._lock:
+            self._stats["ticks"] += 1
+            for seconds in self._resolutions:
+                key = (tick.stock_code, seconds)
+                series = self._series.get(key)
+                if series is None or series.trade_date != timestamp.date():
+                    series = self._series[key] = _Series(timestamp.date())
+                self._apply_locked(
+                    tick.stock_code, seconds, series, timestamp, price, acc, volume, order
+                )
+
+    def advance(self, now: datetime) -> int:
+        """
+        종료 시각(+close_grace)이 지난 봉 완성 후 대기 중인 봉 일괄 전달
+
+        Args:
+            now: 현재 시각 (체결 시각과 같은 벽시계 기준)
+
+        Returns:
+            전달한 봉 수
+        """
+        cutoff = now - self._close_grace
+        with self._lock:
+            for (stock_code, seconds), series in self._series.items():
+                if not series.starts:
+                    continue
+                bar = series.bars[series.starts[-1]]
+                if not bar.closed and bar.end <= cutoff:
+                    bar.closed = True
+                    self._emit_locked(stock_code, seconds, series, len(series.starts) - 1)
+        return self.flush()
+
+    def reconcile(
+        self, stock_code: str, candles: Iterable[Any], now: Optional[datetime] = None
+    ) -> int:
+        """
+        REST 분봉 대조
+
+        완성된 1분봉과 REST 분봉(MinuteCandle 형식)을 비교해 차이를 기록하고,
+        해당 분봉은 REST 값으로 확정한다 (이후 늦은 틱 보정본/대기 중 발행분 폐기).
+        봉 종료 후 reconcile_settle_seconds가 지나지 않은 분봉은 REST도 미확정이므로 제외.
+
+        Args:
+            stock_code: 종목코드
+            candles: REST 분봉 목록 (candle_datetime "YYYY-MM-DD HH:MM", OHLCV)
+            now: 대조 시각 (기본: 현재)
+
+        Returns:
+            대조한 분봉 수
+        """
+        settled = (now or datetime.now()) - self._reconcile_settle
+        reconciled = 0
+        with self._lock:
+            series = self._series.get((stock_code, MINUTE_SECONDS))
+            if series is None:
+                return 0
+            for candle in candles:
+                try:
+                    start = datetime.strptime(candle.candle_datetime, "%Y-%m-%d %H:%M")
+                except (AttributeError, ValueError):
+                    continue
+                state = series.bars.get(start)
+                if state is None or not state.closed or state.reconciled or state.end > settled:
+                    continue
+
+                idx = bisect_left(series.starts, start)
+                if self._is_complete(series, idx):
+                    drift = abs(self._volume(series, idx) - candle.volume)
+                    if drift or state.close != candle.close_price:
+                        self._stats["drift_bars"] += 1
+                        self._stats["drift_volume"] += drift
+                        logger.debug(
+                            f"[{stock_code}] bar drift {candle.candle_datetime}: "
+                            f"volume {self._volume(series, idx)} -> {candle.volume}, "
+                            f"close {state.close} -> {candle.close_price}"
+                        )
+
+                state.reconciled = True
+                self._pending.pop((stock_code, MINUTE_SECONDS, start), None)
+                self._remember_locked(
+                    Bar(
+                        stock_code=stock_code,
+                        seconds=MINUTE_SECONDS,
+                        start=start,
+                        open_price=candle.open_price,
+                        high_price=candle.high_price,
+                        low_price=candle.low_price,
+                        close_price=candle.close_price,
+                        volume=candle.volume,
+                        tick_count=state.tick_count,
+                        revision=state.emitted,
+                    )
+                )
+                reconciled += 1
+            self._stats["reconciled"] += reconciled
+        return reconciled
+
+    # ==========================================
+    # 출력
+    # ==========================================
+
+    def flush(self) -> int:
+        """대기 중인 완성 봉을 on_bars로 일괄 전달"""
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                bars = list(self._pending.values())
+                self._pending.clear()
+                self._stats["batches"] += 1
+            if self._on_bars:
+                try:
+                    self._on_bars(bars)
+                except Exception as e:
+                    logger.error(f"BarAggregator on_bars error ({len(bars)} bars): {e}")
+            return len(bars)
+
+    def get_bars(self, stock_code: str, seconds: int = MINUTE_SECONDS, count: int = 100) -> List[Bar]:
+        """최근 완성 봉 (과거 → 최근 순, REST 대조분은 REST 값)"""
+        with self._lock:
+            history = self._history.get((stock_code, seconds))
+            if not history:
+                return []
+            bars = sorted(history.values(), key=lambda bar: bar.start)
+        return bars[-count:]
+
+    def stats(self) -> Dict[str, int]:
+        """집계/보정/REST 대조 통계"""
+        with self._lock:
+            return {**self._stats, "series": len(self._series), "pending": len(self._pending)}
+
+    # ==========================================
+    # 내부 헬퍼 (self._lock 보유 상태에서 호출)
+    # ==========================================
+
+    def _apply_locked(
+        self,
+        stock_code: str,
+        seconds: int,
+        series: _Series,
+        timestamp: datetime,
+        price: int,
+        acc: int,
+        volume: int,
+        order: Tuple[datetime, int],
+    ) -> None:
+        start = _bar_start(timestamp, seconds)
+        if series.floor is not None and start < series.floor:
+            self._stats["late_dropped"] += 1
+            return
+
+        idx = bisect_left(series.starts, start)
+        if idx < len(series.starts) and series.starts[idx] == start:
+            state = series.bars[start]
+            state.add(price, acc, volume, order)
+            if state.closed:
+                # 완성 후 도착한 틱: 해당 봉 + 거래량 기준이 바뀌는 다음 봉 보정
+                self._stats["late_ticks"] += 1
+                self._emit_locked(stock_code, seconds, series, idx)
+                self._emit_next_locked(stock_code, seconds, series, idx)
+            return
+
+        state = _BarState(start, _bar_end(start, seconds))
+        state.add(price, acc, volume, order)
+        series.starts.insert(idx, start)
+        series.bars[start] = state
+
+        if idx == len(series.starts) - 1:
+            # 새 봉 시작: 이전 봉 즉시 완성
+            if idx > 0:
+                previous = series.bars[series.starts[idx - 1]]
+                if not previous.closed:
+                    previous.closed = True
+                    self._emit_locked(stock_code, seconds, series, idx - 1)
+        else:
+            # 이미 지나간 구간의 첫 틱 (순서 뒤바뀜): 바로 완성 처리
+            self._stats["late_ticks"] += 1
+            state.closed = True
+            self._emit_locked(stock_code, seconds, series, idx)
+            self._emit_next_locked(stock_code, seconds, series, idx)
+
+        self._trim_locked(series)
+
+    def _emit_next_locked(self, stock_code: str, seconds: int, series: _Series, idx: int) -> None:
+        if idx + 1 < len(series.starts) and series.bars[series.starts[idx + 1]].closed:
+            self._emit_locked(stock_code, seconds, series, idx + 1)
+
+    def _emit_locked(self, stock_code: str, seconds: int, series: _Series, idx: int) -> None:
+        """완성 봉 발행 (대기열 + 조회 이력), 시작 구간이 잘린 봉/REST 확정 봉 제외"""
+        state = series.bars[series.starts[idx]]
+        if state.reconciled:
+            return
+        if not self._is_complete(series, idx):
+            if state.emitted == 0:
+                self._stats["partial_skipped"] += 1
+            return
+
+        bar = Bar(
+            stock_code=stock_code,
+            seconds=seconds,
+            start=state.start,
+            open_price=state.open,
+            high_price=state.high,
+            low_price=state.low,
+            close_price=state.close,
+            volume=self._volume(series, idx),
+            tick_count=state.tick_count,
+            revision=state.emitted,
+        )
+        if state.emitted:
+            self._stats["corrections"] += 1
+        else:
+            self._stats["bars"] += 1
+        state.emitted += 1
+
+        key = (stock_code, seconds, state.start)
+        self._pending.pop(key, None)
+        self._pending[key] = bar
+        self._remember_locked(bar)
+
+    def _remember_locked(self, bar: Bar) -> None:
+        history = self._history.setdefault((bar.stock_code, bar.seconds), OrderedDict())
+        history[bar.start] = bar
+        while len(history) > self._history_size:
+            history.popitem(last=False)
+
+    def _is_complete(self, series: _Series, idx: int) -> bool:
+        """봉 시작부터 체결을 관측했는지 (집계 시작 직후의 첫 봉은 일부 구간만 보유)"""
+        if idx > 0 or series.floor is not None:
+            return True
+        state = series.bars[series.starts[idx]]
+        # 당일 첫 체결(누적거래량 = 체결수량)부터 받은 경우만 완전
+        return state.base_acc == 0
+
+    def _volume(self, series: _Series, idx: int) -> int:
+        """봉 거래량 = 봉 최대 누적거래량 - 직전 봉 최대 누적거래량"""
+        state = series.bars[series.starts[idx]]
+        if state.max_acc <= 0:
+            return state.volume_sum
+        previous_acc = series.baseline_acc
+        if idx > 0:
+            previous_acc = series.bars[series.starts[idx - 1]].max_acc
+        if previous_acc <= 0:
+            previous_acc = state.base_acc or 0
+        return max(0, state.max_acc - previous_acc)
+
+    def _trim_locked(self, series: _Series) -> None:
+        """보관 한도 초과한 완성 봉 정리 (거래량 기준 누적거래량은 유지)"""
+        while len(series.starts) > self._retain_bars + 1:
+            oldest = series.bars[series.starts[0]]
+            if not oldest.closed:
+                break
+            del series.bars[series.starts.pop(0)]
+            if oldest.max_acc > 0:
+                series.baseline_acc = oldest.max_acc
+            series.floor = oldest.end
+
+
+def _session_anchor(timestamp: datetime) -> datetime:
+    return datetime.combine(timestamp.date(), SESSION_START)
+
+
+def _bar_start(timestamp: datetime, seconds: int) -> datetime:
+    """장 시작(09:00) 기준으로 정렬한 봉 시작 시각"""
+    anchor = _session_anchor(timestamp)
+    elapsed = int((timestamp - anchor).total_seconds())
+    return anchor + timedelta(seconds=elapsed - elapsed % seconds)
+
+
+def _bar_end(start: datetime, seconds: int) -> datetime:
+    """봉 종료 시각 (장 종료 경계에서 잘림)"""
+    return min(start + timedelta(seconds=seconds), datetime.combine(start.date(), SESSION_END))
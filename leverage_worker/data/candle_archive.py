@@ -0,0 +1,442 @@
+"""
+분봉 Parquet 아카이브 모듈
+
+마감된 거래일 분봉을 SQLite(minute_candles)에서 컬럼형 Parquet으로 이관
+- 파티션: <root>/<종목코드>/<YYYY>/<YYYYMM>.parquet (월 단위 파일, zstd)
+- 컬럼: timestamp(봉 시작, timestamp[s]), open, high, low, close, volume
+  (candles_to_dataframe와 같은 컬럼 → ML 학습에 바로 사용)
+- MinuteCandleReader: 아카이브 + SQLite(hot) 구간을 합쳐 Arrow/numpy로 조회
+- archive_minute_candles: 보관 기간이 지난 분봉을 아카이브로 옮기고 SQLite에서 삭제
+"""
+
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from leverage_worker.data.database import Database
+from leverage_worker.data.minute_candle_repository import MinuteCandle
+from leverage_worker.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 장중 SQLite 최소 보관 기간 (전략 히스토리 500봉 ≈ 2거래일 + 주말/휴일 여유)
+MIN_MINUTE_HOT_DAYS = 7
+
+ARCHIVE_SCHEMA = pa.schema([
+    ("timestamp", pa.timestamp("s")),
+    ("open", pa.float64()),
+    ("high", pa.float64()),
+    ("low", pa.float64()),
+    ("close", pa.float64()),
+    ("volume", pa.int64()),
+])
+
+
+def _iter_months(start_date: str, end_date: str) -> Iterator[str]:
+    """YYYYMMDD 구간에 걸친 YYYYMM 목록"""
+    year, month = int(start_date[:4]), int(start_date[4:6])
+    end = (int(end_date[:4]), int(end_date[4:6]))
+    while (year, month) <= end:
+        yield f"{year:04d}{month:02d}"
+        month += 1
+        if month > 12:
+            year, month = year + 1, 1
+
+
+def _date_bounds(start_date: str, end_date: str) -> Tuple[np.datetime64, np.datetime64]:
+    """YYYYMMDD 구간 → [시작일 00:00, 종료일+1 00:00) 초 단위 경계"""
+    start = np.datetime64(f"{start_date[:4]}-{start_date[4:6]}-{start_date[6:]}", "s")
+    end = np.datetime64(f"{end_date[:4]}-{end_date[4:6]}-{end_date[6:]}", "s")
+    return start, end + np.timedelta64(1, "D")
+
+
+def trade_dates_of(timestamps: np.ndarray) -> np.ndarray:
+    """봉 시작 시각 배열 → 거래일 정수 배열 (YYYYMMDD)"""
+    days = timestamps.astype("datetime64[D]")
+    years = days.astype("datetime64[Y]").astype(np.int64) + 1970
+    months = days.astype("datetime64[M]").astype(np.int64) % 12 + 1
+    dom = (days - days.astype("datetime64[M]")).astype(np.int64) + 1
+    return (years * 10000 + months * 100 + dom).astype(np.int32)
+
+
+def rows_to_table(rows: Sequence[Sequence]) -> pa.Table:
+    """
+    (candle_datetime, open, high, low, close, volume) 행 → 아카이브 스키마 Table
+
+    candle_datetime은 "YYYY-MM-DD HH:MM" 문자열
+    """
+    if not rows:
+        return ARCHIVE_SCHEMA.empty_table()
+    columns = list(zip(*rows))
+    timestamps = np.array(columns[0], dtype="datetime64[m]").astype("datetime64[s]")
+    return pa.table(
+        [
+            pa.array(timestamps, type=pa.timestamp("s")),
+            pa.array(columns[1], type=pa.float64()),
+            pa.array(columns[2], type=pa.float64()),
+            pa.array(columns[3], type=pa.float64()),
+            pa.array(columns[4], type=pa.float64()),
+            pa.array([v or 0 for v in columns[5]], type=pa.int64()),
+        ],
+        schema=ARCHIVE_SCHEMA,
+    )
+
+
+def _merge(base: pa.Table, newer: pa.Table) -> pa.Table:
+    """두 Table 병합 (같은 timestamp는 newer 우선), timestamp 오름차순"""
+    if base.num_rows == 0:
+        merged = newer
+    elif newer.num_rows == 0:
+        merged = base
+    else:
+        keep = pc.invert(pc.is_in(base["timestamp"], value_set=newer["timestamp"]))
+        merged = pa.concat_tables([base.filter(keep), newer])
+    return merged.sort_by("timestamp")
+
+
+class MinuteCandleArchive:
+    """
+    분봉 Parquet 아카이브 (종목/연/월 파티션)
+
+    사용 예:
+        archive = MinuteCandleArchive()
+        table = archive.read("122630", "20250101", "20250630")
+    """
+
+    DEFAULT_ROOT = Path(__file__).parent / "minute_archive"
+
+    def __init__(self, root: Optional[Path] = None):
+        """
+        Args:
+            root: 아카이브 루트 디렉토리. None이면 기본 경로 사용
+        """
+        self._root = Path(root) if root is not None else self.DEFAULT_ROOT
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def _month_path(self, stock_code: str, month: str) -> Path:
+        return self._root / stock_code / month[:4] / f"{month}.parquet"
+
+    def stock_codes(self) -> List[str]:
+        """아카이브된 종목코드 목록"""
+        if not self._root.exists():
+            return []
+        return sorted(p.name for p in self._root.iterdir() if p.is_dir())
+
+    def months(self, stock_code: str) -> List[str]:
+        """종목의 아카이브 월 목록 (YYYYMM 오름차순)"""
+        base = self._root / stock_code
+        if not base.exists():
+            return []
+        return sorted(p.stem for p in base.glob("*/*.parquet"))
+
+    # ==========================================
+    # 쓰기
+    # ==========================================
+
+    def write(self, stock_code: str, table: pa.Table) -> int:
+        """
+        분봉 Table을 월 파일에 병합 저장 (같은 봉은 새 값으로 대체)
+
+        월 파일 전체를 임시 파일에 다시 쓰고 교체 (중단 시에도 기존 파일 유지)
+
+        Returns:
+            저장한 행 수
+        """
+        if table.num_rows == 0:
+            return 0
+        table = table.cast(ARCHIVE_SCHEMA)
+        months = pc.strftime(table["timestamp"], format="%Y%m")
+
+        for month in pc.unique(months).to_pylist():
+            part = table.filter(pc.equal(months, month))
+            path = self._month_path(stock_code, month)
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            existing = pq.read_table(path) if path.exists() else ARCHIVE_SCHEMA.empty_table()
+            merged = _merge(existing.cast(ARCHIVE_SCHEMA), part)
+
+            tmp_path = path.with_suffix(".parquet.tmp")
+            pq.write_table(merged, tmp_path, compression="zstd")
+            os.replace(tmp_path, path)
+
+        return table.num_rows
+
+    # ==========================================
+    # 읽기
+    # ==========================================
+
+    def read(
+        self,
+        stock_code: str,
+        start_date: str,
+        end_date: str,
+        columns: Optional[List[str]] = None,
+    ) -> pa.Table:
+        """
+        거래일 구간 분봉 조회
+
+        Args:
+            stock_code: 종목코드
+            start_date: 시작일 (YYYYMMDD, 포함)
+            end_date: 종료일 (YYYYMMDD, 포함)
+            columns: 조회 컬럼 (None이면 전체, timestamp는 항상 포함)
+
+        Returns:
+            timestamp 오름차순 Table
+        """
+        if columns is not None and "timestamp" not in columns:
+            columns = ["timestamp", *columns]
+        schema = ARCHIVE_SCHEMA if columns is None else pa.schema(
+            [ARCHIVE_SCHEMA.field(c) for c in columns]
+        )
+
+        parts = [
+            pq.read_table(path, columns=columns)
+            for month in _iter_months(start_date, end_date)
+            for path in [self._month_path(stock_code, month)]
+            if path.exists()
+        ]
+        if not parts:
+            return schema.empty_table()
+
+        # Parquet은 timestamp[s]를 ms 단위로 저장 → 스키마로 복원
+        table = pa.concat_tables(parts).cast(schema)
+        start, end = _date_bounds(start_date, end_date)
+        mask = pc.and_(
+            pc.greater_equal(table["timestamp"], pa.scalar(start, pa.timestamp("s"))),
+            pc.less(table["timestamp"], pa.scalar(end, pa.timestamp("s"))),
+        )
+        return table.filter(mask)
+
+    def read_month(self, stock_code: str, month: str) -> pa.Table:
+        """월 파일 전체 조회 (YYYYMM, 없으면 빈 Table)"""
+        path = self._month_path(stock_code, month)
+        if not path.exists():
+            return ARCHIVE_SCHEMA.empty_table()
+        return pq.read_table(path).cast(ARCHIVE_SCHEMA)
+
+    def get_day_counts(self, stock_code: str, start_date: str, end_date: str) -> Dict[str, int]:
+        """거래일별 분봉 개수 {YYYYMMDD: 개수}"""
+        table = self.read(stock_code, start_date, end_date, columns=["timestamp"])
+        ts = table["timestamp"].to_numpy()
+        dates, counts = np.unique(trade_dates_of(ts), return_counts=True)
+        return {str(d): int(c) for d, c in zip(dates, counts)}
+
+    def get_date_range(self, stock_code: str) -> Optional[Tuple[str, str]]:
+        """아카이브 기간 (시작일, 종료일)"""
+        months = self.months(stock_code)
+        if not months:
+            return None
+        first = pq.read_table(self._month_path(stock_code, months[0]), columns=["timestamp"])
+        last = pq.read_table(self._month_path(stock_code, months[-1]), columns=["timestamp"])
+        lo = trade_dates_of(first["timestamp"].to_numpy().astype("datetime64[s]")).min()
+        hi = trade_dates_of(last["timestamp"].to_numpy().astype("datetime64[s]")).max()
+        return (str(lo), str(hi))
+
+
+class MinuteCandleReader:
+    """
+    분봉 통합 조회 (Parquet 아카이브 + SQLite hot 테이블)
+
+    같은 봉이 양쪽에 있으면 SQLite 값 우선 (재수집 반영)
+
+    사용 예:
+        reader = MinuteCandleReader(MarketDataDB(), MinuteCandleArchive())
+        arrays = reader.read_arrays("122630", "20250101", "20251231")
+        arrays["close"]  # np.ndarray
+    """
+
+    def __init__(self, db: Database, archive: Optional[MinuteCandleArchive] = None):
+        """
+        Args:
+            db: 시세 DB (minute_candles 테이블)
+            archive: Parquet 아카이브 (None이면 SQLite만 조회)
+        """
+        self._db = db
+        self._archive = archive
+
+    @property
+    def archive(self) -> Optional[MinuteCandleArchive]:
+        return self._archive
+
+    def _read_hot(self, stock_code: str, start_date: str, end_date: str) -> pa.Table:
+        rows = self._db.fetch_all(
+            """
+            SELECT candle_datetime, open_price, high_price, low_price, close_price, volume
+            FROM minute_candles
+            WHERE stock_code = ? AND trade_date BETWEEN ? AND ?
+            ORDER BY candle_datetime
+            """,
+            (stock_code, start_date, end_date),
+        )
+        return rows_to_table([tuple(row) for row in rows])
+
+    def read_table(self, stock_code: str, start_date: str, end_date: str) -> pa.Table:
+        """
+        거래일 구간 분봉 Arrow Table (timestamp, open, high, low, close, volume)
+
+        Args:
+            stock_code: 종목코드
+            start_date: 시작일 (YYYYMMDD, 포함)
+            end_date: 종료일 (YYYYMMDD, 포함)
+        """
+        hot = self._read_hot(stock_code, start_date, end_date)
+        if self._archive is None:
+            return hot
+        cold = self._archive.read(stock_code, start_date, end_date)
+        return _merge(cold, hot)
+
+    def read_arrays(self, stock_code: str, start_date: str, end_date: str) -> Dict[str, np.ndarray]:
+        """
+        거래일 구간 분봉 numpy 배열
+
+        Returns:
+            {"timestamp": datetime64[s], "trade_date": int32 (YYYYMMDD),
+             "open"/"high"/"low"/"close": float64, "volume": int64}
+        """
+        table = self.read_table(stock_code, start_date, end_date)
+        arrays = {name: table[name].to_numpy() for name in table.column_names}
+        arrays["trade_date"] = trade_dates_of(arrays["timestamp"])
+        return arrays
+
+    def read_dataframe(self, stock_code: str, start_date: str, end_date: str):
+        """candles_to_dataframe와 같은 형식의 DataFrame (ML 학습용)"""
+        return self.read_table(stock_code, start_date, end_date).to_pandas()
+
+    def read_candles(self, stock_code: str, start_date: str, end_date: str) -> List[MinuteCandle]:
+        """MinuteCandle 리스트 (기존 전략/백테스트 코드 호환)"""
+        return self.table_to_candles(stock_code, self.read_table(stock_code, start_date, end_date))
+
+    @staticmethod
+    def table_to_candles(stock_code: str, table: pa.Table) -> List[MinuteCandle]:
+        """아카이브 스키마 Table → MinuteCandle 리스트"""
+        if table.num_rows == 0:
+            return []
+        timestamps = table["timestamp"].to_numpy()
+        stamps = np.char.replace(np.datetime_as_string(timestamps, unit="m"), "T", " ")
+        return [
+            MinuteCandle(
+                stock_code=stock_code,
+                candle_datetime=stamp,
+                trade_date=str(trade_date),
+                open_price=o,
+                high_price=h,
+                low_price=l,
+                close_price=c,
+                volume=v,
+            )
+            for stamp, trade_date, o, h, l, c, v in zip(
+                stamps.tolist(), trade_dates_of(timestamps).tolist(),
+                table["open"].to_pylist(), table["high"].to_pylist(),
+                table["low"].to_pylist(), table["close"].to_pylist(),
+                table["volume"].to_pylist(),
+            )
+        ]
+
+    def get_day_counts(self, stock_code: str, start_date: str, end_date: str) -> Dict[str, int]:
+        """거래일별 분봉 개수 (아카이브 + SQLite)"""
+        ts = self.read_table(stock_code, start_date, end_date)["timestamp"].to_numpy()
+        dates, counts = np.unique(trade_dates_of(ts), return_counts=True)
+        return {str(d): int(c) for d, c in zip(dates, counts)}
+
+    def get_date_range(self, stock_code: str) -> Optional[Tuple[str, str]]:
+        """데이터 기간 (아카이브 + SQLite)"""
+        row = self._db.fetch_one(
+            "SELECT MIN(trade_date), MAX(trade_date) FROM minute_candles WHERE stock_code = ?",
+            (stock_code,),
+        )
+        ranges = [(row[0], row[1])] if row and row[0] else []
+        if self._archive is not None:
+            cold = self._archive.get_date_range(stock_code)
+            if cold:
+                ranges.append(cold)
+        if not ranges:
+            return None
+        return (min(r[0] for r in ranges), max(r[1] for r in ranges))
+
+
+def archive_minute_candles(
+    db: Database,
+    archive: MinuteCandleArchive,
+    keep_days: int = 30,
+    today: Optional[datetime] = None,
+    stock_codes: Optional[Sequence[str]] = None,
+    vacuum: bool = False,
+) -> Dict[str, int]:
+    """
+    보관 기간이 지난 분봉을 아카이브로 옮기고 SQLite에서 삭제
+
+    - 대상: trade_date < (오늘 - keep_days) 인 마감 거래일
+    - 아카이브 쓰기 후 거래일별 개수가 SQLite 이상인지 확인한 다음 삭제
+    - 확인 실패 종목은 삭제하지 않음 (다음 실행 시 재시도)
+
+    Args:
+        db: 시세 DB
+        archive: Parquet 아카이브
+        keep_days: SQLite에 남길 기간 (달력 일수, 최소 1 → 당일 데이터는 항상 유지)
+        today: 기준일 (기본: 현재)
+        stock_codes: 대상 종목 (기본: minute_candles 전체 종목)
+        vacuum: 삭제 후 VACUUM 실행 여부
+
+    Returns:
+        {종목코드: 이관 행 수}
+    """
+    today = today or datetime.now()
+    cutoff = (today - timedelta(days=max(1, keep_days))).strftime("%Y%m%d")
+    if stock_codes is None:
+        rows = db.fetch_all(
+            "SELECT DISTINCT stock_code FROM minute_candles WHERE trade_date < ?", (cutoff,)
+        )
+        stock_codes = [row[0] for row in rows]
+
+    moved: Dict[str, int] = {}
+    for stock_code in stock_codes:
+        rows = db.fetch_all(
+            """
+            SELECT candle_datetime, open_price, high_price, low_price, close_price, volume
+            FROM minute_candles
+            WHERE stock_code = ? AND trade_date < ?
+            ORDER BY candle_datetime
+            """,
+            (stock_code, cutoff),
+        )
+        if not rows:
+            continue
+
+        table = rows_to_table([tuple(row) for row in rows])
+        archive.write(stock_code, table)
+
+        ts = table["timestamp"].to_numpy()
+        dates, counts = np.unique(trade_dates_of(ts), return_counts=True)
+        archived = archive.get_day_counts(stock_code, str(dates[0]), str(dates[-1]))
+        short = [str(d) for d, c in zip(dates, counts) if archived.get(str(d), 0) < c]
+        if short:
+            logger.error(
+                f"[archive] {stock_code} 아카이브 검증 실패 ({len(short)}일, 예: {short[0]}) "
+                f"- SQLite 삭제 생략"
+            )
+            continue
+
+        with db.get_cursor() as cursor:
+            cursor.execute(
+                "DELETE FROM minute_candles WHERE stock_code = ? AND trade_date < ?",
+                (stock_code, cutoff),
+            )
+        moved[stock_code] = len(rows)
+        logger.info(
+            f"[archive] {stock_code}: {len(rows):,} rows ({dates[0]} ~ {dates[-1]}) "
+            f"-> {archive.root}"
+        )
+
+    if moved and vacuum:
+        db.vacuum()
+    return moved
@@ -0,0 +1,436 @@
+"""
+분봉 메모리 저장소 모듈
+
+틱 처리 경로에서 SQLite 조회를 제거하기 위한 종목별 인메모리 분봉 버퍼
+- 시작 시 market_data.db에서 1회 적재 (seed)
+- REST 분봉 / WebSocket 체결로 증분 갱신
+- DB 반영은 백그라운드 writer 스레드에서 일괄 처리 (write-through)
+- 전략에는 복사 없는 읽기 전용 뷰(CandleView) 제공
+"""
+
+import queue
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Sequence
+from datetime import datetime
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from leverage_worker.data.minute_candle_repository import (
+    MinuteCandle,
+    MinuteCandleRepository,
+)
+from leverage_worker.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CandleView(Sequence):
+    """
+    분봉 리스트 읽기 전용 뷰
+
+    저장소 내부 리스트를 복사하지 않고 [start, stop) 구간만 노출.
+    생성 이후 저장소에 추가되는 분봉은 보이지 않음 (stop 고정).
+    슬라이싱 결과는 일반 list로 반환 (기존 price_history 사용처 호환).
+    """
+
+    __slots__ = ("_items", "_start", "_stop")
+
+    def __init__(self, items: List[MinuteCandle], start: int, stop: int):
+        self._items = items
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            return self._items[self._start + start:self._start + stop:step]
+
+        length = len(self)
+        if index < 0:
+            index += length
+        if index < 0 or index >= length:
+            raise IndexError("CandleView index out of range")
+        return self._items[self._start + index]
+
+    def __iter__(self):
+        return islice(self._items, self._start, self._stop)
+
+    def __repr__(self) -> str:
+        return f"CandleView(len={len(self)})"
+
+
+class _SymbolBuffer:
+    """종목별 분봉 버퍼 (candle_datetime 오름차순)"""
+
+    __slots__ = ("items", "keys")
+
+    def __init__(self):
+        self.items: List[MinuteCandle] = []
+        self.keys: List[str] = []
+
+
+class CandleStore:
+    """
+    종목별 인메모리 분봉 저장소
+
+    - seed(): DB에서 최근 N개 분봉 적재 (시작 시 1회)
+    - upsert_candles(): REST 분봉 반영 + DB 비동기 저장
+    - update_from_tick(): WebSocket 체결로 진행 중 분봉 갱신 (메모리 전용)
+    - get_recent(): 완성된 분봉 뷰 반환 (현재 미완성 봉 제외)
+
+    버퍼 교체 규칙:
+    - 진행 중인 분봉(현재 분 이후)은 제자리 교체
+    - 이미 완성된 분봉의 수정/중간 삽입은 새 리스트로 교체 (기존 뷰 불변 보장)
+    """
+
+    def __init__(
+        self,
+        repository: MinuteCandleRepository,
+        capacity: int = 600,
+        flush_interval: float = 1.0,
+    ):
+        """
+        Args:
+            repository: 분봉 저장소 (seed 및 write-through 대상)
+            capacity: 종목별 보관 분봉 수 (전략 조회 최대치 이상)
+            flush_interval: DB 일괄 저장 주기 (초)
+        """
+        self._repo = repository
+        self._capacity = capacity
+        self._flush_interval = flush_interval
+
+        self._buffers: Dict[str, _SymbolBuffer] = {}
+        self._lock = threading.Lock()
+
+        # write-through 큐 (writer 스레드에서 upsert_batch)
+        self._write_queue: "queue.Queue[MinuteCandle]" = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._running = False
+
+        logger.debug(f"CandleStore initialized (capacity={capacity})")
+
+    # ==========================================
+    # 적재 / 생명주기
+    # ==========================================
+
+    def seed(self, stock_codes: Iterable[str]) -> None:
+        """
+        DB에서 종목별 최근 분봉 적재 (시작 시 1회)
+
+        Args:
+            stock_codes: 적재할 종목코드 목록
+        """
+        for stock_code in stock_codes:
+            try:
+                candles = self._repo.get_recent(stock_code, count=self._capacity)
+                buffer = _SymbolBuffer()
+                buffer.items = list(candles)
+                buffer.keys = [c.candle_datetime for c in candles]
+                with self._lock:
+                    self._buffers[stock_code] = buffer
+                logger.info(f"CandleStore seeded: {stock_code} ({len(candles)} candles)")
+            except Exception as e:
+                logger.error(f"CandleStore seed failed [{stock_code}]: {e}")
+
+    def start(self) -> None:
+        """DB writer 스레드 시작"""
+        if self._running:
+            return
+
+        self._running = True
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop,
+            daemon=True,
+            name="CandleStoreWriterThread",
+        )
+        self._writer_thread.start()
+        logger.info("CandleStore writer started")
+
+    def stop(self) -> None:
+        """DB writer 스레드 중지 (대기 중인 분봉 모두 저장)"""
+        self._running = False
+        if self._writer_thread:
+            self._writer_thread.join(timeout=5)
+            self._writer_thread = None
+        # 스레드 종료 후 잔여분 동기 저장
+        self.flush()
+        logger.info("CandleStore writer stopped")
+
+    # ==========================================
+    # 갱신
+    # ==========================================
+
+    def upsert_candles(
+        self,
+        stock_code: str,
+        candles: Iterable[MinuteCandle],
+        persist: bool = True,
+    ) -> int:
+        """
+        분봉 반영 (REST 분봉 등)
+
+        DB upsert와 동일한 병합 규칙 적용:
+        시가 유지, 고가=max, 저가=min, 종가/거래량=신규값
+
+        Args:
+            stock_code: 종목코드
+            candles: MinuteCandle 목록 (순서 무관)
+            persist: True면 DB에 비동기 저장
+
+        Returns:
+            반영된 분봉 수
+        """
+        candles = list(candles)
+        now_key = _current_minute_key()
+
+        with self._lock:
+            buffer = self._buffers.setdefault(stock_code, _SymbolBuffer())
+            for candle in candles:
+                self._merge_locked(buffer, candle, now_key)
+            self._trim_locked(buffer)
+
+        if persist:
+            for candle in candles:
+                self._write_queue.put(candle)
+
+        return len(candles)
+
+    def update_from_tick(
+        self,
+        stock_code: str,
+        price: int,
+        volume: int,
+        timestamp: datetime,
+    ) -> None:
+        """
+        WebSocket 체결로 해당 분봉 갱신 (메모리 전용)
+
+        DB 저장은 REST 분봉(upsert_candles)이 담당하므로 여기서는 하지 않음.
+        시세 스냅샷(WS/멀티종목 현재가)은 volume=0으로 전달해 종가/고저만 갱신한다.
+
+        Args:
+            stock_code: 종목코드
+            price: 체결가
+            volume: 체결수량 (0이면 거래량 유지)
+            timestamp: 체결시간
+        """
+        if price <= 0:
+            return
+
+        # 장중 시간 필터 (09:00 ~ 15:30) - REST 분봉 저장 규칙과 동일
+        hour_min = timestamp.strftime("%H%M")
+        if not ("0900" <= hour_min <= "1530"):
+            return
+
+        candle_datetime = timestamp.strftime("%Y-%m-%d %H:%M")
+        now_key = _current_minute_key()
+
+        with self._lock:
+            buffer = self._buffers.setdefault(stock_code, _SymbolBuffer())
+            idx = bisect_left(buffer.keys, candle_datetime)
+
+            if idx < len(buffer.keys) and buffer.keys[idx] == candle_datetime:
+                existing = buffer.items[idx]
+                updated = MinuteCandle(
+                    stock_code=stock_code,
+                    candle_datetime=candle_datetime,
+                    trade_date=existing.trade_date,
+                    open_price=existing.open_price,
+                    high_price=max(existing.high_price, price),
+                    low_price=min(existing.low_price, price),
+                    close_price=price,
+                    volume=existing.volume + volume,
+                    created_at=existing.created_at,
+                    updated_at=timestamp,
+                )
+            else:
+                updated = MinuteCandle(
+                    stock_code=stock_code,
+                    candle_datetime=candle_datetime,
+                    trade_date=timestamp.strftime("%Y%m%d"),
+                    open_price=price,
+                    high_price=price,
+                    low_price=price,
+                    close_price=price,
+                    volume=volume,
+                    created_at=timestamp,
+                    updated_at=timestamp,
+                )
+
+            self._place_locked(buffer, idx, updated, now_key)
+            self._trim_locked(buffer)
+
+    # ==========================================
+    # 조회
+    # ==========================================
+
+    def get_recent(
+        self,
+        stock_code: str,
+        count: int = 500,
+        until_datetime: Optional[str] = None,
+    ) -> CandleView:
+        """
+        최근 N개 완성 분봉 뷰 (전략용)
+
+        MinuteCandleRepository.get_recent_prices()와 동일하게
+        until_datetime(기본: 현재 분) 이전 분봉만 포함 (미완성 봉 제외)
+
+        Args:
+            stock_code: 종목코드
+            count: 조회 개수
+            until_datetime: 이 시간 미만 데이터만 (YYYY-MM-DD HH:MM)
+
+        Returns:
+            CandleView (과거 → 최근 순)
+        """
+        if until_datetime is None:
+            until_datetime = _current_minute_key()
+
+        with self._lock:
+            buffer = self._buffers.get(stock_code)
+            if buffer is None:
+                return CandleView([], 0, 0)
+            items = buffer.items
+            stop = bisect_left(buffer.keys, until_datetime)
+
+        start = max(0, stop - count)
+        return CandleView(items, start, stop)
+
+    def get_latest(self, stock_code: str) -> Optional[MinuteCandle]:
+        """가장 최근 분봉 (미완성 봉 포함)"""
+        with self._lock:
+            buffer = self._buffers.get(stock_code)
+            if buffer is None or not buffer.items:
+                return None
+            return buffer.items[-1]
+
+    def get_count(self, stock_code: str) -> int:
+        """종목별 보관 분봉 수"""
+        with self._lock:
+            buffer = self._buffers.get(stock_code)
+            return len(buffer.items) if buffer else 0
+
+    def has(self, stock_code: str) -> bool:
+        """종목 버퍼 존재 여부"""
+        with self._lock:
+            return stock_code in self._buffers
+
+    # ==========================================
+    # DB write-through
+    # ==========================================
+
+    def flush(self) -> int:
+        """
+        대기 중인 분봉을 DB에 일괄 저장
+
+        같은 (종목, 분봉) 키는 마지막 값만 저장
+
+        Returns:
+            저장된 분봉 수
+        """
+        pending: Dict[Tuple[str, str], MinuteCandle] = {}
+        while True:
+            try:
+                candle = self._write_queue.get_nowait()
+            except queue.Empty:
+                break
+            pending[(candle.stock_code, candle.candle_datetime)] = candle
+
+        if not pending:
+            return 0
+
+        try:
+            return self._repo.upsert_batch(list(pending.values()), verbose=False)
+        except Exception as e:
+            logger.error(f"CandleStore flush failed ({len(pending)} candles): {e}")
+            return 0
+
+    def _writer_loop(self) -> None:
+        """writer 스레드 루프 (flush_interval마다 일괄 저장)"""
+        while self._running:
+            try:
+                time.sleep(self._flush_interval)
+                self.flush()
+            except Exception as e:
+                logger.error(f"CandleStore writer error: {e}")
+
+    # ==========================================
+    # 내부 헬퍼 (self._lock 보유 상태에서 호출)
+    # ==========================================
+
+    def _merge_locked(
+        self, buffer: _SymbolBuffer, candle: MinuteCandle, now_key: str
+    ) -> None:
+        """DB upsert 규칙으로 분봉 병합"""
+        idx = bisect_left(buffer.keys, candle.candle_datetime)
+
+        if idx < len(buffer.keys) and buffer.keys[idx] == candle.candle_datetime:
+            existing = buffer.items[idx]
+            merged = MinuteCandle(
+                stock_code=candle.stock_code,
+                candle_datetime=candle.candle_datetime,
+                trade_date=existing.trade_date,
+                open_price=existing.open_price,
+                high_price=max(existing.high_price, candle.high_price),
+                low_price=min(existing.low_price, candle.low_price),
+                close_price=candle.close_price,
+                volume=candle.volume,
+                created_at=existing.created_at,
+                updated_at=candle.updated_at,
+            )
+            if (
+                merged.high_price == existing.high_price
+                and merged.low_price == existing.low_price
+                and merged.close_price == existing.close_price
+                and merged.volume == existing.volume
+            ):
+                return  # 변경 없음
+            candle = merged
+
+        self._place_locked(buffer, idx, candle, now_key)
+
+    def _place_locked(
+        self, buffer: _SymbolBuffer, idx: int, candle: MinuteCandle, now_key: str
+    ) -> None:
+        """분봉 배치 (append / 제자리 교체 / copy-on-write)"""
+        key = candle.candle_datetime
+        exists = idx < len(buffer.keys) and buffer.keys[idx] == key
+
+        if not exists and idx == len(buffer.keys):
+            # 끝에 추가: 기존 뷰의 stop은 고정이므로 영향 없음
+            buffer.items.append(candle)
+            buffer.keys.append(key)
+            return
+
+        if exists and key >= now_key:
+            # 진행 중인 분봉: 어떤 뷰에도 포함되지 않으므로 제자리 교체
+            buffer.items[idx] = candle
+            return
+
+        # 완성 분봉 수정 또는 중간 삽입: 새 리스트로 교체
+        items = list(buffer.items)
+        keys = list(buffer.keys)
+        if exists:
+            items[idx] = candle
+        else:
+            items.insert(idx, candle)
+            keys.insert(idx, key)
+        buffer.items = items
+        buffer.keys = keys
+
+    def _trim_locked(self, buffer: _SymbolBuffer) -> None:
+        """용량 2배 초과 시 오래된 분봉 정리 (새 리스트로 교체)"""
+        if len(buffer.items) > self._capacity * 2:
+            buffer.items = buffer.items[-self._capacity:]
+            buffer.keys = buffer.keys[-self._capacity:]
+
+
+def _current_minute_key() -> str:
+    """현재 분봉 datetime 문자열 (YYYY-MM-DD HH:MM)"""
+    return datetime.now().strftime("%Y-%m-%d %H:%M")
@@ -13,34 +13,351 @@ SQLite 데이터베이스 연결 및 테이블 관리
 - 주문 기록 (orders)
 - 포지션 (positions)
 - 일일 거래 요약 (daily_summary)
+
+연결 모드:
+- 단일 writer 모드 (기본): 모든 쓰기는 전용 writer 스레드가 큐에서 모아
+  한 트랜잭션으로 그룹 커밋 (작업 단위별 SAVEPOINT), 읽기는 스레드별
+  읽기 전용 연결 (WAL → writer와 서로 대기하지 않음)
+- 레거시 모드 (single_writer=False): 스레드별 읽기/쓰기 연결
+- 공통 PRAGMA: journal_mode=WAL, synchronous=NORMAL, temp_store=MEMORY,
+  mmap_size, cache_size, busy_timeout (+ prepared statement 캐시)
 """
 
+import queue
 import sqlite3
 import threading
+import weakref
+from concurrent.futures import Future
 from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Generator
+from typing import Any, Callable, Dict, Generator, List, Optional
 
 from leverage_worker.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def _open_connection(
+    db_path: Path,
+    pragmas: Dict[str, Any],
+    statement_cache: int,
+    readonly: bool = False,
+) -> sqlite3.Connection:
+    """PRAGMA 적용된 SQLite 연결 생성"""
+    if readonly:
+        conn = sqlite3.connect(
+            f"{db_path.resolve().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            cached_statements=statement_cache,
+        )
+    else:
+        conn = sqlite3.connect(
+            str(db_path),
+            check_same_thread=False,
+            timeout=pragmas["busy_timeout"] / 1000,
+            cached_statements=statement_cache,
+        )
+    # Row를 dict처럼 접근 가능하게
+    conn.row_factory = sqlite3.Row
+    for name, value in pragmas.items():
+        # journal_mode는 파일에 기록되는 설정 → 쓰기 연결에서만
+        if readonly and name in ("journal_mode", "synchronous"):
+            continue
+        conn.execute(f"PRAGMA {name}={value}")
+    return conn
+
+
+# ==========================================
+# 단일 writer 스레드
+# ==========================================
+
+@dataclass
+class _WriteUnit:
+    """writer 큐 작업 단위 (fn(conn) 결과를 커밋 후 future로 전달)"""
+
+    fn: Callable[[sqlite3.Connection], Any]
+    future: Future
+    transactional: bool = True
+
+
+class _LeaseAborted(Exception):
+    """임대 블록 예외/시간 초과 → writer 쪽 SAVEPOINT 롤백 신호"""
+
+
+class LeaseExpiredError(sqlite3.OperationalError):
+    """get_cursor 블록이 임대 시간을 넘겨 writer가 회수 (블록의 쓰기는 롤백됨)"""
+
+
+class _Lease:
+    """
+    writer 연결 임대 (get_cursor 블록을 writer 트랜잭션 안에서 실행)
+
+    writer 스레드는 SAVEPOINT를 연 뒤 호출 스레드가 블록을 끝낼 때까지 대기.
+    timeout 초과 시 SAVEPOINT를 롤백하고 다음 작업으로 진행하며, 이후 호출 스레드의
+    연결 사용은 LeaseExpiredError (진행 중인 쿼리는 끝날 때까지 기다린 뒤 회수)
+    """
+
+    def __init__(self, timeout: float):
+        self.conn: Optional[sqlite3.Connection] = None
+        self.acquired = threading.Event()
+        self.released = threading.Event()
+        self.failed = False
+        self.expired = False
+        self.lock = threading.Lock()
+        self._timeout = timeout
+
+    def __call__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+        self.acquired.set()
+        if not self.released.wait(self._timeout):
+            with self.lock:
+                self.expired = not self.released.is_set()
+        if self.expired:
+            logger.error(f"Database lease expired after {self._timeout:.1f}s → rolled back")
+            raise _LeaseAborted("lease expired")
+        if self.failed:
+            raise _LeaseAborted()
+
+    def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """호출 스레드의 연결 사용 (회수된 뒤에는 거부)"""
+        with self.lock:
+            if self.expired:
+                raise LeaseExpiredError(f"Database lease expired after {self._timeout:.1f}s")
+            return fn(*args, **kwargs)
+
+
+class _LeasedCursor:
+    """임대 연결 커서 (모든 메서드 호출을 임대 유효 구간으로 제한)"""
+
+    def __init__(self, lease: _Lease, cursor: sqlite3.Cursor):
+        self._lease = lease
+        self._cursor = cursor
+
+    @property
+    def connection(self) -> "_LeasedConnection":
+        return _LeasedConnection(self._lease)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._cursor, name)
+        if not callable(attr):
+            return attr
+        return lambda *args, **kwargs: self._wrap(self._lease.run(attr, *args, **kwargs))
+
+    def _wrap(self, result: Any) -> Any:
+        return self if result is self._cursor else result
+
+    def __iter__(self):
+        return iter(self.fetchall())
+
+
+class _LeasedConnection:
+    """임대 writer 연결 (호출 스레드용, 커서도 임대 유효 구간으로 제한)"""
+
+    def __init__(self, lease: _Lease):
+        self._lease = lease
+
+    def cursor(self) -> _LeasedCursor:
+        return _LeasedCursor(self._lease, self._lease.run(self._lease.conn.cursor))
+
+    def execute(self, sql: str, parameters: Any = ()) -> _LeasedCursor:
+        return _LeasedCursor(self._lease, self._lease.run(self._lease.conn.execute, sql, parameters))
+
+    def executemany(self, sql: str, parameters: Any) -> _LeasedCursor:
+        return _LeasedCursor(
+            self._lease, self._lease.run(self._lease.conn.executemany, sql, parameters)
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._lease.conn, name)
+        if not callable(attr):
+            return attr
+        return lambda *args, **kwargs: self._lease.run(attr, *args, **kwargs)
+
+
+class _DBWriter:
+    """
+    DB 전용 writer 스레드
+
+    - 큐에 쌓인 작업을 최대 max_batch개씩 꺼내 한 트랜잭션으로 그룹 커밋
+    - 작업 단위마다 SAVEPOINT → 실패한 작업만 롤백, 나머지는 커밋
+    - future는 COMMIT 이후 완료 (완료 시점에 읽기 연결에서 조회 가능)
+    """
+
+    def __init__(self, connect: Callable[[], sqlite3.Connection], name: str, max_batch: int):
+        self._connect = connect
+        self._max_batch = max_batch
+        self._queue: "queue.Queue[Optional[_WriteUnit]]" = queue.Queue()
+        self._stopped = False
+        self._stop_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    @property
+    def thread(self) -> threading.Thread:
+        return self._thread
+
+    def submit(
+        self,
+        fn: Callable[[sqlite3.Connection], Any],
+        transactional: bool = True,
+    ) -> Future:
+        """작업 등록 (완료/예외는 future로 전달)"""
+        future: Future = Future()
+        with self._stop_lock:
+            if self._stopped:
+                raise RuntimeError("Database writer is stopped")
+            self._queue.put(_WriteUnit(fn, future, transactional))
+        return future
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """대기 중인 작업 처리 후 종료"""
+        with self._stop_lock:
+            if self._stopped:
+                return
+            self._stopped = True
+            self._queue.put(None)
+        if threading.current_thread() is not self._thread:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        try:
+            conn = self._connect()
+            # 트랜잭션은 직접 관리 (BEGIN IMMEDIATE / SAVEPOINT / COMMIT)
+            conn.isolation_level = None
+        except Exception as e:
+            logger.error(f"Database writer connect failed: {e}")
+            self._fail_pending(e)
+            return
+
+        running = True
+        while running:
+            unit = self._queue.get()
+            if unit is None:
+                break
+            batch = [unit]
+            while len(batch) < self._max_batch:
+                try:
+                    unit = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if unit is None:
+                    running = False
+                    break
+                batch.append(unit)
+            self._process(conn, batch)
+
+        conn.close()
+
+    def _fail_pending(self, error: BaseException) -> None:
+        with self._stop_lock:
+            self._stopped = True
+        while True:
+            try:
+                unit = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if unit is not None and unit.future.set_running_or_notify_cancel():
+                unit.future.set_exception(error)
+
+    def _process(self, conn: sqlite3.Connection, batch: List[_WriteUnit]) -> None:
+        """트랜잭션 작업은 그룹 커밋, 비트랜잭션 작업(VACUUM 등)은 단독 실행"""
+        group: List[_WriteUnit] = []
+        for unit in batch:
+            if unit.transactional:
+                group.append(unit)
+                continue
+            self._commit_group(conn, group)
+            group = []
+            if unit.future.set_running_or_notify_cancel():
+                try:
+                    unit.future.set_result(unit.fn(conn))
+                except BaseException as e:
+                    unit.future.set_exception(e)
+        self._commit_group(conn, group)
+
+    def _commit_group(self, conn: sqlite3.Connection, group: List[_WriteUnit]) -> None:
+        if not group:
+            return
+        done: List[tuple] = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+        except Exception as e:
+            logger.error(f"Database writer BEGIN failed: {e}")
+            for unit in group:
+                if unit.future.set_running_or_notify_cancel():
+                    unit.future.set_exception(e)
+            return
+
+        for unit in group:
+            if not unit.future.set_running_or_notify_cancel():
+                continue
+            conn.execute("SAVEPOINT unit")
+            try:
+                result = unit.fn(conn)
+            except BaseException as e:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK TO unit")
+                    conn.execute("RELEASE unit")
+                else:
+                    # SQLite가 트랜잭션 전체를 롤백한 경우 → 앞선 작업도 실패 처리
+                    for prev, _ in done:
+                        prev.future.set_exception(e)
+                    done = []
+                    conn.execute("BEGIN IMMEDIATE")
+                unit.future.set_exception(e)
+                continue
+            conn.execute("RELEASE unit")
+            done.append((unit, result))
+
+        try:
+            conn.execute("COMMIT")
+        except Exception as e:
+            logger.error(f"Database writer COMMIT failed: {e}")
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            for unit, _ in done:
+                unit.future.set_exception(e)
+            return
+
+        for unit, result in done:
+            unit.future.set_result(result)
+
+
+# ==========================================
+# Database
+# ==========================================
+
 class Database:
     """
     SQLite 데이터베이스 관리 베이스 클래스
 
-    - 연결 풀링 (스레드별 연결)
-    - 트랜잭션 관리
+    - 단일 writer 스레드 + 그룹 커밋 (기본) / 스레드별 연결 (레거시)
+    - 읽기: 스레드별 읽기 전용 연결 (WAL 스냅샷 읽기)
+    - 트랜잭션 관리 (get_cursor 블록 = 하나의 원자적 작업)
     """
 
-    def __init__(self, db_path: Path):
+    # 연결 PRAGMA (서브클래스에서 데이터 규모에 맞게 조정)
+    CACHE_SIZE_KB = 16 * 1024
+    MMAP_SIZE = 64 * 1024 * 1024
+    BUSY_TIMEOUT_MS = 30_000
+    STATEMENT_CACHE_SIZE = 256
+
+    # writer 그룹 커밋 최대 작업 수
+    WRITER_MAX_BATCH = 256
+    # get_cursor 블록의 writer 연결 최대 점유 시간 (초과 시 롤백 후 writer 재개)
+    LEASE_TIMEOUT_SECONDS = 10.0
+
+    def __init__(self, db_path: Path, single_writer: bool = True):
         """
         Args:
             db_path: DB 파일 경로
+            single_writer: 전용 writer 스레드로 쓰기 직렬화 (False면 스레드별 연결)
         """
         self._db_path = db_path
+        self._single_writer = single_writer
 
         # 스레드별 연결 저장
         self._local = threading.local()
@@ -49,26 +366,129 @@ class Database:
         # DB 디렉토리 생성
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
 
+        self._writer: Optional[_DBWriter] = None
+        if single_writer:
+            self._writer = _DBWriter(
+                self._make_connector(readonly=False),
+                name=f"db-writer-{self._db_path.stem}",
+                max_batch=self.WRITER_MAX_BATCH,
+            )
+            # GC/인터프리터 종료 시 대기 중인 쓰기 처리 후 종료
+            self._finalizer = weakref.finalize(self, self._writer.stop)
+
         # 테이블 초기화 (서브클래스에서 구현)
         self._init_tables()
 
-        logger.info(f"Database initialized: {self._db_path}")
+        logger.info(
+            f"Database initialized: {self._db_path} "
+            f"({'single writer' if single_writer else 'per-thread'})"
+        )
+
+    @property
+    def single_writer(self) -> bool:
+        return self._single_writer
+
+    def _pragmas(self) -> Dict[str, Any]:
+        return {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "temp_store": "MEMORY",
+            "mmap_size": self.MMAP_SIZE,
+            "cache_size": -self.CACHE_SIZE_KB,
+            "busy_timeout": self.BUSY_TIMEOUT_MS,
+        }
+
+    def _make_connector(self, readonly: bool) -> Callable[[], sqlite3.Connection]:
+        # writer 스레드가 self를 참조하지 않도록 값만 캡처 (finalize 동작 보장)
+        db_path, pragmas, cache = self._db_path, self._pragmas(), self.STATEMENT_CACHE_SIZE
+        return lambda: _open_connection(db_path, pragmas, cache, readonly)
 
     def _get_connection(self) -> sqlite3.Connection:
-        """현재 스레드의 DB 연결 반환 (없으면 생성)"""
+        """
+        현재 스레드의 DB 연결 반환 (없으면 생성)
+
+        단일 writer 모드에서는 읽기 전용 연결
+        """
         if not hasattr(self._local, "connection") or self._local.connection is None:
-            self._local.connection = sqlite3.connect(
-                str(self._db_path),
-                check_same_thread=False,
-                timeout=30.0,
+            self._local.connection = _open_connection(
+                self._db_path,
+                self._pragmas(),
+                self.STATEMENT_CACHE_SIZE,
+                readonly=self._single_writer,
             )
-            # Row를 dict처럼 접근 가능하게
-            self._local.connection.row_factory = sqlite3.Row
         return self._local.connection
 
+    def _lease_connection(self) -> Optional["_LeasedConnection"]:
+        """현재 스레드가 임대 중인 writer 연결 (get_cursor 블록 내부)"""
+        return getattr(self._local, "lease", None)
+
+    @contextmanager
+    def _nested(self, conn: sqlite3.Connection) -> Generator[sqlite3.Cursor, None, None]:
+        """임대 블록 안의 중첩 get_cursor → SAVEPOINT"""
+        cursor = conn.cursor()
+        cursor.execute("SAVEPOINT nested")
+        try:
+            yield cursor
+            cursor.execute("RELEASE nested")
+        except Exception:
+            cursor.execute("ROLLBACK TO nested")
+            cursor.execute("RELEASE nested")
+            raise
+        finally:
+            cursor.close()
+
+    @contextmanager
+    def _leased_cursor(self) -> Generator[sqlite3.Cursor, None, None]:
+        """
+        writer 트랜잭션 안에서 블록 실행, 블록 종료 후 COMMIT까지 대기
+
+        Raises:
+            LeaseExpiredError: 블록이 LEASE_TIMEOUT_SECONDS를 넘겨 쓰기가 롤백됨
+        """
+        lease = _Lease(self.LEASE_TIMEOUT_SECONDS)
+        future = self._writer.submit(lease)
+        while not lease.acquired.wait(0.5):
+            if future.done():
+                future.result()
+
+        raw_cursor = lease.conn.cursor()
+        self._local.lease = _LeasedConnection(lease)
+        try:
+            yield _LeasedCursor(lease, raw_cursor)
+        except Exception as e:
+            lease.failed = True
+            logger.error(f"Database error: {e}")
+            raise
+        finally:
+            self._local.lease = None
+            with lease.lock:
+                raw_cursor.close()
+            lease.released.set()
+            if lease.failed:
+                try:
+                    future.result()
+                except _LeaseAborted:
+                    pass
+        try:
+            future.result()
+        except _LeaseAborted:
+            raise LeaseExpiredError(
+                f"Database lease expired after {self.LEASE_TIMEOUT_SECONDS:.1f}s (rolled back)"
+            ) from None
+
     @contextmanager
     def get_cursor(self) -> Generator[sqlite3.Cursor, None, None]:
         """커서 컨텍스트 매니저 (자동 커밋/롤백)"""
+        lease_conn = self._lease_connection()
+        if lease_conn is not None:
+            with self._nested(lease_conn) as cursor:
+                yield cursor
+            return
+        if self._writer is not None:
+            with self._leased_cursor() as cursor:
+                yield cursor
+            return
+
         conn = self._get_connection()
         cursor = conn.cursor()
         try:
@@ -84,6 +504,12 @@ class Database:
     @contextmanager
     def transaction(self) -> Generator[sqlite3.Cursor, None, None]:
         """명시적 트랜잭션 (여러 쿼리를 하나의 트랜잭션으로)"""
+        if self._writer is not None or self._lease_connection() is not None:
+            # 단일 writer 모드의 get_cursor 블록은 이미 원자적
+            with self.get_cursor() as cursor:
+                yield cursor
+            return
+
         conn = self._get_connection()
         cursor = conn.cursor()
         try:
@@ -103,26 +529,93 @@ class Database:
 
     def execute(self, query: str, params: tuple = ()) -> sqlite3.Cursor:
         """단일 쿼리 실행"""
+        if self._writer is not None and self._lease_connection() is None:
+            return self.execute_async(query, params).result()
         with self.get_cursor() as cursor:
             cursor.execute(query, params)
             return cursor
 
     def execute_many(self, query: str, params_list: list) -> None:
         """다중 쿼리 실행"""
+        if self._writer is not None and self._lease_connection() is None:
+            self.execute_many_async(query, params_list).result()
+            return
         with self.get_cursor() as cursor:
             cursor.executemany(query, params_list)
 
+    def execute_async(self, query: str, params: tuple = ()) -> Future:
+        """
+        쓰기 쿼리 비동기 실행 (커밋 후 future 완료)
+
+        레거시 모드에서는 즉시 실행 후 완료된 future 반환
+        """
+        return self._submit_write(lambda conn: conn.execute(query, params))
+
+    def execute_many_async(self, query: str, params_list: list) -> Future:
+        """다중 쓰기 쿼리 비동기 실행 (커밋 후 future 완료)"""
+        return self._submit_write(lambda conn: conn.executemany(query, params_list))
+
+    def run_async(self, fn: Callable[[sqlite3.Connection], Any]) -> Future:
+        """
+        연결을 받는 쓰기 함수를 하나의 작업 단위로 비동기 실행 (커밋 후 future 완료)
+
+        여러 쿼리를 원자적으로 묶어 writer 스레드에서 실행 (작업 단위별 SAVEPOINT).
+        레거시 모드에서는 즉시 실행 후 완료된 future 반환
+        """
+        return self._submit_write(fn)
+
+    def _submit_write(self, fn: Callable[[sqlite3.Connection], Any]) -> Future:
+        lease_conn = self._lease_connection()
+        if self._writer is not None and lease_conn is None:
+            return self._writer.submit(fn)
+
+        future: Future = Future()
+        try:
+            if lease_conn is not None:
+                future.set_result(fn(lease_conn))
+            else:
+                with self.get_cursor() as cursor:
+                    future.set_result(fn(cursor.connection))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """이전에 등록된 비동기 쓰기가 모두 커밋될 때까지 대기"""
+        if self._writer is not None:
+            self._writer.submit(lambda conn: None).result(timeout)
+
+    def _read_cursor(self) -> sqlite3.Cursor:
+        lease_conn = self._lease_connection()
+        if lease_conn is not None:
+            return lease_conn.cursor()
+        return self._get_connection().cursor()
+
     def fetch_one(self, query: str, params: tuple = ()) -> Optional[sqlite3.Row]:
         """단일 행 조회"""
-        with self.get_cursor() as cursor:
+        if self._writer is None:
+            with self.get_cursor() as cursor:
+                cursor.execute(query, params)
+                return cursor.fetchone()
+        cursor = self._read_cursor()
+        try:
             cursor.execute(query, params)
             return cursor.fetchone()
+        finally:
+            cursor.close()
 
     def fetch_all(self, query: str, params: tuple = ()) -> list:
         """전체 행 조회"""
-        with self.get_cursor() as cursor:
+        if self._writer is None:
+            with self.get_cursor() as cursor:
+                cursor.execute(query, params)
+                return cursor.fetchall()
+        cursor = self._read_cursor()
+        try:
             cursor.execute(query, params)
             return cursor.fetchall()
+        finally:
+            cursor.close()
 
     def close(self) -> None:
         """현재 스레드의 연결 종료"""
@@ -132,14 +625,20 @@ class Database:
             logger.debug("Database connection closed")
 
     def close_all(self) -> None:
-        """모든 연결 종료 (메인 스레드에서 호출)"""
+        """모든 연결 종료 (메인 스레드에서 호출, writer는 대기 중인 쓰기 처리 후 종료)"""
         self.close()
+        if self._writer is not None:
+            self._finalizer()
         logger.info("All database connections closed")
 
     def vacuum(self) -> None:
         """DB 최적화 (압축)"""
-        with self.get_cursor() as cursor:
-            cursor.execute("VACUUM")
+        if self._writer is not None:
+            # VACUUM은 트랜잭션 밖에서만 실행 가능
+            self._writer.submit(lambda conn: conn.execute("VACUUM"), transactional=False).result()
+        else:
+            with self.get_cursor() as cursor:
+                cursor.execute("VACUUM")
         logger.info("Database vacuumed")
 
     def get_table_stats(self) -> dict:
@@ -160,14 +659,19 @@ class MarketDataDB(Database):
 
     DEFAULT_PATH = Path(__file__).parent / "market_data.db"
 
-    def __init__(self, db_path: Optional[Path] = None):
+    # 분봉 테이블/인덱스 위주 → 큰 페이지 캐시 + mmap
+    CACHE_SIZE_KB = 64 * 1024
+    MMAP_SIZE = 256 * 1024 * 1024
+
+    def __init__(self, db_path: Optional[Path] = None, single_writer: bool = True):
         """
         Args:
             db_path: DB 파일 경로. None이면 기본 경로 사용
+            single_writer: 전용 writer 스레드로 쓰기 직렬화
         """
         if db_path is None:
             db_path = self.DEFAULT_PATH
-        super().__init__(db_path)
+        super().__init__(db_path, single_writer)
 
     def _init_tables(self) -> None:
         """시세 관련 테이블 생성"""
@@ -335,12 +839,17 @@ class TradingDB(Database):
     - 실투자: trading_live.db
     """
 
-    def __init__(self, db_path: Path):
+    # 주문/포지션 소량 테이블
+    CACHE_SIZE_KB = 4 * 1024
+    MMAP_SIZE = 16 * 1024 * 1024
+
+    def __init__(self, db_path: Path, single_writer: bool = True):
         """
         Args:
             db_path: DB 파일 경로 (trading_paper.db 또는 trading_live.db)
+            single_writer: 전용 writer 스레드로 쓰기 직렬화
         """
-        super().__init__(db_path)
+        super().__init__(db_path, single_writer)
 
     def _init_tables(self) -> None:
         """매매 관련 테이블 생성"""
@@ -365,6 +874,7 @@ class TradingDB(Database):
                     pnl INTEGER DEFAULT NULL,
                     avg_cost REAL DEFAULT NULL,
                     pnl_rate REAL DEFAULT NULL,
+                    trade_date TEXT,
                     created_at TEXT NOT NULL,
                     updated_at TEXT NOT NULL
                 )
@@ -426,7 +936,7 @@ class TradingDB(Database):
         self._migrate_orders_table()
 
     def _migrate_orders_table(self) -> None:
-        """orders 테이블에 pnl 컬럼 추가 마이그레이션"""
+        """orders 테이블에 pnl / trade_date 컬럼 추가 마이그레이션"""
         with self.get_cursor() as cursor:
             # 컬럼 존재 여부 확인
             cursor.execute("PRAGMA table_info(orders)")
@@ -438,6 +948,24 @@ class TradingDB(Database):
                 cursor.execute("ALTER TABLE orders ADD COLUMN pnl_rate REAL DEFAULT NULL")
                 logger.info("orders 테이블에 pnl 컬럼 추가 완료")
 
+            # 거래일 컬럼: DATE(created_at) 대신 인덱스로 당일 주문 조회
+            if "trade_date" not in columns:
+                cursor.execute("ALTER TABLE orders ADD COLUMN trade_date TEXT")
+                logger.info("orders 테이블에 trade_date 컬럼 추가 완료")
+
+            # trade_date 없이 기록된 행 채우기 (created_at 'YYYY-MM-DD HH:MM:SS' 앞 10자리)
+            cursor.execute("""
+                UPDATE orders SET trade_date = substr(created_at, 1, 10)
+                WHERE trade_date IS NULL
+            """)
+            if cursor.rowcount > 0:
+                logger.info(f"orders.trade_date 채움: {cursor.rowcount}건")
+
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_orders_trade_date
+                ON orders(trade_date, status, stock_code)
+            """)
+
     def get_table_stats(self) -> dict:
         """매매 테이블별 통계 조회"""
         stats = {}
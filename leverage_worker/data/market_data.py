@@ -0,0 +1,320 @@
+"""
+시세 서비스 모듈
+
+스케줄러 종목 틱의 시세 출처를 종목별로 결정해 단일 스냅샷으로 제공
+- WebSocket 체결이 최근(ws_stale_seconds 이내)이면 WS 시세 사용 (REST 호출 없음)
+- 아니면 관심종목(멀티종목) 시세조회로 여러 종목을 한 번에 조회 (짧은 수집 구간 내 요청 병합)
+- 분봉(REST 30개)은 분이 바뀐 뒤 1회 + 분 초반 조회분의 보정 1회만 조회 (완성 분봉 반영용)
+  WS 체결로 분봉을 집계하는 종목은 ws_candle_interval마다 1회만 조회 (집계 분봉 대조용)
+  분봉을 조회하지 않은 틱의 WS/멀티종목 현재가는 TradingEngine이 CandleStore 진행 중 분봉에 반영
+  (전략의 price_history[-1]이 current_price와 같은 시점 유지)
+- 같은 종목 동시 요청은 진행 중 조회 결과를 공유 (single-flight)
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from leverage_worker.utils.logger import get_logger
+from leverage_worker.utils.single_flight import Flight
+
+logger = get_logger(__name__)
+
+# 시세 출처
+SOURCE_WS = "ws"
+SOURCE_REST_MULTI = "rest_multi"
+SOURCE_REST_CANDLES = "rest_candles"
+
+
+@dataclass
+class MarketSnapshot:
+    """종목 시세 스냅샷 (_on_stock_tick 입력)"""
+
+    stock_code: str
+    price: int
+    change_rate: float  # 전일 대비율 (%)
+    timestamp: datetime  # 시세 기준 시각
+    source: str  # SOURCE_*
+    candles: Optional[List[Dict[str, Any]]] = None  # 이번에 조회한 REST 분봉 (최신순, 저장 대상)
+
+
+class MarketDataService:
+    """
+    WS 우선 / REST 보완 시세 서비스
+
+    스레드 안전. 스케줄러 워커(종목별 병렬)와 WS 수신 스레드에서 동시에 호출된다.
+
+    Example:
+        service = MarketDataService(
+            fetch_prices=broker.get_multi_prices,
+            fetch_candles=lambda code: broker.get_minute_candles(stock_code=code),
+        )
+        bus.subscribe(service.on_tick)
+        snapshot = service.get_snapshot("122630", datetime.now())
+    """
+
+    def __init__(
+        self,
+        fetch_prices: Callable[[List[str]], Dict[str, Any]],
+        fetch_candles: Callable[[str], List[Dict[str, Any]]],
+        ws_stale_seconds: float = 5.0,
+        batch_window: float = 0.02,
+        batch_size: int = 30,
+        price_ttl: float = 0.5,
+        candle_settle_seconds: float = 3.0,
+        wait_timeout: float = 10.0,
+        ws_candle_interval: float = 0.0,
+    ):
+        """
+        Args:
+            fetch_prices: 종목 목록 → {종목코드: StockPrice} (멀티종목 시세)
+            fetch_candles: 종목코드 → REST 분봉 목록 (최신순)
+            ws_stale_seconds: 마지막 WS 체결 후 이 시간이 지나면 REST로 전환
+            batch_window: 멀티종목 조회 요청 수집 구간 (초)
+            batch_size: 멀티종목 조회 1회 최대 종목 수
+            price_ttl: REST 시세 재사용 시간 (초)
+            candle_settle_seconds: 분 초반 이 시간 안에 조회한 분봉은 이후 1회 재조회 (직전 분봉 확정 반영)
+            wait_timeout: 다른 스레드의 조회 결과 대기 한도 (초)
+            ws_candle_interval: WS 수신 중인 종목의 REST 분봉 조회 주기 (초, 0이면 WS 여부 무관 매분)
+        """
+        self._fetch_prices = fetch_prices
+        self._fetch_candles = fetch_candles
+        self._ws_stale_ns = int(ws_stale_seconds * 1e9)
+        self._batch_window = batch_window
+        self._batch_size = batch_size
+        self._price_ttl_ns = int(price_ttl * 1e9)
+        self._candle_settle_seconds = candle_settle_seconds
+        self._wait_timeout = wait_timeout
+        self._ws_candle_interval = ws_candle_interval
+
+        self._lock = threading.Lock()
+
+        # WS 최신 체결: stock_code -> (수신 단조 시각 ns, price, change_rate, 체결 시각)
+        self._ws_latest: Dict[str, Tuple[int, int, float, datetime]] = {}
+        # REST 시세 캐시: stock_code -> (조회 단조 시각 ns, StockPrice)
+        self._rest_prices: Dict[str, Tuple[int, Any]] = {}
+        # 분봉 조회 기록: stock_code -> 마지막 조회 시각
+        self._candles_fetched_at: Dict[str, datetime] = {}
+
+        # 진행 중 조회
+        self._collecting: Optional[Flight] = None  # 멀티종목 수집 중인 배치
+        self._price_flights: Dict[str, Flight] = {}
+        self._candle_flights: Dict[str, Flight] = {}
+
+        self._stats: Dict[str, int] = {
+            SOURCE_WS: 0,
+            SOURCE_REST_MULTI: 0,
+            SOURCE_REST_CANDLES: 0,
+            "price_cache_hits": 0,
+            "multi_calls": 0,
+            "candle_calls": 0,
+            "deduped": 0,
+            "misses": 0,
+        }
+
+    # ==========================================
+    # WebSocket 입력
+    # ==========================================
+
+    def on_tick(self, tick) -> None:
+        """TickBus 구독 콜백 (TickData)"""
+        if tick.price <= 0:
+            return
+        self._ws_latest[tick.stock_code] = (
+            time.monotonic_ns(),
+            tick.price,
+            tick.change_rate,
+            tick.timestamp,
+        )
+
+    def is_ws_live(self, stock_code: str) -> bool:
+        """최근 WS 체결 수신 여부"""
+        latest = self._ws_latest.get(stock_code)
+        return latest is not None and time.monotonic_ns() - latest[0] <= self._ws_stale_ns
+
+    # ==========================================
+    # 스냅샷
+    # ==========================================
+
+    def needs_candles(self, stock_code: str, now: datetime) -> bool:
+        """
+        REST 분봉 조회 필요 여부
+
+        - 분이 바뀐 뒤 첫 조회 (직전 완성 분봉 반영)
+        - 분 초반(candle_settle_seconds 이내)에 조회했다면 그 이후 1회 보정
+        - WS 수신 중(분봉 실시간 집계)이면 ws_candle_interval마다 1회 (집계 분봉 대조)
+        """
+        fetched_at = self._candles_fetched_at.get(stock_code)
+        if fetched_at is None:
+            return True
+        if self._ws_candle_interval > 0 and self.is_ws_live(stock_code):
+            return (now - fetched_at).total_seconds() >= self._ws_candle_interval
+        if fetched_at.replace(second=0, microsecond=0) != now.replace(second=0, microsecond=0):
+            return True
+        settle = self._candle_settle_seconds
+        return fetched_at.second + fetched_at.microsecond / 1e6 < settle <= (
+            now.second + now.microsecond / 1e6
+        )
+
+    def get_snapshot(
+        self,
+        stock_code: str,
+        now: datetime,
+        candles: Optional[List[Dict[str, Any]]] = None,
+    ) -> Optional[MarketSnapshot]:
+        """
+        종목 시세 스냅샷
+
+        Args:
+            stock_code: 종목코드
+            now: 스케줄 슬롯 시각
+            candles: 호출 측에서 이미 조회한 분봉 (async 모드), None이면 필요 시 직접 조회
+
+        Returns:
+            MarketSnapshot 또는 None (모든 출처 실패)
+        """
+        if candles is None and self.needs_candles(stock_code, now):
+            candles = self._get_candles(stock_code)
+        if candles:
+            self._candles_fetched_at[stock_code] = now
+
+        # 1. WebSocket 시세
+        latest = self._ws_latest.get(stock_code)
+        if latest is not None and time.monotonic_ns() - latest[0] <= self._ws_stale_ns:
+            _, price, change_rate, timestamp = latest
+            return self._snapshot(stock_code, price, change_rate, timestamp, SOURCE_WS, candles)
+
+        # 2. 이번에 조회한 분봉의 최신 종가
+        if candles:
+            latest_candle = candles[0]
+            return self._snapshot(
+                stock_code,
+                latest_candle["close_price"],
+                latest_candle.get("change_rate", 0.0),
+                now,
+                SOURCE_REST_CANDLES,
+                candles,
+            )
+
+        # 3. 멀티종목 시세 (요청 병합)
+        price = self._get_rest_price(stock_code)
+        if price is not None:
+            return self._snapshot(
+                stock_code, price.current_price, price.change_rate, now, SOURCE_REST_MULTI, None
+            )
+
+        # 4. 최후: 분봉 조회
+        candles = self._get_candles(stock_code)
+        if candles:
+            self._candles_fetched_at[stock_code] = now
+            return self._snapshot(
+                stock_code,
+                candles[0]["close_price"],
+                candles[0].get("change_rate", 0.0),
+                now,
+                SOURCE_REST_CANDLES,
+                candles,
+            )
+
+        self._stats["misses"] += 1
+        return None
+
+    def _snapshot(
+        self,
+        stock_code: str,
+        price: int,
+        change_rate: float,
+        timestamp: datetime,
+        source: str,
+        candles: Optional[List[Dict[str, Any]]],
+    ) -> MarketSnapshot:
+        self._stats[source] += 1
+        return MarketSnapshot(stock_code, price, change_rate, timestamp, source, candles)
+
+    # ==========================================
+    # REST 조회 (요청 병합 / single-flight)
+    # ==========================================
+
+    def _get_rest_price(self, stock_code: str):
+        """멀티종목 시세 (price_ttl 이내 캐시 재사용, 동시 요청은 한 번에 조회)"""
+        cached = self._rest_prices.get(stock_code)
+        if cached is not None and time.monotonic_ns() - cached[0] <= self._price_ttl_ns:
+            self._stats["price_cache_hits"] += 1
+            return cached[1]
+
+        leader = False
+        with self._lock:
+            flight = self._price_flights.get(stock_code)
+            if flight is not None:
+                self._stats["deduped"] += 1
+            else:
+                flight = self._collecting
+                if flight is None or len(flight.keys) >= self._batch_size:
+                    flight = self._collecting = Flight()
+                    leader = True
+                flight.keys.append(stock_code)
+                self._price_flights[stock_code] = flight
+
+        if not leader:
+            return (flight.wait(self._wait_timeout) or {}).get(stock_code)
+
+        # 수집 구간 동안 다른 종목 요청을 모은 뒤 한 번에 조회
+        if self._batch_window > 0:
+            time.sleep(self._batch_window)
+        with self._lock:
+            if self._collecting is flight:
+                self._collecting = None
+            codes = list(flight.keys)
+
+        result: Dict[str, Any] = {}
+        try:
+            self._stats["multi_calls"] += 1
+            result = self._fetch_prices(codes) or {}
+            fetched_ns = time.monotonic_ns()
+            for code, price in result.items():
+                self._rest_prices[code] = (fetched_ns, price)
+        except Exception as e:
+            logger.error(f"Multi price fetch failed ({len(codes)} codes): {e}")
+        finally:
+            with self._lock:
+                for code in codes:
+                    if self._price_flights.get(code) is flight:
+                        del self._price_flights[code]
+            flight.finish(result)
+        return result.get(stock_code)
+
+    def _get_candles(self, stock_code: str) -> List[Dict[str, Any]]:
+        """REST 분봉 (같은 종목 진행 중 조회가 있으면 결과 공유)"""
+        with self._lock:
+            flight = self._candle_flights.get(stock_code)
+            leader = flight is None
+            if leader:
+                flight = self._candle_flights[stock_code] = Flight()
+            else:
+                self._stats["deduped"] += 1
+
+        if not leader:
+            return flight.wait(self._wait_timeout) or []
+
+        candles: List[Dict[str, Any]] = []
+        try:
+            self._stats["candle_calls"] += 1
+            candles = self._fetch_candles(stock_code) or []
+        except Exception as e:
+            logger.error(f"Minute candles fetch failed [{stock_code}]: {e}")
+        finally:
+            with self._lock:
+                if self._candle_flights.get(stock_code) is flight:
+                    del self._candle_flights[stock_code]
+            flight.finish(candles)
+        return candles
+
+    # ==========================================
+    # 상태
+    # ==========================================
+
+    def stats(self) -> Dict[str, int]:
+        """출처별 스냅샷 수 / REST 호출 수 / 병합 건수"""
+        return {**self._stats, "ws_symbols": sum(1 for c in list(self._ws_latest) if self.is_ws_live(c))}
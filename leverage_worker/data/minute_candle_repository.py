@@ -378,12 +378,13 @@ class MinuteCandleRepository:
                 volume=volume,
             )
 
-    def upsert_batch(self, candles: List[MinuteCandle]) -> int:
+    def upsert_batch(self, candles: List[MinuteCandle], verbose: bool = True) -> int:
         """
         분봉 데이터 일괄 upsert
 
         Args:
             candles: MinuteCandle 리스트
+            verbose: False면 INFO 로그 생략 (주기적 write-through용)
 
         Returns:
             처리된 건수
@@ -422,7 +423,10 @@ class MinuteCandleRepository:
         with self._db.get_cursor() as cursor:
             cursor.executemany(query, params_list)
 
-        logger.info(f"Minute candle batch upsert: {len(candles)} records")
+        if verbose:
+            logger.info(f"Minute candle batch upsert: {len(candles)} records")
+        else:
+            logger.debug(f"Minute candle batch upsert: {len(candles)} records")
         return len(candles)
 
     def get(self, stock_code: str, candle_datetime: str) -> Optional[MinuteCandle]:
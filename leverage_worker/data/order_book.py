@@ -0,0 +1,174 @@
+"""
+실시간 호가 뷰 모듈
+
+WebSocket 호가(H0STASP0)로 종목별 로컬 호가창(10단계)을 유지하고
+최우선 매도/매수호가를 REST 조회 없이 제공
+- 호가 수신 후 stale_seconds 이내면 로컬 호가 사용
+- 구독되지 않았거나 오래된 종목은 REST 호가 조회로 보완 (fallback)
+- add_listener(): 호가 갱신 종목 알림 (주문 추격 엔진 재호가용)
+"""
+
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple
+
+from leverage_worker.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from leverage_worker.websocket.orderbook_handler import OrderBookData
+
+logger = get_logger(__name__)
+
+# 호가 출처
+SOURCE_BOOK = "book"
+SOURCE_REST = "rest"
+
+
+class MarketDataView:
+    """
+    종목별 로컬 호가창 + REST 보완
+
+    스레드 안전. WS 수신 스레드(on_order_book)와 주문/매도 스레드에서 동시에 호출된다.
+
+    Example:
+        view = MarketDataView(
+            fetch_ask=broker.get_asking_price,
+            fetch_bid=broker.get_bidding_price,
+        )
+        ws_manager.add_book_listener(view.on_order_book)
+        ws_manager.acquire_book("122630")
+        ask = view.best_ask("122630")
+    """
+
+    def __init__(
+        self,
+        fetch_ask: Callable[[str], Optional[int]],
+        fetch_bid: Callable[[str], Optional[int]],
+        stale_seconds: float = 2.0,
+    ):
+        """
+        Args:
+            fetch_ask: 종목코드 → REST 매도호가1
+            fetch_bid: 종목코드 → REST 매수호가1
+            stale_seconds: 마지막 호가 수신 후 이 시간이 지나면 REST로 전환
+        """
+        self._fetch_ask = fetch_ask
+        self._fetch_bid = fetch_bid
+        self._stale_seconds = stale_seconds
+
+        self._lock = threading.Lock()
+        # stock_code -> (수신 단조 시각 ns, 호가)
+        self._books: Dict[str, Tuple[int, "OrderBookData"]] = {}
+        # 호가 갱신 리스너 (stock_code 전달, copy-on-write)
+        self._listeners: Tuple[Callable[[str], None], ...] = ()
+
+        self._stats: Dict[str, int] = {
+            "updates": 0,
+            "ask_" + SOURCE_BOOK: 0,
+            "ask_" + SOURCE_REST: 0,
+            "bid_" + SOURCE_BOOK: 0,
+            "bid_" + SOURCE_REST: 0,
+        }
+
+    # ==========================================
+    # WebSocket 입력
+    # ==========================================
+
+    def on_order_book(self, book: "OrderBookData") -> None:
+        """WSConnectionManager 호가 리스너 콜백 (OrderBookData)"""
+        received_ns = book.received_ns or time.monotonic_ns()
+        with self._lock:
+            self._books[book.stock_code] = (received_ns, book)
+            self._stats["updates"] += 1
+
+        for callback in self._listeners:
+            try:
+                callback(book.stock_code)
+            except Exception as e:
+                logger.error(f"[MarketDataView] listener error: {e}", exc_info=True)
+
+    def add_listener(self, callback: Callable[[str], None]) -> None:
+        """호가 갱신 리스너 등록 (WS 수신 스레드에서 종목코드로 호출, 빠르게 반환해야 함)"""
+        with self._lock:
+            if callback not in self._listeners:
+                self._listeners = self._listeners + (callback,)
+
+    def remove_listener(self, callback: Callable[[str], None]) -> None:
+        """호가 갱신 리스너 해제"""
+        with self._lock:
+            self._listeners = tuple(cb for cb in self._listeners if cb != callback)
+
+    # ==========================================
+    # 조회
+    # ==========================================
+
+    def depth(
+        self, stock_code: str, max_age: Optional[float] = None
+    ) -> Optional["OrderBookData"]:
+        """
+        로컬 호가창 (REST 보완 없음)
+
+        Args:
+            stock_code: 종목코드
+            max_age: 허용 경과 시간 (초, None이면 stale_seconds)
+
+        Returns:
+            최근 호가 또는 None (미수신/오래됨)
+        """
+        entry = self._books.get(stock_code)
+        if entry is None:
+            return None
+        received_ns, book = entry
+        limit = self._stale_seconds if max_age is None else max_age
+        if time.monotonic_ns() - received_ns > limit * 1e9:
+            return None
+        return book
+
+    def age(self, stock_code: str) -> Optional[float]:
+        """마지막 호가 수신 후 경과 시간 (초, 미수신이면 None)"""
+        entry = self._books.get(stock_code)
+        if entry is None:
+            return None
+        return (time.monotonic_ns() - entry[0]) / 1e9
+
+    def best_ask(self, stock_code: str, max_age: Optional[float] = None) -> Optional[int]:
+        """최우선 매도호가 (로컬 호가 우선, 없거나 오래되면 REST)"""
+        book = self.depth(stock_code, max_age)
+        if book is not None and book.best_ask is not None:
+            self._stats["ask_" + SOURCE_BOOK] += 1
+            return book.best_ask.price
+        self._stats["ask_" + SOURCE_REST] += 1
+        return self._fetch_ask(stock_code)
+
+    def best_bid(self, stock_code: str, max_age: Optional[float] = None) -> Optional[int]:
+        """최우선 매수호가 (로컬 호가 우선, 없거나 오래되면 REST)"""
+        book = self.depth(stock_code, max_age)
+        if book is not None and book.best_bid is not None:
+            self._stats["bid_" + SOURCE_BOOK] += 1
+            return book.best_bid.price
+        self._stats["bid_" + SOURCE_REST] += 1
+        return self._fetch_bid(stock_code)
+
+    def is_live(self, stock_code: str) -> bool:
+        """로컬 호가가 신선한지 여부"""
+        return self.depth(stock_code) is not None
+
+    # ==========================================
+    # 정리
+    # ==========================================
+
+    def clear(self, stock_code: Optional[str] = None) -> None:
+        """로컬 호가 삭제 (구독 해제 시)"""
+        with self._lock:
+            if stock_code is None:
+                self._books.clear()
+            else:
+                self._books.pop(stock_code, None)
+
+    # ==========================================
+    # 상태
+    # ==========================================
+
+    def stats(self) -> Dict[str, int]:
+        """출처별 호가 조회 수 / 호가 수신 수"""
+        return {**self._stats, "live_symbols": sum(1 for c in list(self._books) if self.is_live(c))}
@@ -0,0 +1,24 @@
+"""
+Indicators 모듈 - numpy 기반 기술적 지표 (규칙 기반 전략 공용)
+
+주요 구성:
+- functions: sma / ema / mean_std / bollinger / donchian / atr / rsi (배열 → 마지막 값)
+- IndicatorSet: 캔들 스냅샷의 OHLCV 연속 배열 + 지표 메모이제이션
+- IndicatorCache: (종목, 봉 종류, 마지막 봉) 단위 공유 캐시 (전략 인스턴스 간 공유)
+"""
+
+from leverage_worker.indicators.cache import IndicatorCache, IndicatorSet, get_indicator_cache
+from leverage_worker.indicators.functions import atr, bollinger, donchian, ema, mean_std, rsi, sma
+
+__all__ = [
+    "IndicatorCache",
+    "IndicatorSet",
+    "get_indicator_cache",
+    "sma",
+    "ema",
+    "mean_std",
+    "bollinger",
+    "donchian",
+    "atr",
+    "rsi",
+]
@@ -0,0 +1,213 @@
+"""
+종목별 지표 캐시
+
+틱마다 같은 종목의 여러 전략이 각자 캔들 리스트를 순회하며 지표를 다시 계산하지 않도록
+(종목, 봉 종류, 마지막 봉) 단위로 OHLCV 배열과 지표값을 한 번만 계산해 공유.
+
+- IndicatorSet: 캔들 스냅샷 1개의 연속 numpy 배열 + 지표 메모이제이션
+- IndicatorCache: (종목, 봉 종류)별 최신 IndicatorSet 보관 (마지막 봉이 바뀌면 교체)
+
+사용 예:
+    ind = context.indicators              # 분봉
+    upper, middle, lower = ind.bollinger(20, 2.0)
+    high_n, _ = context.daily_indicators.donchian(30, offset=1)   # 오늘 제외
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from leverage_worker.indicators import functions
+
+# 메모이제이션 결과 없음 표시 (None도 유효한 결과)
+_MISSING = object()
+
+
+def _bar_key(candles: Sequence[Any]) -> Tuple:
+    """캔들 스냅샷 식별 키 (개수 + 첫/마지막 봉 시각 + 마지막 봉 OHLCV)"""
+    if len(candles) == 0:
+        return (0,)
+    first = candles[0]
+    last = candles[-1]
+    stamp = getattr(last, "candle_datetime", None) or getattr(last, "trade_date", None)
+    first_stamp = getattr(first, "candle_datetime", None) or getattr(first, "trade_date", None)
+    return (
+        len(candles),
+        first_stamp,
+        stamp,
+        last.open_price,
+        last.high_price,
+        last.low_price,
+        last.close_price,
+        last.volume,
+    )
+
+
+class IndicatorSet:
+    """
+    캔들 스냅샷의 OHLCV 배열과 지표
+
+    배열은 생성 시 1회 변환 (float64, 연속 메모리). 지표 메서드는 (지표, 인자, offset) 단위로
+    결과를 메모이제이션하므로 같은 스냅샷을 공유하는 전략들은 같은 지표를 한 번만 계산.
+
+    offset: 끝에서 제외할 봉 수 (예: 일봉 offset=1 → 오늘 제외, 분봉 offset=1 → 직전 봉 기준)
+    """
+
+    __slots__ = ("symbol", "key", "open", "high", "low", "close", "volume", "_memo")
+
+    def __init__(self, symbol: str, key: Hashable, candles: Sequence[Any]):
+        count = len(candles)
+        self.symbol = symbol
+        self.key = key
+        self.open = np.fromiter((c.open_price for c in candles), dtype=np.float64, count=count)
+        self.high = np.fromiter((c.high_price for c in candles), dtype=np.float64, count=count)
+        self.low = np.fromiter((c.low_price for c in candles), dtype=np.float64, count=count)
+        self.close = np.fromiter((c.close_price for c in candles), dtype=np.float64, count=count)
+        self.volume = np.fromiter((c.volume for c in candles), dtype=np.float64, count=count)
+        self._memo: Dict[Tuple, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    def sma(self, period: int, offset: int = 0) -> Optional[float]:
+        """종가 단순 이동평균"""
+        return self._cached(
+            ("sma", period, offset),
+            lambda: functions.sma(self._tail(self.close, offset), period),
+        )
+
+    def ema(self, period: int, offset: int = 0) -> Optional[float]:
+        """종가 지수 이동평균"""
+        return self._cached(
+            ("ema", period, offset),
+            lambda: functions.ema(self._tail(self.close, offset), period),
+        )
+
+    def mean_std(self, period: int, offset: int = 0) -> Optional[Tuple[float, float]]:
+        """종가 평균, 모표준편차"""
+        return self._cached(
+            ("mean_std", period, offset),
+            lambda: functions.mean_std(self._tail(self.close, offset), period),
+        )
+
+    def volume_sma(self, period: int, offset: int = 0) -> Optional[float]:
+        """거래량 단순 이동평균"""
+        return self._cached(
+            ("volume_sma", period, offset),
+            lambda: functions.sma(self._tail(self.volume, offset), period),
+        )
+
+    def bollinger(
+        self, period: int, num_std: float = 2.0, offset: int = 0
+    ) -> Optional[Tuple[float, float, float]]:
+        """볼린저 밴드 (상단, 중간, 하단)"""
+        stats = self.mean_std(period, offset)
+        if stats is None:
+            return None
+        mean, std = stats
+        return mean + num_std * std, mean, mean - num_std * std
+
+    def donchian(self, period: int, offset: int = 0) -> Optional[Tuple[float, float]]:
+        """돈치안 채널 (최고가, 최저가)"""
+        return self._cached(
+            ("donchian", period, offset),
+            lambda: functions.donchian(
+                self._tail(self.high, offset), self._tail(self.low, offset), period
+            ),
+        )
+
+    def atr(self, period: int, offset: int = 0) -> Optional[float]:
+        """ATR (True Range 단순 평균)"""
+        return self._cached(
+            ("atr", period, offset),
+            lambda: functions.atr(
+                self._tail(self.high, offset),
+                self._tail(self.low, offset),
+                self._tail(self.close, offset),
+                period,
+            ),
+        )
+
+    def rsi(self, period: int = 14, offset: int = 0) -> Optional[float]:
+        """RSI (0~100)"""
+        return self._cached(
+            ("rsi", period, offset),
+            lambda: functions.rsi(self._tail(self.close, offset), period),
+        )
+
+    @staticmethod
+    def _tail(values: np.ndarray, offset: int) -> np.ndarray:
+        return values[:len(values) - offset] if offset > 0 else values
+
+    def _cached(self, key: Tuple, compute: Callable[[], Any]) -> Any:
+        value = self._memo.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self._memo[key] = value
+        return value
+
+    def __repr__(self) -> str:
+        return f"IndicatorSet(symbol={self.symbol!r}, bars={len(self)})"
+
+
+class IndicatorCache:
+    """
+    (종목, 봉 종류)별 최신 IndicatorSet 저장소
+
+    같은 스냅샷(마지막 봉 동일)이면 기존 IndicatorSet 재사용, 아니면 새로 만들어 교체.
+    종목별 1개만 보관하므로 메모리는 종목 수에 비례. 종목 샤드 스레드 간 공유 가능.
+    """
+
+    def __init__(self):
+        self._sets: Dict[Tuple[str, str], IndicatorSet] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, symbol: str, timeframe: str, candles: Sequence[Any]) -> IndicatorSet:
+        """
+        캔들 스냅샷의 IndicatorSet 반환
+
+        Args:
+            symbol: 종목코드
+            timeframe: 봉 종류 ("minute", "daily" 등)
+            candles: 캔들 시퀀스 (open/high/low/close_price, volume 속성)
+        """
+        key = _bar_key(candles)
+        slot = (symbol, timeframe)
+        with self._lock:
+            cached = self._sets.get(slot)
+            if cached is not None and cached.key == key:
+                self._hits += 1
+                return cached
+            self._misses += 1
+
+        # 배열 변환은 잠금 밖에서 (동시에 만들어져도 결과 동일)
+        indicator_set = IndicatorSet(symbol, key, candles)
+        with self._lock:
+            self._sets[slot] = indicator_set
+        return indicator_set
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sets.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"symbols": len(self._sets), "hits": self._hits, "misses": self._misses}
+
+
+# 싱글톤 인스턴스 (StrategyContext.indicators / daily_indicators 공용)
+_indicator_cache: Optional[IndicatorCache] = None
+_indicator_cache_lock = threading.Lock()
+
+
+def get_indicator_cache() -> IndicatorCache:
+    """지표 캐시 싱글톤 인스턴스 가져오기"""
+    global _indicator_cache
+    if _indicator_cache is None:
+        with _indicator_cache_lock:
+            if _indicator_cache is None:
+                _indicator_cache = IndicatorCache()
+    return _indicator_cache
@@ -0,0 +1,95 @@
+"""
+numpy 기반 기술적 지표 함수
+
+모두 배열(최근 데이터가 마지막)을 받아 마지막 시점의 지표값 1개를 반환.
+데이터가 기간보다 짧으면 None. 슬라이싱(values[:-1])은 복사 없는 뷰이므로
+직전 봉 기준 값도 같은 함수로 계산.
+
+- sma / ema / mean_std
+- bollinger: (상단, 중간, 하단), 모표준편차(ddof=0)
+- donchian: (최고가, 최저가)
+- atr: 최근 N개 True Range 단순 평균
+- rsi: 최근 N개 변화량의 평균 상승/하락 (단순 평균)
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+_EPS = 1e-10
+
+
+def sma(values: np.ndarray, period: int) -> Optional[float]:
+    """단순 이동평균"""
+    if period <= 0 or len(values) < period:
+        return None
+    return float(values[-period:].mean())
+
+
+def ema(values: np.ndarray, period: int) -> Optional[float]:
+    """
+    지수 이동평균 (pandas ewm(span=period, adjust=False)와 동일)
+
+    첫 값을 초기값으로 전체 구간을 반영. 가중치 (1-α)^k 를 한 번에 내적으로 계산.
+    """
+    if period <= 0 or len(values) < period:
+        return None
+    alpha = 2.0 / (period + 1)
+    weights = alpha * np.power(1.0 - alpha, np.arange(len(values)))
+    # 가장 오래된 값(초기값)은 α 없이 (1-α)^(n-1)
+    weights[-1] /= alpha
+    return float(np.dot(weights, values[::-1]))
+
+
+def mean_std(values: np.ndarray, period: int) -> Optional[Tuple[float, float]]:
+    """최근 N개 평균, 모표준편차"""
+    if period <= 0 or len(values) < period:
+        return None
+    window = values[-period:]
+    return float(window.mean()), float(window.std())
+
+
+def bollinger(
+    values: np.ndarray, period: int, num_std: float = 2.0
+) -> Optional[Tuple[float, float, float]]:
+    """볼린저 밴드 (상단, 중간, 하단)"""
+    stats = mean_std(values, period)
+    if stats is None:
+        return None
+    mean, std = stats
+    return mean + num_std * std, mean, mean - num_std * std
+
+
+def donchian(
+    high: np.ndarray, low: np.ndarray, period: int
+) -> Optional[Tuple[float, float]]:
+    """돈치안 채널 (최근 N개 최고가, 최저가)"""
+    if period <= 0 or len(high) < period:
+        return None
+    return float(high[-period:].max()), float(low[-period:].min())
+
+
+def atr(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int
+) -> Optional[float]:
+    """ATR (최근 N개 True Range 단순 평균, 첫 봉은 전일 종가가 없어 제외)"""
+    if period <= 0 or len(close) < period + 1:
+        return None
+    high = high[-period:]
+    low = low[-period:]
+    prev_close = close[-period - 1:-1]
+    true_range = np.maximum(
+        high - low,
+        np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)),
+    )
+    return float(true_range.mean())
+
+
+def rsi(close: np.ndarray, period: int = 14) -> Optional[float]:
+    """RSI (최근 N개 변화량의 평균 상승/하락, 0~100)"""
+    if period <= 0 or len(close) < period + 1:
+        return None
+    delta = np.diff(close[-period - 1:])
+    gain = float(delta[delta > 0].sum()) / period
+    loss = float(-delta[delta < 0].sum()) / period
+    return 100.0 - 100.0 / (1.0 + gain / (loss + _EPS))
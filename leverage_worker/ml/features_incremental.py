@@ -0,0 +1,651 @@
+"""
+지정가 매수 전략용 129개 피처 증분 계산
+
+features_limit_order.calculate_features()의 마지막 행과 동일한 값을
+봉 1개당 O(1)로 계산 (전체 DataFrame 재계산 없음)
+
+- 이동 평균/표준편차: 롤링 합 + 제곱합
+- 이동 최고/최저: 단조 deque
+- RSI/ATR/스토캐스틱 %D: 롤링 합 (배치 구현과 동일한 단순 이동평균)
+- MACD: EMA 상태
+- 일별 피처: 날짜별 누적 상태
+
+사용 예:
+    engine = IncrementalLimitOrderFeatures()
+    for candle in candles:
+        row = engine.update_candle(candle)     # 완성 봉 반영 + 피처 반환
+    row = engine.preview(ts, o, h, l, c, v)     # 미완성 봉 피처 (상태 변경 없음)
+"""
+import math
+from collections import deque
+from datetime import date, datetime
+from typing import Any, Deque, Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from leverage_worker.data.minute_candle_repository import MinuteCandle
+
+_EPS = 1e-10
+
+_MA_WINDOWS = (3, 5, 10, 20, 30, 60)
+_RSI_PERIODS = (3, 7, 14)
+_STOCH_PERIODS = (7, 14)
+_RETURN_PERIODS = (1, 2, 3, 5, 10, 15, 20, 30)
+_VOLATILITY_WINDOWS = (5, 10, 20)
+_MOMENTUM_PERIODS = (5, 10, 20)
+_RANGE_WINDOWS = (5, 10, 20)
+_EXTREME_WINDOWS = tuple(sorted(set(_STOCH_PERIODS) | set(_RANGE_WINDOWS)))
+_MAX_LAG = max(_RETURN_PERIODS)
+# sync() 겹침 구간 검증용 반영 봉 이력 (CandleStore 종목별 보관 분봉 수)
+_SYNC_HISTORY = 600
+
+_ALPHA_12 = 2.0 / (12 + 1)
+_ALPHA_26 = 2.0 / (26 + 1)
+_ALPHA_9 = 2.0 / (9 + 1)
+
+
+def _pct(value: float, base: float) -> float:
+    """pandas pct_change와 동일 (0 나누기 시 inf/nan)"""
+    if base == 0:
+        if value == 0 or math.isnan(value):
+            return math.nan
+        return math.copysign(math.inf, value)
+    return value / base - 1
+
+
+class _RollingStats:
+    """
+    고정 크기 롤링 평균/표준편차 (pandas rolling(min_periods=1))
+
+    - None은 NaN으로 취급 (개수에서 제외)
+    - 기준값(ref) 차감 후 합/제곱합 누적 → 큰 값에서도 상쇄 오차 최소화
+    - 창이 한 바퀴 돌 때마다 합계를 재계산해 누적 오차 제거 (분할 상환 O(1))
+    """
+
+    __slots__ = ("_size", "_values", "_ref", "_sum", "_sumsq", "_count", "_pushes")
+
+    def __init__(self, size: int):
+        self._size = size
+        self._values: Deque[Optional[float]] = deque(maxlen=size)
+        self._ref: Optional[float] = None
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self._count = 0
+        self._pushes = 0
+
+    def push(self, x: Optional[float]) -> None:
+        """값 추가 (창 크기 초과분 제거)"""
+        if len(self._values) == self._size:
+            old = self._values[0]
+            if old is not None:
+                d = old - self._ref
+                self._sum -= d
+                self._sumsq -= d * d
+                self._count -= 1
+
+        self._values.append(x)
+        if x is not None:
+            if self._ref is None:
+                self._ref = x
+            d = x - self._ref
+            self._sum += d
+            self._sumsq += d * d
+            self._count += 1
+
+        self._pushes += 1
+        if self._pushes >= self._size:
+            self._recompute()
+
+    def _recompute(self) -> None:
+        """현재 창 기준으로 합계 재계산"""
+        self._pushes = 0
+        valid = [v for v in self._values if v is not None]
+        self._ref = valid[0] if valid else None
+        self._sum = 0.0
+        self._sumsq = 0.0
+        for v in valid:
+            d = v - self._ref
+            self._sum += d
+            self._sumsq += d * d
+        self._count = len(valid)
+
+    def _with(self, x: Optional[float]) -> Tuple[float, int, float, float]:
+        """기존 창의 최근 size-1개 + x 의 (ref, count, sum, sumsq)"""
+        ref = self._ref
+        if ref is None:
+            ref = x if x is not None else 0.0
+        s, sq, n = self._sum, self._sumsq, self._count
+
+        if len(self._values) == self._size:
+            old = self._values[0]
+            if old is not None:
+                d = old - ref
+                s -= d
+                sq -= d * d
+                n -= 1
+
+        if x is not None:
+            d = x - ref
+            s += d
+            sq += d * d
+            n += 1
+        return ref, n, s, sq
+
+    def mean_with(self, x: Optional[float]) -> float:
+        """x를 마지막 값으로 하는 창의 평균"""
+        ref, n, s, _ = self._with(x)
+        if n == 0:
+            return math.nan
+        return ref + s / n
+
+    def mean_std_with(self, x: Optional[float]) -> Tuple[float, float]:
+        """x를 마지막 값으로 하는 창의 (평균, 표본 표준편차)"""
+        ref, n, s, sq = self._with(x)
+        if n == 0:
+            return math.nan, math.nan
+        mean = ref + s / n
+        if n < 2:
+            return mean, math.nan
+        var = (sq - s * s / n) / (n - 1)
+        return mean, math.sqrt(var) if var > 0 else 0.0
+
+
+class _RollingExtreme:
+    """고정 크기 롤링 최고/최저 (단조 deque)"""
+
+    __slots__ = ("_size", "_is_max", "_deque", "_seq")
+
+    def __init__(self, size: int, is_max: bool):
+        self._size = size
+        self._is_max = is_max
+        self._deque: Deque[Tuple[int, float]] = deque()
+        self._seq = 0
+
+    def _dominates(self, a: float, b: float) -> bool:
+        return a >= b if self._is_max else a <= b
+
+    def push(self, x: float) -> None:
+        """값 추가"""
+        dq = self._deque
+        while dq and self._dominates(x, dq[-1][1]):
+            dq.pop()
+        dq.append((self._seq, x))
+        self._seq += 1
+        while dq[0][0] < self._seq - self._size:
+            dq.popleft()
+
+    def value_with(self, x: float) -> float:
+        """x를 마지막 값으로 하는 창의 최고/최저"""
+        dq = self._deque
+        if not dq:
+            return x
+        # 다음 봉 기준으로 창에서 빠지는 가장 오래된 값은 제외
+        head = dq[0]
+        if head[0] < self._seq - self._size + 1:
+            if len(dq) < 2:
+                return x
+            head = dq[1]
+        return head[1] if self._dominates(head[1], x) else x
+
+
+class IncrementalLimitOrderFeatures:
+    """
+    129개 피처 증분 계산기 (종목별 1개)
+
+    calculate_features(bars).iloc[-1]과 동일한 값을 봉 1개당 O(1)로 계산.
+    같은 봉 목록을 처음부터 입력하면 배치 결과와 일치 (부동소수 오차 범위).
+
+    전략에서는 sync()로 price_history와 동기화 (새 봉만 반영).
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """상태 초기화"""
+        self._bar_count = 0
+        self._last_timestamp: Optional[datetime] = None
+        # 반영한 분봉 (객체, 원본 값) - sync 시 겹침 구간 수정 여부 확인
+        self._history: Deque[Tuple[MinuteCandle, tuple]] = deque(maxlen=_SYNC_HISTORY)
+        self._last_row: Optional[Dict[str, float]] = None
+        self._closes: Deque[float] = deque(maxlen=_MAX_LAG)
+        self._prev_volume: Optional[float] = None
+
+        self._close_stats = {w: _RollingStats(w) for w in _MA_WINDOWS}
+        self._volume_stats = {w: _RollingStats(w) for w in _MA_WINDOWS}
+        self._gain_stats = {p: _RollingStats(p) for p in _RSI_PERIODS}
+        self._loss_stats = {p: _RollingStats(p) for p in _RSI_PERIODS}
+        self._stoch_k_stats = {p: _RollingStats(3) for p in _STOCH_PERIODS}
+        self._tr_stats = _RollingStats(14)
+        self._return_stats = {w: _RollingStats(w) for w in _VOLATILITY_WINDOWS}
+        self._high_max = {w: _RollingExtreme(w, True) for w in _EXTREME_WINDOWS}
+        self._low_min = {w: _RollingExtreme(w, False) for w in _EXTREME_WINDOWS}
+
+        self._ema_12: Optional[float] = None
+        self._ema_26: Optional[float] = None
+        self._macd_signal: Optional[float] = None
+        self._prev_macd: Optional[float] = None
+
+        self._consecutive_up = 0
+        self._consecutive_down = 0
+
+        self._date: Optional[date] = None
+        self._day_open = 0.0
+        self._day_high = 0.0
+        self._day_low = 0.0
+        self._day_volume = 0.0
+
+    @property
+    def bar_count(self) -> int:
+        """반영된 봉 개수"""
+        return self._bar_count
+
+    @property
+    def last_timestamp(self) -> Optional[datetime]:
+        """마지막으로 반영된 봉 시각"""
+        return self._last_timestamp
+
+    # ==========================================
+    # 입력
+    # ==========================================
+
+    def update(
+        self,
+        timestamp: datetime,
+        open_price: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+    ) -> Dict[str, float]:
+        """
+        완성 봉 반영
+
+        Returns:
+            해당 봉의 피처 dict (129개 피처 + open/high/low/close/volume)
+        """
+        # 분봉 객체 없이 반영 → sync()로 이어서 반영 불가
+        self._history.clear()
+        return self._apply(timestamp, open_price, high, low, close, volume)
+
+    def _apply(self, *values) -> Dict[str, float]:
+        row, pending = self._compute(*values)
+        self._commit(*values, pending)
+        self._last_row = row
+        return row
+
+    def preview(
+        self,
+        timestamp: datetime,
+        open_price: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+    ) -> Dict[str, float]:
+        """
+        다음 봉 피처 미리 계산 (상태 변경 없음, 미완성 봉 틱 단위 평가용)
+        """
+        row, _ = self._compute(timestamp, open_price, high, low, close, volume)
+        return row
+
+    def update_candle(self, candle: MinuteCandle) -> Dict[str, float]:
+        """MinuteCandle 반영 (candles_to_dataframe과 동일한 변환)"""
+        row = self._apply(*self.candle_values(candle))
+        self._history.append((candle, self._signature(candle)))
+        return row
+
+    def sync(self, candles: Sequence[MinuteCandle]) -> Optional[Dict[str, float]]:
+        """
+        분봉 목록(과거 → 최근)과 동기화 후 마지막 봉 피처 반환
+
+        - 마지막 반영 봉 이후의 봉만 반영 (보통 0~1개)
+        - 마지막 반영 봉이 목록에 없거나, 겹치는 구간(반영 이력 범위)의 봉이
+          수정/삽입된 경우 전체 재계산
+
+        Returns:
+            마지막 봉 피처 dict (분봉 없으면 None)
+        """
+        if not candles:
+            return None
+
+        start = self._find_resume_index(candles)
+        if start is None:
+            self.reset()
+            start = 0
+
+        for i in range(start, len(candles)):
+            self.update_candle(candles[i])
+        return self._last_row
+
+    def _find_resume_index(self, candles: Sequence[MinuteCandle]) -> Optional[int]:
+        """
+        마지막 반영 봉 다음 위치 (재사용 불가 시 None)
+
+        겹치는 구간은 뒤에서부터 반영 이력과 비교. CandleStore는 수정된 봉을 새 객체로
+        교체하므로 같은 객체면 값 비교 생략 (변경 없는 구간은 참조 비교만).
+        """
+        history = self._history
+        if not history:
+            return None
+        key = history[-1][0].candle_datetime
+
+        end = None
+        for i in range(len(candles) - 1, -1, -1):
+            candle_key = candles[i].candle_datetime
+            if candle_key == key:
+                end = i
+                break
+            if candle_key < key:
+                return None
+        if end is None:
+            return None
+
+        for k in range(1, min(end + 1, len(history)) + 1):
+            candle = candles[end + 1 - k]
+            seen, signature = history[-k]
+            if candle is seen:
+                continue
+            if self._signature(candle) != signature:
+                return None
+            history[-k] = (candle, signature)  # 같은 값의 새 객체 → 다음 비교는 참조로
+        return end + 1
+
+    @staticmethod
+    def _signature(candle: MinuteCandle) -> tuple:
+        """분봉 원본 값 (시각 + OHLCV)"""
+        return (
+            candle.candle_datetime,
+            candle.open_price,
+            candle.high_price,
+            candle.low_price,
+            candle.close_price,
+            candle.volume,
+        )
+
+    @staticmethod
+    def candle_values(
+        candle: MinuteCandle,
+    ) -> Tuple[datetime, float, float, float, float, float]:
+        """MinuteCandle → (timestamp, open, high, low, close, volume)"""
+        return (
+            datetime.strptime(candle.candle_datetime, "%Y-%m-%d %H:%M"),
+            float(candle.open_price),
+            float(candle.high_price),
+            float(candle.low_price),
+            float(candle.close_price),
+            float(int(candle.volume)),
+        )
+
+    @staticmethod
+    def to_vector(row: Mapping[str, Any], feature_cols: Sequence[str]) -> np.ndarray:
+        """피처 dict(또는 배치 모드 Series) → 모델 입력 (1, n) 배열"""
+        return np.array([[row[col] for col in feature_cols]], dtype=np.float64)
+
+    # ==========================================
+    # 계산
+    # ==========================================
+
+    def _compute(
+        self,
+        ts: datetime,
+        o: float,
+        h: float,
+        l: float,
+        c: float,
+        v: float,
+    ) -> Tuple[Dict[str, float], tuple]:
+        """현재 상태 + 새 봉으로 피처 계산 (상태 변경 없음)"""
+        nan = math.nan
+        closes = self._closes
+        pc = closes[-1] if closes else nan
+        f: Dict[str, float] = {
+            "open": o,
+            "high": h,
+            "low": l,
+            "close": c,
+            "volume": v,
+        }
+
+        # === 지정가 매수 특화 피처 ===
+        entry_price = pc * 0.999
+        f["prev_close"] = pc
+        f["low_vs_prev_close"] = (l - pc) / (pc + _EPS)
+        f["entry_price"] = entry_price
+        f["can_fill"] = int(l < entry_price)
+        f["fill_margin"] = (entry_price - l) / (pc + _EPS)
+        f["price_drop_from_prev"] = (c - pc) / (pc + _EPS)
+
+        # === 시간 피처 ===
+        hour = ts.hour
+        minute = ts.minute
+        minutes_since_open = (hour - 9) * 60 + minute
+        f["hour"] = hour
+        f["minute"] = minute
+        f["day_of_week"] = ts.weekday()
+        f["minutes_since_open"] = minutes_since_open
+        f["is_opening_30min"] = int(hour == 9 and minute < 30)
+        f["is_closing_30min"] = int(hour == 15 or (hour == 14 and minute >= 50))
+        f["is_morning"] = int(hour < 12)
+        f["is_afternoon"] = int(hour >= 12)
+        f["session_progress"] = minutes_since_open / 379
+        f["hour_sin"] = math.sin(2 * math.pi * hour / 24)
+        f["hour_cos"] = math.cos(2 * math.pi * hour / 24)
+        f["minute_sin"] = math.sin(2 * math.pi * minute / 60)
+        f["minute_cos"] = math.cos(2 * math.pi * minute / 60)
+
+        # === 가격 피처 ===
+        f["price_change"] = c - pc
+        f["price_change_pct"] = _pct(c, pc)
+        price_range = h - l
+        f["price_range"] = price_range
+        f["price_range_pct"] = price_range / (c + _EPS)
+
+        close_ma: Dict[int, Tuple[float, float]] = {}
+        for w in _MA_WINDOWS:
+            ma, std = self._close_stats[w].mean_std_with(c)
+            close_ma[w] = (ma, std)
+            f[f"price_ma_{w}"] = ma
+            f[f"price_std_{w}"] = std
+            f[f"price_vs_ma_{w}"] = (c - ma) / (ma + _EPS)
+            f[f"price_above_ma_{w}"] = int(c > ma)
+
+        # 일별 피처
+        day = ts.date()
+        if day != self._date:
+            day_open, day_high, day_low, day_volume = o, h, l, v
+        else:
+            day_open = self._day_open
+            day_high = max(self._day_high, h)
+            day_low = min(self._day_low, l)
+            day_volume = self._day_volume + v
+        daily_range = day_high - day_low
+        f["day_open"] = day_open
+        f["price_vs_day_open"] = (c - day_open) / (day_open + _EPS)
+        f["daily_high_so_far"] = day_high
+        f["daily_low_so_far"] = day_low
+        f["daily_range_so_far"] = daily_range
+        f["daily_position"] = (c - day_low) / (daily_range + _EPS)
+
+        # === 거래량 피처 ===
+        for w in _MA_WINDOWS:
+            ma, std = self._volume_stats[w].mean_std_with(v)
+            f[f"volume_ma_{w}"] = ma
+            f[f"volume_std_{w}"] = std
+            f[f"volume_ratio_{w}"] = v / (ma + _EPS)
+            f[f"volume_zscore_{w}"] = (v - ma) / (std + _EPS)
+
+        pv = self._prev_volume
+        f["volume_change_pct"] = _pct(v, pv) if pv is not None else nan
+        f["volume_surge"] = int(f["volume_ratio_20"] > 2.0)
+        f["volume_dry"] = int(f["volume_ratio_20"] < 0.5)
+        f["cumulative_volume"] = day_volume
+
+        # === 기술지표 ===
+        # RSI (첫 봉 delta NaN은 배치 구현과 같이 0으로 취급)
+        delta = c - pc
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        for p in _RSI_PERIODS:
+            avg_gain = self._gain_stats[p].mean_with(gain)
+            avg_loss = self._loss_stats[p].mean_with(loss)
+            rs = avg_gain / (avg_loss + _EPS)
+            f[f"rsi_{p}"] = 100 - (100 / (1 + rs))
+
+        # MACD
+        if self._ema_12 is None:
+            ema_12 = ema_26 = c
+        else:
+            ema_12 = (1 - _ALPHA_12) * self._ema_12 + _ALPHA_12 * c
+            ema_26 = (1 - _ALPHA_26) * self._ema_26 + _ALPHA_26 * c
+        macd = ema_12 - ema_26
+        if self._macd_signal is None:
+            macd_signal = macd
+        else:
+            macd_signal = (1 - _ALPHA_9) * self._macd_signal + _ALPHA_9 * macd
+        f["ema_12"] = ema_12
+        f["ema_26"] = ema_26
+        f["macd"] = macd
+        f["macd_signal"] = macd_signal
+        f["macd_hist"] = macd - macd_signal
+        f["macd_crossover"] = int(
+            self._prev_macd is not None
+            and macd > macd_signal
+            and self._prev_macd <= self._macd_signal
+        )
+
+        # Bollinger Bands
+        ma_20, std_20 = close_ma[20]
+        bb_upper = ma_20 + 2 * std_20
+        bb_lower = ma_20 - 2 * std_20
+        f["bb_upper_20"] = bb_upper
+        f["bb_lower_20"] = bb_lower
+        f["bb_width_20"] = (bb_upper - bb_lower) / (ma_20 + _EPS)
+        f["bb_position_20"] = (c - bb_lower) / (bb_upper - bb_lower + _EPS)
+
+        # Stochastic
+        stoch_k: Dict[int, float] = {}
+        for p in _STOCH_PERIODS:
+            low_min = self._low_min[p].value_with(l)
+            high_max = self._high_max[p].value_with(h)
+            k = (c - low_min) / (high_max - low_min + _EPS) * 100
+            stoch_k[p] = k
+            f[f"stoch_k_{p}"] = k
+            f[f"stoch_d_{p}"] = self._stoch_k_stats[p].mean_with(k)
+
+        # ATR (첫 봉 TR은 NaN → 평균에서 제외)
+        if closes:
+            tr: Optional[float] = max(h - l, abs(h - pc), abs(l - pc))
+        else:
+            tr = None
+        f["tr"] = tr if tr is not None else nan
+        atr = self._tr_stats.mean_with(tr)
+        f["atr_14"] = atr
+        f["atr_pct"] = atr / (c + _EPS)
+
+        # === 캔들 패턴 ===
+        body = c - o
+        full_range = h - l + _EPS
+        body_pct = abs(body) / full_range
+        is_bullish = int(c > o)
+        is_bearish = int(c < o)
+        consecutive_up = self._consecutive_up + 1 if is_bullish else 0
+        consecutive_down = self._consecutive_down + 1 if is_bearish else 0
+        f["candle_body_pct"] = body_pct
+        f["candle_upper_shadow_pct"] = (h - max(c, o)) / full_range
+        f["candle_lower_shadow_pct"] = (min(c, o) - l) / full_range
+        f["is_bullish"] = is_bullish
+        f["is_bearish"] = is_bearish
+        f["is_doji"] = int(body_pct < 0.1)
+        f["consecutive_up"] = consecutive_up
+        f["consecutive_down"] = consecutive_down
+
+        # === 수익률 피처 ===
+        n_closes = len(closes)
+        for p in _RETURN_PERIODS:
+            f[f"return_{p}"] = _pct(c, closes[-p]) if n_closes >= p else nan
+
+        return_1 = f["return_1"]
+        ret: Optional[float] = return_1 if math.isfinite(return_1) else None
+        for w in _VOLATILITY_WINDOWS:
+            _, std = self._return_stats[w].mean_std_with(ret)
+            f[f"volatility_{w}"] = std
+
+        for p in _MOMENTUM_PERIODS:
+            base = closes[-p] if n_closes >= p else nan
+            momentum = c - base
+            f[f"momentum_{p}"] = momentum
+            f[f"momentum_pct_{p}"] = momentum / (base + _EPS)
+
+        for w in _RANGE_WINDOWS:
+            high_max = self._high_max[w].value_with(h)
+            low_min = self._low_min[w].value_with(l)
+            f[f"dist_from_high_{w}"] = (high_max - c) / (c + _EPS)
+            f[f"dist_from_low_{w}"] = (c - low_min) / (c + _EPS)
+            f[f"price_position_{w}"] = (c - low_min) / (high_max - low_min + _EPS)
+
+        # NaN/Inf 처리 (배치 구현의 fillna(0) / replace(inf, 0))
+        for key, value in f.items():
+            if not math.isfinite(value):
+                f[key] = 0.0
+
+        pending = (
+            gain, loss, stoch_k, tr, ret,
+            ema_12, ema_26, macd, macd_signal,
+            consecutive_up, consecutive_down,
+            day, day_open, day_high, day_low, day_volume,
+        )
+        return f, pending
+
+    def _commit(
+        self,
+        ts: datetime,
+        o: float,
+        h: float,
+        l: float,
+        c: float,
+        v: float,
+        pending: tuple,
+    ) -> None:
+        """계산된 봉을 상태에 반영"""
+        (
+            gain, loss, stoch_k, tr, ret,
+            ema_12, ema_26, macd, macd_signal,
+            consecutive_up, consecutive_down,
+            day, day_open, day_high, day_low, day_volume,
+        ) = pending
+
+        for w in _MA_WINDOWS:
+            self._close_stats[w].push(c)
+            self._volume_stats[w].push(v)
+        for p in _RSI_PERIODS:
+            self._gain_stats[p].push(gain)
+            self._loss_stats[p].push(loss)
+        for p in _STOCH_PERIODS:
+            self._stoch_k_stats[p].push(stoch_k[p])
+        self._tr_stats.push(tr)
+        for w in _VOLATILITY_WINDOWS:
+            self._return_stats[w].push(ret)
+        for w in _EXTREME_WINDOWS:
+            self._high_max[w].push(h)
+            self._low_min[w].push(l)
+
+        self._ema_12 = ema_12
+        self._ema_26 = ema_26
+        self._prev_macd = macd
+        self._macd_signal = macd_signal
+
+        self._consecutive_up = consecutive_up
+        self._consecutive_down = consecutive_down
+
+        self._date = day
+        self._day_open = day_open
+        self._day_high = day_high
+        self._day_low = day_low
+        self._day_volume = day_volume
+
+        self._closes.append(c)
+        self._prev_volume = v
+        self._last_timestamp = ts
+        self._bar_count += 1
+
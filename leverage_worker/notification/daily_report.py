@@ -141,7 +141,7 @@ class DailyReportGenerator:
         # DB에서 당일 체결된 주문 조회 (부분 체결 후 취소된 주문도 포함)
         query = """
             SELECT * FROM orders
-            WHERE DATE(created_at) = ? AND filled_quantity > 0
+            WHERE trade_date = ? AND filled_quantity > 0
             ORDER BY created_at ASC
         """
 
@@ -396,7 +396,7 @@ class DailyReportGenerator:
         # 방법 1: orders 테이블의 pnl 필드 직접 사용
         query_direct = """
             SELECT COALESCE(SUM(pnl), 0) as total_pnl FROM orders
-            WHERE DATE(created_at) = ? AND status = 'filled' AND side = 'sell'
+            WHERE trade_date = ? AND status = 'filled' AND side = 'sell'
             AND pnl IS NOT NULL
         """
 
@@ -410,7 +410,7 @@ class DailyReportGenerator:
         # 방법 2: pnl 필드가 없으면 FIFO 방식으로 계산 (fallback)
         query = """
             SELECT * FROM orders
-            WHERE DATE(created_at) = ? AND status = 'filled' AND side = 'sell'
+            WHERE trade_date = ? AND status = 'filled' AND side = 'sell'
             ORDER BY created_at ASC
         """
 
@@ -0,0 +1,266 @@
+"""
+Slack 비동기 전송 큐
+
+매매 스레드는 enqueue만 하고 반환, 전용 스레드가 실제 HTTP 전송을 담당
+- 크기 제한 큐 + 초과 시 가장 오래된 메시지 폐기 (카운터 기록)
+- 채널별 최소 전송 간격 (Slack 채널당 약 1건/초 제한)
+- 짧은 구간에 몰린 메시지는 Block Kit 1건으로 병합 전송
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from leverage_worker.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Slack 제한: 메시지당 블록 50개, section 텍스트 3,000자
+MAX_BLOCKS_PER_MESSAGE = 50
+MAX_SECTION_TEXT = 3000
+MAX_MESSAGE_TEXT = 12000
+
+# 전송 함수: (채널, 텍스트, 블록) → 성공 여부
+SendFunc = Callable[[str, str, Optional[List[Dict]]], bool]
+
+
+@dataclass
+class SlackMessage:
+    """전송 대기 메시지"""
+
+    channel: str
+    text: str
+    blocks: Optional[List[Dict]] = None
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+    def as_blocks(self) -> List[Dict]:
+        """병합용 블록 (블록 없는 메시지는 section 1개)"""
+        if self.blocks:
+            return list(self.blocks)
+        return [
+            {
+                "type": "section",
+                "text": {"type": "mrkdwn", "text": self.text[:MAX_SECTION_TEXT]},
+            }
+        ]
+
+
+class SlackDeliveryQueue:
+    """
+    Slack 비동기 전송 워커
+
+    enqueue()는 잠금 1회 + deque append만 수행 (네트워크 대기 없음).
+    """
+
+    OVERFLOW_DROP_OLDEST = "drop_oldest"
+    OVERFLOW_DROP_NEWEST = "drop_newest"
+
+    def __init__(
+        self,
+        send: SendFunc,
+        max_queue: int = 500,
+        min_interval: float = 1.0,
+        batch_window: float = 0.2,
+        overflow: str = OVERFLOW_DROP_OLDEST,
+        name: str = "slack-delivery",
+    ):
+        """
+        Args:
+            send: 실제 전송 함수 (워커 스레드에서만 호출)
+            max_queue: 대기 메시지 최대 수
+            min_interval: 채널별 최소 전송 간격 (초)
+            batch_window: 첫 메시지 후 병합 대기 시간 (초)
+            overflow: 큐 초과 시 정책 (drop_oldest / drop_newest)
+        """
+        self._send = send
+        self._max_queue = max_queue
+        self._min_interval = min_interval
+        self._batch_window = batch_window
+        self._overflow = overflow
+        self._name = name
+
+        self._queue: Deque[SlackMessage] = deque()
+        self._cond = threading.Condition()
+        self._next_allowed: Dict[str, float] = {}
+        self._busy = False
+        self._running = False
+        self._closed = False  # stop() 이후 등록 거부
+        self._thread: Optional[threading.Thread] = None
+
+        # 카운터
+        self._stats: Dict[str, int] = {
+            "enqueued": 0,
+            "sent": 0,  # 전송된 원본 메시지 수
+            "batches": 0,  # 실제 HTTP 요청 수
+            "coalesced": 0,  # 병합으로 줄어든 요청 수
+            "failed": 0,
+            "dropped": 0,
+        }
+
+    def start(self) -> None:
+        """워커 스레드 시작"""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """남은 메시지 전송 후 종료 (종료 중에는 전송 간격/병합 대기 생략)"""
+        with self._cond:
+            self._closed = True
+            if not self._running:
+                return
+            self._running = False
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def enqueue(self, channel: str, text: str, blocks: Optional[List[Dict]] = None) -> bool:
+        """
+        메시지 등록 (비차단)
+
+        Returns:
+            True: 등록됨 / False: 큐 초과로 버려짐 (drop_newest) 또는 stop() 이후
+        """
+        message = SlackMessage(channel=channel, text=text, blocks=blocks)
+        with self._cond:
+            if self._closed:
+                return False
+            if len(self._queue) >= self._max_queue:
+                self._stats["dropped"] += 1
+                if self._overflow == self.OVERFLOW_DROP_NEWEST:
+                    return False
+                self._queue.popleft()
+            self._queue.append(message)
+            self._stats["enqueued"] += 1
+            self._cond.notify()
+        return True
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """대기 메시지가 모두 전송될 때까지 대기"""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._queue and not self._busy, timeout=timeout
+            )
+
+    @property
+    def closed(self) -> bool:
+        """stop() 호출 여부 (이후 enqueue는 거부)"""
+        with self._cond:
+            return self._closed
+
+    @property
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._queue)
+
+    def stats(self) -> Dict[str, int]:
+        """전송/병합/실패/폐기 카운터 + 대기 수"""
+        with self._cond:
+            return {**self._stats, "pending": len(self._queue)}
+
+    # ==========================================
+    # 워커
+    # ==========================================
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._running and not self._queue:
+                    self._cond.wait()
+                if not self._queue:
+                    return  # 정지 요청 + 큐 비어있음
+
+                channel = self._queue[0].channel
+                if self._running:
+                    # 채널 전송 간격 + 버스트 병합 대기 (전송 가능한 채널 우선)
+                    channel, ready_at = self._next_ready()
+                    wait = ready_at - time.monotonic()
+                    if wait > 0:
+                        self._cond.wait(wait)
+                        continue
+
+                batch = self._take_batch(channel)
+                self._busy = True
+
+            try:
+                self._deliver(channel, batch)
+            finally:
+                with self._cond:
+                    self._next_allowed[channel] = time.monotonic() + self._min_interval
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def _next_ready(self) -> Tuple[str, float]:
+        """가장 먼저 전송 가능한 (채널, 시각) - 채널별 첫 메시지 기준 (잠금 상태에서 호출)"""
+        best: Optional[Tuple[str, float]] = None
+        seen = set()
+        for message in self._queue:
+            if message.channel in seen:
+                continue
+            seen.add(message.channel)
+            ready_at = max(
+                self._next_allowed.get(message.channel, 0.0),
+                message.enqueued_at + self._batch_window,
+            )
+            if best is None or ready_at < best[1]:
+                best = (message.channel, ready_at)
+        return best
+
+    def _take_batch(self, channel: str) -> List[SlackMessage]:
+        """같은 채널 메시지를 블록/텍스트 한도 내에서 꺼냄 (잠금 상태에서 호출)"""
+        batch: List[SlackMessage] = []
+        blocks = 0
+        chars = 0
+        remaining: Deque[SlackMessage] = deque()
+        while self._queue:
+            message = self._queue.popleft()
+            if message.channel != channel:
+                remaining.append(message)
+                continue
+            size = len(message.as_blocks()) + (1 if batch else 0)  # + divider
+            if batch and (
+                blocks + size > MAX_BLOCKS_PER_MESSAGE
+                or chars + len(message.text) > MAX_MESSAGE_TEXT
+            ):
+                remaining.append(message)
+                remaining.extend(self._queue)
+                self._queue.clear()
+                break
+            batch.append(message)
+            blocks += size
+            chars += len(message.text)
+        remaining.extend(self._queue)
+        self._queue = remaining
+        return batch
+
+    def _deliver(self, channel: str, batch: List[SlackMessage]) -> None:
+        """1건은 그대로, 여러 건은 divider로 구분한 블록 1건으로 전송"""
+        if len(batch) == 1:
+            text, blocks = batch[0].text, batch[0].blocks
+        else:
+            text = "\n\n".join(message.text for message in batch)[:MAX_MESSAGE_TEXT]
+            blocks = []
+            for message in batch:
+                if blocks:
+                    blocks.append({"type": "divider"})
+                blocks.extend(message.as_blocks())
+
+        try:
+            ok = self._send(channel, text, blocks)
+        except Exception as e:
+            logger.error(f"Slack delivery error: {e}")
+            ok = False
+
+        with self._cond:
+            self._stats["batches"] += 1
+            self._stats["coalesced"] += len(batch) - 1
+            if ok:
+                self._stats["sent"] += len(batch)
+            else:
+                self._stats["failed"] += len(batch)
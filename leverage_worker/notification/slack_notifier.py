@@ -7,6 +7,8 @@ Slack 알림 전송 (두 가지 방식 지원)
 - 매매 알림
 - 오류 알림
 - 일일 리포트
+
+기본은 비동기 전송 (SlackDeliveryQueue): 호출 스레드는 큐 등록만 수행
 """
 
 import json
@@ -16,6 +18,7 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 
 import requests
 
+from leverage_worker.notification.slack_delivery import SlackDeliveryQueue
 from leverage_worker.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -35,6 +38,9 @@ class SlackNotifier:
         token: Optional[str] = None,
         channel: Optional[str] = None,
         is_paper_mode: bool = False,
+        async_delivery: bool = True,
+        max_queue: int = 500,
+        min_interval: float = 1.0,
     ):
         """
         Args:
@@ -42,6 +48,9 @@ class SlackNotifier:
             token: Slack Bot Token (xoxb-...)
             channel: Slack Channel ID (C...)
             is_paper_mode: 모의투자 모드 여부 (True면 메시지에 [모의] 표시)
+            async_delivery: 백그라운드 전송 큐 사용 여부 (False면 호출 스레드에서 전송)
+            max_queue: 전송 대기 메시지 최대 수 (초과 시 오래된 메시지 폐기)
+            min_interval: 채널별 최소 전송 간격 (초)
         """
         self._webhook_url = webhook_url
         self._token = token
@@ -61,6 +70,17 @@ class SlackNotifier:
         self._use_token = token is not None and channel is not None
         self._enabled = self._use_token or (webhook_url is not None and len(webhook_url) > 0)
 
+        # HTTP 커넥션 재사용 + 비동기 전송 큐
+        self._http = requests.Session()
+        self._delivery: Optional[SlackDeliveryQueue] = None
+        if self._enabled and async_delivery:
+            self._delivery = SlackDeliveryQueue(
+                lambda _channel, text, blocks: self._post(text, blocks),
+                max_queue=max_queue,
+                min_interval=min_interval,
+            )
+            self._delivery.start()
+
         if self._enabled:
             method = "Bot Token" if self._use_token else "Webhook"
             mode_str = "모의투자" if is_paper_mode else "실전투자"
@@ -85,12 +105,43 @@ class SlackNotifier:
             blocks: Block Kit 블록 (선택)
 
         Returns:
-            성공 여부
+            성공 여부 (비동기 전송 시 큐 등록 여부, close() 이후에는 동기 전송 결과)
         """
         if not self._enabled:
             logger.debug(f"Slack disabled, message not sent: {text[:50]}...")
             return False
 
+        if self._delivery is not None:
+            if self._delivery.enqueue(self._channel or "webhook", text, blocks):
+                return True
+            if not self._delivery.closed:
+                return False  # 큐 초과로 버려짐
+            # close() 이후 → 전송 워커 없음, 호출 스레드에서 직접 전송
+        return self._post(text, blocks)
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """대기 중인 메시지 전송 완료까지 대기"""
+        if self._delivery is None:
+            return True
+        return self._delivery.flush(timeout)
+
+    def close(self, timeout: float = 10.0) -> None:
+        """남은 메시지 전송 후 전송 워커/세션 종료"""
+        if self._delivery is not None:
+            self._delivery.stop(timeout)
+            stats = self._delivery.stats()
+            if stats["dropped"] or stats["failed"]:
+                logger.warning(f"Slack delivery stats: {stats}")
+        self._http.close()
+
+    def delivery_stats(self) -> Dict[str, int]:
+        """비동기 전송 카운터 (enqueued/sent/batches/coalesced/failed/dropped/pending)"""
+        if self._delivery is None:
+            return {}
+        return self._delivery.stats()
+
+    def _post(self, text: str, blocks: Optional[List[Dict]] = None) -> bool:
+        """실제 전송 (비동기 모드에서는 전송 워커 스레드 또는 close() 이후 호출 스레드)"""
         if self._use_token:
             return self._send_via_token(text, blocks)
         else:
@@ -103,7 +154,7 @@ class SlackNotifier:
             payload["blocks"] = blocks
 
         try:
-            response = requests.post(
+            response = self._http.post(
                 self._webhook_url,
                 data=json.dumps(payload),
                 headers={"Content-Type": "application/json"},
@@ -133,7 +184,7 @@ class SlackNotifier:
             payload["blocks"] = blocks
 
         try:
-            response = requests.post(
+            response = self._http.post(
                 "https://slack.com/api/chat.postMessage",
                 json=payload,
                 headers={
@@ -7,6 +7,7 @@ WebSocket 실시간 데이터 기반 P10 매수 → +0.1% 매도 반복 스캘
 from leverage_worker.scalping.models import ScalpingConfig, ScalpingSignalContext, ScalpingState
 from leverage_worker.scalping.price_tracker import PriceRangeTracker
 from leverage_worker.scalping.executor import ScalpingExecutor
+from leverage_worker.scalping.order_dispatcher import IntentKind, OrderDispatcher, OrderIntent
 
 __all__ = [
     "ScalpingConfig",
@@ -14,4 +15,7 @@ __all__ = [
     "ScalpingState",
     "PriceRangeTracker",
     "ScalpingExecutor",
+    "IntentKind",
+    "OrderDispatcher",
+    "OrderIntent",
 ]
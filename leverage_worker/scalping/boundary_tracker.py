@@ -11,6 +11,7 @@ from collections import deque
 from typing import Deque, Optional, Tuple
 
 from leverage_worker.utils.logger import get_logger
+from leverage_worker.utils.rolling import OrderStatistic
 
 logger = get_logger("scalping.boundary_tracker")
 
@@ -61,6 +62,8 @@ class AdaptiveBoundaryTracker:
 
         # 틱 데이터 (시간+가격 저장, 시간/틱 이중 윈도우)
         self._ticks: Deque[Tuple[float, int]] = deque()
+        # 틱 가격 순서 통계 (percentile 조회 시 정렬 없음)
+        self._order = OrderStatistic()
 
         # 바운더리 상태
         self._upper_boundary: Optional[int] = None
@@ -104,6 +107,7 @@ class AdaptiveBoundaryTracker:
             # 2. 틱 추가 (시간+가격)
             now = time.monotonic()
             self._ticks.append((now, price))
+            self._order.add(price)
 
             # 만료: 시간 윈도우 밖 + 틱 수 초과분 제거
             cutoff = now - self._boundary_window_seconds
@@ -111,7 +115,7 @@ class AdaptiveBoundaryTracker:
                 len(self._ticks) > self._boundary_window_ticks
                 and self._ticks[0][0] < cutoff
             ):
-                self._ticks.popleft()
+                self._order.remove(self._ticks.popleft()[1])
 
             # 3. 바운더리 재계산 (틱 수 OR 시간 윈도우 충족 시)
             time_span = now - self._ticks[0][0] if self._ticks else 0
@@ -177,15 +181,14 @@ class AdaptiveBoundaryTracker:
             바운더리 틱의 percentile_threshold 가격, 미확립 시 None
         """
         with self._lock:
-            if self._lower_boundary is None or len(self._ticks) == 0:
+            if self._lower_boundary is None or len(self._order) == 0:
                 return None
 
-            sorted_ticks = sorted(t[1] for t in self._ticks)
             idx = max(
                 0,
-                int(len(sorted_ticks) * self._percentile_threshold / 100.0) - 1,
+                int(len(self._order) * self._percentile_threshold / 100.0) - 1,
             )
-            return sorted_ticks[idx]
+            return self._order.kth(idx)
 
     def get_percentile_price(self, percentile: float) -> Optional[int]:
         """바운더리 틱의 N-th percentile 가격 반환
@@ -197,11 +200,10 @@ class AdaptiveBoundaryTracker:
             해당 퍼센타일 가격, 틱 없으면 None
         """
         with self._lock:
-            if len(self._ticks) == 0:
+            if len(self._order) == 0:
                 return None
-            sorted_ticks = sorted(t[1] for t in self._ticks)
-            idx = max(0, int(len(sorted_ticks) * percentile / 100.0) - 1)
-            return sorted_ticks[idx]
+            idx = max(0, int(len(self._order) * percentile / 100.0) - 1)
+            return self._order.kth(idx)
 
     def is_trading_allowed(self) -> bool:
         """
@@ -219,6 +221,7 @@ class AdaptiveBoundaryTracker:
         """
         with self._lock:
             self._ticks.clear()
+            self._order.clear()
             self._reset_boundary()
             self._breach_count = 0
             self._lower_boundary_history.clear()  # NEW: 히스토리도 초기화
@@ -255,18 +258,17 @@ class AdaptiveBoundaryTracker:
         prev_lower = self._lower_boundary
         prev_upper = self._upper_boundary
 
-        # 최근 → 과거 순서로 틱 리스트 생성 (reversed)
-        ticks_recent_first = list(reversed(self._ticks))
-
         valid_upper: Optional[int] = None
         valid_lower: Optional[int] = None
 
-        # 2틱부터 시작하여 과거로 확장
-        for i in range(2, len(ticks_recent_first) + 1):
-            window_prices = [t[1] for t in ticks_recent_first[:i]]
-
-            upper = max(window_prices)
-            lower = min(window_prices)
+        # 최근 → 과거로 1틱씩 확장하며 최고/최저 누적 (2틱부터 판정)
+        recent = reversed(self._ticks)
+        upper = lower = next(recent)[1]
+        for _, price in recent:
+            if price > upper:
+                upper = price
+            elif price < lower:
+                lower = price
             range_pct = (upper - lower) / lower if lower > 0 else 0
 
             if range_pct > self._max_boundary_range_pct:
@@ -279,9 +281,8 @@ class AdaptiveBoundaryTracker:
 
         # 전체 확장해도 0.2% 안 넘으면 전체 사용
         if valid_upper is None and self._ticks:
-            prices = [t[1] for t in self._ticks]
-            valid_upper = max(prices)
-            valid_lower = min(prices)
+            valid_upper = self._order.kth(-1)
+            valid_lower = self._order.kth(0)
 
         # 바운더리 설정
         if valid_upper is not None and valid_lower is not None:
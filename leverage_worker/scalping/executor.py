@@ -2,20 +2,33 @@
 스캘핑 실행기 (상태 머신)
 
 WebSocket tick 기반으로 P10 매수 → +0.1% 매도를 반복 실행
+
+주문 실행:
+- 상태 머신은 주문 intent만 발행하고, 상태 전환은 브로커 응답(ack) 콜백에서 수행
+- dispatcher 지정 시 REST 호출은 계좌 전용 스레드에서 실행 (WS tick 스레드 비차단)
+- intent 진행 중에는 tick은 tracker만 갱신, 체결통보/외부 명령은 보류 후 ack 완료 시 재생
+- dispatcher 미지정 시 즉시 실행 (기존 동기 동작과 동일)
 """
 
 import threading
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from leverage_worker.notification.daily_report import DailyReportGenerator
     from leverage_worker.trading.position_manager import PositionManager
+    from leverage_worker.trading.trade_ledger import TradeLedger
     from leverage_worker.websocket.ws_client import RealtimeWSClient
 
 from leverage_worker.notification.slack_notifier import SlackNotifier
 from leverage_worker.scalping.boundary_tracker import AdaptiveBoundaryTracker
 from leverage_worker.scalping.models import ScalpingConfig, ScalpingSignalContext, ScalpingState
+from leverage_worker.scalping.order_dispatcher import (
+    IntentKind,
+    OrderDispatcher,
+    OrderIntent,
+    execute_intent,
+)
 from leverage_worker.scalping.price_tracker import PriceRangeTracker
 from leverage_worker.trading.broker import KISBroker, OrderResult, OrderSide
 from leverage_worker.utils.logger import get_logger
@@ -30,6 +43,21 @@ _TICK_SIZE_TABLE = [
 ]
 
 
+# 청산 계열 보류 명령 (보류 중 진입 intent 발행 생략)
+_EXIT_COMMANDS = ("short_signal", "deactivate")
+
+
+def _is_entry_intent(intent: OrderIntent) -> bool:
+    """진입(매수) 주문 관련 intent 여부"""
+    return intent.kind == IntentKind.BUYABLE or (
+        intent.kind == IntentKind.PLACE_LIMIT and intent.side == OrderSide.BUY
+    )
+
+
+def _is_place_intent(intent: OrderIntent) -> bool:
+    return intent.kind in (IntentKind.PLACE_LIMIT, IntentKind.PLACE_MARKET)
+
+
 def round_to_tick_size(price: int, direction: str = "down") -> int:
     """
     KRX 호가 단위에 맞게 가격 반올림
@@ -71,6 +99,9 @@ class ScalpingExecutor:
         position_manager: Optional["PositionManager"] = None,
         trading_db: Optional["TradingDatabase"] = None,
         report_generator: Optional["DailyReportGenerator"] = None,
+        dispatcher: Optional[OrderDispatcher] = None,
+        trade_ledger: Optional["TradeLedger"] = None,
+        on_unclaimed_fill: Optional[Callable[[str, int, int, str], None]] = None,
     ) -> None:
         self._stock_code = stock_code
         self._stock_name = stock_name
@@ -83,6 +114,10 @@ class ScalpingExecutor:
         self._position_manager = position_manager
         self._db = trading_db
         self._report_generator = report_generator
+        # 당일 거래 원장 (OrderManager와 공유, 전략 거래 횟수 집계)
+        self._ledger = trade_ledger
+        # 보류했지만 자기 주문이 아닌 체결 반환 (TradingEngine이 다른 주문으로 재라우팅)
+        self._on_unclaimed_fill = on_unclaimed_fill
 
         # 상태
         self._state = ScalpingState.IDLE
@@ -137,8 +172,18 @@ class ScalpingExecutor:
         self._last_order_check_time: Optional[datetime] = None
         self._order_check_interval: float = 1.0  # 초 단위 (1초마다 balance 확인)
 
-        # 스레드 안전
+        # 주문 intent (dispatcher 없으면 동기 실행)
+        self._dispatcher = dispatcher
+        self._owner = f"{stock_code}:{strategy_name}"
+        self._inflight: int = 0  # 응답 대기 중 intent 수
+        self._inflight_places: int = 0  # 그중 주문 접수 (주문번호 미확정)
+        # intent 진행 중 보류된 체결통보 / 외부 명령 (이름별 최신 1건)
+        self._deferred_fills: List[Tuple[str, int, int]] = []
+        self._deferred_commands: Dict[str, Callable[[], None]] = {}
+
+        # 스레드 안전 (_settled: intent 정착 대기용)
         self._lock = threading.Lock()
+        self._settled = threading.Condition(self._lock)
 
     # ──────────────────────────────────────────
     # 외부 인터페이스
@@ -150,7 +195,7 @@ class ScalpingExecutor:
 
     @property
     def is_active(self) -> bool:
-        return self._state != ScalpingState.IDLE
+        return self._state != ScalpingState.IDLE or self._inflight > 0
 
     @property
     def signal_context(self) -> Optional[ScalpingSignalContext]:
@@ -165,7 +210,7 @@ class ScalpingExecutor:
     ) -> None:
         """시그널 활성화 → MONITORING 상태 진입"""
         with self._lock:
-            if self._state != ScalpingState.IDLE:
+            if self.is_active:
                 logger.warning(
                     f"[scalping][{self._stock_code}] "
                     f"시그널 무시: 이미 활성 상태 ({self._state.value})"
@@ -231,115 +276,152 @@ class ScalpingExecutor:
             quantity: 매수 수량 (0이면 allocation 기반 자동 계산)
 
         Returns:
-            주문 성공 여부
+            주문 요청 접수 여부 (dispatcher 사용 시 intent 등록 기준)
         """
         with self._lock:
-            # BUY_PENDING 상태: 시그널 갱신 (기존 주문 취소 후 재주문)
-            if self._state == ScalpingState.BUY_PENDING:
-                return self._update_pending_buy_order(
-                    buy_price, sell_price, timeout_seconds, quantity
-                )
-
-            if self._state != ScalpingState.IDLE:
-                logger.warning(
-                    f"[scalping][{self._stock_code}] "
-                    f"limit_order 무시: 이미 활성 상태 ({self._state.value})"
+            if self._inflight:
+                # 응답 대기 중: 완료 후 처리 (연속 시그널은 최신 1건으로 병합)
+                logger.info(
+                    f"[scalping][{self._stock_code}] limit_order 보류: 주문 응답 대기 중"
                 )
-                return False
-
-            # allocation 기반 수량 계산
-            if quantity <= 0:
-                buyable_qty, _ = self._broker.get_buyable_quantity(
-                    self._stock_code, buy_price
+                self._defer_command(
+                    "limit_order",
+                    lambda: self._activate_limit_order(
+                        buy_price, sell_price, timeout_seconds, quantity
+                    ),
                 )
-                if buyable_qty > 0:
-                    quantity = int(buyable_qty * (self._allocation / 100))
-                    if quantity < 1:
-                        quantity = 1
-                    logger.info(
-                        f"[scalping][{self._stock_code}] 수량 계산: "
-                        f"{buyable_qty}주 x {self._allocation}% = {quantity}주"
-                    )
-                else:
-                    logger.error(
-                        f"[scalping][{self._stock_code}] 매수가능수량 조회 실패"
-                    )
-                    return False
+                return True
+            return self._activate_limit_order(
+                buy_price, sell_price, timeout_seconds, quantity
+            )
 
-            # 컨텍스트 설정
-            timeout_minutes = max(1, timeout_seconds // 60)
-            self._signal_ctx = ScalpingSignalContext(
-                signal_price=buy_price,
-                signal_time=datetime.now(),
-                tp_pct=0.001,  # 참고용 (실제로는 sell_price 사용)
-                sl_pct=self._config.stop_loss_pct,  # config에서 SL% 설정 (기본 0.1%)
-                timeout_minutes=timeout_minutes,
+    def _activate_limit_order(
+        self,
+        buy_price: int,
+        sell_price: int,
+        timeout_seconds: int,
+        quantity: int,
+    ) -> bool:
+        """activate_limit_order 본체 (_lock 내에서 호출)"""
+        # BUY_PENDING 상태: 시그널 갱신 (기존 주문 취소 후 재주문)
+        if self._state == ScalpingState.BUY_PENDING:
+            self._update_pending_buy_order(
+                buy_price, sell_price, timeout_seconds, quantity
             )
-            # 메타데이터에 매도가/타임아웃 저장
-            self._signal_ctx.metadata["sell_price"] = sell_price
-            self._signal_ctx.metadata["timeout_seconds"] = timeout_seconds
-            self._signal_ctx.metadata["is_limit_order"] = True
+            return self.is_active
 
-            # 즉시 지정가 매수 주문 (MONITORING 건너뜀)
-            logger.info(
-                f"[scalping][{self._stock_name}] limit_order 매수 주문: "
-                f"buy_price={buy_price:,}, sell_price={sell_price:,}, "
-                f"qty={quantity}, timeout={timeout_seconds}초"
+        if self._state != ScalpingState.IDLE:
+            logger.warning(
+                f"[scalping][{self._stock_code}] "
+                f"limit_order 무시: 이미 활성 상태 ({self._state.value})"
             )
+            return False
 
-            try:
-                result = self._broker.place_limit_order(
-                    stock_code=self._stock_code,
-                    side=OrderSide.BUY,
-                    quantity=quantity,
-                    price=buy_price,
+        # allocation 기반 수량 계산
+        if quantity > 0:
+            self._place_limit_buy(buy_price, sell_price, timeout_seconds, quantity)
+            return self.is_active
+
+        def on_buyable(result: Tuple[int, int]) -> None:
+            buyable_qty, _ = result
+            if buyable_qty <= 0:
+                logger.error(
+                    f"[scalping][{self._stock_code}] 매수가능수량 조회 실패"
                 )
-            except Exception as e:
-                logger.error(f"[scalping][{self._stock_code}] 매수 주문 실패: {e}")
-                return False
+                return
+            qty = max(1, int(buyable_qty * (self._allocation / 100)))
+            logger.info(
+                f"[scalping][{self._stock_code}] 수량 계산: "
+                f"{buyable_qty}주 x {self._allocation}% = {qty}주"
+            )
+            self._place_limit_buy(buy_price, sell_price, timeout_seconds, qty)
 
-            if result and result.success:
-                self._buy_order_id = result.order_id
-                self._buy_order_branch = getattr(result, "branch_no", "01")
-                self._buy_order_price = buy_price
-                self._buy_order_qty = quantity
-                self._buy_order_time = datetime.now()
-                self._transition(ScalpingState.BUY_PENDING)
+        self._emit(IntentKind.BUYABLE, on_buyable, price=buy_price)
+        return self.is_active
 
-                # DB 저장
-                self._save_order_to_db(result.order_id, "BUY", quantity, buy_price)
+    def _set_limit_order_context(
+        self, buy_price: int, sell_price: int, timeout_seconds: int
+    ) -> None:
+        """limit_order 시그널 컨텍스트 설정"""
+        timeout_minutes = max(1, timeout_seconds // 60)
+        self._signal_ctx = ScalpingSignalContext(
+            signal_price=buy_price,
+            signal_time=datetime.now(),
+            tp_pct=0.001,  # 참고용 (실제로는 sell_price 사용)
+            sl_pct=self._config.stop_loss_pct,  # config에서 SL% 설정 (기본 0.1%)
+            timeout_minutes=timeout_minutes,
+        )
+        # 메타데이터에 매도가/타임아웃 저장
+        self._signal_ctx.metadata["sell_price"] = sell_price
+        self._signal_ctx.metadata["timeout_seconds"] = timeout_seconds
+        self._signal_ctx.metadata["is_limit_order"] = True
 
-                logger.info(
-                    f"[scalping][{self._stock_name}] limit_order 매수 주문 완료: "
-                    f"order_id={result.order_id}, "
-                    f"{buy_price:,}원 x {quantity}주"
-                )
+    def _place_limit_buy(
+        self,
+        buy_price: int,
+        sell_price: int,
+        timeout_seconds: int,
+        quantity: int,
+    ) -> None:
+        """limit_order 지정가 매수 intent 발행 (ack 시 BUY_PENDING 전환)"""
+        self._set_limit_order_context(buy_price, sell_price, timeout_seconds)
 
-                # Slack 알림
-                if self._slack:
-                    try:
-                        self._slack.notify_signal(
-                            stock_code=self._stock_code,
-                            stock_name=self._stock_name,
-                            signal_type="BUY",
-                            price=buy_price,
-                            strategy_name=self._strategy_name,
-                            reason=(
-                                f"지정가 매수 (목표 매도={sell_price:,}원, "
-                                f"타임아웃={timeout_seconds}초)"
-                            ),
-                            strategy_win_rate=None,
-                        )
-                    except Exception as e:
-                        logger.warning(f"[scalping] Slack 알림 실패: {e}")
+        # 즉시 지정가 매수 주문 (MONITORING 건너뜀)
+        logger.info(
+            f"[scalping][{self._stock_name}] limit_order 매수 주문: "
+            f"buy_price={buy_price:,}, sell_price={sell_price:,}, "
+            f"qty={quantity}, timeout={timeout_seconds}초"
+        )
 
-                return True
-            else:
+        def on_placed(result: OrderResult) -> None:
+            if not result.success:
                 logger.error(
                     f"[scalping][{self._stock_code}] limit_order 매수 주문 실패: "
                     f"result={result}"
                 )
-                return False
+                return
+
+            self._buy_order_id = result.order_id
+            self._buy_order_branch = getattr(result, "branch_no", "01")
+            self._buy_order_price = buy_price
+            self._buy_order_qty = quantity
+            self._buy_order_time = datetime.now()
+            self._transition(ScalpingState.BUY_PENDING)
+
+            # DB 저장
+            self._save_order_to_db(result.order_id, "BUY", quantity, buy_price)
+
+            logger.info(
+                f"[scalping][{self._stock_name}] limit_order 매수 주문 완료: "
+                f"order_id={result.order_id}, "
+                f"{buy_price:,}원 x {quantity}주"
+            )
+
+            # Slack 알림
+            if self._slack:
+                try:
+                    self._slack.notify_signal(
+                        stock_code=self._stock_code,
+                        stock_name=self._stock_name,
+                        signal_type="BUY",
+                        price=buy_price,
+                        strategy_name=self._strategy_name,
+                        reason=(
+                            f"지정가 매수 (목표 매도={sell_price:,}원, "
+                            f"타임아웃={timeout_seconds}초)"
+                        ),
+                        strategy_win_rate=None,
+                    )
+                except Exception as e:
+                    logger.warning(f"[scalping] Slack 알림 실패: {e}")
+
+        self._emit(
+            IntentKind.PLACE_LIMIT,
+            on_placed,
+            side=OrderSide.BUY,
+            quantity=quantity,
+            price=buy_price,
+        )
 
     def _update_pending_buy_order(
         self,
@@ -347,45 +429,77 @@ class ScalpingExecutor:
         sell_price: int,
         timeout_seconds: int,
         quantity: int = 0,
-    ) -> bool:
+    ) -> None:
         """
         BUY_PENDING 상태에서 새 시그널로 주문 갱신
 
         기존 매수 주문을 취소하고 새 가격으로 재주문.
         취소 중 체결이 발생하면 매도로 진행.
+        재주문 실패 시 IDLE로 복귀.
 
         Args:
             buy_price: 새 지정가 매수 가격
             sell_price: 새 지정가 매도 가격
             timeout_seconds: 타임아웃 (초)
             quantity: 매수 수량 (0이면 allocation 기반 자동 계산)
-
-        Returns:
-            True: 새 주문 접수 성공
-            False: 갱신 실패 (기존 상태 유지 또는 매도 진행)
         """
         # 이미 _lock 내에서 호출됨
-        old_order_id = self._buy_order_id
         old_price = self._buy_order_price
-        old_qty = self._buy_order_qty
 
         logger.info(
             f"[scalping][{self._stock_name}] BUY_PENDING 시그널 갱신: "
             f"{old_price:,} → {buy_price:,}원"
         )
 
-        # Step 1: 기존 주문 취소
-        self._cancel_buy_order()
+        def place(qty: int) -> None:
+            # Step 5: 컨텍스트 갱신
+            self._set_limit_order_context(buy_price, sell_price, timeout_seconds)
+
+            # Step 6: 새 주문 접수
+            def on_placed(result: OrderResult) -> None:
+                if not result.success:
+                    logger.error(f"[scalping][{self._stock_name}] 재주문 실패: {result}")
+                    self._reset_to_idle()
+                    return
+
+                self._buy_order_id = result.order_id
+                self._buy_order_branch = getattr(result, "branch_no", "01")
+                self._buy_order_price = buy_price
+                self._buy_order_qty = qty
+                self._buy_order_time = datetime.now()  # 타이머 리셋
 
-        # Step 2: 취소 후 최종 체결 상태 확인 (Race condition 방지)
-        if old_order_id:
-            filled_qty, _ = self._broker.get_order_status(
-                old_order_id,
-                stock_code=self._stock_code,
-                order_qty=old_qty,
+                # DB 저장
+                self._save_order_to_db(result.order_id, "BUY", qty, buy_price)
+
+                logger.info(
+                    f"[scalping][{self._stock_name}] 시그널 갱신 완료: "
+                    f"order_id={result.order_id}, {buy_price:,}원 x {qty}주"
+                )
+
+            self._emit(
+                IntentKind.PLACE_LIMIT,
+                on_placed,
                 side=OrderSide.BUY,
+                quantity=qty,
+                price=buy_price,
+            )
+
+        def on_buyable(result: Tuple[int, int]) -> None:
+            buyable_qty, _ = result
+            if buyable_qty <= 0:
+                logger.error(
+                    f"[scalping][{self._stock_name}] 매수가능수량 조회 실패"
+                )
+                self._reset_to_idle()
+                return
+            qty = max(1, int(buyable_qty * (self._allocation / 100)))
+            logger.info(
+                f"[scalping][{self._stock_code}] 수량 재계산: "
+                f"{buyable_qty}주 x {self._allocation}% = {qty}주"
             )
+            place(qty)
 
+        def on_confirmed(filled_qty: int) -> None:
             if filled_qty > 0:
                 # 체결 발생 → 매도 진행, 새 주문 취소
                 logger.info(
@@ -394,74 +508,19 @@ class ScalpingExecutor:
                 self._update_position(filled_qty, old_price)
                 self._clear_buy_order()
                 self._place_sell_order()
-                return False
+                return
 
-        # Step 3: 미체결 확인 → 이전 주문 정보 클리어
-        self._clear_buy_order()
+            # Step 3: 미체결 확인 → 이전 주문 정보 클리어
+            self._clear_buy_order()
 
-        # Step 4: 수량 계산
-        if quantity <= 0:
-            buyable_qty, _ = self._broker.get_buyable_quantity(
-                self._stock_code, buy_price
-            )
-            if buyable_qty > 0:
-                quantity = max(1, int(buyable_qty * (self._allocation / 100)))
-                logger.info(
-                    f"[scalping][{self._stock_code}] 수량 재계산: "
-                    f"{buyable_qty}주 x {self._allocation}% = {quantity}주"
-                )
+            # Step 4: 수량 계산
+            if quantity > 0:
+                place(quantity)
             else:
-                logger.error(
-                    f"[scalping][{self._stock_name}] 매수가능수량 조회 실패"
-                )
-                self._reset_to_idle()
-                return False
+                self._emit(IntentKind.BUYABLE, on_buyable, price=buy_price)
 
-        # Step 5: 컨텍스트 갱신
-        timeout_minutes = max(1, timeout_seconds // 60)
-        self._signal_ctx = ScalpingSignalContext(
-            signal_price=buy_price,
-            signal_time=datetime.now(),
-            tp_pct=0.001,
-            sl_pct=self._config.stop_loss_pct,  # config에서 SL% 설정 (기본 0.1%)
-            timeout_minutes=timeout_minutes,
-        )
-        self._signal_ctx.metadata["sell_price"] = sell_price
-        self._signal_ctx.metadata["timeout_seconds"] = timeout_seconds
-        self._signal_ctx.metadata["is_limit_order"] = True
-
-        # Step 6: 새 주문 접수
-        try:
-            result = self._broker.place_limit_order(
-                stock_code=self._stock_code,
-                side=OrderSide.BUY,
-                quantity=quantity,
-                price=buy_price,
-            )
-        except Exception as e:
-            logger.error(f"[scalping][{self._stock_name}] 재주문 실패: {e}")
-            self._reset_to_idle()
-            return False
-
-        if result and result.success:
-            self._buy_order_id = result.order_id
-            self._buy_order_branch = getattr(result, "branch_no", "01")
-            self._buy_order_price = buy_price
-            self._buy_order_qty = quantity
-            self._buy_order_time = datetime.now()  # 타이머 리셋
-
-            # DB 저장
-            self._save_order_to_db(result.order_id, "BUY", quantity, buy_price)
-
-            logger.info(
-                f"[scalping][{self._stock_name}] 시그널 갱신 완료: "
-                f"order_id={result.order_id}, {buy_price:,}원 x {quantity}주"
-            )
-            return True
-        else:
-            logger.error(f"[scalping][{self._stock_name}] 재주문 실패: {result}")
-            self._reset_to_idle()
-            return False
+        # Step 1-2: 기존 주문 취소 → 최종 체결 상태 확인 (Race condition 방지)
+        self._cancel_buy_and_confirm(on_confirmed)
 
     def handle_short_signal(self, short_price: int, reason: str) -> None:
         """
@@ -478,84 +537,97 @@ class ScalpingExecutor:
             - SELL_PENDING: 매도 주문 취소 + 시장가 매도
         """
         with self._lock:
-            # 사유에 따른 메시지 분류
-            if "익절" in reason:
-                signal_type = "전략 익절"
-                emoji = "📈"
-            elif "손절" in reason:
-                signal_type = "전략 손절"
-                emoji = "📉"
-            elif "반전" in reason or "하락" in reason or "SHORT" in reason.upper():
-                signal_type = "SHORT 반전"
-                emoji = "🔻"
-            else:
-                signal_type = "청산 시그널"
-                emoji = "⚠️"
+            if self._inflight:
+                # 응답 대기 중: 미전송 진입 주문은 철회, 나머지는 완료 후 청산
+                self._defer_command(
+                    "short_signal",
+                    lambda: self._handle_short_signal(short_price, reason),
+                )
+                return
+            self._handle_short_signal(short_price, reason)
+
+    def _handle_short_signal(self, short_price: int, reason: str) -> None:
+        """handle_short_signal 본체 (_lock 내에서 호출)"""
+        # 사유에 따른 메시지 분류
+        if "익절" in reason:
+            signal_type = "전략 익절"
+            emoji = "📈"
+        elif "손절" in reason:
+            signal_type = "전략 손절"
+            emoji = "📉"
+        elif "반전" in reason or "하락" in reason or "SHORT" in reason.upper():
+            signal_type = "SHORT 반전"
+            emoji = "🔻"
+        else:
+            signal_type = "청산 시그널"
+            emoji = "⚠️"
 
-            logger.warning(
-                f"[scalping][{self._stock_name}] {signal_type} 감지: "
-                f"가격={short_price:,}원, 사유={reason}, 상태={self._state.value}"
-            )
+        logger.warning(
+            f"[scalping][{self._stock_name}] {signal_type} 감지: "
+            f"가격={short_price:,}원, 사유={reason}, 상태={self._state.value}"
+        )
 
-            # Slack 알림
-            if self._slack:
-                try:
-                    self._slack.send_message(
-                        f"{emoji} [{self._stock_name}] {signal_type}\n"
-                        f"• 가격: {short_price:,}원\n"
-                        f"• 사유: {reason}\n"
-                        f"• 조치: 즉시 청산 ({self._state.value})"
-                    )
-                except Exception as e:
-                    logger.warning(f"[scalping] Slack 알림 실패: {e}")
+        # Slack 알림
+        if self._slack:
+            try:
+                self._slack.send_message(
+                    f"{emoji} [{self._stock_name}] {signal_type}\n"
+                    f"• 가격: {short_price:,}원\n"
+                    f"• 사유: {reason}\n"
+                    f"• 조치: 즉시 청산 ({self._state.value})"
+                )
+            except Exception as e:
+                logger.warning(f"[scalping] Slack 알림 실패: {e}")
 
-            if self._state == ScalpingState.MONITORING:
-                # DIP 바운더리 찾는 중 → 즉시 종료
-                self._handle_signal_expired(f"{signal_type}: {reason}", short_price)
+        exit_reason = f"{signal_type}: {reason}"
 
-            elif self._state == ScalpingState.BUY_PENDING:
-                # 매수 주문 대기 중 → 주문 취소 후 종료
-                if self._buy_order_id:
-                    self._cancel_buy_order()
-                    self._clear_buy_order()
-                self._handle_signal_expired(f"{signal_type}: {reason}", short_price)
+        if self._state == ScalpingState.MONITORING:
+            # DIP 바운더리 찾는 중 → 즉시 종료
+            self._handle_signal_expired(exit_reason, short_price)
 
-            elif self._state == ScalpingState.POSITION_HELD:
-                # 부분 체결 상태 → 주문 취소 + 포지션 매도
-                if self._buy_order_id:
-                    self._cancel_buy_order()
-                    # 취소 중 추가 체결 확인
-                    if self._buy_order_branch:
-                        filled_qty, _ = self._broker.get_order_status(
-                            self._buy_order_id,
-                            stock_code=self._stock_code,
-                            order_qty=self._buy_order_qty,
-                            side=OrderSide.BUY,
-                        )
-                        if filled_qty > self._held_qty:
-                            self._update_position(filled_qty, self._buy_order_price)
-                    self._clear_buy_order()
+        elif self._state == ScalpingState.BUY_PENDING:
+            # 매수 주문 대기 중 → 주문 취소 후 종료
+            if self._buy_order_id:
+                self._cancel_buy_order()
+                self._clear_buy_order()
+            self._handle_signal_expired(exit_reason, short_price)
 
+        elif self._state == ScalpingState.POSITION_HELD:
+            # 부분 체결 상태 → 주문 취소 + 포지션 매도
+            def liquidate() -> None:
                 # 포지션 시장가 매도
                 if self._held_qty > 0:
-                    self._market_sell_all(f"{signal_type}: {reason}")
+                    self._market_sell_all(exit_reason)
                 else:
-                    self._handle_signal_expired(f"{signal_type}: {reason}", short_price)
+                    self._handle_signal_expired(exit_reason, short_price)
 
-            elif self._state == ScalpingState.SELL_PENDING:
-                # 매도 주문 대기 중 → 기존 주문 취소 + 시장가 매도
-                if self._sell_order_id:
-                    self._cancel_sell_order()
-                    self._clear_sell_order()
+            def on_confirmed(filled_qty: int) -> None:
+                if filled_qty > self._held_qty:
+                    self._update_position(filled_qty, self._buy_order_price)
+                self._clear_buy_order()
+                liquidate()
 
-                # 포지션이 남아있으면 시장가 매도
-                if self._held_qty > 0:
-                    self._market_sell_all(f"{signal_type}: {reason}")
-                else:
-                    self._log_signal_summary()
-                    self._reset_to_idle()
+            if self._buy_order_id and self._buy_order_branch:
+                # 취소 중 추가 체결 확인
+                self._cancel_buy_and_confirm(on_confirmed)
+            else:
+                self._clear_buy_order()
+                liquidate()
 
-            # COOLDOWN은 무시 (이미 종료 과정 중)
+        elif self._state == ScalpingState.SELL_PENDING:
+            # 매도 주문 대기 중 → 기존 주문 취소 + 시장가 매도
+            if self._sell_order_id:
+                self._cancel_sell_order()
+                self._clear_sell_order()
+
+            # 포지션이 남아있으면 시장가 매도
+            if self._held_qty > 0:
+                self._market_sell_all(exit_reason)
+            else:
+                self._log_signal_summary()
+                self._reset_to_idle()
+
+        # COOLDOWN은 무시 (이미 종료 과정 중)
 
     def on_tick(self, price: int, timestamp: datetime) -> None:
         """
@@ -583,6 +655,10 @@ class ScalpingExecutor:
             # DEPRECATED: old tracker tick (backward compatibility)
             self._price_tracker.add_tick(timestamp, price)
 
+            # 주문 응답 대기 중: 판단은 ack 반영 후 다음 틱에서 (중복 intent 방지)
+            if self._inflight:
+                return
+
             # 시그널 수명 만료 체크 (SELL_PENDING 제외 - 이미 매도 진행 중)
             if self._signal_ctx and self._state != ScalpingState.SELL_PENDING:
                 expired, reason = self._signal_ctx.is_expired(timestamp, price)
@@ -614,29 +690,48 @@ class ScalpingExecutor:
                 self._handle_cooldown(price, timestamp)
 
     def process_ws_fill(
-        self, order_no: str, filled_qty: int, filled_price: int
+        self,
+        order_no: str,
+        filled_qty: int,
+        filled_price: int,
+        stock_code: Optional[str] = None,
     ) -> bool:
         """
         WebSocket 체결통보 처리 (TradingEngine에서 라우팅)
 
+        주문 응답 대기 중에는 보류 후 ack 반영이 끝나면 재생.
+        주문번호를 아직 모르는 체결(주문 ack보다 먼저 도착)도 종목코드가
+        일치하면 보류하고, 재생 시 자기 주문이 아니면 on_unclaimed_fill로 반환한다.
+
         Args:
             order_no: 주문번호
             filled_qty: 체결 수량
             filled_price: 체결 단가
+            stock_code: 종목코드 (ack 전 도착 체결 판별용)
 
         Returns:
             True if this executor handled the order, False otherwise
         """
         with self._lock:
-            # Check if this is our order
-            if order_no != self._buy_order_id and order_no != self._sell_order_id:
-                return False
+            is_ours = order_no in (self._buy_order_id, self._sell_order_id)
+            if self._inflight:
+                # 주문번호 미확정 체결: 주문 접수 응답 대기 중일 때만 보류
+                if not is_ours and not (
+                    self._inflight_places and stock_code == self._stock_code
+                ):
+                    return False
+                self._deferred_fills.append((order_no, filled_qty, filled_price))
+                return True
 
-            if order_no == self._buy_order_id:
-                return self._handle_ws_buy_fill(filled_qty, filled_price)
-            elif order_no == self._sell_order_id:
-                return self._handle_ws_sell_fill(filled_qty, filled_price)
+            return self._apply_ws_fill(order_no, filled_qty, filled_price)
 
+    def _apply_ws_fill(self, order_no: str, filled_qty: int, filled_price: int) -> bool:
+        """체결통보 반영 (_lock 내에서 호출)"""
+        # Check if this is our order
+        if order_no == self._buy_order_id:
+            return self._handle_ws_buy_fill(filled_qty, filled_price)
+        elif order_no == self._sell_order_id:
+            return self._handle_ws_sell_fill(filled_qty, filled_price)
         return False
 
     def _handle_ws_buy_fill(self, filled_qty: int, filled_price: int) -> bool:
@@ -657,7 +752,7 @@ class ScalpingExecutor:
 
         # DB 업데이트
         self._update_order_fill_in_db(
-            self._buy_order_id, self._held_qty, filled_price
+            self._buy_order_id, OrderSide.BUY, self._held_qty, filled_price
         )
 
         # Check if fully filled
@@ -765,7 +860,7 @@ class ScalpingExecutor:
 
         # DB 업데이트 (누적 체결 정보)
         self._update_order_fill_in_db(
-            self._sell_order_id, self._sold_qty, filled_price,
+            self._sell_order_id, OrderSide.SELL, self._sold_qty, filled_price,
             pnl=self._sold_pnl, avg_cost=self._held_avg_price,
             pnl_rate=((filled_price / self._held_avg_price) - 1) * 100 if self._held_avg_price > 0 else 0.0,
         )
@@ -839,16 +934,213 @@ class ScalpingExecutor:
                 pass
         return True
 
-    def deactivate(self) -> None:
-        """강제 종료 (일간 청산, 긴급 정지 등)"""
+    def deactivate(self, timeout: float = 30.0) -> None:
+        """
+        강제 종료 (일간 청산, 긴급 정지 등)
+
+        주문 정리/시장가 매도 응답까지 대기 후 반환 (최대 timeout초)
+        """
         with self._lock:
             logger.info(f"[scalping][{self._stock_name}] 강제 종료 시작")
-            self._cleanup_all_orders()
+            if self._inflight:
+                # 진행 중 intent 완료 후 종료 (보류된 재진입 명령은 폐기)
+                self._deferred_commands.clear()
+                self._defer_command("deactivate", self._deactivate)
+            else:
+                self._deactivate()
+
+            if not self._settled.wait_for(
+                lambda: self._inflight == 0 and not self._deferred_commands,
+                timeout=timeout,
+            ):
+                logger.error(
+                    f"[scalping][{self._stock_name}] 강제 종료 응답 대기 시간 초과 "
+                    f"({timeout:.0f}초, 대기 intent {self._inflight}건)"
+                )
+
+    def _deactivate(self) -> None:
+        """deactivate 본체 (_lock 내에서 호출)"""
+
+        def liquidate() -> None:
             if self._held_qty > 0:
                 self._market_sell_all("강제 종료", force_immediate=True)
             else:
                 self._reset_to_idle()
 
+        self._cleanup_all_orders(then=liquidate)
+
+    # ──────────────────────────────────────────
+    # 주문 intent
+    # ──────────────────────────────────────────
+
+    def _emit(
+        self,
+        kind: IntentKind,
+        on_done: Callable[[Any], None],
+        side: Optional[OrderSide] = None,
+        quantity: int = 0,
+        price: int = 0,
+        order_id: Optional[str] = None,
+        order_branch: Optional[str] = None,
+    ) -> None:
+        """
+        주문 intent 발행 (_lock 내에서 호출)
+
+        on_done(브로커 응답)은 _lock을 잡은 상태로 호출되며, 상태 전환은 여기서 수행.
+        dispatcher가 없으면 즉시 실행 (기존 동기 동작).
+        """
+        intent = OrderIntent(
+            owner=self._owner,
+            kind=kind,
+            stock_code=self._stock_code,
+            strategy_name=self._strategy_name,
+            side=side,
+            quantity=quantity,
+            price=price,
+            order_id=order_id,
+            order_branch=order_branch,
+        )
+        # 청산 대기 중 진입 주문은 발행하지 않음 (주문 → 취소 왕복 생략)
+        if _is_entry_intent(intent) and self._exit_pending():
+            logger.info(
+                f"[scalping][{self._stock_name}] 청산 대기 중 → 진입 주문 생략 "
+                f"({kind.value})"
+            )
+            return
+
+        self._inflight += 1
+        if _is_place_intent(intent):
+            self._inflight_places += 1
+
+        if self._dispatcher is None:
+            self._complete_intent(intent, on_done, execute_intent(self._broker, intent))
+            return
+
+        intent.on_done = lambda result: self._on_intent_done(intent, on_done, result)
+        if not self._dispatcher.submit(intent):
+            logger.debug(
+                f"[scalping][{self._stock_name}] 중복 intent 무시: {kind.value}"
+            )
+            self._release_intent(intent)
+
+    def _on_intent_done(
+        self, intent: OrderIntent, on_done: Callable[[Any], None], result: Any
+    ) -> None:
+        """브로커 응답 수신 (dispatcher 스레드)"""
+        with self._lock:
+            self._complete_intent(intent, on_done, result)
+
+    def _complete_intent(
+        self, intent: OrderIntent, on_done: Callable[[Any], None], result: Any
+    ) -> None:
+        """ack 반영 후 intent 완료 처리"""
+        try:
+            on_done(result)
+        except Exception as e:
+            logger.error(
+                f"[scalping][{self._stock_name}] {intent.kind.value} 응답 처리 실패: {e}"
+            )
+        finally:
+            self._release_intent(intent)
+
+    def _release_intent(self, intent: OrderIntent) -> None:
+        """intent 완료 → 모두 끝나면 보류 항목 재생"""
+        self._inflight -= 1
+        if _is_place_intent(intent):
+            self._inflight_places -= 1
+        if self._inflight == 0:
+            self._on_settled()
+
+    def _on_settled(self) -> None:
+        """
+        응답 대기 intent가 없을 때 보류 항목 재생
+
+        체결통보 → 외부 명령 순서. 재생 중 새 intent가 발행되면 다음 정착 시 이어서 처리.
+        """
+        unclaimed: List[Tuple[str, int, int]] = []
+        while self._inflight == 0 and self._deferred_fills:
+            fill = self._deferred_fills.pop(0)
+            if not self._apply_ws_fill(*fill):
+                unclaimed.append(fill)
+        if unclaimed:
+            self._return_unclaimed_fills(unclaimed)
+
+        while self._inflight == 0 and self._deferred_commands:
+            name = next(iter(self._deferred_commands))
+            command = self._deferred_commands.pop(name)
+            logger.info(f"[scalping][{self._stock_name}] 보류 명령 실행: {name}")
+            try:
+                command()
+            except Exception as e:
+                logger.error(f"[scalping][{self._stock_name}] 보류 명령 실패 ({name}): {e}")
+
+        if self._inflight == 0:
+            self._settled.notify_all()
+
+    def _return_unclaimed_fills(self, fills: List[Tuple[str, int, int]]) -> None:
+        """
+        자기 주문이 아닌 보류 체결을 TradingEngine에 반환 (같은 종목 다른 전략/추격 주문 등)
+
+        _lock을 잡은 채 다른 executor/OrderManager 락을 잡지 않도록 별도 스레드에서 전달.
+        """
+        if self._on_unclaimed_fill is None:
+            for order_no, _, _ in fills:
+                logger.debug(
+                    f"[scalping][{self._stock_name}] 보류 체결 무시 "
+                    f"(정리된 주문): {order_no}"
+                )
+            return
+
+        def _deliver() -> None:
+            for order_no, filled_qty, filled_price in fills:
+                try:
+                    self._on_unclaimed_fill(order_no, filled_qty, filled_price, self._stock_code)
+                except Exception as e:
+                    logger.error(
+                        f"[scalping][{self._stock_name}] 보류 체결 반환 실패 ({order_no}): {e}"
+                    )
+
+        threading.Thread(
+            target=_deliver, name=f"scalping-refill-{self._stock_code}", daemon=True
+        ).start()
+
+    def _defer_command(self, name: str, command: Callable[[], None]) -> None:
+        """
+        외부 명령 보류 (같은 이름은 최신 1건만 유지)
+
+        청산 명령이면 아직 전송되지 않은 진입 주문을 dispatcher 큐에서 철회.
+        """
+        self._deferred_commands[name] = command
+        if name not in _EXIT_COMMANDS or self._dispatcher is None:
+            return
+
+        withdrawn = self._dispatcher.withdraw(self._owner, _is_entry_intent)
+        if withdrawn:
+            logger.info(
+                f"[scalping][{self._stock_name}] 미전송 진입 주문 {len(withdrawn)}건 철회"
+            )
+        for intent in withdrawn:
+            self._release_intent(intent)
+
+    def _exit_pending(self) -> bool:
+        return any(name in self._deferred_commands for name in _EXIT_COMMANDS)
+
+    def _query_order_status(
+        self,
+        order_id: str,
+        side: OrderSide,
+        order_qty: int,
+        then: Callable[[int, int], None],
+    ) -> None:
+        """체결 상태 조회 intent → then(체결수량, 미체결수량)"""
+        self._emit(
+            IntentKind.STATUS,
+            lambda result: then(*result),
+            side=side,
+            quantity=order_qty,
+            order_id=order_id,
+        )
+
     # ──────────────────────────────────────────
     # 상태 핸들러
     # ──────────────────────────────────────────
@@ -921,32 +1213,37 @@ class ScalpingExecutor:
             )
             return
 
-        # 6. 매수 수량 결정
-        try:
-            buyable_qty, _ = self._broker.get_buyable_quantity(
-                self._stock_code, buy_price
-            )
+        # 6. 매수 수량 결정 → 7. 매수 주문
+        def on_buyable(result: Tuple[int, int]) -> None:
+            buyable_qty, _ = result
             if buyable_qty > 0:
                 quantity = int(buyable_qty * (self._allocation / 100))
                 if quantity < 1:
                     quantity = 1
             else:
                 quantity = self._config.position_size
-        except Exception as e:
-            quantity = self._config.position_size
-            logger.warning(
-                f"[scalping][{self._stock_name}] 수량 계산 실패 → "
-                f"fallback={quantity}"
+                logger.warning(
+                    f"[scalping][{self._stock_name}] 수량 계산 실패 → "
+                    f"fallback={quantity}"
+                )
+            self._emit(
+                IntentKind.PLACE_LIMIT,
+                lambda order: self._on_dip_buy_placed(order, buy_price, quantity, timestamp),
+                side=OrderSide.BUY,
+                quantity=quantity,
+                price=buy_price,
             )
 
-        # 7. 매수 주문
-        result = self._broker.place_limit_order(
-            stock_code=self._stock_code,
-            side=OrderSide.BUY,
-            quantity=quantity,
-            price=buy_price,
-        )
+        self._emit(IntentKind.BUYABLE, on_buyable, price=buy_price)
 
+    def _on_dip_buy_placed(
+        self,
+        result: OrderResult,
+        buy_price: int,
+        quantity: int,
+        timestamp: datetime,
+    ) -> None:
+        """DIP 매수 주문 ack → BUY_PENDING"""
         if result.success:
             self._buy_order_id = result.order_id
             self._buy_order_branch = result.order_branch
@@ -1031,13 +1328,17 @@ class ScalpingExecutor:
         self._last_order_check_time = timestamp
 
         # REST 체결 확인
-        filled_qty, unfilled_qty = self._broker.get_order_status(
+        self._query_order_status(
             self._buy_order_id,
-            stock_code=self._stock_code,
-            order_qty=self._buy_order_qty,
-            side=OrderSide.BUY,
+            OrderSide.BUY,
+            self._buy_order_qty,
+            lambda filled_qty, unfilled_qty: self._on_buy_status(
+                filled_qty, unfilled_qty, timestamp
+            ),
         )
 
+    def _on_buy_status(self, filled_qty: int, unfilled_qty: int, timestamp: datetime) -> None:
+        """BUY_PENDING REST 체결 확인 ack"""
         if filled_qty > self._held_qty:
             new_fills = filled_qty - self._held_qty
             self._update_position(filled_qty, self._buy_order_price)
@@ -1045,7 +1346,7 @@ class ScalpingExecutor:
 
             # DB 업데이트
             self._update_order_fill_in_db(
-                self._buy_order_id, filled_qty, self._buy_order_price
+                self._buy_order_id, OrderSide.BUY, filled_qty, self._buy_order_price
             )
 
             # Slack notification - REST buy fill
@@ -1094,51 +1395,68 @@ class ScalpingExecutor:
                 # REST fallback (throttled)
                 if self._last_order_check_time:
                     elapsed = (timestamp - self._last_order_check_time).total_seconds()
-                    if elapsed < self._order_check_interval:
-                        pass  # 다음 틱 대기
-                    else:
+                    if elapsed >= self._order_check_interval:
                         self._last_order_check_time = timestamp
-                        filled_qty, unfilled_qty = self._broker.get_order_status(
+                        # 매도 조건 확인은 체결 확인 ack 이후
+                        self._query_order_status(
                             self._buy_order_id,
-                            stock_code=self._stock_code,
-                            order_qty=self._buy_order_qty,
-                            side=OrderSide.BUY,
+                            OrderSide.BUY,
+                            self._buy_order_qty,
+                            lambda filled_qty, unfilled_qty: self._on_position_buy_status(
+                                filled_qty, unfilled_qty, price, timestamp
+                            ),
                         )
-                        if filled_qty > self._held_qty:
-                            new_fills = filled_qty - self._held_qty
-                            self._update_position(filled_qty, self._buy_order_price)
-                            logger.info(f"[REST 폴백] 추가 매수 체결: +{new_fills}주")
-
-                            # DB 업데이트 - 추가 매수 체결
-                            self._update_order_fill_in_db(
-                                self._buy_order_id, filled_qty, self._buy_order_price
-                            )
-
-                            # Slack notification - REST additional buy fill
-                            if self._slack:
-                                try:
-                                    self._slack.notify_fill(
-                                        fill_type="BUY",
-                                        stock_code=self._stock_code,
-                                        stock_name=self._stock_name,
-                                        quantity=new_fills,
-                                        price=self._buy_order_price,
-                                        strategy_name=self._strategy_name,
-                                    )
-                                except Exception as e:
-                                    logger.warning(f"[scalping] Slack 알림 실패: {e}")
-
-                        if unfilled_qty == 0:
-                            self._clear_buy_order()
-                            logger.info(
-                                f"[REST 폴백] 전량 매수 체결 → 즉시 매도 주문: "
-                                f"{self._held_qty}주 @ {self._held_avg_price:,.0f}원"
-                            )
-                            self._place_sell_order()
-                            return
+                        return
                 else:
                     self._last_order_check_time = timestamp
 
+        self._check_position_exit(price, timestamp)
+
+    def _on_position_buy_status(
+        self,
+        filled_qty: int,
+        unfilled_qty: int,
+        price: int,
+        timestamp: datetime,
+    ) -> None:
+        """POSITION_HELD REST 추가 체결 확인 ack → 매도 조건 확인"""
+        if filled_qty > self._held_qty:
+            new_fills = filled_qty - self._held_qty
+            self._update_position(filled_qty, self._buy_order_price)
+            logger.info(f"[REST 폴백] 추가 매수 체결: +{new_fills}주")
+
+            # DB 업데이트 - 추가 매수 체결
+            self._update_order_fill_in_db(
+                self._buy_order_id, OrderSide.BUY, filled_qty, self._buy_order_price
+            )
+
+            # Slack notification - REST additional buy fill
+            if self._slack:
+                try:
+                    self._slack.notify_fill(
+                        fill_type="BUY",
+                        stock_code=self._stock_code,
+                        stock_name=self._stock_name,
+                        quantity=new_fills,
+                        price=self._buy_order_price,
+                        strategy_name=self._strategy_name,
+                    )
+                except Exception as e:
+                    logger.warning(f"[scalping] Slack 알림 실패: {e}")
+
+        if unfilled_qty == 0:
+            self._clear_buy_order()
+            logger.info(
+                f"[REST 폴백] 전량 매수 체결 → 즉시 매도 주문: "
+                f"{self._held_qty}주 @ {self._held_avg_price:,.0f}원"
+            )
+            self._place_sell_order()
+            return
+
+        self._check_position_exit(price, timestamp)
+
+    def _check_position_exit(self, price: int, timestamp: datetime) -> None:
+        """POSITION_HELD 매도 조건 확인 (buy_timeout / TP / SL)"""
         if self._held_qty <= 0:
             # limit_order 모드: IDLE로 복귀
             if self._signal_ctx and self._signal_ctx.metadata.get("is_limit_order"):
@@ -1163,7 +1481,7 @@ class ScalpingExecutor:
                 )
                 self._cancel_buy_order()
                 self._clear_buy_order()
-                # return 없음 - 아래 TP/SL 체크 계속
+                # return 없음 - 아래 TP/SL 체크 계속 (취소 intent가 매도보다 먼저 전송됨)
 
         # +0.1% 매도 조건 확인
         sell_target = self._calculate_sell_price(self._held_avg_price)
@@ -1179,30 +1497,30 @@ class ScalpingExecutor:
                 # 매수 주문 남아있으면 먼저 취소 (일반 전략용)
                 if self._buy_order_id:
                     cancel_qty = self._buy_order_qty - self._held_qty
-                    self._cancel_buy_order()
 
-                    # 취소 후 최종 체결량 재확인 (취소 중 체결 가능)
-                    final_filled, _ = self._broker.get_order_status(
-                        self._buy_order_id,
-                        stock_code=self._stock_code,
-                        order_qty=self._buy_order_qty,
-                        side=OrderSide.BUY,
-                    )
-                    if final_filled > self._held_qty:
-                        self._update_position(final_filled, self._buy_order_price)
-                        logger.info(f"[취소 중 체결] +{final_filled - self._held_qty}주")
-
-                    # Slack 알림 - TP 매수 취소
-                    if self._slack:
-                        try:
-                            self._slack.send_message(
-                                f"📊 [{self._stock_name}] TP 도달 → 미체결 매수 취소\n"
-                                f"• 취소: {cancel_qty}주 / 체결: {self._held_qty}주\n"
-                                f"• 시장가 매도 진행"
-                            )
-                        except Exception:
-                            pass
-                    self._clear_buy_order()
+                    def on_confirmed(final_filled: int) -> None:
+                        # 취소 후 최종 체결량 재확인 (취소 중 체결 가능)
+                        if final_filled > self._held_qty:
+                            logger.info(f"[취소 중 체결] +{final_filled - self._held_qty}주")
+                            self._update_position(final_filled, self._buy_order_price)
+
+                        # Slack 알림 - TP 매수 취소
+                        if self._slack:
+                            try:
+                                self._slack.send_message(
+                                    f"📊 [{self._stock_name}] TP 도달 → 미체결 매수 취소\n"
+                                    f"• 취소: {cancel_qty}주 / 체결: {self._held_qty}주\n"
+                                    f"• 시장가 매도 진행"
+                                )
+                            except Exception:
+                                pass
+                        self._clear_buy_order()
+
+                        # 부분체결 상황 → 시장가 매도
+                        self._market_sell_all("부분체결 TP 도달")
+
+                    self._cancel_buy_and_confirm(on_confirmed)
+                    return
 
                 # 부분체결 상황 → 시장가 매도
                 self._market_sell_all("부분체결 TP 도달")
@@ -1309,13 +1627,23 @@ class ScalpingExecutor:
         self._last_order_check_time = timestamp
 
         # REST 체결 확인
-        filled_qty, unfilled_qty = self._broker.get_order_status(
+        self._query_order_status(
             self._sell_order_id,
-            stock_code=self._stock_code,
-            order_qty=self._sell_order_qty,
-            side=OrderSide.SELL,
+            OrderSide.SELL,
+            self._sell_order_qty,
+            lambda filled_qty, unfilled_qty: self._on_sell_status(
+                filled_qty, unfilled_qty, price, timestamp
+            ),
         )
 
+    def _on_sell_status(
+        self,
+        filled_qty: int,
+        unfilled_qty: int,
+        price: int,
+        timestamp: datetime,
+    ) -> None:
+        """SELL_PENDING REST 체결 확인 ack"""
         if unfilled_qty == 0 and filled_qty > 0:
             # Full sell fill via REST
 
@@ -1345,7 +1673,7 @@ class ScalpingExecutor:
 
             # DB 업데이트
             self._update_order_fill_in_db(
-                self._sell_order_id, filled_qty, sell_price,
+                self._sell_order_id, OrderSide.SELL, filled_qty, sell_price,
                 pnl=total_pnl, avg_cost=self._held_avg_price, pnl_rate=profit_pct,
             )
 
@@ -1405,7 +1733,7 @@ class ScalpingExecutor:
 
             # DB 업데이트
             self._update_order_fill_in_db(
-                self._sell_order_id, self._sold_qty, sell_price,
+                self._sell_order_id, OrderSide.SELL, self._sold_qty, sell_price,
                 pnl=self._sold_pnl, avg_cost=self._held_avg_price,
                 pnl_rate=((sell_price / self._held_avg_price) - 1) * 100 if self._held_avg_price > 0 else 0.0,
             )
@@ -1519,19 +1847,20 @@ class ScalpingExecutor:
         # SL 도달인 경우
         is_sl = "SL" in reason
 
-        # 미체결 주문 정리
-        self._cleanup_all_orders()
-
-        # 포지션 보유 시 처리
-        if self._held_qty > 0:
-            if is_sl:
-                self._market_sell_all(f"시그널 SL: {reason}")
+        def liquidate() -> None:
+            # 포지션 보유 시 처리
+            if self._held_qty > 0:
+                if is_sl:
+                    self._market_sell_all(f"시그널 SL: {reason}")
+                else:
+                    # TP 또는 타임아웃: 포지션 없으면 바로 종료, 있으면 시장가 매도
+                    self._market_sell_all(f"시그널 만료: {reason}")
             else:
-                # TP 또는 타임아웃: 포지션 없으면 바로 종료, 있으면 시장가 매도
-                self._market_sell_all(f"시그널 만료: {reason}")
-        else:
-            self._log_signal_summary()
-            self._reset_to_idle()
+                self._log_signal_summary()
+                self._reset_to_idle()
+
+        # 미체결 주문 정리 → 포지션 처리
+        self._cleanup_all_orders(then=liquidate)
 
     # ──────────────────────────────────────────
     # 주문 관리 헬퍼
@@ -1554,13 +1883,16 @@ class ScalpingExecutor:
         else:
             sell_price = self._calculate_sell_price(self._held_avg_price)
 
-        result = self._broker.place_limit_order(
-            stock_code=self._stock_code,
+        self._emit(
+            IntentKind.PLACE_LIMIT,
+            lambda result: self._on_sell_placed(result, sell_price),
             side=OrderSide.SELL,
             quantity=self._held_qty,
             price=sell_price,
         )
 
+    def _on_sell_placed(self, result: OrderResult, sell_price: int) -> None:
+        """지정가 매도 주문 ack → SELL_PENDING (실패 시 시장가)"""
         if result.success:
             self._sell_order_id = result.order_id
             self._sell_order_branch = result.order_branch
@@ -1634,12 +1966,17 @@ class ScalpingExecutor:
             except Exception as e:
                 logger.warning(f"[scalping] Slack 알림 실패: {e}")
 
-        result = self._broker.place_market_order(
-            stock_code=self._stock_code,
+        self._emit(
+            IntentKind.PLACE_MARKET,
+            lambda result: self._on_market_sell_placed(result, sell_qty, force_immediate),
             side=OrderSide.SELL,
             quantity=sell_qty,
         )
 
+    def _on_market_sell_placed(
+        self, result: OrderResult, sell_qty: int, force_immediate: bool
+    ) -> None:
+        """시장가 매도 주문 ack → SELL_PENDING (force_immediate면 즉시 IDLE)"""
         if result.success:
             # DB 저장 (시장가)
             self._save_order_to_db(
@@ -1649,7 +1986,7 @@ class ScalpingExecutor:
             if force_immediate:
                 # 비상 경로: 즉시 처리 (deactivate 등)
                 self._update_order_fill_in_db(
-                    result.order_id, sell_qty, 0,
+                    result.order_id, OrderSide.SELL, sell_qty, 0,
                     pnl=self._sold_pnl, avg_cost=self._held_avg_price, pnl_rate=0.0,
                 )
                 self._record_cycle_complete(self._sold_pnl)
@@ -1691,56 +2028,69 @@ class ScalpingExecutor:
             self._log_signal_summary()
             self._reset_to_idle()
 
-    def _cancel_buy_order(self) -> bool:
-        """매수 주문 취소"""
+    def _cancel_buy_order(self) -> None:
+        """매수 주문 취소 intent (응답은 로그만, FIFO로 이후 intent보다 먼저 전송)"""
         if not self._buy_order_id or not self._buy_order_branch:
-            return True
+            return
+
+        def on_cancelled(success: bool) -> None:
+            if success:
+                logger.info(f"[scalping][{self._stock_name}] 매수 주문 취소 완료")
+            else:
+                logger.warning(
+                    f"[scalping][{self._stock_name}] 매수 주문 취소 실패 (체결되었을 수 있음)"
+                )
 
-        success = self._broker.cancel_order(
+        self._emit(
+            IntentKind.CANCEL,
+            on_cancelled,
+            quantity=self._buy_order_qty,
             order_id=self._buy_order_id,
             order_branch=self._buy_order_branch,
-            quantity=self._buy_order_qty,
         )
-        if success:
-            logger.info(f"[scalping][{self._stock_name}] 매수 주문 취소 완료")
-        else:
-            logger.warning(
-                f"[scalping][{self._stock_name}] 매수 주문 취소 실패 (체결되었을 수 있음)"
-            )
-        return success
 
-    def _cancel_sell_order(self) -> bool:
-        """매도 주문 취소"""
+    def _cancel_sell_order(self) -> None:
+        """매도 주문 취소 intent (응답은 로그만, FIFO로 이후 intent보다 먼저 전송)"""
         if not self._sell_order_id or not self._sell_order_branch:
-            return True
+            return
+
+        def on_cancelled(success: bool) -> None:
+            if success:
+                logger.info(f"[scalping][{self._stock_name}] 매도 주문 취소 완료")
+            else:
+                logger.warning(
+                    f"[scalping][{self._stock_name}] 매도 주문 취소 실패 (체결되었을 수 있음)"
+                )
 
-        success = self._broker.cancel_order(
+        self._emit(
+            IntentKind.CANCEL,
+            on_cancelled,
+            quantity=self._sell_order_qty,
             order_id=self._sell_order_id,
             order_branch=self._sell_order_branch,
-            quantity=self._sell_order_qty,
         )
-        if success:
-            logger.info(f"[scalping][{self._stock_name}] 매도 주문 취소 완료")
-        else:
-            logger.warning(
-                f"[scalping][{self._stock_name}] 매도 주문 취소 실패 (체결되었을 수 있음)"
-            )
-        return success
+
+    def _cancel_buy_and_confirm(self, then: Callable[[int], None]) -> None:
+        """매수 주문 취소 → 최종 체결 수량 확인 → then(체결수량)"""
+        if not self._buy_order_id:
+            then(0)
+            return
+
+        self._cancel_buy_order()
+        self._query_order_status(
+            self._buy_order_id,
+            OrderSide.BUY,
+            self._buy_order_qty,
+            lambda filled_qty, _unfilled: then(filled_qty),
+        )
 
     def _cancel_buy_and_return_to_monitoring(self) -> None:
         """매수 취소 후 복귀 (limit_order는 IDLE, 일반은 MONITORING)"""
         cancel_qty = self._buy_order_qty
         cancel_price = self._buy_order_price
-        self._cancel_buy_order()
 
-        # 취소 후 최종 체결 상태 확인
-        if self._buy_order_id:
-            filled_qty, _ = self._broker.get_order_status(
-                self._buy_order_id,
-                stock_code=self._stock_code,
-                order_qty=self._buy_order_qty,
-                side=OrderSide.BUY,
-            )
+        def on_confirmed(filled_qty: int) -> None:
+            # 취소 후 최종 체결 상태 확인
             if filled_qty > 0:
                 self._update_position(filled_qty, self._buy_order_price)
                 self._clear_buy_order()
@@ -1748,63 +2098,46 @@ class ScalpingExecutor:
                 self._place_sell_order()
                 return
 
-        self._clear_buy_order()
+            self._clear_buy_order()
 
-        # limit_order 모드: IDLE로 복귀 (boundary_tracker 미사용, 다음 신호 대기)
-        if self._signal_ctx and self._signal_ctx.metadata.get("is_limit_order"):
-            logger.info(
-                f"[scalping][{self._stock_name}] limit_order 매수 미체결 → IDLE"
-            )
+            # limit_order 모드: IDLE로 복귀 (boundary_tracker 미사용, 다음 신호 대기)
+            if self._signal_ctx and self._signal_ctx.metadata.get("is_limit_order"):
+                logger.info(
+                    f"[scalping][{self._stock_name}] limit_order 매수 미체결 → IDLE"
+                )
+                if self._slack:
+                    try:
+                        self._slack.send_message(
+                            f"⏱️ [{self._stock_name}] 매수 미체결 취소\n"
+                            f"• {cancel_price:,}원 x {cancel_qty}주\n"
+                            f"• 다음 신호 대기 중"
+                        )
+                    except Exception:
+                        pass
+                self._log_signal_summary()
+                self._reset_to_idle()
+                return
+
+            # 기존 scalping: MONITORING으로 복귀 (바운더리 재탐색)
+            self._transition(ScalpingState.MONITORING)
+
+            # Slack 알림 - 매수 타임아웃 취소
             if self._slack:
                 try:
                     self._slack.send_message(
-                        f"⏱️ [{self._stock_name}] 매수 미체결 취소\n"
-                        f"• {cancel_price:,}원 x {cancel_qty}주\n"
-                        f"• 다음 신호 대기 중"
+                        f"⏱️ [{self._stock_name}] 매수 주문 타임아웃 취소\n"
+                        f"• {cancel_price:,}원 x {cancel_qty}주 → 미체결 취소\n"
+                        f"• 바운더리 재탐색 중"
                     )
                 except Exception:
                     pass
-            self._log_signal_summary()
-            self._reset_to_idle()
-            return
 
-        # 기존 scalping: MONITORING으로 복귀 (바운더리 재탐색)
-        self._transition(ScalpingState.MONITORING)
-
-        # Slack 알림 - 매수 타임아웃 취소
-        if self._slack:
-            try:
-                self._slack.send_message(
-                    f"⏱️ [{self._stock_name}] 매수 주문 타임아웃 취소\n"
-                    f"• {cancel_price:,}원 x {cancel_qty}주 → 미체결 취소\n"
-                    f"• 바운더리 재탐색 중"
-                )
-            except Exception:
-                pass
+        self._cancel_buy_and_confirm(on_confirmed)
 
-    def _cleanup_all_orders(self) -> None:
-        """모든 미체결 주문 취소"""
-        if self._buy_order_id:
-            self._cancel_buy_order()
-            # 취소 중 체결 확인
-            filled_qty, _ = self._broker.get_order_status(
-                self._buy_order_id,
-                stock_code=self._stock_code,
-                order_qty=self._buy_order_qty,
-                side=OrderSide.BUY,
-            )
-            if filled_qty > self._held_qty:
-                self._update_position(filled_qty, self._buy_order_price)
-            self._clear_buy_order()
+    def _cleanup_all_orders(self, then: Callable[[], None]) -> None:
+        """모든 미체결 주문 취소 (취소 중 체결 반영 후 then 호출)"""
 
-        if self._sell_order_id:
-            self._cancel_sell_order()
-            filled_qty, _ = self._broker.get_order_status(
-                self._sell_order_id,
-                stock_code=self._stock_code,
-                order_qty=self._sell_order_qty,
-                side=OrderSide.SELL,
-            )
+        def on_sell_confirmed(filled_qty: int, _unfilled: int) -> None:
             # REST에서 확인한 추가 체결 (WS에서 미처리분만)
             new_fills = max(0, filled_qty - self._sold_qty)
             if new_fills > 0:
@@ -1820,6 +2153,7 @@ class ScalpingExecutor:
                 pnl_rate = ((sell_price / self._held_avg_price) - 1) * 100 if self._held_avg_price > 0 else 0.0
                 self._update_order_fill_in_db(
                     self._sell_order_id,
+                    OrderSide.SELL,
                     filled_qty,
                     sell_price,
                     pnl=self._sold_pnl,
@@ -1844,6 +2178,31 @@ class ScalpingExecutor:
                 self._clear_position()
 
             self._clear_sell_order()
+            then()
+
+        def cleanup_sell() -> None:
+            if not self._sell_order_id:
+                then()
+                return
+            self._cancel_sell_order()
+            self._query_order_status(
+                self._sell_order_id,
+                OrderSide.SELL,
+                self._sell_order_qty,
+                on_sell_confirmed,
+            )
+
+        def on_buy_confirmed(filled_qty: int) -> None:
+            # 취소 중 체결 확인
+            if filled_qty > self._held_qty:
+                self._update_position(filled_qty, self._buy_order_price)
+            self._clear_buy_order()
+            cleanup_sell()
+
+        if self._buy_order_id:
+            self._cancel_buy_and_confirm(on_buy_confirmed)
+        else:
+            cleanup_sell()
 
     # ──────────────────────────────────────────
     # 포지션 / 상태 관리 헬퍼
@@ -1976,7 +2335,8 @@ class ScalpingExecutor:
         """스캘핑 주문 DB 저장"""
         if not self._db:
             return
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        created = datetime.now()
+        now = created.strftime("%Y-%m-%d %H:%M:%S")
         try:
             with self._db.get_cursor() as cursor:
                 cursor.execute(
@@ -1984,8 +2344,8 @@ class ScalpingExecutor:
                     INSERT OR IGNORE INTO orders
                     (order_id, stock_code, stock_name, side, order_type,
                      quantity, price, filled_quantity, filled_price,
-                     status, strategy_name, created_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, 0, 0, 'submitted', ?, ?, ?)
+                     status, strategy_name, trade_date, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, 0, 0, 'submitted', ?, ?, ?, ?)
                     """,
                     (
                         order_id,
@@ -1996,6 +2356,7 @@ class ScalpingExecutor:
                         quantity,
                         price,
                         self._strategy_name,
+                        created.strftime("%Y-%m-%d"),
                         now,
                         now,
                     ),
@@ -2006,13 +2367,14 @@ class ScalpingExecutor:
     def _update_order_fill_in_db(
         self,
         order_id: str,
+        side: OrderSide,
         filled_qty: int,
         filled_price: int,
         pnl: Optional[int] = None,
         avg_cost: Optional[float] = None,
         pnl_rate: Optional[float] = None,
     ) -> None:
-        """주문 체결 정보 DB 업데이트"""
+        """주문 체결 정보 DB 업데이트 (+ 당일 거래 원장 반영)"""
         if not self._db or not order_id:
             return
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -2039,6 +2401,10 @@ class ScalpingExecutor:
                 )
         except Exception as e:
             logger.warning(f"[scalping] 주문 체결 DB 업데이트 실패: {e}")
+            return
+
+        if self._ledger:
+            self._ledger.record_fill(order_id, self._stock_code, side.value)
 
     def _transition(self, new_state: ScalpingState) -> None:
         """상태 전환 (로그 포함)"""
@@ -0,0 +1,249 @@
+"""
+스캘핑 주문 디스패처
+
+ScalpingExecutor 상태 머신이 발행한 주문 intent를 계좌 단위 전용 스레드에서
+순차 실행하고, 결과(ack)를 콜백으로 돌려준다.
+
+- WS tick 콜백 스레드는 intent 등록만 하고 즉시 반환 (REST 대기 없음)
+- 계좌 단위 FIFO: 같은 executor가 연속 발행한 취소 → 주문 순서 보장
+- 미전송 intent 중복 제거 / 철회(withdraw)로 취소·정정 병합
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+from leverage_worker.trading.broker import KISBroker, OrderResult, OrderSide
+from leverage_worker.utils.latency import STAGE_ORDER_QUEUE, get_latency_recorder
+from leverage_worker.utils.logger import get_logger
+
+logger = get_logger("scalping.dispatcher")
+
+
+class IntentKind(Enum):
+    """주문 intent 종류"""
+
+    BUYABLE = "buyable"  # 매수가능수량 조회 → (수량, 금액)
+    PLACE_LIMIT = "place_limit"  # 지정가 주문 → OrderResult
+    PLACE_MARKET = "place_market"  # 시장가 주문 → OrderResult
+    CANCEL = "cancel"  # 주문 취소 → bool
+    STATUS = "status"  # 체결 상태 조회 → (체결수량, 미체결수량)
+
+
+@dataclass
+class OrderIntent:
+    """
+    주문 intent (executor → dispatcher)
+
+    on_done은 dispatcher 스레드에서 브로커 응답과 함께 호출된다.
+    """
+
+    owner: str  # 발행 executor 식별자 (종목:전략)
+    kind: IntentKind
+    stock_code: str
+    strategy_name: Optional[str] = None
+    side: Optional[OrderSide] = None
+    quantity: int = 0
+    price: int = 0
+    order_id: Optional[str] = None
+    order_branch: Optional[str] = None
+    on_done: Optional[Callable[[Any], None]] = field(default=None, repr=False, compare=False)
+    created_ns: int = field(default_factory=time.perf_counter_ns, compare=False)
+
+    @property
+    def dedup_key(self) -> Tuple:
+        """중복 판정 키 (같은 owner의 동일 요청)"""
+        return (
+            self.owner,
+            self.kind,
+            self.side,
+            self.quantity,
+            self.price,
+            self.order_id,
+        )
+
+
+def execute_intent(broker: KISBroker, intent: OrderIntent) -> Any:
+    """
+    intent를 브로커 호출로 실행
+
+    예외는 종류별 실패 결과로 변환 (상태 머신이 ack 처리에서 판단)
+    """
+    try:
+        if intent.kind == IntentKind.BUYABLE:
+            return broker.get_buyable_quantity(intent.stock_code, intent.price)
+        if intent.kind == IntentKind.PLACE_LIMIT:
+            return broker.place_limit_order(
+                stock_code=intent.stock_code,
+                side=intent.side,
+                quantity=intent.quantity,
+                price=intent.price,
+            )
+        if intent.kind == IntentKind.PLACE_MARKET:
+            return broker.place_market_order(
+                stock_code=intent.stock_code,
+                side=intent.side,
+                quantity=intent.quantity,
+            )
+        if intent.kind == IntentKind.CANCEL:
+            return broker.cancel_order(
+                order_id=intent.order_id,
+                order_branch=intent.order_branch,
+                quantity=intent.quantity,
+            )
+        return broker.get_order_status(
+            intent.order_id,
+            stock_code=intent.stock_code,
+            order_qty=intent.quantity,
+            side=intent.side,
+        )
+    except Exception as e:
+        logger.error(f"[dispatcher] {intent.kind.value} 실패 ({intent.stock_code}): {e}")
+        return _failed_result(intent, str(e))
+
+
+def _failed_result(intent: OrderIntent, message: str) -> Any:
+    """예외 발생 시 intent 종류별 실패 결과"""
+    if intent.kind == IntentKind.BUYABLE:
+        return (0, 0)
+    if intent.kind in (IntentKind.PLACE_LIMIT, IntentKind.PLACE_MARKET):
+        return OrderResult(
+            success=False,
+            order_id=None,
+            message=message,
+            stock_code=intent.stock_code,
+            side=intent.side,
+            quantity=intent.quantity,
+            price=intent.price,
+        )
+    if intent.kind == IntentKind.CANCEL:
+        return False
+    return (0, intent.quantity)
+
+
+class OrderDispatcher:
+    """
+    계좌 단위 주문 디스패처
+
+    하나의 KISBroker(계좌)에 대해 전용 스레드 1개가 intent 큐를 FIFO로 처리.
+    여러 종목의 executor가 공유하며, 브로커 지연은 이 스레드에만 머문다.
+    """
+
+    def __init__(self, broker: KISBroker, name: str = "order-dispatcher"):
+        self._broker = broker
+        self._name = name
+        self._queue: Deque[OrderIntent] = deque()
+        self._in_flight: Optional[OrderIntent] = None
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._latency = get_latency_recorder()
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        """디스패처 스레드 시작"""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+        logger.info(f"[dispatcher] {self._name} started")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """남은 intent 처리 후 종료"""
+        with self._cond:
+            if not self._running:
+                return
+            self._running = False
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        logger.info(f"[dispatcher] {self._name} stopped")
+
+    def submit(self, intent: OrderIntent) -> bool:
+        """
+        intent 등록
+
+        Returns:
+            True: 등록됨 (on_done 호출 예정)
+            False: 동일 intent가 이미 대기/실행 중이라 버려짐
+        """
+        with self._cond:
+            key = intent.dedup_key
+            if self._in_flight is not None and self._in_flight.dedup_key == key:
+                return False
+            if any(queued.dedup_key == key for queued in self._queue):
+                return False
+            self._queue.append(intent)
+            self._cond.notify()
+        return True
+
+    def withdraw(
+        self,
+        owner: str,
+        predicate: Optional[Callable[[OrderIntent], bool]] = None,
+    ) -> List[OrderIntent]:
+        """
+        아직 전송되지 않은 owner의 intent 철회
+
+        전송 전 주문을 큐에서 빼면 "주문 → 취소" REST 왕복이 모두 생략된다.
+        철회된 intent의 on_done은 호출되지 않는다.
+        """
+        with self._cond:
+            withdrawn = [
+                intent
+                for intent in self._queue
+                if intent.owner == owner and (predicate is None or predicate(intent))
+            ]
+            for intent in withdrawn:
+                self._queue.remove(intent)
+        return withdrawn
+
+    def pending_count(self, owner: Optional[str] = None) -> int:
+        """대기 + 실행 중 intent 수"""
+        with self._cond:
+            intents = list(self._queue)
+            if self._in_flight is not None:
+                intents.append(self._in_flight)
+        if owner is None:
+            return len(intents)
+        return sum(1 for intent in intents if intent.owner == owner)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._running and not self._queue:
+                    self._cond.wait()
+                if not self._queue:
+                    return  # 정지 요청 + 큐 비어있음
+                intent = self._queue.popleft()
+                self._in_flight = intent
+
+            try:
+                self._dispatch(intent)
+            finally:
+                with self._cond:
+                    self._in_flight = None
+
+    def _dispatch(self, intent: OrderIntent) -> None:
+        """intent 1건 실행 + ack 콜백"""
+        with self._latency.context(intent.stock_code, intent.strategy_name):
+            self._latency.record_since(STAGE_ORDER_QUEUE, intent.created_ns)
+            result = execute_intent(self._broker, intent)
+        if intent.on_done is None:
+            return
+        try:
+            intent.on_done(result)
+        except Exception as e:
+            logger.error(
+                f"[dispatcher] ack 처리 오류 ({intent.owner} {intent.kind.value}): {e}",
+                exc_info=True,
+            )
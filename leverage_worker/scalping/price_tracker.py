@@ -7,9 +7,10 @@ WebSocket tick 데이터의 롤링 윈도우를 유지하며 percentile 기반 
 import threading
 from collections import deque
 from datetime import datetime, timedelta
-from typing import Deque, List, Optional, Tuple
+from typing import Deque, Dict, Optional, Tuple
 
 from leverage_worker.utils.logger import get_logger
+from leverage_worker.utils.rolling import TimeWindow
 
 logger = get_logger("scalping.price_tracker")
 
@@ -20,6 +21,9 @@ class PriceRangeTracker:
 
     최대 max_window_seconds(60초) 데이터를 보관하고,
     조회 시 window_seconds 범위 내 데이터만 사용하여 percentile 계산.
+
+    윈도우 크기별 롤링 통계(TimeWindow)를 틱마다 증분 갱신하므로 조회 시 복사/정렬 없음.
+    처음 조회하는 윈도우 크기는 보관 중인 틱으로 1회 생성 후 계속 유지.
     """
 
     def __init__(
@@ -30,13 +34,20 @@ class PriceRangeTracker:
         self._window_seconds = window_seconds
         self._max_window_seconds = max_window_seconds
         self._ticks: Deque[Tuple[datetime, int]] = deque()
+        # 윈도우 크기(초)별 롤링 통계
+        self._windows: Dict[int, TimeWindow] = {}
         self._lock = threading.Lock()
 
     def add_tick(self, timestamp: datetime, price: int) -> None:
         """tick 추가 및 만료 데이터 제거"""
         with self._lock:
+            # 역순 체결시각은 직전 시각으로 취급 (윈도우 키 비감소 유지)
+            if self._ticks and timestamp < self._ticks[-1][0]:
+                timestamp = self._ticks[-1][0]
             self._ticks.append((timestamp, price))
             self._prune(timestamp)
+            for window in self._windows.values():
+                window.add(timestamp, price)
 
     def get_percentile(
         self,
@@ -53,24 +64,26 @@ class PriceRangeTracker:
         Returns:
             해당 percentile의 가격, 데이터 부족 시 None
         """
-        prices = self._get_prices(window_seconds)
-        if not prices:
-            return None
+        with self._lock:
+            window = self._get_window(window_seconds)
+            count = len(window)
+            if count == 0:
+                return None
 
-        prices.sort()
-        idx = int(len(prices) * percentile / 100)
-        idx = min(idx, len(prices) - 1)
-        return prices[idx]
+            idx = int(count * percentile / 100)
+            idx = min(idx, count - 1)
+            return window.kth(idx)
 
     def get_range(
         self,
         window_seconds: Optional[int] = None,
     ) -> Optional[Tuple[int, int]]:
         """윈도우 내 (최저가, 최고가) 반환"""
-        prices = self._get_prices(window_seconds)
-        if not prices:
-            return None
-        return (min(prices), max(prices))
+        with self._lock:
+            window = self._get_window(window_seconds)
+            if len(window) == 0:
+                return None
+            return (window.min(), window.max())
 
     def get_volatility(
         self,
@@ -113,7 +126,8 @@ class PriceRangeTracker:
 
     def get_tick_count(self, window_seconds: Optional[int] = None) -> int:
         """윈도우 내 tick 수"""
-        return len(self._get_prices(window_seconds))
+        with self._lock:
+            return len(self._get_window(window_seconds))
 
     def is_ready(self, min_ticks: int = 10) -> bool:
         """매매 가능 최소 tick 수 충족 여부"""
@@ -137,17 +151,12 @@ class PriceRangeTracker:
         Returns:
             0.0~1.0 사이 비율. 데이터 부족 시 None.
         """
-        prices = self._get_prices(window_seconds)
-        if len(prices) < 4:
-            return None
-
-        up_count = 0
-        total_changes = 0
-        for i in range(1, len(prices)):
-            if prices[i] != prices[i - 1]:
-                total_changes += 1
-                if prices[i] > prices[i - 1]:
-                    up_count += 1
+        with self._lock:
+            window = self._get_window(window_seconds)
+            if len(window) < 4:
+                return None
+            up_count = window.upticks
+            total_changes = window.upticks + window.downticks
 
         if total_changes == 0:
             return 0.5  # 가격 변화 없음 → 중립
@@ -158,15 +167,21 @@ class PriceRangeTracker:
         """전체 데이터 초기화"""
         with self._lock:
             self._ticks.clear()
+            for window in self._windows.values():
+                window.clear()
 
-    def _get_prices(self, window_seconds: Optional[int] = None) -> List[int]:
-        """윈도우 내 가격 리스트 반환 (thread-safe)"""
+    def _get_window(self, window_seconds: Optional[int] = None) -> TimeWindow:
+        """윈도우 크기별 롤링 통계 반환 (lock 내부 호출, 최초 조회 시 보관 틱으로 생성)"""
         ws = window_seconds if window_seconds is not None else self._window_seconds
-        with self._lock:
-            if not self._ticks:
-                return []
-            cutoff = self._ticks[-1][0] - timedelta(seconds=ws)
-            return [price for ts, price in self._ticks if ts >= cutoff]
+        # 보관 구간(max_window_seconds)보다 긴 윈도우는 보관 구간과 동일
+        ws = min(ws, self._max_window_seconds)
+        window = self._windows.get(ws)
+        if window is None:
+            window = TimeWindow(timedelta(seconds=ws))
+            for ts, price in self._ticks:
+                window.add(ts, price)
+            self._windows[ws] = window
+        return window
 
     def _prune(self, current_time: datetime) -> None:
         """max_window_seconds보다 오래된 데이터 제거 (lock 내부 호출)"""
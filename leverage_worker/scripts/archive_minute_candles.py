@@ -0,0 +1,55 @@
+"""
+분봉 Parquet 아카이브 이관 스크립트
+
+보관 기간이 지난 minute_candles 행을 Parquet 아카이브(종목/연/월)로 옮기고
+SQLite에서 삭제합니다. (장 마감 후 자동 이관: execution.minute_hot_days 설정)
+
+사용법:
+    # 최근 30일만 SQLite에 남기고 이관
+    python archive_minute_candles.py --keep-days 30
+
+    # 특정 종목 + VACUUM
+    python archive_minute_candles.py --keep-days 30 --stocks 122630,233740 --vacuum
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from leverage_worker.data.candle_archive import MinuteCandleArchive, archive_minute_candles
+from leverage_worker.data.database import MarketDataDB
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="분봉 Parquet 아카이브 이관")
+    parser.add_argument("--keep-days", type=int, default=30, help="SQLite에 남길 기간 (일)")
+    parser.add_argument("--stocks", help="대상 종목코드 (콤마 구분, 기본: 전체)")
+    parser.add_argument("--archive", help="아카이브 경로 (기본: data/minute_archive)")
+    parser.add_argument("--db", help="market_data.db 경로")
+    parser.add_argument("--vacuum", action="store_true", help="삭제 후 VACUUM 실행")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    db = MarketDataDB(Path(args.db)) if args.db else MarketDataDB()
+    archive = MinuteCandleArchive(Path(args.archive) if args.archive else None)
+    stock_codes = [c.strip() for c in args.stocks.split(",") if c.strip()] if args.stocks else None
+
+    try:
+        moved = archive_minute_candles(
+            db, archive, keep_days=args.keep_days, stock_codes=stock_codes, vacuum=args.vacuum
+        )
+    finally:
+        db.close()
+
+    for stock_code, count in sorted(moved.items()):
+        print(f"  {stock_code}: {count:,}건")
+    print(f"이관 완료: {sum(moved.values()):,}건 → {archive.root}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+롤링 통계 벤치마크 (전수 복사/정렬 vs 증분 갱신)
+
+틱 burst를 넣으면서 매 틱마다 스캘핑 경로의 조회(P10, 범위, 상승틱 비율, 적응형 윈도우)를 수행.
+기존 방식은 조회마다 윈도우 복사 + 정렬, rolling 방식은 TimeWindow 증분 갱신.
+
+사용법:
+    python bench_rolling.py
+    python bench_rolling.py --ticks 10000 --interval-ms 5 --window 10
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from leverage_worker.utils.rolling import TimeWindow
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="롤링 통계 벤치마크 (전수 계산 vs 증분 갱신)")
+    parser.add_argument("--ticks", type=int, default=10000, help="burst 틱 수")
+    parser.add_argument("--interval-ms", type=float, default=5.0, help="틱 간격 (ms)")
+    parser.add_argument("--window", type=int, default=10, help="기본 윈도우 (초)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    return parser.parse_args()
+
+
+def make_ticks(count: int, interval_ms: float, seed: int) -> list:
+    rng = random.Random(seed)
+    base = datetime(2024, 1, 15, 9, 0, 0)
+    price = 20000
+    ticks = []
+    for i in range(count):
+        price = max(5, price + rng.choice([-5, 0, 0, 5]))
+        ticks.append((base + timedelta(milliseconds=i * interval_ms), price))
+    return ticks
+
+
+def run_naive(ticks: list, window: int) -> float:
+    """기존 방식: 조회마다 윈도우 복사 + 정렬/전수 순회"""
+    buf = deque()
+    start = time.perf_counter()
+    for ts, price in ticks:
+        buf.append((ts, price))
+        while buf[0][0] < ts - timedelta(seconds=60):
+            buf.popleft()
+        for ws in (window, 30):
+            cutoff = ts - timedelta(seconds=ws)
+            prices = [p for t, p in buf if t >= cutoff]
+            prices.sort()
+            _ = prices[min(int(len(prices) * 0.1), len(prices) - 1)]
+            _ = (min(prices), max(prices))
+        prices = [p for t, p in buf if t >= ts - timedelta(seconds=window)]
+        _ = sum(1 for a, b in zip(prices, prices[1:]) if b > a)
+    return time.perf_counter() - start
+
+
+def run_rolling(ticks: list, window: int) -> float:
+    """rolling 방식: 윈도우별 TimeWindow 증분 갱신 후 O(1) 조회"""
+    windows = [TimeWindow(timedelta(seconds=ws)) for ws in (window, 30)]
+    start = time.perf_counter()
+    for ts, price in ticks:
+        for w in windows:
+            w.add(ts, price)
+            _ = w.kth(min(int(len(w) * 0.1), len(w) - 1))
+            _ = (w.min(), w.max())
+        _ = windows[0].upticks
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    args = parse_args()
+    ticks = make_ticks(args.ticks, args.interval_ms, args.seed)
+    per_window = int(args.window * 1000 / args.interval_ms)
+
+    print(
+        f"{args.ticks:,}틱 burst, 간격 {args.interval_ms:.1f}ms "
+        f"(기본 윈도우 {args.window}초 ≈ {per_window:,}틱)\n"
+    )
+    naive = run_naive(ticks, args.window)
+    rolling = run_rolling(ticks, args.window)
+    print(f"{'방식':>8} | {'총 시간 (s)':>11} | {'틱당 (us)':>10}")
+    print("-" * 38)
+    print(f"{'전수 계산':>8} | {naive:>11.3f} | {naive / args.ticks * 1e6:>10.1f}")
+    print(f"{'증분 갱신':>8} | {rolling:>11.3f} | {rolling / args.ticks * 1e6:>10.1f}")
+    print(f"\n배율: {naive / rolling:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
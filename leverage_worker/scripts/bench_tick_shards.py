@@ -0,0 +1,102 @@
+"""
+틱 처리 동시성 벤치마크 (전역 잠금 vs 종목 샤드)
+
+틱 1건 처리 = CPU 작업(전략 계산 모사) + I/O 대기(REST 호출 모사).
+전역 잠금은 종목 수와 무관하게 직렬, 종목 샤드는 종목 수(최대 샤드 수)만큼 병렬.
+
+사용법:
+    python bench_tick_shards.py
+    python bench_tick_shards.py --symbols 1,2,5,10,20,40 --ticks 50 --io-ms 2 --shards 8
+"""
+
+import argparse
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from leverage_worker.core.tick_shards import TickShardExecutor
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="틱 처리 처리량 벤치마크 (전역 잠금 vs 종목 샤드)")
+    parser.add_argument("--symbols", default="1,2,5,10,20,40", help="종목 수 목록 (콤마 구분)")
+    parser.add_argument("--ticks", type=int, default=50, help="종목당 틱 수")
+    parser.add_argument("--io-ms", type=float, default=2.0, help="틱당 I/O 대기 (ms)")
+    parser.add_argument("--cpu-us", type=float, default=50.0, help="틱당 CPU 작업 (us)")
+    parser.add_argument("--shards", type=int, default=8, help="샤드 워커 수")
+    return parser.parse_args()
+
+
+def make_work(io_ms: float, cpu_us: float):
+    def work(counter: list) -> None:
+        deadline = time.perf_counter() + cpu_us / 1e6
+        while time.perf_counter() < deadline:
+            pass
+        time.sleep(io_ms / 1000)
+        counter[0] += 1
+
+    return work
+
+
+def run_global_lock(num_symbols: int, ticks: int, work) -> float:
+    """기존 방식: 수신 스레드(종목별) → 전역 잠금 → 처리"""
+    lock = threading.Lock()
+    counters = {f"S{i:02d}": [0] for i in range(num_symbols)}
+
+    def feed(code: str) -> None:
+        for _ in range(ticks):
+            with lock:
+                work(counters[code])
+
+    threads = [threading.Thread(target=feed, args=(code,)) for code in counters]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - start
+
+
+def run_shards(num_symbols: int, ticks: int, work, num_shards: int) -> float:
+    """종목 샤드: 수신 스레드는 submit만, 종목별 순서 보장 + 종목 간 병렬"""
+    shards = TickShardExecutor(num_shards=num_shards, name="bench-shard")
+    counters = {f"S{i:02d}": [0] for i in range(num_symbols)}
+    shards.start()
+    try:
+        start = time.perf_counter()
+        futures = [
+            shards.submit(code, work, counters[code])
+            for _ in range(ticks)
+            for code in counters
+        ]
+        for future in futures:
+            future.result()
+        return time.perf_counter() - start
+    finally:
+        shards.stop()
+
+
+def main() -> int:
+    args = parse_args()
+    work = make_work(args.io_ms, args.cpu_us)
+    symbol_counts = [int(n) for n in args.symbols.split(",") if n.strip()]
+
+    print(
+        f"틱당 CPU {args.cpu_us:.0f}us + I/O {args.io_ms:.1f}ms, "
+        f"종목당 {args.ticks}틱, 샤드 {args.shards}개\n"
+    )
+    print(f"{'종목':>4} | {'전역 잠금 (tick/s)':>18} | {'종목 샤드 (tick/s)':>18} | {'배율':>6}")
+    print("-" * 58)
+    for n in symbol_counts:
+        total = n * args.ticks
+        baseline = total / run_global_lock(n, args.ticks, work)
+        sharded = total / run_shards(n, args.ticks, work, args.shards)
+        print(f"{n:>4} | {baseline:>18,.0f} | {sharded:>18,.0f} | {sharded / baseline:>5.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,17 +6,20 @@ market_data.db의 일봉/분봉 데이터 누락 여부를 검증합니다.
 2. 각 종목의 첫날/마지막날 확인
 3. 빠진 일봉 확인 (휴일 제외)
 4. 분봉 개수가 381개가 아닌 날 확인
+
+분봉은 SQLite(minute_candles)와 Parquet 아카이브를 합쳐서 검증합니다.
 """
 
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Set, Tuple
+from typing import Dict, List, Set, Tuple
 
 # 프로젝트 루트를 path에 추가
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from leverage_worker.data.candle_archive import MinuteCandleArchive, MinuteCandleReader
 from leverage_worker.data.database import MarketDataDB
 from leverage_worker.data.daily_candle_repository import DailyCandleRepository
 from leverage_worker.data.minute_candle_repository import MinuteCandleRepository
@@ -84,39 +87,21 @@ def check_daily_candle_integrity(
 
 
 def check_minute_candle_integrity(
-    minute_repo: MinuteCandleRepository,
-    stock_code: str,
-    start_date: str,
-    end_date: str,
+    day_counts: Dict[str, int],
 ) -> List[Tuple[str, int]]:
     """
     분봉 데이터 무결성 체크
 
     Args:
-        minute_repo: 분봉 저장소
-        stock_code: 종목코드
-        start_date: 시작일
-        end_date: 종료일
+        day_counts: 거래일별 분봉 개수 (MinuteCandleReader.get_day_counts)
 
     Returns:
         (날짜, 분봉개수) 튜플 리스트 (381개가 아닌 날만)
     """
-    db = minute_repo._db
-
-    # 날짜별 분봉 개수 조회
-    query = """
-        SELECT trade_date, COUNT(*) as cnt
-        FROM minute_candles
-        WHERE stock_code = ? AND trade_date BETWEEN ? AND ?
-        GROUP BY trade_date
-        ORDER BY trade_date
-    """
-    rows = db.fetch_all(query, (stock_code, start_date, end_date))
-
     incomplete_days = []
-    for row in rows:
-        if row["cnt"] != EXPECTED_MINUTE_CANDLES_PER_DAY:
-            incomplete_days.append((row["trade_date"], row["cnt"]))
+    for trade_date, cnt in sorted(day_counts.items()):
+        if cnt != EXPECTED_MINUTE_CANDLES_PER_DAY:
+            incomplete_days.append((trade_date, cnt))
 
     return incomplete_days
 
@@ -154,13 +139,15 @@ def main():
     db = MarketDataDB()
     daily_repo = DailyCandleRepository(db)
     minute_repo = MinuteCandleRepository(db)
+    archive = MinuteCandleArchive()
+    minute_reader = MinuteCandleReader(db, archive)
 
     # 1. 종목 리스트업
     print("[1] 종목 리스트 확인")
     print("-" * 50)
 
     daily_stocks = set(daily_repo.get_stock_codes())
-    minute_stocks = set(minute_repo.get_stored_stock_codes())
+    minute_stocks = set(minute_repo.get_stored_stock_codes()) | set(archive.stock_codes())
     all_stocks = daily_stocks.union(minute_stocks)
 
     print(f"  일봉 데이터 종목 수: {len(daily_stocks)}")
@@ -201,7 +188,7 @@ def main():
             print(f"     일봉: 데이터 없음")
 
         # 분봉 기간
-        minute_range = minute_repo.get_date_range(stock_code)
+        minute_range = minute_reader.get_date_range(stock_code)
         if minute_range:
             m_start, m_end = minute_range
             print(f"     분봉: {m_start} ~ {m_end}")
@@ -238,9 +225,8 @@ def main():
         # 4. 분봉 개수 체크 (381개 아닌 날)
         if minute_range:
             m_start, m_end = minute_range
-            incomplete_minute = check_minute_candle_integrity(
-                minute_repo, stock_code, m_start, m_end
-            )
+            day_counts = minute_reader.get_day_counts(stock_code, m_start, m_end)
+            incomplete_minute = check_minute_candle_integrity(day_counts)
 
             if incomplete_minute:
                 print(f"     [WARN] 분봉 개수 이상 ({len(incomplete_minute)}일):")
@@ -254,14 +240,7 @@ def main():
                 if len(incomplete_minute) > 100:
                     print(f"        ... 외 {len(incomplete_minute) - 10}일")
             else:
-                # 분봉 있는 날 수 확인
-                query = """
-                    SELECT COUNT(DISTINCT trade_date) as day_cnt
-                    FROM minute_candles
-                    WHERE stock_code = ?
-                """
-                row = minute_repo._db.fetch_one(query, (stock_code,))
-                day_count = row["day_cnt"] if row else 0
+                day_count = len(day_counts)
                 print(f"     [OK] 분봉: 모든 거래일 {EXPECTED_MINUTE_CANDLES_PER_DAY}개 ({day_count}일)")
 
     print()
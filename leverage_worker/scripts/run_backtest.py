@@ -0,0 +1,114 @@
+"""
+분봉 리플레이 백테스트 실행 스크립트
+
+사용법:
+    # 단일 전략, 여러 종목
+    python run_backtest.py 20250101 20251231 --strategy main_beam_4 --stocks 122630,233740
+
+    # 전략 파라미터/실행 모드 지정
+    python run_backtest.py 20250101 20251231 --strategy scalping_range --stocks 122630 \\
+        --mode scalping --params '{"timeout_seconds": 120}'
+
+    # trading_config.yaml 종목/전략 전체
+    python run_backtest.py 20250101 20251231 --from-config
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from leverage_worker.backtest import BacktestConfig, BacktestEngine, MarketDataFeed, StrategySpec
+from leverage_worker.data.candle_archive import MinuteCandleArchive
+from leverage_worker.data.database import MarketDataDB
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="market_data.db 분봉 리플레이 백테스트")
+    parser.add_argument("start_date", help="시작일 (YYYYMMDD)")
+    parser.add_argument("end_date", help="종료일 (YYYYMMDD)")
+    parser.add_argument("--strategy", help="전략 이름 (StrategyRegistry)")
+    parser.add_argument("--stocks", help="종목코드 (콤마 구분)")
+    parser.add_argument("--params", default="{}", help="전략 파라미터 (JSON)")
+    parser.add_argument("--allocation", type=float, default=100.0, help="할당 비율 (%%)")
+    parser.add_argument(
+        "--mode", choices=["scheduler", "scalping"], default="scheduler", help="실행 모드"
+    )
+    parser.add_argument("--from-config", action="store_true", help="trading_config.yaml 사용")
+    parser.add_argument("--config", help="설정 디렉토리 경로 (--from-config)")
+    parser.add_argument("--cash", type=int, default=10_000_000, help="초기 예수금")
+    parser.add_argument("--slippage-ticks", type=int, default=0, help="시장가 슬리피지 호가 수")
+    parser.add_argument("--db", help="market_data.db 경로")
+    parser.add_argument(
+        "--archive", nargs="?", const="", help="분봉 Parquet 아카이브 포함 (경로 생략 시 기본 경로)"
+    )
+    parser.add_argument("--output", help="결과 CSV 저장 디렉토리")
+    return parser.parse_args()
+
+
+def build_specs(args: argparse.Namespace):
+    """명령행 인자 → StrategySpec 목록"""
+    if args.from_config:
+        from leverage_worker.config.settings import Settings
+
+        settings = Settings(config_path=Path(args.config) if args.config else None)
+        return StrategySpec.from_settings(settings)
+
+    if not args.strategy or not args.stocks:
+        raise SystemExit("--strategy, --stocks 또는 --from-config 필요")
+
+    params = json.loads(args.params)
+    return [
+        StrategySpec(
+            stock_code=code.strip(),
+            name=args.strategy,
+            params=params,
+            allocation=args.allocation,
+            execution_mode=args.mode,
+        )
+        for code in args.stocks.split(",")
+        if code.strip()
+    ]
+
+
+def main() -> int:
+    args = parse_args()
+    specs = build_specs(args)
+
+    db = MarketDataDB(Path(args.db)) if args.db else MarketDataDB()
+    archive = None
+    if args.archive is not None:
+        archive = MinuteCandleArchive(Path(args.archive) if args.archive else None)
+    try:
+        config = BacktestConfig(
+            start_date=args.start_date,
+            end_date=args.end_date,
+            initial_cash=args.cash,
+            slippage_ticks=args.slippage_ticks,
+        )
+        feed = MarketDataFeed(
+            db, [spec.stock_code for spec in specs], args.start_date, args.end_date, archive
+        )
+        result = BacktestEngine(db, specs, config, feed=feed).run()
+    finally:
+        db.close()
+
+    print("\n=== 백테스트 결과 ===")
+    for key, value in result.summary().items():
+        print(f"{key:>18}: {value:,.2f}" if isinstance(value, float) else f"{key:>18}: {value:,}")
+
+    if args.output:
+        output_dir = Path(args.output)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        tag = f"{args.start_date}_{args.end_date}"
+        result.trades_dataframe().to_csv(output_dir / f"trades_{tag}.csv", index=False)
+        result.equity_dataframe().to_csv(output_dir / f"equity_{tag}.csv", index=False)
+        print(f"\n저장: {output_dir}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""
+전략 파라미터 스윕 실행 스크립트
+
+사용법:
+    # 그리드 탐색
+    python run_sweep.py bollinger_band 20250101 20251231 --stocks 122630,233740 \\
+        --space '{"bb_period": [10, 15, 20, 30], "std_multiplier": [1.5, 2.0, 2.5]}'
+
+    # 랜덤 탐색 (50개 조합) + 워커 수 지정
+    python run_sweep.py kosdaq_donchian 20250101 20251231 --stocks 233740 \\
+        --space '{"channel_period": [10, 20, 30, 40], "stop_loss_pct": [0.015, 0.025]}' \\
+        --samples 50 --seed 42 --workers 8
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from leverage_worker.backtest import BacktestConfig, run_sweep
+from leverage_worker.data.candle_archive import MinuteCandleArchive
+from leverage_worker.data.database import MarketDataDB
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="전략 파라미터 스윕 (분봉 리플레이 백테스트)")
+    parser.add_argument("strategy", help="전략 이름 (StrategyRegistry)")
+    parser.add_argument("start_date", help="시작일 (YYYYMMDD)")
+    parser.add_argument("end_date", help="종료일 (YYYYMMDD)")
+    parser.add_argument("--stocks", required=True, help="종목코드 (콤마 구분)")
+    parser.add_argument("--space", required=True, help="탐색 공간 JSON {파라미터: [후보값...]}")
+    parser.add_argument("--params", default="{}", help="고정 파라미터 (JSON)")
+    parser.add_argument("--samples", type=int, help="랜덤 탐색 조합 수 (미지정 시 그리드 전체)")
+    parser.add_argument("--seed", type=int, help="랜덤 탐색 시드")
+    parser.add_argument(
+        "--mode", choices=["scheduler", "scalping"], default="scheduler", help="실행 모드"
+    )
+    parser.add_argument("--allocation", type=float, default=100.0, help="할당 비율 (%%)")
+    parser.add_argument("--cash", type=int, default=10_000_000, help="초기 예수금")
+    parser.add_argument("--workers", type=int, help="워커 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--metric", default="total_return_pct", help="순위 기준 지표")
+    parser.add_argument("--db", help="market_data.db 경로")
+    parser.add_argument(
+        "--archive", nargs="?", const="", help="분봉 Parquet 아카이브 포함 (경로 생략 시 기본 경로)"
+    )
+    parser.add_argument("--output", help="Parquet 저장 경로 (기본: sweeps/<전략>_<기간>.parquet)")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    output = Path(args.output) if args.output else (
+        Path("sweeps") / f"{args.strategy}_{args.start_date}_{args.end_date}.parquet"
+    )
+
+    db = MarketDataDB(Path(args.db)) if args.db else MarketDataDB()
+    archive = None
+    if args.archive is not None:
+        archive = MinuteCandleArchive(Path(args.archive) if args.archive else None)
+    try:
+        result = run_sweep(
+            args.strategy,
+            json.loads(args.space),
+            [code.strip() for code in args.stocks.split(",") if code.strip()],
+            args.start_date,
+            args.end_date,
+            base_params=json.loads(args.params),
+            n_samples=args.samples,
+            seed=args.seed,
+            execution_mode=args.mode,
+            allocation=args.allocation,
+            config=BacktestConfig(args.start_date, args.end_date, initial_cash=args.cash),
+            max_workers=args.workers,
+            db=db,
+            archive=archive,
+            output_path=output,
+        )
+    finally:
+        db.close()
+
+    print(f"\n=== 상위 조합 ({args.metric}, 종목 평균) ===")
+    print(result.ranked(args.metric).head(20).to_string())
+    print(f"\n{len(result.rows)}건, {result.elapsed_seconds:.1f}초, 저장: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
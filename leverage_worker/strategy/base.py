@@ -11,10 +11,11 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from leverage_worker.data.daily_candle_repository import DailyCandle
 from leverage_worker.data.minute_candle_repository import MinuteCandle as OHLCV
+from leverage_worker.indicators import IndicatorSet, get_indicator_cache
 from leverage_worker.trading.broker import Position
 
 
@@ -115,8 +116,8 @@ class StrategyContext:
     current_price: int
     current_time: datetime
 
-    # 가격 히스토리 (분봉 OHLCV)
-    price_history: List[OHLCV]
+    # 가격 히스토리 (분봉 OHLCV, list 또는 CandleView)
+    price_history: Sequence[OHLCV]
 
     # 현재 포지션 (보유 중이면 Position, 아니면 None)
     position: Optional[Position]
@@ -157,6 +158,16 @@ class StrategyContext:
                     self.position.avg_price) * 100
         return 0.0
 
+    @property
+    def indicators(self) -> IndicatorSet:
+        """분봉 OHLCV 배열 + 지표 (같은 종목/마지막 봉이면 전략 인스턴스 간 공유)"""
+        return get_indicator_cache().get(self.stock_code, "minute", self.price_history)
+
+    @property
+    def daily_indicators(self) -> IndicatorSet:
+        """일봉 OHLCV 배열 + 지표 (같은 종목/마지막 봉이면 전략 인스턴스 간 공유)"""
+        return get_indicator_cache().get(self.stock_code, "daily", self.daily_candles)
+
     def get_recent_prices(self, count: int = 10) -> List[int]:
         """최근 N개 종가 리스트"""
         return [p.close_price for p in self.price_history[-count:]]
@@ -167,10 +178,7 @@ class StrategyContext:
 
     def get_sma(self, period: int) -> Optional[float]:
         """단순 이동평균 계산 (분봉)"""
-        prices = self.get_recent_prices(period)
-        if len(prices) < period:
-            return None
-        return sum(prices) / len(prices)
+        return self.indicators.sma(period)
 
     # --- 일봉 데이터 관련 메서드 ---
 
@@ -192,25 +200,17 @@ class StrategyContext:
 
     def get_daily_sma(self, period: int) -> Optional[float]:
         """일봉 단순 이동평균 계산"""
-        prices = self.get_daily_prices(period)
-        if len(prices) < period:
-            return None
-        return sum(prices) / len(prices)
+        return self.daily_indicators.sma(period)
 
     def get_daily_high_n(self, period: int) -> Optional[float]:
         """최근 N일 최고가 (오늘 제외)"""
-        # 오늘 제외하고 N일치의 고가 중 최대값
-        high_prices = self.get_daily_high_prices(period + 1)[:-1] if len(self.daily_candles) > 0 else []
-        if len(high_prices) < period:
-            return None
-        return max(high_prices)
+        channel = self.daily_indicators.donchian(period, offset=1)
+        return channel[0] if channel is not None else None
 
     def get_daily_low_n(self, period: int) -> Optional[float]:
         """최근 N일 최저가 (오늘 제외)"""
-        low_prices = self.get_daily_low_prices(period + 1)[:-1] if len(self.daily_candles) > 0 else []
-        if len(low_prices) < period:
-            return None
-        return min(low_prices)
+        channel = self.daily_indicators.donchian(period, offset=1)
+        return channel[1] if channel is not None else None
 
     def has_sufficient_daily_data(self, min_required: int) -> bool:
         """충분한 일봉 데이터가 있는지 확인"""
@@ -249,12 +249,13 @@ class StrategyContext:
         if not self.price_history:
             errors.append("Empty price history")
         else:
-            # 가격 스파이크 검증
-            for i in range(1, len(self.price_history)):
-                prev_close = self.price_history[i - 1].close_price
-                curr_close = self.price_history[i].close_price
+            # 가격 스파이크 / 0 또는 음수 가격 검증 (단일 순회)
+            ohlc_warnings = []
+            prev_close = None
+            for i, candle in enumerate(self.price_history):
+                curr_close = candle.close_price
 
-                if prev_close > 0:
+                if prev_close is not None and prev_close > 0:
                     change_rate = abs(curr_close - prev_close) / prev_close
                     if change_rate > spike_threshold:
                         warnings.append(
@@ -262,8 +263,16 @@ class StrategyContext:
                             f"({change_rate * 100:.1f}%)"
                         )
 
+                if curr_close <= 0:
+                    errors.append(f"Invalid close price at index {i}: {curr_close}")
+                if candle.high_price < candle.low_price:
+                    ohlc_warnings.append(
+                        f"High < Low at index {i}: high={candle.high_price}, low={candle.low_price}"
+                    )
+                prev_close = curr_close
+
             # 현재가와 최신 히스토리 가격 비교
-            latest_close = self.price_history[-1].close_price
+            latest_close = prev_close
             if latest_close > 0:
                 current_change = abs(self.current_price - latest_close) / latest_close
                 if current_change > spike_threshold:
@@ -272,14 +281,7 @@ class StrategyContext:
                         f"current={self.current_price} ({current_change * 100:.1f}%)"
                     )
 
-            # 0 또는 음수 가격 검증
-            for i, candle in enumerate(self.price_history):
-                if candle.close_price <= 0:
-                    errors.append(f"Invalid close price at index {i}: {candle.close_price}")
-                if candle.high_price < candle.low_price:
-                    warnings.append(
-                        f"High < Low at index {i}: high={candle.high_price}, low={candle.low_price}"
-                    )
+            warnings.extend(ohlc_warnings)
 
         is_valid = len(errors) == 0
         return PriceValidationResult(is_valid=is_valid, warnings=warnings, errors=errors)
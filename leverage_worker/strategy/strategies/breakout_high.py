@@ -124,13 +124,14 @@ class BreakoutHigh5Strategy(BaseStrategy):
 
         # 미보유 시 진입 조건 확인 (일봉 기준)
         # 최근 N일 최고가 (오늘 제외)
-        high_n_days = context.get_daily_high_n(self._lookback_period)
-        if high_n_days is None:
+        daily = context.daily_indicators
+        channel = daily.donchian(self._lookback_period, offset=1)
+        if channel is None:
             return TradingSignal.hold(stock_code, "Insufficient daily high data")
+        high_n_days, _ = channel
 
         # 최근 N일 평균 거래량 (오늘 제외)
-        daily_volumes = context.get_daily_volumes(self._lookback_period + 1)[:-1]
-        avg_volume = sum(daily_volumes) / len(daily_volumes) if daily_volumes else 0
+        avg_volume = daily.volume_sma(self._lookback_period, offset=1) or 0
 
         current_price = context.current_price
         # 오늘 거래량은 분봉 데이터에서 추정 (또는 일봉의 마지막 값)
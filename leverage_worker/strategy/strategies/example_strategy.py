@@ -112,15 +112,8 @@ class ExampleStrategy(BaseStrategy):
 
     def _calculate_prev_sma(self, context: StrategyContext, period: int) -> Optional[float]:
         """이전 시점의 SMA 계산 (1분봉 전)"""
-        if len(context.price_history) < period + 1:
-            return None
-
         # 마지막 1개를 제외한 N개의 평균
-        prices = [p.close_price for p in context.price_history[-(period + 1):-1]]
-        if len(prices) < period:
-            return None
-
-        return sum(prices) / len(prices)
+        return context.indicators.sma(period, offset=1)
 
     def on_entry(self, context: StrategyContext, signal: TradingSignal) -> None:
         logger.info(
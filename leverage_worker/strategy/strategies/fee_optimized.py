@@ -21,7 +21,7 @@
     - MDD: 13.6% (주의: 높은 MDD)
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
 from leverage_worker.strategy.base import BaseStrategy, StrategyContext, TradingSignal
 from leverage_worker.strategy.registry import register_strategy
@@ -30,48 +30,6 @@ from leverage_worker.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
-def calculate_atr(
-    high_prices: List[float],
-    low_prices: List[float],
-    close_prices: List[float],
-    period: int = 14,
-) -> Optional[float]:
-    """
-    ATR (Average True Range) 계산
-
-    Args:
-        high_prices: 고가 리스트
-        low_prices: 저가 리스트
-        close_prices: 종가 리스트
-        period: ATR 기간
-
-    Returns:
-        ATR 값 또는 None
-    """
-    if len(high_prices) < period + 1:
-        return None
-
-    true_ranges = []
-
-    for i in range(1, len(high_prices)):
-        high = high_prices[i]
-        low = low_prices[i]
-        prev_close = close_prices[i - 1]
-
-        tr1 = high - low
-        tr2 = abs(high - prev_close)
-        tr3 = abs(low - prev_close)
-
-        true_ranges.append(max(tr1, tr2, tr3))
-
-    if len(true_ranges) < period:
-        return None
-
-    # 최근 N개의 TR 평균
-    recent_trs = true_ranges[-period:]
-    return sum(recent_trs) / period
-
-
 @register_strategy("fee_optimized")
 class FeeOptimizedStrategy(BaseStrategy):
     """
@@ -177,12 +135,7 @@ class FeeOptimizedStrategy(BaseStrategy):
         is_above_sma = current_price > sma
 
         # 조건 2: ATR 변동성 확인 (일봉 기준)
-        daily_candles = context.daily_candles[-required_days:]
-        high_prices = [c.high_price for c in daily_candles]
-        low_prices = [c.low_price for c in daily_candles]
-        close_prices = [c.close_price for c in daily_candles]
-
-        atr = calculate_atr(high_prices, low_prices, close_prices, self._atr_period)
+        atr = context.daily_indicators.atr(self._atr_period)
         if atr is None:
             return TradingSignal.hold(stock_code, "ATR 계산 불가")
 
@@ -121,14 +121,13 @@ class FibonacciLuckyStrategy(BaseStrategy):
             return TradingSignal.hold(stock_code, "보유 중")
 
         # 미보유 시 진입 조건 확인 (일봉 기준)
-        prices = context.get_daily_prices(required_days)
-        volumes = context.get_daily_volumes(required_days)
+        daily = context.daily_indicators
 
         current_price = context.current_price
-        price_fib_ago = prices[-(self._fib_period + 1)]
+        price_fib_ago = float(daily.close[-(self._fib_period + 1)])
 
-        today_volume = volumes[-1]
-        yesterday_volume = volumes[-2]
+        today_volume = float(daily.volume[-1])
+        yesterday_volume = float(daily.volume[-2])
 
         # 조건 1: 5일 전 대비 상승
         is_uptrend = current_price > price_fib_ago
@@ -21,8 +21,7 @@
     - MDD: 4.1%
 """
 
-import math
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
 from leverage_worker.strategy.base import BaseStrategy, StrategyContext, TradingSignal
 from leverage_worker.strategy.registry import register_strategy
@@ -31,40 +30,6 @@ from leverage_worker.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
-def calculate_zscore(prices: List[float], period: int = 15) -> Optional[float]:
-    """
-    Z-Score 계산
-
-    원본 스펙:
-        mean_15 = (close[i-15] + close[i-14] + ... + close[i-1]) / 15  # 현재가 제외
-        std_15 = sqrt(sum((close[i-j] - mean_15)^2 for j in 1..15) / 15)
-        zscore = (close[i] - mean_15) / std_15
-
-    Args:
-        prices: 가격 리스트 (최근 데이터가 마지막, 현재가 포함)
-        period: 계산 기간
-
-    Returns:
-        Z-Score 값 또는 None (데이터 부족 시)
-    """
-    # period + 1 개의 데이터 필요 (현재가 + 과거 period개)
-    if len(prices) < period + 1:
-        return None
-
-    current_price = prices[-1]
-    # 현재가 제외, 과거 period개 가격으로 평균/표준편차 계산
-    past_prices = prices[-(period + 1):-1]
-    mean = sum(past_prices) / period
-
-    variance = sum((p - mean) ** 2 for p in past_prices) / period
-    std = math.sqrt(variance) if variance > 0 else 0
-
-    if std == 0:
-        return 0.0
-
-    return (current_price - mean) / std
-
-
 @register_strategy("hybrid_momentum")
 class HybridMomentumStrategy(BaseStrategy):
     """
@@ -126,9 +91,6 @@ class HybridMomentumStrategy(BaseStrategy):
         if not context.has_sufficient_daily_data(required_days):
             return TradingSignal.hold(stock_code, "Insufficient daily data")
 
-        # 일봉 종가 가져오기
-        prices = context.get_daily_prices(required_days)
-
         # 포지션 보유 시 청산 조건 확인
         if context.has_position:
             profit_rate = context.profit_rate / 100  # % → 소수
@@ -168,16 +130,20 @@ class HybridMomentumStrategy(BaseStrategy):
 
         # 미보유 시 진입 조건 확인 (일봉 기준)
         current_price = context.current_price
-        price_n_days_ago = prices[-(self._momentum_period + 1)]
+        daily = context.daily_indicators
+        price_n_days_ago = float(daily.close[-(self._momentum_period + 1)])
 
         # 조건 1: 모멘텀 확인 (N일 전 대비 threshold 이상 상승)
         momentum_target = price_n_days_ago * (1 + self._momentum_threshold)
         has_momentum = current_price > momentum_target
 
         # 조건 2: Z-Score 확인 (과매도 아님)
-        zscore = calculate_zscore(prices, self._zscore_period)
-        if zscore is None:
+        # 오늘 종가 vs 오늘 제외 과거 N일 평균/표준편차
+        stats = daily.mean_std(self._zscore_period, offset=1)
+        if stats is None:
             return TradingSignal.hold(stock_code, "Z-Score 계산 불가")
+        mean, std = stats
+        zscore = (float(daily.close[-1]) - mean) / std if std > 0 else 0.0
 
         is_not_oversold = zscore > self._zscore_threshold
 
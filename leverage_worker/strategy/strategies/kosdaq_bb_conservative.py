@@ -24,8 +24,7 @@
     - MDD: 4.62%
 """
 
-import math
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Optional
 
 from leverage_worker.strategy.base import BaseStrategy, StrategyContext, TradingSignal
 from leverage_worker.strategy.registry import register_strategy
@@ -34,35 +33,6 @@ from leverage_worker.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
-def calculate_bollinger_bands_25(
-    prices: List[float], period: int = 25, std_multiplier: float = 1.5
-) -> Tuple[Optional[float], Optional[float], Optional[float]]:
-    """
-    볼린저 밴드 계산 (25일 기준)
-
-    Args:
-        prices: 가격 리스트
-        period: 이동평균 기간 (기본 25)
-        std_multiplier: 표준편차 배수 (기본 1.5)
-
-    Returns:
-        (상단 밴드, 중간 밴드, 하단 밴드) 또는 None
-    """
-    if len(prices) < period:
-        return None, None, None
-
-    recent_prices = prices[-period:]
-    mean = sum(recent_prices) / period
-
-    variance = sum((p - mean) ** 2 for p in recent_prices) / period
-    std = math.sqrt(variance) if variance > 0 else 0
-
-    upper_band = mean + (std_multiplier * std)
-    lower_band = mean - (std_multiplier * std)
-
-    return upper_band, mean, lower_band
-
-
 @register_strategy("kosdaq_bb_conservative")
 class KosdaqBBConservativeStrategy(BaseStrategy):
     """
@@ -116,9 +86,6 @@ class KosdaqBBConservativeStrategy(BaseStrategy):
         if not context.has_sufficient_daily_data(self._bb_period):
             return TradingSignal.hold(stock_code, "Insufficient daily data")
 
-        # 일봉 종가로 볼린저 밴드 계산
-        prices = context.get_daily_prices(self._bb_period)
-
         # 포지션 보유 시 청산 조건 확인
         if context.has_position:
             profit_rate = context.profit_rate / 100
@@ -156,13 +123,11 @@ class KosdaqBBConservativeStrategy(BaseStrategy):
 
             return TradingSignal.hold(stock_code, "보유 중")
 
-        # 미보유 시 진입 조건 확인
-        upper_band, middle_band, lower_band = calculate_bollinger_bands_25(
-            prices, self._bb_period, self._std_multiplier
-        )
-
-        if lower_band is None:
+        # 미보유 시 진입 조건 확인 (일봉 종가 볼린저 밴드)
+        bands = context.daily_indicators.bollinger(self._bb_period, self._std_multiplier)
+        if bands is None:
             return TradingSignal.hold(stock_code, "볼린저 밴드 계산 불가")
+        _, _, lower_band = bands
 
         current_price = context.current_price
 
@@ -24,7 +24,7 @@ ATR 기반 변동성 필터링으로 적절한 진입 시점 포착.
     - MDD: 6.25%
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
 from leverage_worker.strategy.base import BaseStrategy, StrategyContext, TradingSignal
 from leverage_worker.strategy.registry import register_strategy
@@ -33,47 +33,6 @@ from leverage_worker.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
-def calculate_atr(
-    high_prices: List[float],
-    low_prices: List[float],
-    close_prices: List[float],
-    period: int = 14,
-) -> Optional[float]:
-    """
-    ATR (Average True Range) 계산
-
-    Args:
-        high_prices: 고가 리스트
-        low_prices: 저가 리스트
-        close_prices: 종가 리스트
-        period: ATR 기간
-
-    Returns:
-        ATR 값 또는 None
-    """
-    if len(high_prices) < period + 1:
-        return None
-
-    true_ranges = []
-
-    for i in range(1, len(high_prices)):
-        high = high_prices[i]
-        low = low_prices[i]
-        prev_close = close_prices[i - 1]
-
-        tr1 = high - low
-        tr2 = abs(high - prev_close)
-        tr3 = abs(low - prev_close)
-
-        true_ranges.append(max(tr1, tr2, tr3))
-
-    if len(true_ranges) < period:
-        return None
-
-    recent_trs = true_ranges[-period:]
-    return sum(recent_trs) / period
-
-
 @register_strategy("kosdaq_mdd_target")
 class KosdaqMDDTargetStrategy(BaseStrategy):
     """
@@ -175,12 +134,8 @@ class KosdaqMDDTargetStrategy(BaseStrategy):
         current_price = context.current_price
 
         # 조건 1: ATR 변동성 확인 (일봉 기준)
-        daily_candles = context.daily_candles[-required_days:]
-        high_prices = [c.high_price for c in daily_candles]
-        low_prices = [c.low_price for c in daily_candles]
-        close_prices = [c.close_price for c in daily_candles]
-
-        atr = calculate_atr(high_prices, low_prices, close_prices, self._atr_period)
+        daily = context.daily_indicators
+        atr = daily.atr(self._atr_period)
         if atr is None:
             return TradingSignal.hold(stock_code, "ATR 계산 불가")
 
@@ -188,8 +143,7 @@ class KosdaqMDDTargetStrategy(BaseStrategy):
         has_valid_volatility = self._min_volatility < atr_ratio < self._max_volatility
 
         # 조건 2: 상승 추세 확인 (일봉 기준)
-        prices = context.get_daily_prices(self._trend_period + 1)
-        price_trend_ago = prices[-(self._trend_period + 1)]
+        price_trend_ago = float(daily.close[-(self._trend_period + 1)])
         is_uptrend = current_price > price_trend_ago
 
         if has_valid_volatility and is_uptrend:
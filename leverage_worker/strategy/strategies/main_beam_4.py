@@ -29,6 +29,7 @@ ML 기반 4분 지정가 스캘핑 전략
     sell_profit_pct: 매도 수익율 (기본 0.001 = +0.1%)
     timeout_seconds: 타임아웃 (기본 240초 = 4분)
     sl_check_from_next_bar: 체결봉 SL 제외 (기본 True)
+    incremental_features: 증분 피처 계산 사용 (기본 True, False면 배치 calculate_features)
     * 수량은 config의 allocation 비율로 자동 계산
 
 백테스트 결과:
@@ -43,10 +44,11 @@ import logging
 import math
 from datetime import datetime, time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 
 from leverage_worker.ml.data_utils import candles_to_dataframe
 from leverage_worker.ml.two_stage_classifier import TwoStageClassifier
+from leverage_worker.ml.features_incremental import IncrementalLimitOrderFeatures
 from leverage_worker.ml.features_limit_order import calculate_features
 from leverage_worker.scalping.executor import round_to_tick_size
 from leverage_worker.strategy.base import BaseStrategy, StrategyContext, TradingSignal
@@ -84,6 +86,7 @@ class MainBeam4Strategy(BaseStrategy):
         self._sell_profit_pct = self.get_param("sell_profit_pct", 0.001)    # +0.1%
         self._timeout_seconds = self.get_param("timeout_seconds", 240)      # 4분
         self._sl_check_from_next_bar = self.get_param("sl_check_from_next_bar", True)
+        self._incremental_features = self.get_param("incremental_features", True)
 
         # Momentum 필터 (비활성화)
         # self._momentum_5_pct_min = self.get_param("momentum_5_pct_min", -0.003)  # -0.3%
@@ -100,6 +103,9 @@ class MainBeam4Strategy(BaseStrategy):
         self._model_loaded = False
         self._feature_cols: Optional[list] = None
 
+        # 종목별 증분 피처 계산기
+        self._feature_engines: Dict[str, IncrementalLimitOrderFeatures] = {}
+
         # 진입 추적
         self._entry_time: Optional[datetime] = None
         self._entry_price: Optional[int] = None
@@ -197,14 +203,12 @@ class MainBeam4Strategy(BaseStrategy):
         """진입 조건 확인 (2단계 필터링)"""
         stock_code = context.stock_code
 
-        # 분봉 데이터 → DataFrame 변환
-        df = candles_to_dataframe(context.price_history)
-        if df.empty or len(df) < self.MIN_DATA_REQUIRED:
+        if len(context.price_history) < self.MIN_DATA_REQUIRED:
             return TradingSignal.hold(stock_code, "데이터 부족")
 
-        # 피처 계산 (129개)
+        # 피처 계산 (129개) - 마지막 봉
         try:
-            df = calculate_features(df)
+            last_row = self._calculate_last_features(context)
         except Exception as e:
             logger.warning(f"[{stock_code}] 피처 계산 실패: {e}")
             return TradingSignal.hold(stock_code, f"피처 계산 실패: {e}")
@@ -215,7 +219,7 @@ class MainBeam4Strategy(BaseStrategy):
             return TradingSignal.hold(stock_code, "피처 컬럼 없음")
 
         # 누락된 피처 확인
-        missing_cols = [c for c in self._feature_cols if c not in df.columns]
+        missing_cols = [c for c in self._feature_cols if c not in last_row]
         if missing_cols:
             logger.warning(
                 f"[{stock_code}] 누락된 피처 {len(missing_cols)}개: "
@@ -223,9 +227,6 @@ class MainBeam4Strategy(BaseStrategy):
             )
             return TradingSignal.hold(stock_code, f"피처 누락: {len(missing_cols)}개")
 
-        # 마지막 행 참조 (Momentum 필터 + OHLCV 로그용)
-        last_row = df.iloc[-1]
-
         # Momentum 필터 (비활성화)
         # momentum_5_pct = last_row.get("momentum_pct_5", 0.0)
         # if math.isnan(momentum_5_pct):
@@ -246,7 +247,7 @@ class MainBeam4Strategy(BaseStrategy):
 
         # 피처 추출 (필터 통과 시에만)
         try:
-            features = df[self._feature_cols].iloc[-1:].values
+            features = IncrementalLimitOrderFeatures.to_vector(last_row, self._feature_cols)
         except Exception as e:
             logger.warning(f"[{stock_code}] 피처 추출 실패: {e}")
             return TradingSignal.hold(stock_code, f"피처 추출 실패: {e}")
@@ -267,7 +268,7 @@ class MainBeam4Strategy(BaseStrategy):
         )
 
         # CSV 시그널 기록 (분석/백테스트용)
-        self._record_signal_to_csv(context, df, old_proba, new_proba, has_signal)
+        self._record_signal_to_csv(context, last_row, old_proba, new_proba, has_signal)
 
         # 2단계 필터링 결과 확인
         if not has_signal:
@@ -280,7 +281,7 @@ class MainBeam4Strategy(BaseStrategy):
             return TradingSignal.hold(stock_code, reason)
 
         # 지정가 매수 가격 계산: 이전 봉 종가 * (1 - discount)
-        prev_close = int(df["close"].iloc[-1])
+        prev_close = int(last_row["close"])
         buy_price = round_to_tick_size(
             int(prev_close * (1 - self._buy_discount_pct)), direction="down"
         )
@@ -316,6 +317,23 @@ class MainBeam4Strategy(BaseStrategy):
 
         return signal
 
+    def _calculate_last_features(self, context: StrategyContext) -> Mapping[str, Any]:
+        """
+        마지막 봉의 피처 계산
+
+        증분 모드: 종목별 상태에 새 봉만 반영 (봉당 O(1))
+        배치 모드: 전체 분봉 DataFrame으로 calculate_features 후 마지막 행
+        """
+        if self._incremental_features:
+            engine = self._feature_engines.get(context.stock_code)
+            if engine is None:
+                engine = IncrementalLimitOrderFeatures()
+                self._feature_engines[context.stock_code] = engine
+            return engine.sync(context.price_history)
+
+        df = calculate_features(candles_to_dataframe(context.price_history))
+        return df.iloc[-1]
+
     def on_entry(self, context: StrategyContext, signal: TradingSignal) -> None:
         """진입 완료 콜백"""
         self._entry_time = context.current_time
@@ -345,17 +363,15 @@ class MainBeam4Strategy(BaseStrategy):
     def _record_signal_to_csv(
         self,
         context: StrategyContext,
-        df,
+        last_row: Mapping[str, Any],
         old_proba: float,
         new_proba: float,
         has_signal: bool
     ) -> None:
         """시그널 정보를 CSV에 기록 (분석/백테스트용)"""
         try:
-            last_row = df.iloc[-1]
-
             # 기본 정보 계산
-            prev_close = int(df["close"].iloc[-1])
+            prev_close = int(last_row["close"])
             change_rate = (context.current_price - prev_close) / prev_close * 100 if prev_close > 0 else 0
             pos_str = "보유" if context.has_position else ""
             signal_label = "BUY" if has_signal else "HOLD"
@@ -122,14 +122,19 @@ class ScalpingRangeStrategy(BaseStrategy):
         if candle_end.minute < candle_start.minute:
             candle_end = candle_end.replace(hour=candle_start.hour + 1)
 
+        # candle_datetime("YYYY-MM-DD HH:MM")은 문자열 비교로 시간순 비교 가능
+        # price_history는 시간 오름차순 → 뒤에서부터 구간 시작 이전까지만 확인
+        start_key = candle_start.strftime("%Y-%m-%d %H:%M")
+        end_key = candle_end.strftime("%Y-%m-%d %H:%M")
         relevant_candles: List[OHLCV] = []
-        for candle in context.price_history:
-            try:
-                candle_dt = datetime.strptime(candle.candle_datetime, "%Y-%m-%d %H:%M")
-                if candle_start <= candle_dt < candle_end:
-                    relevant_candles.append(candle)
-            except (ValueError, AttributeError):
+        for candle in reversed(context.price_history):
+            candle_key = getattr(candle, "candle_datetime", None)
+            if not isinstance(candle_key, str):
                 continue
+            if candle_key < start_key:
+                break
+            if candle_key < end_key:
+                relevant_candles.append(candle)
 
         if not relevant_candles:
             return Candle(
@@ -0,0 +1,124 @@
+"""
+계좌 스냅샷 테스트
+
+- TTL 이내 재조회는 REST 호출 없이 재사용, max_age=0이면 새로 조회
+- 동시 조회는 진행 중인 REST 호출 1건 공유 (single-flight)
+- 조회 중 무효화되면 결과를 캐시하지 않음
+- 조회 실패(None / 빈 요약)는 캐시하지 않음
+- 주문번호/종목코드 인덱스
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+from leverage_worker.trading.account_snapshot import AccountSnapshot
+
+
+def _order(order_id, stock_code, filled_qty=0):
+    return SimpleNamespace(order_id=order_id, stock_code=stock_code, order_qty=10, filled_qty=filled_qty)
+
+
+class _Rest:
+    """호출 수 기록 + 조회 지연/차단 가능한 가짜 REST"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.gate = threading.Event()
+        self.gate.set()
+        self.order_calls = 0
+        self.balance_calls = 0
+        self.orders = [_order("0001", "122630"), _order("0002", "122630", 3), _order("0003", "233740")]
+        self.summary = {"deposit": 1_000_000}
+
+    def fetch_orders(self):
+        self.order_calls += 1
+        self.gate.wait(5)
+        time.sleep(self.delay)
+        return list(self.orders)
+
+    def fetch_balance(self):
+        self.balance_calls += 1
+        time.sleep(self.delay)
+        return [SimpleNamespace(stock_code="122630", quantity=7)], dict(self.summary)
+
+
+class TestAccountSnapshot:
+    def test_ttl_reuse_and_forced_refresh(self):
+        """TTL 이내 재사용, max_age=0은 새로 조회"""
+        rest = _Rest()
+        snap = AccountSnapshot(rest.fetch_orders, rest.fetch_balance, orders_ttl=10.0)
+
+        first = snap.orders()
+        assert snap.orders() is first
+        assert rest.order_calls == 1
+
+        assert snap.orders(max_age=0) is not first
+        assert rest.order_calls == 2
+        assert snap.stats()["hits"] == 1
+
+    def test_indexes(self):
+        """주문번호/종목코드 O(1) 조회"""
+        rest = _Rest()
+        snap = AccountSnapshot(rest.fetch_orders, rest.fetch_balance)
+
+        orders = snap.orders()
+        assert orders.get("0002").filled_qty == 3
+        assert orders.get("9999") is None
+        assert [o.order_id for o in orders.for_stock("122630")] == ["0001", "0002"]
+        assert orders.for_stock("069500") == ()
+
+        balance = snap.balance()
+        assert balance.position("122630").quantity == 7
+        assert balance.position("233740") is None
+        assert balance.summary["deposit"] == 1_000_000
+
+    def test_concurrent_callers_share_one_fetch(self):
+        """동시 10건 조회 → REST 1회"""
+        rest = _Rest(delay=0.1)
+        snap = AccountSnapshot(rest.fetch_orders, rest.fetch_balance)
+        results = []
+
+        threads = [threading.Thread(target=lambda: results.append(snap.balance())) for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert rest.balance_calls == 1
+        assert len(results) == 10 and all(r is results[0] for r in results)
+        stats = snap.stats()
+        assert stats["coalesced"] + stats["hits"] == 9
+
+    def test_invalidate_during_fetch_is_not_cached(self):
+        """조회 중 무효화 → 진행 중 결과는 캐시하지 않고, 이후 조회는 새로 조회"""
+        rest = _Rest()
+        rest.gate.clear()
+        snap = AccountSnapshot(rest.fetch_orders, rest.fetch_balance, orders_ttl=10.0)
+
+        leader = threading.Thread(target=snap.orders)
+        leader.start()
+        deadline = time.monotonic() + 2.0
+        while rest.order_calls == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        snap.invalidate()  # 체결통보 수신
+        rest.gate.set()
+        leader.join()
+
+        rest.orders = [_order("0001", "122630", 10)]
+        assert snap.orders().get("0001").filled_qty == 10
+        assert rest.order_calls == 2
+
+    def test_failures_are_not_cached(self):
+        """주문 조회 None / 잔고 빈 요약 → None 반환, 다음 호출에 재조회"""
+        rest = _Rest()
+        snap = AccountSnapshot(lambda: None, rest.fetch_balance, balance_ttl=10.0)
+        rest.summary = {}
+
+        assert snap.orders() is None
+        assert snap.balance() is None
+        rest.summary = {"deposit": 5}
+        assert snap.balance().summary == {"deposit": 5}
+        assert rest.balance_calls == 2
+        assert snap.stats()["failures"] == 2
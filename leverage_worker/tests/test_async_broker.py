@@ -0,0 +1,249 @@
+"""
+비동기 브로커 / async 스케줄러 모드 테스트 (가짜 aiohttp 세션)
+
+- 여러 종목 조회가 한 이벤트 루프에서 동시에 진행
+- 429 응답 → 토큰 버킷 속도 감소 후 재시도, 5xx 재시도 소진 시 실패 응답
+- acquire_async 대기 중 이벤트 루프 비차단
+- 스케줄러 async 모드: 종목 틱을 전용 루프에서 동시에 실행, 종료 시 정리 코루틴 실행
+"""
+
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+from types import SimpleNamespace
+
+import pytest
+
+from leverage_worker.config.settings import ScheduleConfig, StockConfig
+from leverage_worker.core import scheduler as scheduler_module
+from leverage_worker.core.rate_limiter import TokenBucketRateLimiter
+from leverage_worker.core.scheduler import TradingScheduler
+from leverage_worker.core.session_manager import SessionManager
+from leverage_worker.trading.async_broker import AsyncKISBroker
+
+pytest.importorskip("aiohttp")
+
+
+def _price_body(price: int) -> dict:
+    return {
+        "rt_cd": "0",
+        "msg_cd": "MCA00000",
+        "msg1": "정상처리 되었습니다.",
+        "output": {"hts_kor_isnm": "KODEX 레버리지", "stck_prpr": str(price), "prdy_ctrt": "1.20"},
+    }
+
+
+class _FakeResponse:
+    """aiohttp 응답 (async with 진입 시 지연)"""
+
+    def __init__(self, client: "FakeClient", status: int, body):
+        self._client = client
+        self.status = status
+        self.headers = {"Content-Type": "application/json", "tr_cont": ""}
+        self._text = body if isinstance(body, str) else json.dumps(body)
+
+    async def __aenter__(self):
+        self._client.active += 1
+        self._client.max_active = max(self._client.max_active, self._client.active)
+        await asyncio.sleep(self._client.delay)
+        return self
+
+    async def __aexit__(self, *exc):
+        self._client.active -= 1
+        return False
+
+    async def text(self) -> str:
+        return self._text
+
+
+class FakeClient:
+    """aiohttp.ClientSession 대역 (응답 순서대로 반환, 없으면 기본 응답)"""
+
+    closed = False
+
+    def __init__(self, responses=(), default=(200, _price_body(10_000)), delay: float = 0.0):
+        self.responses = deque(responses)
+        self.default = default
+        self.delay = delay
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+
+    def get(self, url, headers=None, params=None):
+        self.requests.append(("GET", url, params))
+        status, body = self.responses.popleft() if self.responses else self.default
+        return _FakeResponse(self, status, body)
+
+    def post(self, url, headers=None, data=None):
+        self.requests.append(("POST", url, data))
+        status, body = self.responses.popleft() if self.responses else self.default
+        return _FakeResponse(self, status, body)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    """SessionManager 대역 (요청 생성 / 속도 제한 / 제한 응답 판별)"""
+
+    is_throttled = staticmethod(SessionManager.is_throttled)
+
+    def __init__(self, limiter: TokenBucketRateLimiter):
+        self.rate_limiter = limiter
+
+    def build_request(self, api_url, tr_id):
+        return f"https://fake{api_url}", {"tr_id": tr_id}
+
+    def get_account_info(self):
+        return "12345678", "01"
+
+    def force_reauthenticate(self) -> bool:
+        return True
+
+
+def _broker(client: FakeClient, rate: float = 1_000.0) -> AsyncKISBroker:
+    broker = AsyncKISBroker(FakeSession(TokenBucketRateLimiter(rate, burst=rate)))
+    broker._client = client
+    return broker
+
+
+@pytest.fixture
+def fast_sleep(monkeypatch):
+    """재시도 대기(asyncio.sleep) 기록 후 즉시 진행"""
+    delays = []
+    real_sleep = asyncio.sleep
+
+    async def _sleep(delay, *args, **kwargs):
+        delays.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", _sleep)
+    return delays
+
+
+class TestAsyncKISBroker:
+    def test_concurrent_requests_overlap_on_one_loop(self):
+        """종목 5개 동시 조회 → 응답 대기가 겹침 (순차 합계보다 빠름)"""
+        client = FakeClient(delay=0.1)
+        broker = _broker(client)
+        codes = ["122630", "233740", "069500", "229200", "252670"]
+
+        async def run():
+            return await asyncio.gather(*(broker.get_current_price(c) for c in codes))
+
+        start = time.perf_counter()
+        prices = asyncio.run(run())
+        elapsed = time.perf_counter() - start
+
+        assert [p.stock_code for p in prices] == codes
+        assert all(p.current_price == 10_000 for p in prices)
+        assert client.max_active == len(codes)
+        assert elapsed < 0.1 * len(codes) / 2
+
+    def test_throttled_response_backs_off_and_retries(self, fast_sleep):
+        """429 → 속도 절반 + 대기 후 재시도 → 성공"""
+        client = FakeClient(responses=[(429, "too many"), (200, _price_body(10_050))])
+        broker = _broker(client, rate=20.0)
+        limiter = broker._session.rate_limiter
+
+        price = asyncio.run(broker.get_current_price("122630"))
+
+        assert price.current_price == 10_050
+        assert len(client.requests) == 2
+        assert limiter.rate == 10.0
+        assert limiter.get_status()["throttled"] == 1
+        assert 1.0 in fast_sleep  # 첫 재시도 대기
+
+    def test_server_errors_exhaust_retries(self, fast_sleep):
+        """5xx 연속 → 재시도(3회) 후 실패 응답, 분봉은 빈 리스트"""
+        client = FakeClient(default=(500, "internal error"))
+        broker = _broker(client)
+
+        assert asyncio.run(broker.get_minute_candles("122630")) == []
+        assert len(client.requests) == 4
+        assert [d for d in fast_sleep if d >= 1.0] == [1.0, 2.0, 4.0]
+
+    def test_close_closes_client(self):
+        client = FakeClient()
+        broker = _broker(client)
+        asyncio.run(broker.close())
+        assert client.closed
+
+
+class TestAcquireAsync:
+    def test_waiting_does_not_block_loop(self):
+        """토큰 대기 중에도 같은 루프의 다른 코루틴이 진행"""
+        limiter = TokenBucketRateLimiter(20.0, burst=1.0)  # 50ms마다 1개
+        ticks = []
+
+        async def ticker(stop: asyncio.Event):
+            while not stop.is_set():
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.005)
+
+        async def run():
+            stop = asyncio.Event()
+            task = asyncio.create_task(ticker(stop))
+            start = time.perf_counter()
+            await asyncio.gather(*(limiter.acquire_async() for _ in range(3)))
+            elapsed = time.perf_counter() - start
+            stop.set()
+            await task
+            return elapsed
+
+        elapsed = asyncio.run(run())
+
+        assert elapsed >= 0.09  # 버스트 1 + 보충 2개
+        assert len(ticks) >= 10
+        assert limiter.get_status()["acquired"] == 3
+
+
+def _settings(codes, interval: float) -> SimpleNamespace:
+    stocks = {c: StockConfig(code=c, name=c, interval_seconds=interval) for c in codes}
+    return SimpleNamespace(
+        schedule=ScheduleConfig(),
+        stocks=stocks,
+        get_stock_interval=lambda code: stocks[code].interval_seconds,
+        get_stock_offset=lambda code: 0,
+        get_scheduler_workers=lambda: 2,
+    )
+
+
+@pytest.fixture
+def always_trading(monkeypatch):
+    monkeypatch.setattr(scheduler_module, "is_weekday", lambda now: True)
+    monkeypatch.setattr(scheduler_module, "is_trading_hours", lambda now, start, end: True)
+
+
+def test_scheduler_async_mode_runs_ticks_concurrently_on_loop(always_trading):
+    codes = ["A", "B", "C"]
+    scheduler = TradingScheduler(_settings(codes, 0.2))
+    threads, slots = set(), []
+    state = {"active": 0, "max_active": 0, "shutdown": False}
+    lock = threading.Lock()
+
+    async def on_tick(stock_code, slot_time):
+        with lock:
+            threads.add(threading.current_thread().name)
+            slots.append((stock_code, slot_time))
+            state["active"] += 1
+            state["max_active"] = max(state["max_active"], state["active"])
+        await asyncio.sleep(0.05)  # 비동기 REST 대기
+        with lock:
+            state["active"] -= 1
+
+    async def on_shutdown():
+        state["shutdown"] = True
+
+    scheduler.set_on_stock_tick_async(on_tick, on_shutdown=on_shutdown)
+    scheduler.start()
+    time.sleep(0.7)
+    scheduler.stop()
+
+    assert threads == {"TradingSchedulerLoop"}
+    assert {code for code, _ in slots} == set(codes)
+    assert state["max_active"] >= 2  # 같은 슬롯의 종목들이 루프에서 겹쳐 실행
+    assert state["shutdown"]
+    assert scheduler.get_status()["tick_mode"] == "async"
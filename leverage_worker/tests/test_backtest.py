@@ -0,0 +1,179 @@
+"""
+백테스트 패키지 테스트
+
+임시 MarketDataDB에 합성 분봉을 넣고 리플레이
+- SimulatedBroker 체결 규칙 (호가단위, 수수료, 대기 지정가)
+- BacktestEngine 전략 구동 (시그널 → 주문 → 거래 원장/평가자산)
+- 공유 메모리 피드 / 파라미터 스윕
+"""
+
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+
+from leverage_worker.backtest import (
+    BacktestConfig,
+    BacktestEngine,
+    MarketDataFeed,
+    SharedMarketData,
+    SimulatedBroker,
+    StrategySpec,
+    iter_grid,
+    run_sweep,
+    sample_space,
+)
+from leverage_worker.data.database import MarketDataDB
+from leverage_worker.data.minute_candle_repository import MinuteCandle, MinuteCandleRepository
+from leverage_worker.strategy import BaseStrategy, StrategyContext, StrategyRegistry, TradingSignal
+from leverage_worker.trading.broker import OrderSide
+
+
+class _EveryNBarsStrategy(BaseStrategy):
+    """N번째 분봉마다 매수, 다음 N번째 분봉에 매도하는 테스트 전략"""
+
+    MIN_DATA_REQUIRED = 1
+
+    def generate_signal(self, context: StrategyContext) -> TradingSignal:
+        n = self.get_param("every", 10)
+        if len(context.price_history) % n:
+            return TradingSignal.hold(context.stock_code)
+        if context.has_position:
+            return TradingSignal.sell(context.stock_code, context.position_quantity, "청산")
+        return TradingSignal.buy(context.stock_code, 0, "진입")
+
+
+StrategyRegistry.register("_test_every_n_bars", _EveryNBarsStrategy)
+
+
+def _candles(stock_code: str, trade_date: str, closes: List[int]) -> List[MinuteCandle]:
+    start = datetime.strptime(trade_date, "%Y%m%d").replace(hour=9)
+    candles = []
+    prev = closes[0]
+    for i, close in enumerate(closes):
+        ts = start + timedelta(minutes=i)
+        candles.append(
+            MinuteCandle(
+                stock_code=stock_code,
+                candle_datetime=ts.strftime("%Y-%m-%d %H:%M"),
+                trade_date=trade_date,
+                open_price=prev,
+                high_price=max(prev, close),
+                low_price=min(prev, close),
+                close_price=close,
+                volume=100,
+            )
+        )
+        prev = close
+    return candles
+
+
+@pytest.fixture
+def market_db(tmp_path):
+    db = MarketDataDB(tmp_path / "market_data.db")
+    repo = MinuteCandleRepository(db)
+    for trade_date in ("20250102", "20250103"):
+        closes = [10000 + 5 * (i % 40) for i in range(120)]
+        repo.upsert_batch(_candles("122630", trade_date, closes), verbose=False)
+    yield db
+    db.close()
+
+
+class TestSimulatedBroker:
+    """SimulatedBroker 체결 규칙"""
+
+    def test_market_and_resting_limit_orders(self):
+        broker = SimulatedBroker(initial_cash=1_000_000, buy_fee_rate=0.001, sell_fee_rate=0.001)
+        bars = _candles("122630", "20250102", [4000, 4010, 3980, 4050])
+        now = datetime(2025, 1, 2, 9, 1)
+        broker.begin_day()
+        broker.on_bar(bars[0], now)
+
+        # 시장가 매수 → 매도1호가 (종가 + 1틱)
+        result = broker.place_market_order("122630", OrderSide.BUY, 10)
+        assert result.success
+        position = broker.get_position("122630")
+        assert position.quantity == 10
+        assert position.avg_price == 4005
+        assert broker.cash == 1_000_000 - 40050 - 40
+
+        # 호가단위에 맞지 않는 지정가 매도 → 올림 후 대기
+        result = broker.place_limit_order("122630", OrderSide.SELL, 10, 4041)
+        assert broker.get_order_status(result.order_id) == (0, 10)
+
+        broker.on_bar(bars[1], now + timedelta(minutes=1))
+        broker.on_bar(bars[2], now + timedelta(minutes=2))
+        assert broker.get_position("122630") is not None
+
+        fills = broker.on_bar(bars[3], now + timedelta(minutes=3))
+        assert [f.price for f in fills] == [4045]
+        assert broker.get_position("122630") is None
+        assert broker.get_order_status(result.order_id) == (10, 0)
+
+        trade = broker.trades[-1]
+        assert trade.pnl == (4045 - 4005) * 10 - 40 - 40
+        assert broker.get_equity() == broker.cash
+
+
+class TestBacktestEngine:
+    """BacktestEngine 리플레이"""
+
+    def test_run_produces_ledger_and_equity_curve(self, market_db):
+        spec = StrategySpec(stock_code="122630", name="_test_every_n_bars", params={"every": 10})
+        config = BacktestConfig(start_date="20250101", end_date="20250131", initial_cash=5_000_000)
+        result = BacktestEngine(market_db, [spec], config).run()
+
+        assert result.bars_processed == 240
+        assert len(result.equity_curve) == 240
+        assert result.trades
+        assert all(t.strategy_name == "_test_every_n_bars" for t in result.trades)
+        assert result.final_equity == config.initial_cash + sum(t.pnl for t in result.trades)
+
+        summary = result.summary()
+        assert summary["trade_count"] == len(result.trades)
+        assert len(result.trades_dataframe()) == len(result.trades)
+
+
+class TestSweep:
+    """공유 메모리 피드 / 파라미터 스윕"""
+
+    def test_array_feed_matches_db_feed(self, market_db):
+        db_feed = MarketDataFeed(market_db, ["122630"], "20250101", "20250131")
+        with SharedMarketData.create(market_db, ["122630"], "20250101", "20250131") as data:
+            attached = SharedMarketData.attach(data.handle)
+            array_feed = attached.feed(["122630"])
+            assert array_feed.get_trade_dates() == db_feed.get_trade_dates()
+            for (date_a, day_a), (date_b, day_b) in zip(array_feed.iter_days(), db_feed.iter_days()):
+                assert date_a == date_b
+                assert day_a == day_b
+            attached.close()
+
+    def test_search_space(self):
+        space = {"a": [1, 2, 3], "b": [0.1, 0.2]}
+        grid = list(iter_grid(space))
+        assert len(grid) == 6
+        samples = sample_space(space, 4, seed=1)
+        assert len(samples) == 4
+        assert all(s in grid for s in samples)
+        assert len({tuple(s.items()) for s in samples}) == 4
+        assert len(sample_space(space, 100, seed=1)) == 6
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_run_sweep(self, market_db, tmp_path, max_workers):
+        output = tmp_path / "sweep.parquet"
+        result = run_sweep(
+            "bollinger_band",
+            {"bb_period": [10, 20], "std_multiplier": [1.0, 2.0]},
+            ["122630"],
+            "20250101",
+            "20250131",
+            max_workers=max_workers,
+            db=market_db,
+            output_path=output,
+        )
+        df = result.to_dataframe()
+        assert len(df) == 4
+        assert df["error"].isna().all()
+        assert (df["bars_processed"] == 240).all()
+        assert output.exists()
+        assert len(result.ranked()) == 4
@@ -0,0 +1,93 @@
+"""
+틱 → 봉 집계 테스트
+
+- 누적거래량 기준 거래량, 다음 분 체결 수신 시 즉시 완성, 장 시간 밖 제외
+- 완성 후 도착한 틱은 해당 봉 + 다음 봉 보정본 재발행
+- 집계 시작 직후의 잘린 첫 봉은 발행하지 않음
+- N초봉 시각 기준 완성, REST 분봉 대조 후에는 보정본 발행 안 함
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+from leverage_worker.data.bar_aggregator import BarAggregator
+
+
+def _tick(ts, price, volume, acc, code="122630"):
+    return SimpleNamespace(
+        stock_code=code, timestamp=ts, price=price, volume=volume, accumulated_volume=acc
+    )
+
+
+def _collector():
+    batches = []
+    return batches, batches.append
+
+
+def test_minute_bars_and_late_tick_correction():
+    batches, on_bars = _collector()
+    agg = BarAggregator(on_bars=on_bars)
+
+    agg.on_tick(_tick(datetime(2026, 1, 5, 8, 59, 50), 990, 5, 5))  # 장 시작 전
+    agg.on_tick(_tick(datetime(2026, 1, 5, 9, 0, 1), 1000, 10, 10))
+    agg.on_tick(_tick(datetime(2026, 1, 5, 9, 0, 30), 1010, 5, 15))
+    agg.on_tick(_tick(datetime(2026, 1, 5, 9, 0, 40), 1010, 5, 15))  # 중복
+    agg.on_tick(_tick(datetime(2026, 1, 5, 9, 0, 20), 990, 3, 13))  # 순서 뒤바뀜 (봉 진행 중)
+    agg.on_tick(_tick(datetime(2026, 1, 5, 9, 1, 2), 1020, 7, 30))  # 9:00:50 체결(acc 23) 누락
+    assert agg.flush() == 1
+
+    bar = batches[-1][0]
+    assert bar.start == datetime(2026, 1, 5, 9, 0)
+    assert (bar.open_price, bar.high_price, bar.low_price, bar.close_price) == (1000, 1010, 990, 1010)
+    assert bar.volume == 15
+
+    # 누락됐던 9:00:50 체결이 늦게 도착 → 9:00 보정 (9:01 봉은 아직 진행 중)
+    agg.on_tick(_tick(datetime(2026, 1, 5, 9, 0, 50), 1030, 8, 23))
+    agg.flush()
+    corrected = batches[-1][0]
+    assert corrected.revision == 1
+    assert (corrected.high_price, corrected.close_price, corrected.volume) == (1030, 1030, 23)
+
+    agg.advance(datetime(2026, 1, 5, 9, 2, 1))
+    minute_2 = batches[-1][0]
+    assert minute_2.start == datetime(2026, 1, 5, 9, 1)
+    assert minute_2.volume == 7  # 30 - 23
+
+    stats = agg.stats()
+    assert stats["outside_session"] == 1
+    assert stats["late_ticks"] == 1 and stats["corrections"] == 1
+
+
+def test_partial_first_bar_n_second_bars_and_reconcile():
+    batches, on_bars = _collector()
+    agg = BarAggregator(on_bars=on_bars, bar_seconds=[10], reconcile_settle_seconds=0)
+
+    # 장중 집계 시작 → 10:00 첫 봉은 앞부분이 없으므로 발행 안 함
+    agg.on_tick(_tick(datetime(2026, 1, 5, 10, 0, 30), 500, 10, 1000))
+    agg.on_tick(_tick(datetime(2026, 1, 5, 10, 1, 5), 505, 20, 1020))
+    agg.on_tick(_tick(datetime(2026, 1, 5, 10, 1, 15), 510, 30, 1050))
+    agg.advance(datetime(2026, 1, 5, 10, 2, 1))
+
+    bars = [bar for batch in batches for bar in batch]
+    assert {(b.seconds, b.start.strftime("%H:%M:%S"), b.volume) for b in bars} == {
+        (10, "10:01:00", 20),
+        (10, "10:01:10", 30),
+        (60, "10:01:00", 50),
+    }
+    assert agg.stats()["partial_skipped"] == 2
+
+    # REST 분봉 대조: 차이 기록 후 REST 값 확정, 이후 늦은 틱은 보정본 발행 안 함
+    rest = SimpleNamespace(
+        candle_datetime="2026-01-05 10:01",
+        open_price=505, high_price=510, low_price=505, close_price=510, volume=52,
+    )
+    assert agg.reconcile("122630", [rest], datetime(2026, 1, 5, 10, 2, 5)) == 1
+    assert agg.get_bars("122630")[-1].volume == 52
+
+    batches.clear()
+    agg.on_tick(_tick(datetime(2026, 1, 5, 10, 1, 30), 508, 2, 1052))
+    agg.flush()
+    assert all(b.seconds == 10 for batch in batches for b in batch)
+
+    stats = agg.stats()
+    assert stats["drift_bars"] == 1 and stats["drift_volume"] == 2
@@ -0,0 +1,132 @@
+"""
+분봉 Parquet 아카이브 테스트
+
+- 월 파일 병합 저장 / 구간 조회
+- 아카이브 + SQLite 통합 조회 (SQLite 우선)
+- 보관 기간 이관 (SQLite 삭제) 후 백테스트 피드 동일성
+"""
+
+from datetime import datetime, timedelta
+from typing import List
+
+import numpy as np
+import pytest
+
+from leverage_worker.backtest import MarketDataFeed, SharedMarketData
+from leverage_worker.data.candle_archive import (
+    MinuteCandleArchive,
+    MinuteCandleReader,
+    archive_minute_candles,
+    rows_to_table,
+)
+from leverage_worker.data.database import MarketDataDB
+from leverage_worker.data.minute_candle_repository import MinuteCandle, MinuteCandleRepository
+
+TRADE_DATES = ["20250129", "20250130", "20250131", "20250203", "20250204"]
+
+
+def _day_candles(stock_code: str, trade_date: str, base: int, bars: int = 30) -> List[MinuteCandle]:
+    start = datetime.strptime(trade_date, "%Y%m%d").replace(hour=9)
+    candles = []
+    for i in range(bars):
+        ts = start + timedelta(minutes=i)
+        price = base + 5 * (i % 7)
+        candles.append(
+            MinuteCandle(
+                stock_code=stock_code,
+                candle_datetime=ts.strftime("%Y-%m-%d %H:%M"),
+                trade_date=trade_date,
+                open_price=price,
+                high_price=price + 5,
+                low_price=price - 5,
+                close_price=price,
+                volume=100 + i,
+            )
+        )
+    return candles
+
+
+@pytest.fixture
+def market_db(tmp_path):
+    db = MarketDataDB(tmp_path / "market_data.db")
+    repo = MinuteCandleRepository(db)
+    for n, trade_date in enumerate(TRADE_DATES):
+        repo.upsert_batch(_day_candles("122630", trade_date, 4000 + n * 10), verbose=False)
+        repo.upsert_batch(_day_candles("233740", trade_date, 3000 + n * 10), verbose=False)
+    yield db
+    db.close()
+
+
+class TestMinuteCandleArchive:
+    """아카이브 쓰기/읽기"""
+
+    def test_write_merges_and_reads_range(self, tmp_path):
+        archive = MinuteCandleArchive(tmp_path / "archive")
+        rows = [
+            (c.candle_datetime, c.open_price, c.high_price, c.low_price, c.close_price, c.volume)
+            for d in TRADE_DATES
+            for c in _day_candles("122630", d, 4000)
+        ]
+        archive.write("122630", rows_to_table(rows))
+        assert archive.months("122630") == ["202501", "202502"]
+
+        # 같은 봉 재기록 → 대체 (중복 없음)
+        revised = [(rows[0][0], 1.0, 2.0, 0.5, 1.5, 7)]
+        archive.write("122630", rows_to_table(revised))
+
+        table = archive.read("122630", "20250129", "20250203")
+        assert table.num_rows == 4 * 30
+        assert table["close"][0].as_py() == 1.5
+        assert archive.get_day_counts("122630", "20250101", "20250228") == {
+            d: 30 for d in TRADE_DATES
+        }
+        assert archive.get_date_range("122630") == ("20250129", "20250204")
+
+
+class TestMinuteCandleReader:
+    """아카이브 + SQLite 통합 조회 / 이관"""
+
+    def test_archive_then_read_spans_both(self, market_db, tmp_path):
+        reader = MinuteCandleReader(market_db)
+        before = reader.read_arrays("122630", "20250101", "20250228")
+        before_candles = reader.read_candles("122630", "20250101", "20250228")
+
+        archive = MinuteCandleArchive(tmp_path / "archive")
+        moved = archive_minute_candles(
+            market_db, archive, keep_days=3, today=datetime(2025, 2, 4, 16, 0)
+        )
+        # 20250201 이전 3거래일 × 30봉 이관
+        assert moved == {"122630": 90, "233740": 90}
+        remaining = market_db.fetch_one("SELECT MIN(trade_date) FROM minute_candles")[0]
+        assert remaining == "20250203"
+
+        reader = MinuteCandleReader(market_db, archive)
+        after = reader.read_arrays("122630", "20250101", "20250228")
+        for key in ("timestamp", "trade_date", "open", "close", "volume"):
+            np.testing.assert_array_equal(after[key], before[key])
+        assert reader.read_candles("122630", "20250101", "20250228") == before_candles
+        assert reader.get_date_range("122630") == ("20250129", "20250204")
+
+        # SQLite 값 우선
+        MinuteCandleRepository(market_db).upsert_batch(
+            [MinuteCandle("122630", "2025-01-29 09:00", "20250129", 1, 1, 1, 1, 1)],
+            verbose=False,
+        )
+        table = reader.read_table("122630", "20250129", "20250129")
+        assert table.num_rows == 30
+        assert table["close"][0].as_py() == 1
+
+    def test_backtest_feeds_include_archive(self, market_db, tmp_path):
+        codes = ["122630", "233740"]
+        expected = list(MarketDataFeed(market_db, codes, "20250101", "20250228").iter_days())
+
+        archive = MinuteCandleArchive(tmp_path / "archive")
+        archive_minute_candles(market_db, archive, keep_days=3, today=datetime(2025, 2, 4, 16, 0))
+
+        feed = MarketDataFeed(market_db, codes, "20250101", "20250228", archive=archive)
+        assert list(feed.iter_days()) == expected
+
+        with SharedMarketData.create(
+            market_db, codes, "20250101", "20250228", archive=archive
+        ) as data:
+            assert list(data.feed(codes).iter_days()) == expected
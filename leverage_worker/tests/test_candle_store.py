@@ -0,0 +1,150 @@
+"""
+CandleStore 모듈 테스트
+"""
+
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from leverage_worker.data.candle_store import CandleStore
+from leverage_worker.data.database import MarketDataDB
+from leverage_worker.data.minute_candle_repository import MinuteCandle, MinuteCandleRepository
+
+
+def _candle(minute: str, close: float, volume: int = 100) -> MinuteCandle:
+    return MinuteCandle(
+        stock_code="005930",
+        candle_datetime=f"2024-01-15 {minute}",
+        trade_date="20240115",
+        open_price=close,
+        high_price=close,
+        low_price=close,
+        close_price=close,
+        volume=volume,
+        created_at=datetime(2024, 1, 15, 10, 0),
+        updated_at=datetime(2024, 1, 15, 10, 0),
+    )
+
+
+class TestCandleStore:
+    """인메모리 분봉 저장소 테스트"""
+
+    def setup_method(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db = MarketDataDB(Path(self.temp_dir.name) / "market_data.db")
+        self.repo = MinuteCandleRepository(self.db)
+
+    def teardown_method(self):
+        self.db.close()
+        self.temp_dir.cleanup()
+
+    def test_seed_and_view(self):
+        """DB 적재 후 뷰 조회"""
+        self.repo.upsert_batch([_candle("10:00", 100), _candle("10:01", 101)])
+
+        store = CandleStore(self.repo)
+        store.seed(["005930"])
+
+        view = store.get_recent("005930", count=500)
+        assert len(view) == 2
+        assert view[-1].close_price == 101
+        assert [c.close_price for c in view[-1:]] == [101]
+
+    def test_view_excludes_until_and_is_stable(self):
+        """until_datetime 이후 분봉 제외 + 이후 추가분은 기존 뷰에 보이지 않음"""
+        store = CandleStore(self.repo)
+        store.upsert_candles("005930", [_candle("10:00", 100), _candle("10:01", 101)], persist=False)
+
+        view = store.get_recent("005930", count=10, until_datetime="2024-01-15 10:01")
+        assert len(view) == 1
+
+        store.upsert_candles("005930", [_candle("10:02", 102)], persist=False)
+        assert len(view) == 1
+        assert len(store.get_recent("005930", count=10, until_datetime="2024-01-15 10:03")) == 3
+
+    def test_merge_rule_matches_db_upsert(self):
+        """시가 유지 / 고가 max / 저가 min / 종가·거래량 교체"""
+        store = CandleStore(self.repo)
+        first = _candle("10:00", 100)
+        first.high_price = 105
+        store.upsert_candles("005930", [first], persist=False)
+
+        second = _candle("10:00", 99, volume=300)
+        second.open_price = 90
+        second.high_price = 103
+        second.low_price = 95
+        store.upsert_candles("005930", [second], persist=False)
+
+        merged = store.get_latest("005930")
+        assert merged.open_price == 100
+        assert merged.high_price == 105
+        assert merged.low_price == 95
+        assert merged.close_price == 99
+        assert merged.volume == 300
+
+    def test_closed_candle_revision_does_not_mutate_view(self):
+        """완성 분봉 수정은 copy-on-write (기존 뷰 불변)"""
+        store = CandleStore(self.repo)
+        store.upsert_candles("005930", [_candle("10:00", 100), _candle("10:01", 101)], persist=False)
+        view = store.get_recent("005930", count=10, until_datetime="2024-01-15 10:05")
+
+        store.upsert_candles("005930", [_candle("10:00", 98, volume=500)], persist=False)
+
+        assert view[0].close_price == 100
+        fresh = store.get_recent("005930", count=10, until_datetime="2024-01-15 10:05")
+        assert fresh[0].close_price == 98
+
+    def test_update_from_tick(self):
+        """체결로 분봉 생성/갱신 (장외 시간 무시)"""
+        store = CandleStore(self.repo)
+        store.update_from_tick("005930", 100, 10, datetime(2024, 1, 15, 10, 0, 1))
+        store.update_from_tick("005930", 103, 5, datetime(2024, 1, 15, 10, 0, 20))
+        store.update_from_tick("005930", 99, 7, datetime(2024, 1, 15, 10, 0, 40))
+        store.update_from_tick("005930", 200, 1, datetime(2024, 1, 15, 8, 30, 0))
+
+        candle = store.get_latest("005930")
+        assert candle.candle_datetime == "2024-01-15 10:00"
+        assert (candle.open_price, candle.high_price, candle.low_price, candle.close_price) == (
+            100, 103, 99, 99
+        )
+        assert candle.volume == 22
+        assert store.get_count("005930") == 1
+
+    def test_snapshot_price_refreshes_in_progress_bar(self):
+        """REST 분봉 이후 시세 스냅샷(거래량 0) → 마지막 분봉 종가 = 현재가, 다음 분은 새 분봉"""
+        store = CandleStore(self.repo)
+        store.upsert_candles("005930", [_candle("10:00", 100, volume=50)])
+
+        store.update_from_tick("005930", 104, 0, datetime(2024, 1, 15, 10, 0, 30))
+        candle = store.get_recent("005930", count=10)[-1]
+        assert (candle.high_price, candle.low_price, candle.close_price) == (104, 100, 104)
+        assert candle.volume == 50
+
+        store.update_from_tick("005930", 103, 0, datetime(2024, 1, 15, 10, 1, 5))
+        history = store.get_recent("005930", count=10)
+        assert [c.candle_datetime[-5:] for c in history] == ["10:00", "10:01"]
+        assert (history[-1].open_price, history[-1].close_price, history[-1].volume) == (103, 103, 0)
+
+    def test_flush_writes_through(self):
+        """대기 분봉 DB 일괄 저장"""
+        store = CandleStore(self.repo)
+        store.upsert_candles("005930", [_candle("10:00", 100), _candle("10:01", 101)])
+        store.upsert_candles("005930", [_candle("10:01", 102)])
+
+        assert store.flush() == 2
+        assert self.repo.get("005930", "2024-01-15 10:01").close_price == 102
+
+    def test_trim(self):
+        """용량 초과 시 오래된 분봉 정리"""
+        store = CandleStore(self.repo, capacity=5)
+        candles = [_candle(f"10:{m:02d}", 100 + m) for m in range(11)]
+        store.upsert_candles("005930", candles, persist=False)
+
+        assert store.get_count("005930") == 5
+        assert store.get_latest("005930").close_price == 110
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,166 @@
+"""
+DB 연결 모드 테스트
+
+- WAL / PRAGMA 적용
+- 단일 writer: get_cursor 블록 원자성, rowcount, 중첩 블록
+- 단일 writer: 임대 시간 초과 블록은 롤백 후 writer 재개
+- 동시 쓰기/읽기 시 "database is locked" 없음
+"""
+
+import threading
+import time
+
+import pytest
+
+from leverage_worker.data.database import LeaseExpiredError, MarketDataDB, TradingDB
+
+
+@pytest.fixture
+def trading_db(tmp_path):
+    db = TradingDB(tmp_path / "trading_paper.db")
+    yield db
+    db.close_all()
+
+
+def _insert_order(cursor, order_id: str, status: str = "submitted") -> None:
+    cursor.execute(
+        """
+        INSERT INTO orders
+        (order_id, stock_code, side, order_type, quantity, status, created_at, updated_at)
+        VALUES (?, '122630', 'buy', 'limit', 1, ?, '2025-01-02', '2025-01-02')
+        """,
+        (order_id, status),
+    )
+
+
+class TestSingleWriter:
+    """단일 writer 모드"""
+
+    def test_pragmas_and_readonly_reader(self, trading_db):
+        assert trading_db.fetch_one("PRAGMA journal_mode")[0] == "wal"
+        with pytest.raises(Exception):
+            trading_db.fetch_all("DELETE FROM orders")
+
+    def test_block_is_atomic_and_rowcount(self, trading_db):
+        with trading_db.get_cursor() as cursor:
+            _insert_order(cursor, "A")
+            _insert_order(cursor, "B")
+            # 같은 블록 안에서는 자신의 쓰기가 보임
+            assert trading_db.fetch_one("SELECT COUNT(*) FROM orders")[0] == 2
+
+        with pytest.raises(ValueError):
+            with trading_db.get_cursor() as cursor:
+                _insert_order(cursor, "C")
+                raise ValueError("abort")
+
+        with trading_db.get_cursor() as cursor:
+            cursor.execute("UPDATE orders SET status = 'filled'")
+            assert cursor.rowcount == 2
+            # 중첩 블록 실패 → 중첩 부분만 롤백
+            with pytest.raises(ValueError):
+                with trading_db.get_cursor() as inner:
+                    _insert_order(inner, "D")
+                    raise ValueError("inner")
+
+        rows = trading_db.fetch_all("SELECT order_id, status FROM orders ORDER BY order_id")
+        assert [tuple(r) for r in rows] == [("A", "filled"), ("B", "filled")]
+
+    def test_failed_unit_does_not_poison_batch(self, trading_db):
+        futures = [
+            trading_db.execute_async(
+                "INSERT INTO daily_summary (trade_date, created_at) VALUES (?, 'now')",
+                (date,),
+            )
+            for date in ["20250102", "20250102", "20250103"]
+        ]
+        results = [f.exception() for f in futures]
+        assert results[0] is None and results[2] is None
+        assert results[1] is not None  # UNIQUE 위반
+        assert trading_db.fetch_one("SELECT COUNT(*) FROM daily_summary")[0] == 2
+
+    def test_stalled_block_expires_and_writer_resumes(self, trading_db, monkeypatch):
+        """블록이 임대 시간 초과 → 블록 쓰기 롤백, 다른 쓰기는 대기 없이 진행"""
+        monkeypatch.setattr(trading_db, "LEASE_TIMEOUT_SECONDS", 0.2)
+        entered = threading.Event()
+        resume = threading.Event()
+        errors = []
+
+        def stalled() -> None:
+            try:
+                with trading_db.get_cursor() as cursor:
+                    _insert_order(cursor, "STALLED")
+                    entered.set()
+                    resume.wait(5)
+                    _insert_order(cursor, "LATE")
+            except Exception as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=stalled)
+        thread.start()
+        assert entered.wait(5)
+
+        start = time.monotonic()
+        trading_db.execute(
+            "INSERT INTO daily_summary (trade_date, created_at) VALUES ('20250102', 'now')"
+        )
+        assert time.monotonic() - start < 2.0
+
+        resume.set()
+        thread.join(5)
+        assert len(errors) == 1 and isinstance(errors[0], LeaseExpiredError)
+        assert trading_db.fetch_one("SELECT COUNT(*) FROM orders")[0] == 0
+        assert trading_db.fetch_one("SELECT COUNT(*) FROM daily_summary")[0] == 1
+
+        # 이후 블록은 정상
+        with trading_db.get_cursor() as cursor:
+            _insert_order(cursor, "NEXT")
+        assert trading_db.fetch_one("SELECT COUNT(*) FROM orders")[0] == 1
+
+    def test_concurrent_writers_and_readers(self, tmp_path):
+        db = MarketDataDB(tmp_path / "market_data.db")
+        errors = []
+
+        def write(worker: int) -> None:
+            try:
+                for i in range(50):
+                    with db.get_cursor() as cursor:
+                        cursor.execute(
+                            """
+                            INSERT INTO stocks
+                            (stock_code, stock_name, market, created_at, updated_at)
+                            VALUES (?, 'x', 'KOSPI', 'now', 'now')
+                            """,
+                            (f"{worker:02d}{i:04d}",),
+                        )
+            except Exception as e:
+                errors.append(e)
+
+        def read() -> None:
+            try:
+                for _ in range(200):
+                    db.fetch_one("SELECT COUNT(*) FROM stocks")
+            except Exception as e:
+                errors.append(e)
+            finally:
+                db.close()
+
+        threads = [threading.Thread(target=write, args=(w,)) for w in range(8)]
+        threads += [threading.Thread(target=read) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        assert db.fetch_one("SELECT COUNT(*) FROM stocks")[0] == 400
+        db.vacuum()
+        db.close_all()
+
+
+def test_legacy_mode_uses_wal(tmp_path):
+    db = TradingDB(tmp_path / "trading_live.db", single_writer=False)
+    with db.get_cursor() as cursor:
+        _insert_order(cursor, "A")
+    assert db.fetch_one("PRAGMA journal_mode")[0] == "wal"
+    assert db.fetch_one("SELECT COUNT(*) FROM orders")[0] == 1
+    db.close_all()
@@ -0,0 +1,172 @@
+"""
+증분 피처 계산기 패리티 테스트
+
+features_limit_order.calculate_features() 배치 결과와 봉별 비교
+- 합성 분봉 (항상 실행)
+- market_data.db 과거 분봉 (파일 있을 때만)
+"""
+
+from dataclasses import replace
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pytest
+
+from leverage_worker.data.minute_candle_repository import MinuteCandle
+from leverage_worker.ml.data_utils import candles_to_dataframe
+from leverage_worker.ml.features_incremental import IncrementalLimitOrderFeatures
+from leverage_worker.ml.features_limit_order import calculate_features, get_feature_columns
+
+MARKET_DATA_DB = Path(__file__).resolve().parent.parent / "data" / "market_data.db"
+
+# 배치 구현(pandas rolling std)은 값이 모두 같은 창에서도 ~1e-5 잔차를 남김
+RTOL = 1e-6
+ATOL = 1e-4
+
+
+def _synthetic_candles(days: int = 3, seed: int = 0) -> List[MinuteCandle]:
+    """호가 단위 랜덤워크 분봉 (하루 381개, 중간중간 거래량 0)"""
+    rng = np.random.default_rng(seed)
+    candles = []
+    price = 20000
+    for d in range(days):
+        day_start = datetime(2024, 1, 15 + d, 9, 0)
+        for m in range(381):
+            ts = day_start + timedelta(minutes=m)
+            open_price = price
+            price = max(100, price + int(rng.integers(-3, 4)) * 5)
+            high = max(open_price, price) + int(rng.integers(0, 3)) * 5
+            low = min(open_price, price) - int(rng.integers(0, 3)) * 5
+            volume = int(rng.integers(0, 5000)) if m % 50 else 0
+            candles.append(
+                MinuteCandle(
+                    stock_code="122630",
+                    candle_datetime=ts.strftime("%Y-%m-%d %H:%M"),
+                    trade_date=ts.strftime("%Y%m%d"),
+                    open_price=open_price,
+                    high_price=high,
+                    low_price=low,
+                    close_price=price,
+                    volume=volume,
+                    created_at=ts,
+                    updated_at=ts,
+                )
+            )
+    return candles
+
+
+def _assert_parity(candles: List[MinuteCandle]) -> None:
+    """전체 봉에 대해 증분 결과 == 배치 결과"""
+    columns = get_feature_columns()
+    batch = calculate_features(candles_to_dataframe(candles))[columns].to_numpy(dtype=float)
+
+    engine = IncrementalLimitOrderFeatures()
+    incremental = np.array(
+        [[row[c] for c in columns] for row in map(engine.update_candle, candles)],
+        dtype=float,
+    )
+
+    mismatch = ~np.isclose(incremental, batch, rtol=RTOL, atol=ATOL)
+    if mismatch.any():
+        i, j = np.argwhere(mismatch)[0]
+        pytest.fail(
+            f"{candles[i].candle_datetime} {columns[j]}: "
+            f"incremental={incremental[i, j]} batch={batch[i, j]}"
+        )
+
+
+class TestIncrementalFeatures:
+    """증분 피처 계산기 테스트"""
+
+    def test_parity_synthetic(self):
+        """합성 분봉 (3일) 전체 봉 패리티"""
+        _assert_parity(_synthetic_candles())
+
+    def test_preview_does_not_mutate(self):
+        """preview는 update와 같은 값 + 상태 불변"""
+        candles = _synthetic_candles(days=1)
+        engine = IncrementalLimitOrderFeatures()
+        for candle in candles[:-1]:
+            engine.update_candle(candle)
+
+        values = IncrementalLimitOrderFeatures.candle_values(candles[-1])
+        preview = engine.preview(*values)
+        assert engine.bar_count == len(candles) - 1
+        assert engine.preview(*values) == preview
+        assert engine.update(*values) == preview
+
+    def test_sync_appends_and_rebuilds(self):
+        """sync: 새 봉만 반영, 마지막 봉 수정 시 전체 재계산"""
+        candles = _synthetic_candles(days=1)
+        engine = IncrementalLimitOrderFeatures()
+
+        engine.sync(candles[:200])
+        row = engine.sync(candles[:201])
+        assert engine.bar_count == 201
+        assert row["close"] == candles[200].close_price
+
+        # 슬라이딩 창 (앞부분 잘림) → 이어서 반영
+        engine.sync(candles[50:202])
+        assert engine.bar_count == 202
+
+        # 마지막 봉 값 수정 → 전달된 목록 기준 재계산
+        revised = list(candles[100:202])
+        last = revised[-1]
+        revised[-1] = replace(
+            last, close_price=last.close_price + 5, high_price=last.high_price + 5
+        )
+        row = engine.sync(revised)
+        assert engine.bar_count == len(revised)
+
+        expected = calculate_features(candles_to_dataframe(revised)).iloc[-1]
+        assert row["close"] == revised[-1].close_price
+        assert row["rsi_14"] == pytest.approx(expected["rsi_14"], rel=RTOL, abs=ATOL)
+
+    def test_sync_detects_revision_inside_overlap(self):
+        """마지막 봉은 같고 겹침 구간 중간 봉만 수정 → 전체 재계산"""
+        candles = _synthetic_candles(days=1)
+        engine = IncrementalLimitOrderFeatures()
+        engine.sync(candles[:200])
+
+        # 같은 값의 새 객체(DB 재적재) → 이어서 반영
+        reloaded = [replace(c) for c in candles[:201]]
+        engine.sync(reloaded)
+        assert engine.bar_count == 201
+
+        before = engine.sync(reloaded)["price_ma_20"]
+        revised = list(reloaded)
+        revised[190] = replace(revised[190], close_price=revised[190].close_price + 30)
+        row = engine.sync(revised)
+        assert engine.bar_count == len(revised)
+
+        expected = calculate_features(candles_to_dataframe(revised)).iloc[-1]
+        assert row["price_ma_20"] == pytest.approx(expected["price_ma_20"], rel=RTOL, abs=ATOL)
+        assert row["price_ma_20"] != pytest.approx(before)
+
+    def test_to_vector_orders_columns(self):
+        row = {"a": 1.0, "b": 2.0, "c": 3.0}
+        vector = IncrementalLimitOrderFeatures.to_vector(row, ["c", "a"])
+        assert vector.shape == (1, 2)
+        assert vector.tolist() == [[3.0, 1.0]]
+
+    @pytest.mark.skipif(not MARKET_DATA_DB.exists(), reason="market_data.db 없음")
+    def test_parity_market_data_db(self):
+        """market_data.db 과거 분봉 패리티 (종목별 최근 2000개)"""
+        from leverage_worker.data.database import MarketDataDB
+        from leverage_worker.data.minute_candle_repository import MinuteCandleRepository
+
+        db = MarketDataDB(MARKET_DATA_DB)
+        try:
+            repo = MinuteCandleRepository(db)
+            for stock_code in repo.get_stored_stock_codes():
+                candles = repo.get_recent(stock_code, count=2000)
+                if len(candles) >= 100:
+                    _assert_parity(candles)
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
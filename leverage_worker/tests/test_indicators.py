@@ -0,0 +1,133 @@
+"""
+지표(indicators) 모듈 테스트
+"""
+
+import math
+import random
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from leverage_worker.data.daily_candle_repository import DailyCandle
+from leverage_worker.indicators import IndicatorCache, atr, bollinger, donchian, ema, rsi, sma
+from leverage_worker.strategy.base import StrategyContext
+
+
+def _daily(count: int, seed: int = 3):
+    rng = random.Random(seed)
+    candles = []
+    price = 10000.0
+    for i in range(count):
+        price += rng.randint(-200, 200)
+        high = price + rng.randint(0, 150)
+        low = price - rng.randint(0, 150)
+        candles.append(
+            DailyCandle(
+                stock_code="122630",
+                trade_date=f"2024{(i // 28) + 1:02d}{(i % 28) + 1:02d}",
+                open_price=price,
+                high_price=high,
+                low_price=low,
+                close_price=price,
+                volume=rng.randint(1000, 5000),
+            )
+        )
+    return candles
+
+
+def _context(daily_candles, price_history=()):
+    return StrategyContext(
+        stock_code="122630",
+        stock_name="KODEX 레버리지",
+        current_price=10000,
+        current_time=datetime(2024, 3, 1, 10, 0),
+        price_history=list(price_history),
+        position=None,
+        daily_candles=daily_candles,
+    )
+
+
+class TestFunctions:
+    """순수 함수가 기존 리스트 계산과 일치"""
+
+    def setup_method(self):
+        candles = _daily(60)
+        self.close = np.array([c.close_price for c in candles])
+        self.high = np.array([c.high_price for c in candles])
+        self.low = np.array([c.low_price for c in candles])
+
+    def test_sma_and_bollinger(self):
+        recent = list(self.close[-15:])
+        mean = sum(recent) / 15
+        std = math.sqrt(sum((p - mean) ** 2 for p in recent) / 15)
+
+        assert sma(self.close, 15) == pytest.approx(mean)
+        upper, middle, lower = bollinger(self.close, 15, 1.5)
+        assert middle == pytest.approx(mean)
+        assert upper == pytest.approx(mean + 1.5 * std)
+        assert lower == pytest.approx(mean - 1.5 * std)
+        assert sma(self.close[:10], 15) is None
+
+    def test_ema_matches_pandas(self):
+        expected = pd.Series(self.close).ewm(span=12, adjust=False).mean().iloc[-1]
+        assert ema(self.close, 12) == pytest.approx(expected)
+
+    def test_atr_and_donchian(self):
+        trs = [
+            max(
+                self.high[i] - self.low[i],
+                abs(self.high[i] - self.close[i - 1]),
+                abs(self.low[i] - self.close[i - 1]),
+            )
+            for i in range(1, len(self.close))
+        ]
+        assert atr(self.high, self.low, self.close, 14) == pytest.approx(sum(trs[-14:]) / 14)
+        assert donchian(self.high, self.low, 20) == (max(self.high[-20:]), min(self.low[-20:]))
+
+    def test_rsi_bounds(self):
+        assert rsi(np.arange(1.0, 20.0), 14) == pytest.approx(100.0)
+        assert rsi(np.arange(20.0, 1.0, -1.0), 14) == pytest.approx(0.0)
+        assert rsi(self.close[:5], 14) is None
+
+
+class TestIndicatorCache:
+    """종목/마지막 봉 단위 공유"""
+
+    def test_shared_until_last_bar_changes(self):
+        cache = IndicatorCache()
+        candles = _daily(30)
+
+        first = cache.get("122630", "daily", candles)
+        assert cache.get("122630", "daily", list(candles)) is first
+        assert cache.get("233740", "daily", candles) is not first
+
+        candles.append(_daily(31)[-1])
+        assert cache.get("122630", "daily", candles) is not first
+        assert cache.get_stats()["hits"] == 1
+
+    def test_memoizes_results(self):
+        indicator_set = IndicatorCache().get("122630", "daily", _daily(30))
+        assert indicator_set.bollinger(15, 1.5) == indicator_set.bollinger(15, 1.5)
+        assert ("mean_std", 15, 0) in indicator_set._memo
+        assert indicator_set.sma(100) is None
+
+
+class TestStrategyContext:
+    """StrategyContext 지표 메서드 호환성"""
+
+    def test_daily_helpers(self):
+        candles = _daily(40)
+        context = _context(candles)
+
+        assert context.get_daily_high_n(30) == max(c.high_price for c in candles[-31:-1])
+        assert context.get_daily_low_n(30) == min(c.low_price for c in candles[-31:-1])
+        assert context.get_daily_sma(20) == pytest.approx(sum(c.close_price for c in candles[-20:]) / 20)
+        assert context.get_daily_high_n(40) is None
+        assert context.daily_indicators is _context(candles).daily_indicators
+
+    def test_empty_history(self):
+        context = _context([])
+        assert context.get_sma(5) is None
+        assert len(context.indicators) == 0
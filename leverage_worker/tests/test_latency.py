@@ -0,0 +1,95 @@
+"""
+지연 시간 계측 테스트
+
+- HDR 히스토그램 백분위 정확도
+- context 라벨 전파 / tick_to_order 1회 기록 / 체결통보 지연
+- 주기 기록 리셋 후에도 누적 조회 유지
+"""
+
+import random
+
+from leverage_worker.utils.latency import (
+    STAGE_BROKER_HTTP,
+    STAGE_FILL_NOTICE,
+    STAGE_TICK_TO_ORDER,
+    LatencyHistogram,
+    LatencyRecorder,
+)
+
+
+class TestLatencyHistogram:
+    def test_percentiles_within_bucket_precision(self):
+        rng = random.Random(7)
+        values = sorted(rng.randint(50, 2_000_000) for _ in range(20_000))
+        histogram = LatencyHistogram()
+        for v in values:
+            histogram.record(v)
+
+        for q in (50, 90, 99, 99.9):
+            exact = values[int(len(values) * q / 100 + 0.5) - 1]
+            assert abs(histogram.percentile(q) - exact) <= exact * 0.035
+        assert histogram.percentile(100) == values[-1]
+        assert histogram.min_us == values[0]
+
+        merged = LatencyHistogram()
+        merged.merge(histogram)
+        merged.merge(histogram)
+        assert merged.count == 2 * histogram.count
+        assert merged.percentile(50) == histogram.percentile(50)
+
+
+class TestLatencyRecorder:
+    def test_context_labels_and_order_stages(self):
+        recorder = LatencyRecorder()
+        origin = recorder.now() - 5_000_000  # 5ms 전 WS 수신
+
+        with recorder.context("122630", "main_beam_4", origin):
+            recorder.record(STAGE_BROKER_HTTP, 2_000_000)
+            recorder.on_order_sent("0001", recorder.now())
+            # 같은 틱의 정정 주문은 end-to-end 제외
+            recorder.on_order_sent("0002", recorder.now())
+        recorder.on_fill_notice("0001")
+        recorder.on_fill_notice("0001")  # 중복 통보 무시
+        recorder.record(STAGE_BROKER_HTTP, 1_000_000, "233740")
+
+        snapshot = recorder.snapshot()
+        http = snapshot[STAGE_BROKER_HTTP]
+        assert http["122630/main_beam_4"]["count"] == 1
+        assert http["233740/*"]["p50_ms"] >= 0.99
+        assert http["*/*"]["count"] == 2
+
+        tick_to_order = snapshot[STAGE_TICK_TO_ORDER]["122630/main_beam_4"]
+        assert tick_to_order["count"] == 1
+        assert tick_to_order["min_ms"] >= 5.0
+        assert snapshot[STAGE_FILL_NOTICE]["122630/main_beam_4"]["count"] == 1
+
+        recorder.snapshot(reset=True)
+        assert recorder.snapshot() == {}
+
+    def test_cumulative_snapshot_survives_interval_reset(self):
+        """주기 기록(reset=True) 직후에도 누적 조회는 이전 구간 포함"""
+        recorder = LatencyRecorder()
+        recorder.record(STAGE_BROKER_HTTP, 1_000_000, "122630")
+        recorder.record(STAGE_BROKER_HTTP, 3_000_000, "122630")
+
+        interval = recorder.snapshot(reset=True)
+        assert interval[STAGE_BROKER_HTTP]["122630/*"]["count"] == 2
+        assert recorder.snapshot() == {}
+        assert recorder.snapshot(cumulative=True)[STAGE_BROKER_HTTP]["*/*"]["count"] == 2
+
+        recorder.record(STAGE_BROKER_HTTP, 2_000_000, "122630")
+        recorder.record(STAGE_BROKER_HTTP, 2_000_000, "233740")
+        total = recorder.snapshot(cumulative=True)[STAGE_BROKER_HTTP]
+        assert total["122630/*"]["count"] == 3
+        assert total["122630/*"]["max_ms"] >= 2.99
+        assert total["*/*"]["count"] == 4
+        assert recorder.snapshot()[STAGE_BROKER_HTTP]["*/*"]["count"] == 2  # 현재 구간만
+
+        recorder.reset()
+        assert recorder.snapshot(cumulative=True) == {}
+
+    def test_disabled_records_nothing(self):
+        recorder = LatencyRecorder(enabled=False)
+        with recorder.span(STAGE_BROKER_HTTP, "122630"):
+            pass
+        assert recorder.snapshot() == {}
@@ -0,0 +1,95 @@
+"""
+시세 서비스 테스트
+
+- WS 체결이 최근이면 REST 호출 없음, 끊기면 REST로 전환
+- 동시 요청은 멀티종목 시세 1회로 병합
+- 분봉은 분이 바뀐 뒤 1회 + 분 초반 조회분 보정 1회
+"""
+
+import threading
+from datetime import datetime
+from types import SimpleNamespace
+
+from leverage_worker.data.market_data import (
+    SOURCE_REST_CANDLES,
+    SOURCE_REST_MULTI,
+    SOURCE_WS,
+    MarketDataService,
+)
+
+
+class FakeBroker:
+    def __init__(self):
+        self.multi_calls = []
+        self.candle_calls = []
+        self._lock = threading.Lock()
+
+    def get_multi_prices(self, codes):
+        with self._lock:
+            self.multi_calls.append(sorted(codes))
+        return {c: SimpleNamespace(current_price=1000 + i, change_rate=0.5) for i, c in enumerate(codes)}
+
+    def get_minute_candles(self, code):
+        with self._lock:
+            self.candle_calls.append(code)
+        return [{"close_price": 777, "change_rate": 1.2}]
+
+
+def _service(broker, **kwargs):
+    return MarketDataService(
+        fetch_prices=broker.get_multi_prices,
+        fetch_candles=broker.get_minute_candles,
+        batch_window=0.05,
+        **kwargs,
+    )
+
+
+def test_ws_tick_preferred_and_rest_only_on_gap():
+    broker = FakeBroker()
+    service = _service(broker, ws_stale_seconds=60)
+    now = datetime(2026, 1, 5, 9, 30, 10)
+    service._candles_fetched_at["A"] = now  # 이번 분 분봉은 이미 반영됨
+
+    service.on_tick(SimpleNamespace(stock_code="A", price=5000, change_rate=2.0, timestamp=now))
+    snapshot = service.get_snapshot("A", now)
+    assert (snapshot.source, snapshot.price, snapshot.candles) == (SOURCE_WS, 5000, None)
+    assert broker.multi_calls == [] and broker.candle_calls == []
+
+    service._ws_stale_ns = -1  # WS 끊김
+    snapshot = service.get_snapshot("A", now)
+    assert snapshot.source == SOURCE_REST_MULTI and broker.multi_calls == [["A"]]
+
+
+def test_concurrent_requests_merge_into_one_multi_price_call():
+    broker = FakeBroker()
+    service = _service(broker)
+    now = datetime(2026, 1, 5, 9, 30, 10)
+    codes = [f"{i:06d}" for i in range(8)]
+    for code in codes:
+        service._candles_fetched_at[code] = now
+
+    results = {}
+    threads = [
+        threading.Thread(target=lambda c=c: results.__setitem__(c, service.get_snapshot(c, now)))
+        for c in codes + codes[:3]  # 같은 종목 중복 요청 포함
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert broker.multi_calls == [sorted(codes)]
+    assert all(results[c].source == SOURCE_REST_MULTI for c in codes)
+
+
+def test_candles_fetched_once_per_minute_with_one_settle_refresh():
+    broker = FakeBroker()
+    service = _service(broker, candle_settle_seconds=3.0)
+
+    first = service.get_snapshot("A", datetime(2026, 1, 5, 9, 30, 0))
+    assert first.source == SOURCE_REST_CANDLES and first.candles
+    for second in (5, 10, 55):  # :05에 보정 1회, 이후 같은 분에는 조회 없음
+        service.get_snapshot("A", datetime(2026, 1, 5, 9, 30, second))
+    service.get_snapshot("A", datetime(2026, 1, 5, 9, 31, 5))
+
+    assert broker.candle_calls == ["A", "A", "A"]
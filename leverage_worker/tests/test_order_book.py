@@ -0,0 +1,73 @@
+"""
+실시간 호가 뷰 테스트
+
+- 신선한 로컬 호가 → REST 호출 없이 최우선 호가
+- 미수신/오래된 호가 → REST 보완
+"""
+
+import time
+from types import SimpleNamespace
+
+from leverage_worker.data.order_book import MarketDataView
+
+
+def _book(stock_code, ask, bid, received_ns=0):
+    level = lambda price: SimpleNamespace(price=price, quantity=100)  # noqa: E731
+    return SimpleNamespace(
+        stock_code=stock_code,
+        best_ask=level(ask) if ask else None,
+        best_bid=level(bid) if bid else None,
+        received_ns=received_ns,
+    )
+
+
+class _Rest:
+    def __init__(self):
+        self.calls = []
+
+    def ask(self, code):
+        self.calls.append(("ask", code))
+        return 9_999
+
+    def bid(self, code):
+        self.calls.append(("bid", code))
+        return 9_990
+
+
+class TestMarketDataView:
+    def test_fresh_book_serves_best_prices_without_rest(self):
+        """신선한 호가는 REST 없이 사용"""
+        rest = _Rest()
+        view = MarketDataView(rest.ask, rest.bid)
+        view.on_order_book(_book("122630", 10_005, 10_000))
+
+        assert view.best_ask("122630") == 10_005
+        assert view.best_bid("122630") == 10_000
+        assert rest.calls == []
+        assert view.stats()["ask_book"] == 1
+        assert view.stats()["live_symbols"] == 1
+
+    def test_missing_or_stale_book_falls_back_to_rest(self):
+        """미수신/오래된 호가는 REST 조회"""
+        rest = _Rest()
+        view = MarketDataView(rest.ask, rest.bid, stale_seconds=1.0)
+
+        assert view.best_ask("233740") == 9_999  # 미구독 종목
+
+        stale_ns = time.monotonic_ns() - int(5e9)
+        view.on_order_book(_book("122630", 10_005, 10_000, received_ns=stale_ns))
+        assert view.depth("122630") is None
+        assert view.age("122630") >= 5.0
+        assert view.best_bid("122630") == 9_990
+        assert view.best_bid("122630", max_age=10.0) == 10_000  # 허용 경과 시간 확대
+
+        assert rest.calls == [("ask", "233740"), ("bid", "122630")]
+
+    def test_empty_side_falls_back_to_rest(self):
+        """매도호가 없음(상한가 등) → REST"""
+        rest = _Rest()
+        view = MarketDataView(rest.ask, rest.bid)
+        view.on_order_book(_book("122630", 0, 10_000))
+
+        assert view.best_ask("122630") == 9_999
+        assert view.best_bid("122630") == 10_000
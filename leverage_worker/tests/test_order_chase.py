@@ -0,0 +1,224 @@
+"""
+주문 추격 엔진 테스트
+
+- 추격 매수/지정가 매도 호출은 최초 주문 후 즉시 반환 (sleep 대기 없음)
+- WS 체결통보로 완료 → 정정/취소 없음
+- 호가 갱신 시 점검 간격 전에 정정, 마감 시 미체결 취소 + 정정 전 주문번호의 늦은 체결 반영
+- 동시 추격 주문은 당일 주문 조회 1회를 공유
+- 지정가 매도 미체결 → 취소 후 잔고 한도 시장가 매도 (전환 중에도 종목 pending 유지)
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from leverage_worker.data.database import TradingDB
+from leverage_worker.data.order_book import MarketDataView
+from leverage_worker.trading.broker import OrderInfo, OrderResult, OrderSide, OrderStatus
+from leverage_worker.trading.order_manager import OrderManager, OrderState
+from leverage_worker.trading.position_manager import PositionManager
+
+
+class FakeBroker:
+    """주문/정정/취소/당일 주문 조회 가짜 브로커 (체결은 fill()로 주입)"""
+
+    def __init__(self, ask: int = 10_000):
+        self.ask = ask
+        self.calls = []
+        self.orders = {}  # order_id -> OrderInfo
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def _new_order(self, stock_code, side, quantity, price) -> str:
+        with self._lock:
+            self._seq += 1
+            order_id = f"{self._seq:04d}"
+            self.orders[order_id] = OrderInfo(
+                order_id=order_id, order_no="", branch_no="01", stock_code=stock_code,
+                stock_name="", side=side, order_qty=quantity, order_price=price,
+                filled_qty=0, filled_price=0, status=OrderStatus.PENDING, order_time="",
+            )
+        return order_id
+
+    def fill(self, order_id: str, quantity: int, price: int) -> None:
+        with self._lock:
+            info = self.orders[order_id]
+            info.filled_qty += quantity
+            info.filled_price = price
+
+    def place_limit_order(self, stock_code, side, quantity, price):
+        self.calls.append(("limit", side, quantity, price))
+        order_id = self._new_order(stock_code, side, quantity, price)
+        return OrderResult(True, order_id, "ok", stock_code, side, quantity, price, "01")
+
+    def place_market_order(self, stock_code, side, quantity):
+        self.calls.append(("market", side, quantity))
+        order_id = self._new_order(stock_code, side, quantity, 0)
+        return OrderResult(True, order_id, "ok", stock_code, side, quantity, 0, "01")
+
+    def modify_order(self, order_id, order_branch, quantity, new_price):
+        self.calls.append(("modify", order_id, quantity, new_price))
+        old = self.orders[order_id]
+        return self._new_order(old.stock_code, old.side, quantity, new_price)
+
+    def cancel_order(self, order_id, order_branch, quantity):
+        self.calls.append(("cancel", order_id, quantity))
+        return True
+
+    def get_today_orders(self, max_age=None):
+        self.calls.append(("today",))
+        with self._lock:
+            return [SimpleNamespace(**vars(o)) for o in self.orders.values()]
+
+    def get_asking_price(self, stock_code):
+        return self.ask
+
+    def get_bidding_price(self, stock_code):
+        return self.ask - 5
+
+    def count(self, kind: str) -> int:
+        return sum(1 for call in self.calls if call[0] == kind)
+
+
+def _book(stock_code, ask):
+    level = SimpleNamespace(price=ask, quantity=100)
+    bid = SimpleNamespace(price=ask - 5, quantity=100)
+    return SimpleNamespace(stock_code=stock_code, best_ask=level, best_bid=bid, received_ns=0)
+
+
+def _wait(predicate, timeout: float = 3.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def env(tmp_path):
+    db = TradingDB(tmp_path / "trading_paper.db")
+    broker = FakeBroker()
+    view = MarketDataView(broker.get_asking_price, broker.get_bidding_price)
+    positions = PositionManager(broker, db)
+    manager = OrderManager(broker, positions, db, market_data_view=view, chase_reconcile_interval=0.1)
+    yield SimpleNamespace(broker=broker, view=view, positions=positions, manager=manager)
+    manager.stop(timeout=5)
+    db.close_all()
+
+
+class TestBuyChase:
+    def test_returns_immediately_and_completes_on_ws_fill(self, env):
+        """WS 체결통보만으로 완료 (정정/취소 없음, 완료 콜백 1회)"""
+        done = []
+        start = time.monotonic()
+        order_id = env.manager.place_buy_order_with_chase(
+            "122630", "KODEX", quantity=10, deposit=1_000_000, strategy_name="s",
+            interval=0.5, max_retry=10, on_complete=done.append,
+        )
+        assert time.monotonic() - start < 0.2
+        assert env.manager.has_pending_order("122630")
+
+        env.broker.fill(order_id, 4, 10_000)
+        env.manager.process_ws_fill(order_id, 4, 10_000)
+        env.broker.fill(order_id, 6, 10_000)
+        env.manager.process_ws_fill(order_id, 6, 10_000)
+
+        assert _wait(lambda: done)
+        order = done[0]
+        assert order.state == OrderState.FILLED
+        assert order.filled_qty == 10 and order.filled_price == 10_000
+        assert env.positions.get_position("122630").quantity == 10
+        assert not env.manager.has_pending_order("122630")
+        assert env.broker.count("modify") == 0 and env.broker.count("cancel") == 0
+        assert env.manager.get_today_trade_count("122630") == 1  # 당일 원장
+
+    def test_book_update_reprices_then_cancels_at_deadline(self, env):
+        """호가 갱신 → 점검 간격 전 정정, 마감 시 미체결 취소 (정정 전 주문번호 늦은 체결 반영)"""
+        done = []
+        first_id = env.manager.place_buy_order_with_chase(
+            "122630", "KODEX", quantity=10, deposit=1_000_000, strategy_name="s",
+            interval=0.3, max_retry=3, on_complete=done.append,
+        )
+        env.view.on_order_book(_book("122630", 10_005))
+        assert _wait(lambda: env.broker.count("modify") == 1, timeout=0.25)  # interval 전
+        modify = next(call for call in env.broker.calls if call[0] == "modify")
+        assert modify[1:] == (first_id, 10, 10_005)
+
+        # 정정 직전 체결된 2주가 이전 주문번호로 늦게 조회됨
+        env.broker.fill(first_id, 2, 10_000)
+
+        assert _wait(lambda: done, timeout=3.0)
+        order = done[0]
+        assert order.filled_qty == 2
+        assert order.state == OrderState.PARTIAL
+        assert env.broker.count("cancel") == 1
+        assert env.positions.get_position("122630").quantity == 2
+
+    def test_concurrent_chases_share_reconcile_query(self, env):
+        """동시 추격 5건이 당일 주문 조회를 공유 (주문별 조회 없음)"""
+        done = []
+        codes = ["122630", "233740", "069500", "114800", "252670"]
+        for code in codes:
+            env.manager.place_buy_order_with_chase(
+                code, code, quantity=1, deposit=100_000, strategy_name="s",
+                interval=0.1, max_retry=5, on_complete=done.append,
+            )
+        assert _wait(lambda: len(done) == len(codes))
+        # 0.5초 추격 동안 reconcile_interval(0.1초)당 1회 + 종목별 마감 취소 확인
+        assert env.broker.count("today") <= 6 + len(codes)
+        assert env.manager.get_chase_stats()["active"] == 0
+
+
+class TestSellFallback:
+    def test_unfilled_limit_falls_back_to_market(self, env):
+        """미체결 지정가 → 취소 후 남은 잔고만 시장가"""
+        env.positions.add_position("122630", "KODEX", 10, 9_900, 10_000, "s", "b1")
+        start = time.monotonic()
+        order_id = env.manager.place_sell_order_with_fallback(
+            "122630", "KODEX", quantity=10, strategy_name="s", limit_price=9_995,
+            fallback_seconds=0.2,
+        )
+        assert time.monotonic() - start < 0.2
+
+        env.broker.fill(order_id, 3, 9_995)
+        env.manager.process_ws_fill(order_id, 3, 9_995)
+
+        assert _wait(lambda: env.broker.count("market") == 1)
+        assert env.broker.calls[-1] == ("market", OrderSide.SELL, 7)
+        assert env.positions.get_position("122630").quantity == 7
+        assert env.manager.has_pending_order("122630")  # 시장가 주문 체결 대기
+
+    def test_symbol_stays_pending_through_market_fallback(self, env):
+        """추격 종료 ~ 시장가 등록 사이에도 pending 유지 → 중복 매도 차단"""
+        env.positions.add_position("122630", "KODEX", 10, 9_900, 10_000, "s", "b1")
+        pending_at_market = []
+        place_market_order = env.broker.place_market_order
+
+        def place_market(stock_code, side, quantity):
+            pending_at_market.append(env.manager.has_pending_order(stock_code))
+            return place_market_order(stock_code, side, quantity)
+
+        env.broker.place_market_order = place_market
+        env.manager.place_sell_order_with_fallback(
+            "122630", "KODEX", quantity=10, strategy_name="s", limit_price=9_995,
+            fallback_seconds=0.1,
+        )
+
+        assert _wait(lambda: env.broker.count("market") == 1)
+        assert pending_at_market == [True]
+        assert env.manager.has_pending_order("122630")
+
+    def test_pending_released_when_fallback_not_submitted(self, env):
+        """잔고 없음으로 시장가 미제출 → pending 해제"""
+        env.positions.add_position("122630", "KODEX", 10, 9_900, 10_000, "s", "b1")
+        env.manager.place_sell_order_with_fallback(
+            "122630", "KODEX", quantity=10, strategy_name="s", limit_price=9_995,
+            fallback_seconds=0.1,
+        )
+        env.positions.remove_position("122630")  # 다른 경로로 전량 청산됨
+
+        assert _wait(lambda: not env.manager.has_pending_order("122630"))
+        assert env.broker.count("market") == 0
@@ -0,0 +1,114 @@
+"""
+포지션 DB 영속화 테스트
+
+- 변경 종목만 upsert/delete (다른 종목 행은 그대로)
+- 커밋 대기 중 같은 종목 반복 변경은 1행으로 합쳐 기록
+- 현재가는 다음 저장(flush) 시 함께 반영
+- load_from_db로 복원 (단일 writer / 레거시 모드)
+- 저장 실패 → 추가 변경 없이도 백오프 후 재시도
+"""
+
+import sqlite3
+import time
+
+import pytest
+
+from leverage_worker.data.database import TradingDB
+from leverage_worker.trading.position_manager import PositionManager
+
+
+@pytest.fixture(params=[True, False], ids=["single_writer", "legacy"])
+def env(tmp_path, request):
+    db = TradingDB(tmp_path / "trading_paper.db", single_writer=request.param)
+    yield db, PositionManager(broker=None, database=db)
+    db.close_all()
+
+
+def _rows(db):
+    return {row["stock_code"]: dict(row) for row in db.fetch_all("SELECT * FROM positions")}
+
+
+class TestPositionPersistence:
+    def test_delta_upsert_and_delete(self, env):
+        """변경 종목만 기록, 제거 종목만 삭제"""
+        db, pm = env
+        pm.add_position("122630", "KODEX 레버리지", 10, 10_000, 10_000, "s1", "o1")
+        pm.add_position("233740", "KODEX 코스닥150레버리지", 5, 8_000, 8_000, "s2", "o2")
+        pm.flush()
+        row_id = _rows(db)["122630"]["id"]
+
+        pm.add_position("122630", "KODEX 레버리지", 10, 11_000, 11_000, "s1", "o3")
+        pm.remove_position("233740")
+        pm.flush()
+
+        rows = _rows(db)
+        assert set(rows) == {"122630"}
+        assert rows["122630"]["quantity"] == 20
+        assert rows["122630"]["avg_price"] == 10_500
+        # 삭제 후 재삽입이 아닌 갱신 (행 id 유지)
+        assert rows["122630"]["id"] == row_id
+
+    def test_repeated_changes_coalesce(self, env):
+        """같은 종목 반복 변경 → 마지막 상태만 기록"""
+        db, pm = env
+        pm.add_position("122630", "KODEX 레버리지", 10, 10_000, 10_000, "s1", "o1")
+        for qty in range(9, 0, -1):
+            pm.update_quantity("122630", qty)
+        pm.flush()
+
+        stats = pm.get_persist_stats()
+        assert _rows(db)["122630"]["quantity"] == 1
+        assert stats["upserts"] <= 10
+        assert stats["failures"] == 0
+
+    def test_price_persisted_on_flush_and_reload(self, env):
+        """현재가는 flush 시 반영, 재시작 시 load_from_db로 복원"""
+        db, pm = env
+        pm.add_position("122630", "KODEX 레버리지", 10, 10_000, 10_000, "s1", "o1")
+        pm.assign_strategy("122630", "s2")
+        pm.update_price("122630", 10_250)
+        pm.flush()
+
+        restored = PositionManager(broker=None, database=db)
+        restored.load_from_db()
+        mp = restored.get_position("122630")
+        assert mp.current_price == 10_250
+        assert mp.strategy_name == "s2"
+        assert [p.stock_code for p in restored.get_strategy_positions("s2")] == ["122630"]
+
+    def test_quantity_zero_deletes_row(self, env):
+        """수량 0 → 행 삭제"""
+        db, pm = env
+        pm.add_position("122630", "KODEX 레버리지", 10, 10_000, 10_000, "s1", "o1")
+        pm.update_quantity("122630", 0)
+        pm.flush()
+
+        assert _rows(db) == {}
+        assert pm.get_position("122630") is None
+
+    def test_failed_save_retried_with_backoff(self, env, monkeypatch):
+        """저장 실패 2회 → 다음 변경 없이 백오프 재시도로 기록, 성공 후 실패 횟수 초기화"""
+        db, pm = env
+        monkeypatch.setattr(pm, "SAVE_RETRY_BASE_SECONDS", 0.05)
+        write_pending = pm._write_pending
+        attempts = []
+
+        def flaky(conn, batch):
+            attempts.append(time.monotonic())
+            write_pending(conn, batch)
+            if len(attempts) <= 2:
+                raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(pm, "_write_pending", flaky)
+        pm.add_position("122630", "KODEX 레버리지", 10, 10_000, 10_000, "s1", "o1")
+
+        deadline = time.monotonic() + 5
+        while "122630" not in _rows(db) and time.monotonic() < deadline:
+            time.sleep(0.02)
+        pm.flush()
+
+        assert _rows(db)["122630"]["quantity"] == 10
+        assert len(attempts) == 3
+        assert attempts[2] - attempts[1] >= 0.09  # 두 번째 재시도는 간격 2배
+        assert pm.get_persist_stats()["failures"] == 2
+        assert pm._save_failures == 0
@@ -0,0 +1,122 @@
+"""
+적응형 토큰 버킷 테스트 (가짜 시계로 결정적 실행)
+
+- 버스트: 버킷 용량만큼 즉시 획득, 이후 보충 속도대로
+- 보충: 경과 시간 × 현재 속도, 용량 상한
+- 서버 제한: 속도 절반 + 버킷 비움, 하한 유지
+- 복구: 연속 성공 recovery_after회마다 기준 속도 × recovery_step 증가, 기준 속도 상한
+"""
+
+import pytest
+
+from leverage_worker.core import rate_limiter as rate_limiter_module
+from leverage_worker.core.rate_limiter import TokenBucketRateLimiter
+
+
+class FakeClock:
+    """monotonic/sleep 대역 (sleep은 시계만 전진)"""
+
+    def __init__(self):
+        self.now = 1_000.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter_module, "time", clock)
+    return clock
+
+
+def _drain(limiter: TokenBucketRateLimiter) -> int:
+    count = 0
+    while limiter.acquire(timeout=0):
+        count += 1
+    return count
+
+
+class TestTokenBucket:
+    def test_burst_then_refill(self, clock):
+        limiter = TokenBucketRateLimiter(10.0, burst=5)
+
+        assert _drain(limiter) == 5
+        assert clock.sleeps == []
+
+        clock.advance(0.25)  # 10/s × 0.25s = 2.5개
+        assert _drain(limiter) == 2
+
+        clock.advance(60)  # 장시간 유휴 → 용량까지만 보충
+        assert _drain(limiter) == 5
+
+    def test_default_burst_is_half_rate(self, clock):
+        assert _drain(TokenBucketRateLimiter(20.0)) == 10
+        assert _drain(TokenBucketRateLimiter(1.0)) == 1  # 최소 1
+
+    def test_acquire_waits_for_next_token(self, clock):
+        limiter = TokenBucketRateLimiter(4.0, burst=1)
+        assert limiter.acquire()
+
+        assert limiter.acquire()
+        assert clock.sleeps == [pytest.approx(0.25)]
+        assert limiter.get_status()["avg_wait_ms"] == pytest.approx(125.0)
+
+    def test_acquire_timeout(self, clock):
+        limiter = TokenBucketRateLimiter(2.0, burst=1)
+        assert limiter.acquire()
+
+        assert not limiter.acquire(timeout=0.1)  # 다음 토큰까지 0.5초
+        assert sum(clock.sleeps) == pytest.approx(0.1)
+
+    def test_throttle_halves_rate_and_empties_bucket(self, clock):
+        limiter = TokenBucketRateLimiter(16.0, burst=8)
+
+        limiter.on_throttled()
+        assert limiter.rate == 8.0
+        assert _drain(limiter) == 0
+
+        clock.advance(0.5)  # 8/s × 0.5s
+        assert _drain(limiter) == 4
+
+        for _ in range(10):
+            limiter.on_throttled()
+        assert limiter.rate == 2.0  # 하한 = 기준 속도 / 8
+        assert limiter.get_status()["throttled"] == 11
+
+    def test_recovery_after_success_streak(self, clock):
+        limiter = TokenBucketRateLimiter(20.0, recovery_step=0.1, recovery_after=5)
+        limiter.on_throttled()
+        assert limiter.rate == 10.0
+
+        for _ in range(4):
+            limiter.on_success()
+        assert limiter.rate == 10.0
+
+        limiter.on_success()
+        assert limiter.rate == pytest.approx(12.0)  # + 20 × 0.1
+
+        # 서버 제한 → 연속 성공 초기화
+        for _ in range(4):
+            limiter.on_success()
+        limiter.on_throttled()
+        assert limiter.rate == pytest.approx(6.0)
+        for _ in range(4):
+            limiter.on_success()
+        assert limiter.rate == pytest.approx(6.0)
+
+        for _ in range(200):
+            limiter.on_success()
+        assert limiter.rate == 20.0  # 기준 속도 상한
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucketRateLimiter(0)
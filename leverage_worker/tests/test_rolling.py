@@ -0,0 +1,119 @@
+"""
+롤링 통계(rolling) 모듈 및 스캘핑 추적기 테스트
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from leverage_worker.scalping.boundary_tracker import AdaptiveBoundaryTracker
+from leverage_worker.scalping.price_tracker import PriceRangeTracker
+from leverage_worker.utils.rolling import OrderStatistic, TickDirectionCounter, TimeWindow
+
+
+def _naive_percentile(prices, percentile):
+    prices = sorted(prices)
+    idx = min(int(len(prices) * percentile / 100), len(prices) - 1)
+    return prices[idx]
+
+
+class TestTimeWindow:
+    """시간 윈도우 롤링 통계"""
+
+    def test_matches_brute_force(self):
+        """무작위 틱에서 min/max/k번째/상승·하락 수가 전수 계산과 일치"""
+        rng = random.Random(7)
+        window = TimeWindow(5.0)
+        items = []
+        t = 0.0
+        for _ in range(2000):
+            t += rng.choice([0.0, 0.1, 0.5, 1.3])
+            price = 10000 + rng.randint(-20, 20) * 5
+            window.add(t, price)
+            items.append((t, price))
+            live = [p for k, p in items if k >= t - 5.0]
+
+            assert len(window) == len(live)
+            assert window.min() == min(live)
+            assert window.max() == max(live)
+            assert window.kth(len(live) // 2) == sorted(live)[len(live) // 2]
+            ups = sum(1 for a, b in zip(live, live[1:]) if b > a)
+            downs = sum(1 for a, b in zip(live, live[1:]) if b < a)
+            assert (window.upticks, window.downticks) == (ups, downs)
+
+    def test_clear(self):
+        window = TimeWindow(timedelta(seconds=10))
+        window.add(datetime(2024, 1, 15, 9, 0, 0), 100)
+        window.clear()
+        assert len(window) == 0
+        assert window.min() is None and window.max() is None
+        assert window.upticks == 0
+
+
+class TestPrimitives:
+    """개별 자료구조"""
+
+    def test_order_statistic_remove_missing(self):
+        order = OrderStatistic()
+        order.add(3)
+        with pytest.raises(ValueError):
+            order.remove(4)
+
+    def test_direction_counter_pop_front(self):
+        counter = TickDirectionCounter()
+        for price in [100, 99, 100, 101, 100]:
+            counter.push(price)
+        assert (counter.up, counter.down) == (2, 2)
+        counter.pop_front(100, 99)
+        assert (counter.up, counter.down) == (2, 1)
+
+
+class TestPriceRangeTracker:
+    """PriceRangeTracker가 기존 전수 계산과 같은 결과를 내는지"""
+
+    def test_matches_naive(self):
+        rng = random.Random(11)
+        tracker = PriceRangeTracker(window_seconds=10, max_window_seconds=60)
+        base = datetime(2024, 1, 15, 9, 0, 0)
+        ticks = []
+        for i in range(1500):
+            ts = base + timedelta(milliseconds=i * 150)
+            price = 20000 + rng.randint(-10, 10) * 5
+            tracker.add_tick(ts, price)
+            ticks.append((ts, price))
+
+            if i % 50 == 0:
+                for ws in (10, 30):
+                    live = [p for t, p in ticks if t >= ts - timedelta(seconds=ws)]
+                    assert tracker.get_percentile(10, ws) == _naive_percentile(live, 10)
+                    assert tracker.get_range(ws) == (min(live), max(live))
+                    assert tracker.get_tick_count(ws) == len(live)
+
+    def test_uptick_ratio_and_reset(self):
+        tracker = PriceRangeTracker()
+        base = datetime(2024, 1, 15, 9, 0, 0)
+        for i, price in enumerate([100, 99, 100, 101, 100]):
+            tracker.add_tick(base + timedelta(seconds=i), price)
+        assert tracker.get_uptick_ratio() == 0.5
+
+        tracker.reset()
+        assert tracker.get_percentile(50) is None
+        assert tracker.get_range() is None
+
+
+class TestBoundaryTracker:
+    """AdaptiveBoundaryTracker percentile 조회"""
+
+    def test_percentile_price(self):
+        tracker = AdaptiveBoundaryTracker(boundary_window_ticks=10, boundary_window_seconds=60.0)
+        prices = [10000, 10005, 9995, 10010, 10000, 9990, 10015, 10005, 10000, 9995]
+        for price in prices:
+            tracker.add_tick(price)
+
+        expected = sorted(prices)[max(0, int(len(prices) * 20 / 100) - 1)]
+        assert tracker.get_percentile_price(20.0) == expected
+        assert tracker.get_boundary_info()[2] == len(prices)
+
+        tracker.reset()
+        assert tracker.get_percentile_price(20.0) is None
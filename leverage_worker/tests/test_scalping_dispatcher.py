@@ -0,0 +1,206 @@
+"""
+스캘핑 주문 디스패처 테스트
+
+- 느린 브로커에서도 tick 처리 비차단 + 응답 대기 중 중복 intent 없음
+- 주문 ack보다 먼저 도착한 체결통보 보류 후 재생 (남의 주문이면 엔진에 반환)
+- 청산 시그널 → 미전송 진입 주문 철회 / 동일 intent 중복 제거
+"""
+
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from leverage_worker.scalping import (
+    IntentKind,
+    OrderDispatcher,
+    OrderIntent,
+    ScalpingConfig,
+    ScalpingExecutor,
+    ScalpingState,
+)
+from leverage_worker.trading.broker import OrderResult, OrderSide
+
+
+class SlowBroker:
+    """지연/차단 가능한 가짜 브로커"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.gate = threading.Event()
+        self.gate.set()
+        self.calls = []
+        self._seq = 0
+
+    def _respond(self) -> None:
+        self.gate.wait(5)
+        time.sleep(self.delay)
+
+    def _order(self, stock_code, side, quantity, price) -> OrderResult:
+        self._respond()
+        self._seq += 1
+        self.calls.append(("order", side, quantity, price))
+        return OrderResult(True, f"{self._seq:04d}", "ok", stock_code, side, quantity, price, "01")
+
+    def place_limit_order(self, stock_code, side, quantity, price):
+        return self._order(stock_code, side, quantity, price)
+
+    def place_market_order(self, stock_code, side, quantity):
+        return self._order(stock_code, side, quantity, 0)
+
+    def cancel_order(self, order_id, order_branch, quantity):
+        self._respond()
+        self.calls.append(("cancel", order_id))
+        return True
+
+    def get_order_status(self, order_id, stock_code="", order_qty=0, side=None):
+        self._respond()
+        self.calls.append(("status", order_id))
+        return (0, order_qty)
+
+    def get_buyable_quantity(self, stock_code, price):
+        self._respond()
+        self.calls.append(("buyable",))
+        return (10, 0)
+
+
+def _executor(
+    broker, dispatcher=None, stock_code="122630", strategy_name="main_beam_1", **kwargs
+) -> ScalpingExecutor:
+    return ScalpingExecutor(
+        stock_code=stock_code,
+        stock_name=stock_code,
+        config=ScalpingConfig(),
+        broker=broker,
+        strategy_name=strategy_name,
+        dispatcher=dispatcher,
+        **kwargs,
+    )
+
+
+def _activate(executor: ScalpingExecutor) -> bool:
+    return executor.activate_limit_order(
+        buy_price=10_000, sell_price=10_010, timeout_seconds=60, quantity=5
+    )
+
+
+def _wait_settled(executor: ScalpingExecutor, timeout: float = 5.0) -> None:
+    with executor._settled:
+        assert executor._settled.wait_for(lambda: executor._inflight == 0, timeout)
+
+
+@pytest.fixture
+def broker():
+    return SlowBroker()
+
+
+@pytest.fixture
+def dispatcher(broker):
+    dispatcher = OrderDispatcher(broker, name="test-orders")
+    dispatcher.start()
+    yield dispatcher
+    broker.gate.set()
+    dispatcher.stop()
+
+
+def test_ticks_do_not_wait_on_slow_broker(broker, dispatcher):
+    broker.delay = 0.2
+    executor = _executor(broker, dispatcher)
+
+    start = time.perf_counter()
+    assert _activate(executor)
+    for _ in range(200):
+        executor.on_tick(10_005, datetime.now())
+    assert time.perf_counter() - start < 0.1
+
+    # ack 전: 활성(응답 대기) 상태, 상태 전환은 아직
+    assert executor.is_active
+    assert executor.state == ScalpingState.IDLE
+
+    _wait_settled(executor)
+    assert executor.state == ScalpingState.BUY_PENDING
+    assert broker.calls == [("order", OrderSide.BUY, 5, 10_000)]
+
+
+def test_fill_before_ack_is_replayed(broker, dispatcher):
+    broker.gate.clear()
+    executor = _executor(broker, dispatcher)
+    assert _activate(executor)
+
+    # 주문번호 확정 전 체결통보: 종목코드 일치 시 보류
+    assert executor.process_ws_fill("0001", 5, 10_000, stock_code="122630")
+    assert not executor.process_ws_fill("9999", 1, 100, stock_code="233740")
+
+    broker.gate.set()
+    _wait_settled(executor)
+
+    # 매수 ack → 보류 체결 재생 → 전량 체결 → 지정가 매도
+    assert executor.state == ScalpingState.SELL_PENDING
+    assert broker.calls == [
+        ("order", OrderSide.BUY, 5, 10_000),
+        ("order", OrderSide.SELL, 5, 10_010),
+    ]
+
+
+def test_held_fill_of_other_executor_is_rerouted(broker, dispatcher):
+    """같은 종목 두 executor: ack 대기 중 보류한 남의 체결 → 재생 시 반환 → 주인에게 전달"""
+    other = _executor(broker, strategy_name="main_beam_2")  # 동기 실행: 주문번호 0001 확정
+    assert _activate(other)
+    assert other.state == ScalpingState.BUY_PENDING
+
+    delivered = threading.Event()
+
+    def reroute(order_no, filled_qty, filled_price, stock_code):
+        other.process_ws_fill(order_no, filled_qty, filled_price, stock_code=stock_code)
+        delivered.set()
+
+    broker.gate.clear()
+    executor = _executor(broker, dispatcher, on_unclaimed_fill=reroute)
+    assert _activate(executor)  # 주문 0002 응답 대기
+
+    # 엔진 라우팅 순서상 먼저 만난 executor가 주문번호 미확정 체결로 보류
+    assert executor.process_ws_fill("0001", 2, 10_000, stock_code="122630")
+
+    broker.gate.set()
+    _wait_settled(executor)
+    assert delivered.wait(5)
+
+    assert other._held_qty == 2
+    assert executor._held_qty == 0
+    assert executor.state == ScalpingState.BUY_PENDING
+
+
+def test_exit_withdraws_unsent_entry(broker, dispatcher):
+    broker.gate.clear()
+    first = _executor(broker, dispatcher, "122630")
+    second = _executor(broker, dispatcher, "233740")
+    assert _activate(first)  # 전송 중 (브로커 차단)
+    assert _activate(second)  # 큐 대기
+
+    duplicate = OrderIntent(owner="x", kind=IntentKind.STATUS, stock_code="122630", order_id="1")
+    assert dispatcher.submit(duplicate)
+    assert not dispatcher.submit(
+        OrderIntent(owner="x", kind=IntentKind.STATUS, stock_code="122630", order_id="1")
+    )
+    dispatcher.withdraw("x")
+
+    # 미전송 매수 주문 철회 → 주문/취소 REST 없이 종료
+    second.handle_short_signal(9_990, "SHORT 반전")
+    assert not second.is_active
+    assert dispatcher.pending_count(second._owner) == 0
+
+    broker.gate.set()
+    _wait_settled(first)
+    assert broker.calls == [("order", OrderSide.BUY, 5, 10_000)]
+    assert first.state == ScalpingState.BUY_PENDING
+
+
+def test_without_dispatcher_runs_inline(broker):
+    executor = _executor(broker)
+    assert _activate(executor)
+    assert executor.state == ScalpingState.BUY_PENDING
+
+    executor.deactivate()
+    assert not executor.is_active
+    assert [c[0] for c in broker.calls] == ["order", "cancel", "status"]
@@ -0,0 +1,76 @@
+"""
+타이밍 휠 스케줄러 테스트
+
+- 타이밍 휠: deadline 순 만기 / 한 바퀴 이상 deadline / 다음 만기 시각
+- 스케줄러: 1초 미만 interval 슬롯이 누락·중복 없이 순서대로 실행
+  (느린 콜백은 완료 후 대기 슬롯 실행), 슬롯 지연 계측
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from leverage_worker.config.settings import ScheduleConfig, StockConfig
+from leverage_worker.core import scheduler as scheduler_module
+from leverage_worker.core.scheduler import TradingScheduler
+from leverage_worker.core.timing_wheel import TimingWheel
+
+
+def test_timing_wheel_orders_deadlines_across_rounds():
+    wheel = TimingWheel(resolution_ns=10, slots=8)  # 한 바퀴 = 80ns
+    for deadline, item in [(250, "late"), (35, "b"), (30, "a"), (95, "c")]:
+        wheel.schedule(deadline, item)
+
+    assert wheel.next_deadline() == 30
+    assert wheel.advance(40) == ["a", "b"]
+    assert wheel.next_deadline() == 95
+    assert wheel.advance(200) == ["c"]  # 250은 같은 버킷이지만 다음 회차
+    assert wheel.next_deadline() == 250
+    assert wheel.advance(1_000) == ["late"]
+    assert len(wheel) == 0 and wheel.next_deadline() is None
+
+
+def _settings(interval: float) -> SimpleNamespace:
+    stocks = {"A": StockConfig(code="A", name="A", interval_seconds=interval)}
+    return SimpleNamespace(
+        schedule=ScheduleConfig(),
+        stocks=stocks,
+        get_stock_interval=lambda code: stocks[code].interval_seconds,
+        get_stock_offset=lambda code: 0,
+        get_scheduler_workers=lambda: 2,
+    )
+
+
+@pytest.fixture
+def always_trading(monkeypatch):
+    monkeypatch.setattr(scheduler_module, "is_weekday", lambda now: True)
+    monkeypatch.setattr(scheduler_module, "is_trading_hours", lambda now, start, end: True)
+
+
+def test_sub_second_slots_are_contiguous_and_unique(always_trading):
+    scheduler = TradingScheduler(_settings(0.1))
+    slots = []
+    lock = threading.Lock()
+
+    def on_tick(stock_code, slot_time):
+        with lock:
+            slots.append(slot_time)
+        if len(slots) == 3:
+            time.sleep(0.35)  # 다음 슬롯 3개가 밀림 → 완료 후 순서대로 실행
+
+    scheduler.set_on_stock_tick(on_tick)
+    scheduler.start()
+    time.sleep(1.3)
+    scheduler.stop()
+
+    steps = [round((b - a).total_seconds(), 6) for a, b in zip(slots, slots[1:])]
+    assert len(slots) >= 8
+    assert steps == [0.1] * len(steps)  # 누락/중복 없음
+    assert all(s.microsecond % 100_000 == 0 for s in slots)  # 자정 기준 정렬
+
+    status = scheduler.get_status()
+    assert status["deferred"] >= 3 and status["dropped"] == 0
+    assert status["dispatched"] == len(slots)
+    assert status["max_lateness_us"] >= 200_000  # 밀린 슬롯 지연이 기록됨
@@ -0,0 +1,35 @@
+"""
+single-flight 유틸리티 테스트
+
+- 참여자는 리더가 게시한 결과 공유
+- 완료 전 시간 초과 → None
+"""
+
+import threading
+
+from leverage_worker.utils.single_flight import Flight
+
+
+def test_waiters_share_leader_result():
+    flight = Flight()
+    results = []
+    waiters = [
+        threading.Thread(target=lambda: results.append(flight.wait(5))) for _ in range(3)
+    ]
+    for thread in waiters:
+        thread.start()
+
+    flight.finish({"122630": 10_000})
+    for thread in waiters:
+        thread.join(5)
+
+    assert results == [{"122630": 10_000}] * 3
+    assert flight.wait(0) == {"122630": 10_000}
+
+
+def test_wait_timeout_returns_none():
+    flight = Flight()
+    flight.keys.append("122630")
+
+    assert flight.wait(0.01) is None
+    assert flight.keys == ["122630"]
@@ -0,0 +1,113 @@
+"""
+Slack 비동기 전송 큐 테스트
+
+- 전송 지연과 무관한 비차단 enqueue
+- 버스트 병합 / 큐 초과 폐기 / 채널 전송 간격
+- 종료 후 enqueue 거부, 알림은 호출 스레드에서 직접 전송
+"""
+
+import threading
+import time
+
+from leverage_worker.notification.slack_delivery import SlackDeliveryQueue
+from leverage_worker.notification.slack_notifier import SlackNotifier
+
+
+class BlockingSender:
+    def __init__(self):
+        self.gate = threading.Event()
+        self.calls = []
+
+    def __call__(self, channel, text, blocks):
+        self.calls.append((time.monotonic(), channel, text, blocks))
+        self.gate.wait(5)
+        return True
+
+
+def test_burst_is_coalesced_without_blocking_callers():
+    sender = BlockingSender()
+    queue = SlackDeliveryQueue(sender, min_interval=0.0, batch_window=0.0)
+    queue.start()
+
+    start = time.perf_counter()
+    assert queue.enqueue("C1", "first")
+    while not sender.calls:  # 첫 메시지 전송 중 (응답 지연)
+        time.sleep(0.001)
+    for i in range(20):
+        assert queue.enqueue("C1", f"burst {i}")
+    assert time.perf_counter() - start < 0.5
+
+    sender.gate.set()
+    assert queue.flush(5)
+    queue.stop()
+
+    assert [c[2] for c in sender.calls[:1]] == ["first"]
+    merged = sender.calls[1][3]
+    assert len(sender.calls) == 2
+    assert sum(1 for b in merged if b["type"] == "divider") == 19
+    stats = queue.stats()
+    assert stats["sent"] == 21 and stats["batches"] == 2 and stats["coalesced"] == 19
+
+
+def test_overflow_drops_oldest_and_counts():
+    sender = BlockingSender()
+    queue = SlackDeliveryQueue(sender, max_queue=3, min_interval=0.0, batch_window=0.0)
+    for i in range(6):
+        queue.enqueue("C1", f"m{i}")
+    assert queue.stats()["dropped"] == 3
+
+    sender.gate.set()
+    queue.start()
+    queue.stop()
+    assert "m0" not in sender.calls[0][2] and "m5" in sender.calls[0][2]
+
+
+def test_channel_min_interval():
+    sender = BlockingSender()
+    sender.gate.set()
+    queue = SlackDeliveryQueue(sender, min_interval=0.15, batch_window=0.0)
+    queue.start()
+    queue.enqueue("C1", "a")
+    assert queue.flush(5)
+    queue.enqueue("C1", "b")
+    queue.enqueue("C2", "c")  # 다른 채널은 대기 없음
+    assert queue.flush(5)
+    queue.stop()
+
+    sent_at = {text: at for at, _channel, text, _blocks in sender.calls}
+    assert sent_at["b"] - sent_at["a"] >= 0.14
+    assert sent_at["c"] < sent_at["b"]
+
+
+def test_notifier_enqueues_and_flushes_on_close(monkeypatch):
+    sent = []
+    notifier = SlackNotifier(webhook_url="https://hooks.slack.com/test", min_interval=0.0)
+    monkeypatch.setattr(notifier, "_post", lambda text, blocks=None: sent.append(text) or True)
+
+    assert notifier.send_message("hello")
+    notifier.close()
+    assert sent == ["hello"]
+    assert notifier.delivery_stats()["sent"] == 1
+
+
+def test_queue_rejects_after_stop():
+    sender = BlockingSender()
+    sender.gate.set()
+    queue = SlackDeliveryQueue(sender, min_interval=0.0, batch_window=0.0)
+    queue.start()
+    queue.stop()
+
+    assert queue.closed
+    assert not queue.enqueue("C1", "late")
+    assert queue.stats()["pending"] == 0
+
+
+def test_notifier_posts_synchronously_after_close(monkeypatch):
+    sent = []
+    notifier = SlackNotifier(webhook_url="https://hooks.slack.com/test", min_interval=0.0)
+    monkeypatch.setattr(notifier, "_post", lambda text, blocks=None: sent.append(text) or True)
+    notifier.close()
+
+    assert notifier.send_message("late")
+    assert sent == ["late"]
+    assert notifier.delivery_stats()["enqueued"] == 0
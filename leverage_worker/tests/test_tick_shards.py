@@ -0,0 +1,58 @@
+"""
+종목 샤드 실행기 테스트
+
+- 같은 종목은 제출 순서대로 실행
+- 다른 종목은 병렬 실행
+- 작업 예외는 Future로 전달되고 워커는 계속 동작
+"""
+
+import threading
+import time
+
+import pytest
+
+from leverage_worker.core.tick_shards import TickShardExecutor
+
+
+@pytest.fixture
+def shards():
+    executor = TickShardExecutor(num_shards=4)
+    executor.start()
+    yield executor
+    executor.stop()
+
+
+def test_ticks_for_one_symbol_stay_ordered(shards):
+    seen = {"A": [], "B": []}
+
+    def handle(code: str, seq: int) -> None:
+        time.sleep(0.0005)
+        seen[code].append(seq)
+
+    futures = [
+        shards.submit(code, handle, code, seq) for seq in range(50) for code in ("A", "B")
+    ]
+    for future in futures:
+        future.result(timeout=5)
+
+    assert seen["A"] == list(range(50))
+    assert seen["B"] == list(range(50))
+    assert shards.shard_of("A") != shards.shard_of("B")
+
+
+def test_symbols_run_in_parallel_and_errors_are_isolated(shards):
+    barrier = threading.Barrier(4, timeout=2)  # 4종목이 동시에 실행 중이어야 통과
+
+    futures = [shards.submit(code, barrier.wait) for code in ("A", "B", "C", "D")]
+    for future in futures:
+        future.result(timeout=5)
+
+    def broken() -> None:
+        raise RuntimeError("strategy bug")
+
+    failed = shards.submit("A", broken)
+    after = shards.submit("A", lambda: "ok")
+    with pytest.raises(RuntimeError):
+        failed.result(timeout=5)
+    assert after.result(timeout=5) == "ok"
+    assert sum(s["symbols"] for s in shards.stats()) == 4
@@ -0,0 +1,127 @@
+"""
+당일 거래 원장 / trade_date 인덱스 테스트
+
+- 기존 DB 마이그레이션: trade_date 컬럼 추가 + 채움, 당일 조회가 인덱스 사용
+- 원장: 같은 주문 중복 반영 없음, 매수/매도 구분은 호출 측 전달값
+- 재시작 시 orders에서 복원, 실현손익 조회(리포트)는 trade_date 기준
+"""
+
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from leverage_worker.data.database import TradingDB
+from leverage_worker.notification.daily_report import DailyReportGenerator
+from leverage_worker.scalping import ScalpingConfig, ScalpingExecutor
+from leverage_worker.trading.broker import OrderSide
+from leverage_worker.trading.trade_ledger import TradeLedger
+
+TODAY = datetime.now().strftime("%Y-%m-%d")
+
+
+@pytest.fixture
+def trading_db(tmp_path):
+    db = TradingDB(tmp_path / "trading_paper.db")
+    yield db
+    db.close_all()
+
+
+def _insert(db, order_id, stock_code, side, status="filled", pnl=None, day=TODAY):
+    with db.get_cursor() as cursor:
+        cursor.execute(
+            """
+            INSERT INTO orders
+            (order_id, stock_code, side, order_type, quantity, filled_quantity,
+             filled_price, status, pnl, trade_date, created_at, updated_at)
+            VALUES (?, ?, ?, 'limit', 1, 1, 10000, ?, ?, ?, ?, ?)
+            """,
+            (order_id, stock_code, side, status, pnl, day, f"{day} 09:10:00", f"{day} 09:10:00"),
+        )
+
+
+class TestTradeDateMigration:
+    def test_existing_rows_backfilled_and_indexed(self, tmp_path):
+        """trade_date 없는 기존 DB → 컬럼 추가 + created_at 날짜로 채움"""
+        path = tmp_path / "trading_live.db"
+        conn = sqlite3.connect(path)
+        conn.execute("""
+            CREATE TABLE orders (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                order_id TEXT NOT NULL UNIQUE, stock_code TEXT NOT NULL, stock_name TEXT,
+                side TEXT NOT NULL, order_type TEXT NOT NULL, quantity INTEGER NOT NULL,
+                price REAL, filled_quantity INTEGER DEFAULT 0, filled_price REAL,
+                status TEXT NOT NULL, strategy_name TEXT,
+                created_at TEXT NOT NULL, updated_at TEXT NOT NULL
+            )
+        """)
+        conn.execute(
+            "INSERT INTO orders (order_id, stock_code, side, order_type, quantity, status, "
+            "created_at, updated_at) VALUES ('A', '122630', 'buy', 'limit', 1, 'filled', "
+            "'2025-01-02 09:10:00', '2025-01-02 09:10:00')"
+        )
+        conn.commit()
+        conn.close()
+
+        db = TradingDB(path)
+        try:
+            row = db.fetch_one("SELECT trade_date, pnl FROM orders WHERE order_id = 'A'")
+            assert row["trade_date"] == "2025-01-02"
+
+            plan = db.fetch_all(
+                "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM orders "
+                "WHERE trade_date = ? AND status = 'filled' AND stock_code = ?",
+                ("2025-01-02", "122630"),
+            )
+            assert any("idx_orders_trade_date" in row["detail"] for row in plan)
+        finally:
+            db.close_all()
+
+
+class TestTradeLedger:
+    def test_counts_once_per_order(self, trading_db):
+        """같은 주문 재반영(부분 체결 누적) → 횟수 1회"""
+        ledger = TradeLedger(trading_db)
+        ledger.record_fill("B1", "122630", "buy")
+        ledger.record_fill("B1", "122630", "buy")
+        ledger.record_fill("S1", "122630", "SELL")
+        ledger.record_fill("S1", "122630", "SELL")
+        ledger.record_fill("S2", "233740", "sell")
+
+        assert ledger.trade_count("122630") == 2
+        assert ledger.trade_count("069500") == 0
+        snap = ledger.snapshot()
+        assert snap["filled_orders"] == 3
+        assert (snap["buy_trades"], snap["sell_trades"]) == (1, 2)
+
+    def test_executor_records_actual_side(self, trading_db):
+        """스캘핑 체결 기록 → 손익 유무와 무관하게 실제 주문 방향으로 집계"""
+        ledger = TradeLedger(trading_db)
+        executor = ScalpingExecutor(
+            stock_code="122630",
+            stock_name="KODEX 레버리지",
+            config=ScalpingConfig(),
+            broker=None,
+            trading_db=trading_db,
+            trade_ledger=ledger,
+        )
+        _insert(trading_db, "S1", "122630", "sell", status="submitted")
+        executor._update_order_fill_in_db("S1", OrderSide.SELL, 1, 0)  # 시장가 매도, 손익 미상
+
+        snap = ledger.snapshot()
+        assert (snap["buy_trades"], snap["sell_trades"]) == (0, 1)
+
+    def test_restores_today_from_orders(self, trading_db):
+        """재시작 → 당일 체결 완료 주문만 복원"""
+        _insert(trading_db, "B1", "122630", "buy")
+        _insert(trading_db, "S1", "122630", "sell", pnl=2_000)
+        _insert(trading_db, "B2", "122630", "buy", status="submitted")
+        _insert(trading_db, "OLD", "122630", "sell", pnl=9_999, day="2025-01-02")
+
+        ledger = TradeLedger(trading_db)
+        assert ledger.trade_count("122630") == 2
+
+        # 이미 복원된 주문은 다시 세지 않음
+        ledger.record_fill("S1", "122630", "sell")
+        assert ledger.trade_count("122630") == 2
+        assert DailyReportGenerator(trading_db).get_today_realized_pnl() == 2_000
@@ -0,0 +1,118 @@
+"""
+WebSocket 원문 프레임 파싱 테스트
+
+- H0STCNT0 체결: 단건 / 다건("^"로 이어진 레코드) / 필드 수 불일치
+- H0STCNI0 체결통보: 단건 / 다건(접수 통보 제외) / 필드 수 불일치
+"""
+
+import logging
+
+import pytest
+
+try:
+    # leverage_worker.websocket 패키지 import 시 kis_auth를 읽으므로 설정 없는 환경에서는 스킵
+    from leverage_worker.websocket.order_notice_handler import OrderNoticeHandler
+    from leverage_worker.websocket.tick_handler import TickHandler
+except Exception as e:  # SyntaxError(3.12 미만) / 설정 파일 없음
+    pytest.skip(f"kis_auth unavailable: {e}", allow_module_level=True)
+
+TICK_COLUMNS = [
+    "MKSC_SHRN_ISCD", "STCK_CNTG_HOUR", "STCK_PRPR", "PRDY_VRSS_SIGN",
+    "PRDY_VRSS", "PRDY_CTRT", "WGHN_AVRG_STCK_PRC", "STCK_OPRC",
+    "STCK_HGPR", "STCK_LWPR", "ASKP1", "BIDP1", "CNTG_VOL", "ACML_VOL",
+]
+
+NOTICE_COLUMNS = [
+    "CUST_ID", "ACNT_NO", "ODER_NO", "OODER_NO", "SELN_BYOV_CLS", "RCTF_CLS",
+    "ODER_KIND", "ODER_COND", "STCK_SHRN_ISCD", "CNTG_QTY", "CNTG_UNPR",
+    "STCK_CNTG_HOUR", "RFUS_YN", "CNTG_YN", "ACPT_YN", "BRNC_NO", "ODER_QTY",
+]
+
+
+def _tick(stock_code: str, price: int, sign: str = "2", change: int = 100) -> str:
+    return "^".join([
+        stock_code, "093015", str(price), sign, str(change), "1.25", str(price),
+        "10000", str(price + 50), "9950", str(price + 5), str(price), "7", "123456",
+    ])
+
+
+def _notice(order_no: str, qty: int, price: int, cntg_yn: str = "2") -> str:
+    return "^".join([
+        "hts01", "5012345601", order_no, "", "02", "0",
+        "00", "0", "122630", str(qty), str(price),
+        "093016", "0", cntg_yn, "2", "00950", "10",
+    ])
+
+
+class TestTickFrame:
+    def test_single_record(self):
+        ticks = TickHandler().parse_frame(_tick("122630", 10_050), TICK_COLUMNS)
+
+        assert len(ticks) == 1
+        tick = ticks[0]
+        assert (tick.stock_code, tick.price, tick.volume, tick.accumulated_volume) == (
+            "122630", 10_050, 7, 123_456
+        )
+        assert (tick.open_price, tick.high_price, tick.low_price) == (10_000, 10_100, 9_950)
+        assert (tick.change, tick.change_rate) == (100, 1.25)
+        assert tick.timestamp.strftime("%H:%M:%S") == "09:30:15"
+
+    def test_multi_record_keeps_order_and_sign(self):
+        payload = "^".join([
+            _tick("122630", 10_050),
+            _tick("233740", 8_000, sign="5", change=40),  # 하락
+            _tick("122630", 10_055),
+        ])
+        ticks = TickHandler().parse_frame(payload, TICK_COLUMNS)
+
+        assert [(t.stock_code, t.price) for t in ticks] == [
+            ("122630", 10_050), ("233740", 8_000), ("122630", 10_055),
+        ]
+        assert ticks[1].change == -40
+
+    def test_field_count_mismatch_logged(self, caplog):
+        """필드 수가 컬럼 수의 배수가 아니면 완전한 레코드만 파싱 + 경고"""
+        payload = _tick("122630", 10_050) + "^" + _tick("233740", 8_000) + "^extra^fields"
+
+        with caplog.at_level(logging.WARNING):
+            ticks = TickHandler().parse_frame(payload, TICK_COLUMNS)
+
+        assert [t.stock_code for t in ticks] == ["122630", "233740"]
+        assert any("field count mismatch" in r.getMessage() for r in caplog.records)
+
+    def test_empty_payload(self):
+        assert TickHandler().parse_frame("", TICK_COLUMNS) == []
+
+
+class TestOrderNoticeFrame:
+    def test_single_fill(self):
+        notices = OrderNoticeHandler().parse_frame(_notice("0000012345", 3, 10_050), NOTICE_COLUMNS)
+
+        assert len(notices) == 1
+        notice = notices[0]
+        assert (notice.stock_code, notice.order_no, notice.filled_qty, notice.filled_price) == (
+            "122630", "0000012345", 3, 10_050
+        )
+        assert (notice.side, notice.order_qty, notice.fill_time) == ("02", 10, "093016")
+        assert notice.is_filled
+
+    def test_multi_record_skips_acceptance(self):
+        payload = "^".join([
+            _notice("0000000001", 0, 0, cntg_yn="1"),  # 접수 통보
+            _notice("0000000002", 4, 10_050),
+            _notice("0000000003", 6, 10_055),
+        ])
+        notices = OrderNoticeHandler().parse_frame(payload, NOTICE_COLUMNS)
+
+        assert [(n.order_no, n.filled_qty) for n in notices] == [
+            ("0000000002", 4), ("0000000003", 6),
+        ]
+
+    def test_field_count_mismatch_logged(self, caplog):
+        payload = _notice("0000000002", 4, 10_050) + "^truncated"
+
+        with caplog.at_level(logging.WARNING):
+            notices = OrderNoticeHandler().parse_frame(payload, NOTICE_COLUMNS)
+
+        assert [n.order_no for n in notices] == ["0000000002"]
+        assert any("field count mismatch" in r.getMessage() for r in caplog.records)
@@ -0,0 +1,203 @@
+"""
+WebSocket 연결 풀 테스트 (로컬 가짜 KIS WebSocket 서버)
+
+- 연결별 approval key / 연결당 구독 한도 분산 / 단일 틱 피드 병합 + 중복 제거
+- 종목 삭제 시 재분배 (서버 측 구독 해제 확인)
+- 서버 단절 시 백오프 재접속 + 재구독
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+try:
+    # 패키지 import 시 kis_auth(KIS 설정 파일 필요)가 함께 로드됨
+    from leverage_worker.websocket import TickBus
+    from leverage_worker.websocket.tick_handler import H0STCNT0_COLUMNS
+    from leverage_worker.websocket.ws_pool import WSConnectionPool
+except Exception as e:  # SyntaxError(3.12 미만) / 설정 파일 없음
+    pytest.skip(f"kis_auth unavailable: {e}", allow_module_level=True)
+
+from websockets.asyncio.server import serve
+from websockets.exceptions import ConnectionClosed
+
+
+class FakeKISServer:
+    """H0STCNT0 구독/해제/체결 프레임만 흉내내는 KIS WebSocket 서버"""
+
+    def __init__(self):
+        self.sessions = {}  # ws -> (approval_key, set(stock_code))
+        self.connects = 0
+        self._loop = asyncio.new_event_loop()
+        self._server = None
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    def start(self) -> str:
+        self._thread.start()
+
+        async def open_server():
+            return await serve(self._handler, "127.0.0.1", 0)
+
+        self._server = self._run(open_server())
+        port = self._server.sockets[0].getsockname()[1]
+        return f"ws://127.0.0.1:{port}/tryitout"
+
+    def stop(self) -> None:
+        self._server.close()
+        self._run(self._server.wait_closed())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(2)
+
+    def _run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(5)
+
+    async def _handler(self, ws):
+        self.connects += 1
+        subscribed = set()
+        try:
+            async for raw in ws:
+                message = json.loads(raw)
+                code = message["body"]["input"]["tr_key"]
+                self.sessions[ws] = (message["header"]["approval_key"], subscribed)
+                if message["header"]["tr_type"] == "1":
+                    subscribed.add(code)
+                    msg1 = "SUBSCRIBE SUCCESS"
+                else:
+                    subscribed.discard(code)
+                    msg1 = "UNSUBSCRIBE SUCCESS"
+                await ws.send(json.dumps({
+                    "header": {"tr_id": "H0STCNT0", "tr_key": code, "encrypt": "N"},
+                    "body": {"rt_cd": "0", "msg_cd": "OPSP0000", "msg1": msg1},
+                }))
+        except ConnectionClosed:
+            pass
+        finally:
+            self.sessions.pop(ws, None)
+
+    def subscriptions(self):
+        return {key: set(codes) for key, codes in list(self.sessions.values())}
+
+    def push(self, stock_code: str, price: int, accumulated_volume: int, copies: int = 1):
+        fields = {name: "0" for name in H0STCNT0_COLUMNS}
+        fields.update(
+            MKSC_SHRN_ISCD=stock_code, STCK_CNTG_HOUR="093000", STCK_PRPR=str(price),
+            PRDY_VRSS_SIGN="2", PRDY_VRSS="10", PRDY_CTRT="0.10", CNTG_VOL="1",
+            ACML_VOL=str(accumulated_volume),
+        )
+        frame = "0|H0STCNT0|001|" + "^".join(fields[name] for name in H0STCNT0_COLUMNS)
+
+        async def send():
+            for ws, (_key, codes) in list(self.sessions.items()):
+                if stock_code in codes:
+                    for _ in range(copies):
+                        await ws.send(frame)
+
+        self._run(send())
+
+    def drop_all(self):
+        async def close():
+            for ws in list(self.sessions):
+                await ws.close()
+
+        self._run(close())
+
+
+def _wait_until(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return
+        time.sleep(0.01)
+    raise AssertionError("condition not met in time")
+
+
+@pytest.fixture
+def server():
+    server = FakeKISServer()
+    yield server
+    server.stop()
+
+
+def _pool(url: str, connections: int, **kwargs) -> WSConnectionPool:
+    return WSConnectionPool(
+        url=url,
+        approval_key_providers=[lambda i=i: f"key-{i}" for i in range(connections)],
+        bus=TickBus(),
+        send_interval=0.0,
+        monitor_interval=0.05,
+        backoff_base=0.05,
+        backoff_max=0.2,
+        **kwargs,
+    )
+
+
+def test_symbols_sharded_across_sessions_into_one_feed(server):
+    pool = _pool(server.start(), 3, max_per_connection=2)
+    received = []
+    pool.bus.subscribe(lambda tick: received.append((tick.stock_code, tick.price)))
+    pool.start()
+    try:
+        codes = ["A0", "A1", "A2", "A3", "A4", "A5"]
+        assert all(pool.add(code) for code in codes)
+        assert not pool.add("A6")  # 3 세션 x 2 = 6건 한도
+
+        assignment = pool.assignment()
+        expected = {
+            f"key-{i}": {code for code, idx in assignment.items() if idx == i} for i in range(3)
+        }
+        _wait_until(lambda: server.subscriptions() == expected)
+        assert all(len(c) == 2 for c in expected.values())
+
+        server.push("A0", 100, 10, copies=2)  # 중복 프레임
+        server.push("A3", 300, 5)
+        server.push("A0", 101, 11)
+        _wait_until(lambda: len(received) == 3)
+        assert received == [("A0", 100), ("A3", 300), ("A0", 101)]
+        assert pool.stats()["duplicates"] == 1
+    finally:
+        pool.stop()
+
+
+def test_remove_rebalances_sessions(server):
+    pool = _pool(server.start(), 2, rebalance_threshold=1)
+    pool.start()
+    try:
+        for i in range(6):
+            pool.add(f"B{i}")
+        _wait_until(lambda: sorted(len(c) for c in server.subscriptions().values()) == [3, 3])
+
+        first = [code for code, idx in pool.assignment().items() if idx == 0]
+        for code in first:
+            pool.remove(code)
+
+        # 0/3 → 편차 1 이하로 재분배, 서버에서도 해제/구독 반영
+        _wait_until(lambda: sorted(len(c) for c in server.subscriptions().values()) == [1, 2])
+        remaining = set().union(*server.subscriptions().values())
+        assert remaining == set(pool.assignment()) and len(remaining) == 3
+        assert pool.stats()["moves"] == 1
+    finally:
+        pool.stop()
+
+
+def test_reconnects_with_backoff_and_resubscribes(server):
+    pool = _pool(server.start(), 2)
+    received = []
+    pool.bus.subscribe(lambda tick: received.append(tick.price))
+    pool.start()
+    try:
+        pool.add("C0")
+        pool.add("C1")
+        _wait_until(lambda: len(server.subscriptions()) == 2)
+
+        server.drop_all()
+        _wait_until(lambda: server.connects >= 4 and len(server.subscriptions()) == 2)
+        assert all(h.reconnects >= 1 for h in pool.health())
+
+        server.push("C1", 500, 1)
+        _wait_until(lambda: received == [500])
+        assert all(h.connected and h.healthy for h in pool.health())
+    finally:
+        pool.stop()
@@ -0,0 +1,164 @@
+"""
+공유 WebSocket 틱 버스 테스트
+
+- 종목 참조 카운트 구독 / 구독 한도 / 재연결용 open_map 동기화
+- 체결통보 1건 몫은 종목 구독이 먼저 한도를 채워도 남아 있음
+- 프레임 1회 디코딩 → 여러 구독자 분배 (구독자 예외 격리)
+"""
+
+import pytest
+
+try:
+    # kis_auth는 import 시 KIS 설정 파일을 읽으므로 설정 없는 환경에서는 스킵
+    from leverage_worker.websocket import (
+        ExitMonitor,
+        RealtimeWSClient,
+        TickBus,
+        WSConnectionManager,
+    )
+
+    import kis_auth as ka
+except Exception as e:  # SyntaxError(3.12 미만) / 설정 파일 없음
+    pytest.skip(f"kis_auth unavailable: {e}", allow_module_level=True)
+
+COLUMNS = [
+    "MKSC_SHRN_ISCD", "STCK_CNTG_HOUR", "STCK_PRPR", "PRDY_VRSS_SIGN",
+    "PRDY_VRSS", "PRDY_CTRT", "STCK_OPRC", "STCK_HGPR", "STCK_LWPR",
+    "CNTG_VOL", "ACML_VOL",
+]
+
+
+def _record(stock_code: str, price: int) -> str:
+    return "^".join(
+        [stock_code, "093000", str(price), "2", "10", "0.10",
+         str(price), str(price), str(price), "1", "100"]
+    )
+
+
+def test_refcounted_subscriptions_share_one_kis_subscription():
+    manager = WSConnectionManager(max_subscriptions=3)
+    client = RealtimeWSClient(on_tick=lambda tick: None, manager=manager)
+    monitor = ExitMonitor(on_exit_signal=lambda *args: None, manager=manager)
+    monitor._is_ws_market_hours = lambda: True
+    manager.start = lambda: None  # 네트워크 연결 없이 구독 상태만 검증
+
+    client.start(["122630", "233740"])
+    monitor.start()
+    monitor._subscribe_stock("122630")  # 중복 종목 → KIS 구독 공유
+
+    assert manager.refcount("122630") == 2
+    assert ka.open_map["ccnl_krx"]["items"] == ["122630", "233740"]
+
+    assert manager.acquire("069500")
+    assert not manager.acquire("114800")  # 한도 3건
+
+    monitor.stop()
+    assert manager.refcount("122630") == 1
+    client.stop()
+    manager.release("069500")
+    assert manager.subscribed_stocks == []
+    assert ka.open_map["ccnl_krx"]["items"] == []
+
+
+def test_frame_decoded_once_and_fanned_out():
+    bus = TickBus()
+    manager = WSConnectionManager(bus=bus)
+    manager._running = True
+    manager._attach = lambda ws: None
+
+    received = {"a": [], "b": [], "all": []}
+
+    def broken(tick):
+        raise RuntimeError("subscriber bug")
+
+    bus.subscribe(lambda t: received["a"].append(t.price), "122630")
+    bus.subscribe(broken, "122630")
+    bus.subscribe(lambda t: received["b"].append(t.price), "233740")
+    bus.subscribe(lambda t: received["all"].append(t.stock_code))
+
+    payload = "^".join(
+        [_record("122630", 10_000), _record("233740", 5_000), _record("122630", 10_005)]
+    )
+    manager._on_ws_result(None, "H0STCNT0", payload, {"columns": COLUMNS})
+
+    assert received["a"] == [10_000, 10_005]
+    assert received["b"] == [5_000]
+    assert received["all"] == ["122630", "233740", "122630"]
+    assert manager.stats()["ticks"] == 3
+
+    bus.unsubscribe(broken, "122630")
+    assert bus.subscriber_count("122630") == 1
+
+
+BOOK_COLUMNS = (
+    ["MKSC_SHRN_ISCD", "BSOP_HOUR", "HOUR_CLS_CODE"]
+    + [f"ASKP{i}" for i in range(1, 11)]
+    + [f"BIDP{i}" for i in range(1, 11)]
+    + [f"ASKP_RSQN{i}" for i in range(1, 11)]
+    + [f"BIDP_RSQN{i}" for i in range(1, 11)]
+    + ["TOTAL_ASKP_RSQN", "TOTAL_BIDP_RSQN"]
+)
+
+
+def _book_record(stock_code: str, ask: int, bid: int, levels: int = 10) -> str:
+    asks = [str(ask + 5 * i) if i < levels else "0" for i in range(10)]
+    bids = [str(bid - 5 * i) if i < levels else "0" for i in range(10)]
+    return "^".join(
+        [stock_code, "093001", "0"] + asks + bids + ["100"] * 10 + ["200"] * 10 + ["1000", "2000"]
+    )
+
+
+def test_order_notice_slot_reserved_before_listener_registers():
+    manager = WSConnectionManager(hts_id="HTS01", max_subscriptions=3, book_reserve=1)
+    manager.start = lambda: None
+
+    assert manager.acquire("122630")
+    assert manager.acquire("233740")
+    assert not manager.acquire("069500")  # 1건은 체결통보 몫
+    assert not manager.acquire_book("122630")
+
+    assert manager.add_order_notice_listener(lambda notice: None)
+    assert not manager.acquire("069500")  # 체결통보 포함 한도 3건
+    manager.release("122630")
+    manager.release("233740")
+
+
+def test_order_book_subscription_keeps_tick_reserve():
+    manager = WSConnectionManager(max_subscriptions=4, book_reserve=2)
+    manager.start = lambda: None
+
+    assert manager.acquire("122630")
+    assert manager.acquire_book("122630")
+    assert manager.acquire_book("122630")  # 같은 종목 → KIS 구독 공유
+    assert not manager.acquire_book("233740")  # 체결 여유분 2건 유지
+    assert manager.acquire("233740")  # 체결 구독은 여유분 사용 가능
+    assert ka.open_map["asking_price_krx"]["items"] == ["122630"]
+
+    manager.release_book("122630")
+    assert manager.subscribed_books == ["122630"]
+    manager.release_book("122630")
+    assert manager.subscribed_books == []
+    assert ka.open_map["asking_price_krx"]["items"] == []
+    manager.release("122630")
+    manager.release("233740")
+
+
+def test_order_book_frame_dispatched_to_listeners():
+    manager = WSConnectionManager()
+    manager._running = True
+    manager._attach = lambda ws: None
+    received = []
+    manager.add_book_listener(received.append)
+
+    payload = "^".join(
+        [_book_record("122630", 10_005, 10_000, levels=3), _book_record("233740", 5_005, 5_000)]
+    )
+    manager._on_ws_result(None, "H0STASP0", payload, {"columns": BOOK_COLUMNS})
+
+    assert [b.stock_code for b in received] == ["122630", "233740"]
+    book = received[0]
+    assert book.best_ask.price == 10_005 and book.best_bid.price == 10_000
+    assert len(book.asks) == 3  # 빈 단계(가격 0) 제외
+    assert book.total_bid_qty == 2000
+    assert book.received_ns > 0
+    assert manager.stats()["books"] == 2
@@ -0,0 +1,230 @@
+"""
+계좌 스냅샷 모듈
+
+당일 주문(inquire-daily-ccld)과 잔고(inquire-balance) 조회를 계좌 단위로 공유
+- TTL 이내 재조회는 마지막 스냅샷 재사용 (조회 종류별 TTL)
+- 동시 조회는 진행 중인 REST 호출 1건에 합류 (single-flight)
+- 주문번호/종목코드 인덱스로 O(1) 조회
+- invalidate(): 주문 접수/정정/취소, WS 체결통보 시 스냅샷 폐기
+  (조회 중 무효화되면 그 결과는 참여자에게만 전달하고 캐시하지 않음)
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from leverage_worker.utils.logger import get_logger
+from leverage_worker.utils.single_flight import Flight
+
+logger = get_logger(__name__)
+
+KIND_ORDERS = "orders"
+KIND_BALANCE = "balance"
+
+
+@dataclass(frozen=True)
+class OrdersSnapshot:
+    """당일 주문 스냅샷 (읽기 전용, 주문 객체를 수정하지 말 것)"""
+
+    orders: Tuple[Any, ...]  # OrderInfo (조회 순서)
+    by_id: Dict[str, Any]  # order_id -> OrderInfo
+    by_code: Dict[str, Tuple[Any, ...]]  # stock_code -> OrderInfo들
+    fetched_ns: int  # 조회 시작 단조 시각 ns
+
+    @classmethod
+    def build(cls, orders: List[Any], fetched_ns: int) -> "OrdersSnapshot":
+        by_code: Dict[str, List[Any]] = {}
+        for order in orders:
+            by_code.setdefault(order.stock_code, []).append(order)
+        return cls(
+            orders=tuple(orders),
+            by_id={order.order_id: order for order in orders},
+            by_code={code: tuple(items) for code, items in by_code.items()},
+            fetched_ns=fetched_ns,
+        )
+
+    def get(self, order_id: str) -> Optional[Any]:
+        return self.by_id.get(order_id)
+
+    def for_stock(self, stock_code: str) -> Tuple[Any, ...]:
+        return self.by_code.get(stock_code, ())
+
+
+@dataclass(frozen=True)
+class BalanceSnapshot:
+    """잔고 스냅샷 (읽기 전용)"""
+
+    positions: Tuple[Any, ...]  # Position
+    summary: Dict[str, Any]  # 계좌 요약
+    by_code: Dict[str, Any]  # stock_code -> Position
+    fetched_ns: int  # 조회 시작 단조 시각 ns
+
+    @classmethod
+    def build(
+        cls, positions: List[Any], summary: Dict[str, Any], fetched_ns: int
+    ) -> "BalanceSnapshot":
+        return cls(
+            positions=tuple(positions),
+            summary=summary,
+            by_code={pos.stock_code: pos for pos in positions},
+            fetched_ns=fetched_ns,
+        )
+
+    def position(self, stock_code: str) -> Optional[Any]:
+        return self.by_code.get(stock_code)
+
+
+class AccountSnapshot:
+    """
+    계좌 주문/잔고 스냅샷 캐시
+
+    스레드 안전. 주문 관리/추격 엔진/스캘핑 디스패처/포지션 동기화 스레드에서 동시에 호출된다.
+
+    Example:
+        snapshot = AccountSnapshot(
+            fetch_orders=broker._query_today_orders,
+            fetch_balance=broker._fetch_balance,
+        )
+        info = snapshot.orders().get(order_id)
+        snapshot.invalidate()  # 체결통보 수신
+    """
+
+    def __init__(
+        self,
+        fetch_orders: Callable[[], Optional[List[Any]]],
+        fetch_balance: Callable[[], Tuple[List[Any], Dict[str, Any]]],
+        orders_ttl: float = 0.5,
+        balance_ttl: float = 1.0,
+        wait_timeout: float = 10.0,
+    ):
+        """
+        Args:
+            fetch_orders: 당일 주문 REST 조회 (실패 시 None)
+            fetch_balance: 잔고 REST 조회 ((포지션, 요약), 요약이 비어있으면 실패)
+            orders_ttl: 주문 스냅샷 재사용 시간 (초)
+            balance_ttl: 잔고 스냅샷 재사용 시간 (초)
+            wait_timeout: 진행 중인 조회 합류 시 최대 대기 (초)
+        """
+        self._fetchers: Dict[str, Callable[[], Any]] = {
+            KIND_ORDERS: lambda: self._build_orders(fetch_orders),
+            KIND_BALANCE: lambda: self._build_balance(fetch_balance),
+        }
+        self._ttls = {KIND_ORDERS: orders_ttl, KIND_BALANCE: balance_ttl}
+        self._wait_timeout = wait_timeout
+
+        self._lock = threading.Lock()
+        self._snapshots: Dict[str, Any] = {}
+        self._flights: Dict[str, Flight] = {}
+        # 무효화 세대 (조회 시작 후 무효화되면 결과를 캐시하지 않음)
+        self._generations = {KIND_ORDERS: 0, KIND_BALANCE: 0}
+
+        self._stats: Dict[str, int] = {
+            "orders_fetches": 0,
+            "balance_fetches": 0,
+            "hits": 0,
+            "coalesced": 0,
+            "invalidations": 0,
+            "failures": 0,
+        }
+
+    # ==========================================
+    # 조회
+    # ==========================================
+
+    def orders(self, max_age: Optional[float] = None) -> Optional[OrdersSnapshot]:
+        """
+        당일 주문 스냅샷
+
+        Args:
+            max_age: 허용 경과 시간 (초, None이면 orders_ttl, 0이면 새로 조회)
+
+        Returns:
+            OrdersSnapshot 또는 None (조회 실패)
+        """
+        return self._get(KIND_ORDERS, max_age)
+
+    def balance(self, max_age: Optional[float] = None) -> Optional[BalanceSnapshot]:
+        """
+        잔고 스냅샷
+
+        Args:
+            max_age: 허용 경과 시간 (초, None이면 balance_ttl, 0이면 새로 조회)
+
+        Returns:
+            BalanceSnapshot 또는 None (조회 실패)
+        """
+        return self._get(KIND_BALANCE, max_age)
+
+    def invalidate(self, orders: bool = True, balance: bool = True) -> None:
+        """스냅샷 폐기 (진행 중인 조회는 참여자에게만 결과 전달)"""
+        kinds = [k for k, on in ((KIND_ORDERS, orders), (KIND_BALANCE, balance)) if on]
+        with self._lock:
+            for kind in kinds:
+                self._snapshots.pop(kind, None)
+                self._flights.pop(kind, None)
+                self._generations[kind] += 1
+            self._stats["invalidations"] += 1
+
+    def _get(self, kind: str, max_age: Optional[float]) -> Any:
+        limit_ns = (self._ttls[kind] if max_age is None else max_age) * 1e9
+        with self._lock:
+            snapshot = self._snapshots.get(kind)
+            if snapshot is not None and time.monotonic_ns() - snapshot.fetched_ns <= limit_ns:
+                self._stats["hits"] += 1
+                return snapshot
+
+            flight = self._flights.get(kind)
+            leader = flight is None
+            if leader:
+                flight = self._flights[kind] = Flight()
+                generation = self._generations[kind]
+                self._stats[kind + "_fetches"] += 1
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            return flight.wait(self._wait_timeout)
+
+        result = None
+        try:
+            result = self._fetchers[kind]()
+        except Exception as e:
+            logger.error(f"[AccountSnapshot] {kind} fetch failed: {e}")
+        finally:
+            with self._lock:
+                if result is None:
+                    self._stats["failures"] += 1
+                elif self._generations[kind] == generation:
+                    self._snapshots[kind] = result
+                if self._flights.get(kind) is flight:
+                    del self._flights[kind]
+            flight.finish(result)
+        return result
+
+    @staticmethod
+    def _build_orders(fetch: Callable[[], Optional[List[Any]]]) -> Optional[OrdersSnapshot]:
+        fetched_ns = time.monotonic_ns()
+        orders = fetch()
+        if orders is None:
+            return None
+        return OrdersSnapshot.build(orders, fetched_ns)
+
+    @staticmethod
+    def _build_balance(
+        fetch: Callable[[], Tuple[List[Any], Dict[str, Any]]]
+    ) -> Optional[BalanceSnapshot]:
+        fetched_ns = time.monotonic_ns()
+        positions, summary = fetch()
+        # summary가 비어있으면 API 호출 자체가 실패한 것
+        if not summary:
+            return None
+        return BalanceSnapshot.build(positions, summary, fetched_ns)
+
+    # ==========================================
+    # 상태
+    # ==========================================
+
+    def stats(self) -> Dict[str, int]:
+        """조회/재사용/합류/무효화 횟수"""
+        return dict(self._stats)
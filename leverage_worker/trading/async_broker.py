@@ -0,0 +1,419 @@
+"""
+KIS API 비동기 브로커 모듈
+
+KISBroker의 asyncio 버전 (aiohttp)
+- 하나의 이벤트 루프에서 여러 종목 요청을 동시에 처리
+- 요청 파라미터/응답 파싱은 KISBroker와 공유 (BaseKISBroker)
+- 호출 속도는 SessionManager의 토큰 버킷을 동기 브로커와 함께 사용
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from leverage_worker.core.session_manager import APIResp, APIRespError, SessionManager
+from leverage_worker.trading.broker import (
+    BaseKISBroker,
+    OrderInfo,
+    OrderResult,
+    OrderSide,
+    Position,
+    StockPrice,
+    _TRANSIENT_MAX_RETRIES,
+    _TRANSIENT_RETRY_DELAY,
+)
+from leverage_worker.utils.latency import STAGE_BROKER_HTTP, get_latency_recorder
+from leverage_worker.utils.logger import get_logger
+
+try:
+    import aiohttp
+except ImportError:  # 선택 의존성 (scheduler_mode: async 에서만 필요)
+    aiohttp = None
+
+logger = get_logger(__name__)
+
+
+class _AsyncResponse:
+    """APIResp 호환 응답 (aiohttp 응답 본문을 미리 읽어 보관)"""
+
+    __slots__ = ("status_code", "headers", "text")
+
+    def __init__(self, status_code: int, headers: Dict[str, str], text: str):
+        self.status_code = status_code
+        self.headers = headers
+        self.text = text
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+class AsyncKISBroker(BaseKISBroker):
+    """
+    한국투자증권 API 비동기 브로커
+
+    - 분봉 / 현재가 / 잔고 / 당일 주문 조회
+    - 지정가 주문 / 주문 취소
+
+    aiohttp 세션은 첫 요청 시 실행 중인 이벤트 루프에서 생성되며,
+    같은 루프에서 close()로 정리해야 함
+    """
+
+    def __init__(self, session: SessionManager, pool_size: int = 16):
+        """
+        Args:
+            session: 인증/헤더/속도 제한을 제공하는 SessionManager
+            pool_size: 동시 연결 수 상한
+
+        Raises:
+            ImportError: aiohttp 미설치
+        """
+        if aiohttp is None:
+            raise ImportError("aiohttp가 설치되어 있지 않습니다. pip install aiohttp")
+
+        super().__init__(session)
+        self._pool_size = pool_size
+        self._client: Optional["aiohttp.ClientSession"] = None
+        logger.info(f"AsyncKISBroker initialized. Account: {self._account_no}")
+
+    def _get_client(self) -> "aiohttp.ClientSession":
+        """keep-alive aiohttp 세션 (지연 생성)"""
+        if self._client is None or self._client.closed:
+            self._client = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._pool_size),
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """aiohttp 세션 종료"""
+        if self._client is not None and not self._client.closed:
+            await self._client.close()
+        self._client = None
+        logger.debug("AsyncKISBroker client closed")
+
+    async def _url_fetch(
+        self,
+        api_url: str,
+        tr_id: str,
+        params: Optional[Dict[str, Any]] = None,
+        post_flag: bool = False,
+        max_retries: int = 3,
+    ) -> APIResp:
+        """
+        API 호출 (SessionManager.url_fetch와 동일한 재시도/속도 제한 규칙)
+
+        Args:
+            api_url: API URL 경로
+            tr_id: 트랜잭션 ID
+            params: 요청 파라미터
+            post_flag: POST 요청 여부
+            max_retries: 최대 재시도 횟수
+
+        Returns:
+            APIResp 객체
+        """
+        url, headers = self._session.build_request(api_url, tr_id)
+        params = params or {}
+        limiter = self._session.rate_limiter
+        client = self._get_client()
+
+        base_delay = 1.0
+        max_delay = 10.0
+
+        for attempt in range(max_retries + 1):
+            await limiter.acquire_async()
+            delay = min(base_delay * (2 ** attempt), max_delay)
+
+            try:
+                if post_flag:
+                    request = client.post(url, headers=headers, data=json.dumps(params))
+                else:
+                    request = client.get(url, headers=headers, params=params)
+
+                async with request as resp:
+                    res = _AsyncResponse(resp.status, dict(resp.headers), await resp.text())
+
+                if res.status_code == 200:
+                    limiter.on_success()
+                    return APIResp(res)
+
+                # Rate Limit (429 / EGW00201) - 속도 감소 후 재시도
+                if self._session.is_throttled(res):
+                    limiter.on_throttled()
+                    if attempt < max_retries:
+                        logger.warning(
+                            f"Rate limit hit (429), attempt {attempt + 1}/{max_retries + 1}, "
+                            f"retrying in {delay:.1f}s - {api_url}"
+                        )
+                        await asyncio.sleep(delay)
+                        continue
+                    logger.error(f"Rate limit exceeded after {max_retries + 1} attempts: {api_url}")
+                    return APIRespError(429, "Rate limit exceeded after retries")
+
+                # 서버 에러 (5xx) - 재시도
+                if res.status_code >= 500:
+                    if attempt < max_retries:
+                        logger.warning(
+                            f"Server error ({res.status_code}), attempt {attempt + 1}/{max_retries + 1}, "
+                            f"retrying in {delay:.1f}s - {api_url}"
+                        )
+                        await asyncio.sleep(delay)
+                        continue
+                    logger.error(f"Server error after {max_retries + 1} attempts: {api_url}")
+                    return APIRespError(res.status_code, res.text)
+
+                # 기타 에러 (재시도 안함)
+                logger.error(f"API Error: {res.status_code} - {res.text}")
+                return APIRespError(res.status_code, res.text)
+
+            except asyncio.TimeoutError:
+                if attempt < max_retries:
+                    logger.warning(
+                        f"Timeout, attempt {attempt + 1}/{max_retries + 1}, "
+                        f"retrying in {delay:.1f}s - {api_url}"
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                logger.error(f"API Timeout after {max_retries + 1} attempts: {api_url}")
+                return APIRespError(408, "Request Timeout after retries")
+
+            except aiohttp.ClientConnectionError as e:
+                if attempt < max_retries:
+                    logger.warning(
+                        f"Connection error, attempt {attempt + 1}/{max_retries + 1}, "
+                        f"retrying in {delay:.1f}s - {api_url}"
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                logger.error(f"Connection error after {max_retries + 1} attempts: {api_url} - {e}")
+                return APIRespError(503, f"Connection error: {e}")
+
+            except Exception as e:
+                logger.error(f"API Exception: {e}")
+                return APIRespError(500, str(e))
+
+        logger.error(f"All retries exhausted: {api_url}")
+        return APIRespError(500, "Unknown error")
+
+    async def _fetch_account(
+        self,
+        name: str,
+        api_url: str,
+        tr_id: str,
+        params: Dict[str, Any],
+    ) -> Optional[APIResp]:
+        """
+        계좌 조회 호출 (인증 에러 시 토큰 재발급, 일시적 에러 시 재시도)
+
+        Returns:
+            성공 응답 또는 None
+        """
+        res = await self._url_fetch(api_url, tr_id, params=params)
+        if res.is_ok():
+            return res
+
+        logger.error(
+            f"{name} failed - CANO: '{self._account_no}', "
+            f"ACNT_PRDT_CD: '{self._account_prod}', "
+            f"Error: {res.get_error_code()} {res.get_error_message()}"
+        )
+
+        # 인증 에러 시 토큰 재발급 후 1회 재시도 (재발급은 동기 호출이므로 스레드에서)
+        if self._is_auth_error(res):
+            logger.warning(f"{name}: Auth error detected. Attempting token refresh and retry...")
+            if not await asyncio.to_thread(self._session.force_reauthenticate):
+                logger.error("Token re-authentication failed")
+                return None
+            res = await self._url_fetch(api_url, tr_id, params=params)
+            if not res.is_ok():
+                logger.error(
+                    f"{name} still failed after token refresh: "
+                    f"{res.get_error_code()} {res.get_error_message()}"
+                )
+                return None
+            return res
+
+        # 일시적 에러 시 재시도
+        if self._is_transient_error(res):
+            for retry in range(_TRANSIENT_MAX_RETRIES):
+                logger.warning(
+                    f"{name}: Transient error {res.get_error_code()}. "
+                    f"Retry {retry + 1}/{_TRANSIENT_MAX_RETRIES} after {_TRANSIENT_RETRY_DELAY}s"
+                )
+                await asyncio.sleep(_TRANSIENT_RETRY_DELAY)
+                res = await self._url_fetch(api_url, tr_id, params=params)
+                if res.is_ok():
+                    return res
+            logger.error(
+                f"{name}: Transient error persisted after {_TRANSIENT_MAX_RETRIES} retries"
+            )
+            return None
+
+        res.print_error(api_url)
+        return None
+
+    # ==========================================
+    # 시세
+    # ==========================================
+
+    async def get_minute_candles(
+        self,
+        stock_code: str,
+        time_unit: str = "1",
+        target_hour: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        분봉 데이터 조회 (KISBroker.get_minute_candles 참고)
+
+        Returns:
+            분봉 데이터 리스트 (최신순)
+        """
+        try:
+            api_url = "/uapi/domestic-stock/v1/quotations/inquire-time-itemchartprice"
+            tr_id = "FHKST03010200"
+
+            params = self._minute_candles_params(stock_code, target_hour)
+
+            resp = await self._url_fetch(api_url, tr_id, params=params)
+            if not resp.is_ok():
+                logger.warning(
+                    f"Failed to get minute candles: {stock_code}, "
+                    f"error: {resp.get_error_code()} - {resp.get_error_message()}"
+                )
+                return []
+
+            return self._parse_minute_candles(stock_code, resp)
+
+        except Exception as e:
+            logger.error(f"Failed to get minute candles for {stock_code}: {e}")
+            return []
+
+    async def get_current_price(self, stock_code: str) -> Optional[StockPrice]:
+        """현재가 조회"""
+        api_url = "/uapi/domestic-stock/v1/quotations/inquire-price"
+        tr_id = "FHKST01010100"
+
+        res = await self._url_fetch(
+            api_url, tr_id, params=self._current_price_params(stock_code)
+        )
+
+        if not res.is_ok():
+            res.print_error(api_url)
+            return None
+
+        return self._parse_current_price(stock_code, res)
+
+    # ==========================================
+    # 계좌
+    # ==========================================
+
+    async def get_balance(self) -> Tuple[List[Position], Dict[str, Any]]:
+        """
+        잔고 조회
+
+        Returns:
+            (포지션 리스트, 계좌 요약) 튜플
+        """
+        res = await self._fetch_account(
+            "get_balance",
+            "/uapi/domestic-stock/v1/trading/inquire-balance",
+            "TTTC8434R",
+            self._balance_params(),
+        )
+        if res is None:
+            return [], {}
+
+        return self._parse_balance(res)
+
+    async def get_today_orders(self) -> List[OrderInfo]:
+        """당일 전체 주문 조회"""
+        res = await self._fetch_account(
+            "get_today_orders",
+            "/uapi/domestic-stock/v1/trading/inquire-daily-ccld",
+            "TTTC8001R",
+            self._orders_params(filled_only=False, all_orders=True),
+        )
+        if res is None:
+            return []
+
+        return self._parse_orders(res)
+
+    # ==========================================
+    # 주문
+    # ==========================================
+
+    async def place_limit_order(
+        self,
+        stock_code: str,
+        side: OrderSide,
+        quantity: int,
+        price: int,
+    ) -> OrderResult:
+        """
+        지정가 주문
+
+        Args:
+            stock_code: 종목코드
+            side: 매수/매도
+            quantity: 수량
+            price: 지정가
+
+        Returns:
+            OrderResult 객체
+        """
+        api_url = "/uapi/domestic-stock/v1/trading/order-cash"
+        tr_id, params = self._limit_order_params(stock_code, side, quantity, price)
+
+        recorder = get_latency_recorder()
+        start_ns = recorder.now()
+        res = await self._url_fetch(api_url, tr_id, params=params, post_flag=True)
+        sent_ns = recorder.record_since(STAGE_BROKER_HTTP, start_ns, stock_code)
+
+        if not res.is_ok():
+            error_msg = res.get_error_message()
+            logger.error(
+                f"Limit order failed: {side.value} {stock_code} x {quantity} @ {price} - {error_msg}"
+            )
+            return OrderResult(
+                success=False,
+                order_id=None,
+                message=error_msg,
+                stock_code=stock_code,
+                side=side,
+                quantity=quantity,
+                price=price,
+            )
+
+        result = self._parse_limit_order(res, stock_code, side, quantity, price)
+        if result.success:
+            recorder.on_order_sent(result.order_id, sent_ns)
+        return result
+
+    async def cancel_order(
+        self,
+        order_id: str,
+        order_branch: str,
+        quantity: int,
+    ) -> bool:
+        """
+        주문 취소
+
+        Returns:
+            성공 여부
+        """
+        api_url = "/uapi/domestic-stock/v1/trading/order-rvsecncl"
+        tr_id = "TTTC0803U"
+
+        res = await self._url_fetch(
+            api_url,
+            tr_id,
+            params=self._cancel_order_params(order_id, order_branch, quantity),
+            post_flag=True,
+        )
+
+        if not res.is_ok():
+            res.print_error(api_url)
+            return False
+
+        logger.info(f"Order cancelled: {order_id}")
+        return True
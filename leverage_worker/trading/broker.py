@@ -16,6 +16,8 @@ from enum import Enum
 from typing import List, Optional, Dict, Any, Tuple
 
 from leverage_worker.core.session_manager import SessionManager, APIResp
+from leverage_worker.trading.account_snapshot import AccountSnapshot
+from leverage_worker.utils.latency import STAGE_BROKER_HTTP, get_latency_recorder
 from leverage_worker.utils.logger import get_logger
 from leverage_worker.utils.time_utils import get_today_date_str
 
@@ -109,26 +111,31 @@ _TRANSIENT_ERROR_CODES = frozenset({
     "OPSQ2000",   # INPUT INVALID_CHECK_ACNO (일시적 계좌 검증 실패)
 })
 
+# 관심종목(멀티종목) 시세조회 1회 최대 종목 수
+MULTI_PRICE_MAX_CODES = 30
+
 # 일시적 에러 재시도 설정
 _TRANSIENT_RETRY_DELAY = 1.0  # 재시도 간격 (초)
 _TRANSIENT_MAX_RETRIES = 3    # 최대 재시도 횟수
 
 
-class KISBroker:
+def _get_value(obj: Any, key: str, default: Any = 0) -> Any:
+    """dict / namedtuple 응답 필드 공통 조회"""
+    if isinstance(obj, dict):
+        return obj.get(key, default)
+    return getattr(obj, key, default)
+
+
+class BaseKISBroker:
     """
-    한국투자증권 API 브로커
+    동기/비동기 브로커 공통 부분
 
-    - 현재가 조회
-    - 잔고 조회
-    - 시장가 주문
-    - 주문 취소
-    - 체결 조회
+    요청 파라미터 생성과 응답 파싱만 담당 (HTTP 호출은 하위 클래스)
     """
 
     def __init__(self, session: SessionManager):
         self._session = session
         self._account_no, self._account_prod = session.get_account_info()
-        logger.info(f"KISBroker initialized. Account: {self._account_no}")
 
     @staticmethod
     def _is_auth_error(res: APIResp) -> bool:
@@ -140,6 +147,400 @@ class KISBroker:
         """일시적 에러 여부 확인 (단순 재시도로 복구 가능)"""
         return res.get_error_code() in _TRANSIENT_ERROR_CODES
 
+    # ==========================================
+    # 요청 파라미터
+    # ==========================================
+
+    @staticmethod
+    def _current_price_params(stock_code: str) -> Dict[str, str]:
+        """현재가 조회 파라미터"""
+        return {
+            "FID_COND_MRKT_DIV_CODE": "J",  # KRX
+            "FID_INPUT_ISCD": stock_code,
+        }
+
+    @staticmethod
+    def _multi_price_params(stock_codes: List[str]) -> Dict[str, str]:
+        """관심종목(멀티종목) 시세조회 파라미터 (최대 MULTI_PRICE_MAX_CODES 종목)"""
+        params = {}
+        for i, stock_code in enumerate(stock_codes, start=1):
+            params[f"FID_COND_MRKT_DIV_CODE_{i}"] = "J"  # KRX
+            params[f"FID_INPUT_ISCD_{i}"] = stock_code
+        return params
+
+    def _balance_params(self) -> Dict[str, str]:
+        """잔고 조회 파라미터"""
+        return {
+            "CANO": self._account_no,
+            "ACNT_PRDT_CD": self._account_prod,
+            "AFHR_FLPR_YN": "N",
+            "OFL_YN": "",
+            "INQR_DVSN": "01",  # 대출일별 (모의투자 호환)
+            "UNPR_DVSN": "01",
+            "FUND_STTL_ICLD_YN": "N",
+            "FNCG_AMT_AUTO_RDPT_YN": "N",
+            "PRCS_DVSN": "00",  # 전일매매포함
+            "CTX_AREA_FK100": "",
+            "CTX_AREA_NK100": "",
+        }
+
+    def _limit_order_params(
+        self, stock_code: str, side: OrderSide, quantity: int, price: int
+    ) -> Tuple[str, Dict[str, str]]:
+        """지정가 주문 (tr_id, 파라미터)"""
+        # TR ID 설정 (매수/매도)
+        if side == OrderSide.BUY:
+            tr_id = "TTTC0802U"
+        else:
+            tr_id = "TTTC0801U"
+
+        params = {
+            "CANO": self._account_no,
+            "ACNT_PRDT_CD": self._account_prod,
+            "PDNO": stock_code,
+            "ORD_DVSN": "00",  # 지정가
+            "ORD_QTY": str(quantity),
+            "ORD_UNPR": str(price),  # 지정가
+            "EXCG_ID_DVSN_CD": "KRX",
+        }
+
+        # 매도 시 추가 파라미터
+        if side == OrderSide.SELL:
+            params["SLL_TYPE"] = "01"  # 일반매도
+
+        return tr_id, params
+
+    def _cancel_order_params(
+        self, order_id: str, order_branch: str, quantity: int
+    ) -> Dict[str, str]:
+        """주문 취소 파라미터"""
+        return {
+            "CANO": self._account_no,
+            "ACNT_PRDT_CD": self._account_prod,
+            "KRX_FWDG_ORD_ORGNO": order_branch,
+            "ORGN_ODNO": order_id,
+            "ORD_DVSN": "00",
+            "RVSE_CNCL_DVSN_CD": "02",  # 취소
+            "ORD_QTY": str(quantity),
+            "ORD_UNPR": "0",
+            "QTY_ALL_ORD_YN": "Y",  # 전량 취소
+            "EXCG_ID_DVSN_CD": "KRX",
+        }
+
+    def _orders_params(self, filled_only: bool, all_orders: bool) -> Dict[str, str]:
+        """주문/체결 조회 파라미터"""
+        today = get_today_date_str()
+
+        # 체결구분: 00=전체, 01=체결, 02=미체결
+        if all_orders:
+            ccld_dvsn = "00"
+        elif filled_only:
+            ccld_dvsn = "01"
+        else:
+            ccld_dvsn = "02"
+
+        return {
+            "CANO": self._account_no,
+            "ACNT_PRDT_CD": self._account_prod,
+            "INQR_STRT_DT": today,
+            "INQR_END_DT": today,
+            "SLL_BUY_DVSN_CD": "00",  # 전체
+            "INQR_DVSN": "00",  # 역순
+            "PDNO": "",
+            "CCLD_DVSN": ccld_dvsn,
+            "ORD_GNO_BRNO": "",
+            "ODNO": "",
+            "INQR_DVSN_3": "00",  # 전체
+            "INQR_DVSN_1": "",
+            "CTX_AREA_FK100": "",
+            "CTX_AREA_NK100": "",
+        }
+
+    @staticmethod
+    def _minute_candles_params(
+        stock_code: str, target_hour: Optional[str]
+    ) -> Dict[str, str]:
+        """분봉 조회 파라미터"""
+        # 기준 시간 설정 (target_hour가 없으면 현재 시간)
+        if target_hour is None:
+            fid_input_hour = datetime.now().strftime("%H%M%S")
+        else:
+            fid_input_hour = target_hour
+
+        return {
+            "FID_COND_MRKT_DIV_CODE": "J",
+            "FID_INPUT_ISCD": stock_code,
+            "FID_INPUT_HOUR_1": fid_input_hour,
+            "FID_PW_DATA_INCU_YN": "Y",  # 과거 데이터 포함
+            "FID_ETC_CLS_CODE": "",  # 기타 구분 코드 (필수)
+        }
+
+    # ==========================================
+    # 응답 파싱
+    # ==========================================
+
+    @staticmethod
+    def _parse_current_price(stock_code: str, res: APIResp) -> Optional[StockPrice]:
+        """현재가 응답 파싱"""
+        try:
+            output = res.get_body().output
+
+            return StockPrice(
+                stock_code=stock_code,
+                stock_name=_get_value(output, "hts_kor_isnm", ""),
+                current_price=int(_get_value(output, "stck_prpr", 0)),
+                prev_close=int(_get_value(output, "stck_sdpr", 0)),
+                change=int(_get_value(output, "prdy_vrss", 0)),
+                change_rate=float(_get_value(output, "prdy_ctrt", 0)),
+                open_price=int(_get_value(output, "stck_oprc", 0)),
+                high_price=int(_get_value(output, "stck_hgpr", 0)),
+                low_price=int(_get_value(output, "stck_lwpr", 0)),
+                volume=int(_get_value(output, "acml_vol", 0)),
+                trade_amount=int(_get_value(output, "acml_tr_pbmn", 0)),
+            )
+        except Exception as e:
+            logger.error(f"Failed to parse price response: {e}")
+            return None
+
+    @staticmethod
+    def _parse_multi_prices(res: APIResp) -> Dict[str, StockPrice]:
+        """관심종목(멀티종목) 시세 응답 파싱 (종목코드 -> StockPrice)"""
+        prices: Dict[str, StockPrice] = {}
+        output = getattr(res.get_body(), "output", None) or []
+        if not isinstance(output, (list, tuple)):
+            output = [output]
+
+        for item in output:
+            try:
+                stock_code = str(_get_value(item, "inter_shrn_iscd", ""))
+                current_price = int(_get_value(item, "inter2_prpr", 0))
+                if not stock_code or current_price <= 0:
+                    continue
+                prices[stock_code] = StockPrice(
+                    stock_code=stock_code,
+                    stock_name=_get_value(item, "inter_kor_isnm", ""),
+                    current_price=current_price,
+                    prev_close=int(_get_value(item, "inter2_prdy_clpr", 0)),
+                    change=int(_get_value(item, "inter2_prdy_vrss", 0)),
+                    change_rate=float(_get_value(item, "prdy_ctrt", 0)),
+                    open_price=int(_get_value(item, "inter2_oprc", 0)),
+                    high_price=int(_get_value(item, "inter2_hgpr", 0)),
+                    low_price=int(_get_value(item, "inter2_lwpr", 0)),
+                    volume=int(_get_value(item, "acml_vol", 0)),
+                    trade_amount=int(_get_value(item, "acml_tr_pbmn", 0)),
+                )
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Failed to parse multi price item: {e}")
+        return prices
+
+    @staticmethod
+    def _parse_balance(res: APIResp) -> Tuple[List[Position], Dict[str, Any]]:
+        """잔고 응답 파싱"""
+        positions = []
+        summary = {}
+
+        try:
+            body = res.get_body()
+
+            # 보유 종목 (output1)
+            if hasattr(body, "output1"):
+                for item in body.output1:
+                    qty = int(_get_value(item, "hldg_qty", 0))
+                    if qty <= 0:
+                        continue
+
+                    positions.append(Position(
+                        stock_code=_get_value(item, "pdno", ""),
+                        stock_name=_get_value(item, "prdt_name", ""),
+                        quantity=qty,
+                        avg_price=float(_get_value(item, "pchs_avg_pric", 0)),
+                        current_price=int(_get_value(item, "prpr", 0)),
+                        eval_amount=int(_get_value(item, "evlu_amt", 0)),
+                        profit_loss=int(_get_value(item, "evlu_pfls_amt", 0)),
+                        profit_rate=float(_get_value(item, "evlu_pfls_rt", 0)),
+                    ))
+
+            # 계좌 요약 (output2)
+            if hasattr(body, "output2") and body.output2:
+                out2 = body.output2[0] if isinstance(body.output2, list) else body.output2
+                summary = {
+                    "total_eval": int(_get_value(out2, "tot_evlu_amt", 0)),
+                    "deposit": int(_get_value(out2, "dnca_tot_amt", 0)),
+                    "total_profit_loss": int(_get_value(out2, "evlu_pfls_smtl_amt", 0)),
+                }
+
+        except Exception as e:
+            logger.error(f"Failed to parse balance response: {e}")
+
+        return positions, summary
+
+    @staticmethod
+    def _parse_limit_order(
+        res: APIResp, stock_code: str, side: OrderSide, quantity: int, price: int
+    ) -> OrderResult:
+        """지정가 주문 응답 파싱 (res.is_ok() 확인 후 호출)"""
+        try:
+            output = res.get_body().output
+            order_id = _get_value(output, "ODNO", "")
+            order_time = _get_value(output, "ORD_TMD", "")
+            order_branch = _get_value(output, "KRX_FWDG_ORD_ORGNO", "")
+
+            logger.info(
+                f"Limit order placed: {side.value} {stock_code} x {quantity} @ {price} - "
+                f"OrderID: {order_id}, Time: {order_time}"
+            )
+
+            return OrderResult(
+                success=True,
+                order_id=order_id,
+                message="Order placed successfully",
+                stock_code=stock_code,
+                side=side,
+                quantity=quantity,
+                price=price,
+                order_branch=order_branch,
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to parse order response: {e}")
+            return OrderResult(
+                success=False,
+                order_id=None,
+                message=str(e),
+                stock_code=stock_code,
+                side=side,
+                quantity=quantity,
+                price=price,
+            )
+
+    @staticmethod
+    def _parse_orders(res: APIResp) -> List[OrderInfo]:
+        """주문/체결 조회 응답 파싱"""
+        orders = []
+
+        try:
+            body = res.get_body()
+
+            if hasattr(body, "output1"):
+                for item in body.output1:
+                    order_qty = int(_get_value(item, "ord_qty", 0) or 0)
+                    filled_qty = int(_get_value(item, "tot_ccld_qty", 0) or 0)
+
+                    # 상태 판단
+                    if filled_qty == 0:
+                        status = OrderStatus.PENDING
+                    elif filled_qty < order_qty:
+                        status = OrderStatus.PARTIAL
+                    else:
+                        status = OrderStatus.FILLED
+
+                    # 매수/매도 구분
+                    sll_buy = _get_value(item, "sll_buy_dvsn_cd", "")
+                    side = OrderSide.BUY if sll_buy == "02" else OrderSide.SELL
+
+                    orders.append(OrderInfo(
+                        order_id=_get_value(item, "odno", ""),
+                        order_no=_get_value(item, "orgn_odno", ""),
+                        branch_no=_get_value(item, "ord_gno_brno", ""),
+                        stock_code=_get_value(item, "pdno", ""),
+                        stock_name=_get_value(item, "prdt_name", ""),
+                        side=side,
+                        order_qty=order_qty,
+                        order_price=int(_get_value(item, "ord_unpr", 0) or 0),
+                        filled_qty=filled_qty,
+                        filled_price=int(_get_value(item, "avg_prvs", 0) or 0),
+                        status=status,
+                        order_time=_get_value(item, "ord_tmd", ""),
+                    ))
+
+        except Exception as e:
+            logger.error(f"Failed to parse orders response: {e}")
+
+        return orders
+
+    @staticmethod
+    def _parse_minute_candles(stock_code: str, res: APIResp) -> List[Dict[str, Any]]:
+        """분봉 응답 파싱 (최신순)"""
+        body = res.get_body()
+        output1 = getattr(body, "output1", None)
+        output2 = getattr(body, "output2", None)
+
+        # output2 검증
+        if output2 is None:
+            logger.warning(f"No output2 in minute candles response for {stock_code}")
+            return []
+
+        if not isinstance(output2, (list, tuple)):
+            logger.warning(f"Minute candles output2 is not a list: {type(output2)}")
+            return []
+
+        # output1에서 당일 등락률 추출 (전 분봉 공통 적용)
+        change_rate = 0.0
+        if output1:
+            change_rate = float(_get_value(output1, "prdy_ctrt", 0))
+
+        candles = []
+        for item in output2:
+            try:
+                candle = {
+                    "trade_date": str(_get_value(item, "stck_bsop_date", "")),
+                    "time": str(_get_value(item, "stck_cntg_hour", "")),
+                    "open_price": int(_get_value(item, "stck_oprc", 0)),
+                    "high_price": int(_get_value(item, "stck_hgpr", 0)),
+                    "low_price": int(_get_value(item, "stck_lwpr", 0)),
+                    "close_price": int(_get_value(item, "stck_prpr", 0)),
+                    "volume": int(_get_value(item, "cntg_vol", 0)),
+                    "change_rate": change_rate,  # output1의 당일 등락률 사용
+                }
+                if candle["close_price"] > 0:
+                    candles.append(candle)
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Failed to parse minute candle: {e}")
+                continue
+
+        return candles
+
+
+class KISBroker(BaseKISBroker):
+    """
+    한국투자증권 API 브로커
+
+    - 현재가 조회
+    - 잔고 조회
+    - 시장가 주문
+    - 주문 취소
+    - 체결 조회 (당일 주문/잔고는 계좌 스냅샷으로 공유)
+    """
+
+    def __init__(
+        self,
+        session: SessionManager,
+        orders_ttl: float = 0.5,
+        balance_ttl: float = 1.0,
+    ):
+        """
+        Args:
+            session: 세션 매니저
+            orders_ttl: 당일 주문 스냅샷 재사용 시간 (초)
+            balance_ttl: 잔고 스냅샷 재사용 시간 (초)
+        """
+        super().__init__(session)
+        self._snapshot = AccountSnapshot(
+            fetch_orders=self._query_today_orders,
+            fetch_balance=self._fetch_balance,
+            orders_ttl=orders_ttl,
+            balance_ttl=balance_ttl,
+        )
+        logger.info(f"KISBroker initialized. Account: {self._account_no}")
+
+    def invalidate_account_snapshot(self) -> None:
+        """당일 주문/잔고 스냅샷 폐기 (WS 체결통보 수신 시)"""
+        self._snapshot.invalidate()
+
+    def account_snapshot_stats(self) -> Dict[str, int]:
+        """계좌 스냅샷 조회/재사용/합류 통계"""
+        return self._snapshot.stats()
+
     def get_current_price(self, stock_code: str) -> Optional[StockPrice]:
         """
         현재가 조회
@@ -153,44 +554,40 @@ class KISBroker:
         api_url = "/uapi/domestic-stock/v1/quotations/inquire-price"
         tr_id = "FHKST01010100"
 
-        params = {
-            "FID_COND_MRKT_DIV_CODE": "J",  # KRX
-            "FID_INPUT_ISCD": stock_code,
-        }
+        params = self._current_price_params(stock_code)
 
         res = self._session.url_fetch(api_url, tr_id, params=params)
-        self._session.smart_sleep()
 
         if not res.is_ok():
             res.print_error(api_url)
             return None
 
-        try:
-            body = res.get_body()
-            output = body.output
+        return self._parse_current_price(stock_code, res)
 
-            # output이 dict인 경우와 객체인 경우 모두 처리
-            def get_value(key: str, default=0):
-                if isinstance(output, dict):
-                    return output.get(key, default)
-                return getattr(output, key, default)
+    def get_multi_prices(self, stock_codes: List[str]) -> Dict[str, StockPrice]:
+        """
+        여러 종목 현재가 일괄 조회 (관심종목 멀티종목 시세, 호출당 최대 30종목)
 
-            return StockPrice(
-                stock_code=stock_code,
-                stock_name=get_value("hts_kor_isnm", ""),
-                current_price=int(get_value("stck_prpr", 0)),
-                prev_close=int(get_value("stck_sdpr", 0)),
-                change=int(get_value("prdy_vrss", 0)),
-                change_rate=float(get_value("prdy_ctrt", 0)),
-                open_price=int(get_value("stck_oprc", 0)),
-                high_price=int(get_value("stck_hgpr", 0)),
-                low_price=int(get_value("stck_lwpr", 0)),
-                volume=int(get_value("acml_vol", 0)),
-                trade_amount=int(get_value("acml_tr_pbmn", 0)),
+        Args:
+            stock_codes: 종목코드 목록 (30개 초과 시 나누어 호출)
+
+        Returns:
+            종목코드 -> StockPrice (조회 실패 종목은 제외)
+        """
+        api_url = "/uapi/domestic-stock/v1/quotations/intstock-multprice"
+        tr_id = "FHKST11300006"
+
+        prices: Dict[str, StockPrice] = {}
+        for i in range(0, len(stock_codes), MULTI_PRICE_MAX_CODES):
+            chunk = stock_codes[i:i + MULTI_PRICE_MAX_CODES]
+            res = self._session.url_fetch(
+                api_url, tr_id, params=self._multi_price_params(chunk)
             )
-        except Exception as e:
-            logger.error(f"Failed to parse price response: {e}")
-            return None
+            if not res.is_ok():
+                res.print_error(api_url)
+                continue
+            prices.update(self._parse_multi_prices(res))
+        return prices
 
     def get_asking_price(self, stock_code: str) -> Optional[int]:
         """
@@ -211,7 +608,6 @@ class KISBroker:
         }
 
         res = self._session.url_fetch(api_url, tr_id, params=params)
-        self._session.smart_sleep()
 
         if not res.is_ok():
             res.print_error(api_url)
@@ -251,7 +647,6 @@ class KISBroker:
         }
 
         res = self._session.url_fetch(api_url, tr_id, params=params)
-        self._session.smart_sleep()
 
         if not res.is_ok():
             res.print_error(api_url)
@@ -271,9 +666,24 @@ class KISBroker:
             logger.error(f"Failed to parse bidding price response: {e}")
             return None
 
-    def get_balance(self) -> Tuple[List[Position], Dict[str, Any]]:
+    def get_balance(self, max_age: Optional[float] = None) -> Tuple[List[Position], Dict[str, Any]]:
         """
-        잔고 조회
+        잔고 조회 (계좌 스냅샷, balance_ttl 이내 재사용)
+
+        Args:
+            max_age: 허용 경과 시간 (초, None이면 balance_ttl, 0이면 새로 조회)
+
+        Returns:
+            (포지션 리스트, 계좌 요약) 튜플 (실패 시 ([], {}))
+        """
+        snapshot = self._snapshot.balance(max_age)
+        if snapshot is None:
+            return [], {}
+        return list(snapshot.positions), dict(snapshot.summary)
+
+    def _fetch_balance(self) -> Tuple[List[Position], Dict[str, Any]]:
+        """
+        잔고 REST 조회 (AccountSnapshot 조회 함수)
 
         Returns:
             (포지션 리스트, 계좌 요약) 튜플
@@ -281,22 +691,9 @@ class KISBroker:
         api_url = "/uapi/domestic-stock/v1/trading/inquire-balance"
         tr_id = "TTTC8434R"
 
-        params = {
-            "CANO": self._account_no,
-            "ACNT_PRDT_CD": self._account_prod,
-            "AFHR_FLPR_YN": "N",
-            "OFL_YN": "",
-            "INQR_DVSN": "01",  # 대출일별 (모의투자 호환)
-            "UNPR_DVSN": "01",
-            "FUND_STTL_ICLD_YN": "N",
-            "FNCG_AMT_AUTO_RDPT_YN": "N",
-            "PRCS_DVSN": "00",  # 전일매매포함
-            "CTX_AREA_FK100": "",
-            "CTX_AREA_NK100": "",
-        }
+        params = self._balance_params()
 
         res = self._session.url_fetch(api_url, tr_id, params=params)
-        self._session.smart_sleep()
 
         positions = []
         summary = {}
@@ -313,7 +710,6 @@ class KISBroker:
                 logger.warning("Auth error detected. Attempting token refresh and retry...")
                 if self._session.force_reauthenticate():
                     res = self._session.url_fetch(api_url, tr_id, params=params)
-                    self._session.smart_sleep()
                     if not res.is_ok():
                         logger.error(
                             f"get_balance still failed after token refresh: "
@@ -333,7 +729,6 @@ class KISBroker:
                     )
                     time.sleep(_TRANSIENT_RETRY_DELAY)
                     res = self._session.url_fetch(api_url, tr_id, params=params)
-                    self._session.smart_sleep()
                     if res.is_ok():
                         logger.info(f"get_balance: Transient error resolved after {retry + 1} retries")
                         break
@@ -345,46 +740,25 @@ class KISBroker:
             else:
                 return positions, summary
 
-        try:
-            body = res.get_body()
-
-            # dict/객체 모두 처리하는 헬퍼 함수
-            def get_value(obj, key: str, default=0):
-                if isinstance(obj, dict):
-                    return obj.get(key, default)
-                return getattr(obj, key, default)
-
-            # 보유 종목 (output1)
-            if hasattr(body, "output1"):
-                for item in body.output1:
-                    qty = int(get_value(item, "hldg_qty", 0))
-                    if qty <= 0:
-                        continue
-
-                    positions.append(Position(
-                        stock_code=get_value(item, "pdno", ""),
-                        stock_name=get_value(item, "prdt_name", ""),
-                        quantity=qty,
-                        avg_price=float(get_value(item, "pchs_avg_pric", 0)),
-                        current_price=int(get_value(item, "prpr", 0)),
-                        eval_amount=int(get_value(item, "evlu_amt", 0)),
-                        profit_loss=int(get_value(item, "evlu_pfls_amt", 0)),
-                        profit_rate=float(get_value(item, "evlu_pfls_rt", 0)),
-                    ))
-
-            # 계좌 요약 (output2)
-            if hasattr(body, "output2") and body.output2:
-                out2 = body.output2[0] if isinstance(body.output2, list) else body.output2
-                summary = {
-                    "total_eval": int(get_value(out2, "tot_evlu_amt", 0)),
-                    "deposit": int(get_value(out2, "dnca_tot_amt", 0)),
-                    "total_profit_loss": int(get_value(out2, "evlu_pfls_smtl_amt", 0)),
-                }
+        return self._parse_balance(res)
 
-        except Exception as e:
-            logger.error(f"Failed to parse balance response: {e}")
+    def _post_order(
+        self,
+        api_url: str,
+        tr_id: str,
+        params: Dict[str, str],
+        stock_code: Optional[str] = None,
+    ) -> Tuple[APIResp, int]:
+        """
+        주문 REST 호출 (왕복 지연 계측, (응답, 응답 수신 시각 ns) 반환)
 
-        return positions, summary
+        주문/정정/취소는 주문 목록과 주문가능금액을 바꾸므로 계좌 스냅샷을 폐기한다.
+        """
+        recorder = get_latency_recorder()
+        start_ns = recorder.now()
+        res = self._session.url_fetch(api_url, tr_id, params=params, post_flag=True)
+        self._snapshot.invalidate()
+        return res, recorder.record_since(STAGE_BROKER_HTTP, start_ns, stock_code)
 
     def place_market_order(
         self,
@@ -425,8 +799,7 @@ class KISBroker:
         if side == OrderSide.SELL:
             params["SLL_TYPE"] = "01"  # 일반매도
 
-        res = self._session.url_fetch(api_url, tr_id, params=params, post_flag=True)
-        self._session.smart_sleep()
+        res, sent_ns = self._post_order(api_url, tr_id, params, stock_code)
 
         if not res.is_ok():
             error_msg = res.get_error_message()
@@ -453,6 +826,7 @@ class KISBroker:
                 order_id = getattr(output, "ODNO", "")
                 order_time = getattr(output, "ORD_TMD", "")
 
+            get_latency_recorder().on_order_sent(order_id, sent_ns)
             logger.info(
                 f"Order placed: {side.value} {stock_code} x {quantity} - "
                 f"OrderID: {order_id}, Time: {order_time}"
@@ -500,29 +874,9 @@ class KISBroker:
             OrderResult 객체
         """
         api_url = "/uapi/domestic-stock/v1/trading/order-cash"
+        tr_id, params = self._limit_order_params(stock_code, side, quantity, price)
 
-        # TR ID 설정 (매수/매도)
-        if side == OrderSide.BUY:
-            tr_id = "TTTC0802U"
-        else:
-            tr_id = "TTTC0801U"
-
-        params = {
-            "CANO": self._account_no,
-            "ACNT_PRDT_CD": self._account_prod,
-            "PDNO": stock_code,
-            "ORD_DVSN": "00",  # 지정가
-            "ORD_QTY": str(quantity),
-            "ORD_UNPR": str(price),  # 지정가
-            "EXCG_ID_DVSN_CD": "KRX",
-        }
-
-        # 매도 시 추가 파라미터
-        if side == OrderSide.SELL:
-            params["SLL_TYPE"] = "01"  # 일반매도
-
-        res = self._session.url_fetch(api_url, tr_id, params=params, post_flag=True)
-        self._session.smart_sleep()
+        res, sent_ns = self._post_order(api_url, tr_id, params, stock_code)
 
         if not res.is_ok():
             error_msg = res.get_error_message()
@@ -537,47 +891,10 @@ class KISBroker:
                 price=price,
             )
 
-        try:
-            body = res.get_body()
-            output = body.output
-
-            # output이 딕셔너리인 경우와 namedtuple인 경우 모두 처리
-            if isinstance(output, dict):
-                order_id = output.get("ODNO", "")
-                order_time = output.get("ORD_TMD", "")
-                order_branch = output.get("KRX_FWDG_ORD_ORGNO", "")
-            else:
-                order_id = getattr(output, "ODNO", "")
-                order_time = getattr(output, "ORD_TMD", "")
-                order_branch = getattr(output, "KRX_FWDG_ORD_ORGNO", "")
-
-            logger.info(
-                f"Limit order placed: {side.value} {stock_code} x {quantity} @ {price} - "
-                f"OrderID: {order_id}, Time: {order_time}"
-            )
-
-            return OrderResult(
-                success=True,
-                order_id=order_id,
-                message="Order placed successfully",
-                stock_code=stock_code,
-                side=side,
-                quantity=quantity,
-                price=price,
-                order_branch=order_branch,
-            )
-
-        except Exception as e:
-            logger.error(f"Failed to parse order response: {e}")
-            return OrderResult(
-                success=False,
-                order_id=None,
-                message=str(e),
-                stock_code=stock_code,
-                side=side,
-                quantity=quantity,
-                price=price,
-            )
+        result = self._parse_limit_order(res, stock_code, side, quantity, price)
+        if result.success:
+            get_latency_recorder().on_order_sent(result.order_id, sent_ns)
+        return result
 
     def cancel_order(
         self,
@@ -599,21 +916,9 @@ class KISBroker:
         api_url = "/uapi/domestic-stock/v1/trading/order-rvsecncl"
         tr_id = "TTTC0803U"
 
-        params = {
-            "CANO": self._account_no,
-            "ACNT_PRDT_CD": self._account_prod,
-            "KRX_FWDG_ORD_ORGNO": order_branch,
-            "ORGN_ODNO": order_id,
-            "ORD_DVSN": "00",
-            "RVSE_CNCL_DVSN_CD": "02",  # 취소
-            "ORD_QTY": str(quantity),
-            "ORD_UNPR": "0",
-            "QTY_ALL_ORD_YN": "Y",  # 전량 취소
-            "EXCG_ID_DVSN_CD": "KRX",
-        }
+        params = self._cancel_order_params(order_id, order_branch, quantity)
 
-        res = self._session.url_fetch(api_url, tr_id, params=params, post_flag=True)
-        self._session.smart_sleep()
+        res, _ = self._post_order(api_url, tr_id, params)
 
         if not res.is_ok():
             res.print_error(api_url)
@@ -657,8 +962,7 @@ class KISBroker:
             "EXCG_ID_DVSN_CD": "KRX",
         }
 
-        res = self._session.url_fetch(api_url, tr_id, params=params, post_flag=True)
-        self._session.smart_sleep()
+        res, sent_ns = self._post_order(api_url, tr_id, params)
 
         if not res.is_ok():
             error_msg = res.get_error_message()
@@ -680,7 +984,9 @@ class KISBroker:
                 f"Order modified: {order_id} -> {new_order_id}, "
                 f"{quantity}주 @ {new_price:,}원"
             )
-            return new_order_id if new_order_id else order_id
+            new_order_id = new_order_id or order_id
+            get_latency_recorder().on_order_sent(new_order_id, sent_ns)
+            return new_order_id
 
         except Exception as e:
             logger.error(f"Failed to parse modify order response: {e}")
@@ -689,7 +995,10 @@ class KISBroker:
 
     def get_pending_orders(self) -> List[OrderInfo]:
         """
-        미체결 주문 조회
+        미체결 주문 조회 (항상 REST 조회)
+
+        스냅샷 주문 목록은 취소된 주문을 구분할 수 없으므로(체결/주문수량만 파싱)
+        미체결 일괄 취소 등에 쓰이는 이 조회는 캐시하지 않는다.
 
         Returns:
             미체결 주문 리스트
@@ -707,7 +1016,7 @@ class KISBroker:
         주문의 체결/미체결 수량 조회
 
         stock_code + side가 전달되면 get_balance 기반으로 체결 확인 (PRIMARY).
-        전달되지 않으면 _get_orders 사용 (레거시 호환).
+        전달되지 않으면 당일 주문 스냅샷에서 주문번호로 조회 (레거시 호환).
 
         Args:
             order_id: 주문번호
@@ -722,12 +1031,11 @@ class KISBroker:
         if stock_code and side:
             return self._get_order_status_from_balance(stock_code, order_qty, side)
 
-        # 레거시: _get_orders 사용
-        orders = self._get_orders(all_orders=True)
-        for order in orders:
-            if order.order_id == order_id:
-                unfilled_qty = order.order_qty - order.filled_qty
-                return (order.filled_qty, unfilled_qty)
+        # 레거시: 당일 주문 스냅샷 (주문번호 인덱스)
+        snapshot = self._snapshot.orders()
+        order = snapshot.get(order_id) if snapshot else None
+        if order is not None:
+            return (order.filled_qty, order.order_qty - order.filled_qty)
 
         logger.warning(f"Order not found: {order_id}")
         return (0, 0)
@@ -749,12 +1057,9 @@ class KISBroker:
         Returns:
             (체결수량, 미체결수량) 튜플
         """
-        positions, _ = self.get_balance()
-        held_qty = 0
-        for pos in positions:
-            if pos.stock_code == stock_code:
-                held_qty = pos.quantity
-                break
+        snapshot = self._snapshot.balance()
+        pos = snapshot.position(stock_code) if snapshot else None
+        held_qty = pos.quantity if pos else 0
 
         if side == OrderSide.BUY:
             # 잔고에 있으면 체결된 것으로 판단
@@ -782,14 +1087,22 @@ class KISBroker:
             )
             return (sold, remaining)
 
-    def get_today_orders(self) -> List[OrderInfo]:
+    def get_today_orders(self, max_age: Optional[float] = None) -> List[OrderInfo]:
         """
-        당일 전체 주문 조회
+        당일 전체 주문 조회 (계좌 스냅샷, orders_ttl 이내 재사용)
+
+        Args:
+            max_age: 허용 경과 시간 (초, None이면 orders_ttl, 0이면 새로 조회)
 
         Returns:
-            당일 주문 리스트
+            당일 주문 리스트 (조회 실패 시 빈 리스트)
         """
-        return self._get_orders(filled_only=False, all_orders=True)
+        snapshot = self._snapshot.orders(max_age)
+        return list(snapshot.orders) if snapshot else []
+
+    def _query_today_orders(self) -> Optional[List[OrderInfo]]:
+        """당일 전체 주문 REST 조회 (AccountSnapshot 조회 함수, 실패 시 None)"""
+        return self._query_orders(filled_only=False, all_orders=True)
 
     def _get_orders(
         self,
@@ -804,42 +1117,31 @@ class KISBroker:
             all_orders: 전체 조회 (False면 미체결만)
 
         Returns:
-            주문 리스트
+            주문 리스트 (실패 시 빈 리스트)
         """
-        api_url = "/uapi/domestic-stock/v1/trading/inquire-daily-ccld"
-        tr_id = "TTTC8001R"
+        return self._query_orders(filled_only, all_orders) or []
 
-        today = get_today_date_str()
+    def _query_orders(
+        self,
+        filled_only: bool,
+        all_orders: bool,
+    ) -> Optional[List[OrderInfo]]:
+        """
+        주문/체결 REST 조회 (실패 시 None - 빈 주문 목록과 구분)
 
-        # 체결구분: 00=전체, 01=체결, 02=미체결
-        if all_orders:
-            ccld_dvsn = "00"
-        elif filled_only:
-            ccld_dvsn = "01"
-        else:
-            ccld_dvsn = "02"
+        Args:
+            filled_only: 체결 건만 조회
+            all_orders: 전체 조회 (False면 미체결만)
 
-        params = {
-            "CANO": self._account_no,
-            "ACNT_PRDT_CD": self._account_prod,
-            "INQR_STRT_DT": today,
-            "INQR_END_DT": today,
-            "SLL_BUY_DVSN_CD": "00",  # 전체
-            "INQR_DVSN": "00",  # 역순
-            "PDNO": "",
-            "CCLD_DVSN": ccld_dvsn,
-            "ORD_GNO_BRNO": "",
-            "ODNO": "",
-            "INQR_DVSN_3": "00",  # 전체
-            "INQR_DVSN_1": "",
-            "CTX_AREA_FK100": "",
-            "CTX_AREA_NK100": "",
-        }
+        Returns:
+            주문 리스트 또는 None
+        """
+        api_url = "/uapi/domestic-stock/v1/trading/inquire-daily-ccld"
+        tr_id = "TTTC8001R"
 
-        res = self._session.url_fetch(api_url, tr_id, params=params)
-        self._session.smart_sleep()
+        params = self._orders_params(filled_only, all_orders)
 
-        orders = []
+        res = self._session.url_fetch(api_url, tr_id, params=params)
 
         if not res.is_ok():
             logger.error(
@@ -853,17 +1155,16 @@ class KISBroker:
                 logger.warning("_get_orders: Auth error detected. Attempting token refresh and retry...")
                 if self._session.force_reauthenticate():
                     res = self._session.url_fetch(api_url, tr_id, params=params)
-                    self._session.smart_sleep()
                     if not res.is_ok():
                         logger.error(
                             f"_get_orders still failed after token refresh: "
                             f"{res.get_error_code()} {res.get_error_message()}"
                         )
-                        return orders
+                        return None
                     logger.info("_get_orders succeeded after token refresh")
                 else:
                     logger.error("Token re-authentication failed")
-                    return orders
+                    return None
             # 일시적 에러 시 WebSocket fallback 패턴으로 재시도
             elif self._is_transient_error(res):
                 for retry in range(_TRANSIENT_MAX_RETRIES):
@@ -873,7 +1174,6 @@ class KISBroker:
                     )
                     time.sleep(_TRANSIENT_RETRY_DELAY)
                     res = self._session.url_fetch(api_url, tr_id, params=params)
-                    self._session.smart_sleep()
                     if res.is_ok():
                         logger.info(f"_get_orders: Transient error resolved after {retry + 1} retries")
                         break
@@ -881,56 +1181,12 @@ class KISBroker:
                     logger.error(
                         f"_get_orders: Transient error persisted after {_TRANSIENT_MAX_RETRIES} retries"
                     )
-                    return orders
+                    return None
             else:
                 res.print_error(api_url)
-                return orders
-
-        try:
-            body = res.get_body()
-
-            # dict/객체 모두 처리하는 헬퍼 함수
-            def get_value(obj, key: str, default=0):
-                if isinstance(obj, dict):
-                    return obj.get(key, default)
-                return getattr(obj, key, default)
-
-            if hasattr(body, "output1"):
-                for item in body.output1:
-                    order_qty = int(get_value(item, "ord_qty", 0) or 0)
-                    filled_qty = int(get_value(item, "tot_ccld_qty", 0) or 0)
-
-                    # 상태 판단
-                    if filled_qty == 0:
-                        status = OrderStatus.PENDING
-                    elif filled_qty < order_qty:
-                        status = OrderStatus.PARTIAL
-                    else:
-                        status = OrderStatus.FILLED
-
-                    # 매수/매도 구분
-                    sll_buy = get_value(item, "sll_buy_dvsn_cd", "")
-                    side = OrderSide.BUY if sll_buy == "02" else OrderSide.SELL
+                return None
 
-                    orders.append(OrderInfo(
-                        order_id=get_value(item, "odno", ""),
-                        order_no=get_value(item, "orgn_odno", ""),
-                        branch_no=get_value(item, "ord_gno_brno", ""),
-                        stock_code=get_value(item, "pdno", ""),
-                        stock_name=get_value(item, "prdt_name", ""),
-                        side=side,
-                        order_qty=order_qty,
-                        order_price=int(get_value(item, "ord_unpr", 0) or 0),
-                        filled_qty=filled_qty,
-                        filled_price=int(get_value(item, "avg_prvs", 0) or 0),
-                        status=status,
-                        order_time=get_value(item, "ord_tmd", ""),
-                    ))
-
-        except Exception as e:
-            logger.error(f"Failed to parse orders response: {e}")
-
-        return orders
+        return self._parse_orders(res)
 
     def cancel_all_pending_orders(self) -> int:
         """
@@ -985,7 +1241,6 @@ class KISBroker:
         )
 
         res = self._session.url_fetch(api_url, tr_id, params=params)
-        self._session.smart_sleep()
 
         if not res.is_ok():
             # 인증 에러 시 토큰 재발급 후 1회 재시도
@@ -996,7 +1251,6 @@ class KISBroker:
                 )
                 if self._session.force_reauthenticate():
                     res = self._session.url_fetch(api_url, tr_id, params=params)
-                    self._session.smart_sleep()
                     if not res.is_ok():
                         logger.error(
                             f"get_buyable_quantity still failed after token refresh: "
@@ -1016,7 +1270,6 @@ class KISBroker:
                     )
                     time.sleep(_TRANSIENT_RETRY_DELAY)
                     res = self._session.url_fetch(api_url, tr_id, params=params)
-                    self._session.smart_sleep()
                     if res.is_ok():
                         logger.info(
                             f"get_buyable_quantity: Transient error resolved after {retry + 1} retries"
@@ -1203,19 +1456,7 @@ class KISBroker:
             api_url = "/uapi/domestic-stock/v1/quotations/inquire-time-itemchartprice"
             tr_id = "FHKST03010200"
 
-            # 기준 시간 설정 (target_hour가 없으면 현재 시간)
-            if target_hour is None:
-                fid_input_hour = datetime.now().strftime("%H%M%S")
-            else:
-                fid_input_hour = target_hour
-
-            params = {
-                "FID_COND_MRKT_DIV_CODE": "J",
-                "FID_INPUT_ISCD": stock_code,
-                "FID_INPUT_HOUR_1": fid_input_hour,
-                "FID_PW_DATA_INCU_YN": "Y",  # 과거 데이터 포함
-                "FID_ETC_CLS_CODE": "",  # 기타 구분 코드 (필수)
-            }
+            params = self._minute_candles_params(stock_code, target_hour)
 
             resp: APIResp = self._session.url_fetch(api_url, tr_id, params=params)
             if not resp.is_ok():
@@ -1227,50 +1468,7 @@ class KISBroker:
                 )
                 return []
 
-            body = resp.get_body()
-            output1 = getattr(body, "output1", None)
-            output2 = getattr(body, "output2", None)
-
-            # output2 검증
-            if output2 is None:
-                logger.warning(f"No output2 in minute candles response for {stock_code}")
-                return []
-
-            if not isinstance(output2, (list, tuple)):
-                logger.warning(f"Minute candles output2 is not a list: {type(output2)}")
-                return []
-
-            # dict/object 모두 처리하는 헬퍼 함수
-            def get_value(obj, key: str, default=0):
-                if isinstance(obj, dict):
-                    return obj.get(key, default)
-                return getattr(obj, key, default)
-
-            # output1에서 당일 등락률 추출 (전 분봉 공통 적용)
-            change_rate = 0.0
-            if output1:
-                change_rate = float(get_value(output1, "prdy_ctrt", 0))
-
-            candles = []
-            for item in output2:
-                try:
-                    candle = {
-                        "trade_date": str(get_value(item, "stck_bsop_date", "")),
-                        "time": str(get_value(item, "stck_cntg_hour", "")),
-                        "open_price": int(get_value(item, "stck_oprc", 0)),
-                        "high_price": int(get_value(item, "stck_hgpr", 0)),
-                        "low_price": int(get_value(item, "stck_lwpr", 0)),
-                        "close_price": int(get_value(item, "stck_prpr", 0)),
-                        "volume": int(get_value(item, "cntg_vol", 0)),
-                        "change_rate": change_rate,  # output1의 당일 등락률 사용
-                    }
-                    if candle["close_price"] > 0:
-                        candles.append(candle)
-                except (ValueError, TypeError) as e:
-                    logger.warning(f"Failed to parse minute candle: {e}")
-                    continue
-
-            return candles
+            return self._parse_minute_candles(stock_code, resp)
 
         except Exception as e:
             logger.error(f"Failed to get minute candles for {stock_code}: {e}")
@@ -0,0 +1,445 @@
+"""
+주문 추격 엔진 모듈
+
+지정가 추격 매수 / 지정가 매도 → 시장가 전환을 전용 스레드 1개의 주문별 상태 머신으로 처리
+- 호출 스레드(스케줄러/ExitMonitor)는 최초 주문 후 즉시 반환 (sleep 대기 없음)
+- 체결: WS 체결통보(주문번호 단위 증분)를 우선 반영, REST는 보정용
+- REST 보정: 활성 주문 전체가 당일 주문 조회 1회(get_today_orders) 결과를 공유
+  (reconcile_interval 안에서는 재사용, 취소 직후에만 강제 재조회)
+- 재호가: 실시간 호가 갱신으로 매도호가1이 주문가와 달라지면 다음 점검을 기다리지 않고 정정
+
+상태 머신 (ChaseKind)
+- BUY_CHASE: 주문 → [점검/호가 갱신마다 매도호가1로 정정 (최대 max_retry회)] → 마감 시 미체결 취소
+- SELL_FALLBACK: 지정가 주문 → [fallback 시각까지 체결 대기] → 미체결 취소 → 시장가 매도
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set
+
+from leverage_worker.trading.broker import KISBroker, OrderInfo
+from leverage_worker.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from leverage_worker.trading.order_manager import ManagedOrder, OrderManager
+
+logger = get_logger(__name__)
+
+
+class ChaseKind(Enum):
+    """추격 작업 종류"""
+
+    BUY_CHASE = "buy_chase"  # 매도호가1 추격 매수
+    SELL_FALLBACK = "sell_fallback"  # 지정가 매도 → 시장가 전환
+
+
+@dataclass(eq=False)
+class ChaseTask:
+    """
+    주문 1건의 추격 상태
+
+    정정으로 주문번호가 바뀌어도 이전 주문번호의 늦은 체결을 반영하도록
+    주문번호별 주문/체결 수량을 따로 보관한다. 엔진 스레드에서만 변경.
+    """
+
+    kind: ChaseKind
+    order: "ManagedOrder"
+    order_id: str  # 현재 주문번호
+    branch: str
+    deadline_ns: int  # 추격 마감 / 시장가 전환 시각
+    interval_ns: int = 0  # 점검 간격 (BUY_CHASE)
+    max_retry: int = 0  # 최대 정정 횟수 (BUY_CHASE)
+    deposit: int = 0  # 사용 가능 예수금 (BUY_CHASE)
+    on_complete: Optional[Callable[["ManagedOrder"], None]] = field(default=None, repr=False)
+
+    next_check_ns: int = 0
+    next_reprice_ns: int = 0  # 호가 갱신에 의한 정정 허용 시각 (정정 직후 연속 정정 방지)
+    retries: int = 0
+    book_moved: bool = False
+    ordered: Dict[str, int] = field(default_factory=dict)  # 주문번호 -> 주문수량
+    ws_fills: Dict[str, int] = field(default_factory=dict)  # 주문번호 -> WS 누적 체결
+    rest_fills: Dict[str, int] = field(default_factory=dict)  # 주문번호 -> REST 체결 (절대값)
+    applied: Dict[str, int] = field(default_factory=dict)  # 주문번호 -> 포지션 반영 체결
+    fill_cost: int = 0  # 반영 체결 금액 합 (평균 체결가 계산용)
+
+    @property
+    def stock_code(self) -> str:
+        return self.order.stock_code
+
+    @property
+    def filled_qty(self) -> int:
+        return sum(self.applied.values())
+
+    @property
+    def unfilled_qty(self) -> int:
+        """현재 주문번호의 미체결 수량"""
+        return self.ordered[self.order_id] - self.applied.get(self.order_id, 0)
+
+
+# 엔진 이벤트: (종류, 주문번호/종목코드, 수량, 가격)
+_EV_FILL = "fill"
+_EV_BOOK = "book"
+
+
+class OrderChaseEngine:
+    """
+    주문 추격 엔진
+
+    OrderManager가 생성/소유하며 첫 작업 등록 시 스레드를 시작한다.
+    주문 상태(ManagedOrder, 활성 주문, 포지션) 변경은 OrderManager 메서드로 위임한다.
+
+    잠금 순서: OrderManager._order_lock → 엔진 _cond (엔진은 _cond를 잡은 채 OrderManager를 호출하지 않음)
+    """
+
+    def __init__(
+        self,
+        manager: "OrderManager",
+        broker: KISBroker,
+        reconcile_interval: float = 0.5,
+        name: str = "order-chase",
+    ):
+        """
+        Args:
+            manager: 주문 관리자 (체결 반영/주문 종료 위임)
+            broker: 정정/취소/시장가 주문 및 당일 주문 조회
+            reconcile_interval: 당일 주문 조회 결과 재사용 시간 (초, 활성 주문 전체 공유)
+            name: 스레드 이름
+        """
+        self._manager = manager
+        self._broker = broker
+        self._reconcile_ns = int(reconcile_interval * 1e9)
+        self._name = name
+
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._tasks: List[ChaseTask] = []
+        self._by_order_no: Dict[str, ChaseTask] = {}  # 현재/이전 주문번호 -> 작업
+        self._symbols: Set[str] = set()  # 추격 매수 진행 중 종목 (호가 이벤트 필터)
+        self._events: List[tuple] = []
+
+        # 엔진 스레드 전용
+        self._snapshot: Dict[str, OrderInfo] = {}
+        self._snapshot_ns = 0
+
+        self._stats: Dict[str, int] = {
+            "tasks": 0,
+            "rest_queries": 0,
+            "ws_fills": 0,
+            "rest_fills": 0,
+            "modifies": 0,
+            "book_reprices": 0,
+            "cancels": 0,
+            "market_fallbacks": 0,
+        }
+
+    # ==========================================
+    # 수명 주기
+    # ==========================================
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        """엔진 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+        logger.info(f"[OrderChase] {self._name} started")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """진행 중 작업이 끝날 때까지(최대 timeout) 기다린 후 종료"""
+        with self._cond:
+            if not self._running:
+                return
+            self._running = False
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                logger.warning(f"[OrderChase] {len(self._tasks)} tasks still active at shutdown")
+            self._thread = None
+        logger.info(f"[OrderChase] {self._name} stopped")
+
+    # ==========================================
+    # 입력 (임의 스레드)
+    # ==========================================
+
+    def submit(self, task: ChaseTask) -> None:
+        """작업 등록 (최초 주문 접수 후 호출)"""
+        now = time.monotonic_ns()
+        task.ordered[task.order_id] = task.order.quantity
+        if task.kind == ChaseKind.BUY_CHASE:
+            task.next_check_ns = now + task.interval_ns
+        else:
+            task.next_check_ns = task.deadline_ns
+
+        if not self._running:
+            self.start()
+        with self._cond:
+            self._tasks.append(task)
+            self._by_order_no[task.order_id] = task
+            if task.kind == ChaseKind.BUY_CHASE:
+                self._symbols.add(task.stock_code)
+            self._stats["tasks"] += 1
+            self._cond.notify()
+
+    def on_fill(self, order_no: str, filled_qty: int, filled_price: int) -> bool:
+        """
+        WS 체결통보 전달
+
+        Returns:
+            True: 추격 작업 주문 (엔진이 반영) / False: 해당 없음
+        """
+        with self._cond:
+            if order_no not in self._by_order_no:
+                return False
+            self._events.append((_EV_FILL, order_no, filled_qty, filled_price))
+            self._cond.notify()
+        return True
+
+    def on_book(self, stock_code: str) -> None:
+        """호가 갱신 알림 (MarketDataView 리스너)"""
+        if stock_code not in self._symbols:
+            return
+        with self._cond:
+            self._events.append((_EV_BOOK, stock_code, 0, 0))
+            self._cond.notify()
+
+    def is_tracking(self, order_no: str) -> bool:
+        with self._cond:
+            return order_no in self._by_order_no
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {**self._stats, "active": len(self._tasks)}
+
+    # ==========================================
+    # 엔진 스레드
+    # ==========================================
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._events:
+                        break
+                    if not self._tasks:
+                        if not self._running:
+                            return
+                        self._cond.wait()
+                        continue
+                    wait_ns = min(t.next_check_ns for t in self._tasks) - time.monotonic_ns()
+                    if wait_ns <= 0:
+                        break
+                    self._cond.wait(wait_ns / 1e9)
+                events = self._events
+                self._events = []
+                tasks = list(self._tasks)
+
+            try:
+                self._process(events, tasks)
+            except Exception as e:
+                logger.error(f"[OrderChase] loop error: {e}", exc_info=True)
+
+    def _process(self, events: List[tuple], tasks: List[ChaseTask]) -> None:
+        """이벤트 반영 → 만기 작업 점검 → 호가 변동 작업 재호가"""
+        moved: Set[str] = set()
+        for kind, key, qty, price in events:
+            if kind == _EV_FILL:
+                task = self._by_order_no.get(key)
+                if task is not None:
+                    task.ws_fills[key] = task.ws_fills.get(key, 0) + qty
+                    self._stats["ws_fills"] += 1
+                    self._apply_fills(task, key, price)
+            else:
+                moved.add(key)
+
+        now = time.monotonic_ns()
+        due = [t for t in tasks if t.next_check_ns <= now]
+        if due:
+            self._reconcile(tasks)
+
+        for task in tasks:
+            if task.stock_code in moved:
+                task.book_moved = True
+            try:
+                if task.unfilled_qty <= 0:
+                    self._finish(task)
+                elif task.kind == ChaseKind.BUY_CHASE:
+                    self._step_buy(task, now, task in due)
+                elif task in due:
+                    self._step_sell(task)
+            except Exception as e:
+                logger.error(f"[OrderChase] {task.stock_code} step error: {e}", exc_info=True)
+                self._finish(task)
+
+    # ==========================================
+    # 체결 반영
+    # ==========================================
+
+    def _reconcile(self, tasks: List[ChaseTask], force: bool = False) -> None:
+        """당일 주문 조회 1회로 모든 작업의 REST 체결 갱신 (reconcile_interval 내 재사용)"""
+        now = time.monotonic_ns()
+        if force or now - self._snapshot_ns >= self._reconcile_ns:
+            orders = self._broker.get_today_orders(max_age=0 if force else None)
+            self._snapshot = {o.order_id: o for o in orders}
+            self._snapshot_ns = now
+            self._stats["rest_queries"] += 1
+
+        for task in tasks:
+            for order_no in list(task.ordered):
+                info = self._snapshot.get(order_no)
+                if info is None or info.filled_qty <= task.rest_fills.get(order_no, 0):
+                    continue
+                task.rest_fills[order_no] = info.filled_qty
+                self._stats["rest_fills"] += 1
+                self._apply_fills(task, order_no, info.filled_price)
+
+    def _apply_fills(self, task: ChaseTask, order_no: str, price: int) -> None:
+        """
+        주문번호 체결 = max(WS 누적, REST 절대값) (주문수량 상한) → 미반영분만 포지션 반영
+
+        두 출처를 합산하지 않으므로 WS 통보와 REST 조회가 같은 체결을 중복 반영하지 않음.
+        """
+        effective = min(
+            max(task.ws_fills.get(order_no, 0), task.rest_fills.get(order_no, 0)),
+            task.ordered[order_no],
+        )
+        delta = effective - task.applied.get(order_no, 0)
+        if delta <= 0:
+            return
+        if price <= 0:
+            price = task.order.price  # REST 체결가 미반영 → 주문가
+
+        task.applied[order_no] = effective
+        task.fill_cost += delta * price
+        self._manager._apply_chase_fill(task.order, task.filled_qty, delta, price)
+
+    # ==========================================
+    # 상태 머신
+    # ==========================================
+
+    def _step_buy(self, task: ChaseTask, now: int, due: bool) -> None:
+        """추격 매수: 마감이면 취소/종료, 아니면 매도호가1 변동 시 정정"""
+        if due and now >= task.deadline_ns:
+            self._cancel_remaining(task)
+            self._finish(task)
+            return
+
+        book_triggered = task.book_moved and now >= task.next_reprice_ns
+        task.book_moved = False
+        if not (due or book_triggered) or task.retries >= task.max_retry:
+            if due:
+                task.next_check_ns = min(now + task.interval_ns, task.deadline_ns)
+            return
+
+        if due:
+            task.next_check_ns = min(now + task.interval_ns, task.deadline_ns)
+
+        order = task.order
+        new_price = self._manager._get_ask_price(task.stock_code)
+        if not new_price or new_price <= 0:
+            logger.warning(f"[{task.stock_code}] 매도호가1 재조회 실패, 대기")
+            return
+        if new_price == order.price:
+            return
+
+        # 가격 상승 시 남은 예수금 기준으로 수량 축소
+        unfilled = task.unfilled_qty
+        new_qty = unfilled
+        if new_price > order.price:
+            affordable = (task.deposit - task.fill_cost) // new_price
+            new_qty = min(unfilled, affordable)
+            if new_qty < unfilled:
+                logger.info(
+                    f"[{task.stock_code}] 가격 상승으로 수량 조정: {unfilled}주 → {new_qty}주 "
+                    f"(가격: {order.price:,} → {new_price:,})"
+                )
+        if new_qty <= 0:
+            logger.warning(f"[{task.stock_code}] 예수금 부족으로 추가 매수 불가")
+            task.deadline_ns = now  # 다음 점검에서 취소/종료
+            task.next_check_ns = now
+            return
+
+        task.retries += 1
+        task.next_reprice_ns = now + task.interval_ns // 2
+        if book_triggered:
+            self._stats["book_reprices"] += 1
+
+        new_order_id = self._broker.modify_order(task.order_id, task.branch, new_qty, new_price)
+        if not new_order_id:
+            logger.warning(f"[{task.stock_code}] 정정 주문 실패")
+            return
+
+        self._stats["modifies"] += 1
+        old_order_id = task.order_id
+        # 이전 주문번호는 추적 유지 (정정 직전 체결 통보가 늦게 와도 반영)
+        task.ordered[new_order_id] = new_qty
+        task.order_id = new_order_id
+        with self._cond:
+            self._by_order_no[new_order_id] = task
+        self._manager._replace_chase_order(
+            order, old_order_id, new_order_id, task.filled_qty + new_qty, new_price
+        )
+        logger.info(
+            f"[{task.stock_code}] 정정 주문 #{task.retries}: {new_qty}주 @ {new_price:,}원"
+        )
+
+    def _step_sell(self, task: ChaseTask) -> None:
+        """지정가 매도 fallback 시각: 미체결 취소 후 잔량 시장가 매도"""
+        unfilled = task.unfilled_qty
+        logger.info(f"[{task.stock_code}] 지정가 매도 미체결: {unfilled}주 → 시장가 전환")
+        self._cancel_remaining(task)
+
+        unfilled = task.unfilled_qty
+        # 시장가 전환 시 종목 pending 유지 (해제~재등록 사이 중복 매도 방지)
+        self._finish(task, keep_pending=unfilled > 0)
+        if unfilled > 0:
+            self._stats["market_fallbacks"] += 1
+            self._manager._submit_market_fallback(task.order, unfilled)
+
+    def _cancel_remaining(self, task: ChaseTask) -> None:
+        """현재 주문 미체결 취소 + 취소 중 체결 확인 (강제 재조회)"""
+        unfilled = task.unfilled_qty
+        if unfilled <= 0:
+            return
+        self._stats["cancels"] += 1
+        if not self._broker.cancel_order(task.order_id, task.branch, unfilled):
+            logger.warning(f"[{task.stock_code}] 미체결 취소 실패 - 체결 재확인")
+        self._reconcile([task], force=True)
+
+    def _finish(self, task: ChaseTask, keep_pending: bool = False) -> None:
+        """작업 종료: 주문 상태 확정 + 등록 해제 + 완료 콜백 (keep_pending: 후속 주문이 이어받음)"""
+        with self._cond:
+            if task not in self._tasks:
+                return
+            self._tasks.remove(task)
+            for order_no in task.ordered:
+                self._by_order_no.pop(order_no, None)
+            if task.kind == ChaseKind.BUY_CHASE and not any(
+                t.stock_code == task.stock_code and t.kind == ChaseKind.BUY_CHASE for t in self._tasks
+            ):
+                self._symbols.discard(task.stock_code)
+
+        filled = task.filled_qty
+        avg_price = task.fill_cost // filled if filled else 0
+        self._manager._finish_chase_order(
+            task.order, task.order_id, filled, avg_price, task.unfilled_qty, keep_pending
+        )
+        logger.info(
+            f"[{task.stock_code}] {task.kind.value} 종료: {filled}주 체결"
+            + (f" @ {avg_price:,}원" if filled else "")
+        )
+
+        if task.on_complete is not None:
+            try:
+                task.on_complete(task.order)
+            except Exception as e:
+                logger.error(f"[{task.stock_code}] 추격 완료 콜백 에러: {e}", exc_info=True)
@@ -6,15 +6,19 @@
 - 주문 상태 추적
 - 체결 확인 및 포지션 업데이트
 - 감사 추적 (SQLite)
+- 추격 매수 / 매도 시장가 전환은 OrderChaseEngine에 위임 (호출 스레드 비차단)
+- 당일 체결 집계는 TradeLedger (메모리, 틱 경로 DB 조회 없음)
 """
 
 import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional, Set, Callable
 
 from leverage_worker.data.database import Database
+from leverage_worker.data.order_book import MarketDataView
 from leverage_worker.trading.broker import (
     KISBroker,
     OrderResult,
@@ -22,7 +26,9 @@ from leverage_worker.trading.broker import (
     OrderStatus,
     OrderInfo,
 )
+from leverage_worker.trading.order_chase import ChaseKind, ChaseTask, OrderChaseEngine
 from leverage_worker.trading.position_manager import PositionManager
+from leverage_worker.trading.trade_ledger import TradeLedger
 from leverage_worker.utils.logger import get_logger
 from leverage_worker.utils.audit_logger import get_audit_logger
 
@@ -91,10 +97,16 @@ class OrderManager:
         broker: KISBroker,
         position_manager: PositionManager,
         database: Database,
+        market_data_view: Optional[MarketDataView] = None,
+        chase_reconcile_interval: float = 0.5,
     ):
         self._broker = broker
         self._position_manager = position_manager
         self._db = database
+        # 당일 체결 집계 (주문 DB 기록 시 갱신)
+        self._ledger = TradeLedger(database)
+        # 실시간 호가 뷰 (없으면 REST 호가 조회)
+        self._market_view = market_data_view
 
         # 활성 주문: order_id -> ManagedOrder
         self._active_orders: Dict[str, ManagedOrder] = {}
@@ -114,6 +126,11 @@ class OrderManager:
         # 주문 상태 보호용 lock (RLock: _handle_fill에서 콜백 재진입 가능)
         self._order_lock = threading.RLock()
 
+        # 추격 매수 / 매도 시장가 전환 엔진 (첫 주문 시 스레드 시작)
+        self._chase = OrderChaseEngine(self, broker, reconcile_interval=chase_reconcile_interval)
+        if market_data_view is not None:
+            market_data_view.add_listener(self._chase.on_book)
+
         logger.info("OrderManager initialized")
 
     def set_on_fill_callback(
@@ -122,6 +139,19 @@ class OrderManager:
         """체결 콜백 설정 (order, filled_qty, avg_price)"""
         self._on_fill_callback = callback
 
+    def stop(self, timeout: float = 10.0) -> None:
+        """추격 엔진 종료 (진행 중 추격은 최대 timeout까지 마무리)"""
+        self._chase.stop(timeout)
+
+    @property
+    def trade_ledger(self) -> TradeLedger:
+        """당일 거래 원장 (스캘핑 등 orders 테이블에 기록하는 다른 모듈과 공유)"""
+        return self._ledger
+
+    def get_chase_stats(self) -> Dict[str, int]:
+        """추격 엔진 통계 (활성 작업 수, REST 조회/정정/취소 횟수 등)"""
+        return self._chase.stats()
+
     def enable_liquidation_mode(self) -> None:
         """청산 모드 활성화 (신규 매수 차단)"""
         self._liquidation_mode = True
@@ -299,12 +329,14 @@ class OrderManager:
         interval: float = 0.5,
         max_retry: int = 10,
         signal_price: int = 0,
+        on_complete: Optional[Callable[["ManagedOrder"], None]] = None,
     ) -> Optional[str]:
         """
         매도호가1 추격 매수 (지정가 주문 + 반복 정정)
 
-        - 0.5초마다 미체결 확인
-        - 매도호가1로 정정 (최대 10회)
+        최초 주문 후 즉시 반환. 이후 추격은 OrderChaseEngine이 진행:
+        - 0.5초마다 미체결 확인 (호가 뷰가 있으면 매도호가1 변동 시 즉시 정정)
+        - 매도호가1로 정정 (최대 10회, interval * max_retry 후 미체결 취소)
         - 가격 상승 시 수량 자동 조정
 
         Args:
@@ -316,12 +348,11 @@ class OrderManager:
             interval: 정정 간격 (초)
             max_retry: 최대 정정 횟수
             signal_price: 시그널 발생 시점 가격 (TP 계산용)
+            on_complete: 추격 종료 콜백 (엔진 스레드, 최종 체결 수량/평균가 반영된 ManagedOrder)
 
         Returns:
-            주문 ID 또는 None (실패 시)
+            최초 주문 ID 또는 None (실패 시)
         """
-        import time
-
         # 청산 모드 체크 (신규 매수 차단)
         if self._liquidation_mode:
             logger.warning(f"[{stock_code}] 매수 주문 차단: 청산 진행 중")
@@ -333,7 +364,7 @@ class OrderManager:
             return None
 
         # 1. 매도호가1 조회
-        ask_price = self._broker.get_asking_price(stock_code)
+        ask_price = self._get_ask_price(stock_code)
         if not ask_price or ask_price <= 0:
             logger.error(f"[{stock_code}] 매수 주문 차단: 매도호가1 조회 실패")
             return None
@@ -396,332 +427,18 @@ class OrderManager:
             status="submitted",
         )
 
-        # 4. 반복 정정 루프
-        total_filled = 0
-        current_price = ask_price
-        cumulative_pre_modify_cost = 0   # 정정 이전 체결분의 누적 비용
-        cumulative_pre_modify_fills = 0  # 정정 이전 체결분의 누적 수량
-
-        try:
-            for retry in range(max_retry):
-                time.sleep(interval)  # 대기
-
-                # 체결 상태 확인
-                filled_qty, unfilled_qty = self._broker.get_order_status(order_id)
-                total_filled = filled_qty
-
-                if unfilled_qty == 0:
-                    # 전량 체결 완료
-                    logger.info(f"[{stock_code}] 전량 체결 완료: {total_filled}주")
-
-                    # 체결가 조회
-                    broker_orders = self._broker.get_today_orders()
-                    broker_order = next(
-                        (o for o in broker_orders if o.order_id == order_id), None
-                    )
-                    filled_price = broker_order.filled_price if broker_order else current_price
-
-                    # 아직 포지션에 추가되지 않은 체결분 처리
-                    if total_filled > order.filled_qty:
-                        new_filled = total_filled - order.filled_qty
-                        self._position_manager.add_position(
-                            stock_code=stock_code,
-                            stock_name=stock_name,
-                            quantity=new_filled,
-                            avg_price=filled_price,
-                            current_price=filled_price,
-                            strategy_name=strategy_name,
-                            order_id=order_id,
-                        )
-                        order.filled_qty = total_filled
-                        order.filled_price = filled_price
-
-                        # 콜백 호출 (Slack 알림 + ExitMonitor 등록)
-                        try:
-                            if self._on_fill_callback:
-                                self._on_fill_callback(order, new_filled, 0.0)
-                        except Exception as e:
-                            logger.error(f"[{stock_code}] 체결 콜백 에러: {e}")
-
-                    # 상태 정리
-                    with self._order_lock:
-                        order.state = OrderState.FILLED
-                        order.is_chase_in_progress = False
-                        self._pending_stocks.discard(stock_code)
-                    self._update_order_in_db(order)
-                    break
-
-                # 미체결 있음 → 매도호가1 재조회
-                new_ask_price = self._broker.get_asking_price(stock_code)
-                if not new_ask_price or new_ask_price <= 0:
-                    logger.warning(f"[{stock_code}] 매도호가1 재조회 실패, 대기")
-                    continue
-
-                # 가격 변동 시에만 정정
-                if new_ask_price == current_price:
-                    logger.debug(f"[{stock_code}] 가격 변동 없음, 대기 (미체결: {unfilled_qty}주)")
-                    continue
-
-                # 가격 상승 시 수량 재계산
-                if new_ask_price > current_price:
-                    # 남은 예수금 = 초기 예수금 - (체결수량 * 체결가격들의 합)
-                    # 간소화: 체결수량 * 현재 기준가격으로 계산
-                    used_amount = cumulative_pre_modify_cost + (total_filled * current_price)
-                    remaining_deposit = deposit - used_amount
-
-                    # 새 가격으로 주문 가능한 수량
-                    affordable_qty = remaining_deposit // new_ask_price
-                    new_order_qty = min(unfilled_qty, affordable_qty)
-
-                    if new_order_qty < unfilled_qty:
-                        logger.info(
-                            f"[{stock_code}] 가격 상승으로 수량 조정: "
-                            f"{unfilled_qty}주 → {new_order_qty}주 "
-                            f"(가격: {current_price:,} → {new_ask_price:,})"
-                        )
-                else:
-                    new_order_qty = unfilled_qty
-
-                if new_order_qty <= 0:
-                    logger.warning(f"[{stock_code}] 예수금 부족으로 추가 매수 불가")
-                    break
-
-                # 정정 직전 체결 상태 재확인 (race condition 방지)
-                latest_filled, latest_unfilled = self._broker.get_order_status(order_id)
-                if latest_unfilled == 0:
-                    # 정정 전에 전량 체결됨
-                    logger.info(f"[{stock_code}] 정정 전 전량 체결 완료: {latest_filled}주")
-                    total_filled = latest_filled
-
-                    # 체결가 조회
-                    broker_orders = self._broker.get_today_orders()
-                    broker_order = next(
-                        (o for o in broker_orders if o.order_id == order_id), None
-                    )
-                    filled_price = broker_order.filled_price if broker_order else current_price
-
-                    # 아직 포지션에 추가되지 않은 체결분 처리
-                    if total_filled > order.filled_qty:
-                        new_filled = total_filled - order.filled_qty
-                        self._position_manager.add_position(
-                            stock_code=stock_code,
-                            stock_name=stock_name,
-                            quantity=new_filled,
-                            avg_price=filled_price,
-                            current_price=filled_price,
-                            strategy_name=strategy_name,
-                            order_id=order_id,
-                        )
-                        order.filled_qty = total_filled
-                        order.filled_price = filled_price
-
-                        # 콜백 호출 (Slack 알림 + ExitMonitor 등록)
-                        try:
-                            if self._on_fill_callback:
-                                self._on_fill_callback(order, new_filled, 0.0)
-                        except Exception as e:
-                            logger.error(f"[{stock_code}] 체결 콜백 에러: {e}")
-
-                    # 상태 정리
-                    with self._order_lock:
-                        order.state = OrderState.FILLED
-                        order.is_chase_in_progress = False
-                        self._pending_stocks.discard(stock_code)
-                    self._update_order_in_db(order)
-                    break
-
-                # 실제 미체결 수량으로 정정 수량 조정
-                if latest_unfilled < new_order_qty:
-                    logger.info(
-                        f"[{stock_code}] 체결 진행으로 수량 재조정: "
-                        f"{new_order_qty}주 → {latest_unfilled}주"
-                    )
-                    new_order_qty = latest_unfilled
-                    total_filled = latest_filled
-
-                # 정정 전 체결분을 포지션에 즉시 추가 (누락 방지)
-                if latest_filled > order.filled_qty:
-                    new_filled = latest_filled - order.filled_qty
-
-                    # 체결가 조회
-                    broker_orders = self._broker.get_today_orders()
-                    broker_order = next(
-                        (o for o in broker_orders if o.order_id == order_id),
-                        None
-                    )
-                    filled_price = broker_order.filled_price if broker_order else current_price
-
-                    # 포지션에 추가
-                    self._position_manager.add_position(
-                        stock_code=stock_code,
-                        stock_name=stock_name,
-                        quantity=new_filled,
-                        avg_price=filled_price,
-                        current_price=filled_price,
-                        strategy_name=strategy_name,
-                        order_id=order_id,
-                    )
-                    order.filled_qty = latest_filled
-                    order.filled_price = filled_price
-                    logger.info(
-                        f"[{stock_code}] 정정 전 부분 체결 포지션 추가: "
-                        f"{new_filled}주 @ {filled_price:,}원 (누적: {order.filled_qty}주)"
-                    )
-
-                    # 콜백 호출 (Slack 알림 + ExitMonitor 등록)
-                    try:
-                        if self._on_fill_callback:
-                            self._on_fill_callback(order, new_filled, 0.0)
-                    except Exception as e:
-                        logger.error(f"[{stock_code}] 체결 콜백 에러: {e}")
-
-                # 정정 주문
-                new_order_id = self._broker.modify_order(order_id, order_branch, new_order_qty, new_ask_price)
-                if new_order_id:
-                    # 주문번호가 변경된 경우 추적 업데이트
-                    if new_order_id != order_id:
-                        with self._order_lock:
-                            self._active_orders.pop(order_id, None)
-                            order.order_id = new_order_id
-                            self._active_orders[new_order_id] = order
-                        logger.info(f"[{stock_code}] 주문번호 변경: {order_id} -> {new_order_id}")
-                        order_id = new_order_id  # 이후 루프에서 새 ID 사용
-
-                    # 정정 이전 체결 비용/수량 누적 (새 주문은 체결 0에서 시작)
-                    cumulative_pre_modify_cost += order.filled_qty * current_price
-                    cumulative_pre_modify_fills += order.filled_qty
-                    order.filled_qty = 0  # 새 주문은 체결 이력 0에서 시작
-
-                    # ManagedOrder 상태 업데이트
-                    order.quantity = new_order_qty
-                    order.price = new_ask_price
-                    order.updated_at = datetime.now()
-
-                    current_price = new_ask_price
-                    logger.info(
-                        f"[{stock_code}] 정정 주문 #{retry+1}: "
-                        f"{new_order_qty}주 @ {new_ask_price:,}원"
-                    )
-                else:
-                    logger.warning(f"[{stock_code}] 정정 주문 실패")
-
-            # 최종 상태 로그
-            final_filled, final_unfilled = self._broker.get_order_status(order_id)
-
-            # 루프 종료 후 아직 포지션에 추가되지 않은 최종 체결분 처리
-            if final_filled > order.filled_qty:
-                remaining_filled = final_filled - order.filled_qty
-
-                # 체결가 조회
-                broker_orders = self._broker.get_today_orders()
-                broker_order = next(
-                    (o for o in broker_orders if o.order_id == order_id),
-                    None
-                )
-                filled_price = broker_order.filled_price if broker_order else current_price
-
-                # 포지션에 추가
-                self._position_manager.add_position(
-                    stock_code=stock_code,
-                    stock_name=stock_name,
-                    quantity=remaining_filled,
-                    avg_price=filled_price,
-                    current_price=filled_price,
-                    strategy_name=strategy_name,
-                    order_id=order_id,
-                )
-                order.filled_qty = final_filled
-                order.filled_price = filled_price
-                logger.info(
-                    f"[{stock_code}] 최종 체결분 포지션 추가: "
-                    f"{remaining_filled}주 @ {filled_price:,}원 (총 체결: {order.filled_qty}주)"
-                )
-
-                # 콜백 호출 (Slack 알림 + ExitMonitor 등록)
-                try:
-                    if self._on_fill_callback:
-                        self._on_fill_callback(order, remaining_filled, 0.0)
-                except Exception as e:
-                    logger.error(f"[{stock_code}] 체결 콜백 에러: {e}")
-
-            if final_unfilled > 0:
-                # 1) 미체결분 취소 요청
-                cancel_result = self._broker.cancel_order(order_id, order_branch, final_unfilled)
-
-                # 2) 취소 후 최종 체결 상태 재확인 (취소 중 체결된 수량 확인)
-                post_cancel_filled, post_cancel_unfilled = self._broker.get_order_status(order_id)
-
-                # 3) 취소 동안 추가 체결된 수량이 있으면 포지션에 추가
-                if post_cancel_filled > order.filled_qty:
-                    additional_filled = post_cancel_filled - order.filled_qty
-
-                    # 체결가 조회
-                    broker_orders = self._broker.get_today_orders()
-                    broker_order = next(
-                        (o for o in broker_orders if o.order_id == order_id), None
-                    )
-                    filled_price = broker_order.filled_price if broker_order else current_price
-
-                    # 포지션에 추가
-                    self._position_manager.add_position(
-                        stock_code=stock_code,
-                        stock_name=stock_name,
-                        quantity=additional_filled,
-                        avg_price=filled_price,
-                        current_price=filled_price,
-                        strategy_name=strategy_name,
-                        order_id=order_id,
-                    )
-                    order.filled_qty = post_cancel_filled
-                    order.filled_price = filled_price
-                    logger.info(
-                        f"[{stock_code}] 취소 중 추가 체결 포지션 추가: "
-                        f"{additional_filled}주 @ {filled_price:,}원 (총 체결: {order.filled_qty}주)"
-                    )
-
-                    # 콜백 호출 (Slack 알림 + ExitMonitor 등록)
-                    try:
-                        if self._on_fill_callback:
-                            self._on_fill_callback(order, additional_filled, 0.0)
-                    except Exception as e:
-                        logger.error(f"[{stock_code}] 체결 콜백 에러: {e}")
-
-                # 4) 상태 업데이트 및 로그
-                if cancel_result:
-                    cancelled_qty = final_unfilled - (post_cancel_filled - final_filled)
-                    logger.info(
-                        f"[{stock_code}] 추격매수 종료: {post_cancel_filled}주 체결, "
-                        f"{cancelled_qty}주 취소"
-                    )
-                else:
-                    logger.warning(
-                        f"[{stock_code}] 미체결 취소 실패 - 수동 확인 필요"
-                    )
-
-                # 5) pending 상태 정리
-                with self._order_lock:
-                    order.state = OrderState.PARTIAL if order.filled_qty > 0 else OrderState.CANCELLED
-                    order.is_chase_in_progress = False  # 추격매수 종료
-                    self._pending_stocks.discard(stock_code)
-                self._update_order_in_db(order)
-            else:
-                # 10회 정정 후 전량 체결된 경우 상태 정리
-                if order.state != OrderState.FILLED:
-                    with self._order_lock:
-                        order.state = OrderState.FILLED
-                        order.is_chase_in_progress = False
-                        self._pending_stocks.discard(stock_code)
-                    self._update_order_in_db(order)
-
-            # 누적 체결 수량 반영 (외부 참조용: Slack 알림 등)
-            order.filled_qty += cumulative_pre_modify_fills
-
-        finally:
-            with self._order_lock:
-                if order.is_chase_in_progress:
-                    order.is_chase_in_progress = False
-                    logger.warning(f"[{stock_code}] chase flag forced cleanup")
-
+        # 4. 추격 엔진 등록 (정정/체결/취소는 엔진 스레드에서 진행)
+        self._chase.submit(ChaseTask(
+            kind=ChaseKind.BUY_CHASE,
+            order=order,
+            order_id=order_id,
+            branch=order_branch,
+            deadline_ns=time.monotonic_ns() + int(max_retry * interval * 1e9),
+            interval_ns=int(interval * 1e9),
+            max_retry=max_retry,
+            deposit=deposit,
+            on_complete=on_complete,
+        ))
         return order_id
 
     def place_sell_order(
@@ -835,7 +552,8 @@ class OrderManager:
         """
         지정가 매도 주문 후 미체결 시 시장가로 전환
 
-        TP 달성 시 사용: 지정가로 먼저 시도 후 빠르게 시장가 전환
+        TP 달성 시 사용: 지정가로 먼저 시도 후 빠르게 시장가 전환.
+        지정가 주문 후 즉시 반환하며 체결 대기/시장가 전환은 OrderChaseEngine이 진행.
 
         Args:
             stock_code: 종목코드
@@ -846,10 +564,8 @@ class OrderManager:
             fallback_seconds: 미체결 대기 시간 (초)
 
         Returns:
-            주문 ID 또는 None (실패 시)
+            지정가 주문 ID 또는 None (실패 시)
         """
-        import time
-
         # 중복 주문 체크
         if stock_code in self._pending_stocks:
             logger.warning(f"[{stock_code}] 매도 주문 차단: 중복 주문 (pending 상태의 주문 존재)")
@@ -935,219 +651,15 @@ class OrderManager:
             reason="limit_order_with_fallback",
         )
 
-        # 2. 대기
-        time.sleep(fallback_seconds)
-
-        try:
-            # 3. 체결 상태 확인
-            filled_qty, unfilled_qty = self._broker.get_order_status(order_id)
-
-            if unfilled_qty == 0:
-                # 전량 체결 완료
-                logger.info(f"[{stock_code}] 지정가 매도 전량 체결: {filled_qty}주 @ {limit_price:,}원")
-
-                # 체결 처리 + 상태 정리
-                with self._order_lock:
-                    if order_id in self._active_orders:
-                        order = self._active_orders[order_id]
-                    else:
-                        order = None
-
-                if order:
-                    broker_order = next(
-                        (o for o in self._broker.get_today_orders() if o.order_id == order_id),
-                        None
-                    )
-                    with self._order_lock:
-                        if broker_order:
-                            order.filled_qty = filled_qty
-                            order.filled_price = broker_order.filled_price if broker_order.filled_price > 0 else limit_price
-                        else:
-                            logger.warning(f"[{stock_code}] 전량 체결 정보 조회 실패 (지정가 사용)")
-                            order.filled_qty = filled_qty
-                            order.filled_price = limit_price
-
-                        # 포지션 업데이트 + 손익 계산 (콜백은 _handle_fill 내부에서 호출됨)
-                        self._handle_fill(order, filled_qty)
-
-                        # 상태 정리
-                        order.state = OrderState.FILLED
-                        order.is_sell_fallback_in_progress = False
-                        self._active_orders.pop(order_id, None)
-
-                with self._order_lock:
-                    self._pending_stocks.discard(stock_code)
-                self._update_order_in_db(order)
-                return order_id
-
-            # 4. 미체결 있음 → 취소 후 시장가 전환
-            logger.info(
-                f"[{stock_code}] 지정가 매도 미체결: {unfilled_qty}주 → 시장가 전환"
-            )
-
-            # 취소 전에 order 참조 저장 (cancel_order가 _active_orders에서 제거하므로)
-            order = self._active_orders.get(order_id)
-
-            # 부분 체결분 처리 (취소 전에 먼저 처리)
-            if filled_qty > 0 and order:
-                # 체결가 조회
-                broker_order = next(
-                    (o for o in self._broker.get_today_orders() if o.order_id == order_id),
-                    None
-                )
-                with self._order_lock:
-                    if broker_order:
-                        order.filled_qty = filled_qty
-                        order.filled_price = broker_order.filled_price if broker_order.filled_price > 0 else limit_price
-                    else:
-                        logger.warning(f"[{stock_code}] 부분 체결 정보 조회 실패: {filled_qty}주 체결됨 (지정가 사용)")
-                        order.filled_qty = filled_qty
-                        order.filled_price = limit_price
-
-                    # 포지션 업데이트 + 손익 계산 (콜백은 _handle_fill 내부에서 호출됨)
-                    self._handle_fill(order, filled_qty)
-
-            # 기존 주문 취소
-            if not self.cancel_order(order_id):
-                logger.warning(f"[{stock_code}] 지정가 주문 취소 실패, 체결 재확인")
-                # 취소 실패 시 체결 상태 재확인
-                filled_qty, unfilled_qty = self._broker.get_order_status(order_id)
-                if unfilled_qty == 0:
-                    logger.info(f"[{stock_code}] 취소 실패했으나 전량 체결됨")
-                    # 남은 체결분 처리 (콜백은 _handle_fill 내부에서 호출됨)
-                    with self._order_lock:
-                        if order and order.filled_qty < filled_qty:
-                            additional = filled_qty - order.filled_qty
-                            order.filled_qty = filled_qty
-                            order.filled_price = limit_price
-                            self._handle_fill(order, additional)
-                        if order:
-                            order.is_sell_fallback_in_progress = False
-                        self._pending_stocks.discard(stock_code)
-                    return order_id
-            else:
-                # 취소 성공 후 - 체결 상태 재확인 (취소 중 추가 체결 가능)
-                final_filled, final_unfilled = self._broker.get_order_status(order_id)
-
-                # 취소 중 추가 체결분 처리 (저장된 order 참조 사용)
-                if final_filled > filled_qty and order:
-                    additional_filled = final_filled - filled_qty
-                    logger.info(f"[{stock_code}] 취소 중 추가 체결: {filled_qty}주 → {final_filled}주")
-                    broker_order = next(
-                        (o for o in self._broker.get_today_orders() if o.order_id == order_id),
-                        None
-                    )
-                    with self._order_lock:
-                        if broker_order:
-                            order.filled_qty = final_filled
-                            order.filled_price = broker_order.filled_price if broker_order.filled_price > 0 else limit_price
-                        else:
-                            logger.warning(f"[{stock_code}] 취소 중 체결 정보 조회 실패 (지정가 사용)")
-                            order.filled_qty = final_filled
-                            order.filled_price = limit_price
-                        # 포지션 업데이트 + 손익 계산 (콜백은 _handle_fill 내부에서 호출됨)
-                        self._handle_fill(order, additional_filled)
-
-                    filled_qty = final_filled
-                    unfilled_qty = final_unfilled
-
-                # 전량 체결 완료 확인
-                if unfilled_qty == 0:
-                    logger.info(f"[{stock_code}] 취소 완료 후 전량 체결 확인됨: {filled_qty}주")
-                    with self._order_lock:
-                        self._pending_stocks.discard(stock_code)
-                        if order:
-                            order.is_sell_fallback_in_progress = False
-                    return order_id
-
-            # pending 상태 해제 (시장가 재주문을 위해)
-            with self._order_lock:
-                self._pending_stocks.discard(stock_code)
-                self._active_orders.pop(order_id, None)
-
-            # 시장가 매도 전 실제 잔고 확인
-            position = self._position_manager.get_position(stock_code)
-            actual_qty = position.quantity if position else 0
-
-            if actual_qty <= 0:
-                logger.warning(f"[{stock_code}] 시장가 전환 취소: 잔고 없음 (전량 체결됨)")
-                if order:
-                    order.is_sell_fallback_in_progress = False
-                return order_id
-
-            if actual_qty < unfilled_qty:
-                logger.warning(f"[{stock_code}] 시장가 수량 조정: {unfilled_qty}주 → {actual_qty}주 (잔고 부족)")
-                unfilled_qty = actual_qty
-
-            # 미체결 수량만큼 시장가 매도
-            logger.info(f"[{stock_code}] 시장가 매도 전환: {unfilled_qty}주")
-
-            market_result = self._broker.place_market_order(stock_code, OrderSide.SELL, unfilled_qty)
-
-            if not market_result.success:
-                logger.error(f"[{stock_code}] 시장가 매도 전환 실패: {market_result.message}")
-                self._audit.log_order(
-                    event_type="ORDER_REJECTED",
-                    module="OrderManager",
-                    stock_code=stock_code,
-                    stock_name=stock_name,
-                    order_id=None,
-                    side="SELL",
-                    quantity=unfilled_qty,
-                    price=0,
-                    strategy_name=strategy_name or "",
-                    status="rejected",
-                    reason=f"market_fallback_failed: {market_result.message}",
-                )
-                # 상태 정리
-                if order:
-                    order.is_sell_fallback_in_progress = False
-                return order_id  # 부분 체결된 지정가 주문 ID 반환
-
-            # 시장가 주문 등록 (동일한 avg_price 사용)
-            market_order = ManagedOrder(
-                order_id=market_result.order_id,
-                stock_code=stock_code,
-                stock_name=stock_name,
-                side=OrderSide.SELL,
-                quantity=unfilled_qty,
-                price=market_result.price,
-                strategy_name=strategy_name,
-                state=OrderState.SUBMITTED,
-                avg_price=avg_price_for_pnl,
-            )
-            with self._order_lock:
-                self._active_orders[market_result.order_id] = market_order
-                self._pending_stocks.add(stock_code)
-
-            # DB 저장
-            self._save_order_to_db(market_order)
-
-            # 감사 로그 기록
-            self._audit.log_order(
-                event_type="ORDER_SUBMIT",
-                module="OrderManager",
-                stock_code=stock_code,
-                stock_name=stock_name,
-                order_id=market_result.order_id,
-                side="SELL",
-                quantity=unfilled_qty,
-                price=market_result.price,
-                strategy_name=strategy_name or "",
-                status="submitted",
-                reason="market_fallback_from_limit",
-            )
-
-            logger.info(
-                f"[{stock_code}] 시장가 매도 전환 완료: {unfilled_qty}주 (ID: {market_result.order_id})"
-            )
-
-            return market_result.order_id
-        finally:
-            with self._order_lock:
-                if order and order.is_sell_fallback_in_progress:
-                    order.is_sell_fallback_in_progress = False
-                    logger.warning(f"[{stock_code}] fallback flag forced cleanup")
+        # 2. 추격 엔진 등록 (fallback 시각에 미체결 취소 → 시장가 전환)
+        self._chase.submit(ChaseTask(
+            kind=ChaseKind.SELL_FALLBACK,
+            order=order,
+            order_id=order_id,
+            branch=order.branch_no,
+            deadline_ns=time.monotonic_ns() + int(fallback_seconds * 1e9),
+        ))
+        return order_id
 
     def process_ws_fill(self, order_no: str, filled_qty: int, filled_price: int) -> Optional[ManagedOrder]:
         """WebSocket 체결통보에서 직접 체결 처리 (증분 방식)
@@ -1160,6 +672,11 @@ class OrderManager:
         Returns:
             완료된 ManagedOrder 또는 None
         """
+        # 추격/fallback 주문 (정정 전 주문번호 포함)은 엔진이 반영
+        if self._chase.on_fill(order_no, filled_qty, filled_price):
+            logger.debug(f"WS fill: order {order_no} routed to chase engine")
+            return None
+
         with self._order_lock:
             order = self._active_orders.get(order_no)
             if not order:
@@ -1433,22 +950,159 @@ class OrderManager:
         with self._order_lock:
             return self._active_orders.get(order_id)
 
+    def _get_ask_price(self, stock_code: str) -> Optional[int]:
+        """매도호가1 (실시간 호가 뷰 우선, 없으면 REST)"""
+        if self._market_view is not None:
+            return self._market_view.best_ask(stock_code)
+        return self._broker.get_asking_price(stock_code)
+
+    # ==========================================
+    # 추격 엔진 위임 (엔진 스레드에서 호출)
+    # ==========================================
+
+    def _apply_chase_fill(
+        self, order: ManagedOrder, total_filled: int, filled_qty: int, filled_price: int
+    ) -> None:
+        """추격 주문 체결분 반영 (포지션/손익/콜백은 _handle_fill)"""
+        with self._order_lock:
+            order.filled_qty = total_filled
+            order.filled_price = filled_price  # 이번 체결분 가격 (손익/포지션 계산용)
+            order.state = OrderState.PARTIAL
+            order.updated_at = datetime.now()
+            self._handle_fill(order, filled_qty)
+
+    def _replace_chase_order(
+        self, order: ManagedOrder, old_order_id: str, new_order_id: str, quantity: int, price: int
+    ) -> None:
+        """정정으로 바뀐 주문번호/수량/가격 반영"""
+        with self._order_lock:
+            self._active_orders.pop(old_order_id, None)
+            order.order_id = new_order_id
+            order.quantity = quantity
+            order.price = price
+            order.updated_at = datetime.now()
+            self._active_orders[new_order_id] = order
+        if new_order_id != old_order_id:
+            logger.info(f"[{order.stock_code}] 주문번호 변경: {old_order_id} -> {new_order_id}")
+
+    def _finish_chase_order(
+        self,
+        order: ManagedOrder,
+        order_id: str,
+        filled_qty: int,
+        avg_price: int,
+        unfilled_qty: int,
+        keep_pending: bool = False,
+    ) -> None:
+        """추격 종료: 최종 상태 확정 + 활성/pending 해제 (keep_pending이면 pending 유지)"""
+        with self._order_lock:
+            order.filled_qty = filled_qty
+            if avg_price > 0:
+                order.filled_price = avg_price
+            if unfilled_qty <= 0:
+                order.state = OrderState.FILLED
+            else:
+                order.state = OrderState.PARTIAL if filled_qty > 0 else OrderState.CANCELLED
+            order.is_chase_in_progress = False
+            order.is_sell_fallback_in_progress = False
+            order.updated_at = datetime.now()
+            self._active_orders.pop(order_id, None)
+            if not keep_pending:
+                self._pending_stocks.discard(order.stock_code)
+        self._update_order_in_db(order)
+
+    def _submit_market_fallback(self, order: ManagedOrder, quantity: int) -> Optional[str]:
+        """
+        지정가 매도 미체결분 시장가 매도 (실제 잔고 한도)
+
+        추격 종료 시 유지한 종목 pending을 시장가 주문이 이어받음 (미제출 시 해제)
+        """
+        order_id: Optional[str] = None
+        try:
+            order_id = self._place_market_fallback(order, quantity)
+        finally:
+            if order_id is None:
+                with self._order_lock:
+                    self._pending_stocks.discard(order.stock_code)
+        return order_id
+
+    def _place_market_fallback(self, order: ManagedOrder, quantity: int) -> Optional[str]:
+        """시장가 매도 제출 + 주문 등록 (실패/잔고 없음 시 None)"""
+        stock_code = order.stock_code
+        position = self._position_manager.get_position(stock_code)
+        actual_qty = position.quantity if position else 0
+
+        if actual_qty <= 0:
+            logger.warning(f"[{stock_code}] 시장가 전환 취소: 잔고 없음 (전량 체결됨)")
+            return None
+
+        if actual_qty < quantity:
+            logger.warning(f"[{stock_code}] 시장가 수량 조정: {quantity}주 → {actual_qty}주 (잔고 부족)")
+            quantity = actual_qty
+
+        logger.info(f"[{stock_code}] 시장가 매도 전환: {quantity}주")
+        market_result = self._broker.place_market_order(stock_code, OrderSide.SELL, quantity)
+
+        if not market_result.success:
+            logger.error(f"[{stock_code}] 시장가 매도 전환 실패: {market_result.message}")
+            self._audit.log_order(
+                event_type="ORDER_REJECTED",
+                module="OrderManager",
+                stock_code=stock_code,
+                stock_name=order.stock_name,
+                order_id=None,
+                side="SELL",
+                quantity=quantity,
+                price=0,
+                strategy_name=order.strategy_name or "",
+                status="rejected",
+                reason=f"market_fallback_failed: {market_result.message}",
+            )
+            return None
+
+        # 시장가 주문 등록 (동일한 avg_price 사용, 이후 WS/REST 체결 처리는 일반 주문과 동일)
+        market_order = ManagedOrder(
+            order_id=market_result.order_id,
+            stock_code=stock_code,
+            stock_name=order.stock_name,
+            side=OrderSide.SELL,
+            quantity=quantity,
+            price=market_result.price,
+            strategy_name=order.strategy_name,
+            state=OrderState.SUBMITTED,
+            avg_price=order.avg_price,
+        )
+        with self._order_lock:
+            self._active_orders[market_result.order_id] = market_order
+            self._pending_stocks.add(stock_code)
+
+        self._save_order_to_db(market_order)
+        self._audit.log_order(
+            event_type="ORDER_SUBMIT",
+            module="OrderManager",
+            stock_code=stock_code,
+            stock_name=order.stock_name,
+            order_id=market_result.order_id,
+            side="SELL",
+            quantity=quantity,
+            price=market_result.price,
+            strategy_name=order.strategy_name or "",
+            status="submitted",
+            reason="market_fallback_from_limit",
+        )
+        logger.info(
+            f"[{stock_code}] 시장가 매도 전환 완료: {quantity}주 (ID: {market_result.order_id})"
+        )
+        return market_result.order_id
+
     def has_pending_order(self, stock_code: str) -> bool:
         """종목에 진행 중인 주문이 있는지 확인"""
         with self._order_lock:
             return stock_code in self._pending_stocks
 
     def get_today_trade_count(self, stock_code: str) -> int:
-        """당일 해당 종목의 거래 횟수 조회"""
-        today = datetime.now().strftime("%Y-%m-%d")
-
-        query = """
-            SELECT COUNT(*) as cnt FROM orders
-            WHERE stock_code = ? AND DATE(created_at) = ? AND status = 'filled'
-        """
-
-        row = self._db.fetch_one(query, (stock_code, today))
-        return row["cnt"] if row else 0
+        """당일 해당 종목의 거래 횟수 조회 (체결 완료 주문 수, 메모리 원장)"""
+        return self._ledger.trade_count(stock_code)
 
     def _save_order_to_db(self, order: ManagedOrder) -> None:
         """주문 DB 저장"""
@@ -1459,8 +1113,8 @@ class OrderManager:
                 INSERT INTO orders
                 (order_id, stock_code, stock_name, side, order_type, quantity,
                  price, filled_quantity, filled_price, status, strategy_name,
-                 created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                 trade_date, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 order.order_id,
                 order.stock_code,
@@ -1473,9 +1127,11 @@ class OrderManager:
                 order.filled_price,
                 order.state.value,
                 order.strategy_name,
+                order.created_at.strftime("%Y-%m-%d"),
                 order.created_at.strftime("%Y-%m-%d %H:%M:%S"),
                 now,
             ))
+        self._record_in_ledger(order)
 
     def _update_order_in_db(self, order: ManagedOrder) -> None:
         """주문 DB 업데이트"""
@@ -1502,3 +1158,9 @@ class OrderManager:
                 now,
                 order.order_id,
             ))
+        self._record_in_ledger(order)
+
+    def _record_in_ledger(self, order: ManagedOrder) -> None:
+        """체결 완료로 기록된 주문을 당일 원장에 반영"""
+        if order.state == OrderState.FILLED:
+            self._ledger.record_fill(order.order_id, order.stock_code, order.side.value)
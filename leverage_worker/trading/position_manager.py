@@ -6,12 +6,15 @@
 - 종목-전략 매핑
 - 기존 보유 주식 관리 (전략 없이)
 - 스레드 안전 (RLock 사용)
+- DB 영속화: 변경된 종목만 upsert/delete, DB writer 스레드에서 모아서 한 트랜잭션으로 커밋
 """
 
+import sqlite3
 import threading
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from leverage_worker.data.database import Database
 from leverage_worker.trading.broker import KISBroker, Position, OrderSide
@@ -20,6 +23,22 @@ from leverage_worker.utils.audit_logger import get_audit_logger
 
 logger = get_logger(__name__)
 
+_UPSERT_POSITION = """
+    INSERT INTO positions
+    (stock_code, stock_name, quantity, avg_price, current_price,
+     strategy_name, entry_order_id, entry_time, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(stock_code) DO UPDATE SET
+        stock_name = excluded.stock_name,
+        quantity = excluded.quantity,
+        avg_price = excluded.avg_price,
+        current_price = excluded.current_price,
+        strategy_name = excluded.strategy_name,
+        entry_order_id = excluded.entry_order_id,
+        entry_time = excluded.entry_time,
+        updated_at = excluded.updated_at
+"""
+
 
 @dataclass
 class ManagedPosition:
@@ -67,10 +86,14 @@ class PositionManager:
 
     - 전략별 포지션 추적
     - 브로커 잔고와 동기화
-    - DB 영속화
+    - DB 영속화 (변경분만, 매매 스레드에서 커밋 대기 없음)
     - RLock으로 스레드 안전성 보장
     """
 
+    # DB 저장 실패 시 재시도 간격 (지수 백오프, 초)
+    SAVE_RETRY_BASE_SECONDS = 1.0
+    SAVE_RETRY_MAX_SECONDS = 30.0
+
     def __init__(self, broker: KISBroker, database: Database):
         self._broker = broker
         self._db = database
@@ -93,6 +116,17 @@ class PositionManager:
         # 감사 추적 로거
         self._audit = get_audit_logger()
 
+        # DB 미반영 변경 종목 (self._lock 보호, _save_to_db에서 행으로 변환)
+        self._dirty: Set[str] = set()
+        # 커밋 대기 행: stock_code -> 행 (None이면 삭제), 같은 종목은 마지막 상태만 유지
+        self._persist_lock = threading.Lock()
+        self._pending: Dict[str, Optional[Tuple[Any, ...]]] = {}
+        self._flush_scheduled = False
+        # 저장 실패 재시도 (연속 실패 횟수, 예약된 타이머)
+        self._save_failures = 0
+        self._retry_timer: Optional[threading.Timer] = None
+        self._persist_stats: Dict[str, int] = {"flushes": 0, "upserts": 0, "deletes": 0, "failures": 0}
+
         logger.info("PositionManager initialized")
 
     def sync_with_broker(self) -> None:
@@ -142,6 +176,10 @@ class PositionManager:
                                 "broker": bp.quantity,
                             })
 
+                        if (mp.quantity, mp.avg_price, mp.current_price) != (
+                            bp.quantity, bp.avg_price, bp.current_price
+                        ):
+                            self._dirty.add(bp.stock_code)
                         mp.quantity = bp.quantity
                         mp.avg_price = bp.avg_price
                         mp.current_price = bp.current_price
@@ -159,6 +197,7 @@ class PositionManager:
                             entry_time=datetime.now(),
                         )
                         self._positions[bp.stock_code] = mp
+                        self._dirty.add(bp.stock_code)
                         logger.info(
                             f"New position detected (unmanaged): {bp.stock_code} "
                             f"x {bp.quantity} @ {bp.avg_price}"
@@ -182,6 +221,7 @@ class PositionManager:
                 for stock_code in list(self._positions.keys()):
                     if stock_code not in broker_codes:
                         mp = self._positions.pop(stock_code)
+                        self._dirty.add(stock_code)
 
                         # 감사 로그 기록 (동기화로 제거된 포지션)
                         self._audit.log_position(
@@ -202,7 +242,7 @@ class PositionManager:
                             self._strategy_stocks[mp.strategy_name].discard(stock_code)
                         logger.info(f"Position removed: {stock_code}")
 
-                # 3. DB 저장
+                # 3. DB 저장 (변경 종목만)
                 self._save_to_db()
 
                 # 4. 마지막 동기화 시간 업데이트
@@ -256,6 +296,10 @@ class PositionManager:
                                 "broker": bp.quantity,
                             })
 
+                        if (mp.quantity, mp.avg_price, mp.current_price) != (
+                            bp.quantity, bp.avg_price, bp.current_price
+                        ):
+                            self._dirty.add(bp.stock_code)
                         mp.quantity = bp.quantity
                         mp.avg_price = bp.avg_price
                         mp.current_price = bp.current_price
@@ -273,6 +317,7 @@ class PositionManager:
                             entry_time=datetime.now(),
                         )
                         self._positions[bp.stock_code] = mp
+                        self._dirty.add(bp.stock_code)
                         logger.info(
                             f"New position detected (unmanaged): {bp.stock_code} "
                             f"x {bp.quantity} @ {bp.avg_price}"
@@ -296,6 +341,7 @@ class PositionManager:
                 for stock_code in list(self._positions.keys()):
                     if stock_code not in broker_codes:
                         mp = self._positions.pop(stock_code)
+                        self._dirty.add(stock_code)
 
                         # 감사 로그 기록
                         self._audit.log_position(
@@ -316,7 +362,7 @@ class PositionManager:
                             self._strategy_stocks[mp.strategy_name].discard(stock_code)
                         logger.info(f"Position removed: {stock_code}")
 
-                # 3. DB 저장
+                # 3. DB 저장 (변경 종목만)
                 self._save_to_db()
 
                 # 4. 마지막 동기화 시간 업데이트
@@ -449,6 +495,7 @@ class PositionManager:
                     self._strategy_stocks[strategy_name] = set()
                 self._strategy_stocks[strategy_name].add(stock_code)
 
+            self._dirty.add(stock_code)
             self._save_to_db()
 
     def remove_position(self, stock_code: str) -> Optional[ManagedPosition]:
@@ -482,17 +529,19 @@ class PositionManager:
             if mp.strategy_name and mp.strategy_name in self._strategy_stocks:
                 self._strategy_stocks[mp.strategy_name].discard(stock_code)
 
+            self._dirty.add(stock_code)
             self._save_to_db()
             logger.info(f"Position removed: {stock_code}")
 
             return mp
 
     def update_price(self, stock_code: str, current_price: int) -> None:
-        """현재가 업데이트 (스레드 안전)"""
+        """현재가 업데이트 (스레드 안전, DB에는 다음 저장 시 함께 반영)"""
         with self._lock:
             if stock_code in self._positions:
                 self._positions[stock_code].current_price = current_price
                 self._positions[stock_code].updated_at = datetime.now()
+                self._dirty.add(stock_code)
 
     def update_quantity(self, stock_code: str, quantity: int) -> None:
         """수량 업데이트 (부분 체결 등, 스레드 안전)"""
@@ -501,15 +550,17 @@ class PositionManager:
                 mp = self._positions[stock_code]
                 mp.quantity = quantity
                 mp.updated_at = datetime.now()
+                self._dirty.add(stock_code)
 
                 if quantity <= 0:
                     # remove_position도 락을 잡으므로 직접 제거
                     self._positions.pop(stock_code, None)
                     if mp.strategy_name and mp.strategy_name in self._strategy_stocks:
                         self._strategy_stocks[mp.strategy_name].discard(stock_code)
-                    self._save_to_db()
                     logger.info(f"Position removed: {stock_code}")
 
+                self._save_to_db()
+
     def assign_strategy(self, stock_code: str, strategy_name: str) -> bool:
         """
         기존 포지션에 전략 할당 (스레드 안전)
@@ -539,6 +590,7 @@ class PositionManager:
                 self._strategy_stocks[strategy_name] = set()
             self._strategy_stocks[strategy_name].add(stock_code)
 
+            self._dirty.add(stock_code)
             self._save_to_db()
             logger.info(f"Strategy assigned: {stock_code} -> {strategy_name}")
 
@@ -552,33 +604,123 @@ class PositionManager:
         """전체 평가손익"""
         return sum(p.profit_loss for p in self._positions.values())
 
+    # ==========================================
+    # DB 영속화 (변경분만)
+    # ==========================================
+
     def _save_to_db(self) -> None:
-        """DB에 포지션 저장"""
-        # 기존 데이터 삭제
-        with self._db.get_cursor() as cursor:
-            cursor.execute("DELETE FROM positions")
-
-        # 현재 포지션 저장
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        for mp in self._positions.values():
-            with self._db.get_cursor() as cursor:
-                cursor.execute("""
-                    INSERT INTO positions
-                    (stock_code, stock_name, quantity, avg_price, current_price,
-                     strategy_name, entry_order_id, entry_time, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    mp.stock_code,
-                    mp.stock_name,
-                    mp.quantity,
-                    mp.avg_price,
-                    mp.current_price,
-                    mp.strategy_name,
-                    mp.entry_order_id,
-                    mp.entry_time.strftime("%Y-%m-%d %H:%M:%S"),
-                    now,
-                ))
+        """
+        변경 종목을 DB 저장 대기열에 반영하고 writer 작업 등록 (self._lock 안에서 호출)
+
+        - 변경 종목만 upsert, 제거된 종목만 delete (전체 삭제/재기록 없음)
+        - 커밋 대기 중에 같은 종목이 다시 바뀌면 마지막 상태 1행만 기록
+        - 이미 등록된 작업이 실행 전이면 그 작업이 함께 처리 (추가 등록 없음)
+        - 단일 writer 모드에서는 커밋을 기다리지 않음 (레거시 모드는 즉시 커밋)
+        """
+        if self._dirty:
+            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            rows = {
+                code: self._to_row(self._positions[code], now) if code in self._positions else None
+                for code in self._dirty
+            }
+            self._dirty.clear()
+            with self._persist_lock:
+                self._pending.update(rows)
+
+        with self._persist_lock:
+            if self._flush_scheduled or not self._pending:
+                return
+            self._flush_scheduled = True
+
+        batch: Dict[str, Optional[Tuple[Any, ...]]] = {}
+        try:
+            future = self._db.run_async(lambda conn: self._write_pending(conn, batch))
+        except RuntimeError as e:
+            # writer 종료 후 (엔진 종료 중)
+            with self._persist_lock:
+                self._flush_scheduled = False
+            logger.error(f"Position save skipped: {e}")
+            return
+        future.add_done_callback(lambda f: self._on_saved(f, batch))
+
+    @staticmethod
+    def _to_row(mp: ManagedPosition, now: str) -> Tuple[Any, ...]:
+        return (
+            mp.stock_code,
+            mp.stock_name,
+            mp.quantity,
+            mp.avg_price,
+            mp.current_price,
+            mp.strategy_name,
+            mp.entry_order_id,
+            mp.entry_time.strftime("%Y-%m-%d %H:%M:%S"),
+            now,
+        )
+
+    def _write_pending(
+        self, conn: sqlite3.Connection, batch: Dict[str, Optional[Tuple[Any, ...]]]
+    ) -> None:
+        """writer 스레드: 대기 행을 꺼내 delete + upsert (한 작업 단위)"""
+        with self._persist_lock:
+            batch.update(self._pending)
+            self._pending.clear()
+            self._flush_scheduled = False
+
+        deletes = [(code,) for code, row in batch.items() if row is None]
+        upserts = [row for row in batch.values() if row is not None]
+        if deletes:
+            conn.executemany("DELETE FROM positions WHERE stock_code = ?", deletes)
+        if upserts:
+            conn.executemany(_UPSERT_POSITION, upserts)
+
+        self._persist_stats["flushes"] += 1
+        self._persist_stats["upserts"] += len(upserts)
+        self._persist_stats["deletes"] += len(deletes)
+
+    def _on_saved(self, future: Future, batch: Dict[str, Optional[Tuple[Any, ...]]]) -> None:
+        """
+        저장 실패 시 꺼낸 행을 대기열에 되돌리고 백오프 후 재시도 예약
+
+        그 사이 더 새로운 행이 있으면 유지. 성공하면 연속 실패 횟수 초기화
+        """
+        error = future.exception()
+        with self._persist_lock:
+            if error is None:
+                self._save_failures = 0
+                return
+            if not batch:
+                # 작업이 실행되기 전에 실패 (BEGIN 실패 등) → 재등록 허용
+                self._flush_scheduled = False
+            for code, row in batch.items():
+                self._pending.setdefault(code, row)
+            self._save_failures += 1
+            delay = min(
+                self.SAVE_RETRY_MAX_SECONDS,
+                self.SAVE_RETRY_BASE_SECONDS * (2 ** (self._save_failures - 1)),
+            )
+            if self._retry_timer is None:
+                self._retry_timer = threading.Timer(delay, self._retry_save)
+                self._retry_timer.daemon = True
+                self._retry_timer.start()
+        self._persist_stats["failures"] += 1
+        logger.error(f"Position save failed ({len(batch)} rows, retry in {delay:.1f}s): {error}")
+
+    def _retry_save(self) -> None:
+        """타이머 스레드: 실패로 되돌린 행 재저장 (이미 등록된 작업이 있으면 그 작업이 처리)"""
+        with self._persist_lock:
+            self._retry_timer = None
+        with self._lock:
+            self._save_to_db()
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """현재가 등 미반영 변경분까지 저장하고 커밋될 때까지 대기 (리포트/종료 전)"""
+        with self._lock:
+            self._save_to_db()
+        self._db.flush(timeout)
+
+    def get_persist_stats(self) -> Dict[str, int]:
+        """DB 저장 작업/행 수"""
+        return dict(self._persist_stats)
 
     def load_from_db(self) -> None:
         """DB에서 포지션 로드"""
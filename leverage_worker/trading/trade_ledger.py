@@ -0,0 +1,123 @@
+"""
+당일 거래 원장 모듈
+
+체결 완료(status='filled') 주문의 당일 집계를 메모리에 유지
+- 종목별 체결 주문 수 (전략 컨텍스트의 today_trade_count)
+- 매수/매도 체결 주문 수
+- 주문 DB 기록 시점에 갱신 → 틱 경로에서 SQLite 조회 없음
+- 시작/날짜 변경 시 orders(trade_date 인덱스)에서 1회 복원
+
+실현손익/승패는 집계하지 않음 (DailyReportGenerator가 orders/daily_summary 기준으로 산출)
+"""
+
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional, Set
+
+from leverage_worker.data.database import Database
+from leverage_worker.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class DailyLedger:
+    """당일 집계 (체결 완료 주문 기준)"""
+
+    trade_date: str  # YYYY-MM-DD
+    trade_counts: Dict[str, int] = field(default_factory=dict)  # stock_code -> 체결 주문 수
+    buy_trades: int = 0
+    sell_trades: int = 0
+    # 반영된 주문 (같은 주문 중복 집계 방지)
+    order_ids: Set[str] = field(default_factory=set)
+
+
+class TradeLedger:
+    """
+    당일 거래 원장 (스레드 안전)
+
+    orders 테이블에 체결 완료로 기록되는 주문을 같은 시점에 record_fill()로 전달한다.
+    같은 주문을 여러 번 전달해도(부분 체결 누적 등) 주문 수는 1회만 센다.
+
+    Example:
+        ledger = TradeLedger(trading_db)
+        ledger.record_fill("0001", "122630", "sell")
+        count = ledger.trade_count("122630")
+    """
+
+    def __init__(self, database: Database):
+        self._db = database
+        self._lock = threading.Lock()
+        self._ledger: Optional[DailyLedger] = None
+
+    def _today(self) -> DailyLedger:
+        """당일 원장 (없거나 날짜가 바뀌면 DB에서 복원, self._lock 안에서 호출)"""
+        today = datetime.now().strftime("%Y-%m-%d")
+        if self._ledger is None or self._ledger.trade_date != today:
+            self._ledger = self._load(today)
+        return self._ledger
+
+    def _load(self, trade_date: str) -> DailyLedger:
+        ledger = DailyLedger(trade_date=trade_date)
+        try:
+            rows = self._db.fetch_all(
+                """
+                SELECT order_id, stock_code, side FROM orders
+                WHERE trade_date = ? AND status = 'filled'
+                """,
+                (trade_date,),
+            )
+        except Exception as e:
+            logger.error(f"Trade ledger load failed ({trade_date}): {e}")
+            return ledger
+
+        for row in rows:
+            self._apply(ledger, row["order_id"], row["stock_code"], row["side"])
+        logger.info(f"Trade ledger loaded ({trade_date}): {len(ledger.order_ids)} filled orders")
+        return ledger
+
+    @staticmethod
+    def _apply(ledger: DailyLedger, order_id: str, stock_code: str, side: str) -> None:
+        if order_id in ledger.order_ids:
+            return
+        ledger.order_ids.add(order_id)
+        ledger.trade_counts[stock_code] = ledger.trade_counts.get(stock_code, 0) + 1
+        if side.lower() == "sell":
+            ledger.sell_trades += 1
+        else:
+            ledger.buy_trades += 1
+
+    # ==========================================
+    # 갱신 / 조회
+    # ==========================================
+
+    def record_fill(self, order_id: str, stock_code: str, side: str) -> None:
+        """
+        체결 완료 주문 반영 (orders 테이블 status='filled' 기록과 같은 시점)
+
+        Args:
+            order_id: 주문번호
+            stock_code: 종목코드
+            side: "buy" / "sell" (대소문자 무관)
+        """
+        if not order_id:
+            return
+        with self._lock:
+            self._apply(self._today(), order_id, stock_code, side)
+
+    def trade_count(self, stock_code: str) -> int:
+        """당일 종목 체결 완료 주문 수"""
+        with self._lock:
+            return self._today().trade_counts.get(stock_code, 0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """당일 집계 요약"""
+        with self._lock:
+            ledger = self._today()
+            return {
+                "trade_date": ledger.trade_date,
+                "filled_orders": len(ledger.order_ids),
+                "buy_trades": ledger.buy_trades,
+                "sell_trades": ledger.sell_trades,
+            }
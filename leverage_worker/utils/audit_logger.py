@@ -58,13 +58,24 @@ class AuditLogger:
         log_dir.mkdir(parents=True, exist_ok=True)
         self._db_path = log_dir / "audit_trail.db"
         self._lock = threading.Lock()
+        # 쓰기 연결 재사용 (self._lock 보호, WAL + synchronous=NORMAL)
+        self._write_conn: Optional[sqlite3.Connection] = None
         self._init_db()
 
         logger.info(f"AuditLogger initialized: {self._db_path}")
 
+    def _connection(self) -> sqlite3.Connection:
+        """쓰기 연결 반환 (없으면 생성, self._lock 안에서 호출)"""
+        if self._write_conn is None:
+            conn = sqlite3.connect(str(self._db_path), check_same_thread=False, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._write_conn = conn
+        return self._write_conn
+
     def _init_db(self) -> None:
         """감사 로그 테이블 초기화"""
-        with sqlite3.connect(str(self._db_path)) as conn:
+        with self._lock, self._connection() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS audit_log (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -177,7 +188,7 @@ class AuditLogger:
 
         with self._lock:
             try:
-                with sqlite3.connect(str(self._db_path)) as conn:
+                with self._connection() as conn:
                     conn.execute("""
                         INSERT INTO audit_log (
                             timestamp, event_type, module, correlation_id, session_id,
@@ -253,7 +264,7 @@ class AuditLogger:
 
         with self._lock:
             try:
-                with sqlite3.connect(str(self._db_path)) as conn:
+                with self._connection() as conn:
                     conn.execute("""
                         INSERT INTO audit_log (
                             timestamp, event_type, module, correlation_id, session_id,
@@ -0,0 +1,429 @@
+"""
+지연 시간 계측 모듈
+
+틱 → 시그널 → 주문 경로의 단계별 지연 시간을 상시 기록
+- 단조 시계(time.perf_counter_ns) 기반 구간 측정
+- 단계 × 종목 × 전략별 HDR 방식(로그-선형 버킷) 히스토그램
+- 주기적으로 구조화 로그에 구간 요약 기록 (구간별 리셋)
+- TradingEngine.get_status()는 시작 후 누적 요약 조회 (주기 기록의 리셋과 무관)
+
+사용 예:
+    recorder = get_latency_recorder()
+    with recorder.span(STAGE_GENERATE_SIGNAL, stock_code, strategy_name):
+        signal = strategy.generate_signal(context)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from leverage_worker.utils.log_constants import LogEventType
+from leverage_worker.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# ==========================================
+# 단계 이름
+# ==========================================
+
+STAGE_WS_DECODE = "ws_decode"  # WS 수신 → 체결 프레임 분해 완료
+STAGE_TICK_LOCK_WAIT = "tick_lock_wait"  # 종목 샤드 큐 + 종목 잠금 대기
+STAGE_HISTORY_LOAD = "history_load"  # 분봉 히스토리/포지션 로드
+STAGE_GENERATE_SIGNAL = "generate_signal"  # strategy.generate_signal
+STAGE_PROCESS_SIGNAL = "process_signal"  # TradingEngine._process_signal
+STAGE_ORDER_QUEUE = "order_queue"  # 스캘핑 주문 intent 등록 → 디스패처 실행
+STAGE_BROKER_HTTP = "broker_http"  # 주문 REST 왕복 (place/modify/cancel)
+STAGE_TICK_TO_ORDER = "tick_to_order"  # WS 수신 → 주문 응답 (end-to-end)
+STAGE_FILL_NOTICE = "fill_notice"  # 주문 응답 → 체결통보 수신
+STAGE_SCHEDULE_LATENESS = "schedule_lateness"  # 스케줄 슬롯 시각 → 워커 등록 (라벨: 종목, 타이머 종류)
+
+# 라벨 없음 표기
+ANY = "*"
+
+
+class LatencyHistogram:
+    """
+    HDR 방식 지연 시간 히스토그램 (마이크로초)
+
+    2의 거듭제곱 구간마다 32개 선형 버킷 → 상대 오차 약 3%
+    고정 크기 배열에 카운트만 누적 (기록 O(1), 메모리 일정)
+    """
+
+    SUB_BITS = 5
+    SUB_COUNT = 1 << SUB_BITS
+    # 최대 추적값: 2^36us ≈ 19시간 (초과분은 마지막 버킷)
+    MAX_EXPONENT = 36 - SUB_BITS
+
+    def __init__(self):
+        self._counts: List[int] = [0] * (self.SUB_COUNT * (self.MAX_EXPONENT + 2))
+        self.count = 0
+        self.total_us = 0
+        self.min_us = 0
+        self.max_us = 0
+
+    @classmethod
+    def _index(cls, value: int) -> int:
+        if value < cls.SUB_COUNT:
+            return value
+        exponent = value.bit_length() - cls.SUB_BITS - 1
+        if exponent > cls.MAX_EXPONENT:
+            return cls.SUB_COUNT * (cls.MAX_EXPONENT + 2) - 1
+        return cls.SUB_COUNT * (exponent + 1) + (value >> exponent) - cls.SUB_COUNT
+
+    @classmethod
+    def _upper_bound(cls, index: int) -> int:
+        """버킷 상한값 (us)"""
+        if index < cls.SUB_COUNT:
+            return index
+        exponent = index // cls.SUB_COUNT - 1
+        mantissa = index % cls.SUB_COUNT + cls.SUB_COUNT
+        return ((mantissa + 1) << exponent) - 1
+
+    def record(self, value_us: int) -> None:
+        """지연 시간 기록 (us, 음수는 0)"""
+        if value_us < 0:
+            value_us = 0
+        self._counts[self._index(value_us)] += 1
+        if self.count == 0 or value_us < self.min_us:
+            self.min_us = value_us
+        if value_us > self.max_us:
+            self.max_us = value_us
+        self.count += 1
+        self.total_us += value_us
+
+    def percentile(self, q: float) -> int:
+        """백분위 값 (us, q: 0~100, 버킷 상한 기준 / 최대값 이하)"""
+        if self.count == 0:
+            return 0
+        target = max(1, int(self.count * q / 100 + 0.5))
+        seen = 0
+        for index, n in enumerate(self._counts):
+            if n:
+                seen += n
+                if seen >= target:
+                    return min(self._upper_bound(index), self.max_us)
+        return self.max_us
+
+    def copy(self) -> "LatencyHistogram":
+        histogram = LatencyHistogram()
+        histogram.merge(self)
+        return histogram
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """다른 히스토그램 누적"""
+        if other.count == 0:
+            return
+        for index, n in enumerate(other._counts):
+            if n:
+                self._counts[index] += n
+        self.min_us = other.min_us if self.count == 0 else min(self.min_us, other.min_us)
+        self.max_us = max(self.max_us, other.max_us)
+        self.count += other.count
+        self.total_us += other.total_us
+
+    def summary(self) -> Dict[str, float]:
+        """요약 (ms 단위)"""
+        if self.count == 0:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_us / self.count / 1000, 3),
+            "min_ms": round(self.min_us / 1000, 3),
+            "p50_ms": round(self.percentile(50) / 1000, 3),
+            "p90_ms": round(self.percentile(90) / 1000, 3),
+            "p99_ms": round(self.percentile(99) / 1000, 3),
+            "p999_ms": round(self.percentile(99.9) / 1000, 3),
+            "max_ms": round(self.max_us / 1000, 3),
+        }
+
+
+class LatencyRecorder:
+    """
+    단계별 지연 시간 기록기
+
+    - 키: (단계, 종목코드, 전략명) → LatencyHistogram
+    - context(): 현재 스레드의 종목/전략 라벨 + 기준 시각 (WS 수신 시각) 설정
+      → 하위 호출(broker 등)은 라벨 없이 span만 열어도 같은 키로 기록
+    - 주문번호별 응답 시각을 보관해 체결통보 지연 계산
+    - 스레드 안전
+    """
+
+    # 체결통보 대기 주문 최대 보관 수
+    MAX_PENDING_ORDERS = 1024
+
+    def __init__(self, enabled: bool = True):
+        self._enabled = enabled
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._histograms: Dict[Tuple[str, str, str], LatencyHistogram] = {}
+        # snapshot(reset=True)로 넘긴 이전 구간 누적 (cumulative 조회용)
+        self._retired: Dict[Tuple[str, str, str], LatencyHistogram] = {}
+        self._pending_orders: "OrderedDict[str, Tuple[int, str, str]]" = OrderedDict()
+        self._dump_thread: Optional[threading.Thread] = None
+        self._dump_stop = threading.Event()
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = value
+
+    # ==========================================
+    # 기록
+    # ==========================================
+
+    @staticmethod
+    def now() -> int:
+        """단조 시계 (ns)"""
+        return time.perf_counter_ns()
+
+    def _labels(
+        self, stock_code: Optional[str], strategy_name: Optional[str]
+    ) -> Tuple[str, str]:
+        ctx = getattr(self._local, "context", None)
+        if ctx is not None:
+            stock_code = stock_code or ctx[0]
+            strategy_name = strategy_name or ctx[1]
+        return stock_code or ANY, strategy_name or ANY
+
+    def record(
+        self,
+        stage: str,
+        elapsed_ns: int,
+        stock_code: Optional[str] = None,
+        strategy_name: Optional[str] = None,
+    ) -> None:
+        """구간 지연 시간 기록 (라벨 생략 시 현재 context 라벨)"""
+        if not self._enabled:
+            return
+        key = (stage, *self._labels(stock_code, strategy_name))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.record(elapsed_ns // 1000)
+
+    def record_since(
+        self,
+        stage: str,
+        start_ns: int,
+        stock_code: Optional[str] = None,
+        strategy_name: Optional[str] = None,
+    ) -> int:
+        """start_ns부터 현재까지 기록, 현재 시각(ns) 반환"""
+        end_ns = time.perf_counter_ns()
+        if start_ns:
+            self.record(stage, end_ns - start_ns, stock_code, strategy_name)
+        return end_ns
+
+    @contextmanager
+    def span(
+        self,
+        stage: str,
+        stock_code: Optional[str] = None,
+        strategy_name: Optional[str] = None,
+    ) -> Iterator[None]:
+        """구간 측정 컨텍스트 매니저 (예외 발생 시에도 기록)"""
+        if not self._enabled:
+            yield
+            return
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter_ns() - start_ns, stock_code, strategy_name)
+
+    @contextmanager
+    def context(
+        self,
+        stock_code: Optional[str] = None,
+        strategy_name: Optional[str] = None,
+        origin_ns: int = 0,
+    ) -> Iterator[None]:
+        """
+        현재 스레드 라벨/기준 시각 설정 (중첩 가능)
+
+        Args:
+            stock_code: 종목코드
+            strategy_name: 전략명
+            origin_ns: end-to-end 기준 시각 (WS 수신 시각, 0이면 상위 값 유지)
+        """
+        prev = getattr(self._local, "context", None)
+        if prev is not None:
+            stock_code = stock_code or prev[0]
+            strategy_name = strategy_name or prev[1]
+            origin_ns = origin_ns or prev[2]
+        self._local.context = (stock_code, strategy_name, origin_ns)
+        try:
+            yield
+        finally:
+            self._local.context = prev
+
+    def origin_ns(self) -> int:
+        """현재 context의 기준 시각 (없으면 0)"""
+        ctx = getattr(self._local, "context", None)
+        return ctx[2] if ctx is not None else 0
+
+    def on_order_sent(self, order_no: Optional[str], sent_ns: int) -> None:
+        """
+        주문 응답 수신 시 호출
+
+        - context 기준 시각이 있으면 tick_to_order 기록 (틱당 첫 주문만)
+        - 주문번호별 응답 시각 보관 (체결통보 지연 계산용)
+        """
+        if not self._enabled:
+            return
+        ctx = getattr(self._local, "context", None)
+        if ctx is not None and ctx[2]:
+            self.record(STAGE_TICK_TO_ORDER, sent_ns - ctx[2])
+            # 같은 틱의 후속 주문(정정 등)은 end-to-end에서 제외
+            self._local.context = (ctx[0], ctx[1], 0)
+        if not order_no:
+            return
+        stock_code, strategy_name = self._labels(None, None)
+        with self._lock:
+            self._pending_orders[order_no] = (sent_ns, stock_code, strategy_name)
+            while len(self._pending_orders) > self.MAX_PENDING_ORDERS:
+                self._pending_orders.popitem(last=False)
+
+    def on_fill_notice(self, order_no: str) -> None:
+        """체결통보 수신 시 호출 (주문별 첫 통보만 기록)"""
+        if not self._enabled:
+            return
+        now_ns = time.perf_counter_ns()
+        with self._lock:
+            pending = self._pending_orders.pop(order_no, None)
+        if pending is not None:
+            sent_ns, stock_code, strategy_name = pending
+            self.record(STAGE_FILL_NOTICE, now_ns - sent_ns, stock_code, strategy_name)
+
+    # ==========================================
+    # 조회 / 출력
+    # ==========================================
+
+    def snapshot(
+        self, reset: bool = False, cumulative: bool = False
+    ) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        단계별 요약
+
+        Args:
+            reset: 현재 구간 요약 후 새 구간 시작 (주기 기록용)
+            cumulative: 현재 구간 + 리셋된 이전 구간 누적 (reset() 이후 전체, 상태 조회용)
+
+        Returns:
+            {단계: {"종목코드/전략명": 요약, "*/*": 단계 전체 요약}}
+        """
+        with self._lock:
+            histograms = self._histograms
+            if reset:
+                self._histograms = {}
+                for key, histogram in histograms.items():
+                    retired = self._retired.get(key)
+                    if retired is None:
+                        self._retired[key] = histogram.copy()
+                    else:
+                        retired.merge(histogram)
+            if cumulative:
+                combined = {key: h.copy() for key, h in self._retired.items()}
+                if not reset:
+                    for key, histogram in histograms.items():
+                        if key in combined:
+                            combined[key].merge(histogram)
+                        else:
+                            combined[key] = histogram.copy()
+                histograms = combined
+            elif not reset:
+                histograms = dict(histograms)
+
+        totals: Dict[str, LatencyHistogram] = {}
+        result: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for (stage, stock_code, strategy_name), histogram in sorted(histograms.items()):
+            result.setdefault(stage, {})[f"{stock_code}/{strategy_name}"] = histogram.summary()
+            total = totals.get(stage)
+            if total is None:
+                total = totals[stage] = LatencyHistogram()
+            total.merge(histogram)
+        for stage, total in totals.items():
+            result[stage][f"{ANY}/{ANY}"] = total.summary()
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms = {}
+            self._retired = {}
+            self._pending_orders.clear()
+
+    def dump(self, reset: bool = True) -> int:
+        """
+        구조화 로그에 단계별 요약 기록
+
+        Returns:
+            기록한 항목 수
+        """
+        from leverage_worker.utils.structured_logger import get_structured_logger
+
+        snapshot = self.snapshot(reset=reset)
+        structured_logger = get_structured_logger()
+        written = 0
+        for stage, entries in snapshot.items():
+            for labels, summary in entries.items():
+                stock_code, strategy_name = labels.split("/", 1)
+                structured_logger.log(
+                    LogEventType.LATENCY_REPORT,
+                    "LatencyRecorder",
+                    f"{stage} latency",
+                    stock_code=None if stock_code == ANY else stock_code,
+                    strategy_name=None if strategy_name == ANY else strategy_name,
+                    duration_ms=summary.get("p50_ms"),
+                    stage=stage,
+                    **summary,
+                )
+                written += 1
+        return written
+
+    def start_periodic_dump(self, interval_seconds: float = 60.0) -> None:
+        """주기적 구조화 로그 기록 시작 (구간별 리셋)"""
+        if self._dump_thread is not None or interval_seconds <= 0:
+            return
+        self._dump_stop.clear()
+
+        def run() -> None:
+            while not self._dump_stop.wait(interval_seconds):
+                try:
+                    self.dump(reset=True)
+                except Exception as e:
+                    logger.error(f"[latency] dump failed: {e}")
+
+        self._dump_thread = threading.Thread(target=run, name="latency-dump", daemon=True)
+        self._dump_thread.start()
+        logger.info(f"[latency] periodic dump started (interval={interval_seconds}s)")
+
+    def stop_periodic_dump(self, flush: bool = True) -> None:
+        """주기적 기록 중지 (flush=True면 남은 구간 기록)"""
+        if self._dump_thread is None:
+            return
+        self._dump_stop.set()
+        self._dump_thread.join(timeout=5)
+        self._dump_thread = None
+        if flush:
+            self.dump(reset=True)
+
+
+# 싱글톤 인스턴스
+_latency_recorder: Optional[LatencyRecorder] = None
+_latency_lock = threading.Lock()
+
+
+def get_latency_recorder() -> LatencyRecorder:
+    """지연 시간 기록기 싱글톤 인스턴스 가져오기"""
+    global _latency_recorder
+    if _latency_recorder is None:
+        with _latency_lock:
+            if _latency_recorder is None:
+                _latency_recorder = LatencyRecorder()
+    return _latency_recorder
@@ -54,6 +54,7 @@ class LogEventType(str, Enum):
     HEALTH_CHECK = "HEALTH_CHECK"
     EMERGENCY_STOP = "EMERGENCY_STOP"
     RECOVERY_START = "RECOVERY_START"
+    LATENCY_REPORT = "LATENCY_REPORT"
 
 
 class LogCategory(str, Enum):
@@ -115,6 +116,7 @@ EVENT_CATEGORY_MAP = {
     LogEventType.HEALTH_CHECK: LogCategory.SYSTEM,
     LogEventType.EMERGENCY_STOP: LogCategory.SYSTEM,
     LogEventType.RECOVERY_START: LogCategory.SYSTEM,
+    LogEventType.LATENCY_REPORT: LogCategory.SYSTEM,
 }
 
 
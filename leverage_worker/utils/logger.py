@@ -25,7 +25,7 @@ class SlackHandler(logging.Handler):
     """
 
     # Slack 전송 제외할 로거 이름들
-    EXCLUDED_LOGGERS = {"slack_notifier", "urllib3", "requests"}
+    EXCLUDED_LOGGERS = {"slack_notifier", "slack_delivery", "urllib3", "requests"}
 
     def __init__(self, notifier: "SlackNotifier", level: int = logging.ERROR):
         super().__init__(level)
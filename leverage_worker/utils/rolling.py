@@ -0,0 +1,203 @@
+"""
+롤링 통계 유틸리티
+
+틱 윈도우 조회를 매번 복사/정렬하지 않도록 증분 갱신되는 자료구조 제공
+- MonotonicMinMax: 단조 deque 기반 윈도우 최소/최대 (원소당 상각 O(1))
+- OrderStatistic: 정렬 리스트 기반 순서 통계 (삽입/삭제 O(log n) 탐색, k번째 값 O(1))
+- TickDirectionCounter: 연속 틱 쌍의 상승/하락 카운터 (윈도우 앞 원소 제거 시 차감)
+- TimeWindow: 위 세 가지를 묶은 시간 윈도우 (키 = datetime 또는 단조 시계 float)
+
+스레드 안전하지 않음 (호출 측 잠금 사용)
+"""
+
+from bisect import bisect_left, insort
+from collections import deque
+from typing import Any, Deque, List, Optional, Tuple
+
+
+class MonotonicMinMax:
+    """
+    윈도우 최소/최대 (단조 deque)
+
+    push 순서(키 오름차순)로 입력하고, evict(cutoff)로 cutoff 미만 키를 만료시킨다.
+    """
+
+    __slots__ = ("_min", "_max")
+
+    def __init__(self):
+        self._min: Deque[Tuple[Any, Any]] = deque()  # 값 오름차순
+        self._max: Deque[Tuple[Any, Any]] = deque()  # 값 내림차순
+
+    def push(self, key: Any, value: Any) -> None:
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((key, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((key, value))
+
+    def evict(self, cutoff: Any) -> None:
+        """cutoff 미만 키 만료"""
+        while self._min and self._min[0][0] < cutoff:
+            self._min.popleft()
+        while self._max and self._max[0][0] < cutoff:
+            self._max.popleft()
+
+    def min(self) -> Optional[Any]:
+        return self._min[0][1] if self._min else None
+
+    def max(self) -> Optional[Any]:
+        return self._max[0][1] if self._max else None
+
+    def clear(self) -> None:
+        self._min.clear()
+        self._max.clear()
+
+
+class OrderStatistic:
+    """
+    순서 통계 (정렬 리스트)
+
+    bisect 탐색 O(log n) + 리스트 이동(memmove)으로 삽입/삭제, k번째 값은 인덱싱 O(1).
+    틱 윈도우 크기(수천 이하)에서는 힙 + 지연 삭제보다 빠르고 단순하다.
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self):
+        self._values: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def add(self, value: Any) -> None:
+        insort(self._values, value)
+
+    def remove(self, value: Any) -> None:
+        """값 1개 제거 (없으면 ValueError)"""
+        idx = bisect_left(self._values, value)
+        if idx == len(self._values) or self._values[idx] != value:
+            raise ValueError(f"value not in OrderStatistic: {value}")
+        del self._values[idx]
+
+    def kth(self, k: int) -> Any:
+        """k번째로 작은 값 (0부터, 음수는 뒤에서부터)"""
+        return self._values[k]
+
+    def clear(self) -> None:
+        self._values.clear()
+
+
+class TickDirectionCounter:
+    """
+    연속 틱 쌍 상승/하락 카운터
+
+    push(value)로 윈도우 뒤에 추가, pop_front(front, next_front)로 맨 앞 원소가 빠질 때
+    (front → next_front) 쌍의 기여분을 차감한다.
+    """
+
+    __slots__ = ("up", "down", "_last")
+
+    def __init__(self):
+        self.up = 0
+        self.down = 0
+        self._last: Optional[Any] = None
+
+    @property
+    def changes(self) -> int:
+        """가격이 바뀐 틱 쌍 수"""
+        return self.up + self.down
+
+    def push(self, value: Any) -> None:
+        if self._last is not None:
+            if value > self._last:
+                self.up += 1
+            elif value < self._last:
+                self.down += 1
+        self._last = value
+
+    def pop_front(self, front: Any, next_front: Optional[Any]) -> None:
+        if next_front is None:
+            self.clear()
+            return
+        if next_front > front:
+            self.up -= 1
+        elif next_front < front:
+            self.down -= 1
+
+    def clear(self) -> None:
+        self.up = 0
+        self.down = 0
+        self._last = None
+
+
+class TimeWindow:
+    """
+    시간 윈도우 롤링 통계
+
+    키가 [마지막 키 - span, 마지막 키] 범위인 값만 유지하며 최소/최대, 순서 통계,
+    상승/하락 틱 수를 증분 갱신한다. 키는 비감소로 입력해야 한다.
+
+    Example:
+        window = TimeWindow(timedelta(seconds=10))
+        window.add(tick.timestamp, tick.price)
+        low, high = window.min(), window.max()
+        p10 = window.kth(int(len(window) * 0.1))
+    """
+
+    __slots__ = ("span", "_items", "_minmax", "_order", "_direction")
+
+    def __init__(self, span: Any):
+        """
+        Args:
+            span: 윈도우 길이 (키가 datetime이면 timedelta, float이면 초)
+        """
+        self.span = span
+        self._items: Deque[Tuple[Any, Any]] = deque()
+        self._minmax = MonotonicMinMax()
+        self._order = OrderStatistic()
+        self._direction = TickDirectionCounter()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, key: Any, value: Any) -> None:
+        """값 추가 후 key - span 미만 항목 만료"""
+        self._items.append((key, value))
+        self._minmax.push(key, value)
+        self._order.add(value)
+        self._direction.push(value)
+        self.evict(key - self.span)
+
+    def evict(self, cutoff: Any) -> None:
+        """cutoff 미만 키 만료"""
+        items = self._items
+        while items and items[0][0] < cutoff:
+            _, value = items.popleft()
+            self._order.remove(value)
+            self._direction.pop_front(value, items[0][1] if items else None)
+        self._minmax.evict(cutoff)
+
+    def min(self) -> Optional[Any]:
+        return self._minmax.min()
+
+    def max(self) -> Optional[Any]:
+        return self._minmax.max()
+
+    def kth(self, k: int) -> Any:
+        """윈도우 내 k번째로 작은 값"""
+        return self._order.kth(k)
+
+    @property
+    def upticks(self) -> int:
+        return self._direction.up
+
+    @property
+    def downticks(self) -> int:
+        return self._direction.down
+
+    def clear(self) -> None:
+        self._items.clear()
+        self._minmax.clear()
+        self._order.clear()
+        self._direction.clear()
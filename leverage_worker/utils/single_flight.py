@@ -0,0 +1,34 @@
+"""
+single-flight 유틸리티
+
+같은 대상에 대한 동시 조회를 진행 중인 1건에 합류시켜 REST 호출 중복을 막는다
+- 리더(처음 등록한 스레드)가 조회 후 finish()로 결과 게시
+- 참여자는 wait()로 완료를 기다린 뒤 같은 결과 공유 (시간 초과 시 None)
+
+등록/해제(진행 중 Flight 맵 관리)는 호출 측 잠금에서 수행
+"""
+
+import threading
+from typing import Any, List, Optional
+
+
+class Flight:
+    """진행 중인 조회 1건 (참여자는 완료 대기 후 result 공유)"""
+
+    __slots__ = ("done", "result", "keys")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.keys: List[str] = []  # 배치 조회에 묶인 키 (멀티종목 시세 등)
+
+    def finish(self, result: Any) -> None:
+        """리더: 결과 게시 후 대기 중인 참여자 깨움"""
+        self.result = result
+        self.done.set()
+
+    def wait(self, timeout: Optional[float] = None) -> Any:
+        """참여자: 완료까지 대기 후 결과 (시간 초과 시 None)"""
+        if not self.done.wait(timeout):
+            return None
+        return self.result
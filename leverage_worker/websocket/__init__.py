@@ -1,20 +1,31 @@
 """
 WebSocket 실시간 데이터 패키지
 
-실시간 체결 데이터 수신 및 처리를 위한 모듈
+실시간 체결/호가 데이터 수신 및 처리를 위한 모듈
 """
 
+from leverage_worker.websocket.connection_manager import WSConnectionManager
 from leverage_worker.websocket.exit_monitor import ExitMonitor, ExitMonitorConfig
 from leverage_worker.websocket.order_notice_handler import OrderNoticeData, OrderNoticeHandler
+from leverage_worker.websocket.orderbook_handler import BookLevel, OrderBookData, OrderBookHandler
+from leverage_worker.websocket.tick_bus import TickBus
 from leverage_worker.websocket.tick_handler import TickData, TickHandler
 from leverage_worker.websocket.ws_client import RealtimeWSClient
+from leverage_worker.websocket.ws_pool import ConnectionHealth, WSConnectionPool
 
 __all__ = [
+    "BookLevel",
+    "ConnectionHealth",
     "ExitMonitor",
     "ExitMonitorConfig",
     "OrderNoticeData",
     "OrderNoticeHandler",
+    "OrderBookData",
+    "OrderBookHandler",
+    "TickBus",
     "TickData",
     "TickHandler",
     "RealtimeWSClient",
+    "WSConnectionManager",
+    "WSConnectionPool",
 ]
@@ -0,0 +1,602 @@
+"""
+WebSocket 연결 관리자
+
+프로세스 내 KIS WebSocket 연결을 1개로 통합
+- auth_ws / KISWebSocket 1회 생성, 수신 스레드 1개
+- 종목별 참조 카운트 구독 (첫 acquire 시 구독, 마지막 release 시 해제)
+- KIS 구독 한도(40건) 사전 체크, 초과분은 연결 풀(WSConnectionPool)로 분산
+  (hts_id 설정 시 체결통보 1건 몫은 등록 순서와 무관하게 항상 남겨둠)
+- 수신 데이터는 1회만 디코딩 → TickBus / 체결통보 리스너로 분배
+- 호가(H0STASP0) 구독도 같은 연결에서 참조 카운트로 관리 → 호가 리스너로 분배
+
+NOTE: kis_auth.open_map은 모듈 전역이므로 프로세스당 관리자 1개 사용을 권장
+(재연결 시 KISWebSocket이 open_map 기준으로 재구독)
+"""
+
+import asyncio
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+
+import pandas as pd
+import websockets
+
+from leverage_worker.utils.latency import STAGE_WS_DECODE, get_latency_recorder
+from leverage_worker.utils.logger import get_logger
+from leverage_worker.websocket.order_notice_handler import OrderNoticeData, OrderNoticeHandler
+from leverage_worker.websocket.orderbook_handler import BOOK_TR_ID, OrderBookData, OrderBookHandler
+from leverage_worker.websocket.tick_bus import TickBus
+from leverage_worker.websocket.tick_handler import TickHandler
+from leverage_worker.websocket.ws_pool import WSConnectionPool
+
+logger = get_logger(__name__)
+
+# kis_auth 모듈 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "examples_user"))
+
+import kis_auth as ka
+from domestic_stock.domestic_stock_functions_ws import asking_price_krx, ccnl_krx, ccnl_notice
+
+# 체결통보 TR (실전 / 모의)
+ORDER_NOTICE_TR_IDS = ("H0STCNI0", "H0STCNI9")
+TICK_TR_ID = "H0STCNT0"
+
+NoticeCallback = Callable[[OrderNoticeData], None]
+BookCallback = Callable[[OrderBookData], None]
+
+# 구독 종류 (pending/_send_live 구분)
+KIND_TICK = "tick"
+KIND_NOTICE = "notice"
+KIND_BOOK = "book"
+
+
+class WSConnectionManager:
+    """
+    공유 WebSocket 연결 관리자
+
+    RealtimeWSClient / ExitMonitor 등 구독자는 acquire/release로 종목을 요청하고
+    TickBus에서 틱을 받는다. 같은 종목을 여러 구독자가 요청해도 KIS 구독은 1건.
+    """
+
+    # KIS WebSocket 세션당 최대 구독 수
+    MAX_SUBSCRIPTIONS = 40
+
+    def __init__(
+        self,
+        is_paper: bool = True,
+        hts_id: str = "",
+        use_dataframe: bool = False,
+        bus: Optional[TickBus] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        max_subscriptions: int = MAX_SUBSCRIPTIONS,
+        pool: Optional[WSConnectionPool] = None,
+        name: str = "WebSocketThread",
+        book_reserve: int = 5,
+    ):
+        """
+        Args:
+            is_paper: 모의투자 여부 (True면 모의투자 WebSocket 사용)
+            hts_id: HTS ID (체결통보 구독용)
+            use_dataframe: True면 DataFrame 호환 모드 (프레임당 첫 레코드만 처리)
+            bus: 틱 분배 버스 (None이면 새로 생성)
+            on_error: 연결 오류 콜백
+            max_subscriptions: 구독 한도 (체결가 + 체결통보 합계, hts_id 설정 시 체결통보 1건 몫은
+                체결가/호가 구독에 쓰지 않음)
+            pool: 한도 초과 종목을 받을 연결 풀 (같은 bus로 발행해야 함)
+            book_reserve: 호가 구독 시 남겨둘 체결가 구독 여유분 (실시간 매도 모니터 등 동적 구독용)
+        """
+        self._is_paper = is_paper
+        self._hts_id = hts_id
+        self._use_dataframe = use_dataframe
+        self._bus = bus or TickBus()
+        self._on_error = on_error
+        self._max_subscriptions = max_subscriptions
+        self._pool = pool
+        self._name = name
+        self._book_reserve = book_reserve
+        self._tick_handler = TickHandler()
+        self._order_notice_handler = OrderNoticeHandler()
+        self._book_handler = OrderBookHandler()
+
+        # 구독 상태
+        self._lock = threading.RLock()
+        self._refcounts: Dict[str, int] = {}  # stock_code -> 구독자 수
+        self._pooled: Set[str] = set()  # 연결 풀로 구독된 종목
+        self._notice_listeners: Tuple[NoticeCallback, ...] = ()
+        self._book_refcounts: Dict[str, int] = {}  # stock_code -> 호가 구독자 수
+        self._book_listeners: Tuple[BookCallback, ...] = ()
+        # 연결 객체 확보 전 요청: (tr_type, key, 구독 종류)
+        self._pending: List[Tuple[str, str, str]] = []
+
+        # 연결 상태
+        self._thread: Optional[threading.Thread] = None
+        self._ws: Optional[websockets.ClientConnection] = None
+        self._kws: Optional[ka.KISWebSocket] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._running = False
+        self._last_ws_data_time: Optional[datetime] = None
+
+        # 카운터
+        self._frames = 0
+        self._ticks = 0
+        self._books = 0
+
+    @property
+    def bus(self) -> TickBus:
+        return self._bus
+
+    # ==========================================
+    # 연결
+    # ==========================================
+
+    def start(self) -> None:
+        """WebSocket 연결 시작 (이미 실행 중이면 무시)"""
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._sync_open_map()
+
+        self._thread = threading.Thread(target=self._run_websocket, name=self._name, daemon=True)
+        self._thread.start()
+        if self._pool is not None:
+            self._pool.start()
+        logger.info(
+            f"[WSManager] started ({len(self._refcounts)} stocks, "
+            f"notice={'on' if self._notice_enabled() else 'off'})"
+        )
+
+    def stop(self) -> None:
+        """WebSocket 연결 중지 - graceful close 포함"""
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+            self._pending.clear()
+
+        if self._pool is not None:
+            self._pool.stop()
+
+        # KISWebSocket 재연결 방지
+        if self._kws is not None:
+            self._kws.retry_count = self._kws.max_retries
+
+        # 수신 루프에서 close 실행
+        ws, loop = self._ws, self._loop
+        if ws is not None and loop is not None and not loop.is_closed():
+            try:
+                asyncio.run_coroutine_threadsafe(ws.close(), loop).result(timeout=2.0)
+                logger.info("[WSManager] WebSocket connection closed gracefully")
+            except Exception as e:
+                logger.warning(f"[WSManager] WebSocket close error (expected): {e}")
+
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=3.0)
+            if self._thread.is_alive():
+                logger.warning("[WSManager] WebSocket thread did not terminate in time")
+
+        self._thread = None
+        self._ws = None
+        self._kws = None
+        self._loop = None
+        self._last_ws_data_time = None
+        logger.info("[WSManager] stopped")
+
+    def _run_websocket(self) -> None:
+        """WebSocket 실행 (별도 스레드에서 호출)"""
+        try:
+            # WebSocket 인증 (모드에 맞는 키 사용)
+            ws_svr = "vps" if self._is_paper else "prod"
+            ka.auth_ws(svr=ws_svr)
+            logger.info(f"[WSManager] WebSocket authenticated (svr={ws_svr})")
+
+            self._kws = ka.KISWebSocket(api_url="/tryitout", max_retries=10)
+
+            # WebSocket 시작 (블로킹) - 구독 응답도 받아 연결 객체/루프 확보
+            self._kws.start(
+                on_result=self._on_ws_result,
+                result_all_data=True,
+                raw_data=not self._use_dataframe,
+            )
+
+        except Exception as e:
+            logger.error(f"[WSManager] WebSocket error: {e}")
+            if self._on_error:
+                self._on_error(e)
+        finally:
+            self._ws = None
+            self._loop = None
+
+    # ==========================================
+    # 구독 (참조 카운트)
+    # ==========================================
+
+    def acquire(self, stock_code: str) -> bool:
+        """
+        종목 체결가 구독 요청
+
+        Returns:
+            True: 구독됨 (기존 구독 공유 포함) / False: 구독 한도 초과
+        """
+        with self._lock:
+            count = self._refcounts.get(stock_code, 0)
+            if count:
+                self._refcounts[stock_code] = count + 1
+                return True
+
+            if self._subscription_count() >= self._direct_limit():
+                if self._pool is not None and self._pool.add(stock_code):
+                    self._refcounts[stock_code] = 1
+                    self._pooled.add(stock_code)
+                    logger.info(f"[WSManager] Subscribed to {stock_code} (pool)")
+                    return True
+                logger.warning(
+                    f"[WSManager] {stock_code} 구독 불가 - 한도 "
+                    f"{self._direct_limit()}건 도달"
+                )
+                return False
+
+            self._refcounts[stock_code] = 1
+            self._sync_open_map()
+            self._send_live("1", stock_code)
+            logger.info(f"[WSManager] Subscribed to {stock_code}")
+            return True
+
+    def release(self, stock_code: str) -> None:
+        """종목 체결가 구독 반납 (마지막 구독자면 KIS 구독 해제)"""
+        with self._lock:
+            count = self._refcounts.get(stock_code, 0)
+            if count == 0:
+                return
+            if count > 1:
+                self._refcounts[stock_code] = count - 1
+                return
+
+            del self._refcounts[stock_code]
+            if stock_code in self._pooled:
+                self._pooled.discard(stock_code)
+                self._pool.remove(stock_code)
+                logger.info(f"[WSManager] Unsubscribed from {stock_code} (pool)")
+                return
+            self._sync_open_map()
+            self._send_live("2", stock_code)
+            logger.info(f"[WSManager] Unsubscribed from {stock_code}")
+
+    def add_order_notice_listener(self, callback: NoticeCallback) -> bool:
+        """
+        체결통보 리스너 등록 (첫 리스너 등록 시 체결통보 구독)
+
+        Returns:
+            True: 체결통보 구독 가능 / False: hts_id 미설정 또는 한도 초과
+        """
+        if not self._hts_id:
+            logger.warning("[WSManager] hts_id 미설정 - 체결통보 구독 불가")
+            return False
+
+        with self._lock:
+            if callback in self._notice_listeners:
+                return True
+            first = not self._notice_listeners
+            if first and self._subscription_count() >= self._max_subscriptions:
+                logger.error("[WSManager] 체결통보 구독 불가 - 구독 한도 도달")
+                return False
+
+            self._notice_listeners = self._notice_listeners + (callback,)
+            if first:
+                self._sync_open_map()
+                self._send_live("1", self._hts_id, KIND_NOTICE)
+                logger.info(
+                    f"[WSManager] Subscribed to order notice "
+                    f"(hts_id={self._hts_id}, env={self._env_dv})"
+                )
+            return True
+
+    def remove_order_notice_listener(self, callback: NoticeCallback) -> None:
+        """체결통보 리스너 해제 (마지막 리스너면 구독 해제)"""
+        with self._lock:
+            if callback not in self._notice_listeners:
+                return
+            self._notice_listeners = tuple(
+                cb for cb in self._notice_listeners if cb != callback
+            )
+            if not self._notice_listeners:
+                self._sync_open_map()
+                self._send_live("2", self._hts_id, KIND_NOTICE)
+
+    def acquire_book(self, stock_code: str) -> bool:
+        """
+        종목 호가 구독 요청 (연결 풀로 분산하지 않음)
+
+        Returns:
+            True: 구독됨 (기존 구독 공유 포함) / False: 구독 한도 초과 (REST 호가 사용)
+        """
+        with self._lock:
+            count = self._book_refcounts.get(stock_code, 0)
+            if count:
+                self._book_refcounts[stock_code] = count + 1
+                return True
+
+            if self._subscription_count() >= self._direct_limit() - self._book_reserve:
+                logger.warning(
+                    f"[WSManager] {stock_code} 호가 구독 불가 - 한도 "
+                    f"{self._max_subscriptions}건 (여유분 {self._book_reserve}건)"
+                )
+                return False
+
+            self._book_refcounts[stock_code] = 1
+            self._sync_open_map()
+            self._send_live("1", stock_code, KIND_BOOK)
+            logger.info(f"[WSManager] Subscribed to {stock_code} order book")
+            return True
+
+    def release_book(self, stock_code: str) -> None:
+        """종목 호가 구독 반납 (마지막 구독자면 KIS 구독 해제)"""
+        with self._lock:
+            count = self._book_refcounts.get(stock_code, 0)
+            if count == 0:
+                return
+            if count > 1:
+                self._book_refcounts[stock_code] = count - 1
+                return
+
+            del self._book_refcounts[stock_code]
+            self._sync_open_map()
+            self._send_live("2", stock_code, KIND_BOOK)
+            logger.info(f"[WSManager] Unsubscribed from {stock_code} order book")
+
+    def add_book_listener(self, callback: BookCallback) -> None:
+        """호가 리스너 등록 (모든 구독 종목 호가 수신)"""
+        with self._lock:
+            if callback not in self._book_listeners:
+                self._book_listeners = self._book_listeners + (callback,)
+
+    def remove_book_listener(self, callback: BookCallback) -> None:
+        """호가 리스너 해제"""
+        with self._lock:
+            self._book_listeners = tuple(cb for cb in self._book_listeners if cb != callback)
+
+    def refcount(self, stock_code: str) -> int:
+        """종목 구독자 수"""
+        with self._lock:
+            return self._refcounts.get(stock_code, 0)
+
+    @property
+    def subscribed_stocks(self) -> List[str]:
+        """KIS에 구독된 종목 목록"""
+        with self._lock:
+            return list(self._refcounts)
+
+    @property
+    def subscribed_books(self) -> List[str]:
+        """KIS에 호가 구독된 종목 목록"""
+        with self._lock:
+            return list(self._book_refcounts)
+
+    def _subscription_count(self) -> int:
+        """이 연결의 구독 수 (풀 구독 제외, 호가 포함)"""
+        direct = len(self._refcounts) - len(self._pooled) + len(self._book_refcounts)
+        return direct + (1 if self._notice_enabled() else 0)
+
+    def _notice_enabled(self) -> bool:
+        return bool(self._hts_id and self._notice_listeners)
+
+    def _direct_limit(self) -> int:
+        """체결가/호가 구독 한도 (체결통보 구독 전이면 1건을 체결통보 몫으로 남겨둠)"""
+        if self._hts_id and not self._notice_listeners:
+            return self._max_subscriptions - 1
+        return self._max_subscriptions
+
+    @property
+    def _env_dv(self) -> str:
+        return "demo" if self._is_paper else "real"
+
+    def _sync_open_map(self) -> None:
+        """
+        재연결용 구독 목록(kis_auth.open_map) 갱신 (잠금 상태에서 호출)
+
+        수신 스레드가 재연결 중 순회할 수 있으므로 키 삭제 없이 항목만 교체
+        """
+        ka.open_map[ccnl_krx.__name__] = {
+            "func": ccnl_krx,
+            "items": [code for code in self._refcounts if code not in self._pooled],
+            "kwargs": None,
+        }
+        ka.open_map[ccnl_notice.__name__] = {
+            "func": ccnl_notice,
+            "items": [self._hts_id] if self._notice_enabled() else [],
+            "kwargs": {"env_dv": self._env_dv},
+        }
+        ka.open_map[asking_price_krx.__name__] = {
+            "func": asking_price_krx,
+            "items": list(self._book_refcounts),
+            "kwargs": {"env_dv": self._env_dv},
+        }
+
+    def _send_live(self, tr_type: str, key: str, kind: str = KIND_TICK) -> None:
+        """
+        연결 중인 세션에 구독/해제 메시지 전송 (잠금 상태에서 호출)
+
+        연결 객체 확보 전이면 보류 후 첫 수신 시 전송
+        (새 연결은 open_map 기준으로 구독되므로 미연결 상태에서는 생략)
+        """
+        if not self._running:
+            return
+        if self._ws is None or self._loop is None:
+            self._pending.append((tr_type, key, kind))
+            return
+
+        if kind == KIND_NOTICE:
+            request, kwargs = ccnl_notice, {"env_dv": self._env_dv}
+        elif kind == KIND_BOOK:
+            request, kwargs = asking_price_krx, {"env_dv": self._env_dv}
+        else:
+            request, kwargs = ccnl_krx, None
+        future = asyncio.run_coroutine_threadsafe(
+            ka.KISWebSocket.send(self._ws, request, tr_type, key, kwargs), self._loop
+        )
+        future.add_done_callback(lambda f: self._on_send_done(f, tr_type, key))
+
+    @staticmethod
+    def _on_send_done(future, tr_type: str, key: str) -> None:
+        error = future.exception()
+        if error is not None:
+            action = "subscribe" if tr_type == "1" else "unsubscribe"
+            logger.warning(f"[WSManager] {action} {key} failed: {error}")
+
+    def _attach(self, ws: websockets.ClientConnection) -> None:
+        """수신 콜백에서 연결 객체/루프 확보 (재연결 시 갱신)"""
+        with self._lock:
+            if ws is self._ws:
+                return
+            reconnected = self._ws is not None
+            self._ws = ws
+            self._loop = asyncio.get_running_loop()
+            pending, self._pending = self._pending, []
+            if reconnected:
+                return  # 새 연결은 open_map 기준으로 구독 완료
+            for tr_type, key, kind in pending:
+                self._send_live(tr_type, key, kind)
+
+    # ==========================================
+    # 수신
+    # ==========================================
+
+    def _on_ws_result(
+        self,
+        ws: websockets.ClientConnection,
+        tr_id: str,
+        data: Union[str, pd.DataFrame],
+        data_info: dict,
+    ) -> None:
+        """
+        WebSocket 수신 콜백 (수신 루프 스레드)
+
+        data는 기본 모드에서 "^" 구분 원문, 호환 모드에서 DataFrame.
+        시스템 응답(구독 확인/PINGPONG)은 빈 DataFrame으로 전달됨.
+        """
+        if not self._running:
+            return
+
+        self._attach(ws)
+        if isinstance(data, pd.DataFrame) and data.empty:
+            return  # 시스템 응답
+
+        # 수신 시각 (단조 시계, 틱 → 주문 지연 계측 기준)
+        recorder = get_latency_recorder()
+        received_ns = recorder.now()
+        self._last_ws_data_time = datetime.now()
+        self._frames += 1
+
+        if tr_id in ORDER_NOTICE_TR_IDS:
+            self._dispatch_notices(data, data_info)
+            return
+
+        if tr_id == BOOK_TR_ID:
+            self._dispatch_books(data, data_info, received_ns)
+            return
+
+        if tr_id != TICK_TR_ID:
+            return
+
+        # 체결 데이터 파싱 (다건 프레임은 수신 순서대로 전달)
+        if self._use_dataframe:
+            tick_data = self._tick_handler.parse(data, tr_id)
+            ticks = [tick_data] if tick_data else []
+        else:
+            ticks = self._tick_handler.parse_frame(data, data_info["columns"])
+
+        if ticks:
+            recorder.record_since(STAGE_WS_DECODE, received_ns, ticks[0].stock_code)
+
+        for tick_data in ticks:
+            tick_data.received_ns = received_ns
+            self._ticks += 1
+            logger.debug(
+                f"[WS] {tick_data.stock_code} 체결: {tick_data.price:,}원 "
+                f"({tick_data.change_rate:+.2f}%)"
+            )
+            self._bus.publish(tick_data)
+
+    def _dispatch_notices(self, data: Union[str, pd.DataFrame], data_info: dict) -> None:
+        """체결통보 파싱 후 리스너 호출"""
+        listeners = self._notice_listeners
+        if not listeners:
+            return
+
+        if self._use_dataframe:
+            notice = self._order_notice_handler.parse(data)
+            notices = [notice] if notice else []
+        else:
+            notices = self._order_notice_handler.parse_frame(data, data_info["columns"])
+
+        for notice in notices:
+            logger.info(
+                f"[WS] 체결통보: {notice.stock_code} "
+                f"{'매도' if notice.side == '01' else '매수'} "
+                f"x{notice.filled_qty} @ {notice.filled_price:,}원"
+            )
+            for callback in listeners:
+                try:
+                    callback(notice)
+                except Exception as e:
+                    logger.error(f"[WSManager] order notice listener error: {e}", exc_info=True)
+
+    def _dispatch_books(
+        self, data: Union[str, pd.DataFrame], data_info: dict, received_ns: int
+    ) -> None:
+        """호가 파싱 후 리스너 호출"""
+        listeners = self._book_listeners
+        if not listeners:
+            return
+
+        if self._use_dataframe:
+            book = self._book_handler.parse(data, BOOK_TR_ID)
+            books = [book] if book else []
+        else:
+            books = self._book_handler.parse_frame(data, data_info["columns"])
+
+        for book in books:
+            book.received_ns = received_ns
+            self._books += 1
+            for callback in listeners:
+                try:
+                    callback(book)
+                except Exception as e:
+                    logger.error(f"[WSManager] order book listener error: {e}", exc_info=True)
+
+    # ==========================================
+    # 상태
+    # ==========================================
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def is_connected(self) -> bool:
+        """수신 스레드 동작 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def is_order_notice_active(self) -> bool:
+        """WebSocket 체결통보 수신 가능 여부 (10초 이내 데이터 수신 = 정상)"""
+        if not self._running or not self._notice_enabled():
+            return False
+        if self._last_ws_data_time is None:
+            return False
+        return (datetime.now() - self._last_ws_data_time).total_seconds() < 10
+
+    def stats(self) -> Dict[str, int]:
+        """구독/수신 카운터"""
+        with self._lock:
+            return {
+                "subscriptions": self._subscription_count(),
+                "stocks": len(self._refcounts),
+                "pooled": len(self._pooled),
+                "book_stocks": len(self._book_refcounts),
+                "frames": self._frames,
+                "ticks": self._ticks,
+                "books": self._books,
+            }
@@ -5,29 +5,18 @@
 기존 60초 폴링의 백업으로도 사용
 """
 
-import asyncio
-import sys
 import threading
 from dataclasses import dataclass
-from datetime import datetime, time as dt_time
-from pathlib import Path
+from datetime import datetime
 from typing import Callable, Dict, List, Optional, Set
 
-import pandas as pd
-import websockets
-
 from leverage_worker.utils.logger import get_logger
 from leverage_worker.utils.time_utils import is_trading_hours
-from leverage_worker.websocket.tick_handler import TickData, TickHandler
+from leverage_worker.websocket.connection_manager import WSConnectionManager
+from leverage_worker.websocket.tick_handler import TickData
 
 logger = get_logger(__name__)
 
-# kis_auth 모듈 경로 추가
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "examples_user"))
-
-import kis_auth as ka
-from domestic_stock.domestic_stock_functions_ws import ccnl_krx
-
 
 @dataclass
 class ExitMonitorConfig:
@@ -48,9 +37,9 @@ class ExitMonitor:
     """
     실시간 매도 모니터링
 
-    포지션 보유 시 WebSocket 구독 시작
+    포지션 보유 시 공유 WebSocket에 종목 구독 (참조 카운트)
     실시간 가격으로 TP/SL/Timeout 체크
-    매도 체결 후 구독 해제
+    매도 체결 후 구독 반납
     """
 
     # WebSocket 운영 시간 (KRX 정규장 시간)
@@ -61,28 +50,33 @@ class ExitMonitor:
         self,
         on_exit_signal: Callable[[str, str, int, str, bool], None],
         is_paper: bool = True,
+        use_dataframe: bool = False,
+        manager: Optional[WSConnectionManager] = None,
     ):
         """
         Args:
             on_exit_signal: 매도 시그널 콜백
                 (stock_code, strategy_name, quantity, reason, is_take_profit)
             is_paper: 모의투자 여부 (True면 모의투자 WebSocket 사용)
+            use_dataframe: True면 DataFrame 호환 모드 (프레임당 첫 레코드만 처리)
+            manager: 공유 연결 관리자 (None이면 전용 관리자 생성)
         """
         self._on_exit_signal = on_exit_signal
-        self._is_paper = is_paper
-        self._tick_handler = TickHandler()
+
+        self._owns_manager = manager is None
+        self._manager = manager or WSConnectionManager(
+            is_paper=is_paper,
+            use_dataframe=use_dataframe,
+            name="ExitMonitorWSThread",
+        )
 
         # 모니터링 상태
         self._monitored: Dict[str, ExitMonitorConfig] = {}  # stock_code -> config
         self._exit_in_progress: Set[str] = set()  # 매도 진행 중인 종목
         self._lock = threading.RLock()
 
-        # WebSocket 상태
-        self._ws_thread: Optional[threading.Thread] = None
-        self._ws: Optional[websockets.ClientConnection] = None
-        self._kws: Optional[ka.KISWebSocket] = None
+        # 구독 상태 (이 모니터가 보유한 관리자 참조)
         self._running = False
-        self._ws_stop_event = threading.Event()  # WebSocket 종료 시그널
         self._subscribed_stocks: Set[str] = set()
 
     def start(self) -> None:
@@ -92,55 +86,21 @@ class ExitMonitor:
             return
 
         self._running = True
-        self._ws_stop_event.clear()  # 종료 시그널 초기화
         logger.info("[ExitMonitor] Started (waiting for positions)")
 
     def stop(self) -> None:
-        """모니터링 중지 - WebSocket graceful close 포함"""
+        """모니터링 중지 - 구독 반납 (전용 관리자면 연결 종료)"""
         self._running = False
-        self._ws_stop_event.set()  # 종료 시그널 설정
-
-        # KISWebSocket 재연결 방지 및 종료
-        if self._kws is not None:
-            try:
-                self._kws.retry_count = self._kws.max_retries
-                # KISWebSocket 내부 종료 플래그 설정
-                self._kws._running = False
-            except Exception:
-                pass
-
-        # WebSocket graceful close
-        if self._ws is not None:
-            try:
-                # 새 이벤트 루프에서 close 실행
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(asyncio.wait_for(self._ws.close(), timeout=2.0))
-                    logger.info("[ExitMonitor] WebSocket connection closed gracefully")
-                finally:
-                    loop.close()
-            except Exception as e:
-                logger.debug(f"[ExitMonitor] WebSocket close: {e}")
-            finally:
-                self._ws = None
-
-        self._kws = None
-
-        # 스레드 종료 대기
-        if self._ws_thread and self._ws_thread.is_alive():
-            self._ws_thread.join(timeout=3.0)
-            if self._ws_thread.is_alive():
-                logger.warning("[ExitMonitor] WebSocket thread did not terminate in time")
-        self._ws_thread = None
 
         # 상태 초기화
         with self._lock:
+            for stock_code in list(self._subscribed_stocks):
+                self._unsubscribe_stock(stock_code)
             self._monitored.clear()
             self._exit_in_progress.clear()
-            self._subscribed_stocks.clear()
 
-        self._ws_stop_event.clear()  # 다음 시작을 위해 리셋
+        if self._owns_manager:
+            self._manager.stop()
         logger.info("[ExitMonitor] Stopped")
 
     def add_position(self, config: ExitMonitorConfig) -> None:
@@ -181,12 +141,8 @@ class ExitMonitor:
 
             self._monitored[stock_code] = config
 
-            # WebSocket이 실행 중이 아니면 시작
-            if not self._ws_thread or not self._ws_thread.is_alive():
-                self._start_websocket([stock_code])
-            else:
-                # 실행 중이면 동적 구독 추가
-                self._subscribe_stock(stock_code)
+            # 공유 WebSocket 구독 (연결 없으면 시작)
+            self._subscribe_stock(stock_code)
 
             # TP 달성 가격 계산
             tp_base = config.signal_price if config.signal_price > 0 else config.avg_price
@@ -247,60 +203,12 @@ class ExitMonitor:
     @property
     def is_ws_connected(self) -> bool:
         """WebSocket 연결 여부"""
-        return self._ws_thread is not None and self._ws_thread.is_alive()
+        return self._manager.is_connected
 
     def _is_ws_market_hours(self) -> bool:
         """WebSocket 운영 시간인지 확인 (08:59~15:30)"""
         return is_trading_hours(datetime.now(), self.WS_MARKET_OPEN, self.WS_MARKET_CLOSE)
 
-    def _start_websocket(self, stock_codes: List[str]) -> None:
-        """WebSocket 연결 시작 (별도 스레드)"""
-        # 시장 시간 체크
-        if not self._is_ws_market_hours():
-            logger.info(
-                f"[ExitMonitor] WebSocket skipped - outside market hours "
-                f"({self.WS_MARKET_OPEN}~{self.WS_MARKET_CLOSE})"
-            )
-            return
-
-        self._ws_thread = threading.Thread(
-            target=self._run_websocket,
-            args=(stock_codes,),
-            name="ExitMonitorWSThread",
-            daemon=True,
-        )
-        self._ws_thread.start()
-        logger.info(f"[ExitMonitor] WebSocket started for {stock_codes}")
-
-    def _run_websocket(self, initial_stocks: List[str]) -> None:
-        """WebSocket 실행 (별도 스레드)"""
-        try:
-            # WebSocket 인증 (모드에 맞는 키 사용)
-            ws_svr = "vps" if self._is_paper else "prod"
-            ka.auth_ws(svr=ws_svr)
-            logger.info(f"[ExitMonitor] WebSocket authenticated (svr={ws_svr})")
-
-            # WebSocket 객체 생성
-            self._kws = ka.KISWebSocket(api_url="/tryitout", max_retries=10)
-
-            # 초기 종목 구독
-            for stock_code in initial_stocks:
-                ka.KISWebSocket.subscribe(
-                    request=ccnl_krx,
-                    data=[stock_code],
-                )
-                self._subscribed_stocks.add(stock_code)
-                logger.info(f"[ExitMonitor] Subscribed to {stock_code}")
-
-            # WebSocket 시작 (블로킹) - ws 객체 저장을 위한 커스텀 래퍼 사용
-            self._kws.start(
-                on_result=self._on_ws_result,
-                result_all_data=False,
-            )
-
-        except Exception as e:
-            logger.error(f"[ExitMonitor] WebSocket error: {e}")
-
     def _subscribe_stock(self, stock_code: str) -> None:
         """종목 구독 추가 (동적)"""
         if stock_code in self._subscribed_stocks:
@@ -309,62 +217,35 @@ class ExitMonitor:
         # 시장 시간 체크
         if not self._is_ws_market_hours():
             logger.debug(
-                f"[ExitMonitor] Subscribe skipped for {stock_code} - outside market hours"
+                f"[ExitMonitor] Subscribe skipped for {stock_code} - outside market hours "
+                f"({self.WS_MARKET_OPEN}~{self.WS_MARKET_CLOSE})"
             )
             return
 
-        # NOTE: KIS WebSocket의 동적 구독은 연결 후 send_multiple 호출 필요
-        # 현재 구조에서는 새 연결이 필요할 수 있음
-        # 일단 subscribe 등록 후 재연결 방식 사용
-        if self._kws and self._ws:
-            try:
-                # 동적 구독 시도 (연결 중일 때)
-                ka.KISWebSocket.subscribe(
-                    request=ccnl_krx,
-                    data=[stock_code],
-                )
-                self._subscribed_stocks.add(stock_code)
-                logger.info(f"[ExitMonitor] Dynamically subscribed to {stock_code}")
-            except Exception as e:
-                logger.warning(f"[ExitMonitor] Dynamic subscribe failed: {e}")
-        else:
-            # WebSocket이 없으면 새로 시작
-            self._start_websocket([stock_code])
+        if not self._manager.acquire(stock_code):
+            logger.warning(f"[ExitMonitor] {stock_code} 구독 실패 - 폴링으로 모니터링")
+            return
+
+        self._manager.bus.subscribe(self._handle_tick, stock_code)
+        self._subscribed_stocks.add(stock_code)
+        self._manager.start()
+        logger.info(f"[ExitMonitor] Subscribed to {stock_code}")
 
     def _unsubscribe_stock(self, stock_code: str) -> None:
-        """종목 구독 해제"""
+        """종목 구독 해제 (다른 구독자가 없으면 KIS 구독도 해제)"""
         if stock_code not in self._subscribed_stocks:
             return
 
         self._subscribed_stocks.discard(stock_code)
+        self._manager.bus.unsubscribe(self._handle_tick, stock_code)
+        self._manager.release(stock_code)
         logger.info(f"[ExitMonitor] Unsubscribed from {stock_code}")
 
-        # 모니터링 종목이 없으면 WebSocket 유지 (재사용 위해)
-
-    def _on_ws_result(
-        self,
-        ws: websockets.ClientConnection,
-        tr_id: str,
-        df: pd.DataFrame,
-        data_info: dict,
-    ) -> None:
-        """WebSocket 데이터 수신 콜백"""
+    def _handle_tick(self, tick_data: TickData) -> None:
+        """체결 1건 처리 (TP/SL/Timeout 체크) - TickBus 구독 콜백"""
         if not self._running:
             return
 
-        # WebSocket 연결 객체 저장 (동적 구독/해제용)
-        if self._ws is None:
-            self._ws = ws
-
-        # H0STCNT0 (체결가)만 처리
-        if tr_id != "H0STCNT0":
-            return
-
-        # 체결 데이터 파싱
-        tick_data = self._tick_handler.parse(df, tr_id)
-        if not tick_data:
-            return
-
         # 모니터링 중인 종목인지 확인
         stock_code = tick_data.stock_code
 
@@ -3,10 +3,12 @@
 
 WebSocket을 통해 수신한 체결통보(H0STCNI0/H0STCNI9) 데이터를 파싱하여
 OrderNoticeData 객체로 변환
+- parse_frame(): "^" 구분 원문을 직접 분해 (기본, 다건 프레임 지원)
+- parse(): DataFrame 호환 모드 (첫 행만 처리)
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, List, Optional, Sequence
 
 import pandas as pd
 
@@ -15,7 +17,7 @@ from leverage_worker.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderNoticeData:
     """실시간 체결통보 데이터"""
 
@@ -47,9 +49,84 @@ class OrderNoticeHandler:
     COL_ORDER_QTY = "ODER_QTY"  # 주문수량
     COL_FILL_TIME = "STCK_CNTG_HOUR"  # 체결시간
 
+    def __init__(self):
+        # parse_frame용 컬럼 인덱스 캐시 (data_map 컬럼 리스트가 바뀔 때만 재계산)
+        self._frame_columns: Optional[Sequence[str]] = None
+        self._frame_index: Dict[str, int] = {}
+
+    def _get_frame_index(self, columns: Sequence[str]) -> Dict[str, int]:
+        """컬럼명 → 필드 인덱스 (컬럼 리스트 단위로 1회 계산)"""
+        if columns is not self._frame_columns:
+            index = {name: i for i, name in enumerate(columns)}
+            self._frame_index = {
+                col: index[col]
+                for col in (
+                    self.COL_STOCK_CODE, self.COL_ORDER_NO, self.COL_FILL_YN,
+                    self.COL_FILL_QTY, self.COL_FILL_PRICE, self.COL_SIDE,
+                    self.COL_ORDER_QTY, self.COL_FILL_TIME,
+                )
+            }
+            self._frame_columns = columns
+        return self._frame_index
+
+    def parse_frame(self, payload: str, columns: Sequence[str]) -> List[OrderNoticeData]:
+        """
+        WebSocket 원문에서 체결통보 파싱 (DataFrame 생성 없음)
+
+        Args:
+            payload: "^" 구분 원문 (H0STCNI0/H0STCNI9, 복호화 완료)
+            columns: TR 컬럼 목록 (data_map["columns"])
+
+        Returns:
+            체결(CNTG_YN == "2") 통보 리스트 (접수/취소/거부 제외)
+        """
+        notices: List[OrderNoticeData] = []
+        num_columns = len(columns)
+        if num_columns == 0 or not payload:
+            return notices
+
+        try:
+            idx = self._get_frame_index(columns)
+        except KeyError as e:
+            logger.error(f"Order notice frame column missing: {e}")
+            return notices
+
+        fields = payload.split("^")
+        count, remainder = divmod(len(fields), num_columns)
+        if remainder:
+            logger.warning(
+                f"Order notice frame field count mismatch: {len(fields)} fields / "
+                f"{num_columns} columns → {count} records, trailing {remainder} fields dropped"
+            )
+
+        for base in range(0, count * num_columns, num_columns):
+            try:
+                cntg_yn = fields[base + idx[self.COL_FILL_YN]].strip()
+                if cntg_yn != "2":
+                    logger.debug(
+                        f"체결통보 접수/취소/거부 (CNTG_YN={cntg_yn}): "
+                        f"{fields[base + idx[self.COL_STOCK_CODE]]}"
+                    )
+                    continue
+
+                notices.append(OrderNoticeData(
+                    stock_code=fields[base + idx[self.COL_STOCK_CODE]].strip(),
+                    order_no=fields[base + idx[self.COL_ORDER_NO]].strip(),
+                    is_filled=True,
+                    filled_qty=int(fields[base + idx[self.COL_FILL_QTY]]),
+                    filled_price=int(fields[base + idx[self.COL_FILL_PRICE]]),
+                    side=fields[base + idx[self.COL_SIDE]].strip(),
+                    order_qty=int(fields[base + idx[self.COL_ORDER_QTY]]),
+                    fill_time=fields[base + idx[self.COL_FILL_TIME]].strip(),
+                ))
+            except (ValueError, IndexError) as e:
+                logger.error(f"Order notice parse error: {e}")
+
+        return notices
+
     def parse(self, df: pd.DataFrame) -> Optional[OrderNoticeData]:
         """
-        DataFrame에서 체결통보 데이터 파싱
+        DataFrame에서 체결통보 데이터 파싱 (호환 모드, 첫 행만 처리)
 
         Args:
             df: WebSocket에서 수신한 DataFrame (한 행)
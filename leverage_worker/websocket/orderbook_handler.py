@@ -0,0 +1,175 @@
+"""
+실시간 호가 데이터 파싱 모듈
+
+WebSocket으로 수신한 H0STASP0 (국내주식 실시간호가, 10단계) 데이터를 OrderBookData로 변환
+- parse_frame(): "^" 구분 원문을 직접 분해 (기본, 다건 프레임 지원)
+- parse(): DataFrame 호환 모드 (첫 행만 처리)
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from leverage_worker.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+BOOK_TR_ID = "H0STASP0"
+BOOK_LEVELS = 10
+
+
+@dataclass(frozen=True, slots=True)
+class BookLevel:
+    """호가 1단계"""
+
+    price: int
+    quantity: int
+
+
+@dataclass(slots=True)
+class OrderBookData:
+    """실시간 호가 (10단계)"""
+
+    stock_code: str  # 종목코드 (MKSC_SHRN_ISCD)
+    asks: Tuple[BookLevel, ...]  # 매도호가 1~10 (가격 오름차순, 빈 단계 제외)
+    bids: Tuple[BookLevel, ...]  # 매수호가 1~10 (가격 내림차순, 빈 단계 제외)
+    total_ask_qty: int  # 총 매도호가 잔량 (TOTAL_ASKP_RSQN)
+    total_bid_qty: int  # 총 매수호가 잔량 (TOTAL_BIDP_RSQN)
+    timestamp: datetime  # 호가 시각 (BSOP_HOUR)
+    received_ns: int = 0  # WS 수신 시각 (단조 시계 ns, 신선도 판단용)
+
+    @property
+    def best_ask(self) -> Optional[BookLevel]:
+        return self.asks[0] if self.asks else None
+
+    @property
+    def best_bid(self) -> Optional[BookLevel]:
+        return self.bids[0] if self.bids else None
+
+
+class OrderBookHandler:
+    """
+    호가 데이터 파서
+
+    H0STASP0 (asking_price_krx columns 기준) 데이터를 파싱
+    """
+
+    COL_STOCK_CODE = "MKSC_SHRN_ISCD"  # 종목코드
+    COL_TIME = "BSOP_HOUR"  # 영업시간 (HHMMSS)
+    COL_TOTAL_ASK = "TOTAL_ASKP_RSQN"  # 총 매도호가 잔량
+    COL_TOTAL_BID = "TOTAL_BIDP_RSQN"  # 총 매수호가 잔량
+    ASK_PRICE_COLS = tuple(f"ASKP{i}" for i in range(1, BOOK_LEVELS + 1))
+    BID_PRICE_COLS = tuple(f"BIDP{i}" for i in range(1, BOOK_LEVELS + 1))
+    ASK_QTY_COLS = tuple(f"ASKP_RSQN{i}" for i in range(1, BOOK_LEVELS + 1))
+    BID_QTY_COLS = tuple(f"BIDP_RSQN{i}" for i in range(1, BOOK_LEVELS + 1))
+
+    def __init__(self):
+        # parse_frame용 컬럼 인덱스 캐시 (data_map 컬럼 리스트가 바뀔 때만 재계산)
+        self._frame_columns: Optional[Sequence[str]] = None
+        self._frame_index: Dict[str, int] = {}
+
+    def _get_frame_index(self, columns: Sequence[str]) -> Dict[str, int]:
+        """컬럼명 → 필드 인덱스 (컬럼 리스트 단위로 1회 계산)"""
+        if columns is not self._frame_columns:
+            index = {name: i for i, name in enumerate(columns)}
+            self._frame_index = {
+                col: index[col]
+                for col in (
+                    self.COL_STOCK_CODE, self.COL_TIME,
+                    self.COL_TOTAL_ASK, self.COL_TOTAL_BID,
+                    *self.ASK_PRICE_COLS, *self.BID_PRICE_COLS,
+                    *self.ASK_QTY_COLS, *self.BID_QTY_COLS,
+                )
+            }
+            self._frame_columns = columns
+        return self._frame_index
+
+    def parse_frame(self, payload: str, columns: Sequence[str]) -> List[OrderBookData]:
+        """
+        WebSocket 원문에서 호가 데이터 파싱 (DataFrame 생성 없음)
+
+        Args:
+            payload: "^" 구분 원문 (H0STASP0)
+            columns: TR 컬럼 목록 (data_map["columns"])
+
+        Returns:
+            OrderBookData 리스트 (수신 순서)
+        """
+        books: List[OrderBookData] = []
+        num_columns = len(columns)
+        if num_columns == 0 or not payload:
+            return books
+
+        try:
+            idx = self._get_frame_index(columns)
+        except KeyError as e:
+            logger.error(f"Order book frame column missing: {e}")
+            return books
+
+        fields = payload.split("^")
+        count = len(fields) // num_columns
+        now = datetime.now()
+
+        ask_idx = [(idx[p], idx[q]) for p, q in zip(self.ASK_PRICE_COLS, self.ASK_QTY_COLS)]
+        bid_idx = [(idx[p], idx[q]) for p, q in zip(self.BID_PRICE_COLS, self.BID_QTY_COLS)]
+
+        for base in range(0, count * num_columns, num_columns):
+            try:
+                books.append(OrderBookData(
+                    stock_code=fields[base + idx[self.COL_STOCK_CODE]],
+                    asks=self._levels(fields, base, ask_idx),
+                    bids=self._levels(fields, base, bid_idx),
+                    total_ask_qty=int(fields[base + idx[self.COL_TOTAL_ASK]]),
+                    total_bid_qty=int(fields[base + idx[self.COL_TOTAL_BID]]),
+                    timestamp=self._parse_time(fields[base + idx[self.COL_TIME]], now),
+                ))
+            except (ValueError, IndexError) as e:
+                logger.error(f"Order book parse error: {e}")
+
+        return books
+
+    def parse(self, df: pd.DataFrame, tr_id: str) -> Optional[OrderBookData]:
+        """
+        DataFrame에서 호가 데이터 파싱 (호환 모드, 첫 행만 처리)
+
+        Args:
+            df: WebSocket에서 수신한 DataFrame (한 행)
+            tr_id: TR ID (H0STASP0)
+
+        Returns:
+            OrderBookData 객체 또는 None
+        """
+        if tr_id != BOOK_TR_ID or df.empty:
+            return None
+
+        try:
+            row = [str(value) for value in df.iloc[0].tolist()]
+            books = self.parse_frame("^".join(row), list(df.columns))
+            return books[0] if books else None
+        except (KeyError, ValueError, IndexError) as e:
+            logger.error(f"Order book parse error: {e}")
+            return None
+
+    @staticmethod
+    def _levels(
+        fields: List[str], base: int, level_idx: List[Tuple[int, int]]
+    ) -> Tuple[BookLevel, ...]:
+        """가격 0(빈 단계)에서 중단"""
+        levels = []
+        for i_price, i_qty in level_idx:
+            price = int(fields[base + i_price])
+            if price <= 0:
+                break
+            levels.append(BookLevel(price, int(fields[base + i_qty])))
+        return tuple(levels)
+
+    @staticmethod
+    def _parse_time(time_str: str, now: datetime) -> datetime:
+        return now.replace(
+            hour=int(time_str[0:2]),
+            minute=int(time_str[2:4]),
+            second=int(time_str[4:6]),
+            microsecond=0,
+        )
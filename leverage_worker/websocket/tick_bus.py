@@ -0,0 +1,92 @@
+"""
+실시간 체결 틱 버스
+
+WebSocket에서 한 번 디코딩한 TickData를 프로세스 내 구독자들에게 분배
+- 구독자 목록은 copy-on-write (등록/해제 시에만 잠금, publish는 잠금 없음)
+- 종목별 구독 + 전체 구독 지원
+- 구독자 예외는 격리 (다른 구독자 전달에 영향 없음)
+"""
+
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+from leverage_worker.utils.logger import get_logger
+from leverage_worker.websocket.tick_handler import TickData
+
+logger = get_logger(__name__)
+
+TickCallback = Callable[[TickData], None]
+
+
+class TickBus:
+    """
+    틱 발행/구독 버스
+
+    publish()는 WS 수신 스레드에서 호출되며, 현재 구독자 스냅샷(불변 tuple)을
+    잠금 없이 읽는다. 등록/해제는 새 dict/tuple로 교체한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_code: Dict[str, Tuple[TickCallback, ...]] = {}
+        self._all: Tuple[TickCallback, ...] = ()
+
+    def subscribe(self, callback: TickCallback, stock_code: Optional[str] = None) -> None:
+        """
+        구독 등록
+
+        Args:
+            callback: 틱 수신 콜백 (WS 수신 스레드에서 호출)
+            stock_code: 종목코드 (None이면 전체 종목)
+        """
+        with self._lock:
+            if stock_code is None:
+                if callback not in self._all:
+                    self._all = self._all + (callback,)
+                return
+            current = self._by_code.get(stock_code, ())
+            if callback in current:
+                return
+            by_code = dict(self._by_code)
+            by_code[stock_code] = current + (callback,)
+            self._by_code = by_code
+
+    def unsubscribe(self, callback: TickCallback, stock_code: Optional[str] = None) -> None:
+        """구독 해제 (stock_code=None이면 전체 구독 해제)"""
+        with self._lock:
+            if stock_code is None:
+                self._all = tuple(cb for cb in self._all if cb != callback)
+                return
+            current = self._by_code.get(stock_code, ())
+            if callback not in current:
+                return
+            by_code = dict(self._by_code)
+            remaining = tuple(cb for cb in current if cb != callback)
+            if remaining:
+                by_code[stock_code] = remaining
+            else:
+                del by_code[stock_code]
+            self._by_code = by_code
+
+    def publish(self, tick: TickData) -> int:
+        """
+        틱 분배
+
+        Returns:
+            전달된 구독자 수
+        """
+        callbacks = self._by_code.get(tick.stock_code, ()) + self._all
+        for callback in callbacks:
+            try:
+                callback(tick)
+            except Exception as e:
+                logger.error(
+                    f"[TickBus] subscriber error ({tick.stock_code}): {e}", exc_info=True
+                )
+        return len(callbacks)
+
+    def subscriber_count(self, stock_code: Optional[str] = None) -> int:
+        """구독자 수 (stock_code=None이면 전체 구독자 수)"""
+        if stock_code is None:
+            return len(self._all)
+        return len(self._by_code.get(stock_code, ()))
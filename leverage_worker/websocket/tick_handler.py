@@ -2,11 +2,13 @@
 실시간 체결 데이터 파싱 모듈
 
 WebSocket을 통해 수신한 체결 데이터를 파싱하여 TickData 객체로 변환
+- parse_frame(): "^" 구분 원문을 직접 분해 (기본, 다건 프레임 지원)
+- parse(): DataFrame 호환 모드 (첫 행만 처리)
 """
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional, Sequence
 
 import pandas as pd
 
@@ -14,8 +16,24 @@ from leverage_worker.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-
-@dataclass
+# H0STCNT0 전체 컬럼 (ccnl_krx columns와 동일, kis_auth data_map 없이 직접 수신할 때 사용)
+H0STCNT0_COLUMNS = (
+    "MKSC_SHRN_ISCD", "STCK_CNTG_HOUR", "STCK_PRPR", "PRDY_VRSS_SIGN",
+    "PRDY_VRSS", "PRDY_CTRT", "WGHN_AVRG_STCK_PRC", "STCK_OPRC",
+    "STCK_HGPR", "STCK_LWPR", "ASKP1", "BIDP1", "CNTG_VOL", "ACML_VOL",
+    "ACML_TR_PBMN", "SELN_CNTG_CSNU", "SHNU_CNTG_CSNU", "NTBY_CNTG_CSNU",
+    "CTTR", "SELN_CNTG_SMTN", "SHNU_CNTG_SMTN", "CCLD_DVSN", "SHNU_RATE",
+    "PRDY_VOL_VRSS_ACML_VOL_RATE", "OPRC_HOUR", "OPRC_VRSS_PRPR_SIGN",
+    "OPRC_VRSS_PRPR", "HGPR_HOUR", "HGPR_VRSS_PRPR_SIGN", "HGPR_VRSS_PRPR",
+    "LWPR_HOUR", "LWPR_VRSS_PRPR_SIGN", "LWPR_VRSS_PRPR", "BSOP_DATE",
+    "NEW_MKOP_CLS_CODE", "TRHT_YN", "ASKP_RSQN1", "BIDP_RSQN1",
+    "TOTAL_ASKP_RSQN", "TOTAL_BIDP_RSQN", "VOL_TNRT",
+    "PRDY_SMNS_HOUR_ACML_VOL", "PRDY_SMNS_HOUR_ACML_VOL_RATE",
+    "HOUR_CLS_CODE", "MRKT_TRTM_CLS_CODE", "VI_STND_PRC",
+)
+
+
+@dataclass(slots=True)
 class TickData:
     """실시간 체결 데이터"""
 
@@ -29,6 +47,7 @@ class TickData:
     high_price: int  # 고가 (STCK_HGPR)
     low_price: int  # 저가 (STCK_LWPR)
     timestamp: datetime  # 체결시간
+    received_ns: int = 0  # WS 수신 시각 (단조 시계 ns, 지연 계측용)
 
 
 class TickHandler:
@@ -55,9 +74,107 @@ class TickHandler:
     COL_VOLUME = "CNTG_VOL"  # 체결수량
     COL_ACCUM_VOL = "ACML_VOL"  # 누적거래량
 
+    def __init__(self):
+        # parse_frame용 컬럼 인덱스 캐시 (data_map 컬럼 리스트가 바뀔 때만 재계산)
+        self._frame_columns: Optional[Sequence[str]] = None
+        self._frame_index: Dict[str, int] = {}
+
+    def _get_frame_index(self, columns: Sequence[str]) -> Dict[str, int]:
+        """컬럼명 → 필드 인덱스 (컬럼 리스트 단위로 1회 계산)"""
+        if columns is not self._frame_columns:
+            index = {name: i for i, name in enumerate(columns)}
+            self._frame_index = {
+                col: index[col]
+                for col in (
+                    self.COL_STOCK_CODE, self.COL_TIME, self.COL_PRICE,
+                    self.COL_CHANGE_SIGN, self.COL_CHANGE, self.COL_CHANGE_RATE,
+                    self.COL_OPEN, self.COL_HIGH, self.COL_LOW,
+                    self.COL_VOLUME, self.COL_ACCUM_VOL,
+                )
+            }
+            self._frame_columns = columns
+        return self._frame_index
+
+    def parse_frame(self, payload: str, columns: Sequence[str]) -> List[TickData]:
+        """
+        WebSocket 원문에서 체결 데이터 파싱 (DataFrame 생성 없음)
+
+        KIS 실시간 데이터는 다건일 때 레코드가 "^"로 이어져 오므로
+        필드 수 / 컬럼 수 만큼 레코드를 분해
+
+        Args:
+            payload: "^" 구분 원문 (H0STCNT0, 복호화 완료)
+            columns: TR 컬럼 목록 (data_map["columns"])
+
+        Returns:
+            TickData 리스트 (수신 순서)
+        """
+        ticks: List[TickData] = []
+        num_columns = len(columns)
+        if num_columns == 0 or not payload:
+            return ticks
+
+        try:
+            idx = self._get_frame_index(columns)
+        except KeyError as e:
+            logger.error(f"Tick frame column missing: {e}")
+            return ticks
+
+        fields = payload.split("^")
+        count, remainder = divmod(len(fields), num_columns)
+        if remainder:
+            logger.warning(
+                f"Tick frame field count mismatch: {len(fields)} fields / "
+                f"{num_columns} columns → {count} records, trailing {remainder} fields dropped"
+            )
+        now = datetime.now()
+
+        i_code = idx[self.COL_STOCK_CODE]
+        i_time = idx[self.COL_TIME]
+        i_price = idx[self.COL_PRICE]
+        i_sign = idx[self.COL_CHANGE_SIGN]
+        i_change = idx[self.COL_CHANGE]
+        i_rate = idx[self.COL_CHANGE_RATE]
+        i_open = idx[self.COL_OPEN]
+        i_high = idx[self.COL_HIGH]
+        i_low = idx[self.COL_LOW]
+        i_vol = idx[self.COL_VOLUME]
+        i_acc = idx[self.COL_ACCUM_VOL]
+
+        for base in range(0, count * num_columns, num_columns):
+            try:
+                time_str = fields[base + i_time]
+                timestamp = now.replace(
+                    hour=int(time_str[0:2]),
+                    minute=int(time_str[2:4]),
+                    second=int(time_str[4:6]),
+                    microsecond=0,
+                )
+
+                change = int(fields[base + i_change])
+                if fields[base + i_sign] in ("5", "4"):  # 하락, 상한
+                    change = -change
+
+                ticks.append(TickData(
+                    stock_code=fields[base + i_code],
+                    price=int(fields[base + i_price]),
+                    volume=int(fields[base + i_vol]),
+                    accumulated_volume=int(fields[base + i_acc]),
+                    change=change,
+                    change_rate=float(fields[base + i_rate]),
+                    open_price=int(fields[base + i_open]),
+                    high_price=int(fields[base + i_high]),
+                    low_price=int(fields[base + i_low]),
+                    timestamp=timestamp,
+                ))
+            except (ValueError, IndexError) as e:
+                logger.error(f"Tick parse error: {e}")
+
+        return ticks
+
     def parse(self, df: pd.DataFrame, tr_id: str) -> Optional[TickData]:
         """
-        DataFrame에서 체결 데이터 파싱
+        DataFrame에서 체결 데이터 파싱 (호환 모드, 첫 행만 처리)
 
         Args:
             df: WebSocket에서 수신한 DataFrame (한 행)
@@ -1,39 +1,28 @@
 """
 실시간 WebSocket 클라이언트
 
-KISWebSocket을 래핑하여 별도 스레드에서 실행
-체결 데이터 수신 시 콜백 호출
+공유 WSConnectionManager 위의 구독자
+- 실시간 전략 종목 체결가 구독 → on_tick 콜백
+- 체결통보 구독 → on_order_notice 콜백
+manager 미지정 시 전용 연결 관리자를 생성 (단독 사용)
 """
 
-import asyncio
-import sys
-import threading
-from datetime import datetime
-from pathlib import Path
 from typing import Callable, List, Optional
 
-import pandas as pd
-import websockets
-
 from leverage_worker.utils.logger import get_logger
-from leverage_worker.websocket.tick_handler import TickData, TickHandler
+from leverage_worker.websocket.connection_manager import WSConnectionManager
+from leverage_worker.websocket.order_notice_handler import OrderNoticeData
+from leverage_worker.websocket.tick_handler import TickData
 
 logger = get_logger(__name__)
 
-# kis_auth 모듈 경로 추가
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "examples_user"))
-
-import kis_auth as ka
-from domestic_stock.domestic_stock_functions_ws import ccnl_krx, ccnl_notice
-from leverage_worker.websocket.order_notice_handler import OrderNoticeData, OrderNoticeHandler
-
 
 class RealtimeWSClient:
     """
     실시간 WebSocket 클라이언트
 
-    별도 스레드에서 KISWebSocket을 실행하여 실시간 체결 데이터 수신
-    체결 데이터 수신 시 on_tick 콜백 호출
+    연결/디코딩은 WSConnectionManager가 담당하고,
+    이 클라이언트는 구독 종목의 틱을 on_tick 콜백으로 전달
     """
 
     def __init__(
@@ -43,34 +32,37 @@ class RealtimeWSClient:
         on_order_notice: Optional[Callable[[OrderNoticeData], None]] = None,
         is_paper: bool = True,
         hts_id: str = "",
+        use_dataframe: bool = False,
+        manager: Optional[WSConnectionManager] = None,
     ):
         """
         Args:
             on_tick: 체결 데이터 수신 시 호출할 콜백
-            on_error: 에러 발생 시 호출할 콜백
+            on_error: 에러 발생 시 호출할 콜백 (전용 관리자 사용 시)
             on_order_notice: 체결통보 수신 시 호출할 콜백
             is_paper: 모의투자 여부 (True면 모의투자 WebSocket 사용)
             hts_id: HTS ID (체결통보 구독용)
+            use_dataframe: True면 DataFrame 호환 모드 (프레임당 첫 레코드만 처리)
+            manager: 공유 연결 관리자 (None이면 전용 관리자 생성)
         """
         self._on_tick = on_tick
-        self._on_error = on_error
         self._on_order_notice = on_order_notice
-        self._is_paper = is_paper
-        self._hts_id = hts_id
-        self._tick_handler = TickHandler()
-        self._order_notice_handler = OrderNoticeHandler()
-
-        self._ws_thread: Optional[threading.Thread] = None
-        self._ws: Optional[websockets.ClientConnection] = None
-        self._kws: Optional[ka.KISWebSocket] = None
+
+        self._owns_manager = manager is None
+        self._manager = manager or WSConnectionManager(
+            is_paper=is_paper,
+            hts_id=hts_id,
+            use_dataframe=use_dataframe,
+            on_error=on_error,
+        )
+
         self._running = False
         self._stock_codes: List[str] = []
         self._order_notice_subscribed = False
-        self._last_ws_data_time: Optional[datetime] = None
 
     def start(self, stock_codes: List[str]) -> None:
         """
-        WebSocket 연결 시작 (별도 스레드)
+        구독 시작 (연결이 없으면 관리자 시작)
 
         Args:
             stock_codes: 구독할 종목코드 목록
@@ -79,150 +71,51 @@ class RealtimeWSClient:
             logger.warning("WebSocket client already running")
             return
 
-        self._stock_codes = stock_codes
         self._running = True
+        self._stock_codes = []
+        bus = self._manager.bus
+        for stock_code in stock_codes:
+            if self._manager.acquire(stock_code):
+                bus.subscribe(self._deliver_tick, stock_code)
+                self._stock_codes.append(stock_code)
+
+        # 체결통보 구독 (HTS ID 기반, 1회만)
+        if self._on_order_notice:
+            self._order_notice_subscribed = self._manager.add_order_notice_listener(
+                self._on_order_notice
+            )
+            if not self._order_notice_subscribed:
+                logger.error("[WS] 체결통보 구독 실패 - REST 폴백으로 동작합니다")
+        else:
+            logger.warning("[WS] on_order_notice 콜백 미설정")
 
-        # 별도 스레드에서 WebSocket 실행
-        self._ws_thread = threading.Thread(
-            target=self._run_websocket,
-            name="WebSocketThread",
-            daemon=True,
-        )
-        self._ws_thread.start()
-        logger.info(f"WebSocket client started for {len(stock_codes)} stocks")
+        self._manager.start()
+        logger.info(f"WebSocket client started for {len(self._stock_codes)} stocks")
 
     def stop(self) -> None:
-        """WebSocket 연결 중지 - graceful close 포함"""
+        """구독 해제 (전용 관리자면 연결 종료)"""
+        if not self._running:
+            return
         self._running = False
 
-        # WebSocket graceful close
-        if self._ws is not None:
-            try:
-                # KISWebSocket 재연결 방지
-                if self._kws is not None:
-                    self._kws.retry_count = self._kws.max_retries
-
-                # async close를 동기 코드에서 실행
-                asyncio.run(self._ws.close())
-                logger.info("WebSocket connection closed gracefully")
-            except Exception as e:
-                logger.warning(f"WebSocket close error (expected): {e}")
-            finally:
-                self._ws = None
-                self._kws = None
-
-        # 스레드 종료 대기
-        if self._ws_thread and self._ws_thread.is_alive():
-            self._ws_thread.join(timeout=3.0)
-            if self._ws_thread.is_alive():
-                logger.warning("WebSocket thread did not terminate in time")
-        self._ws_thread = None
-        self._order_notice_subscribed = False
-        self._last_ws_data_time = None
-
-        logger.info("WebSocket client stopped")
-
-    def _run_websocket(self) -> None:
-        """WebSocket 실행 (별도 스레드에서 호출)"""
-        try:
-            # WebSocket 인증 (모드에 맞는 키 사용)
-            ws_svr = "vps" if self._is_paper else "prod"
-            ka.auth_ws(svr=ws_svr)
-            logger.info(f"WebSocket authenticated (svr={ws_svr})")
-
-            # WebSocket 객체 생성 및 인스턴스 변수 저장
-            self._kws = ka.KISWebSocket(api_url="/tryitout", max_retries=10)
-
-            # 종목별 체결가 구독 등록
-            for stock_code in self._stock_codes:
-                ka.KISWebSocket.subscribe(
-                    request=ccnl_krx,
-                    data=[stock_code],
-                )
-                logger.info(f"Subscribed to {stock_code}")
-
-            # 체결통보 구독 (HTS ID 기반, 1회만)
-            if self._hts_id and self._on_order_notice:
-                try:
-                    env_dv = "demo" if self._is_paper else "real"
-                    ka.KISWebSocket.subscribe(
-                        request=ccnl_notice,
-                        data=[self._hts_id],
-                        kwargs={"env_dv": env_dv},
-                    )
-                    self._order_notice_subscribed = True
-                    logger.info(
-                        f"Subscribed to order notice (hts_id={self._hts_id}, env={env_dv})"
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"[WS] 체결통보 구독 실패: {e} - REST 폴백으로 동작합니다"
-                    )
-                    self._order_notice_subscribed = False
-            else:
-                if not self._hts_id:
-                    logger.warning("[WS] hts_id 미설정 - 체결통보 구독 불가")
-                if not self._on_order_notice:
-                    logger.warning("[WS] on_order_notice 콜백 미설정")
-
-            # WebSocket 시작 (블로킹)
-            self._kws.start(
-                on_result=self._on_ws_result,
-                result_all_data=False,
-            )
-
-        except Exception as e:
-            logger.error(f"WebSocket error: {e}")
-            if self._on_error:
-                self._on_error(e)
+        bus = self._manager.bus
+        for stock_code in self._stock_codes:
+            bus.unsubscribe(self._deliver_tick, stock_code)
+            self._manager.release(stock_code)
+        self._stock_codes = []
 
-    def _on_ws_result(
-        self,
-        ws: websockets.ClientConnection,
-        tr_id: str,
-        df: pd.DataFrame,
-        data_info: dict,
-    ) -> None:
-        """
-        WebSocket 데이터 수신 콜백
-
-        KISWebSocket의 on_result 콜백으로 설정됨
-        체결 데이터(H0STCNT0)만 처리하여 on_tick 콜백 호출
-        """
-        if not self._running:
-            return
+        if self._order_notice_subscribed:
+            self._manager.remove_order_notice_listener(self._on_order_notice)
+            self._order_notice_subscribed = False
 
-        # WS 건강 상태 갱신 (모든 데이터 수신 시)
-        self._last_ws_data_time = datetime.now()
-
-        # WebSocket 연결 객체 저장 (graceful close용)
-        if self._ws is None:
-            self._ws = ws
-
-        # H0STCNI0 (실전) / H0STCNI9 (모의) 체결통보 처리
-        if tr_id in ("H0STCNI0", "H0STCNI9"):
-            notice = self._order_notice_handler.parse(df)
-            if notice and self._on_order_notice:
-                logger.info(
-                    f"[WS] 체결통보: {notice.stock_code} "
-                    f"{'매도' if notice.side == '01' else '매수'} "
-                    f"x{notice.filled_qty} @ {notice.filled_price:,}원"
-                )
-                self._on_order_notice(notice)
-            return
+        if self._owns_manager:
+            self._manager.stop()
 
-        # H0STCNT0 (체결가)만 처리
-        if tr_id != "H0STCNT0":
-            return
+        logger.info("WebSocket client stopped")
 
-        # 체결 데이터 파싱
-        tick_data = self._tick_handler.parse(df, tr_id)
-        if tick_data:
-            logger.debug(
-                f"[WS] {tick_data.stock_code} 체결: {tick_data.price:,}원 "
-                f"({tick_data.change_rate:+.2f}%)"
-            )
-            # 콜백 호출
+    def _deliver_tick(self, tick_data: TickData) -> None:
+        """TickBus 구독 콜백"""
+        if self._running:
             self._on_tick(tick_data)
 
     @property
@@ -235,6 +128,4 @@ class RealtimeWSClient:
         """WebSocket 체결통보 수신 가능 여부 (10초 이내 데이터 수신 = 정상)"""
         if not self._running or not self._order_notice_subscribed:
             return False
-        if self._last_ws_data_time is None:
-            return False
-        return (datetime.now() - self._last_ws_data_time).total_seconds() < 10
+        return self._manager.is_order_notice_active
@@ -0,0 +1,513 @@
+"""
+WebSocket 구독 멀티플렉서 (연결 풀)
+
+KIS WebSocket은 세션당 구독 40건 제한 → 여러 세션(approval key)에 종목을 분산
+- 연결별 approval key 발급 함수 (SessionManager.get_ws_approval_key / 추가 자격증명)
+- 종목 추가 시 최소 부하 연결 배정, 삭제 시 부하 편차 재분배
+- 연속 접속 실패 연결의 종목은 정상 연결로 이전
+- 연결별 지수 백오프 재접속 + 헬스 스냅샷
+- 모든 연결은 하나의 asyncio 루프 스레드에서 동작 → 수신 순서대로 단일 틱 피드(TickBus)
+- 종목별 누적거래량 기준 중복/역순 틱 제거 (재분배 중 두 연결 동시 수신 대비)
+
+kis_auth.KISWebSocket은 구독 목록/approval key가 모듈 전역이라 다중 세션 불가 →
+KIS WebSocket 프로토콜을 직접 사용 (H0STCNT0 체결가, 비암호화 TR)
+"""
+
+import asyncio
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+import websockets
+
+from leverage_worker.utils.latency import STAGE_WS_DECODE, get_latency_recorder
+from leverage_worker.utils.logger import get_logger
+from leverage_worker.websocket.tick_bus import TickBus
+from leverage_worker.websocket.tick_handler import H0STCNT0_COLUMNS, TickHandler
+
+logger = get_logger(__name__)
+
+TICK_TR_ID = "H0STCNT0"
+
+# approval key 발급 함수 (블로킹 HTTP, 풀 루프의 executor에서 호출)
+ApprovalKeyProvider = Callable[[], str]
+
+
+def build_request(approval_key: str, tr_type: str, tr_key: str, tr_id: str = TICK_TR_ID) -> str:
+    """KIS WebSocket 구독("1") / 해제("2") 요청 메시지"""
+    return json.dumps(
+        {
+            "header": {
+                "approval_key": approval_key,
+                "custtype": "P",
+                "tr_type": tr_type,
+                "content-type": "utf-8",
+            },
+            "body": {"input": {"tr_id": tr_id, "tr_key": tr_key}},
+        }
+    )
+
+
+@dataclass
+class ConnectionHealth:
+    """연결별 상태 스냅샷"""
+
+    index: int
+    connected: bool
+    symbols: int  # 배정 종목 수
+    subscribed: int  # 현재 세션에 구독 요청한 종목 수
+    reconnects: int
+    failures: int  # 연속 접속 실패 수
+    last_message_age: Optional[float]  # 마지막 수신 후 경과 (초)
+    healthy: bool
+
+
+class PoolConnection:
+    """
+    풀 내 WebSocket 세션 1개 (풀 asyncio 루프에서 실행)
+
+    desired: 풀이 배정한 종목 (풀 잠금으로 보호)
+    subscribed: 현재 세션에 구독 요청을 보낸 종목 (루프 스레드 전용)
+    """
+
+    def __init__(self, pool: "WSConnectionPool", index: int, provider: ApprovalKeyProvider):
+        self.pool = pool
+        self.index = index
+        self._provider = provider
+        self._approval_key = ""
+
+        self.desired: Set[str] = set()
+        self.subscribed: Set[str] = set()
+
+        self.connected = False
+        self.sessions = 0
+        self.failures = 0
+        self.last_message_at: Optional[float] = None
+        self._changed: Optional[asyncio.Event] = None
+
+    @property
+    def healthy(self) -> bool:
+        return self.failures < self.pool.unhealthy_after
+
+    @property
+    def reconnects(self) -> int:
+        return max(0, self.sessions - 1)
+
+    def wake(self) -> None:
+        """배정 변경 알림 (루프 스레드에서 호출)"""
+        if self._changed is not None:
+            self._changed.set()
+
+    async def run(self) -> None:
+        """세션 유지 루프 (배정 종목이 없으면 대기)"""
+        self._changed = asyncio.Event()
+        while self.pool.is_running:
+            if not self.pool.desired_of(self):
+                await self._wait_idle()
+                continue
+
+            try:
+                await self._session()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"[WSPool#{self.index}] session error: {e}")
+
+            if not self.pool.is_running:
+                break
+
+            self.failures += 1
+            if self.failures >= 2:
+                self._approval_key = ""  # 인증 문제 대비 재발급
+            delay = self.pool.backoff_delay(self.failures)
+            logger.info(
+                f"[WSPool#{self.index}] reconnect in {delay:.1f}s (failures={self.failures})"
+            )
+            await asyncio.sleep(delay)
+
+    async def _wait_idle(self) -> None:
+        """배정 대기 - 장애 연결은 일정 시간 후 다시 배정 가능 상태로 복귀"""
+        self._changed.clear()
+        timeout = self.pool.backoff_max if self.failures else None
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            self.failures = 0
+
+    async def _session(self) -> None:
+        if not self._approval_key:
+            loop = asyncio.get_running_loop()
+            self._approval_key = await loop.run_in_executor(None, self._provider)
+            if not self._approval_key:
+                raise ConnectionError("approval key 발급 실패")
+
+        # KIS는 앱 레벨 PINGPONG 사용 → 라이브러리 ping 비활성
+        async with websockets.connect(self.pool.url, ping_interval=None) as ws:
+            self.connected = True
+            self.sessions += 1
+            self.subscribed = set()
+            logger.info(f"[WSPool#{self.index}] connected (session {self.sessions})")
+            sync_task = asyncio.create_task(self._sync_subscriptions(ws))
+            try:
+                async for raw in ws:
+                    self.last_message_at = time.monotonic()
+                    self.failures = 0
+                    await self._on_message(ws, raw)
+            finally:
+                sync_task.cancel()
+                self.connected = False
+                self.subscribed = set()
+
+    async def _sync_subscriptions(self, ws) -> None:
+        """배정(desired)과 구독(subscribed) 차이만큼 구독/해제 요청"""
+        while True:
+            self._changed.clear()  # 복사 전에 clear → 전송 중 변경도 다음 회차에 반영
+            desired = self.pool.desired_of(self)
+            for code in sorted(desired - self.subscribed):
+                await ws.send(build_request(self._approval_key, "1", code))
+                self.subscribed.add(code)
+                await self.pool.pace()
+            for code in sorted(self.subscribed - desired):
+                await ws.send(build_request(self._approval_key, "2", code))
+                self.subscribed.discard(code)
+                await self.pool.pace()
+            await self._changed.wait()
+
+    async def _on_message(self, ws, raw: str) -> None:
+        if raw[0] in ("0", "1"):
+            parts = raw.split("|", 3)
+            if len(parts) < 4 or parts[1] != TICK_TR_ID:
+                return
+            if parts[0] == "1":
+                logger.debug(f"[WSPool#{self.index}] encrypted frame skipped: {parts[1]}")
+                return
+            self.pool.publish_frame(parts[3])
+            return
+
+        try:
+            message = json.loads(raw)
+        except ValueError:
+            logger.debug(f"[WSPool#{self.index}] unknown message: {raw[:80]}")
+            return
+
+        header = message.get("header", {})
+        if header.get("tr_id") == "PINGPONG":
+            await ws.pong(raw)
+            return
+
+        body = message.get("body") or {}
+        if body.get("rt_cd", "0") != "0":
+            logger.warning(
+                f"[WSPool#{self.index}] {header.get('tr_key')} 구독 응답 오류: {body.get('msg1')}"
+            )
+
+    def health(self) -> ConnectionHealth:
+        age = None
+        if self.last_message_at is not None:
+            age = time.monotonic() - self.last_message_at
+        return ConnectionHealth(
+            index=self.index,
+            connected=self.connected,
+            symbols=len(self.pool.desired_of(self)),
+            subscribed=len(self.subscribed),
+            reconnects=self.reconnects,
+            failures=self.failures,
+            last_message_age=age,
+            healthy=self.healthy,
+        )
+
+
+class WSConnectionPool:
+    """
+    다중 세션 구독 풀
+
+    add/remove는 어느 스레드에서나 호출 가능 (배정 변경 후 풀 루프에 알림).
+    수신 틱은 풀 루프 스레드에서 bus.publish()로 전달된다.
+    """
+
+    MAX_PER_CONNECTION = 40
+
+    def __init__(
+        self,
+        url: str,
+        approval_key_providers: Sequence[ApprovalKeyProvider],
+        bus: Optional[TickBus] = None,
+        max_per_connection: int = MAX_PER_CONNECTION,
+        rebalance_threshold: int = 2,
+        unhealthy_after: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        send_interval: float = 0.05,
+        monitor_interval: float = 1.0,
+        name: str = "ws-pool",
+    ):
+        """
+        Args:
+            url: WebSocket URL (예: ws://ops.koreainvestment.com:21000/tryitout)
+            approval_key_providers: 연결별 approval key 발급 함수 (연결 수 = 길이)
+            bus: 틱 분배 버스 (None이면 새로 생성)
+            max_per_connection: 연결당 최대 구독 수
+            rebalance_threshold: 연결 간 허용 부하 편차 (초과 시 재분배)
+            unhealthy_after: 연속 접속 실패 수 (이상이면 종목 이전)
+            backoff_base / backoff_max: 재접속 지수 백오프 (초)
+            send_interval: 구독 요청 간 간격 (초)
+        """
+        if not approval_key_providers:
+            raise ValueError("approval_key_providers is empty")
+
+        self.url = url
+        self.unhealthy_after = unhealthy_after
+        self.backoff_max = backoff_max
+        self._bus = bus or TickBus()
+        self._max_per_connection = max_per_connection
+        self._rebalance_threshold = rebalance_threshold
+        self._backoff_base = backoff_base
+        self._send_interval = send_interval
+        self._monitor_interval = monitor_interval
+        self._name = name
+
+        self._connections = [
+            PoolConnection(self, index, provider)
+            for index, provider in enumerate(approval_key_providers)
+        ]
+        self._assignment: Dict[str, int] = {}  # stock_code -> connection index
+        self._lock = threading.Lock()
+
+        # 루프 스레드 전용
+        self._tick_handler = TickHandler()
+        self._last_seen: Dict[str, Tuple[date, int]] = {}  # stock_code -> (일자, 누적거래량)
+
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._started = threading.Event()
+        self._running = False
+
+        self._stats: Dict[str, int] = {"frames": 0, "ticks": 0, "duplicates": 0, "moves": 0}
+
+    @property
+    def bus(self) -> TickBus:
+        return self._bus
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def capacity(self) -> int:
+        return len(self._connections) * self._max_per_connection
+
+    # ==========================================
+    # 시작 / 중지
+    # ==========================================
+
+    def start(self) -> None:
+        """풀 루프 스레드 시작 (이미 실행 중이면 무시)"""
+        if self._running:
+            return
+        self._running = True
+        self._started.clear()
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+        self._started.wait(timeout=5.0)
+        logger.info(
+            f"[WSPool] started ({len(self._connections)} connections, "
+            f"capacity {self.capacity})"
+        )
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """모든 세션 종료"""
+        if not self._running:
+            return
+        self._running = False
+        loop, stop_event = self._loop, self._stop_event
+        if loop is not None and stop_event is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(stop_event.set)
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                logger.warning("[WSPool] loop thread did not terminate in time")
+            self._thread = None
+        logger.info("[WSPool] stopped")
+
+    def _run(self) -> None:
+        try:
+            asyncio.run(self._main())
+        except Exception as e:
+            logger.error(f"[WSPool] loop error: {e}", exc_info=True)
+        finally:
+            self._loop = None
+            self._started.set()
+
+    async def _main(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        tasks = [asyncio.create_task(conn.run()) for conn in self._connections]
+        tasks.append(asyncio.create_task(self._monitor()))
+        self._started.set()
+
+        await self._stop_event.wait()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _monitor(self) -> None:
+        """장애 연결 종목 이전 / 부하 재분배 주기 점검"""
+        while True:
+            await asyncio.sleep(self._monitor_interval)
+            with self._lock:
+                touched = self._rebalance()
+            for index in touched:
+                self._connections[index].wake()
+
+    # ==========================================
+    # 구독 배정
+    # ==========================================
+
+    def add(self, stock_code: str) -> bool:
+        """
+        종목 구독 추가
+
+        Returns:
+            True: 배정됨 (이미 배정 포함) / False: 풀 용량 초과
+        """
+        with self._lock:
+            if stock_code in self._assignment:
+                return True
+            conn = self._pick_connection()
+            if conn is None:
+                logger.warning(f"[WSPool] {stock_code} 구독 불가 - 풀 용량 {self.capacity}건 초과")
+                return False
+            conn.desired.add(stock_code)
+            self._assignment[stock_code] = conn.index
+        self._wake(conn.index)
+        return True
+
+    def remove(self, stock_code: str) -> None:
+        """종목 구독 해제 (이후 부하 편차가 크면 재분배)"""
+        with self._lock:
+            index = self._assignment.pop(stock_code, None)
+            if index is None:
+                return
+            self._connections[index].desired.discard(stock_code)
+            touched = self._rebalance()
+            touched.add(index)
+        for i in touched:
+            self._wake(i)
+
+    def assignment(self) -> Dict[str, int]:
+        """종목 → 연결 인덱스"""
+        with self._lock:
+            return dict(self._assignment)
+
+    def desired_of(self, conn: PoolConnection) -> Set[str]:
+        with self._lock:
+            return set(conn.desired)
+
+    def _pick_connection(self, exclude: Optional[PoolConnection] = None) -> Optional[PoolConnection]:
+        """여유 있는 연결 중 최소 부하 (정상 연결 우선, 잠금 상태에서 호출)"""
+        candidates = [
+            conn
+            for conn in self._connections
+            if conn is not exclude and len(conn.desired) < self._max_per_connection
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda c: (not c.healthy, len(c.desired), c.index))
+
+    def _move(self, stock_code: str, source: PoolConnection, target: PoolConnection) -> None:
+        source.desired.discard(stock_code)
+        target.desired.add(stock_code)
+        self._assignment[stock_code] = target.index
+        self._stats["moves"] += 1
+        logger.info(f"[WSPool] {stock_code} moved #{source.index} -> #{target.index}")
+
+    def _rebalance(self) -> Set[int]:
+        """장애 연결 종목 이전 + 부하 편차 축소 (잠금 상태에서 호출, 변경된 연결 반환)"""
+        touched: Set[int] = set()
+
+        # 1. 장애 연결 → 정상 연결
+        for conn in self._connections:
+            if conn.healthy or not conn.desired:
+                continue
+            for code in sorted(conn.desired):
+                target = self._pick_connection(exclude=conn)
+                if target is None or not target.healthy:
+                    break
+                self._move(code, conn, target)
+                touched.update((conn.index, target.index))
+
+        # 2. 정상 연결 간 부하 편차 축소
+        healthy = [conn for conn in self._connections if conn.healthy]
+        while len(healthy) > 1:
+            high = max(healthy, key=lambda c: (len(c.desired), -c.index))
+            low = min(healthy, key=lambda c: (len(c.desired), c.index))
+            if len(high.desired) - len(low.desired) <= self._rebalance_threshold:
+                break
+            self._move(max(high.desired), high, low)
+            touched.update((high.index, low.index))
+
+        return touched
+
+    def _wake(self, index: int) -> None:
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._connections[index].wake)
+
+    # ==========================================
+    # 수신 (루프 스레드)
+    # ==========================================
+
+    async def pace(self) -> None:
+        if self._send_interval > 0:
+            await asyncio.sleep(self._send_interval)
+
+    def backoff_delay(self, failures: int) -> float:
+        """지수 백오프 + 지터 (동시 재접속 분산)"""
+        delay = min(self.backoff_max, self._backoff_base * (2 ** max(0, failures - 1)))
+        return delay * (0.5 + random.random() / 2)
+
+    def publish_frame(self, payload: str) -> None:
+        """체결 프레임 디코딩 → 중복/역순 제거 → TickBus 발행"""
+        recorder = get_latency_recorder()
+        received_ns = recorder.now()
+        self._stats["frames"] += 1
+
+        ticks = self._tick_handler.parse_frame(payload, H0STCNT0_COLUMNS)
+        if ticks:
+            recorder.record_since(STAGE_WS_DECODE, received_ns, ticks[0].stock_code)
+
+        for tick in ticks:
+            # 누적거래량은 당일 단조 증가 → 이하이면 다른 연결에서 이미 받은 틱
+            key = (tick.timestamp.date(), tick.accumulated_volume)
+            last = self._last_seen.get(tick.stock_code)
+            if last is not None and last[0] == key[0] and key[1] <= last[1]:
+                self._stats["duplicates"] += 1
+                continue
+            self._last_seen[tick.stock_code] = key
+
+            tick.received_ns = received_ns
+            self._stats["ticks"] += 1
+            self._bus.publish(tick)
+
+    # ==========================================
+    # 상태
+    # ==========================================
+
+    def health(self) -> List[ConnectionHealth]:
+        """연결별 상태"""
+        return [conn.health() for conn in self._connections]
+
+    def stats(self) -> Dict[str, int]:
+        """수신/중복/이전 카운터 + 구독 수"""
+        with self._lock:
+            symbols = len(self._assignment)
+        return {
+            **self._stats,
+            "symbols": symbols,
+            "connected": sum(1 for conn in self._connections if conn.connected),
+        }